@@ -188,7 +188,7 @@ async def _get_document(document_id: str) -> dict:
     client = get_service_client()
     response = (
         client.table("documents")
-        .select("id, name, status, matter_id, extracted_text, error_message, updated_at")
+        .select("id, name, status, matter_id, extracted_text_length, error_message, updated_at")
         .eq("id", document_id)
         .single()
         .execute()
@@ -330,7 +330,7 @@ async def retry_failed_tasks(
 
     # Determine which tasks need to be retried based on document state
     doc_status = doc["status"]
-    has_text = bool(doc.get("extracted_text"))
+    has_text = bool(doc.get("extracted_text_length"))
 
     # Get chunk and entity counts
     client = get_service_client()
@@ -485,7 +485,7 @@ async def get_pipeline_status(
     ocr_chunks_completed = sum(1 for c in ocr_chunks if c.get("status") == "completed")
 
     # Build stage info
-    has_text = bool(doc.get("extracted_text"))
+    has_text = bool(doc.get("extracted_text_length"))
     doc_status = doc["status"]
 
     stages = [
@@ -287,6 +287,7 @@ async def get_llm_quota(
                             "totalPending": 30,
                             "totalActive": 8,
                             "activeWorkers": 3,
+                            "workerCapacity": 150,
                             "lastCheckedAt": "2026-01-27T10:30:00Z",
                             "alertThreshold": 100,
                             "isHealthy": True,
@@ -342,8 +343,9 @@ async def get_queue_status(
         # Get metrics for all queues
         queue_metrics_list = await service.get_all_queue_metrics()
 
-        # Get active worker count
+        # Get active worker count and capacity (same cached snapshot)
         active_workers = await service.get_active_worker_count()
+        worker_capacity = await service.get_worker_capacity()
 
         # Convert to response models
         queues = [
@@ -380,6 +382,7 @@ async def get_queue_status(
             totalPending=total_pending,
             totalActive=total_active,
             activeWorkers=active_workers,
+            workerCapacity=worker_capacity,
             lastCheckedAt=datetime.now(timezone.utc).isoformat(),
             alertThreshold=DEFAULT_ALERT_THRESHOLD,
             isHealthy=is_healthy,
@@ -377,7 +377,10 @@ class CacheClearResponse(BaseModel):
 
     query_cache_cleared: int = Field(..., description="Number of query cache entries cleared")
     summary_cache_cleared: bool = Field(..., description="Whether summary cache was cleared")
-    timeline_cache_cleared: bool = Field(..., description="Whether timeline cache was cleared")
+    timeline_cache_cleared: bool = Field(
+        ...,
+        description="Whether the timeline cache generation was bumped (False if Redis was unavailable)",
+    )
 
 
 @router.delete("/{matter_id}/cache")
@@ -412,18 +415,22 @@ async def clear_chat_cache(
     )
 
     try:
-        # Clear query cache
+        # Clear query cache. Invalidation is a generation bump, so count the
+        # live entries first for the response (user-initiated, not a hot path)
         query_cache_service = get_query_cache_service()
-        query_cleared = await query_cache_service.invalidate_on_document_upload(matter_id)
+        query_stats = await query_cache_service.get_cache_stats(matter_id)
+        await query_cache_service.invalidate_on_document_upload(matter_id)
+        query_cleared = query_stats.get("cached_queries", 0)
 
         # Clear summary cache
         summary_service = get_summary_service()
         summary_cleared = await summary_service.invalidate_cache(matter_id)
 
-        # Clear timeline cache
+        # Clear timeline cache. The bump returns the new generation (>= 1),
+        # or 0 when Redis is unavailable or the INCR failed
         timeline_cache = get_timeline_cache_service()
-        timeline_deleted = await timeline_cache.invalidate_timeline(matter_id)
-        timeline_cleared = timeline_deleted > 0
+        timeline_generation = await timeline_cache.invalidate_timeline(matter_id)
+        timeline_cleared = timeline_generation > 0
 
         logger.info(
             "clear_chat_cache_complete",
@@ -150,6 +150,12 @@ async def get_all_contradictions(
             description="Sort direction: asc, desc",
         ),
     ] = "desc",
+    cursor: Annotated[
+        str | None,
+        Query(
+            description="Keyset cursor from meta.nextCursor (with documentId)",
+        ),
+    ] = None,
     membership: MatterMembership = Depends(
         require_matter_role([MatterRole.OWNER, MatterRole.EDITOR, MatterRole.VIEWER])
     ),
@@ -175,6 +181,7 @@ async def get_all_contradictions(
     - documentId: Filter by source document
     - page/perPage: Pagination (default 1/20)
     - sortBy/sortOrder: Sorting (default severity/desc)
+    - cursor: Keyset pagination for document-filtered listings
 
     Args:
         matter_id: Matter UUID.
@@ -186,6 +193,7 @@ async def get_all_contradictions(
         per_page: Items per page.
         sort_by: Sort field.
         sort_order: Sort direction.
+        cursor: Optional keyset cursor.
         membership: Validated matter membership.
         service: Contradiction list service.
 
@@ -221,6 +229,7 @@ async def get_all_contradictions(
             per_page=per_page,
             sort_by=sort_by,
             sort_order=sort_order,
+            cursor=cursor,
         )
 
         logger.info(
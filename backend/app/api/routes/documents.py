@@ -48,6 +48,8 @@ from app.models.document import (
     DocumentFeatures,
     DocumentListResponseWithPagination,
     DocumentResponse,
+    DocumentText,
+    DocumentTextResponse,
     DocumentType,
     DocumentUpdate,
     DocumentWithFeatures,
@@ -76,6 +78,7 @@ from app.services.storage_service import (
     get_storage_service,
 )
 from app.workers.tasks.document_tasks import (
+    build_document_pdf_manifest,
     calculate_confidence,
     chunk_document,
     embed_chunks,
@@ -529,6 +532,9 @@ def _queue_ocr_task(document_id: str, file_size: int) -> None:
 
     After completion, documents are fully searchable via hybrid search.
 
+    The PDF manifest (page tree parsed once, see pdf_manifest) is built by a
+    separate task queued alongside the chain, so it never delays OCR start.
+
     Args:
         document_id: Document UUID to process.
         file_size: File size in bytes.
@@ -562,6 +568,9 @@ def _queue_ocr_task(document_id: str, file_size: int) -> None:
     # Apply the chain to the appropriate queue
     task_chain.apply_async(queue=queue_name)
 
+    # Off the OCR path: ready for the chunked OCR tasks that need it most
+    build_document_pdf_manifest.apply_async(args=[document_id], queue=queue_name)
+
     logger.info(
         "document_processing_chain_queued",
         document_id=document_id,
@@ -1151,6 +1160,11 @@ async def bulk_update_documents(
 )
 async def get_document(
     document_id: str = Path(..., description="Document UUID"),
+    include_text: bool = Query(
+        False,
+        alias="includeText",
+        description="Include the full extracted text (use GET /{document_id}/text for page ranges)",
+    ),
     current_user: AuthenticatedUser = Depends(get_current_user),
     document_service: DocumentService = Depends(get_document_service),
     storage_service: StorageService = Depends(get_storage_service),
@@ -1159,11 +1173,12 @@ async def get_document(
 
     Returns full document metadata including a signed URL for file access
     and feature flags indicating which pipeline stages have completed.
+    Extracted text is omitted unless includeText=true.
     User must have access to the document's matter.
     """
     try:
         # Get document (RLS will filter if user doesn't have access)
-        doc = document_service.get_document(document_id)
+        doc = document_service.get_document(document_id, include_text=include_text)
 
         # Generate signed URL for storage access (valid for 1 hour)
         signed_url = storage_service.get_signed_url(doc.storage_path, expires_in=3600)
@@ -1187,6 +1202,7 @@ async def get_document(
             processing_started_at=doc.processing_started_at,
             processing_completed_at=doc.processing_completed_at,
             extracted_text=doc.extracted_text,
+            extracted_text_length=doc.extracted_text_length,
             ocr_confidence=doc.ocr_confidence,
             ocr_quality_score=doc.ocr_quality_score,
             ocr_confidence_per_page=doc.ocr_confidence_per_page,
@@ -1382,6 +1398,7 @@ async def update_document(
             processing_started_at=updated_doc.processing_started_at,
             processing_completed_at=updated_doc.processing_completed_at,
             extracted_text=updated_doc.extracted_text,
+            extracted_text_length=updated_doc.extracted_text_length,
             ocr_confidence=updated_doc.ocr_confidence,
             ocr_quality_score=updated_doc.ocr_quality_score,
             ocr_confidence_per_page=updated_doc.ocr_confidence_per_page,
@@ -1498,6 +1515,57 @@ async def get_ocr_quality(
         ) from e
 
 
+@router.get(
+    "/{document_id}/text",
+    response_model=DocumentTextResponse,
+    response_model_by_alias=True,
+)
+async def get_document_text(
+    document_id: str = Path(..., description="Document UUID"),
+    page_start: int | None = Query(None, ge=1, alias="pageStart", description="First page (inclusive)"),
+    page_end: int | None = Query(None, ge=1, alias="pageEnd", description="Last page (inclusive)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    document_service: DocumentService = Depends(get_document_service),
+) -> DocumentTextResponse:
+    """Get a document's extracted text, optionally for a page range only.
+
+    Lets viewers load text on demand instead of with every document read.
+    With pageStart/pageEnd only those pages are loaded.
+
+    User must have access to the document's matter.
+    """
+    try:
+        # Verify access to document (RLS will filter)
+        document_service.get_document(document_id)
+
+        text = document_service.get_document_text(
+            document_id, page_start=page_start, page_end=page_end
+        )
+
+        return DocumentTextResponse(
+            data=DocumentText(
+                document_id=document_id,
+                page_start=page_start,
+                page_end=page_end,
+                text=text,
+            )
+        )
+
+    except DocumentNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "DOCUMENT_NOT_FOUND",
+                    "message": "Document not found or you don't have access",
+                    "details": {},
+                }
+            },
+        ) from e
+    except DocumentServiceError as e:
+        raise _handle_service_error(e) from e
+
+
 @router.post(
     "/{document_id}/request-manual-review",
     response_model=ManualReviewResponse,
@@ -1680,7 +1748,7 @@ async def retry_document_processing(
         if retry_type == "auto":
             # If OCR is complete, just retry RAG
             if doc.status.value in ["ocr_complete", "ocr_failed"]:
-                actual_retry_type = "rag" if doc.extracted_text else "full"
+                actual_retry_type = "rag" if doc.extracted_text_length else "full"
             else:
                 actual_retry_type = "full"
 
@@ -1788,7 +1856,7 @@ async def retry_all_stuck_documents(
         # 2. Processing jobs stuck in QUEUED or PROCESSING for too long
         docs_response = (
             client.table("documents")
-            .select("id, filename, status, extracted_text")
+            .select("id, filename, status, extracted_text_length")
             .eq("matter_id", matter_id)
             .eq("status", "ocr_complete")
             .execute()
@@ -1804,7 +1872,7 @@ async def retry_all_stuck_documents(
 
         for doc in documents:
             doc_id = doc["id"]
-            has_text = bool(doc.get("extracted_text"))
+            has_text = bool(doc.get("extracted_text_length"))
 
             # Check if document has chunks
             chunks_response = (
@@ -1284,6 +1284,7 @@ async def merge_entities(
                 "p_user_id": membership.user_id,
             },
         ).execute()
+        mig_service.invalidate_alias_clusters(matter_id)
 
         # Record the correction for learning (AC #4)
         try:
@@ -1446,6 +1447,7 @@ async def unmerge_entity(
                 "p_user_id": membership.user_id,
             },
         ).execute()
+        mig_service.invalidate_alias_clusters(matter_id)
 
         # Code Review Fix: Record the unmerge correction for audit trail
         try:
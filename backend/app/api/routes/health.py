@@ -14,6 +14,7 @@ from app.core.circuit_breaker import (
 )
 from app.core.config import Settings, get_settings
 from app.core.rate_limit import HEALTH_RATE_LIMIT, get_rate_limit_status, limiter
+from app.services.supabase.client import get_supabase_pool_stats
 from app.workers.celery import celery_app
 
 router = APIRouter(prefix="/health", tags=["health"])
@@ -258,6 +259,40 @@ async def reset_circuit(
     }
 
 
+# =============================================================================
+# Supabase Connection Pool Endpoint
+# =============================================================================
+
+
+@router.get("/supabase-pool")
+async def get_supabase_pool_status() -> dict[str, Any]:
+    """Get Supabase connection pool usage for this API process.
+
+    Returns:
+        Pool stats per client created in this process.
+
+    Example response:
+        {
+            "data": {
+                "pools": {
+                    "service": {
+                        "max_connections": 50,
+                        "requests": 1234,
+                        "in_flight": 3,
+                        "peak_in_flight": 17,
+                        "saturation": 0.06,
+                        "waited": 0,
+                        "timeouts": 0,
+                        "avg_wait_ms": 0.0,
+                        "max_wait_ms": 0.0
+                    }
+                }
+            }
+        }
+    """
+    return {"data": {"pools": get_supabase_pool_stats()}}
+
+
 # =============================================================================
 # Rate Limit Status Endpoint (Story 13.3)
 # =============================================================================
@@ -17,7 +17,11 @@ from app.api.deps import (
     get_tab_stats_service_dep,
     require_matter_role,
 )
-from app.models.cost import MatterCostResponse, MatterCostSummary
+from app.models.cost import (
+    MatterCostRecordsResponse,
+    MatterCostResponse,
+    MatterCostSummary,
+)
 from app.services.matter_cost_service import MatterCostService, get_matter_cost_service
 from app.core.rate_limit import STANDARD_RATE_LIMIT, limiter
 from app.models.matter import (
@@ -371,6 +375,97 @@ async def get_matter_costs(
         ) from e
 
 
+@router.get(
+    "/{matter_id}/costs/records",
+    response_model=MatterCostRecordsResponse,
+    response_model_by_alias=True,
+    summary="Get Matter Cost Records",
+    description="""
+    Drill down into the raw LLM cost records behind the cost summary,
+    newest first. Filter by day (YYYY-MM-DD, UTC) and/or provider.
+
+    **Requires any role on the matter.**
+    """,
+)
+@limiter.limit(STANDARD_RATE_LIMIT)
+async def get_matter_cost_records(
+    request: Request,
+    matter_id: str,
+    cost_date: str | None = Query(
+        default=None,
+        alias="date",
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+        description="UTC day to restrict to (YYYY-MM-DD)",
+    ),
+    provider: str | None = Query(default=None, description="Provider to restrict to"),
+    days: int = Query(default=30, ge=1, le=365, description="Period when no date is given"),
+    limit: int = Query(default=100, ge=1, le=500, description="Maximum records"),
+    offset: int = Query(default=0, ge=0, description="Records to skip"),
+    membership: MatterMembership = Depends(
+        require_matter_role([MatterRole.OWNER, MatterRole.EDITOR, MatterRole.VIEWER])
+    ),
+    cost_service: MatterCostService = Depends(get_matter_cost_service),
+) -> MatterCostRecordsResponse:
+    """Get raw cost records for a matter.
+
+    Story 7.1: Per-Matter Cost Tracking Widget (drill-down)
+
+    Args:
+        request: FastAPI request for rate limiting binding.
+        matter_id: Matter ID.
+        cost_date: Optional UTC day filter.
+        provider: Optional provider filter.
+        days: Period when no date is given.
+        limit: Maximum records to return.
+        offset: Records to skip.
+        membership: User's matter membership (validated by dependency).
+        cost_service: Matter cost service.
+
+    Returns:
+        MatterCostRecordsResponse with a page of cost records.
+    """
+    try:
+        page = await asyncio.to_thread(
+            cost_service.get_matter_cost_records,
+            matter_id,
+            cost_date,
+            provider,
+            days,
+            limit,
+            offset,
+        )
+        return MatterCostRecordsResponse(data=page)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error": {
+                    "code": "INVALID_DATE",
+                    "message": "date must be a valid YYYY-MM-DD day",
+                    "details": {},
+                }
+            },
+        ) from e
+    except PostgrestAPIError as e:
+        logger.error(
+            "matter_cost_records_query_failed",
+            matter_id=matter_id,
+            user_id=membership.user_id,
+            error=str(e),
+            error_type="database",
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": {
+                    "code": "COST_QUERY_FAILED",
+                    "message": "Failed to retrieve cost data",
+                    "details": {},
+                }
+            },
+        ) from e
+
+
 # Member management endpoints
 
 
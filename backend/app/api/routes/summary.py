@@ -205,7 +205,7 @@ async def get_matter_summary(
     force_refresh: bool = Query(
         False,
         alias="forceRefresh",
-        description="Bypass cache and regenerate summary",
+        description="Bypass cache and queue a summary rebuild",
     ),
     summary_service: SummaryService = Depends(get_summary_service),
 ) -> MatterSummaryResponse:
@@ -215,7 +215,8 @@ async def get_matter_summary(
 
     Args:
         access: Validated matter access context (enforces Layer 4 security).
-        force_refresh: If True, bypass cache and regenerate.
+        force_refresh: If True, bypass cache and queue a rebuild (the stored
+            summary is returned with status "refreshing").
         summary_service: Summary service instance.
 
     Returns:
@@ -384,8 +385,9 @@ async def verify_summary_section(
             user_id=access.user_id,
         )
 
-        # Invalidate summary cache so next GET returns updated isVerified
-        await summary_service.invalidate_cache(access.matter_id)
+        # Re-apply review state to the stored summary so next GET returns
+        # updated isVerified without regenerating
+        await summary_service.refresh_review_state(access.matter_id)
 
         return SummaryVerificationResponse(data=verification)
 
@@ -774,8 +776,9 @@ async def save_section_edit(
             user_id=access.user_id,
         )
 
-        # Invalidate summary cache so next GET returns edited content
-        await summary_service.invalidate_cache(access.matter_id)
+        # Re-apply review state to the stored summary so next GET returns
+        # edited content without regenerating
+        await summary_service.refresh_review_state(access.matter_id)
 
         return SummaryEditResponse(data=edit)
 
@@ -877,10 +880,10 @@ async def regenerate_section(
             section_id=section_id,
         )
 
-        # Invalidate cache and force regeneration
-        await summary_service.invalidate_cache(access.matter_id)
+        # Serve the stored summary without the deleted edit right away
+        await summary_service.refresh_review_state(access.matter_id)
 
-        # Get fresh summary (will regenerate)
+        # Queue the rebuild; the stored summary comes back as "refreshing"
         summary = await summary_service.get_summary(
             matter_id=access.matter_id,
             force_refresh=True,
@@ -1013,6 +1013,7 @@ async def get_timeline_with_entities(
                 matter_id=matter_id,
                 page=page,
                 per_page=per_page,
+                include_details=False,
             )
             if cached:
                 # Convert cached timeline to response
@@ -28,6 +28,12 @@ class Settings(BaseSettings):
     supabase_service_key: str = ""  # service role key for admin operations
     supabase_jwt_secret: str = ""  # JWT secret for local token validation
 
+    # Supabase HTTP connection pool (one pool per client, per process)
+    supabase_pool_max_connections: int = 50  # Concurrent requests per client
+    supabase_pool_max_keepalive: int = 20  # Idle connections kept open for reuse
+    supabase_pool_keepalive_expiry: float = 30.0  # Seconds before an idle connection is recycled
+    supabase_pool_timeout: float = 10.0  # Max seconds a request waits for a free connection
+
     # Redis
     redis_url: str = "redis://localhost:6379/0"
 
@@ -190,6 +196,16 @@ class Settings(BaseSettings):
     chunk_recovery_enabled: bool = True       # Master switch for automatic chunk recovery
     chunk_max_recovery_retries: int = 3       # Max times a chunk can be auto-recovered
 
+    # Worker-local PDF blob cache (one Storage download per document per host)
+    pdf_blob_cache_enabled: bool = True
+    pdf_blob_cache_dir: str = ""                       # Empty = <tmpdir>/ldip-pdf-cache
+    pdf_blob_cache_max_bytes: int = 4 * 1024**3        # LRU eviction above 4 GiB
+    pdf_blob_cache_index_ttl_seconds: int = 24 * 3600  # Re-download a path after this
+
+    # Matter summary precompute (Story 14.1) - rebuild once processing goes quiet
+    summary_precompute_delay_seconds: int = 90  # Quiet period after the last job completes
+    summary_live_sections_max_age_seconds: int = 300  # Stats/attention items recomputed on read after this
+
     # Admin Configuration (Story 14.17)
     admin_emails: str = ""  # Comma-separated list of admin emails (ADMIN_EMAILS env var)
     rate_limit_admin: int = 10  # Admin operations rate limit (per minute)
@@ -216,13 +232,15 @@ class Settings(BaseSettings):
     act_validation_enabled: bool = True                # Enable garbage detection/validation
 
     # Rate limiting for India Code requests
-    india_code_request_delay: float = 2.0              # Seconds between requests
+    india_code_request_delay: float = 2.0              # Seconds between requests to one host
+    india_code_max_concurrent_per_host: int = 2        # Requests in flight per host
     india_code_max_requests_per_minute: int = 5        # Rate limit (be polite to gov site)
     india_code_request_timeout: float = 30.0           # HTTP timeout for India Code requests
 
     # Validation task configuration
     validation_max_acts_per_task: int = 50             # Max acts to validate per Celery task
     validation_max_fetch_per_task: int = 5             # Max acts to fetch per Celery task
+    act_fetch_concurrency: int = 4                     # Acts acquired concurrently per task
     validation_task_retry_delay: int = 60              # Seconds between task retries
     validation_task_max_retries: int = 3               # Max retry attempts for tasks
 
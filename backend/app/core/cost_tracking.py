@@ -23,14 +23,26 @@ Usage:
 
     # Get cost summary in INR
     cost = tracker.total_cost_inr
+
+Persistence:
+    persist_cost() hands the row to a write-behind CostRecorder, which
+    inserts buffered rows into llm_costs in multi-row batches (every
+    COST_FLUSH_MAX_RECORDS rows or COST_FLUSH_INTERVAL_SECONDS) and on
+    shutdown (close_cost_service). A crash loses at most one flush interval.
 """
 
+import atexit
+import os
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from enum import Enum
 from functools import lru_cache
 from typing import Any
 
+import httpx
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -592,6 +604,271 @@ def get_exchange_rate() -> dict[str, float]:
     }
 
 
+# =============================================================================
+# Write-behind Cost Recorder
+# =============================================================================
+
+# Flush when this many rows are buffered (also the multi-row insert size)
+COST_FLUSH_MAX_RECORDS = 200
+
+# Flush at least this often while rows are buffered (max loss window on crash)
+COST_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Oldest rows are dropped beyond this while the database is unreachable
+COST_BUFFER_MAX_RECORDS = 20_000
+
+# A row the database keeps rejecting is dropped after this many inserts
+COST_INSERT_MAX_ATTEMPTS = 5
+
+# SQLSTATE classes that fail the same way on retry (data exception,
+# integrity constraint violation, e.g. 23503 for a deleted matter)
+COST_PERMANENT_ERROR_CLASSES = ("22", "23")
+
+
+def _is_unreachable(error: Exception) -> bool:
+    """Whether an insert failed without reaching the database."""
+    return isinstance(error, httpx.TransportError | ConnectionError | TimeoutError)
+
+
+def _is_permanent(error: Exception) -> bool:
+    """Whether the database rejected a row in a way retries can't fix."""
+    code = str(getattr(error, "code", "") or "")
+    return code[:2] in COST_PERMANENT_ERROR_CLASSES
+
+
+class CostRecorder:
+    """Buffers llm_costs rows and inserts them in batches off the hot path.
+
+    record() only appends to an in-process buffer. A daemon thread inserts
+    the buffer in multi-row statements when COST_FLUSH_MAX_RECORDS rows are
+    waiting or every COST_FLUSH_INTERVAL_SECONDS. Batches that can't reach
+    the database are put back and retried on the next flush, so totals
+    reconcile once it is reachable again. A batch the database rejects is
+    retried row by row; rows that fail permanently (e.g. foreign key
+    violation) or COST_INSERT_MAX_ATTEMPTS times are dropped and logged
+    (cost_recorder_row_dropped) so they can't block the rows behind them.
+
+    The flusher thread starts lazily and restarts in forked children (rows
+    buffered by the parent stay with the parent).
+    """
+
+    def __init__(
+        self,
+        supabase_client: Any,
+        max_batch: int = COST_FLUSH_MAX_RECORDS,
+        flush_interval: float = COST_FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = COST_BUFFER_MAX_RECORDS,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            supabase_client: Supabase client used for inserts.
+            max_batch: Rows per insert, and buffered rows that trigger a flush.
+            flush_interval: Seconds between periodic flushes.
+            max_buffered: Buffer bound while inserts are failing.
+        """
+        self.supabase = supabase_client
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self._reset_process_state()
+        self._atexit_registered = False
+
+    def _reset_process_state(self) -> None:
+        self._pid = os.getpid()
+        # (row, failed insert attempts)
+        self._buffer: deque[tuple[dict[str, Any], int]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> int:
+        """Rows waiting to be inserted."""
+        return len(self._buffer)
+
+    def record(self, record: dict[str, Any]) -> None:
+        """Buffer one llm_costs row.
+
+        Args:
+            record: Row as built by CostPersistenceService.build_record.
+        """
+        if self._pid != os.getpid():
+            self._reset_process_state()
+
+        with self._lock:
+            if len(self._buffer) >= self.max_buffered:
+                self._buffer.popleft()
+                self.dropped += 1
+            self._buffer.append((record, 0))
+            self.recorded += 1
+            buffered = len(self._buffer)
+
+        if self._thread is None:
+            self._start()
+        if buffered >= self.max_batch:
+            self._wakeup.set()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stopped.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name="llm-cost-recorder",
+                daemon=True,
+            )
+            self._thread.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        """Insert all buffered rows now.
+
+        Returns:
+            Number of rows inserted.
+        """
+        inserted = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    batch = [
+                        self._buffer.popleft()
+                        for _ in range(min(self.max_batch, len(self._buffer)))
+                    ]
+                if not batch:
+                    break
+
+                try:
+                    self._insert([record for record, _ in batch])
+                except Exception as e:
+                    if _is_unreachable(e):
+                        retry = batch
+                    elif len(batch) == 1:
+                        retry = self._retry_or_drop(*batch[0], e)
+                    else:
+                        # Isolate the rejected rows
+                        rows_inserted, retry = self._insert_rows(batch)
+                        inserted += rows_inserted
+                        self.flushed += rows_inserted
+                    if not retry:
+                        continue
+
+                    # Put the rest back in order; retried on the next flush
+                    with self._lock:
+                        self._buffer.extendleft(reversed(retry))
+                        overflow = len(self._buffer) - self.max_buffered
+                        for _ in range(max(overflow, 0)):
+                            self._buffer.popleft()
+                            self.dropped += 1
+                    logger.error(
+                        "cost_recorder_flush_failed",
+                        error=str(e),
+                        batch_size=len(batch),
+                        pending=len(self._buffer),
+                    )
+                    break
+
+                inserted += len(batch)
+                self.flushed += len(batch)
+
+        if inserted:
+            logger.debug("cost_recorder_flushed", rows=inserted, pending=len(self._buffer))
+        return inserted
+
+    def _insert(self, records: list[dict[str, Any]]) -> None:
+        self.supabase.table("llm_costs").insert(records).execute()
+
+    def _insert_rows(
+        self,
+        batch: list[tuple[dict[str, Any], int]],
+    ) -> tuple[int, list[tuple[dict[str, Any], int]]]:
+        """Insert a rejected batch one row at a time.
+
+        Stops at the first failure that didn't reach the database.
+
+        Returns:
+            Rows inserted, and the (row, attempts) pairs left to retry.
+        """
+        inserted = 0
+        retry: list[tuple[dict[str, Any], int]] = []
+        for index, (record, attempts) in enumerate(batch):
+            try:
+                self._insert([record])
+            except Exception as e:
+                if _is_unreachable(e):
+                    return inserted, retry + batch[index:]
+                retry.extend(self._retry_or_drop(record, attempts, e))
+                continue
+            inserted += 1
+        return inserted, retry
+
+    def _retry_or_drop(
+        self,
+        record: dict[str, Any],
+        attempts: int,
+        error: Exception,
+    ) -> list[tuple[dict[str, Any], int]]:
+        """Count a rejected insert; drop the row if it can't succeed.
+
+        Returns:
+            The row with its new attempt count, or nothing if it was dropped.
+        """
+        attempts += 1
+        if not _is_permanent(error) and attempts < COST_INSERT_MAX_ATTEMPTS:
+            return [(record, attempts)]
+
+        with self._lock:
+            self.dropped += 1
+        logger.error(
+            "cost_recorder_row_dropped",
+            error=str(error),
+            error_code=getattr(error, "code", None),
+            attempts=attempts,
+            matter_id=record.get("matter_id"),
+            operation=record.get("operation"),
+            total_cost_inr=record.get("total_cost_inr"),
+        )
+        return []
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop the flusher thread and insert whatever is still buffered.
+
+        Args:
+            timeout: Seconds to wait for an in-progress flush.
+        """
+        if self._atexit_registered:
+            atexit.unregister(self.close)
+            self._atexit_registered = False
+
+        self._stopped.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+        if self.recorded:
+            logger.info(
+                "cost_recorder_closed",
+                recorded=self.recorded,
+                flushed=self.flushed,
+                dropped=self.dropped,
+                pending=len(self._buffer),
+            )
+
+
 # =============================================================================
 # Cost Persistence Service
 # =============================================================================
@@ -600,11 +877,13 @@ def get_exchange_rate() -> dict[str, float]:
 class CostPersistenceService:
     """Service for persisting LLM costs to the database.
 
-    Provides async methods for storing and querying cost data.
+    Provides async methods for storing and querying cost data. Hot-path
+    callers use record_cost (write-behind via CostRecorder); save_cost
+    inserts immediately and returns the row ID.
 
     Example:
         >>> service = CostPersistenceService(supabase_client)
-        >>> await service.save_cost(tracker)
+        >>> service.record_cost(tracker)
         >>> summary = await service.get_matter_cost_summary(matter_id)
     """
 
@@ -615,13 +894,73 @@ class CostPersistenceService:
             supabase_client: Supabase client instance.
         """
         self.supabase = supabase_client
+        self.recorder = CostRecorder(supabase_client)
+
+    @staticmethod
+    def build_record(
+        tracker: CostTracker,
+        metadata: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build the llm_costs row for a tracker.
+
+        Args:
+            tracker: CostTracker instance with cost data.
+            metadata: Additional metadata to store.
+
+        Returns:
+            Row dictionary for the llm_costs table.
+        """
+        return {
+            "matter_id": tracker.matter_id,
+            "document_id": tracker.document_id,
+            "entity_id": tracker.entity_id,
+            "provider": tracker.provider.value,
+            "operation": tracker.operation,
+            "input_tokens": tracker.input_tokens,
+            "output_tokens": tracker.output_tokens,
+            # Primary currency: INR
+            "input_cost_inr": round(tracker.input_cost_inr, 4),
+            "output_cost_inr": round(tracker.output_cost_inr, 4),
+            "total_cost_inr": round(tracker.total_cost_inr, 4),
+            # USD for reference
+            "input_cost_usd": tracker.input_cost_usd,
+            "output_cost_usd": tracker.output_cost_usd,
+            "total_cost_usd": tracker.total_cost_usd,
+            # Exchange rate at time of tracking
+            "usd_to_inr_rate": USD_TO_INR_RATE,
+            "duration_ms": tracker.duration_ms,
+            "metadata": metadata or {},
+            # Stamped now so buffered rows land in the right rollup day
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+
+    def record_cost(
+        self,
+        tracker: CostTracker,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Buffer a cost record for write-behind insertion.
+
+        Args:
+            tracker: CostTracker instance with cost data.
+            metadata: Additional metadata to store.
+        """
+        try:
+            self.recorder.record(self.build_record(tracker, metadata))
+        except Exception as e:
+            logger.error(
+                "cost_persistence_record_failed",
+                error=str(e),
+                operation=tracker.operation,
+                provider=tracker.provider.value,
+            )
 
     async def save_cost(
         self,
         tracker: CostTracker,
         metadata: dict[str, Any] | None = None,
     ) -> str | None:
-        """Save a cost tracker record to the database.
+        """Save a cost tracker record to the database immediately.
 
         Args:
             tracker: CostTracker instance with cost data.
@@ -631,27 +970,7 @@ class CostPersistenceService:
             The created record ID, or None if save failed.
         """
         try:
-            record = {
-                "matter_id": tracker.matter_id,
-                "document_id": tracker.document_id,
-                "entity_id": tracker.entity_id,
-                "provider": tracker.provider.value,
-                "operation": tracker.operation,
-                "input_tokens": tracker.input_tokens,
-                "output_tokens": tracker.output_tokens,
-                # Primary currency: INR
-                "input_cost_inr": round(tracker.input_cost_inr, 4),
-                "output_cost_inr": round(tracker.output_cost_inr, 4),
-                "total_cost_inr": round(tracker.total_cost_inr, 4),
-                # USD for reference
-                "input_cost_usd": tracker.input_cost_usd,
-                "output_cost_usd": tracker.output_cost_usd,
-                "total_cost_usd": tracker.total_cost_usd,
-                # Exchange rate at time of tracking
-                "usd_to_inr_rate": USD_TO_INR_RATE,
-                "duration_ms": tracker.duration_ms,
-                "metadata": metadata or {},
-            }
+            record = self.build_record(tracker, metadata)
 
             result = self.supabase.table("llm_costs").insert(record).execute()
 
@@ -673,7 +992,7 @@ class CostPersistenceService:
         aggregator: BatchCostAggregator,
         metadata: dict[str, Any] | None = None,
     ) -> int:
-        """Save all trackers from a batch aggregator.
+        """Save all trackers from a batch aggregator in multi-row inserts.
 
         Args:
             aggregator: BatchCostAggregator with multiple trackers.
@@ -682,11 +1001,19 @@ class CostPersistenceService:
         Returns:
             Number of records successfully saved.
         """
+        records = [self.build_record(t, metadata) for t in aggregator.trackers]
         saved_count = 0
-        for tracker in aggregator.trackers:
-            record_id = await self.save_cost(tracker, metadata)
-            if record_id:
-                saved_count += 1
+        for start in range(0, len(records), COST_FLUSH_MAX_RECORDS):
+            batch = records[start:start + COST_FLUSH_MAX_RECORDS]
+            try:
+                result = self.supabase.table("llm_costs").insert(batch).execute()
+                saved_count += len(result.data or [])
+            except Exception as e:
+                logger.error(
+                    "cost_persistence_batch_save_failed",
+                    error=str(e),
+                    batch_size=len(batch),
+                )
         return saved_count
 
     async def get_matter_cost_summary(
@@ -862,19 +1189,23 @@ def get_cost_service(supabase_client: Any | None = None) -> CostPersistenceServi
     return _cost_service
 
 
-async def persist_cost(tracker: CostTracker) -> str | None:
-    """Convenience function to persist a cost tracker.
+async def persist_cost(tracker: CostTracker) -> None:
+    """Convenience function to persist a cost tracker (write-behind).
+
+    Only buffers the row; it is inserted by the service's CostRecorder.
 
     Args:
         tracker: CostTracker instance to persist.
-
-    Returns:
-        Record ID if saved, None otherwise.
     """
     service = get_cost_service()
     if service:
-        return await service.save_cost(tracker)
-    return None
+        service.record_cost(tracker)
+
+
+def close_cost_service() -> None:
+    """Flush buffered cost records at shutdown (API lifespan, worker_shutdown)."""
+    if _cost_service is not None:
+        _cost_service.recorder.close()
 
 
 # =============================================================================
@@ -7,6 +7,10 @@ CRITICAL: Uses Gemini for citation extraction per LLM routing rules -
 this is an ingestion task, NOT user-facing reasoning.
 
 Story 3-1: Act Citation Extraction (AC: #1, #2, #4)
+
+Chunk-level extraction (extract_from_chunks) skips chunks without any
+statutory cue, packs the rest into token-budgeted multi-chunk prompts and
+runs those prompts concurrently, attributing results back to each chunk.
 """
 
 import asyncio
@@ -28,12 +32,14 @@ from app.core.cost_tracking import (
 )
 from app.core.llm_rate_limiter import LLMProvider as RateLimitProvider, get_rate_limiter
 from app.engines.citation.abbreviations import (
+    ACT_ABBREVIATIONS,
     get_canonical_name,
     normalize_act_name,
 )
 from app.engines.citation.prompts import (
     CITATION_EXTRACTION_PROMPT,
     CITATION_EXTRACTION_SYSTEM_PROMPT,
+    format_citation_batch_prompt,
 )
 from app.models.citation import (
     CitationExtractionResult,
@@ -52,6 +58,32 @@ MAX_RETRY_DELAY: Final[float] = 30.0
 MAX_TEXT_LENGTH: Final[int] = 5000  # Max characters per extraction chunk (reduced from 30000 to avoid Gemini output truncation)
 CHUNK_OVERLAP: Final[int] = 500  # Overlap between chunks to avoid missing citations at boundaries
 
+# Packed chunk extraction
+BATCH_TOKEN_BUDGET: Final[int] = 3000  # Estimated chunk-text tokens per packed prompt
+MAX_CHUNKS_PER_BATCH: Final[int] = 12  # Keeps packed responses well under max_output_tokens
+BATCH_CONCURRENCY: Final[int] = 4  # Packed prompts in flight per extract_from_chunks call
+
+# Cheap pre-filter: a chunk without any of these cannot contain a citation.
+# Keywords cover every trigger of CITATION_PATTERNS (section, u/s, Act, Code)
+# plus forms only the LLM picks up (articles, rules, sanhitas, abbreviations).
+_CITATION_CUE_KEYWORDS: Final[str] = (
+    r"sections?|secs?\.|u/s|s\.\s*\d|articles?\s*\d|art\.\s*\d|rules?\s*\d"
+    r"|act|acts|code|sanhita|adhiniyam|ordinance|proviso|explanation"
+)
+CITATION_CUE_PATTERN: Final[re.Pattern] = re.compile(
+    r"(?<![A-Za-z0-9])(?:"
+    + _CITATION_CUE_KEYWORDS
+    + "|"
+    + "|".join(
+        re.escape(abbr)
+        for abbr in sorted(
+            (key for key in ACT_ABBREVIATIONS if key), key=len, reverse=True
+        )
+    )
+    + r")(?![A-Za-z])",
+    re.IGNORECASE,
+)
+
 # Regex patterns for common citation formats
 CITATION_PATTERNS: Final[list[re.Pattern]] = [
     # Section X of Act Name, Year - e.g., "Section 138 of the Negotiable Instruments Act, 1881"
@@ -87,6 +119,19 @@ CITATION_PATTERNS: Final[list[re.Pattern]] = [
 ]
 
 
+def has_citation_cues(text: str) -> bool:
+    """Check whether text contains any statutory cue worth sending to the LLM.
+
+    Args:
+        text: Chunk text.
+
+    Returns:
+        True if the text mentions a section, Act, Code, article or a known
+        Act abbreviation.
+    """
+    return bool(text) and CITATION_CUE_PATTERN.search(text) is not None
+
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -440,6 +485,191 @@ class CitationExtractor:
             extraction_timestamp=datetime.now(UTC),
         )
 
+    async def extract_from_chunks(
+        self,
+        chunks: list[dict],
+        document_id: str,
+        matter_id: str,
+    ) -> dict[str, CitationExtractionResult]:
+        """Extract citations from many chunks with few LLM calls.
+
+        Chunks without a statutory cue are skipped. The rest are packed into
+        multi-chunk prompts of at most BATCH_TOKEN_BUDGET estimated tokens,
+        which run BATCH_CONCURRENCY at a time (per-chunk fallback prompts
+        included). Regex extraction still runs on
+        every cued chunk and is merged per chunk, as in extract_from_text.
+
+        Args:
+            chunks: Chunk rows with "id", "content" and optional "page_number".
+            document_id: Source document UUID.
+            matter_id: Matter UUID for context.
+
+        Returns:
+            Extraction result per chunk id (empty for skipped chunks).
+
+        Raises:
+            CitationConfigurationError: If Gemini is not configured.
+        """
+        start_time = time.time()
+
+        cued: list[dict] = []
+        oversized: list[dict] = []
+        for chunk in chunks:
+            text = chunk.get("content") or ""
+            if not text.strip() or not has_citation_cues(text):
+                continue
+            if len(text) > MAX_TEXT_LENGTH:
+                # Split with overlap by extract_from_text instead of packing
+                oversized.append(chunk)
+            else:
+                cued.append(chunk)
+
+        packs = self._pack_chunks(cued)
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        gemini_by_chunk: dict[str, list[ExtractedCitation]] = {}
+
+        async def run_pack(pack: list[dict]) -> None:
+            gemini_by_chunk.update(
+                await self._extract_packed(pack, document_id, semaphore)
+            )
+
+        async def run_oversized(chunk: dict) -> CitationExtractionResult:
+            async with semaphore:
+                return await self.extract_from_text(
+                    text=chunk["content"],
+                    document_id=document_id,
+                    matter_id=matter_id,
+                    page_number=chunk.get("page_number"),
+                    chunk_id=chunk["id"],
+                )
+
+        oversized_results = (
+            await asyncio.gather(
+                *(run_pack(pack) for pack in packs),
+                *(run_oversized(chunk) for chunk in oversized),
+            )
+        )[len(packs):]
+
+        results: dict[str, CitationExtractionResult] = {
+            chunk["id"]: result
+            for chunk, result in zip(oversized, oversized_results, strict=True)
+        }
+        for chunk in chunks:
+            chunk_id = chunk["id"]
+            if chunk_id in results:
+                continue
+
+            citations: list[ExtractedCitation] = []
+            if chunk_id in gemini_by_chunk:
+                citations = self._merge_citations(
+                    self._extract_with_regex(chunk["content"]),
+                    gemini_by_chunk[chunk_id],
+                )
+
+            results[chunk_id] = CitationExtractionResult(
+                citations=citations,
+                unique_acts=self._get_unique_acts(citations),
+                source_document_id=document_id,
+                source_chunk_id=chunk_id,
+                page_number=chunk.get("page_number"),
+                extraction_timestamp=datetime.now(UTC),
+            )
+
+        logger.info(
+            "citation_chunk_extraction_complete",
+            document_id=document_id,
+            matter_id=matter_id,
+            chunk_count=len(chunks),
+            cue_free_skipped=len(chunks) - len(cued) - len(oversized),
+            packed_prompts=len(packs),
+            oversized_chunks=len(oversized),
+            citation_count=sum(len(r.citations) for r in results.values()),
+            processing_time_ms=int((time.time() - start_time) * 1000),
+        )
+
+        return results
+
+    def _pack_chunks(self, chunks: list[dict]) -> list[list[dict]]:
+        """Pack chunks in order into prompts within the token budget.
+
+        Args:
+            chunks: Chunk rows, each at most MAX_TEXT_LENGTH characters.
+
+        Returns:
+            Packs of chunks; a chunk over the budget gets a pack of its own.
+        """
+        packs: list[list[dict]] = []
+        current: list[dict] = []
+        current_tokens = 0
+
+        for chunk in chunks:
+            tokens = estimate_tokens(chunk["content"])
+            if current and (
+                current_tokens + tokens > BATCH_TOKEN_BUDGET
+                or len(current) >= MAX_CHUNKS_PER_BATCH
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(chunk)
+            current_tokens += tokens
+
+        if current:
+            packs.append(current)
+        return packs
+
+    async def _extract_packed(
+        self,
+        pack: list[dict],
+        document_id: str,
+        semaphore: asyncio.Semaphore,
+    ) -> dict[str, list[ExtractedCitation]]:
+        """Run one packed prompt and map its citations back to chunk ids.
+
+        A pack whose response cannot be parsed (e.g. truncated JSON) is
+        retried one chunk per prompt so recall does not depend on packing.
+
+        Args:
+            pack: Chunk rows sent together.
+            document_id: Document ID for logging and cost attribution.
+            semaphore: Limits prompts in flight, fallback prompts included.
+
+        Returns:
+            Gemini citations per chunk id. Empty lists if Gemini failed.
+        """
+        # Short local ids keep prompts small and avoid echoing UUIDs back
+        local_pack = [(f"c{i}", chunk) for i, chunk in enumerate(pack)]
+        prompt = format_citation_batch_prompt(
+            [(local_id, chunk["content"]) for local_id, chunk in local_pack]
+        )
+
+        async with semaphore:
+            response_text = await self._generate_async(
+                prompt, document_id, operation="citation_extraction_batch"
+            )
+        if response_text is None:
+            # Gemini unavailable, regex results still available
+            return {chunk["id"]: [] for chunk in pack}
+
+        attributed = self._parse_batch_response(response_text, local_pack)
+        if attributed is not None:
+            return {chunk["id"]: attributed[local_id] for local_id, chunk in local_pack}
+
+        logger.info(
+            "citation_batch_fallback_per_chunk",
+            document_id=document_id,
+            chunk_count=len(pack),
+        )
+
+        async def extract_single(chunk: dict) -> list[ExtractedCitation]:
+            async with semaphore:
+                return await self._extract_with_gemini(chunk["content"], document_id)
+
+        fallback = await asyncio.gather(*(extract_single(chunk) for chunk in pack))
+        return {
+            chunk["id"]: citations
+            for chunk, citations in zip(pack, fallback, strict=True)
+        }
+
     def _extract_with_regex(self, text: str) -> list[ExtractedCitation]:
         """Extract citations using regex patterns.
 
@@ -517,10 +747,37 @@ class CitationExtractor:
         """
         prompt = CITATION_EXTRACTION_PROMPT.format(text=text)
 
+        response_text = await self._generate_async(
+            prompt, document_id, operation="citation_extraction"
+        )
+        if response_text is None:
+            return []  # Return empty on failure, regex results still available
+
+        return self._parse_gemini_response(response_text)
+
+    async def _generate_async(
+        self,
+        prompt: str,
+        document_id: str,
+        operation: str,
+    ) -> str | None:
+        """Call Gemini with rate limiting, retries and cost tracking.
+
+        Args:
+            prompt: Complete prompt.
+            document_id: Document ID for logging and cost attribution.
+            operation: Cost tracking operation name.
+
+        Returns:
+            Response text, or None if Gemini failed after retries.
+
+        Raises:
+            CitationConfigurationError: If Gemini is not configured.
+        """
         # Cost tracking for Gemini usage
         cost_tracker = CostTracker(
             provider=LLMProvider.GEMINI_FLASH,
-            operation="citation_extraction",
+            operation=operation,
             document_id=document_id,
         )
 
@@ -543,7 +800,7 @@ class CitationExtractor:
                 cost_tracker.log_cost()
                 await persist_cost(cost_tracker)
 
-                return self._parse_gemini_response(response.text)
+                return response.text or ""
 
             except CitationConfigurationError:
                 raise
@@ -575,10 +832,11 @@ class CitationExtractor:
             "citation_extraction_gemini_failed",
             error=str(last_error),
             document_id=document_id,
+            operation=operation,
             attempts=MAX_RETRIES,
         )
 
-        return []  # Return empty on failure, regex results still available
+        return None
 
     def _extract_with_gemini_sync(
         self,
@@ -661,24 +919,7 @@ class CitationExtractor:
             List of parsed citations.
         """
         try:
-            # Clean up response text
-            json_text = response_text.strip()
-
-            # Remove markdown code blocks if present
-            if json_text.startswith("```"):
-                lines = json_text.split("\n")
-                json_lines = []
-                in_block = False
-                for line in lines:
-                    if line.strip().startswith("```"):
-                        in_block = not in_block
-                        continue
-                    if in_block:
-                        json_lines.append(line)
-                json_text = "\n".join(json_lines)
-
-            # Parse JSON
-            parsed = json.loads(json_text)
+            parsed = self._load_json_response(response_text)
 
             if not isinstance(parsed, dict):
                 logger.warning(
@@ -687,47 +928,7 @@ class CitationExtractor:
                 )
                 return []
 
-            citations: list[ExtractedCitation] = []
-            raw_citations = parsed.get("citations", [])
-
-            for raw in raw_citations:
-                try:
-                    # Handle null values from Gemini response
-                    section = raw.get("section") or ""
-                    act_name = raw.get("act_name") or ""
-                    raw_text = raw.get("raw_text") or ""
-
-                    # Skip if no section - Act mentions without section refs are not citations
-                    if not section:
-                        logger.debug(
-                            "citation_skipped_no_section",
-                            act_name=act_name,
-                            raw_text=raw_text[:80] if raw_text else "",
-                        )
-                        continue
-
-                    citation = ExtractedCitation(
-                        act_name=act_name,
-                        section=section,
-                        subsection=raw.get("subsection"),
-                        clause=raw.get("clause"),
-                        raw_text=raw_text,
-                        quoted_text=raw.get("quoted_text"),
-                        confidence=float(raw.get("confidence", 80.0)),
-                    )
-
-                    if citation.act_name and citation.section:
-                        citations.append(citation)
-
-                except Exception as e:
-                    logger.debug(
-                        "citation_parse_error",
-                        error=str(e),
-                        raw=str(raw)[:100],
-                    )
-                    continue
-
-            return citations
+            return self._parse_citation_items(parsed.get("citations", []))
 
         except json.JSONDecodeError as e:
             logger.warning(
@@ -744,6 +945,148 @@ class CitationExtractor:
             )
             return []
 
+    def _parse_batch_response(
+        self,
+        response_text: str,
+        pack: list[tuple[str, dict]],
+    ) -> dict[str, list[ExtractedCitation]] | None:
+        """Parse a packed-prompt response and attribute citations to chunks.
+
+        Citations under an unknown chunk id are attributed to the chunk whose
+        text contains their raw_text, and dropped if none does.
+
+        Args:
+            response_text: Raw response from Gemini.
+            pack: (local chunk id, chunk row) pairs sent in the prompt.
+
+        Returns:
+            Citations per local chunk id, or None if the response is not
+            valid JSON (e.g. truncated output).
+        """
+        try:
+            parsed = self._load_json_response(response_text)
+        except json.JSONDecodeError as e:
+            logger.warning(
+                "citation_batch_response_json_error",
+                error=str(e),
+                chunk_count=len(pack),
+                response_preview=response_text[:200] if response_text else "",
+            )
+            return None
+
+        if not isinstance(parsed, dict) or not isinstance(parsed.get("chunks"), list):
+            logger.warning(
+                "citation_batch_response_invalid",
+                response_type=type(parsed).__name__,
+                chunk_count=len(pack),
+            )
+            return None
+
+        texts = {local_id: chunk.get("content") or "" for local_id, chunk in pack}
+        attributed: dict[str, list[ExtractedCitation]] = {local_id: [] for local_id in texts}
+
+        for entry in parsed["chunks"]:
+            if not isinstance(entry, dict):
+                continue
+            local_id = str(entry.get("chunk_id") or "")
+            for citation in self._parse_citation_items(entry.get("citations") or []):
+                if local_id in attributed:
+                    attributed[local_id].append(citation)
+                    continue
+
+                owner = next(
+                    (
+                        cid
+                        for cid, text in texts.items()
+                        if citation.raw_text and citation.raw_text in text
+                    ),
+                    None,
+                )
+                if owner is None:
+                    logger.debug(
+                        "citation_batch_unattributed",
+                        chunk_id=local_id,
+                        raw_text=citation.raw_text[:80],
+                    )
+                    continue
+                attributed[owner].append(citation)
+
+        return attributed
+
+    def _load_json_response(self, response_text: str) -> object:
+        """Load JSON from a Gemini response, stripping markdown code blocks.
+
+        Raises:
+            json.JSONDecodeError: If the response is not valid JSON.
+        """
+        # Clean up response text
+        json_text = (response_text or "").strip()
+
+        # Remove markdown code blocks if present
+        if json_text.startswith("```"):
+            lines = json_text.split("\n")
+            json_lines = []
+            in_block = False
+            for line in lines:
+                if line.strip().startswith("```"):
+                    in_block = not in_block
+                    continue
+                if in_block:
+                    json_lines.append(line)
+            json_text = "\n".join(json_lines)
+
+        return json.loads(json_text)
+
+    def _parse_citation_items(self, raw_citations: list) -> list[ExtractedCitation]:
+        """Build citations from the "citations" array of a Gemini response.
+
+        Args:
+            raw_citations: Raw citation dicts.
+
+        Returns:
+            Valid citations; entries without a section are skipped.
+        """
+        citations: list[ExtractedCitation] = []
+
+        for raw in raw_citations:
+            try:
+                # Handle null values from Gemini response
+                section = raw.get("section") or ""
+                act_name = raw.get("act_name") or ""
+                raw_text = raw.get("raw_text") or ""
+
+                # Skip if no section - Act mentions without section refs are not citations
+                if not section:
+                    logger.debug(
+                        "citation_skipped_no_section",
+                        act_name=act_name,
+                        raw_text=raw_text[:80] if raw_text else "",
+                    )
+                    continue
+
+                citation = ExtractedCitation(
+                    act_name=act_name,
+                    section=section,
+                    subsection=raw.get("subsection"),
+                    clause=raw.get("clause"),
+                    raw_text=raw_text,
+                    quoted_text=raw.get("quoted_text"),
+                    confidence=float(raw.get("confidence", 80.0)),
+                )
+
+                if citation.act_name and citation.section:
+                    citations.append(citation)
+
+            except Exception as e:
+                logger.debug(
+                    "citation_parse_error",
+                    error=str(e),
+                    raw=str(raw)[:100],
+                )
+                continue
+
+        return citations
+
     def _merge_citations(
         self,
         regex_citations: list[ExtractedCitation],
@@ -16,9 +16,12 @@ References:
 
 import asyncio
 import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Final
-from urllib.parse import quote, urljoin
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 from bs4 import BeautifulSoup
@@ -79,6 +82,42 @@ class IndiaCodeDownloadResult:
     file_size: int
 
 
+# =============================================================================
+# Per-host politeness
+# =============================================================================
+
+
+class HostPoliteness:
+    """Per-host request budget shared by concurrent requests of one client.
+
+    Requests to the same host start at least ``min_interval`` seconds apart
+    and at most ``max_concurrent`` are in flight. Different hosts don't wait
+    on each other.
+    """
+
+    def __init__(self, min_interval: float, max_concurrent: int):
+        self.min_interval = min_interval
+        self.max_concurrent = max(1, max_concurrent)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a request slot for the host of ``url``."""
+        host = urlsplit(url).netloc
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrent))
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with semaphore:
+            async with lock:
+                delay = self._next_start.get(host, 0.0) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._next_start[host] = time.monotonic() + self.min_interval
+            yield
+
+
 # =============================================================================
 # India Code Client
 # =============================================================================
@@ -92,7 +131,9 @@ class IndiaCodeClient:
     2. Download Act PDFs
     3. Get direct PDF URLs
 
-    The client implements rate limiting to avoid overwhelming the server.
+    The client spaces requests per host (request_delay) and caps requests in
+    flight per host (india_code_max_concurrent_per_host), so one client can
+    be shared by concurrent acquisitions without overwhelming the server.
     Configuration is loaded from settings (config.py).
 
     Example usage:
@@ -103,19 +144,35 @@ class IndiaCodeClient:
                 print(f"Downloaded {len(pdf.pdf_bytes)} bytes")
     """
 
-    def __init__(self, request_delay: float | None = None):
+    def __init__(
+        self,
+        request_delay: float | None = None,
+        base_url: str = BASE_URL,
+        max_concurrent_per_host: int | None = None,
+    ):
         """Initialize the India Code client.
 
         Args:
-            request_delay: Delay between requests in seconds.
+            request_delay: Delay between requests to a host in seconds.
+                          If None, uses value from settings.
+            base_url: India Code base URL (overridable for local stubs).
+            max_concurrent_per_host: Requests in flight per host.
                           If None, uses value from settings.
         """
         settings = get_settings()
         self.request_delay = request_delay if request_delay is not None else settings.india_code_request_delay
         self.request_timeout = settings.india_code_request_timeout
         self.enabled = settings.india_code_enabled
+        self.base_url = base_url.rstrip("/")
+        self._politeness = HostPoliteness(
+            min_interval=self.request_delay,
+            max_concurrent=(
+                max_concurrent_per_host
+                if max_concurrent_per_host is not None
+                else settings.india_code_max_concurrent_per_host
+            ),
+        )
         self._client: httpx.AsyncClient | None = None
-        self._last_request_time: float = 0
         self._known_acts: dict[str, tuple[str, str]] | None = None
 
     def _get_known_acts(self) -> dict[str, tuple[str, str]]:
@@ -139,15 +196,11 @@ class IndiaCodeClient:
             await self._client.aclose()
             self._client = None
 
-    async def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        import time
-
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self.request_delay:
-            await asyncio.sleep(self.request_delay - elapsed)
-        self._last_request_time = time.time()
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET within the per-host politeness budget."""
+        client = self._get_client()
+        async with self._politeness.slot(url):
+            return await client.get(url, **kwargs)
 
     def _get_client(self) -> httpx.AsyncClient:
         """Get the HTTP client, creating if necessary."""
@@ -174,9 +227,9 @@ class IndiaCodeClient:
             # filename may include bitstream number prefix like "2/A187209.pdf"
             # or just the filename for legacy format
             if "/" in filename:
-                return f"{BASE_URL}/bitstream/123456789/{doc_id}/{filename}"
+                return f"{self.base_url}/bitstream/123456789/{doc_id}/{filename}"
             else:
-                return f"{BASE_URL}/bitstream/123456789/{doc_id}/1/{filename}"
+                return f"{self.base_url}/bitstream/123456789/{doc_id}/1/{filename}"
         return None
 
     def get_known_doc_id(self, normalized_act_name: str) -> str | None:
@@ -212,19 +265,13 @@ class IndiaCodeClient:
             logger.warning("India Code integration is disabled")
             return []
 
-        client = self._get_client()
-        await self._rate_limit()
-
         # Clean the search term
         search_term = act_name.strip()
         if year:
             search_term = f"{search_term} {year}"
 
-        # URL encode the search term
-        encoded_term = quote(search_term)
-
         # Search URL - using simple search on Central Acts handle
-        search_url = f"{BASE_URL}/handle/{CENTRAL_ACTS_HANDLE}/simple-search"
+        search_url = f"{self.base_url}/handle/{CENTRAL_ACTS_HANDLE}/simple-search"
         params = {
             "query": search_term,
             "filter_field_1": "type",
@@ -234,7 +281,7 @@ class IndiaCodeClient:
 
         try:
             logger.info(f"Searching India Code for: {search_term}")
-            response = await client.get(search_url, params=params)
+            response = await self._get(search_url, params=params)
             response.raise_for_status()
 
             # Parse HTML response
@@ -269,7 +316,7 @@ class IndiaCodeClient:
                     extracted_year = int(year_match.group(1))
 
                 # Build full URLs
-                handle_url = urljoin(BASE_URL, href)
+                handle_url = urljoin(self.base_url, href)
 
                 results.append(
                     IndiaCodeSearchResult(
@@ -310,14 +357,11 @@ class IndiaCodeClient:
             logger.warning("India Code integration is disabled")
             return None
 
-        client = self._get_client()
-        await self._rate_limit()
-
-        handle_url = f"{BASE_URL}/handle/123456789/{doc_id}"
+        handle_url = f"{self.base_url}/handle/123456789/{doc_id}"
 
         try:
             logger.info(f"Fetching bitstream URL for doc_id: {doc_id}")
-            response = await client.get(handle_url)
+            response = await self._get(handle_url)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.text, "html.parser")
@@ -326,14 +370,14 @@ class IndiaCodeClient:
             # 1. Direct bitstream link
             bitstream_link = soup.select_one("a[href*='/bitstream/'][href$='.pdf']")
             if bitstream_link:
-                return urljoin(BASE_URL, bitstream_link.get("href", ""))
+                return urljoin(self.base_url, bitstream_link.get("href", ""))
 
             # 2. Files section
             files_section = soup.select_one(".file-list, .files, .ds-table")
             if files_section:
                 pdf_link = files_section.select_one("a[href*='.pdf']")
                 if pdf_link:
-                    return urljoin(BASE_URL, pdf_link.get("href", ""))
+                    return urljoin(self.base_url, pdf_link.get("href", ""))
 
             # 3. Try common bitstream pattern
             # Many acts follow: /bitstream/123456789/{doc_id}/1/{filename}.pdf
@@ -383,8 +427,6 @@ class IndiaCodeClient:
                 file_size=0,
             )
 
-        client = self._get_client()
-
         # Get bitstream URL if not provided
         if not bitstream_url:
             bitstream_url = await self.get_bitstream_url(doc_id)
@@ -398,11 +440,9 @@ class IndiaCodeClient:
                     file_size=0,
                 )
 
-        await self._rate_limit()
-
         try:
             logger.info(f"Downloading PDF from: {bitstream_url}")
-            response = await client.get(bitstream_url)
+            response = await self._get(bitstream_url)
             response.raise_for_status()
 
             # Verify it's a PDF
@@ -469,7 +509,7 @@ class IndiaCodeClient:
             return None
 
         doc_id, filename = known_acts[normalized_act_name]
-        bitstream_url = f"{BASE_URL}/bitstream/123456789/{doc_id}/1/{filename}"
+        bitstream_url = f"{self.base_url}/bitstream/123456789/{doc_id}/1/{filename}"
 
         return await self.download_pdf(doc_id, bitstream_url)
 
@@ -179,6 +179,79 @@ def format_citation_extraction_prompt(text: str) -> str:
     )
 
 
+# =============================================================================
+# Packed Multi-Chunk Extraction Prompt
+# =============================================================================
+
+CITATION_BATCH_EXTRACTION_PROMPT: Final[str] = """You are a legal citation extraction specialist for Indian law.
+
+Your task is to extract ALL Act/statute citations from each of the text chunks below.
+Be thorough - missing a citation is worse than a false positive.
+
+Each chunk is wrapped in a <chunk id="..."> tag. Chunks are independent excerpts:
+attribute every citation to the chunk whose text contains it, and never merge
+text across chunks.
+
+Apply the same rules as single-text extraction:
+1. Extract EVERY citation with a section reference - Act mentions without a section are not citations
+2. Handle full Act names and abbreviations (NI Act, IPC, CrPC, etc.), "u/s 138", "S. 138", "sec. 138"
+3. For ranges (138-141) and "read with" clauses, create separate entries for EACH section
+4. Keep raw_text as the EXACT text from the chunk (for highlighting)
+5. The "act_name" field must contain ONLY the Act name with optional year
+6. Confidence: 90-100 for clear citations, 70-89 for ambiguous ones, below 70 for uncertain
+
+## Output Format
+
+Return a JSON object with one entry per chunk that contains citations:
+```json
+{{
+  "chunks": [
+    {{
+      "chunk_id": "c0",
+      "citations": [
+        {{
+          "act_name": "Negotiable Instruments Act, 1881",
+          "section": "138",
+          "subsection": null,
+          "clause": null,
+          "raw_text": "Section 138 of the Negotiable Instruments Act, 1881",
+          "quoted_text": null,
+          "confidence": 95
+        }}
+      ]
+    }}
+  ]
+}}
+```
+
+Chunks without citations may be omitted.
+
+Now extract ALL citations from the following chunks:
+
+{chunks}
+
+Return ONLY valid JSON, no explanation or markdown formatting."""
+
+
+def format_citation_batch_prompt(chunks: list[tuple[str, str]]) -> str:
+    """Format the packed extraction prompt with XML-wrapped chunk texts.
+
+    SECURITY: Each chunk's text is wrapped in document content boundaries;
+    the chunk tags themselves are added outside the wrapped content.
+
+    Args:
+        chunks: (local chunk id, chunk text) pairs in prompt order.
+
+    Returns:
+        Complete formatted prompt.
+    """
+    blocks = "\n\n".join(
+        f'<chunk id="{chunk_id}">{wrap_document_content(text)}</chunk>'
+        for chunk_id, text in chunks
+    )
+    return CITATION_BATCH_EXTRACTION_PROMPT.format(chunks=blocks)
+
+
 # =============================================================================
 # Citation Validation Prompt (for verifying extracted citations)
 # =============================================================================
@@ -17,10 +17,14 @@ from app.engines.contradiction.classifier import (
     get_contradiction_classifier,
 )
 from app.engines.contradiction.comparator import (
+    CachedVerdict,
     ComparisonBatchResult,
+    ComparisonCallback,
     LLMCostTracker,
+    PairVerdictStore,
     StatementComparator,
     StatementPair,
+    compute_pair_hash,
     get_statement_comparator,
 )
 from app.engines.contradiction.scorer import (
@@ -41,10 +45,14 @@ __all__ = [
     "get_statement_query_engine",
     "get_value_extractor",
     # Story 5-2
+    "CachedVerdict",
     "ComparisonBatchResult",
+    "ComparisonCallback",
     "LLMCostTracker",
+    "PairVerdictStore",
     "StatementComparator",
     "StatementPair",
+    "compute_pair_hash",
     "get_statement_comparator",
     # Story 5-3
     "ContradictionClassifier",
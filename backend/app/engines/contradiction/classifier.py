@@ -4,7 +4,8 @@ Story 5-3: Contradiction Type Classification
 
 Classifies contradictions by type (date_mismatch, amount_mismatch, factual,
 semantic) for attorney prioritization. Uses rule-based classification first,
-with GPT-4 fallback only for ambiguous cases.
+with GPT-4 fallback only for ambiguous cases. classify_all sends the
+ambiguous cases to GPT-4 several per prompt, a few prompts at a time.
 
 CRITICAL: Minimize LLM usage - 80%+ should be rule-based, <20% LLM.
 """
@@ -13,14 +14,17 @@ import asyncio
 import json
 import re
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from functools import lru_cache
 
 import structlog
 
 from app.core.config import get_settings
+from app.core.cost_tracking import estimate_tokens
 from app.engines.contradiction.prompts import (
     CLASSIFICATION_ENHANCEMENT_SYSTEM_PROMPT,
+    format_classification_batch_prompt,
     format_classification_prompt,
     validate_classification_response,
 )
@@ -62,6 +66,11 @@ MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0
 MAX_RETRY_DELAY = 30.0
 
+# Batched LLM fallback (classify_all)
+LLM_BATCH_TOKEN_BUDGET = 4000  # Estimated statement tokens per prompt
+LLM_BATCH_MAX_ITEMS = 10  # Keeps per-item explanations within the response
+LLM_BATCH_CONCURRENCY = 4  # Prompts in flight per classify_all call
+
 # Indian amount patterns for normalization
 INDIAN_AMOUNT_PATTERNS = [
     # Lakhs patterns
@@ -87,6 +96,14 @@ INDIAN_DATE_PATTERNS = [
     ),
 ]
 
+# Amount mentions in free text: currency-prefixed or lakh/crore figures.
+# Bare numbers are not amounts (section numbers, counts, years).
+AMOUNT_MENTION_PATTERN = re.compile(
+    r"(?:(?:Rs\.?|INR|₹)\s*\d[\d,]*(?:\.\d+)?(?:\s*(?:lakhs?|lacs?|crores?|cr)\b)?"
+    r"|\b\d+(?:\.\d+)?\s*(?:lakhs?|lacs?|crores?)\b)",
+    re.IGNORECASE,
+)
+
 MONTH_MAP = {
     "jan": "01", "january": "01",
     "feb": "02", "february": "02",
@@ -255,6 +272,70 @@ def normalize_indian_date(value: str | None) -> str | None:
     return None
 
 
+def find_indian_dates(text: str | None) -> dict[str, str]:
+    """Find dates in text in the shapes normalize_indian_date understands.
+
+    Args:
+        text: Free text (e.g., a statement).
+
+    Returns:
+        Map of normalized ISO date to the first original mention.
+    """
+    found: dict[str, str] = {}
+    if not text:
+        return found
+
+    for pattern in INDIAN_DATE_PATTERNS:
+        for match in pattern.finditer(text):
+            normalized = normalize_indian_date(match.group(0))
+            if normalized:
+                found.setdefault(normalized, match.group(0))
+    return found
+
+
+def find_indian_amounts(text: str | None) -> dict[str, str]:
+    """Find monetary amounts in text (Rs./INR/₹ prefixed, lakhs, crores).
+
+    Args:
+        text: Free text (e.g., a statement).
+
+    Returns:
+        Map of normalized numeric amount to the first original mention.
+    """
+    found: dict[str, str] = {}
+    if not text:
+        return found
+
+    for match in AMOUNT_MENTION_PATTERN.finditer(text):
+        normalized = normalize_indian_amount(match.group(0))
+        if normalized:
+            found.setdefault(normalized, match.group(0).strip())
+    return found
+
+
+def _differs_only_in(
+    text_a: str | None,
+    text_b: str | None,
+    mention_a: str,
+    mention_b: str,
+) -> bool:
+    """Whether two texts are the same word for word apart from one mention each.
+
+    Args:
+        text_a: First text.
+        text_b: Second text.
+        mention_a: Mention in text_a (e.g., a date as written).
+        mention_b: Mention in text_b.
+
+    Returns:
+        True if removing the mentions leaves the same words in both texts.
+    """
+    def rest(text: str | None, mention: str) -> list[str]:
+        return re.findall(r"\w+", (text or "").replace(mention, " ", 1).lower())
+
+    return rest(text_a, mention_a) == rest(text_b, mention_b)
+
+
 def create_extracted_values(
     evidence_type: EvidenceType,
     value_a: str | None,
@@ -470,6 +551,11 @@ class ContradictionClassifier:
 
         Story 5-3: 80%+ of classifications should succeed here.
 
+        When the evidence type is NONE, falls back to the values themselves:
+        if the evidence values (or else the statements) differ only in one
+        date (or amount) each, the contradiction is classified without the
+        LLM.
+
         Args:
             comparison: Comparison with evidence type.
 
@@ -480,28 +566,109 @@ class ContradictionClassifier:
 
         # Check if evidence type maps to contradiction type
         if evidence_type == EvidenceType.NONE:
-            # Cannot classify with rule-based approach
-            return None
+            return self._classify_from_values(comparison)
 
         # Direct mapping
         contradiction_type = CLASSIFICATION_MAP.get(evidence_type)
         if not contradiction_type:
-            # Unknown evidence type, need LLM
-            return None
+            # Unknown evidence type, try values before the LLM
+            return self._classify_from_values(comparison)
 
-        # Create extracted values for attorney display
-        extracted_values = create_extracted_values(
+        return self._build_rule_based(
+            comparison,
             evidence_type=evidence_type,
             value_a=comparison.evidence.value_a,
             value_b=comparison.evidence.value_b,
         )
 
+    def _classify_from_values(
+        self,
+        comparison: StatementPairComparison,
+    ) -> ClassifiedContradiction | None:
+        """Classify date/amount conflicts from normalized values.
+
+        Dates take priority over amounts, as in the LLM prompt. Values that
+        normalize to the same date or amount are not a mismatch, and a pair
+        that differs in anything besides that one value is left to the LLM
+        (the conflict may lie in the other difference).
+
+        Args:
+            comparison: Comparison whose evidence type is inconclusive.
+
+        Returns:
+            ClassifiedContradiction, or None if no unambiguous conflict.
+        """
+        evidence = comparison.evidence
+        candidates = (
+            (EvidenceType.DATE_MISMATCH, find_indian_dates),
+            (EvidenceType.AMOUNT_MISMATCH, find_indian_amounts),
+        )
+
+        def single_conflict(
+            text_a: str | None,
+            text_b: str | None,
+            find_values: Callable[[str | None], dict[str, str]],
+        ) -> tuple[str, str] | None:
+            found_a = find_values(text_a)
+            found_b = find_values(text_b)
+            if len(found_a) != 1 or len(found_b) != 1 or found_a.keys() == found_b.keys():
+                return None
+            mention_a = next(iter(found_a.values()))
+            mention_b = next(iter(found_b.values()))
+            if not _differs_only_in(text_a, text_b, mention_a, mention_b):
+                return None
+            return mention_a, mention_b
+
+        # Conflicting values reported by the comparator
+        for evidence_type, find_values in candidates:
+            if single_conflict(evidence.value_a, evidence.value_b, find_values):
+                return self._build_rule_based(
+                    comparison,
+                    evidence_type=evidence_type,
+                    value_a=evidence.value_a,
+                    value_b=evidence.value_b,
+                )
+
+        # Statements that are the same apart from one differing value
+        for evidence_type, find_values in candidates:
+            mentions = single_conflict(
+                comparison.statement_a_content,
+                comparison.statement_b_content,
+                find_values,
+            )
+            if mentions:
+                return self._build_rule_based(
+                    comparison,
+                    evidence_type=evidence_type,
+                    value_a=mentions[0],
+                    value_b=mentions[1],
+                )
+
+        return None
+
+    def _build_rule_based(
+        self,
+        comparison: StatementPairComparison,
+        evidence_type: EvidenceType,
+        value_a: str | None,
+        value_b: str | None,
+    ) -> ClassifiedContradiction:
+        """Build a rule-based classification for a mapped evidence type."""
+        contradiction_type = CLASSIFICATION_MAP[evidence_type]
+
+        # Create extracted values for attorney display
+        extracted_values = create_extracted_values(
+            evidence_type=evidence_type,
+            value_a=value_a,
+            value_b=value_b,
+        )
+
         # Generate explanation from reasoning
         explanation = self._generate_explanation(
             contradiction_type=contradiction_type,
             reasoning=comparison.reasoning,
-            value_a=comparison.evidence.value_a,
-            value_b=comparison.evidence.value_b,
+            value_a=value_a,
+            value_b=value_b,
         )
 
         return ClassifiedContradiction(
@@ -581,6 +748,36 @@ class ContradictionClassifier:
             reasoning=comparison.reasoning,
         )
 
+        parsed = await self._request_classification(user_prompt, cost_tracker)
+        if parsed is not None:
+            # Validate response
+            validation_errors = validate_classification_response(parsed)
+            if validation_errors:
+                logger.warning(
+                    "classification_response_validation_failed",
+                    errors=validation_errors,
+                )
+
+            classified = self._build_llm_classification(comparison, parsed)
+            if classified is not None:
+                return classified, cost_tracker
+
+        return self._build_llm_error_fallback(comparison), cost_tracker
+
+    async def _request_classification(
+        self,
+        user_prompt: str,
+        cost_tracker: ClassificationCostTracker,
+    ) -> dict | None:
+        """Send a classification prompt to GPT-4 with retries.
+
+        Args:
+            user_prompt: Formatted single- or multi-item prompt.
+            cost_tracker: Tracker updated with the call's token usage.
+
+        Returns:
+            Parsed JSON response, or None if every attempt failed.
+        """
         # Retry with exponential backoff
         last_error: Exception | None = None
         retry_delay = INITIAL_RETRY_DELAY
@@ -604,40 +801,16 @@ class ContradictionClassifier:
                 # Parse response
                 response_text = response.choices[0].message.content
                 parsed = json.loads(response_text)
+                if not isinstance(parsed, dict):
+                    raise ClassificationParseError("Response is not a JSON object")
 
-                # Validate response
-                validation_errors = validate_classification_response(parsed)
-                if validation_errors:
-                    logger.warning(
-                        "classification_response_validation_failed",
-                        errors=validation_errors,
-                    )
-
-                # Parse classification type
-                type_str = parsed.get("contradiction_type", "semantic_contradiction").lower()
-                contradiction_type = ContradictionType(type_str)
+                return parsed
 
-                # Extract values if they exist in evidence
-                extracted_values = create_extracted_values(
-                    evidence_type=comparison.evidence.type,
-                    value_a=comparison.evidence.value_a,
-                    value_b=comparison.evidence.value_b,
+            except (json.JSONDecodeError, ClassificationParseError) as e:
+                last_error = (
+                    e if isinstance(e, ClassificationParseError)
+                    else ClassificationParseError(f"Invalid JSON: {e}")
                 )
-
-                classified = ClassifiedContradiction(
-                    comparison_id=f"{comparison.statement_a_id}_{comparison.statement_b_id}",
-                    statement_a_id=comparison.statement_a_id,
-                    statement_b_id=comparison.statement_b_id,
-                    contradiction_type=contradiction_type,
-                    extracted_values=extracted_values,
-                    explanation=parsed.get("explanation", comparison.reasoning),
-                    classification_method="llm_fallback",
-                )
-
-                return classified, cost_tracker
-
-            except json.JSONDecodeError as e:
-                last_error = ClassificationParseError(f"Invalid JSON: {e}")
                 if attempt < MAX_RETRIES - 1:
                     await asyncio.sleep(retry_delay)
                     retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
@@ -667,14 +840,59 @@ class ContradictionClassifier:
                 elif not is_retryable:
                     break
 
-        # Failed after all retries - fall back to semantic classification
+        # Failed after all retries - caller falls back to semantic classification
         logger.error(
             "classification_llm_failed",
             error=str(last_error),
             fallback="semantic_contradiction",
         )
+        return None
+
+    def _build_llm_classification(
+        self,
+        comparison: StatementPairComparison,
+        parsed: dict,
+    ) -> ClassifiedContradiction | None:
+        """Build a classification from one parsed LLM item.
+
+        Returns:
+            ClassifiedContradiction, or None if the type is not recognized.
+        """
+        # Parse classification type
+        type_str = str(parsed.get("contradiction_type", "semantic_contradiction")).lower()
+        try:
+            contradiction_type = ContradictionType(type_str)
+        except ValueError:
+            logger.warning(
+                "classification_llm_invalid_type",
+                statement_a_id=comparison.statement_a_id,
+                statement_b_id=comparison.statement_b_id,
+                contradiction_type=type_str,
+            )
+            return None
+
+        # Extract values if they exist in evidence
+        extracted_values = create_extracted_values(
+            evidence_type=comparison.evidence.type,
+            value_a=comparison.evidence.value_a,
+            value_b=comparison.evidence.value_b,
+        )
+
+        return ClassifiedContradiction(
+            comparison_id=f"{comparison.statement_a_id}_{comparison.statement_b_id}",
+            statement_a_id=comparison.statement_a_id,
+            statement_b_id=comparison.statement_b_id,
+            contradiction_type=contradiction_type,
+            extracted_values=extracted_values,
+            explanation=parsed.get("explanation", comparison.reasoning),
+            classification_method="llm_fallback",
+        )
 
-        # Return best-effort classification
+    def _build_llm_error_fallback(
+        self,
+        comparison: StatementPairComparison,
+    ) -> ClassifiedContradiction:
+        """Best-effort semantic classification when the LLM call failed."""
         return ClassifiedContradiction(
             comparison_id=f"{comparison.statement_a_id}_{comparison.statement_b_id}",
             statement_a_id=comparison.statement_a_id,
@@ -683,7 +901,131 @@ class ContradictionClassifier:
             extracted_values=None,
             explanation=f"Classification fallback due to LLM error. Original reasoning: {comparison.reasoning}",
             classification_method="llm_fallback_error",
-        ), cost_tracker
+        )
+
+    def _pack_for_llm(
+        self,
+        comparisons: list[StatementPairComparison],
+    ) -> list[list[StatementPairComparison]]:
+        """Group inconclusive comparisons into token-budgeted prompts.
+
+        Args:
+            comparisons: Comparisons rule-based classification couldn't resolve.
+
+        Returns:
+            Packs of at most LLM_BATCH_MAX_ITEMS comparisons each, keeping
+            input order. An item over the budget gets a pack of its own.
+        """
+        packs: list[list[StatementPairComparison]] = []
+        current: list[StatementPairComparison] = []
+        current_tokens = 0
+
+        for comparison in comparisons:
+            tokens = estimate_tokens(
+                comparison.statement_a_content
+                + comparison.statement_b_content
+                + comparison.reasoning
+            )
+            if current and (
+                current_tokens + tokens > LLM_BATCH_TOKEN_BUDGET
+                or len(current) >= LLM_BATCH_MAX_ITEMS
+            ):
+                packs.append(current)
+                current, current_tokens = [], 0
+            current.append(comparison)
+            current_tokens += tokens
+
+        if current:
+            packs.append(current)
+        return packs
+
+    async def _classify_batch_with_llm(
+        self,
+        comparisons: list[StatementPairComparison],
+    ) -> list[ClassificationResult]:
+        """Classify several inconclusive contradictions in one GPT-4 call.
+
+        Items missing from the response or with an unknown type are retried
+        individually. The call's cost is split evenly across the items.
+
+        Args:
+            comparisons: One pack from _pack_for_llm.
+
+        Returns:
+            ClassificationResults in the order of comparisons.
+        """
+        start_time = time.time()
+
+        if len(comparisons) == 1:
+            classified, cost_tracker = await self._classify_with_llm(comparisons[0])
+            return [
+                ClassificationResult(
+                    classified_contradiction=classified,
+                    llm_cost_usd=cost_tracker.cost_usd,
+                    processing_time_ms=int((time.time() - start_time) * 1000),
+                )
+            ]
+
+        cost_tracker = ClassificationCostTracker(used_llm=True)
+        user_prompt = format_classification_batch_prompt(
+            [
+                (
+                    str(item_id),
+                    comparison.statement_a_content,
+                    comparison.statement_b_content,
+                    comparison.reasoning,
+                )
+                for item_id, comparison in enumerate(comparisons, start=1)
+            ]
+        )
+
+        parsed = await self._request_classification(user_prompt, cost_tracker)
+        share_usd = cost_tracker.cost_usd / len(comparisons)
+
+        items_by_id: dict[str, dict] = {}
+        if parsed is not None:
+            classifications = parsed.get("classifications")
+            if isinstance(classifications, list):
+                for item in classifications:
+                    if isinstance(item, dict) and "item_id" in item:
+                        items_by_id[str(item["item_id"])] = item
+
+        results: list[ClassificationResult] = []
+        retried = 0
+        for item_id, comparison in enumerate(comparisons, start=1):
+            item_cost = share_usd
+            if parsed is None:
+                classified = self._build_llm_error_fallback(comparison)
+            else:
+                item = items_by_id.get(str(item_id))
+                classified = (
+                    self._build_llm_classification(comparison, item)
+                    if item is not None
+                    else None
+                )
+                if classified is None:
+                    # Missing or unusable entry - classify this one on its own
+                    retried += 1
+                    classified, single_tracker = await self._classify_with_llm(comparison)
+                    item_cost += single_tracker.cost_usd
+
+            results.append(
+                ClassificationResult(
+                    classified_contradiction=classified,
+                    llm_cost_usd=item_cost,
+                    processing_time_ms=int((time.time() - start_time) * 1000),
+                )
+            )
+
+        logger.info(
+            "contradictions_classified_llm_batch",
+            item_count=len(comparisons),
+            retried_individually=retried,
+            failed=parsed is None,
+            cost_usd=cost_tracker.cost_usd,
+        )
+
+        return results
 
     async def classify_all(
         self,
@@ -691,11 +1033,15 @@ class ContradictionClassifier:
     ) -> list[ClassificationResult]:
         """Classify all contradictions in a batch.
 
+        Rule-based classification runs first for every contradiction. The
+        inconclusive remainder is packed into token-budgeted multi-item
+        prompts, at most LLM_BATCH_CONCURRENCY in flight.
+
         Args:
             comparisons: List of comparisons (filters to contradictions only).
 
         Returns:
-            List of ClassificationResults for contradictions only.
+            List of ClassificationResults for contradictions only, in input order.
         """
         # Filter to contradictions only
         contradictions = [
@@ -706,21 +1052,67 @@ class ContradictionClassifier:
         if not contradictions:
             return []
 
-        # Classify each (mostly rule-based, very fast)
-        results: list[ClassificationResult] = []
-        for comparison in contradictions:
-            try:
-                result = await self.classify_contradiction(comparison)
-                results.append(result)
-            except ClassifierError as e:
-                logger.warning(
-                    "classification_failed",
-                    statement_a_id=comparison.statement_a_id,
-                    statement_b_id=comparison.statement_b_id,
-                    error=str(e),
-                )
+        # Rule-based pass (mostly resolved here, very fast)
+        results: list[ClassificationResult | None] = [None] * len(contradictions)
+        pending: list[int] = []
+        for index, comparison in enumerate(contradictions):
+            start_time = time.time()
+            classified = self._classify_rule_based(comparison)
+            if classified is None:
+                pending.append(index)
+                continue
+            processing_time = int((time.time() - start_time) * 1000)
 
-        return results
+            logger.info(
+                "contradiction_classified_rule_based",
+                statement_a_id=comparison.statement_a_id,
+                statement_b_id=comparison.statement_b_id,
+                contradiction_type=classified.contradiction_type.value,
+                processing_time_ms=processing_time,
+            )
+
+            results[index] = ClassificationResult(
+                classified_contradiction=classified,
+                llm_cost_usd=0.0,
+                processing_time_ms=processing_time,
+            )
+
+        if pending:
+            logger.info(
+                "contradiction_classification_llm_fallback",
+                item_count=len(pending),
+                reason="evidence_type_none_or_ambiguous",
+            )
+
+            packs: list[list[int]] = []
+            position = 0
+            for pack in self._pack_for_llm([contradictions[i] for i in pending]):
+                packs.append(pending[position:position + len(pack)])
+                position += len(pack)
+
+            semaphore = asyncio.Semaphore(LLM_BATCH_CONCURRENCY)
+
+            async def classify_pack(indices: list[int]) -> None:
+                async with semaphore:
+                    try:
+                        outcome = await self._classify_batch_with_llm(
+                            [contradictions[i] for i in indices]
+                        )
+                    except ClassifierError as e:
+                        for index in indices:
+                            logger.warning(
+                                "classification_failed",
+                                statement_a_id=contradictions[index].statement_a_id,
+                                statement_b_id=contradictions[index].statement_b_id,
+                                error=str(e),
+                            )
+                        return
+                for index, result in zip(indices, outcome, strict=True):
+                    results[index] = result
+
+            await asyncio.gather(*(classify_pack(indices) for indices in packs))
+
+        return [r for r in results if r is not None]
 
 
 # =============================================================================
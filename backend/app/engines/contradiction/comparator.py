@@ -14,11 +14,15 @@ high-stakes contradiction detection (user must be aware of degraded state).
 """
 
 import asyncio
+import hashlib
 import itertools
 import json
+import random
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from functools import lru_cache
+from typing import Any, Protocol
 
 import structlog
 
@@ -28,8 +32,10 @@ from app.core.circuit_breaker import (
     with_circuit_breaker,
 )
 from app.core.config import get_settings
+from app.core.cost_tracking import usd_to_inr
 from app.core.llm_rate_limiter import LLMProvider, get_rate_limiter
 from app.engines.contradiction.prompts import (
+    COMPARISON_PROMPT_VERSION,
     GEMINI_SCREENING_SYSTEM_PROMPT,
     STATEMENT_COMPARISON_SYSTEM_PROMPT,
     format_comparison_prompt,
@@ -62,7 +68,15 @@ GEMINI_INPUT_COST_PER_1K = 0.000075  # $0.075 per 1M input tokens
 GEMINI_OUTPUT_COST_PER_1K = 0.0003  # $0.30 per 1M output tokens
 
 # Rate limiting
-DEFAULT_BATCH_SIZE = 5  # Process 5 pairs in parallel (rate limit safe)
+DEFAULT_BATCH_SIZE = 5  # Max pairs in flight at once (rate limit safe)
+
+# Per-pair scheduling
+PAIR_TIMEOUT_SECONDS = 60.0  # Per comparison call (screening + escalation)
+PAIR_MAX_RETRIES = 2  # Retries after timeout or retryable error
+PAIR_RETRY_BASE_DELAY_SECONDS = 1.0  # Doubled per attempt, with jitter
+
+# Called with each comparison as soon as it completes (progressive persistence)
+ComparisonCallback = Callable[[StatementPairComparison], Awaitable[None]]
 
 
 # =============================================================================
@@ -122,6 +136,19 @@ class ComparisonBatchResult:
     total_input_tokens: int = 0
     total_output_tokens: int = 0
     processing_time_ms: int = 0
+    # Pairs not compared because a budget was hit or the run was stopped
+    pairs_skipped: int = 0
+    stopped_reason: str | None = None
+    # Pair verdict cache reuse
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cost_avoided_usd: float = 0.0
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of pairs answered from the verdict cache."""
+        total = self.cache_hits + self.cache_misses
+        return self.cache_hits / total if total else 0.0
 
     @property
     def total_cost_usd(self) -> float:
@@ -139,6 +166,65 @@ class ComparisonBatchResult:
         )
 
 
+# =============================================================================
+# Pair Verdict Cache
+# =============================================================================
+
+
+@dataclass
+class CachedVerdict:
+    """A comparison verdict stored in the pair verdict cache.
+
+    The verdict is independent of chunk IDs, pages and bboxes, which are
+    taken from the current pair when the verdict is reused.
+    """
+
+    first_digest: str  # Digest of statement A's content when produced
+    verdict: dict[str, Any]
+    cost_usd: float = 0.0
+    version: str = ""  # StatementComparator.verdict_version that produced it
+
+
+class PairVerdictStore(Protocol):
+    """Persistence for pair verdicts (see services.contradiction.verdict_cache)."""
+
+    async def get_many(self, pair_hashes: list[str]) -> dict[str, CachedVerdict]: ...
+
+    async def put(self, pair_hash: str, verdict: CachedVerdict) -> None: ...
+
+    async def record_hits(self, pair_hashes: list[str]) -> None: ...
+
+
+def statement_digest(content: str) -> str:
+    """Get the sha256 digest of a statement's text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def compute_pair_hash(
+    content_a: str,
+    content_b: str,
+    entity_name: str,
+    version: str,
+) -> str:
+    """Get the verdict cache key for a statement pair.
+
+    Order-independent: (A, B) and (B, A) hash the same. The entity name and
+    prompt/model version are included because both change the verdict.
+
+    Args:
+        content_a: Text of the first statement.
+        content_b: Text of the second statement.
+        entity_name: Entity the statements are about.
+        version: Prompt/model version (StatementComparator.verdict_version).
+
+    Returns:
+        Hex sha256 cache key.
+    """
+    digests = sorted((statement_digest(content_a), statement_digest(content_b)))
+    payload = "\x1f".join([*digests, entity_name, version])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -324,6 +410,20 @@ class StatementComparator:
 
         return self._gemini_model
 
+    @property
+    def verdict_version(self) -> str:
+        """Prompt/model version that cached verdicts must match.
+
+        Covers everything that can change a verdict for the same texts:
+        prompt version, comparison model and the screening configuration.
+        """
+        screening = (
+            f"{self.screening_model}@{self.confidence_threshold}"
+            if self.routing_enabled
+            else "none"
+        )
+        return f"{COMPARISON_PROMPT_VERSION}|{self.model_name}|{screening}"
+
     async def compare_statement_pair(
         self,
         statement_a: Statement,
@@ -610,17 +710,32 @@ class StatementComparator:
         max_pairs: int = 50,
         batch_size: int = DEFAULT_BATCH_SIZE,
         cross_document_only: bool = True,
+        max_cost_usd: float | None = None,
+        pair_timeout_seconds: float = PAIR_TIMEOUT_SECONDS,
+        max_retries: int = PAIR_MAX_RETRIES,
+        on_comparison: ComparisonCallback | None = None,
+        verdict_cache: PairVerdictStore | None = None,
     ) -> ComparisonBatchResult:
         """Compare all statement pairs for an entity.
 
         Generates unique pairs from EntityStatements and compares them
-        using GPT-4 with parallel processing.
+        through a sliding window: up to batch_size comparisons are in flight
+        and a new pair starts as soon as any call finishes, so one slow LLM
+        call never stalls the others.
 
         Args:
             entity_statements: All statements about the entity (from Story 5-1).
             max_pairs: Maximum number of pairs to compare (cost control).
-            batch_size: Number of parallel GPT-4 calls.
+            batch_size: Maximum number of comparisons in flight.
             cross_document_only: If True, only compare statements from different documents.
+            max_cost_usd: Stop starting new pairs once spend reaches this (None = no limit).
+            pair_timeout_seconds: Timeout for a single comparison attempt.
+            max_retries: Retries per pair after a timeout or retryable error.
+            on_comparison: Optional async callback invoked with each comparison
+                as it completes, for progressive persistence.
+            verdict_cache: Optional pair verdict store. Pairs whose texts were
+                already compared under the same prompt/model version reuse the
+                cached verdict; only new or changed pairs reach the LLM.
 
         Returns:
             ComparisonBatchResult with all comparisons and cost tracking.
@@ -648,56 +763,196 @@ class StatementComparator:
             entity_name=entity_statements.entity_name,
             total_pairs=len(pairs),
             batch_size=batch_size,
+            max_cost_usd=max_cost_usd,
         )
 
-        # Process in batches
-        all_comparisons: list[StatementPairComparison] = []
-        total_input_tokens = 0
-        total_output_tokens = 0
-
-        for i in range(0, len(pairs), batch_size):
-            batch = pairs[i:i + batch_size]
-
-            # Process batch in parallel
-            tasks = [
-                self.compare_statement_pair(
-                    statement_a=pair.statement_a,
-                    statement_b=pair.statement_b,
-                    entity_name=pair.entity_name,
-                    doc_a_name=pair.doc_a_name,
-                    doc_b_name=pair.doc_b_name,
+        completed: list[tuple[int, StatementPairComparison]] = []
+
+        # Reuse verdicts for pairs whose texts were already compared
+        pair_hashes: dict[int, str] = {}
+        cached_indexes: set[int] = set()
+        hit_hashes: list[str] = []
+        cost_avoided_usd = 0.0
+        if verdict_cache is not None:
+            version = self.verdict_version
+            pair_hashes = {
+                index: compute_pair_hash(
+                    pair.statement_a.content,
+                    pair.statement_b.content,
+                    pair.entity_name,
+                    version,
                 )
-                for pair in batch
-            ]
+                for index, pair in enumerate(pairs)
+            }
+            try:
+                cached = await verdict_cache.get_many(list(set(pair_hashes.values())))
+            except Exception as e:
+                logger.warning(
+                    "pair_verdict_cache_lookup_failed",
+                    entity_id=entity_statements.entity_id,
+                    error=str(e),
+                )
+                cached = {}
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for index, pair_hash in pair_hashes.items():
+                entry = cached.get(pair_hash)
+                if entry is None:
+                    continue
+                try:
+                    comparison = self._comparison_from_verdict(pairs[index], entry)
+                except (KeyError, TypeError, ValueError) as e:
+                    # Unreadable entry - recompare and overwrite it
+                    logger.warning("pair_verdict_cache_entry_invalid", error=str(e))
+                    continue
+                cached_indexes.add(index)
+                hit_hashes.append(pair_hash)
+                cost_avoided_usd += entry.cost_usd
+                completed.append((index, comparison))
+
+                if on_comparison is not None:
+                    try:
+                        await on_comparison(comparison)
+                    except Exception as e:
+                        logger.warning(
+                            "pair_comparison_callback_failed",
+                            entity_id=entity_statements.entity_id,
+                            error=str(e),
+                        )
 
-            for result in results:
-                if isinstance(result, Exception):
+        # Shared work queue - workers pull the next pair when they finish one.
+        # Pairs are sorted by suspiciousness, so likely contradictions go first.
+        to_compare = [
+            (index, pair) for index, pair in enumerate(pairs)
+            if index not in cached_indexes
+        ]
+        pending = iter(to_compare)
+        total_input_tokens = 0
+        total_output_tokens = 0
+        total_cost_usd = 0.0
+        started = 0
+        stopped_reason: str | None = None
+
+        async def worker() -> None:
+            nonlocal total_input_tokens, total_output_tokens, total_cost_usd
+            nonlocal started, stopped_reason
+
+            while stopped_reason is None:
+                if max_cost_usd is not None and total_cost_usd >= max_cost_usd:
+                    stopped_reason = "cost_budget"
+                    return
+                try:
+                    index, pair = next(pending)
+                except StopIteration:
+                    return
+                started += 1
+
+                try:
+                    comparison, cost_tracker = await self._compare_pair_with_retry(
+                        pair=pair,
+                        timeout_seconds=pair_timeout_seconds,
+                        max_retries=max_retries,
+                    )
+                except ComparatorError as e:
                     logger.warning(
                         "pair_comparison_failed",
-                        error=str(result),
+                        error=e.message,
+                        code=e.code,
+                    )
+                    if e.code == "CIRCUIT_OPEN" or not e.is_retryable:
+                        # Every remaining call would fail the same way
+                        stopped_reason = e.code.lower()
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        "pair_comparison_failed",
+                        error=str(e),
                     )
                     continue
 
-                comparison, cost_tracker = result
-                all_comparisons.append(comparison)
+                completed.append((index, comparison))
                 total_input_tokens += cost_tracker.input_tokens
                 total_output_tokens += cost_tracker.output_tokens
+                total_cost_usd += cost_tracker.cost_usd
+
+                if verdict_cache is not None:
+                    try:
+                        await verdict_cache.put(
+                            pair_hashes[index],
+                            self._verdict_from_comparison(comparison, cost_tracker),
+                        )
+                    except Exception as e:
+                        logger.warning(
+                            "pair_verdict_cache_store_failed",
+                            entity_id=entity_statements.entity_id,
+                            error=str(e),
+                        )
+
+                if on_comparison is not None:
+                    try:
+                        await on_comparison(comparison)
+                    except Exception as e:
+                        # Persistence problems must not abort detection
+                        logger.warning(
+                            "pair_comparison_callback_failed",
+                            entity_id=entity_statements.entity_id,
+                            error=str(e),
+                        )
+
+        if to_compare:
+            await asyncio.gather(
+                *(worker() for _ in range(max(1, min(batch_size, len(to_compare)))))
+            )
+
+        # Report in pair order (highest suspiciousness first), not completion order
+        completed.sort(key=lambda item: item[0])
+        pairs_skipped = len(to_compare) - started
+
+        if verdict_cache is not None:
+            if hit_hashes:
+                try:
+                    await verdict_cache.record_hits(hit_hashes)
+                except Exception as e:
+                    logger.debug("pair_verdict_cache_hit_record_failed", error=str(e))
+
+            logger.info(
+                "pair_verdict_cache_summary",
+                entity_id=entity_statements.entity_id,
+                cache_hits=len(cached_indexes),
+                cache_misses=len(to_compare),
+                hit_rate=round(len(cached_indexes) / len(pairs), 3),
+                cost_avoided_usd=round(cost_avoided_usd, 6),
+                cost_avoided_inr=round(usd_to_inr(cost_avoided_usd), 4),
+                cost_spent_usd=round(total_cost_usd, 6),
+            )
 
         processing_time = int((time.time() - start_time) * 1000)
 
         result = ComparisonBatchResult(
-            comparisons=all_comparisons,
+            comparisons=[comparison for _, comparison in completed],
             total_input_tokens=total_input_tokens,
             total_output_tokens=total_output_tokens,
             processing_time_ms=processing_time,
+            pairs_skipped=pairs_skipped,
+            stopped_reason=stopped_reason,
+            cache_hits=len(cached_indexes),
+            cache_misses=len(to_compare) if verdict_cache is not None else 0,
+            cost_avoided_usd=cost_avoided_usd,
         )
 
+        if stopped_reason is not None:
+            logger.warning(
+                "entity_comparison_stopped_early",
+                entity_id=entity_statements.entity_id,
+                reason=stopped_reason,
+                pairs_skipped=pairs_skipped,
+                spent_usd=total_cost_usd,
+            )
+
         logger.info(
             "entity_comparison_complete",
             entity_id=entity_statements.entity_id,
-            pairs_compared=len(all_comparisons),
+            pairs_compared=len(completed),
+            pairs_skipped=pairs_skipped,
             contradictions_found=result.contradictions_found,
             total_cost_usd=result.total_cost_usd,
             processing_time_ms=processing_time,
@@ -705,6 +960,126 @@ class StatementComparator:
 
         return result
 
+    def _verdict_from_comparison(
+        self,
+        comparison: StatementPairComparison,
+        cost_tracker: LLMCostTracker,
+    ) -> CachedVerdict:
+        """Build a cache entry from a fresh comparison."""
+        return CachedVerdict(
+            first_digest=statement_digest(comparison.statement_a_content),
+            verdict={
+                "result": comparison.result.value,
+                "reasoning": comparison.reasoning,
+                "confidence": comparison.confidence,
+                "evidence_type": comparison.evidence.type.value,
+                "value_a": comparison.evidence.value_a,
+                "value_b": comparison.evidence.value_b,
+            },
+            cost_usd=cost_tracker.cost_usd,
+            version=self.verdict_version,
+        )
+
+    def _comparison_from_verdict(
+        self,
+        pair: StatementPair,
+        entry: CachedVerdict,
+    ) -> StatementPairComparison:
+        """Rebuild a comparison for the current pair from a cached verdict.
+
+        IDs, pages and bboxes come from the current statements. Evidence
+        values are swapped when the pair is in the opposite order to the one
+        the verdict was produced for.
+        """
+        verdict = entry.verdict
+        value_a, value_b = verdict.get("value_a"), verdict.get("value_b")
+        if statement_digest(pair.statement_a.content) != entry.first_digest:
+            value_a, value_b = value_b, value_a
+
+        statement_a, statement_b = pair.statement_a, pair.statement_b
+        return StatementPairComparison(
+            statement_a_id=statement_a.chunk_id,
+            statement_b_id=statement_b.chunk_id,
+            statement_a_content=statement_a.content,
+            statement_b_content=statement_b.content,
+            result=ComparisonResult(verdict["result"]),
+            reasoning=verdict.get("reasoning", ""),
+            confidence=float(verdict["confidence"]),
+            evidence=ContradictionEvidence(
+                type=EvidenceType(verdict.get("evidence_type", "none")),
+                value_a=value_a,
+                value_b=value_b,
+                page_refs={
+                    "statement_a": statement_a.page_number,
+                    "statement_b": statement_b.page_number,
+                },
+            ),
+            document_a_id=statement_a.document_id,
+            document_b_id=statement_b.document_id,
+            page_a=statement_a.page_number,
+            page_b=statement_b.page_number,
+            bbox_ids_a=statement_a.bbox_ids,
+            bbox_ids_b=statement_b.bbox_ids,
+        )
+
+    async def _compare_pair_with_retry(
+        self,
+        pair: StatementPair,
+        timeout_seconds: float,
+        max_retries: int,
+    ) -> tuple[StatementPairComparison, LLMCostTracker]:
+        """Compare one pair with a per-attempt timeout and jittered retries.
+
+        Args:
+            pair: Statement pair to compare.
+            timeout_seconds: Timeout for each attempt.
+            max_retries: Retries after the first attempt.
+
+        Returns:
+            Tuple of (comparison result, cost tracker).
+
+        Raises:
+            ComparatorError: If all attempts fail, or on a non-retryable error.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await asyncio.wait_for(
+                    self.compare_statement_pair(
+                        statement_a=pair.statement_a,
+                        statement_b=pair.statement_b,
+                        entity_name=pair.entity_name,
+                        doc_a_name=pair.doc_a_name,
+                        doc_b_name=pair.doc_b_name,
+                    ),
+                    timeout=timeout_seconds,
+                )
+            except TimeoutError as e:
+                error: ComparatorError = ComparatorError(
+                    f"Comparison timed out after {timeout_seconds}s",
+                    code="COMPARISON_TIMEOUT",
+                )
+                error.__cause__ = e
+            except ComparatorError as e:
+                if e.code == "CIRCUIT_OPEN" or not e.is_retryable:
+                    raise
+                error = e
+
+            if attempt >= max_retries:
+                raise error
+
+            # Exponential backoff with jitter avoids synchronized retries
+            delay = PAIR_RETRY_BASE_DELAY_SECONDS * (2 ** attempt) * random.uniform(0.5, 1.5)
+            attempt += 1
+            logger.debug(
+                "pair_comparison_retrying",
+                pair_key=pair.pair_key,
+                attempt=attempt,
+                code=error.code,
+                delay_seconds=round(delay, 2),
+            )
+            await asyncio.sleep(delay)
+
     def _generate_statement_pairs(
         self,
         entity_statements: EntityStatements,
@@ -14,6 +14,10 @@ SECURITY: All document content wrapped in XML boundaries per ADR-001.
 
 from app.core.prompt_boundaries import wrap_document_content
 
+# Bump whenever the comparison or screening prompts change in a way that can
+# change verdicts - it is part of the pair verdict cache key.
+COMPARISON_PROMPT_VERSION = "5-2.v1"
+
 # =============================================================================
 # System Prompt - Sets the role and rules
 # =============================================================================
@@ -371,6 +375,51 @@ def validate_classification_response(parsed: dict) -> list[str]:
     return errors
 
 
+CLASSIFICATION_BATCH_USER_PROMPT = """Analyze each of these contradictions and classify it independently:
+
+{items}
+
+For EACH item provide:
+1. The most specific contradiction type that applies
+2. A clear explanation suitable for attorney review
+3. Your confidence in this classification
+
+Respond with JSON in this exact format, with one entry per item:
+{{
+  "classifications": [
+    {{
+      "item_id": "1",
+      "contradiction_type": "date_mismatch|amount_mismatch|factual_contradiction|semantic_contradiction",
+      "explanation": "Clear explanation of the conflict for attorney review...",
+      "confidence": 0.0-1.0
+    }}
+  ]
+}}"""
+
+
+def format_classification_batch_prompt(
+    items: list[tuple[str, str, str, str]],
+) -> str:
+    """Format a multi-item classification prompt.
+
+    Story 5-3: Inconclusive contradictions are classified several per call.
+
+    Args:
+        items: (item_id, content_a, content_b, reasoning) tuples.
+
+    Returns:
+        Formatted prompt string with XML-wrapped statement content.
+    """
+    blocks = "\n\n".join(
+        f"Item {item_id}:\n"
+        f"Statement A:\n{wrap_document_content(content_a)}\n"
+        f"Statement B:\n{wrap_document_content(content_b)}\n"
+        f'Original reasoning (from comparison):\n"{reasoning}"'
+        for item_id, content_a, content_b, reasoning in items
+    )
+    return CLASSIFICATION_BATCH_USER_PROMPT.format(items=blocks)
+
+
 # =============================================================================
 # Gemini Screening Prompts (Cost Optimization - Two-Tier Routing)
 # =============================================================================
@@ -8,6 +8,7 @@ Each adapter handles the engine-specific call pattern and normalizes results.
 CRITICAL: Adapters must propagate matter_id to ensure matter isolation.
 """
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from functools import lru_cache
@@ -24,6 +25,9 @@ from app.models.orchestrator import (
 
 logger = structlog.get_logger(__name__)
 
+# Unconsumed speculative retrievals older than this are cancelled and dropped
+RAG_PREFETCH_TTL_SECONDS = 60.0
+
 
 # =============================================================================
 # Abstract Base Adapter (Task 5.1)
@@ -634,6 +638,10 @@ class RAGEngineAdapter(EngineAdapter):
         self._search = None
         self._generator = None
         self._supabase = None
+        # Speculative retrievals keyed by (matter_id, query), started by the
+        # orchestrator before intent is known and consumed by execute().
+        # Values are (task, monotonic start time); see _evict_stale_prefetches.
+        self._prefetched: dict[tuple[str, str], tuple[asyncio.Task, float]] = {}
         logger.debug("rag_adapter_initialized")
 
     def _get_search(self):
@@ -720,6 +728,89 @@ class RAGEngineAdapter(EngineAdapter):
             )
             return {}
 
+    async def _retrieve(self, matter_id: str, query: str):
+        """Run hybrid search with library integration for a query."""
+        search = self._get_search()
+        settings = get_settings()
+        return await search.search_with_library(
+            query=query,
+            matter_id=matter_id,
+            limit=settings.rag_rerank_top_n,  # Final result limit
+            library_limit=10,  # Library results before merge
+        )
+
+    def prefetch_retrieval(self, matter_id: str, query: str) -> asyncio.Task:
+        """Start retrieval speculatively, before the engine is selected.
+
+        Only the retrieval step runs - answer generation (the expensive LLM
+        call) waits until execute() confirms RAG is actually needed.
+        Concurrent prefetches for the same matter and query share one task.
+
+        Args:
+            matter_id: Matter UUID.
+            query: User's query.
+
+        Returns:
+            The in-flight retrieval task.
+        """
+        self._evict_stale_prefetches()
+        key = (matter_id, query)
+        entry = self._prefetched.get(key)
+        if entry is None or entry[0].cancelled():
+            task = asyncio.create_task(self._retrieve(matter_id, query))
+            self._prefetched[key] = (task, time.monotonic())
+            return task
+        return entry[0]
+
+    def discard_prefetch(self, matter_id: str, query: str) -> None:
+        """Drop an unconsumed speculative retrieval, cancelling it if running."""
+        entry = self._prefetched.pop((matter_id, query), None)
+        if entry is not None:
+            self._drop_task(entry[0])
+
+    def _take_prefetch(self, matter_id: str, query: str) -> asyncio.Task | None:
+        """Claim a live prefetched retrieval for this query, if any."""
+        entry = self._prefetched.pop((matter_id, query), None)
+        if entry is None:
+            return None
+        task, started_at = entry
+        if (
+            task.cancelled()
+            or task.get_loop() is not asyncio.get_running_loop()
+            or time.monotonic() - started_at > RAG_PREFETCH_TTL_SECONDS
+        ):
+            self._drop_task(task)
+            return None
+        return task
+
+    def _evict_stale_prefetches(self) -> None:
+        """Drop prefetches that were never consumed.
+
+        The adapter is cached per process while Celery tasks each run their
+        own event loop, so entries can outlive the request (and loop) that
+        created them. Anything older than RAG_PREFETCH_TTL_SECONDS or bound
+        to another loop is cancelled and removed.
+        """
+        now = time.monotonic()
+        loop = asyncio.get_running_loop()
+        stale = [
+            key
+            for key, (task, started_at) in self._prefetched.items()
+            if now - started_at > RAG_PREFETCH_TTL_SECONDS or task.get_loop() is not loop
+        ]
+        for key in stale:
+            self._drop_task(self._prefetched.pop(key)[0])
+
+    @staticmethod
+    def _drop_task(task: asyncio.Task) -> None:
+        """Cancel a pending task or consume the outcome of a finished one."""
+        if task.done():
+            # Retrieve the outcome so failures aren't reported as unhandled
+            if not task.cancelled():
+                task.exception()
+        elif not task.get_loop().is_closed():
+            task.cancel()
+
     async def execute(
         self,
         matter_id: str,
@@ -745,15 +836,13 @@ class RAGEngineAdapter(EngineAdapter):
 
         try:
             # Step 1: Hybrid search with library integration
-            # Searches both matter documents AND linked library documents
-            search = self._get_search()
-            settings = get_settings()
-            results = await search.search_with_library(
-                query=query,
-                matter_id=matter_id,
-                limit=settings.rag_rerank_top_n,  # Final result limit
-                library_limit=10,  # Library results before merge
-            )
+            # Searches both matter documents AND linked library documents.
+            # Reuses a speculative retrieval started by the orchestrator.
+            prefetched = self._take_prefetch(matter_id, query)
+            if prefetched is not None:
+                results = await prefetched
+            else:
+                results = await self._retrieve(matter_id, query)
 
             # Step 2: Get document names for matter documents
             # Library documents already have titles in the result
@@ -3,9 +3,14 @@
 Story 6-2: Engine Execution Ordering (AC: #1-2)
 
 Orchestrates multiple engine calls with parallel execution support.
-Uses asyncio.gather for concurrent execution of independent engines.
-
-CRITICAL: 30 second timeout per engine to prevent blocking.
+Engines are scheduled from the planner's dependency graph: each engine
+starts as soon as the engines it depends on have finished, instead of
+waiting for a whole group barrier.
+
+CRITICAL: Per-engine deadlines (ENGINE_TIMEOUTS) to prevent blocking.
+A non-critical engine that misses its deadline yields a failed result and
+the rest are still returned for partial aggregation. When a critical engine
+misses its deadline, engines still running are cancelled.
 CRITICAL: Matter isolation must be maintained through all engine calls.
 """
 
@@ -31,9 +36,28 @@ logger = structlog.get_logger(__name__)
 # Constants
 # =============================================================================
 
-# Timeout per engine in seconds
+# Default timeout per engine in seconds
 ENGINE_TIMEOUT_SECONDS = 30.0
 
+# Per-engine deadlines in seconds. Citation, timeline and contradiction read
+# results precomputed at ingestion; document discovery is a metadata query;
+# entity lookup adds a small hybrid search; RAG runs search plus an LLM answer.
+# Engines not listed use ENGINE_TIMEOUT_SECONDS.
+ENGINE_TIMEOUTS: dict[EngineType, float] = {
+    EngineType.CITATION: 15.0,
+    EngineType.TIMELINE: 15.0,
+    EngineType.CONTRADICTION: 20.0,
+    EngineType.DOCUMENT_DISCOVERY: 10.0,
+    EngineType.ENTITY_LOOKUP: 20.0,
+    EngineType.RAG: ENGINE_TIMEOUT_SECONDS,
+}
+
+# Engines the answer is built on. If one misses its deadline the query can
+# only return an error note, so engines still running are cancelled instead
+# of being waited for. Other engines only enrich the answer and drop out of
+# it (partial results) when they miss theirs.
+CRITICAL_ENGINES: frozenset[EngineType] = frozenset({EngineType.RAG})
+
 
 # =============================================================================
 # Engine Executor (Task 2.1-2.6)
@@ -46,10 +70,11 @@ class EngineExecutor:
     Story 6-2: Orchestrates multiple engine calls efficiently.
 
     Pipeline:
-    1. Get execution plan from planner (parallel groups)
-    2. Execute each group sequentially
-    3. Within each group, execute engines in parallel
-    4. Track execution time and costs
+    1. Get execution plan from planner (dependency graph)
+    2. Start every engine as a task that first waits for its own dependencies
+    3. Apply each engine's deadline; failures and timeouts become error results
+    4. Cancel engines still running if a critical engine misses its deadline
+    5. Track execution time and costs
 
     Example:
         >>> executor = get_engine_executor()
@@ -62,9 +87,23 @@ class EngineExecutor:
         2
     """
 
-    def __init__(self) -> None:
-        """Initialize engine executor."""
+    def __init__(
+        self,
+        timeouts: dict[EngineType, float] | None = None,
+        critical_engines: frozenset[EngineType] | None = None,
+    ) -> None:
+        """Initialize engine executor.
+
+        Args:
+            timeouts: Optional per-engine timeout overrides in seconds,
+                applied on top of ENGINE_TIMEOUTS.
+            critical_engines: Optional replacement for CRITICAL_ENGINES.
+        """
         self._planner = get_execution_planner()
+        self._timeouts = dict(timeouts or {})
+        self._critical_engines = (
+            CRITICAL_ENGINES if critical_engines is None else critical_engines
+        )
         logger.info("engine_executor_initialized")
 
     async def execute_engines(
@@ -104,18 +143,12 @@ class EngineExecutor:
             parallelism=plan.estimated_parallelism,
         )
 
-        # Execute groups sequentially, engines within groups in parallel
-        all_results: list[EngineExecutionResult] = []
-
-        for group_idx, group in enumerate(plan.parallel_groups):
-            group_results = await self._execute_parallel_group(
-                matter_id=matter_id,
-                query=query,
-                engines=group,
-                context=context,
-                group_index=group_idx,
-            )
-            all_results.extend(group_results)
+        all_results = await self._execute_dependency_graph(
+            matter_id=matter_id,
+            query=query,
+            plan=plan,
+            context=context,
+        )
 
         wall_clock_time = int((time.time() - start_time) * 1000)
         total_engine_time = sum(r.execution_time_ms for r in all_results)
@@ -135,55 +168,106 @@ class EngineExecutor:
 
         return all_results
 
-    async def _execute_parallel_group(
+    async def _execute_dependency_graph(
         self,
         matter_id: str,
         query: str,
-        engines: list[EngineType],
+        plan: ExecutionPlan,
         context: dict[str, Any] | None,
-        group_index: int,
     ) -> list[EngineExecutionResult]:
-        """Execute a group of engines in parallel.
+        """Execute engines as soon as their own dependencies complete.
 
-        Task 2.3: Run independent engines concurrently with asyncio.gather.
+        Task 2.3: Run independent engines concurrently. An engine waits only
+        for the engines it depends on, so a slow engine never delays an
+        unrelated one. A failed dependency does not block its dependents:
+        engines read shared data from the database, so edges only order work.
+        If a critical engine misses its deadline, the engines still running
+        are cancelled and reported as failed.
 
         Args:
             matter_id: Matter UUID.
             query: User's query.
-            engines: Engines to execute in parallel.
+            plan: Execution plan with dependency graph.
             context: Optional context.
-            group_index: Index of this group (for logging).
 
         Returns:
-            List of results from all engines in the group.
+            Results in plan order (dependencies before dependents).
         """
-        logger.debug(
-            "execute_parallel_group_start",
-            matter_id=matter_id,
-            group_index=group_index,
-            engines=[e.value for e in engines],
-        )
+        # Groups are in topological order, so every dependency task exists
+        # before its dependents are created. Edges that would close a cycle
+        # point at tasks not yet created and are dropped.
+        ordered = [engine for group in plan.parallel_groups for engine in group]
+        tasks: dict[EngineType, asyncio.Task] = {}
+
+        for engine in ordered:
+            upstream = [
+                tasks[dep]
+                for dep in plan.dependencies.get(engine, [])
+                if dep in tasks
+            ]
+            tasks[engine] = asyncio.create_task(
+                self._execute_after_dependencies(
+                    matter_id=matter_id,
+                    query=query,
+                    engine=engine,
+                    upstream=upstream,
+                    context=context,
+                )
+            )
+
+        engine_by_task = {task: engine for engine, task in tasks.items()}
+        missed_critical: EngineType | None = None
+        pending = set(tasks.values())
+        try:
+            while pending and missed_critical is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                missed_critical = next(
+                    (
+                        engine_by_task[task]
+                        for task in done
+                        if self._missed_critical_deadline(engine_by_task[task], task)
+                    ),
+                    None,
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        # Create tasks for parallel execution
-        tasks = [
-            self._execute_single_engine(
+        if missed_critical is not None and pending:
+            logger.warning(
+                "engine_critical_deadline_missed",
                 matter_id=matter_id,
-                query=query,
-                engine=engine,
-                context=context,
+                engine=missed_critical.value,
+                cancelled=[engine_by_task[task].value for task in pending],
             )
-            for engine in engines
-        ]
-
-        # Execute all tasks in parallel, catching exceptions
-        results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Process results, converting exceptions to error results
         processed_results: list[EngineExecutionResult] = []
-        for engine, result in zip(engines, results, strict=False):
-            if isinstance(result, Exception):
+        for engine in ordered:
+            task = tasks[engine]
+            if task.cancelled():
+                processed_results.append(
+                    EngineExecutionResult(
+                        engine=engine,
+                        success=False,
+                        error=(
+                            f"Cancelled: critical engine {missed_critical.value} "
+                            "missed its deadline"
+                            if missed_critical
+                            else "Cancelled"
+                        ),
+                        execution_time_ms=0,
+                    )
+                )
+                continue
+
+            result = task.exception() or task.result()
+            if isinstance(result, BaseException):
                 logger.error(
-                    "parallel_group_exception",
+                    "engine_task_exception",
                     matter_id=matter_id,
                     engine=engine.value,
                     error=str(result),
@@ -201,6 +285,42 @@ class EngineExecutor:
 
         return processed_results
 
+    async def _execute_after_dependencies(
+        self,
+        matter_id: str,
+        query: str,
+        engine: EngineType,
+        upstream: list[asyncio.Task],
+        context: dict[str, Any] | None,
+    ) -> EngineExecutionResult:
+        """Wait for an engine's dependencies, then execute it.
+
+        Args:
+            matter_id: Matter UUID.
+            query: User's query.
+            engine: Engine to execute.
+            upstream: Tasks of the engines this engine depends on.
+            context: Optional context.
+
+        Returns:
+            EngineExecutionResult from the engine.
+        """
+        if upstream:
+            await asyncio.wait(upstream)
+            logger.debug(
+                "engine_dependencies_ready",
+                matter_id=matter_id,
+                engine=engine.value,
+                upstream_count=len(upstream),
+            )
+
+        return await self._execute_single_engine(
+            matter_id=matter_id,
+            query=query,
+            engine=engine,
+            context=context,
+        )
+
     async def _execute_single_engine(
         self,
         matter_id: str,
@@ -222,6 +342,7 @@ class EngineExecutor:
             EngineExecutionResult from the engine.
         """
         start_time = time.time()
+        timeout_seconds = self._get_timeout(engine)
 
         try:
             adapter = get_cached_adapter(engine)
@@ -233,7 +354,7 @@ class EngineExecutor:
                     query=query,
                     context=context,
                 ),
-                timeout=ENGINE_TIMEOUT_SECONDS,
+                timeout=timeout_seconds,
             )
 
             logger.debug(
@@ -253,14 +374,15 @@ class EngineExecutor:
                 "engine_timeout",
                 engine=engine.value,
                 matter_id=matter_id,
-                timeout_seconds=ENGINE_TIMEOUT_SECONDS,
+                timeout_seconds=timeout_seconds,
             )
 
             return EngineExecutionResult(
                 engine=engine,
                 success=False,
-                error=f"Engine timed out after {ENGINE_TIMEOUT_SECONDS} seconds",
+                error=f"Engine timed out after {timeout_seconds} seconds",
                 execution_time_ms=execution_time_ms,
+                timed_out=True,
             )
 
         except Exception as e:
@@ -281,6 +403,18 @@ class EngineExecutor:
                 execution_time_ms=execution_time_ms,
             )
 
+    def _get_timeout(self, engine: EngineType) -> float:
+        """Resolve the timeout for an engine (instance, module, then default)."""
+        if engine in self._timeouts:
+            return self._timeouts[engine]
+        return ENGINE_TIMEOUTS.get(engine, ENGINE_TIMEOUT_SECONDS)
+
+    def _missed_critical_deadline(self, engine: EngineType, task: asyncio.Task) -> bool:
+        """Whether a finished engine task is a critical engine that timed out."""
+        if engine not in self._critical_engines or task.exception() is not None:
+            return False
+        return task.result().timed_out
+
     def get_execution_plan(self, engines: list[EngineType]) -> ExecutionPlan:
         """Get execution plan for engines.
 
@@ -290,7 +424,7 @@ class EngineExecutor:
             engines: Engines to plan for.
 
         Returns:
-            ExecutionPlan with parallel groups.
+            ExecutionPlan with parallel groups and dependency graph.
         """
         return self._planner.create_execution_plan(engines)
 
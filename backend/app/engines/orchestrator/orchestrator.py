@@ -16,7 +16,9 @@ This is the main entry point for query processing.
 
 CRITICAL: Matter isolation must be maintained through entire pipeline.
 CRITICAL: Audit logging must be non-blocking (Story 6-3 AC: #5).
-CRITICAL: Safety check runs BEFORE intent analysis (Story 8-2).
+CRITICAL: Safety verdict gates intent analysis (Story 8-2). Cache lookup,
+intent classification and RAG retrieval start speculatively alongside the
+safety check, but their results are discarded if the query is blocked.
 """
 
 import asyncio
@@ -26,6 +28,7 @@ from typing import Any
 
 import structlog
 
+from app.engines.orchestrator.adapters import get_cached_adapter
 from app.engines.orchestrator.aggregator import ResultAggregator, get_result_aggregator
 from app.engines.orchestrator.audit_logger import (
     QueryAuditLogger,
@@ -75,7 +78,8 @@ class QueryOrchestrator:
     Story 8-2: Safety guard integration.
 
     Pipeline:
-    0. SafetyGuard → check query safety (Story 8-2)
+    0. SafetyGuard → check query safety (Story 8-2), with cache lookup,
+       intent analysis and RAG retrieval started speculatively alongside
     1. IntentAnalyzer → classify query, determine required engines
     2. ExecutionPlanner → create execution plan (parallel groups)
     3. EngineExecutor → execute engines with parallel optimization
@@ -106,6 +110,7 @@ class QueryOrchestrator:
         cache_service: QueryCacheService | None = None,
         use_multi_intent: bool = True,
         use_response_cache: bool = True,
+        speculative_rag: bool = True,
     ) -> None:
         """Initialize query orchestrator.
 
@@ -127,6 +132,8 @@ class QueryOrchestrator:
             cache_service: Optional query cache service for response caching.
             use_multi_intent: If True, use new multi-intent classifier (default True).
             use_response_cache: If True, cache and reuse responses (default True).
+            speculative_rag: If True, start RAG retrieval alongside the safety
+                check so it's ready if intent selects RAG (default True).
         """
         self._safety_guard = safety_guard or get_safety_guard()
         self._intent_analyzer = intent_analyzer or get_intent_analyzer()
@@ -139,11 +146,13 @@ class QueryOrchestrator:
         self._cache_service = cache_service or get_query_cache_service()
         self._use_multi_intent = use_multi_intent
         self._use_response_cache = use_response_cache
+        self._speculative_rag = speculative_rag
 
         logger.info(
             "query_orchestrator_initialized",
             use_multi_intent=use_multi_intent,
             use_response_cache=use_response_cache,
+            speculative_rag=speculative_rag,
         )
 
     async def process_query(
@@ -180,176 +189,190 @@ class QueryOrchestrator:
             user_id=user_id,
         )
 
-        # Step 0: Safety check (Story 8-1 regex + Story 8-2 LLM)
-        # Instead of blocking, rewrite the query and continue processing
-        original_query = query
-        query_was_rewritten = False
-        safety_result = await self._safety_guard.check_query(query)
-
-        if not safety_result.is_safe:
-            # If we have a suggested rewrite that's actually different, use it
-            rewrite = safety_result.suggested_rewrite
-            rewrite_is_different = (
-                rewrite
-                and rewrite.strip().lower() != original_query.strip().lower()
-            )
+        # Speculative pre-processing: cache lookup and intent classification
+        # start now and run alongside the safety check, so the critical path
+        # is max(safety, cache, intent) rather than the sum. RAG retrieval
+        # (embedding + rerank) is only started once the cache lookup misses.
+        # Nothing speculative is used until the safety verdict allows it.
+        speculation = self._start_speculative_stages(matter_id, query)
 
-            if rewrite_is_different:
-                logger.info(
-                    "query_rewritten_for_safety",
-                    matter_id=matter_id,
-                    blocked_by=safety_result.blocked_by,
-                    violation_type=safety_result.violation_type,
-                    original_query=query[:100],
-                    rewritten_query=rewrite[:100],
+        try:
+            # Step 0: Safety check (Story 8-1 regex + Story 8-2 LLM)
+            # Instead of blocking, rewrite the query and continue processing
+            original_query = query
+            query_was_rewritten = False
+            safety_result = await self._safety_guard.check_query(query)
+
+            if not safety_result.is_safe:
+                # If we have a suggested rewrite that's actually different, use it
+                rewrite = safety_result.suggested_rewrite
+                rewrite_is_different = (
+                    rewrite
+                    and rewrite.strip().lower() != original_query.strip().lower()
                 )
-                query = rewrite
-                query_was_rewritten = True
 
-                # Log to audit trail (non-blocking)
-                task = asyncio.create_task(
-                    self._log_blocked_query_audit(
+                if rewrite_is_different:
+                    logger.info(
+                        "query_rewritten_for_safety",
                         matter_id=matter_id,
-                        user_id=user_id,
-                        query=original_query,
-                        safety_result=safety_result,
+                        blocked_by=safety_result.blocked_by,
+                        violation_type=safety_result.violation_type,
+                        original_query=query[:100],
+                        rewritten_query=rewrite[:100],
                     )
-                )
-                task.add_done_callback(self._handle_audit_task_exception)
-            elif rewrite:
-                # Rewrite is same as original - treat as safe and continue without rewrite notice
-                logger.info(
-                    "query_rewrite_identical_continuing",
-                    matter_id=matter_id,
-                    blocked_by=safety_result.blocked_by,
-                    message="Rewrite identical to original, treating as safe",
-                )
-                # query_was_rewritten stays False, so no notice shown to user
-            else:
-                # No rewrite available - must block
-                wall_clock_time_ms = int((time.time() - start_time) * 1000)
-
-                logger.info(
-                    "query_blocked_by_safety",
-                    matter_id=matter_id,
-                    blocked_by=safety_result.blocked_by,
-                    violation_type=safety_result.violation_type,
-                    wall_clock_time_ms=wall_clock_time_ms,
-                )
-
-                # Log to audit trail (non-blocking) - Story 8-2 Task 6.5
-                task = asyncio.create_task(
-                    self._log_blocked_query_audit(
+                    query = rewrite
+                    query_was_rewritten = True
+
+                    # Speculative work was for the original query - redo it
+                    self._discard_speculation(speculation, matter_id, original_query)
+                    speculation = self._start_speculative_stages(matter_id, query)
+
+                    # Log to audit trail (non-blocking)
+                    task = asyncio.create_task(
+                        self._log_blocked_query_audit(
+                            matter_id=matter_id,
+                            user_id=user_id,
+                            query=original_query,
+                            safety_result=safety_result,
+                        )
+                    )
+                    task.add_done_callback(self._handle_audit_task_exception)
+                elif rewrite:
+                    # Rewrite is same as original - treat as safe and continue without rewrite notice
+                    logger.info(
+                        "query_rewrite_identical_continuing",
                         matter_id=matter_id,
-                        user_id=user_id,
-                        query=query,
-                        safety_result=safety_result,
+                        blocked_by=safety_result.blocked_by,
+                        message="Rewrite identical to original, treating as safe",
                     )
-                )
-                task.add_done_callback(self._handle_audit_task_exception)
-
-                return OrchestratorResult(
-                    matter_id=matter_id,
-                    query=query,
-                    success=False,
-                    blocked=True,
-                    blocked_reason=safety_result.explanation,
-                    suggested_rewrite=safety_result.suggested_rewrite,
-                    wall_clock_time_ms=wall_clock_time_ms,
-                )
-
-        # Step 0.5: Check response cache (Cost Optimization)
-        if self._use_response_cache:
-            try:
-                cached = await self._cache_service.check_cache(matter_id, query)
-                if cached and cached.response_data:
+                    # query_was_rewritten stays False, so no notice shown to user
+                else:
+                    # No rewrite available - must block
+                    self._discard_speculation(speculation, matter_id, query)
                     wall_clock_time_ms = int((time.time() - start_time) * 1000)
+
                     logger.info(
-                        "process_query_cache_hit",
+                        "query_blocked_by_safety",
                         matter_id=matter_id,
-                        query_hash=cached.query_hash[:16] + "...",
-                        cached_at=cached.cached_at,
+                        blocked_by=safety_result.blocked_by,
+                        violation_type=safety_result.violation_type,
                         wall_clock_time_ms=wall_clock_time_ms,
                     )
-                    # Reconstruct OrchestratorResult from cached data
-                    # Restore sources from cached data
-                    cached_sources = [
-                        SourceReference(**s) for s in cached.response_data.get("sources", [])
-                    ]
+
+                    # Log to audit trail (non-blocking) - Story 8-2 Task 6.5
+                    task = asyncio.create_task(
+                        self._log_blocked_query_audit(
+                            matter_id=matter_id,
+                            user_id=user_id,
+                            query=query,
+                            safety_result=safety_result,
+                        )
+                    )
+                    task.add_done_callback(self._handle_audit_task_exception)
+
                     return OrchestratorResult(
                         matter_id=matter_id,
                         query=query,
-                        success=cached.response_data.get("success", True),
-                        unified_response=cached.response_data.get("unified_response"),
-                        successful_engines=[
-                            EngineType(e) for e in cached.response_data.get("successful_engines", [])
-                        ],
-                        failed_engines=[
-                            EngineType(e) for e in cached.response_data.get("failed_engines", [])
-                        ],
-                        sources=cached_sources,
-                        confidence=cached.confidence,
+                        success=False,
+                        blocked=True,
+                        blocked_reason=safety_result.explanation,
+                        suggested_rewrite=safety_result.suggested_rewrite,
                         wall_clock_time_ms=wall_clock_time_ms,
-                        from_cache=True,
                     )
-            except Exception as e:
-                # Cache errors should not fail the query
-                logger.warning(
-                    "process_query_cache_check_failed",
+
+            # Step 0.5: Check response cache (Cost Optimization)
+            cache_task = speculation.get("cache")
+            cached = await cache_task if cache_task is not None else None
+            rag_starter = speculation.get("rag")
+            if rag_starter is not None:
+                # Registers the prefetch before engines look for it
+                await rag_starter
+            if cached and cached.response_data:
+                self._discard_speculation(speculation, matter_id, query)
+                wall_clock_time_ms = int((time.time() - start_time) * 1000)
+                logger.info(
+                    "process_query_cache_hit",
                     matter_id=matter_id,
-                    error=str(e),
+                    query_hash=cached.query_hash[:16] + "...",
+                    cached_at=cached.cached_at,
+                    wall_clock_time_ms=wall_clock_time_ms,
+                )
+                # Reconstruct OrchestratorResult from cached data
+                # Restore sources from cached data
+                cached_sources = [
+                    SourceReference(**s) for s in cached.response_data.get("sources", [])
+                ]
+                return OrchestratorResult(
+                    matter_id=matter_id,
+                    query=query,
+                    success=cached.response_data.get("success", True),
+                    unified_response=cached.response_data.get("unified_response"),
+                    successful_engines=[
+                        EngineType(e) for e in cached.response_data.get("successful_engines", [])
+                    ],
+                    failed_engines=[
+                        EngineType(e) for e in cached.response_data.get("failed_engines", [])
+                    ],
+                    sources=cached_sources,
+                    confidence=cached.confidence,
+                    wall_clock_time_ms=wall_clock_time_ms,
+                    from_cache=True,
                 )
 
-        # Step 1: Analyze intent and determine required engines
-        # Story 6-1 Enhancement: Support multi-intent classification
-        multi_classification: MultiIntentClassification | None = None
-        intent_result: IntentAnalysisResult | None = None
+            # Step 1: Analyze intent and determine required engines
+            # Story 6-1 Enhancement: Support multi-intent classification
+            multi_classification: MultiIntentClassification | None = None
+            intent_result: IntentAnalysisResult | None = None
 
-        if self._use_multi_intent:
-            # New multi-intent classification path
-            multi_classification = await self._multi_intent_analyzer.classify(query)
-            engines = list(multi_classification.required_engines)
+            if self._use_multi_intent:
+                # New multi-intent classification path
+                multi_classification = await speculation["intent"]
+                engines = list(multi_classification.required_engines)
 
-            # Create legacy IntentAnalysisResult for backward compatibility (audit logging)
-            intent_result = self._create_legacy_intent_result(
-                matter_id=matter_id,
-                query=query,
-                multi_classification=multi_classification,
-            )
+                # Create legacy IntentAnalysisResult for backward compatibility (audit logging)
+                intent_result = self._create_legacy_intent_result(
+                    matter_id=matter_id,
+                    query=query,
+                    multi_classification=multi_classification,
+                )
 
-            logger.info(
-                "process_query_multi_intent_analyzed",
-                matter_id=matter_id,
-                is_multi_intent=multi_classification.is_multi_intent,
-                required_engines=[e.value for e in engines],
-                aggregation_strategy=multi_classification.aggregation_strategy,
-                compound_intent=multi_classification.compound_intent.name if multi_classification.compound_intent else None,
-                llm_was_used=multi_classification.llm_was_used,
-            )
-        else:
-            # Legacy single-intent path
-            intent_result = await self._intent_analyzer.analyze_intent(
-                matter_id=matter_id,
-                query=query,
-            )
-            engines = intent_result.classification.required_engines
+                logger.info(
+                    "process_query_multi_intent_analyzed",
+                    matter_id=matter_id,
+                    is_multi_intent=multi_classification.is_multi_intent,
+                    required_engines=[e.value for e in engines],
+                    aggregation_strategy=multi_classification.aggregation_strategy,
+                    compound_intent=multi_classification.compound_intent.name if multi_classification.compound_intent else None,
+                    llm_was_used=multi_classification.llm_was_used,
+                )
+            else:
+                # Legacy single-intent path
+                intent_result = await speculation["intent"]
+                engines = intent_result.classification.required_engines
+
+                logger.info(
+                    "process_query_intent_analyzed",
+                    matter_id=matter_id,
+                    intent=intent_result.classification.intent.value,
+                    confidence=intent_result.classification.confidence,
+                    required_engines=[e.value for e in engines],
+                    fast_path_used=intent_result.fast_path_used,
+                )
 
-            logger.info(
-                "process_query_intent_analyzed",
+            if EngineType.RAG not in engines:
+                # Speculative retrieval lost the bet - stop it now
+                self._discard_rag_prefetch(matter_id, query)
+
+            # Step 2: Execute engines
+            engine_results = await self._executor.execute_engines(
                 matter_id=matter_id,
-                intent=intent_result.classification.intent.value,
-                confidence=intent_result.classification.confidence,
-                required_engines=[e.value for e in engines],
-                fast_path_used=intent_result.fast_path_used,
+                query=query,
+                engines=engines,
+                context=context,
             )
-
-        # Step 2: Execute engines
-        engine_results = await self._executor.execute_engines(
-            matter_id=matter_id,
-            query=query,
-            engines=engines,
-            context=context,
-        )
+        finally:
+            # Whatever wasn't consumed (error paths, unused prefetch) is dropped
+            self._discard_speculation(speculation, matter_id, query)
 
         # Step 3: Aggregate results (with language policing - Story 8-3)
         wall_clock_time_ms = int((time.time() - start_time) * 1000)
@@ -428,6 +451,113 @@ class QueryOrchestrator:
 
         return result
 
+    def _start_speculative_stages(
+        self,
+        matter_id: str,
+        query: str,
+    ) -> dict[str, asyncio.Task]:
+        """Start pre-processing stages that don't depend on the safety verdict.
+
+        Args:
+            matter_id: Matter UUID.
+            query: Query to pre-process.
+
+        Returns:
+            Dict of in-flight tasks ("cache" if caching is enabled, "intent",
+            "rag" if speculative RAG is enabled).
+        """
+        tasks: dict[str, asyncio.Task] = {}
+        if self._use_response_cache:
+            tasks["cache"] = asyncio.create_task(self._check_cache(matter_id, query))
+        if self._use_multi_intent:
+            tasks["intent"] = asyncio.create_task(
+                self._multi_intent_analyzer.classify(query)
+            )
+        else:
+            tasks["intent"] = asyncio.create_task(
+                self._intent_analyzer.analyze_intent(
+                    matter_id=matter_id,
+                    query=query,
+                )
+            )
+        if self._speculative_rag:
+            tasks["rag"] = asyncio.create_task(
+                self._prefetch_rag_on_cache_miss(tasks.get("cache"), matter_id, query)
+            )
+        return tasks
+
+    async def _prefetch_rag_on_cache_miss(
+        self,
+        cache_task: asyncio.Task | None,
+        matter_id: str,
+        query: str,
+    ) -> None:
+        """Start speculative RAG retrieval once the response cache misses.
+
+        A cache hit answers the query without any engine, so retrieval is
+        held back until the lookup resolves rather than spending an
+        embedding and a rerank on every query.
+
+        Args:
+            cache_task: In-flight cache lookup, or None if caching is disabled.
+            matter_id: Matter UUID.
+            query: Query to retrieve for.
+        """
+        if cache_task is not None:
+            # Shielded so cancelling this task doesn't cancel the lookup itself
+            cached = await asyncio.shield(cache_task)
+            if cached and cached.response_data:
+                return
+        try:
+            get_cached_adapter(EngineType.RAG).prefetch_retrieval(matter_id, query)
+        except Exception as e:
+            # Speculation is an optimization only - never fail the query
+            logger.warning(
+                "speculative_rag_prefetch_failed",
+                matter_id=matter_id,
+                error=str(e),
+            )
+
+    def _discard_speculation(
+        self,
+        tasks: dict[str, asyncio.Task],
+        matter_id: str,
+        query: str,
+    ) -> None:
+        """Cancel unfinished speculative tasks and drop any RAG prefetch."""
+        for task in tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Retrieve the outcome so failures aren't reported as unhandled
+                task.exception()
+        if self._speculative_rag:
+            self._discard_rag_prefetch(matter_id, query)
+
+    def _discard_rag_prefetch(self, matter_id: str, query: str) -> None:
+        """Drop an unconsumed speculative RAG retrieval."""
+        try:
+            get_cached_adapter(EngineType.RAG).discard_prefetch(matter_id, query)
+        except Exception as e:
+            logger.warning(
+                "speculative_rag_discard_failed",
+                matter_id=matter_id,
+                error=str(e),
+            )
+
+    async def _check_cache(self, matter_id: str, query: str) -> Any:
+        """Look up a cached response, treating cache errors as a miss."""
+        try:
+            return await self._cache_service.check_cache(matter_id, query)
+        except Exception as e:
+            # Cache errors should not fail the query
+            logger.warning(
+                "process_query_cache_check_failed",
+                matter_id=matter_id,
+                error=str(e),
+            )
+            return None
+
     def _handle_audit_task_exception(self, task: asyncio.Task) -> None:
         """Handle exceptions from background audit task.
 
@@ -28,6 +28,8 @@ logger = structlog.get_logger(__name__)
 
 # Define which engines depend on others' outputs (not shared data).
 # Currently all engines are independent - they access DB/MIG directly.
+# With no edges, dependency-graph scheduling in EngineExecutor runs exactly
+# like a single parallel group; it only changes latency once edges exist.
 ENGINE_DEPENDENCIES: dict[EngineType, list[EngineType]] = {
     EngineType.CITATION: [],  # Independent - can always run
     EngineType.TIMELINE: [],  # Independent - can always run
@@ -90,6 +92,14 @@ class ExecutionPlanner:
         # Resolve dependencies and create execution groups
         parallel_groups = self._resolve_dependencies(engines)
 
+        # Dependency edges between requested engines - the executor
+        # schedules from these rather than from the group barriers
+        engine_set = set(engines)
+        dependencies = {
+            engine: [d for d in self._dependencies.get(engine, []) if d in engine_set]
+            for engine in engines
+        }
+
         # Calculate parallelism factor
         total = len(engines)
         num_groups = len(parallel_groups)
@@ -107,6 +117,7 @@ class ExecutionPlanner:
             parallel_groups=parallel_groups,
             total_engines=total,
             estimated_parallelism=estimated_parallelism,
+            dependencies=dependencies,
         )
 
     def _resolve_dependencies(
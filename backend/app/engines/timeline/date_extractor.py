@@ -10,11 +10,17 @@ this is an ingestion task, NOT user-facing reasoning.
 
 Fallback: Returns empty result when circuit is open - date extraction
 is non-critical for document ingestion to continue.
+
+Long documents are split into overlapping chunks. Chunks without any date
+cue (DATE_CUE_PATTERN) are skipped, and the rest are extracted concurrently
+under the shared Gemini rate limiter.
 """
 
+import asyncio
 import json
 import re
 import time
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import date
 from functools import lru_cache
 
@@ -33,10 +39,13 @@ from app.core.cost_tracking import (
     estimate_tokens,
     persist_cost,
 )
+from app.core.llm_rate_limiter import LLMProvider as RateLimitProvider
+from app.core.llm_rate_limiter import get_rate_limiter
 from app.engines.timeline.prompts import (
     DATE_EXTRACTION_SYSTEM_PROMPT,
     DATE_EXTRACTION_USER_PROMPT,
 )
+from app.models.chunk import ChunkWithContent
 from app.models.timeline import (
     DateExtractionResult,
     ExtractedDate,
@@ -55,6 +64,53 @@ CHUNK_OVERLAP = 500  # Characters to overlap between chunks for boundary dates
 MIN_VALID_YEAR = 1800  # No legal documents before 1800
 MAX_VALID_YEAR = 2100  # No future dates beyond 2100
 
+# Chunks extracted at once for long documents (Gemini limiter still applies)
+CHUNK_EXTRACTION_CONCURRENCY = 4
+
+_MONTHS = (
+    r"january|february|march|april|june|july|august|september|october|november|december"
+    r"|jan|feb|mar|apr|jun|jul|aug|sept?|oct|nov|dec"
+)
+
+# Anything a chunk needs for the LLM to find a date in it. Deliberately
+# loose: a false positive costs one LLM call, a false negative loses dates.
+DATE_CUE_PATTERN = re.compile(
+    r"\b\d{1,4}\s*[/.\-]\s*\d{1,2}\s*[/.\-]\s*\d{2,4}\b"  # 15/01/2024, 15.1.24, 2024-01-15
+    rf"|\b(?:{_MONTHS})\b"  # January, Sept., Mar
+    r"|\bMay\b|\b\d{1,2}(?:st|nd|rd|th)?\s+may\b|\bmay,?\s+\d"  # May, not "may"
+    r"|\b(?:1[89]\d{2}|20\d{2})\b"  # Bare years (1881, 2024)
+    r"|\b(?:FY|AY)\s*\d{2}"  # Financial / assessment years
+    r"|\b\d{1,2}(?:st|nd|rd|th)\s+day\b|\bday\s+of\b"  # this 5th day of
+    r"|\b(?:yesterday|today|tomorrow|instant|ultimo|proximo)\b"
+    r"|\b(?:last|next|previous|following|preceding)\s+(?:week|month|year|day)\b"
+    r"|\b\d+\s+(?:days?|weeks?|months?|years?)\s+(?:ago|after|before|from|later|of)\b"
+    r"|\bwithin\s+(?:a\s+period\s+of\s+)?\w+\s+(?:days?|weeks?|months?|years?)\b"
+    r"|\bdated\b|\bon\s+or\s+(?:about|before|after)\b|\bw\.?\s*e\.?\s*f\.?(?=\s|$)"
+    r"|\bwith\s+effect\s+from\b",
+    re.IGNORECASE,
+)
+_MAY_AS_VERB = re.compile(r"\bmay\b")
+
+
+def has_date_cues(text: str) -> bool:
+    """Check whether text contains anything that looks like a date.
+
+    Covers Indian numeric formats, month names, bare years, financial
+    years, "this 5th day of" phrasing, relative dates and legal date
+    phrases ("dated", "on or about", "w.e.f."). Lowercase "may" alone is
+    treated as the verb.
+
+    Args:
+        text: Chunk text.
+
+    Returns:
+        True if the chunk should be sent for date extraction.
+    """
+    for match in DATE_CUE_PATTERN.finditer(text):
+        if not _MAY_AS_VERB.fullmatch(match.group(0)):
+            return True
+    return False
+
 
 # =============================================================================
 # Exceptions
@@ -323,7 +379,8 @@ class DateExtractor:
         Returns:
             Response text from Gemini.
         """
-        response = await self.model.generate_content_async(prompt)
+        async with get_rate_limiter(RateLimitProvider.GEMINI):
+            response = await self.model.generate_content_async(prompt)
         return response.text
 
     async def _extract_from_chunks(
@@ -335,8 +392,10 @@ class DateExtractor:
     ) -> DateExtractionResult:
         """Extract dates from text by processing in chunks.
 
-        Handles large documents by splitting into overlapping chunks
-        and deduplicating results.
+        Handles large documents by splitting into overlapping chunks,
+        skipping chunks without date cues, extracting the rest concurrently
+        (CHUNK_EXTRACTION_CONCURRENCY) and deduplicating results in chunk
+        order.
 
         Args:
             text: Full text to process.
@@ -348,30 +407,39 @@ class DateExtractor:
             Combined DateExtractionResult from all chunks.
         """
         chunks = self._split_into_chunks(text)
+        cued_chunks = [chunk for chunk in chunks if has_date_cues(chunk)]
         logger.info(
             "date_extraction_chunking",
             document_id=document_id,
             total_length=len(text),
             chunk_count=len(chunks),
+            skipped_without_cues=len(chunks) - len(cued_chunks),
         )
 
-        all_dates: list[ExtractedDate] = []
+        semaphore = asyncio.Semaphore(CHUNK_EXTRACTION_CONCURRENCY)
 
-        for i, chunk in enumerate(chunks):
-            logger.debug(
-                "date_extraction_processing_chunk",
-                document_id=document_id,
-                chunk_index=i + 1,
-                chunk_count=len(chunks),
-            )
+        async def extract_chunk(index: int, chunk: str) -> DateExtractionResult:
+            async with semaphore:
+                logger.debug(
+                    "date_extraction_processing_chunk",
+                    document_id=document_id,
+                    chunk_index=index + 1,
+                    chunk_count=len(cued_chunks),
+                )
+                return await self._extract_single(
+                    text=chunk,
+                    document_id=document_id,
+                    matter_id=matter_id,
+                    page_number=page_number,
+                )
 
-            chunk_result = await self._extract_single(
-                text=chunk,
-                document_id=document_id,
-                matter_id=matter_id,
-                page_number=page_number,
-            )
+        # gather keeps chunk order, so the merge below is deterministic
+        chunk_results = await asyncio.gather(
+            *(extract_chunk(i, chunk) for i, chunk in enumerate(cued_chunks))
+        )
 
+        all_dates: list[ExtractedDate] = []
+        for chunk_result in chunk_results:
             all_dates.extend(chunk_result.dates)
 
         # Deduplicate dates (same date_text and similar context)
@@ -385,6 +453,77 @@ class DateExtractor:
             processing_time_ms=0,  # Will be set by caller
         )
 
+    async def extract_dates_from_document_chunks(
+        self,
+        chunks: Sequence[ChunkWithContent],
+        document_id: str,
+        matter_id: str,
+        on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> list[ExtractedDate]:
+        """Extract dates from stored document chunks, keeping page/bbox info.
+
+        Chunks without date cues are skipped. Oversized chunks are split
+        like free text. The remaining pieces are extracted concurrently
+        (CHUNK_EXTRACTION_CONCURRENCY, Gemini rate limiter still applies)
+        and merged back in chunk order, so callers can deduplicate
+        deterministically.
+
+        Args:
+            chunks: Document chunks in reading order.
+            document_id: Source document UUID.
+            matter_id: Matter UUID.
+            on_progress: Optional callback awaited with (done, total)
+                after each piece completes.
+
+        Returns:
+            Extracted dates in chunk order (not deduplicated).
+        """
+        pieces: list[tuple[str, ChunkWithContent]] = []
+        for chunk in chunks:
+            if not chunk.content or not chunk.content.strip():
+                continue
+            texts = (
+                self._split_into_chunks(chunk.content)
+                if len(chunk.content) > MAX_TEXT_LENGTH
+                else [chunk.content]
+            )
+            pieces.extend((text, chunk) for text in texts if has_date_cues(text))
+
+        logger.info(
+            "date_extraction_document_chunks",
+            document_id=document_id,
+            chunk_count=len(chunks),
+            piece_count=len(pieces),
+        )
+
+        semaphore = asyncio.Semaphore(CHUNK_EXTRACTION_CONCURRENCY)
+        done = 0
+
+        async def extract_piece(text: str, chunk: ChunkWithContent) -> DateExtractionResult:
+            nonlocal done
+            async with semaphore:
+                result = await self._extract_single(
+                    text=text,
+                    document_id=document_id,
+                    matter_id=matter_id,
+                    page_number=chunk.page_number,
+                    bbox_ids=chunk.bbox_ids or [],
+                )
+            done += 1
+            if on_progress is not None:
+                await on_progress(done, len(pieces))
+            return result
+
+        # gather keeps piece order, so dates come back in chunk order
+        results = await asyncio.gather(
+            *(extract_piece(text, chunk) for text, chunk in pieces)
+        )
+
+        all_dates: list[ExtractedDate] = []
+        for result in results:
+            all_dates.extend(result.dates)
+        return all_dates
+
     def _split_into_chunks(self, text: str) -> list[str]:
         """Split text into overlapping chunks for processing.
 
@@ -522,6 +661,8 @@ class DateExtractor:
             all_dates: list[ExtractedDate] = []
 
             for chunk in chunks:
+                if not has_date_cues(chunk):
+                    continue
                 chunk_result = self._extract_single_sync(
                     text=chunk,
                     document_id=document_id,
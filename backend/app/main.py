@@ -152,6 +152,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.warning("redis_websocket_bridge_stop_failed", error=str(e))
 
+    # Flush buffered LLM cost records
+    try:
+        from app.core.cost_tracking import close_cost_service
+
+        close_cost_service()
+    except Exception as e:
+        logger.warning("cost_records_flush_failed", error=str(e))
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
@@ -371,6 +371,15 @@ class ComparisonMeta(BaseModel):
     processing_time_ms: int = Field(
         ..., alias="processingTimeMs", ge=0, description="Total processing time in milliseconds"
     )
+    cache_hits: int = Field(
+        0, alias="cacheHits", ge=0, description="Pairs answered from the verdict cache"
+    )
+    cost_avoided_usd: float = Field(
+        0.0,
+        alias="costAvoidedUsd",
+        ge=0.0,
+        description="LLM cost avoided by reusing cached verdicts, in USD",
+    )
 
 
 class EntityComparisonsResponse(BaseModel):
@@ -204,6 +204,19 @@ class EntityContradictions(BaseModel):
 # =============================================================================
 
 
+class ContradictionsListMeta(PaginationMeta):
+    """Pagination metadata for the contradictions list.
+
+    Story 14.2: AC #4 - Adds a keyset cursor for document-filtered listings.
+    """
+
+    next_cursor: str | None = Field(
+        None,
+        alias="nextCursor",
+        description="Cursor for the next page (document-filtered listings only)",
+    )
+
+
 class ContradictionsListResponse(BaseModel):
     """API response for contradictions list endpoint.
 
@@ -214,7 +227,7 @@ class ContradictionsListResponse(BaseModel):
         ...,
         description="Contradictions grouped by entity",
     )
-    meta: PaginationMeta = Field(
+    meta: ContradictionsListMeta | PaginationMeta = Field(
         ...,
         description="Pagination metadata",
     )
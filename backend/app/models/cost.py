@@ -103,6 +103,16 @@ class MatterCostSummary(BaseModel):
         alias="weeklyCostUsd",
         description="Total cost for the last 7 days in USD",
     )
+    cost_avoided_inr: float = Field(
+        default=0.0,
+        alias="costAvoidedInr",
+        description="LLM cost avoided by caches in the period, in INR",
+    )
+    cost_avoided_usd: float = Field(
+        default=0.0,
+        alias="costAvoidedUsd",
+        description="LLM cost avoided by caches in the period, in USD",
+    )
 
     model_config = {
         "populate_by_name": True,
@@ -172,6 +182,52 @@ class MatterCostResponse(BaseModel):
     }
 
 
+class CostRecord(BaseModel):
+    """Single LLM cost record for drill-down."""
+
+    id: str = Field(..., description="Cost record UUID")
+    document_id: str | None = Field(
+        None, alias="documentId", description="Document UUID if document-scoped"
+    )
+    provider: str = Field(..., description="Provider identifier")
+    operation: str = Field(..., description="Raw operation name")
+    operation_category: str = Field(
+        ..., alias="operationCategory", description="Normalized operation name"
+    )
+    input_tokens: int = Field(..., alias="inputTokens", description="Input tokens")
+    output_tokens: int = Field(..., alias="outputTokens", description="Output tokens")
+    cost_inr: float = Field(..., alias="costInr", description="Cost in INR")
+    cost_usd: float = Field(..., alias="costUsd", description="Cost in USD")
+    created_at: str = Field(..., alias="createdAt", description="When the call was made")
+
+    model_config = {
+        "populate_by_name": True,
+    }
+
+
+class MatterCostRecordsPage(BaseModel):
+    """Page of raw cost records for a matter."""
+
+    records: list[CostRecord] = Field(default_factory=list, description="Cost records")
+    has_more: bool = Field(
+        default=False, alias="hasMore", description="Whether more records exist"
+    )
+
+    model_config = {
+        "populate_by_name": True,
+    }
+
+
+class MatterCostRecordsResponse(BaseModel):
+    """API response wrapper for matter cost drill-down endpoint."""
+
+    data: MatterCostRecordsPage
+
+    model_config = {
+        "populate_by_name": True,
+    }
+
+
 # =============================================================================
 # Admin Cost Report Models (Story 7.2)
 # =============================================================================
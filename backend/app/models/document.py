@@ -147,7 +147,12 @@ class Document(DocumentBase):
     extracted_text: str | None = Field(
         None,
         alias="extractedText",
-        description="Full OCR-extracted text content"
+        description="Full OCR-extracted text content (only loaded on request)"
+    )
+    extracted_text_length: int | None = Field(
+        None,
+        alias="extractedTextLength",
+        description="Length of extracted_text in characters (null until OCR)"
     )
     ocr_confidence: float | None = Field(
         None, ge=0, le=1,
@@ -355,6 +360,23 @@ class DocumentDetailResponse(BaseModel):
     data: DocumentWithFeatures
 
 
+class DocumentText(BaseModel):
+    """Extracted text of a document, optionally for a page range."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    document_id: str = Field(..., alias="documentId", description="Document UUID")
+    page_start: int | None = Field(None, alias="pageStart", description="First page included")
+    page_end: int | None = Field(None, alias="pageEnd", description="Last page included")
+    text: str | None = Field(None, description="Extracted text (null until OCR)")
+
+
+class DocumentTextResponse(BaseModel):
+    """API response for document text."""
+
+    data: DocumentText
+
+
 class DocumentUpdate(BaseModel):
     """Model for updating document metadata."""
 
@@ -21,6 +21,10 @@ class TimingBreakdown(BaseModel):
     embedding_ms: float | None = Field(None, description="Time to generate query embedding")
     bm25_search_ms: float | None = Field(None, description="BM25 search time")
     semantic_search_ms: float | None = Field(None, description="Semantic/vector search time")
+    retrieval_ms: float | None = Field(
+        None,
+        description="Wall time of concurrent retrieval: max(embedding + semantic, bm25)",
+    )
     rrf_fusion_ms: float | None = Field(None, description="RRF score fusion time")
     rerank_ms: float | None = Field(None, description="Cohere reranking time")
     total_ms: float = Field(..., description="Total search time")
@@ -291,6 +291,10 @@ class EngineExecutionResult(BaseModel):
         le=1.0,
         description="Confidence score from engine (if applicable)",
     )
+    timed_out: bool = Field(
+        default=False,
+        description="True if the engine missed its deadline",
+    )
 
 
 class ExecutionPlan(BaseModel):
@@ -298,8 +302,10 @@ class ExecutionPlan(BaseModel):
 
     Story 6-2: Determines parallel vs sequential execution groups.
 
-    Groups are executed sequentially (one group after another),
-    but engines within each group run in parallel.
+    The executor schedules engines from the dependency graph: each engine
+    starts as soon as its own dependencies finish, so a slow engine only
+    delays its dependents. parallel_groups is the level-by-level view of
+    the same graph, kept for inspection and logging.
 
     Example:
         >>> plan = ExecutionPlan(
@@ -310,13 +316,18 @@ class ExecutionPlan(BaseModel):
     """
 
     parallel_groups: list[list[EngineType]] = Field(
-        description="Groups of engines that can run in parallel. "
-        "Groups are executed sequentially, engines within groups in parallel.",
+        description="Engines grouped by dependency level. "
+        "Each group depends only on engines in earlier groups.",
     )
     total_engines: int = Field(description="Total number of engines to execute")
     estimated_parallelism: float = Field(
         description="Parallelism factor (1.0 = all sequential, higher = more parallel)",
     )
+    dependencies: dict[EngineType, list[EngineType]] = Field(
+        default_factory=dict,
+        description="Dependency graph restricted to the planned engines "
+        "(engine -> engines it must wait for)",
+    )
 
 
 class SourceReference(BaseModel):
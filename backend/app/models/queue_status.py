@@ -73,6 +73,11 @@ class QueueStatusData(BaseModel):
     active_workers: int = Field(
         default=0, description="Number of active Celery workers", alias="activeWorkers"
     )
+    worker_capacity: int = Field(
+        default=0,
+        description="Total task slots (concurrency) of active Celery workers",
+        alias="workerCapacity",
+    )
     last_checked_at: str = Field(
         ..., description="ISO timestamp when metrics were collected", alias="lastCheckedAt"
     )
@@ -136,6 +141,7 @@ class QueueStatusResponse(BaseModel):
                     "totalPending": 130,
                     "totalActive": 8,
                     "activeWorkers": 3,
+                    "workerCapacity": 150,
                     "lastCheckedAt": "2026-01-27T10:30:00Z",
                     "alertThreshold": 100,
                     "isHealthy": False,
@@ -11,7 +11,7 @@ CRITICAL: Must match frontend types exactly for seamless API integration.
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import Enum, StrEnum
 
 from pydantic import BaseModel, Field
 
@@ -53,6 +53,17 @@ class KeyIssueVerificationStatus(str, Enum):
     FLAGGED = "flagged"
 
 
+class SummaryStatus(StrEnum):
+    """Availability of the precomputed summary.
+
+    Story 14.1: Summaries are built in the background; reads never build.
+    """
+
+    READY = "ready"
+    PENDING = "pending"  # Not precomputed yet - only stats and attention items
+    REFRESHING = "refreshing"  # Stored summary served while a rebuild runs
+
+
 # =============================================================================
 # Story 14.1: Component Models (Task 1.3)
 # =============================================================================
@@ -350,6 +361,14 @@ class MatterSummary(BaseModel):
         alias="generatedAt",
         description="When summary was generated (ISO timestamp)",
     )
+    version: int = Field(
+        0,
+        description="Precomputed summary version (0 if not stored)",
+    )
+    status: SummaryStatus = Field(
+        SummaryStatus.READY,
+        description="ready, pending (first build queued) or refreshing",
+    )
 
     model_config = {"populate_by_name": True}
 
@@ -0,0 +1,262 @@
+"""Act acquisition service for fetching missing Act PDFs.
+
+Acquires the Act PDFs citation verification needs:
+1. Acts already in the act cache manifest are returned without any request
+2. Missing Acts are fetched from India Code concurrently (act_fetch_concurrency),
+   within the client's per-host politeness budget
+3. Concurrent requests for the same Act (e.g. from several matters in one
+   batch) share a single fetch
+
+Each fetch tries the known_acts.json mapping first, then an India Code
+search, and caches the PDF globally via ActCacheService.
+
+Part of Act Validation and Auto-Fetching feature.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from enum import StrEnum
+
+import structlog
+
+from app.core.config import get_settings
+from app.engines.citation.india_code import IndiaCodeClient
+from app.services.act_cache_service import ActCacheService, get_act_cache_service
+
+logger = structlog.get_logger(__name__)
+
+
+class AcquisitionStatus(StrEnum):
+    """Outcome of acquiring one Act."""
+
+    CACHED = "cached"  # Already in the manifest, nothing fetched
+    FETCHED = "fetched"  # Downloaded and cached now
+    NOT_FOUND = "not_found"  # Not available on India Code
+    FAILED = "failed"  # Download or caching error
+
+
+@dataclass(frozen=True)
+class ActAcquisitionRequest:
+    """Act to acquire."""
+
+    normalized_name: str
+    canonical_name: str | None = None
+    year: int | None = None
+
+
+@dataclass
+class ActAcquisitionResult:
+    """Result of acquiring one Act."""
+
+    normalized_name: str
+    status: AcquisitionStatus
+    storage_path: str | None = None
+    source_url: str | None = None
+    india_code_doc_id: str | None = None
+    file_size: int = 0
+    used_known_mapping: bool = False
+    searched: bool = False
+    error_message: str | None = None
+
+    @property
+    def is_available(self) -> bool:
+        """Whether the Act PDF is in the global cache."""
+        return self.status in (AcquisitionStatus.CACHED, AcquisitionStatus.FETCHED)
+
+
+class ActAcquisitionService:
+    """Acquires Act PDFs concurrently, backed by the act cache manifest.
+
+    Create one instance per event loop (e.g. per task run): in-flight
+    fetches are coalesced within the instance.
+
+    Example:
+        >>> service = ActAcquisitionService()
+        >>> async with IndiaCodeClient() as india_code:
+        ...     results = await service.acquire_many(requests, india_code)
+    """
+
+    def __init__(
+        self,
+        cache_service: ActCacheService | None = None,
+        concurrency: int | None = None,
+    ):
+        """Initialize acquisition service.
+
+        Args:
+            cache_service: Optional act cache service. Uses singleton if None.
+            concurrency: Max Acts fetched at once. Uses settings if None.
+        """
+        self.cache_service = cache_service or get_act_cache_service()
+        self.concurrency = concurrency or get_settings().act_fetch_concurrency
+        self._semaphore: asyncio.Semaphore | None = None
+        self._inflight: dict[str, asyncio.Future[ActAcquisitionResult]] = {}
+
+    async def acquire_many(
+        self,
+        requests: list[ActAcquisitionRequest],
+        india_code: IndiaCodeClient,
+    ) -> dict[str, ActAcquisitionResult]:
+        """Acquire several Acts concurrently.
+
+        Args:
+            requests: Acts to acquire. Duplicate names are acquired once.
+            india_code: Open India Code client shared by all fetches.
+
+        Returns:
+            Mapping of normalized act name to acquisition result.
+        """
+        unique: dict[str, ActAcquisitionRequest] = {}
+        for request in requests:
+            unique.setdefault(request.normalized_name, request)
+
+        results = await asyncio.gather(
+            *(self.acquire(request, india_code) for request in unique.values())
+        )
+
+        logger.info(
+            "act_acquisition_batch_complete",
+            requested=len(requests),
+            unique=len(unique),
+            **{
+                status.value: sum(1 for r in results if r.status == status)
+                for status in AcquisitionStatus
+            },
+        )
+
+        return {result.normalized_name: result for result in results}
+
+    async def acquire(
+        self,
+        request: ActAcquisitionRequest,
+        india_code: IndiaCodeClient,
+    ) -> ActAcquisitionResult:
+        """Acquire one Act, joining an in-flight fetch of the same Act.
+
+        Args:
+            request: Act to acquire.
+            india_code: Open India Code client.
+
+        Returns:
+            Acquisition result. Never raises for fetch errors.
+        """
+        name = request.normalized_name
+
+        entry = await asyncio.to_thread(self.cache_service.get_entry, name)
+        if entry is not None:
+            return ActAcquisitionResult(
+                normalized_name=name,
+                status=AcquisitionStatus.CACHED,
+                storage_path=entry.storage_path,
+                source_url=entry.source_url,
+                india_code_doc_id=entry.india_code_doc_id,
+                file_size=entry.file_size,
+            )
+
+        inflight = self._inflight.get(name)
+        if inflight is not None:
+            logger.debug("act_acquisition_coalesced", normalized=name)
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[ActAcquisitionResult] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[name] = future
+        try:
+            if self._semaphore is None:
+                self._semaphore = asyncio.Semaphore(self.concurrency)
+            async with self._semaphore:
+                result = await self._fetch(request, india_code)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(name, None)
+
+    async def _fetch(
+        self,
+        request: ActAcquisitionRequest,
+        india_code: IndiaCodeClient,
+    ) -> ActAcquisitionResult:
+        """Download an Act (known mapping, then search) and cache it."""
+        name = request.normalized_name
+        result = ActAcquisitionResult(
+            normalized_name=name,
+            status=AcquisitionStatus.NOT_FOUND,
+        )
+
+        try:
+            # Try known mapping first
+            pdf_url = india_code.get_known_pdf_url(name)
+            if pdf_url:
+                result.used_known_mapping = True
+                doc_id = india_code.get_known_doc_id(name)
+                download = await india_code.download_pdf(doc_id, pdf_url)
+
+                if download.success and download.pdf_bytes:
+                    return await self._cache(result, download.pdf_bytes, pdf_url, doc_id)
+
+                logger.warning(
+                    "fetch_act_download_failed_known",
+                    normalized=name,
+                    error=download.error_message,
+                )
+
+            # Try search if we have canonical name
+            if request.canonical_name:
+                result.searched = True
+                search_results = await india_code.search_act(
+                    request.canonical_name, request.year
+                )
+
+                if search_results:
+                    first_result = search_results[0]
+                    download = await india_code.download_pdf(first_result.doc_id)
+
+                    if download.success and download.pdf_bytes:
+                        return await self._cache(
+                            result,
+                            download.pdf_bytes,
+                            first_result.handle_url,
+                            first_result.doc_id,
+                        )
+
+            logger.info("fetch_act_not_found", normalized=name)
+            return result
+
+        except Exception as e:
+            logger.error("fetch_act_error", normalized=name, error=str(e))
+            result.status = AcquisitionStatus.FAILED
+            result.error_message = str(e)
+            return result
+
+    async def _cache(
+        self,
+        result: ActAcquisitionResult,
+        pdf_bytes: bytes,
+        source_url: str,
+        doc_id: str | None,
+    ) -> ActAcquisitionResult:
+        """Store a downloaded PDF in the global cache and fill in the result."""
+        storage_path = await asyncio.to_thread(
+            self.cache_service.cache_act,
+            result.normalized_name,
+            pdf_bytes,
+            source_url=source_url,
+            india_code_doc_id=doc_id,
+        )
+
+        result.status = AcquisitionStatus.FETCHED
+        result.storage_path = storage_path
+        result.source_url = source_url
+        result.india_code_doc_id = doc_id
+        result.file_size = len(pdf_bytes)
+
+        logger.info(
+            "fetch_act_success",
+            normalized=result.normalized_name,
+            url=source_url,
+            known_mapping=result.used_known_mapping,
+        )
+        return result
@@ -7,9 +7,19 @@ Act multiple times.
 Storage structure:
 - documents/global/acts/{normalized_name}.pdf - Cached Act PDFs
 
+Every cached PDF has a row in the act_cache_manifest table (name, version,
+content hash, storage path, size). The manifest is loaded once per process
+and refreshed every MANIFEST_CACHE_TTL seconds, so existence checks are
+dictionary lookups instead of storage folder listings.
+
 Part of Act Validation and Auto-Fetching feature.
 """
 
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+
 import structlog
 from supabase import Client
 
@@ -22,6 +32,44 @@ logger = structlog.get_logger(__name__)
 _settings = get_settings()
 CACHED_ACT_URL_EXPIRES = getattr(_settings, 'act_cache_url_expiry_seconds', 86400)
 
+# Seconds before the in-process manifest is reloaded (picks up Acts cached
+# by other workers; this process's own writes apply immediately)
+MANIFEST_CACHE_TTL = 300
+
+# Rows per manifest page (PostgREST returns at most 1000 rows per request)
+MANIFEST_PAGE_SIZE = 1000
+
+MANIFEST_COLUMNS = (
+    "act_name_normalized, storage_path, content_sha256, file_size, version, "
+    "source_url, india_code_doc_id"
+)
+
+
+@dataclass(frozen=True)
+class CachedActEntry:
+    """Manifest entry for one cached Act PDF."""
+
+    normalized_name: str
+    storage_path: str
+    content_sha256: str | None
+    file_size: int
+    version: int
+    source_url: str | None = None
+    india_code_doc_id: str | None = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "CachedActEntry":
+        """Build an entry from an act_cache_manifest row."""
+        return cls(
+            normalized_name=row["act_name_normalized"],
+            storage_path=row["storage_path"],
+            content_sha256=row.get("content_sha256"),
+            file_size=int(row.get("file_size") or 0),
+            version=int(row.get("version") or 1),
+            source_url=row.get("source_url"),
+            india_code_doc_id=row.get("india_code_doc_id"),
+        )
+
 
 class ActCacheError(Exception):
     """Base exception for act cache operations."""
@@ -55,6 +103,9 @@ class ActCacheService:
         self.client = client or get_service_client()
         self.bucket = "documents"
         self._settings = get_settings()
+        self._manifest: dict[str, CachedActEntry] | None = None
+        self._manifest_loaded_at = 0.0
+        self._manifest_lock = threading.Lock()
 
     def _get_storage_path(self, normalized_name: str) -> str:
         """Get storage path for a cached Act.
@@ -68,57 +119,95 @@ class ActCacheService:
         prefix = self._settings.act_cache_storage_prefix
         return f"{prefix}/{normalized_name}.pdf"
 
-    def is_cached(self, normalized_name: str) -> bool:
-        """Check if an Act PDF is already cached.
-
-        Args:
-            normalized_name: Normalized act name.
+    def _get_manifest(self) -> dict[str, CachedActEntry]:
+        """Get the manifest of cached Acts, loading it if stale.
 
         Returns:
-            True if cached, False otherwise.
+            Mapping of normalized act name to manifest entry. Empty if the
+            manifest can't be read.
         """
-        if self.client is None:
-            return False
+        with self._manifest_lock:
+            if (
+                self._manifest is not None
+                and time.monotonic() - self._manifest_loaded_at < MANIFEST_CACHE_TTL
+            ):
+                return self._manifest
 
-        storage_path = self._get_storage_path(normalized_name)
+        if self.client is None:
+            return {}
 
         try:
-            # Try to get file info - if it exists, it's cached
-            # We use list with prefix to check existence
-            prefix = self._settings.act_cache_storage_prefix
-            result = self.client.storage.from_(self.bucket).list(
-                path=f"{prefix}/",
-                options={"search": f"{normalized_name}.pdf"}
-            )
+            manifest: dict[str, CachedActEntry] = {}
+            offset = 0
+            while True:
+                result = (
+                    self.client.table("act_cache_manifest")
+                    .select(MANIFEST_COLUMNS)
+                    .order("act_name_normalized")
+                    .range(offset, offset + MANIFEST_PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = result.data or []
+                for row in rows:
+                    manifest[row["act_name_normalized"]] = CachedActEntry.from_row(row)
+                if len(rows) < MANIFEST_PAGE_SIZE:
+                    break
+                offset += MANIFEST_PAGE_SIZE
+        except Exception as e:
+            logger.warning("act_cache_manifest_load_failed", error=str(e))
+            with self._manifest_lock:
+                return self._manifest or {}
 
-            # Check if our file is in the results
-            if result:
-                for file in result:
-                    if file.get("name") == f"{normalized_name}.pdf":
-                        return True
+        with self._manifest_lock:
+            self._manifest = manifest
+            self._manifest_loaded_at = time.monotonic()
 
-            return False
+        logger.debug("act_cache_manifest_loaded", total_cached=len(manifest))
+        return manifest
 
-        except Exception as e:
-            logger.debug(
-                "act_cache_check_error",
-                normalized_name=normalized_name,
-                error=str(e),
-            )
-            return False
+    def invalidate_manifest(self) -> None:
+        """Force the next lookup to reload the manifest."""
+        with self._manifest_lock:
+            self._manifest = None
+
+    def get_entry(self, normalized_name: str) -> CachedActEntry | None:
+        """Get the manifest entry of a cached Act.
+
+        Args:
+            normalized_name: Normalized act name.
+
+        Returns:
+            CachedActEntry if cached, None otherwise.
+        """
+        return self._get_manifest().get(normalized_name)
+
+    def is_cached(self, normalized_name: str) -> bool:
+        """Check if an Act PDF is already cached.
+
+        Args:
+            normalized_name: Normalized act name.
+
+        Returns:
+            True if cached, False otherwise.
+        """
+        return self.get_entry(normalized_name) is not None
 
     def cache_act(
         self,
         normalized_name: str,
         pdf_content: bytes,
         content_type: str = "application/pdf",
+        source_url: str | None = None,
+        india_code_doc_id: str | None = None,
     ) -> str:
-        """Cache an Act PDF globally.
+        """Cache an Act PDF globally and record it in the manifest.
 
         Args:
             normalized_name: Normalized act name.
             pdf_content: PDF content as bytes.
             content_type: MIME type of the file.
+            source_url: URL the PDF was downloaded from.
+            india_code_doc_id: DSpace document ID, if known.
 
         Returns:
             Storage path of cached file.
@@ -151,10 +240,20 @@ class ActCacheService:
                 }
             )
 
+            entry = self._record_manifest_entry(
+                normalized_name,
+                storage_path=storage_path,
+                content_sha256=hashlib.sha256(pdf_content).hexdigest(),
+                file_size=len(pdf_content),
+                source_url=source_url,
+                india_code_doc_id=india_code_doc_id,
+            )
+
             logger.info(
                 "act_cache_complete",
                 normalized_name=normalized_name,
                 storage_path=storage_path,
+                version=entry.version,
             )
 
             return storage_path
@@ -170,6 +269,47 @@ class ActCacheService:
                 code="CACHE_FAILED"
             ) from e
 
+    def _record_manifest_entry(
+        self,
+        normalized_name: str,
+        storage_path: str,
+        content_sha256: str,
+        file_size: int,
+        source_url: str | None,
+        india_code_doc_id: str | None,
+    ) -> CachedActEntry:
+        """Upsert the manifest row of a freshly uploaded Act."""
+        result = self.client.rpc(
+            "record_cached_act",
+            {
+                "p_act_name_normalized": normalized_name,
+                "p_storage_path": storage_path,
+                "p_content_sha256": content_sha256,
+                "p_file_size": file_size,
+                "p_source_url": source_url,
+                "p_india_code_doc_id": india_code_doc_id,
+            },
+        ).execute()
+
+        if result.data:
+            entry = CachedActEntry.from_row(result.data[0])
+        else:
+            entry = CachedActEntry(
+                normalized_name=normalized_name,
+                storage_path=storage_path,
+                content_sha256=content_sha256,
+                file_size=file_size,
+                version=1,
+                source_url=source_url,
+                india_code_doc_id=india_code_doc_id,
+            )
+
+        with self._manifest_lock:
+            if self._manifest is not None:
+                self._manifest[normalized_name] = entry
+
+        return entry
+
     def get_cached_act(self, normalized_name: str) -> bytes | None:
         """Get a cached Act PDF.
 
@@ -258,6 +398,13 @@ class ActCacheService:
 
         try:
             self.client.storage.from_(self.bucket).remove([storage_path])
+            self.client.table("act_cache_manifest").delete().eq(
+                "act_name_normalized", normalized_name
+            ).execute()
+
+            with self._manifest_lock:
+                if self._manifest is not None:
+                    self._manifest.pop(normalized_name, None)
 
             logger.info(
                 "act_cache_deleted",
@@ -280,31 +427,7 @@ class ActCacheService:
         Returns:
             List of normalized act names that are cached.
         """
-        if self.client is None:
-            return []
-
-        prefix = self._settings.act_cache_storage_prefix
-        try:
-            result = self.client.storage.from_(self.bucket).list(
-                path=f"{prefix}/",
-            )
-
-            cached = []
-            if result:
-                for file in result:
-                    name = file.get("name", "")
-                    if name.endswith(".pdf"):
-                        # Remove .pdf extension to get normalized name
-                        cached.append(name[:-4])
-
-            return cached
-
-        except Exception as e:
-            logger.error(
-                "act_cache_list_failed",
-                error=str(e),
-            )
-            return []
+        return sorted(self._get_manifest())
 
     def get_cache_stats(self) -> dict:
         """Get statistics about the act cache.
@@ -312,35 +435,11 @@ class ActCacheService:
         Returns:
             Dict with cache statistics.
         """
-        if self.client is None:
-            return {"total_cached": 0, "total_size_bytes": 0}
-
-        prefix = self._settings.act_cache_storage_prefix
-        try:
-            result = self.client.storage.from_(self.bucket).list(
-                path=f"{prefix}/",
-            )
-
-            total_cached = 0
-            total_size = 0
-
-            if result:
-                for file in result:
-                    if file.get("name", "").endswith(".pdf"):
-                        total_cached += 1
-                        total_size += file.get("metadata", {}).get("size", 0)
-
-            return {
-                "total_cached": total_cached,
-                "total_size_bytes": total_size,
-            }
-
-        except Exception as e:
-            logger.error(
-                "act_cache_stats_failed",
-                error=str(e),
-            )
-            return {"total_cached": 0, "total_size_bytes": 0}
+        manifest = self._get_manifest()
+        return {
+            "total_cached": len(manifest),
+            "total_size_bytes": sum(entry.file_size for entry in manifest.values()),
+        }
 
 
 # Singleton instance
@@ -6,6 +6,9 @@ Story 17.5: Batch Bounding Box Inserts
 - Configurable batch size (default 500 for chunked documents)
 - Parallel batch inserts using thread pool
 - Performance logging for insert operations
+
+Chunked OCR tags each box with the chunk that produced it
+(ocr_chunk_index), so a retried chunk replaces only its own rows.
 """
 
 import time
@@ -84,6 +87,7 @@ class BoundingBoxService:
         bounding_boxes: list[OCRBoundingBox],
         batch_size: int = DEFAULT_BATCH_SIZE,
         use_parallel: bool | None = None,
+        ocr_chunk_index: int | None = None,
     ) -> int:
         """Save bounding boxes to the database.
 
@@ -98,6 +102,8 @@ class BoundingBoxService:
             bounding_boxes: List of OCRBoundingBox to save.
             batch_size: Number of rows per insert batch (default 500).
             use_parallel: Force parallel inserts. Auto-detects if None.
+            ocr_chunk_index: OCR chunk that produced the boxes (chunked
+                documents only).
 
         Returns:
             Number of bounding boxes saved.
@@ -152,6 +158,9 @@ class BoundingBoxService:
                 }
                 for bbox in bounding_boxes
             ]
+            if ocr_chunk_index is not None:
+                for record in records:
+                    record["ocr_chunk_index"] = ocr_chunk_index
 
             # Create batches
             batches = [
@@ -309,6 +318,125 @@ class BoundingBoxService:
                 code="DELETE_FAILED"
             ) from e
 
+    def replace_chunk_bounding_boxes(
+        self,
+        document_id: str,
+        matter_id: str,
+        chunk_index: int,
+        bounding_boxes: list[OCRBoundingBox],
+    ) -> int:
+        """Replace the bounding boxes of one OCR chunk.
+
+        Deletes rows previously written for this chunk (earlier attempt of
+        a retried chunk) and saves the new boxes tagged with chunk_index.
+        Page numbers must already be absolute within the document.
+
+        Args:
+            document_id: Document UUID.
+            matter_id: Matter UUID for RLS.
+            chunk_index: 0-based OCR chunk index.
+            bounding_boxes: Boxes produced by the chunk.
+
+        Returns:
+            Number of bounding boxes saved.
+
+        Raises:
+            BoundingBoxServiceError: If deletion or save fails.
+        """
+        if self.client is None:
+            raise BoundingBoxServiceError(
+                message="Database client not configured",
+                code="DATABASE_NOT_CONFIGURED"
+            )
+
+        try:
+            result = (
+                self.client.table("bounding_boxes")
+                .delete()
+                .eq("document_id", document_id)
+                .eq("ocr_chunk_index", chunk_index)
+                .execute()
+            )
+        except Exception as e:
+            logger.error(
+                "chunk_bounding_boxes_delete_failed",
+                document_id=document_id,
+                chunk_index=chunk_index,
+                error=str(e),
+            )
+            raise BoundingBoxServiceError(
+                message=f"Failed to delete chunk bounding boxes: {e!s}",
+                code="DELETE_FAILED"
+            ) from e
+
+        replaced_count = len(result.data) if result.data else 0
+        if replaced_count:
+            logger.info(
+                "chunk_bounding_boxes_replaced",
+                document_id=document_id,
+                chunk_index=chunk_index,
+                replaced_count=replaced_count,
+            )
+
+        return self.save_bounding_boxes(
+            document_id=document_id,
+            matter_id=matter_id,
+            bounding_boxes=bounding_boxes,
+            ocr_chunk_index=chunk_index,
+        )
+
+    def delete_stale_bounding_boxes(self, document_id: str, chunk_count: int) -> int:
+        """Delete boxes not written by the current set of OCR chunks.
+
+        Removes rows from an earlier OCR run of the document: untagged rows
+        and rows from chunk indices beyond the current chunk count.
+
+        Args:
+            document_id: Document UUID.
+            chunk_count: Number of chunks in the current OCR run.
+
+        Returns:
+            Number of bounding boxes deleted.
+
+        Raises:
+            BoundingBoxServiceError: If deletion fails.
+        """
+        if self.client is None:
+            raise BoundingBoxServiceError(
+                message="Database client not configured",
+                code="DATABASE_NOT_CONFIGURED"
+            )
+
+        try:
+            result = (
+                self.client.table("bounding_boxes")
+                .delete()
+                .eq("document_id", document_id)
+                .or_(f"ocr_chunk_index.is.null,ocr_chunk_index.gte.{chunk_count}")
+                .execute()
+            )
+        except Exception as e:
+            logger.error(
+                "stale_bounding_boxes_delete_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+            raise BoundingBoxServiceError(
+                message=f"Failed to delete stale bounding boxes: {e!s}",
+                code="DELETE_FAILED"
+            ) from e
+
+        deleted_count = len(result.data) if result.data else 0
+        if deleted_count:
+            logger.info(
+                "stale_bounding_boxes_deleted",
+                document_id=document_id,
+                chunk_count=chunk_count,
+                deleted_count=deleted_count,
+            )
+
+        return deleted_count
+
     def get_bounding_boxes_for_page(
         self,
         document_id: str,
@@ -11,6 +11,7 @@ from app.services.contradiction.statement_query import (
     StatementQueryService,
     get_statement_query_service,
 )
+from app.services.contradiction.verdict_cache import PairVerdictCache
 
 __all__ = [
     # Story 5-1
@@ -19,4 +20,5 @@ __all__ = [
     # Story 5-2
     "StatementComparisonService",
     "get_statement_comparison_service",
+    "PairVerdictCache",
 ]
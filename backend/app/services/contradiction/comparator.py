@@ -6,11 +6,20 @@ and provides a clean interface for API routes.
 CRITICAL: Validates matter_id on every request (Layer 4 isolation).
 """
 
+from collections.abc import Awaitable, Callable
 from functools import lru_cache
 
 import structlog
 
+from app.core.cost_tracking import (
+    CostTracker,
+    LLMProvider,
+    get_cost_service,
+    usd_to_inr,
+)
 from app.engines.contradiction import (
+    ComparisonBatchResult,
+    ComparisonCallback,
     StatementComparator,
     get_statement_comparator,
 )
@@ -19,12 +28,14 @@ from app.models.contradiction import (
     ComparisonResult,
     EntityComparisons,
     EntityComparisonsResponse,
+    StatementPairComparison,
 )
 from app.services.contradiction.statement_query import (
     EntityNotFoundError,
     StatementQueryService,
     get_statement_query_service,
 )
+from app.services.contradiction.verdict_cache import PairVerdictCache
 from app.services.mig.graph import MIGGraphService, get_mig_graph_service
 
 logger = structlog.get_logger(__name__)
@@ -39,6 +50,13 @@ DEFAULT_MAX_PAIRS = 50
 DEFAULT_CONFIDENCE_THRESHOLD = 0.5
 ASYNC_THRESHOLD = 100  # If >100 statements, use async processing
 
+# llm_costs operation under which verdict-cache savings are recorded
+VERDICT_CACHE_COST_OPERATION = "contradiction_verdict_cache"
+
+# Receives (entity_id, comparison) for each comparison that passes the
+# confidence threshold, as soon as it completes
+EntityComparisonCallback = Callable[[str, StatementPairComparison], Awaitable[None]]
+
 
 # =============================================================================
 # Exceptions
@@ -135,6 +153,9 @@ class StatementComparisonService:
         max_pairs: int = DEFAULT_MAX_PAIRS,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
         include_aliases: bool = True,
+        max_cost_usd: float | None = None,
+        on_comparison: EntityComparisonCallback | None = None,
+        use_verdict_cache: bool = True,
     ) -> EntityComparisonsResponse:
         """Compare all statements about an entity for contradictions.
 
@@ -152,6 +173,9 @@ class StatementComparisonService:
             max_pairs: Maximum pairs to compare (cost control).
             confidence_threshold: Minimum confidence to include.
             include_aliases: Include statements from entity aliases.
+            max_cost_usd: Stop comparing once spend reaches this (None = no limit).
+            on_comparison: Optional callback for progressive persistence.
+            use_verdict_cache: Reuse verdicts for pairs compared in earlier runs.
 
         Returns:
             EntityComparisonsResponse with comparisons and cost metadata.
@@ -242,7 +266,13 @@ class StatementComparisonService:
             batch_result = await self.comparator.compare_all_entity_statements(
                 entity_statements=entity_statements,
                 max_pairs=max_pairs,
+                max_cost_usd=max_cost_usd,
+                on_comparison=self._filtered_callback(
+                    entity_id, confidence_threshold, on_comparison
+                ),
+                verdict_cache=PairVerdictCache(matter_id) if use_verdict_cache else None,
             )
+            self._record_cache_savings(matter_id, entity_id, batch_result)
 
             # Filter by confidence threshold
             filtered_comparisons = [
@@ -267,6 +297,8 @@ class StatementComparisonService:
                 contradictions_found=batch_result.contradictions_found,
                 total_cost_usd=batch_result.total_cost_usd,
                 processing_time_ms=batch_result.processing_time_ms,
+                cache_hits=batch_result.cache_hits,
+                cost_avoided_usd=batch_result.cost_avoided_usd,
             )
 
             logger.info(
@@ -304,6 +336,9 @@ class StatementComparisonService:
         matter_id: str,
         max_pairs: int = DEFAULT_MAX_PAIRS,
         confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        max_cost_usd: float | None = None,
+        on_comparison: EntityComparisonCallback | None = None,
+        use_verdict_cache: bool = True,
     ) -> EntityComparisonsResponse:
         """Compare statements across ALL entity_ids with the same canonical_name.
 
@@ -318,6 +353,10 @@ class StatementComparisonService:
             matter_id: Matter UUID for isolation (CRITICAL).
             max_pairs: Maximum pairs to compare (cost control).
             confidence_threshold: Minimum confidence to include.
+            max_cost_usd: Stop comparing once spend reaches this (None = no limit).
+            on_comparison: Optional callback for progressive persistence,
+                called with the primary entity_id.
+            use_verdict_cache: Reuse verdicts for pairs compared in earlier runs.
 
         Returns:
             EntityComparisonsResponse with comparisons across all matching entities.
@@ -376,6 +415,9 @@ class StatementComparisonService:
             max_pairs=max_pairs,
             confidence_threshold=confidence_threshold,
             primary_entity_id=primary_entity_id,
+            max_cost_usd=max_cost_usd,
+            on_comparison=on_comparison,
+            use_verdict_cache=use_verdict_cache,
         )
 
     async def _compare_merged_entity_statements(
@@ -386,6 +428,9 @@ class StatementComparisonService:
         max_pairs: int,
         confidence_threshold: float,
         primary_entity_id: str,
+        max_cost_usd: float | None = None,
+        on_comparison: EntityComparisonCallback | None = None,
+        use_verdict_cache: bool = True,
     ) -> EntityComparisonsResponse:
         """Compare statements that mention ANY of the given entity_ids.
 
@@ -399,6 +444,9 @@ class StatementComparisonService:
             max_pairs: Maximum pairs to compare.
             confidence_threshold: Minimum confidence threshold.
             primary_entity_id: ID to use for response structure.
+            max_cost_usd: Stop comparing once spend reaches this (None = no limit).
+            on_comparison: Optional callback for progressive persistence.
+            use_verdict_cache: Reuse verdicts for pairs compared in earlier runs.
 
         Returns:
             EntityComparisonsResponse with merged statement comparisons.
@@ -501,7 +549,13 @@ class StatementComparisonService:
         batch_result = await self.comparator.compare_all_entity_statements(
             entity_statements=entity_statements,
             max_pairs=max_pairs,
+            max_cost_usd=max_cost_usd,
+            on_comparison=self._filtered_callback(
+                primary_entity_id, confidence_threshold, on_comparison
+            ),
+            verdict_cache=PairVerdictCache(matter_id) if use_verdict_cache else None,
         )
+        self._record_cache_savings(matter_id, primary_entity_id, batch_result)
 
         # Filter by confidence threshold
         filtered_comparisons = [
@@ -526,6 +580,8 @@ class StatementComparisonService:
             contradictions_found=batch_result.contradictions_found,
             total_cost_usd=batch_result.total_cost_usd,
             processing_time_ms=batch_result.processing_time_ms,
+            cache_hits=batch_result.cache_hits,
+            cost_avoided_usd=batch_result.cost_avoided_usd,
         )
 
         logger.info(
@@ -568,6 +624,62 @@ class StatementComparisonService:
         # N*(N-1)/2 unique pairs
         return (count * (count - 1)) // 2
 
+    def _filtered_callback(
+        self,
+        entity_id: str,
+        confidence_threshold: float,
+        on_comparison: EntityComparisonCallback | None,
+    ) -> ComparisonCallback | None:
+        """Adapt an entity callback to the engine, applying the confidence filter."""
+        if on_comparison is None:
+            return None
+
+        async def _callback(comparison: StatementPairComparison) -> None:
+            if comparison.confidence >= confidence_threshold:
+                await on_comparison(entity_id, comparison)
+
+        return _callback
+
+    def _record_cache_savings(
+        self,
+        matter_id: str,
+        entity_id: str,
+        batch_result: ComparisonBatchResult,
+    ) -> None:
+        """Record verdict-cache savings through cost tracking.
+
+        Cache hits cost nothing, so they are recorded as a zero-cost
+        llm_costs row whose metadata carries the avoided cost. The
+        llm_cost_rollups trigger totals it for matter cost reports and
+        leaves it out of operation counts.
+        """
+        if not batch_result.cache_hits:
+            return
+        service = get_cost_service()
+        if service is None:
+            return
+
+        try:
+            provider = LLMProvider(self.comparator.model_name)
+        except ValueError:
+            provider = LLMProvider.OPENAI_GPT4_TURBO
+
+        tracker = CostTracker(
+            provider=provider,
+            operation=VERDICT_CACHE_COST_OPERATION,
+            matter_id=matter_id,
+            entity_id=entity_id,
+        )
+        service.record_cost(
+            tracker,
+            metadata={
+                "cache_hits": batch_result.cache_hits,
+                "cache_misses": batch_result.cache_misses,
+                "cost_avoided_usd": round(batch_result.cost_avoided_usd, 8),
+                "cost_avoided_inr": round(usd_to_inr(batch_result.cost_avoided_usd), 4),
+            },
+        )
+
     def _create_empty_response(
         self,
         entity_id: str,
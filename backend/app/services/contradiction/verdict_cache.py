@@ -0,0 +1,146 @@
+"""Supabase-backed pair verdict cache for contradiction detection.
+
+Story 5-2 (cost optimization): Persists statement-pair verdicts in
+contradiction_verdict_cache so re-running detection after a new upload only
+sends new or changed pairs to the LLM.
+
+Implements the PairVerdictStore protocol used by
+StatementComparator.compare_all_entity_statements.
+
+CRITICAL: Every read and write is scoped by matter_id (Layer 4 isolation).
+
+NOTE: Uses asyncio.to_thread() to run synchronous Supabase client calls
+without blocking the event loop.
+"""
+
+import asyncio
+
+import structlog
+
+from app.engines.contradiction.comparator import CachedVerdict
+
+logger = structlog.get_logger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+TABLE_NAME = "contradiction_verdict_cache"
+LOOKUP_CHUNK_SIZE = 200  # Hashes per .in_() query (keeps URLs short)
+
+
+# =============================================================================
+# Store Implementation
+# =============================================================================
+
+
+class PairVerdictCache:
+    """Per-matter pair verdict store backed by Supabase.
+
+    Example:
+        >>> cache = PairVerdictCache(matter_id="matter-123")
+        >>> await comparator.compare_all_entity_statements(
+        ...     entity_statements, verdict_cache=cache
+        ... )
+    """
+
+    def __init__(self, matter_id: str, client=None) -> None:
+        """Initialize the cache for one matter.
+
+        Args:
+            matter_id: Matter UUID every entry is scoped to.
+            client: Optional Supabase client (defaults to service client).
+        """
+        self.matter_id = matter_id
+        self._client = client
+
+    @property
+    def client(self):
+        """Get Supabase service client (workers write the cache)."""
+        if self._client is None:
+            from app.services.supabase.client import get_service_client
+
+            self._client = get_service_client()
+        return self._client
+
+    async def get_many(self, pair_hashes: list[str]) -> dict[str, CachedVerdict]:
+        """Fetch cached verdicts for the given pair hashes.
+
+        Args:
+            pair_hashes: Pair hashes to look up.
+
+        Returns:
+            Mapping of pair hash to cached verdict, for hits only.
+        """
+        if not pair_hashes or self.client is None:
+            return {}
+
+        def _query(chunk: list[str]) -> list[dict]:
+            response = (
+                self.client.table(TABLE_NAME)
+                .select("pair_hash, first_digest, verdict, cost_usd")
+                .eq("matter_id", self.matter_id)
+                .in_("pair_hash", chunk)
+                .execute()
+            )
+            return response.data or []
+
+        hits: dict[str, CachedVerdict] = {}
+        for i in range(0, len(pair_hashes), LOOKUP_CHUNK_SIZE):
+            rows = await asyncio.to_thread(_query, pair_hashes[i:i + LOOKUP_CHUNK_SIZE])
+            for row in rows:
+                hits[row["pair_hash"]] = CachedVerdict(
+                    first_digest=row["first_digest"],
+                    verdict=row["verdict"],
+                    cost_usd=float(row.get("cost_usd") or 0.0),
+                )
+
+        logger.debug(
+            "pair_verdict_cache_lookup",
+            matter_id=self.matter_id,
+            requested=len(pair_hashes),
+            hits=len(hits),
+        )
+        return hits
+
+    async def put(self, pair_hash: str, verdict: CachedVerdict) -> None:
+        """Store a verdict, replacing any existing entry for the same hash.
+
+        Args:
+            pair_hash: Pair hash (includes the prompt/model version).
+            verdict: Verdict to cache.
+        """
+        if self.client is None:
+            return
+
+        record = {
+            "matter_id": self.matter_id,
+            "pair_hash": pair_hash,
+            "first_digest": verdict.first_digest,
+            "verdict_version": verdict.version,
+            "verdict": verdict.verdict,
+            "cost_usd": round(verdict.cost_usd, 6),
+        }
+
+        await asyncio.to_thread(
+            lambda: self.client.table(TABLE_NAME)
+            .upsert(record, on_conflict="matter_id,pair_hash")
+            .execute()
+        )
+
+    async def record_hits(self, pair_hashes: list[str]) -> None:
+        """Bump hit counters for reused verdicts in a single RPC.
+
+        Args:
+            pair_hashes: Hashes of the verdicts that were reused.
+        """
+        if not pair_hashes or self.client is None:
+            return
+
+        await asyncio.to_thread(
+            lambda: self.client.rpc(
+                "record_verdict_cache_hits",
+                {"p_matter_id": self.matter_id, "p_pair_hashes": pair_hashes},
+            ).execute()
+        )
@@ -9,6 +9,9 @@ CRITICAL: Uses Supabase service client - matter access validated at API layer.
 """
 
 import asyncio
+import base64
+import binascii
+import json
 import math
 from functools import lru_cache
 from typing import Any
@@ -17,7 +20,6 @@ import structlog
 
 from app.models.contradiction import (
     ContradictionType,
-    PaginationMeta,
     SeverityLevel,
 )
 from app.models.contradiction_list import (
@@ -26,6 +28,7 @@ from app.models.contradiction_list import (
     MAX_PAGE_SIZE,
     ContradictionEvidenceLink,
     ContradictionItem,
+    ContradictionsListMeta,
     ContradictionsListResponse,
     EntityContradictions,
     StatementInfo,
@@ -66,6 +69,40 @@ class MatterNotFoundError(ContradictionListServiceError):
         )
 
 
+# =============================================================================
+# Story 14.2: Keyset Cursors
+# =============================================================================
+
+SORT_FIELDS = ("severity", "createdAt", "entityName")
+
+
+def _encode_cursor(row: dict[str, Any]) -> str:
+    """Encode a row's sort position as an opaque cursor."""
+    position = [row.get("sort_key"), row.get("sort_created_at"), row.get("id")]
+    payload = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str, str]:
+    """Decode a cursor into (sort_key, sort_created_at, id).
+
+    Raises:
+        ContradictionListServiceError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_key, created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not all(isinstance(v, str) for v in (sort_key, created_at, row_id)):
+            raise ValueError("cursor fields must be strings")
+        return sort_key, created_at, row_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ContradictionListServiceError(
+            "Invalid pagination cursor",
+            code="INVALID_CURSOR",
+            status_code=400,
+        ) from e
+
+
 # =============================================================================
 # Story 14.2: Contradiction List Service
 # =============================================================================
@@ -86,6 +123,9 @@ class ContradictionListService:
     7. Apply pagination
     8. Group results by entity
 
+    Document-filtered listings run steps 1-7 in the list_document_contradictions
+    RPC, which also supports keyset pagination via meta.next_cursor.
+
     Example:
         >>> service = ContradictionListService()
         >>> response = await service.get_all_contradictions("matter-123")
@@ -128,6 +168,7 @@ class ContradictionListService:
         per_page: int = DEFAULT_PAGE_SIZE,
         sort_by: str = "severity",
         sort_order: str = "desc",
+        cursor: str | None = None,
     ) -> ContradictionsListResponse:
         """Get all contradictions for a matter grouped by entity.
 
@@ -143,6 +184,8 @@ class ContradictionListService:
             per_page: Items per page (max 100).
             sort_by: Sort field (severity, createdAt, entityName).
             sort_order: Sort direction (asc, desc).
+            cursor: Keyset cursor from a previous page's meta.next_cursor
+                (document-filtered listings only); takes precedence over page.
 
         Returns:
             ContradictionsListResponse with entity-grouped contradictions.
@@ -161,22 +204,52 @@ class ContradictionListService:
             per_page=per_page,
             sort_by=sort_by,
             sort_order=sort_order,
+            has_cursor=cursor is not None,
         )
 
         # Clamp per_page to max
         per_page = min(per_page, MAX_PAGE_SIZE)
 
-        # Get total count for pagination (includes document filter)
-        total = await self._get_total_count(
-            matter_id=matter_id,
-            severity=severity,
-            contradiction_type=contradiction_type,
-            entity_id=entity_id,
-            document_id=document_id,
-        )
-
         # Calculate offset
         offset = (page - 1) * per_page
+        next_cursor: str | None = None
+
+        if document_id:
+            # Rows, statement details and total in one round trip
+            contradictions, total, next_cursor = await self._query_document_contradictions(
+                matter_id=matter_id,
+                document_id=document_id,
+                severity=severity,
+                contradiction_type=contradiction_type,
+                entity_id=entity_id,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                limit=per_page,
+                offset=offset,
+                cursor=cursor,
+            )
+        else:
+            # Get total count for pagination
+            total = await self._get_total_count(
+                matter_id=matter_id,
+                severity=severity,
+                contradiction_type=contradiction_type,
+                entity_id=entity_id,
+            )
+
+            # Query contradictions with all data in single query (no N+1)
+            contradictions = []
+            if total > 0:
+                contradictions = await self._query_contradictions_with_statements(
+                    matter_id=matter_id,
+                    severity=severity,
+                    contradiction_type=contradiction_type,
+                    entity_id=entity_id,
+                    sort_by=sort_by,
+                    sort_order=sort_order,
+                    limit=per_page,
+                    offset=offset,
+                )
 
         # Return empty if no contradictions
         if total == 0:
@@ -186,7 +259,7 @@ class ContradictionListService:
             )
             return ContradictionsListResponse(
                 data=[],
-                meta=PaginationMeta(
+                meta=ContradictionsListMeta(
                     total=0,
                     page=page,
                     per_page=per_page,
@@ -194,19 +267,6 @@ class ContradictionListService:
                 ),
             )
 
-        # Query contradictions with all data in single query (no N+1)
-        contradictions = await self._query_contradictions_with_statements(
-            matter_id=matter_id,
-            severity=severity,
-            contradiction_type=contradiction_type,
-            entity_id=entity_id,
-            document_id=document_id,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            limit=per_page,
-            offset=offset,
-        )
-
         # Group by entity
         entity_groups = self._group_by_entity(contradictions)
 
@@ -222,11 +282,12 @@ class ContradictionListService:
 
         return ContradictionsListResponse(
             data=entity_groups,
-            meta=PaginationMeta(
+            meta=ContradictionsListMeta(
                 total=total,
                 page=page,
                 per_page=per_page,
                 total_pages=total_pages,
+                next_cursor=next_cursor,
             ),
         )
 
@@ -236,33 +297,21 @@ class ContradictionListService:
         severity: str | None = None,
         contradiction_type: str | None = None,
         entity_id: str | None = None,
-        document_id: str | None = None,
     ) -> int:
         """Get total count of contradictions matching filters.
 
+        Document-filtered counts come from list_document_contradictions.
+
         Args:
             matter_id: Matter UUID.
             severity: Optional severity filter.
             contradiction_type: Optional type filter.
             entity_id: Optional entity filter.
-            document_id: Optional document filter.
 
         Returns:
             Total count.
         """
         try:
-            # For document_id filter, we need to count via RPC or subquery
-            # Since Supabase doesn't support easy subqueries, we use a different approach
-            if document_id:
-                # Get IDs of contradictions where either statement is in the document
-                return await self._get_count_with_document_filter(
-                    matter_id=matter_id,
-                    severity=severity,
-                    contradiction_type=contradiction_type,
-                    entity_id=entity_id,
-                    document_id=document_id,
-                )
-
             query = (
                 self.supabase.table("statement_comparisons")
                 .select("id", count="exact")
@@ -294,129 +343,12 @@ class ContradictionListService:
                 code="COUNT_FAILED",
             ) from e
 
-    async def _get_count_with_document_filter(
-        self,
-        matter_id: str,
-        severity: str | None,
-        contradiction_type: str | None,
-        entity_id: str | None,
-        document_id: str,
-    ) -> int:
-        """Get count when document filter is applied.
-
-        Uses a workaround since Supabase doesn't support easy subqueries.
-        Fetches chunk IDs for the document and filters comparisons.
-
-        Args:
-            matter_id: Matter UUID.
-            severity: Optional severity filter.
-            contradiction_type: Optional type filter.
-            entity_id: Optional entity filter.
-            document_id: Document UUID to filter by.
-
-        Returns:
-            Total count matching filters including document.
-        """
-        try:
-            # First, get all chunk IDs for the document
-            chunks_result = await asyncio.to_thread(
-                lambda: self.supabase.table("chunks")
-                .select("chunk_id")
-                .eq("document_id", document_id)
-                .execute()
-            )
-            chunk_ids = [c["chunk_id"] for c in (chunks_result.data or [])]
-
-            if not chunk_ids:
-                return 0
-
-            # Now count contradictions where either statement is in those chunks
-            # We need to do this in two queries and dedupe
-            query_a = (
-                self.supabase.table("statement_comparisons")
-                .select("id", count="exact")
-                .eq("matter_id", matter_id)
-                .eq("result", "contradiction")
-                .in_("statement_a_id", chunk_ids)
-            )
-
-            query_b = (
-                self.supabase.table("statement_comparisons")
-                .select("id", count="exact")
-                .eq("matter_id", matter_id)
-                .eq("result", "contradiction")
-                .in_("statement_b_id", chunk_ids)
-            )
-
-            # Apply other filters
-            if severity:
-                query_a = query_a.eq("severity", severity.lower())
-                query_b = query_b.eq("severity", severity.lower())
-            if contradiction_type:
-                query_a = query_a.eq("contradiction_type", contradiction_type)
-                query_b = query_b.eq("contradiction_type", contradiction_type)
-            if entity_id:
-                query_a = query_a.eq("entity_id", entity_id)
-                query_b = query_b.eq("entity_id", entity_id)
-
-            # For accurate count, we need the actual IDs to dedupe
-            # Get IDs from both
-            ids_query_a = (
-                self.supabase.table("statement_comparisons")
-                .select("id")
-                .eq("matter_id", matter_id)
-                .eq("result", "contradiction")
-                .in_("statement_a_id", chunk_ids)
-            )
-            ids_query_b = (
-                self.supabase.table("statement_comparisons")
-                .select("id")
-                .eq("matter_id", matter_id)
-                .eq("result", "contradiction")
-                .in_("statement_b_id", chunk_ids)
-            )
-
-            if severity:
-                ids_query_a = ids_query_a.eq("severity", severity.lower())
-                ids_query_b = ids_query_b.eq("severity", severity.lower())
-            if contradiction_type:
-                ids_query_a = ids_query_a.eq("contradiction_type", contradiction_type)
-                ids_query_b = ids_query_b.eq("contradiction_type", contradiction_type)
-            if entity_id:
-                ids_query_a = ids_query_a.eq("entity_id", entity_id)
-                ids_query_b = ids_query_b.eq("entity_id", entity_id)
-
-            ids_result_a = await asyncio.to_thread(lambda: ids_query_a.execute())
-            ids_result_b = await asyncio.to_thread(lambda: ids_query_b.execute())
-
-            # Combine and dedupe
-            all_ids = set()
-            for row in ids_result_a.data or []:
-                all_ids.add(row["id"])
-            for row in ids_result_b.data or []:
-                all_ids.add(row["id"])
-
-            return len(all_ids)
-
-        except Exception as e:
-            logger.error(
-                "contradiction_count_with_doc_filter_failed",
-                error=str(e),
-                matter_id=matter_id,
-                document_id=document_id,
-            )
-            raise ContradictionListServiceError(
-                f"Failed to count contradictions with document filter: {e}",
-                code="COUNT_FAILED",
-            ) from e
-
     async def _query_contradictions_with_statements(
         self,
         matter_id: str,
         severity: str | None = None,
         contradiction_type: str | None = None,
         entity_id: str | None = None,
-        document_id: str | None = None,
         sort_by: str = "severity",
         sort_order: str = "desc",
         limit: int = DEFAULT_PAGE_SIZE,
@@ -434,7 +366,6 @@ class ContradictionListService:
             severity: Optional severity filter.
             contradiction_type: Optional type filter.
             entity_id: Optional entity filter.
-            document_id: Optional document filter.
             sort_by: Sort field (severity, createdAt, entityName).
             sort_order: Sort direction.
             limit: Max results.
@@ -444,20 +375,7 @@ class ContradictionListService:
             List of contradiction dictionaries with statement data.
         """
         try:
-            # Step 1: Get contradiction IDs if document filter is applied
-            contradiction_ids: list[str] | None = None
-            if document_id:
-                contradiction_ids = await self._get_contradiction_ids_for_document(
-                    matter_id=matter_id,
-                    severity=severity,
-                    contradiction_type=contradiction_type,
-                    entity_id=entity_id,
-                    document_id=document_id,
-                )
-                if not contradiction_ids:
-                    return []
-
-            # Step 2: Build main query (no FK join - fetch entity names separately)
+            # Step 1: Build main query (no FK join - fetch entity names separately)
             query = (
                 self.supabase.table("statement_comparisons")
                 .select(
@@ -476,8 +394,6 @@ class ContradictionListService:
                 query = query.eq("contradiction_type", contradiction_type)
             if entity_id:
                 query = query.eq("entity_id", entity_id)
-            if contradiction_ids is not None:
-                query = query.in_("id", contradiction_ids)
 
             # Apply sorting (entityName sorting handled post-query since no FK join)
             desc = sort_order.lower() == "desc"
@@ -504,7 +420,7 @@ class ContradictionListService:
             if not rows:
                 return []
 
-            # Step 3: Collect all chunk IDs and entity IDs for batch lookup
+            # Step 2: Collect all chunk IDs and entity IDs for batch lookup
             chunk_ids: set[str] = set()
             entity_ids: set[str] = set()
             for row in rows:
@@ -515,13 +431,13 @@ class ContradictionListService:
                 if row.get("entity_id"):
                     entity_ids.add(row["entity_id"])
 
-            # Step 4: Batch fetch all chunks with document info
+            # Step 3: Batch fetch all chunks with document info
             chunks_map = await self._batch_get_statement_details(list(chunk_ids))
 
-            # Step 5: Batch fetch entity names
+            # Step 4: Batch fetch entity names
             entity_names_map = await self._batch_get_entity_names(list(entity_ids))
 
-            # Step 6: Build contradiction list with statement data
+            # Step 5: Build contradiction list with statement data
             contradictions: list[dict[str, Any]] = []
             for row in rows:
                 entity_id = row.get("entity_id", "")
@@ -557,75 +473,133 @@ class ContradictionListService:
                 code="QUERY_FAILED",
             ) from e
 
-    async def _get_contradiction_ids_for_document(
+    async def _query_document_contradictions(
         self,
         matter_id: str,
-        severity: str | None,
-        contradiction_type: str | None,
-        entity_id: str | None,
         document_id: str,
-    ) -> list[str]:
-        """Get contradiction IDs where either statement is from the specified document.
+        severity: str | None = None,
+        contradiction_type: str | None = None,
+        entity_id: str | None = None,
+        sort_by: str = "severity",
+        sort_order: str = "desc",
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], int, str | None]:
+        """Query one page of contradictions with a statement in a document.
+
+        The list_document_contradictions RPC joins contradictions to their
+        statement chunks server-side and returns the page together with the
+        total, so the cost does not grow with the document's chunk count.
 
         Args:
             matter_id: Matter UUID.
+            document_id: Document UUID to filter by.
             severity: Optional severity filter.
             contradiction_type: Optional type filter.
             entity_id: Optional entity filter.
-            document_id: Document UUID to filter by.
+            sort_by: Sort field (severity, createdAt, entityName).
+            sort_order: Sort direction.
+            limit: Max results.
+            offset: Pagination offset (ignored when cursor is given).
+            cursor: Keyset cursor from the previous page.
 
         Returns:
-            List of contradiction IDs matching the document filter.
+            Tuple of (contradiction dicts, total count, next page cursor).
+
+        Raises:
+            ContradictionListServiceError: If the cursor is invalid or the
+                query fails.
         """
-        # Get chunk IDs for the document
-        chunks_result = await asyncio.to_thread(
-            lambda: self.supabase.table("chunks")
-            .select("chunk_id")
-            .eq("document_id", document_id)
-            .execute()
-        )
-        chunk_ids = [c["chunk_id"] for c in (chunks_result.data or [])]
+        if sort_by in SORT_FIELDS:
+            descending = sort_order.lower() == "desc"
+        else:
+            # Default sorting
+            sort_by, descending = "severity", True
+
+        params: dict[str, Any] = {
+            "p_matter_id": matter_id,
+            "p_document_id": document_id,
+            "p_severity": severity.lower() if severity else None,
+            "p_contradiction_type": contradiction_type,
+            "p_entity_id": entity_id,
+            "p_sort_by": sort_by,
+            "p_descending": descending,
+            # One extra row tells us whether there is a next page
+            "p_limit": limit + 1,
+            "p_offset": offset,
+        }
+        if cursor:
+            sort_key, created_at, row_id = _decode_cursor(cursor)
+            params.update(
+                p_after_sort_key=sort_key,
+                p_after_created_at=created_at,
+                p_after_id=row_id,
+            )
 
-        if not chunk_ids:
-            return []
-
-        # Get contradictions where statement_a or statement_b is in those chunks
-        ids_query_a = (
-            self.supabase.table("statement_comparisons")
-            .select("id")
-            .eq("matter_id", matter_id)
-            .eq("result", "contradiction")
-            .in_("statement_a_id", chunk_ids)
-        )
-        ids_query_b = (
-            self.supabase.table("statement_comparisons")
-            .select("id")
-            .eq("matter_id", matter_id)
-            .eq("result", "contradiction")
-            .in_("statement_b_id", chunk_ids)
-        )
+        try:
+            result = await asyncio.to_thread(
+                lambda: self.supabase.rpc(
+                    "list_document_contradictions", params
+                ).execute()
+            )
+        except Exception as e:
+            logger.error(
+                "contradiction_query_with_doc_filter_failed",
+                error=str(e),
+                matter_id=matter_id,
+                document_id=document_id,
+            )
+            raise ContradictionListServiceError(
+                f"Failed to query contradictions with document filter: {e}",
+                code="QUERY_FAILED",
+            ) from e
 
-        if severity:
-            ids_query_a = ids_query_a.eq("severity", severity.lower())
-            ids_query_b = ids_query_b.eq("severity", severity.lower())
-        if contradiction_type:
-            ids_query_a = ids_query_a.eq("contradiction_type", contradiction_type)
-            ids_query_b = ids_query_b.eq("contradiction_type", contradiction_type)
-        if entity_id:
-            ids_query_a = ids_query_a.eq("entity_id", entity_id)
-            ids_query_b = ids_query_b.eq("entity_id", entity_id)
-
-        ids_result_a = await asyncio.to_thread(lambda: ids_query_a.execute())
-        ids_result_b = await asyncio.to_thread(lambda: ids_query_b.execute())
-
-        # Combine and dedupe
-        all_ids: set[str] = set()
-        for row in ids_result_a.data or []:
-            all_ids.add(row["id"])
-        for row in ids_result_b.data or []:
-            all_ids.add(row["id"])
-
-        return list(all_ids)
+        rows = result.data or []
+        total = int(rows[0].get("total_count") or 0) if rows else 0
+        # An empty page comes back as one row carrying only the total
+        rows = [row for row in rows if row.get("id")]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1])
+
+        contradictions = [
+            {
+                "id": row["id"],
+                "entity_id": row.get("entity_id", ""),
+                "entity_name": row.get("entity_name") or "Unknown",
+                "contradiction_type": row.get("contradiction_type"),
+                "severity": row.get("severity"),
+                "explanation": row.get("explanation") or "",
+                "confidence": row.get("confidence") or 0.0,
+                "evidence": row.get("evidence"),
+                "created_at": row.get("created_at"),
+                "statement_a": self._statement_from_row(row, "statement_a"),
+                "statement_b": self._statement_from_row(row, "statement_b"),
+            }
+            for row in rows
+        ]
+
+        return contradictions, total, next_cursor
+
+    def _statement_from_row(
+        self,
+        row: dict[str, Any],
+        prefix: str,
+    ) -> dict[str, Any] | None:
+        """Build statement details from prefixed list_document_contradictions columns."""
+        chunk_id = row.get(f"{prefix}_id")
+        if not chunk_id or row.get(f"{prefix}_document_id") is None:
+            return None
+        return {
+            "chunk_id": chunk_id,
+            "content": row.get(f"{prefix}_content") or "",
+            "page_number": row.get(f"{prefix}_page"),
+            "document_id": row.get(f"{prefix}_document_id"),
+            "document_name": row.get(f"{prefix}_document_name") or "Unknown",
+        }
 
     async def _batch_get_statement_details(
         self,
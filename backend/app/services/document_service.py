@@ -19,6 +19,7 @@ from app.models.document import (
     PaginationMeta,
     UploadedDocument,
 )
+from app.services.pdf_manifest import PDFManifest
 from app.services.supabase.client import get_supabase_client
 from app.services.storage_service import get_storage_service, StorageError
 from app.engines.citation.abbreviations import normalize_act_name
@@ -48,6 +49,24 @@ DOCUMENT_LIST_SELECT_FIELDS = (
     "ocr_confidence, ocr_quality_status"
 )
 
+# Fields for Document reads - must match _parse_document(). Excludes the large
+# extracted_text column (can be megabytes); extracted_text_length tells callers
+# whether text exists without transferring it. Use get_document_text() or
+# include_text=True when the text itself is needed.
+DOCUMENT_SELECT_FIELDS = (
+    "id, matter_id, filename, storage_path, file_size, page_count, document_type, "
+    "is_reference_material, source, uploaded_by, uploaded_at, india_code_url, "
+    "status, processing_started_at, processing_completed_at, extracted_text_length, "
+    "ocr_confidence, ocr_quality_score, ocr_confidence_per_page, ocr_quality_status, "
+    "ocr_error, created_at, updated_at"
+)
+
+DOCUMENT_WITH_TEXT_SELECT_FIELDS = f"{DOCUMENT_SELECT_FIELDS}, extracted_text"
+
+# Rows per request when assembling page text from bounding boxes
+# (PostgREST caps responses at 1000 rows by default)
+PAGE_TEXT_BATCH_SIZE = 1000
+
 
 class DocumentServiceError(Exception):
     """Base exception for document service operations."""
@@ -182,11 +201,14 @@ class DocumentService:
                 code="CREATE_FAILED"
             ) from e
 
-    def get_document(self, document_id: str) -> Document:
+    def get_document(self, document_id: str, include_text: bool = False) -> Document:
         """Get a document by ID.
 
         Args:
             document_id: Document UUID.
+            include_text: If True, also loads extracted_text. Default False
+                          so metadata reads (status polling, access checks)
+                          don't transfer the full OCR text.
 
         Returns:
             Document record including OCR fields if available.
@@ -202,7 +224,8 @@ class DocumentService:
             )
 
         try:
-            result = self.client.table("documents").select("*").eq(
+            columns = DOCUMENT_WITH_TEXT_SELECT_FIELDS if include_text else DOCUMENT_SELECT_FIELDS
+            result = self.client.table("documents").select(columns).eq(
                 "id", document_id
             ).execute()
 
@@ -243,11 +266,11 @@ class DocumentService:
             )
 
         try:
-            result = self.client.table("documents").select("*").eq(
+            result = self.client.table("documents").select(DOCUMENT_SELECT_FIELDS).eq(
                 "matter_id", matter_id
             ).order("created_at", desc=True).execute()
 
-            return [self._to_document(doc) for doc in result.data]
+            return [self._parse_document(doc) for doc in result.data]
 
         except Exception as e:
             logger.error(
@@ -384,6 +407,146 @@ class DocumentService:
                 code="LIST_FAILED"
             ) from e
 
+    def get_document_text(
+        self,
+        document_id: str,
+        page_start: int | None = None,
+        page_end: int | None = None,
+    ) -> str | None:
+        """Get a document's extracted text, optionally for a page range only.
+
+        Without a page range this loads documents.extracted_text alone. With
+        a range the text is assembled from the per-page bounding box store,
+        so only those pages are transferred.
+
+        Args:
+            document_id: Document UUID.
+            page_start: First page (1-indexed, inclusive). None for page 1.
+            page_end: Last page (inclusive). None for the last page.
+
+        Returns:
+            Extracted text, or None if the document has no text yet.
+
+        Raises:
+            DocumentNotFoundError: If document doesn't exist.
+            DocumentServiceError: If query fails.
+        """
+        if page_start is not None or page_end is not None:
+            pages = self.get_page_texts(document_id, page_start, page_end)
+            return "\n\n".join(pages[page] for page in sorted(pages)) or None
+
+        if self.client is None:
+            raise DocumentServiceError(
+                message="Database client not configured",
+                code="DATABASE_NOT_CONFIGURED"
+            )
+
+        try:
+            result = self.client.table("documents").select("extracted_text").eq(
+                "id", document_id
+            ).execute()
+
+            if not result.data:
+                raise DocumentNotFoundError(document_id)
+
+            return result.data[0].get("extracted_text")
+
+        except DocumentNotFoundError:
+            raise
+        except Exception as e:
+            logger.error(
+                "document_text_get_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+            raise DocumentServiceError(
+                message=f"Failed to get document text: {e!s}",
+                code="GET_TEXT_FAILED"
+            ) from e
+
+    def get_page_texts(
+        self,
+        document_id: str,
+        page_start: int | None = None,
+        page_end: int | None = None,
+    ) -> dict[int, str]:
+        """Get OCR text per page from the bounding box store.
+
+        Bounding box text on a page is joined in reading order, the same way
+        fix_missing_extracted_text rebuilds extracted_text.
+
+        Args:
+            document_id: Document UUID.
+            page_start: First page (1-indexed, inclusive). None for page 1.
+            page_end: Last page (inclusive). None for the last page.
+
+        Returns:
+            Mapping of page number to page text. Pages without text are omitted.
+
+        Raises:
+            DocumentServiceError: If query fails.
+        """
+        if self.client is None:
+            raise DocumentServiceError(
+                message="Database client not configured",
+                code="DATABASE_NOT_CONFIGURED"
+            )
+
+        try:
+            texts_by_page: dict[int, list[str]] = {}
+            offset = 0
+
+            while True:
+                query = self.client.table("bounding_boxes").select(
+                    "page_number, text"
+                ).eq("document_id", document_id)
+                if page_start is not None:
+                    query = query.gte("page_number", page_start)
+                if page_end is not None:
+                    query = query.lte("page_number", page_end)
+
+                # id breaks reading-order ties so range() batches neither
+                # skip nor repeat rows
+                result = (
+                    query.order("page_number")
+                    .order("reading_order_index", nullsfirst=False)
+                    .order("id")
+                    .range(offset, offset + PAGE_TEXT_BATCH_SIZE - 1)
+                    .execute()
+                )
+
+                rows = result.data or []
+                for row in rows:
+                    if row.get("text"):
+                        texts_by_page.setdefault(row["page_number"], []).append(row["text"])
+
+                if len(rows) < PAGE_TEXT_BATCH_SIZE:
+                    break
+                offset += PAGE_TEXT_BATCH_SIZE
+
+            logger.debug(
+                "document_page_texts_retrieved",
+                document_id=document_id,
+                page_start=page_start,
+                page_end=page_end,
+                pages=len(texts_by_page),
+            )
+
+            return {page: " ".join(texts) for page, texts in texts_by_page.items()}
+
+        except Exception as e:
+            logger.error(
+                "document_page_texts_get_failed",
+                document_id=document_id,
+                page_start=page_start,
+                page_end=page_end,
+                error=str(e),
+            )
+            raise DocumentServiceError(
+                message=f"Failed to get page text: {e!s}",
+                code="GET_TEXT_FAILED"
+            ) from e
+
     def update_document(
         self,
         document_id: str,
@@ -439,7 +602,7 @@ class DocumentService:
         try:
             result = self.client.table("documents").update(
                 update_data
-            ).eq("id", document_id).execute()
+            ).eq("id", document_id).select(DOCUMENT_SELECT_FIELDS).execute()
 
             if not result.data:
                 raise DocumentServiceError(
@@ -455,7 +618,7 @@ class DocumentService:
                 updated_fields=list(update_data.keys()),
             )
 
-            return self._to_document(doc_data)
+            return self._parse_document(doc_data)
 
         except DocumentNotFoundError:
             raise
@@ -681,7 +844,7 @@ class DocumentService:
             ) from e
 
     def _invalidate_summary_cache(self, matter_id: str) -> None:
-        """Invalidate the summary cache for a matter.
+        """Invalidate the summary cache for a matter and schedule a rebuild.
 
         Args:
             matter_id: Matter UUID.
@@ -709,6 +872,11 @@ class DocumentService:
                 error=str(e),
             )
 
+        # Rebuild the stored summary without the deleted document
+        from app.workers.tasks.summary_tasks import schedule_summary_precompute
+
+        schedule_summary_precompute(matter_id)
+
     def cascade_soft_delete_related_data(self, document_id: str) -> dict:
         """Soft-delete or clean up data related to a soft-deleted document.
 
@@ -822,6 +990,7 @@ class DocumentService:
                 doc_data.get("processing_completed_at")
             ),
             extracted_text=doc_data.get("extracted_text"),
+            extracted_text_length=doc_data.get("extracted_text_length"),
             ocr_confidence=doc_data.get("ocr_confidence"),
             ocr_quality_score=doc_data.get("ocr_quality_score"),
             ocr_confidence_per_page=doc_data.get("ocr_confidence_per_page"),
@@ -1082,6 +1251,82 @@ class DocumentService:
                 code="GET_FOR_PROCESSING_FAILED"
             ) from e
 
+    def save_pdf_manifest(
+        self,
+        document_id: str,
+        matter_id: str,
+        manifest: PDFManifest,
+    ) -> bool:
+        """Persist the parse-once PDF manifest for a document.
+
+        Failures are logged, not raised: consumers fall back to parsing the
+        PDF when no manifest is stored.
+
+        Args:
+            document_id: Document UUID.
+            matter_id: Matter UUID (isolation).
+            manifest: Manifest built from the document's PDF.
+
+        Returns:
+            True if the manifest was stored.
+        """
+        if self.client is None:
+            return False
+
+        try:
+            self.client.table("document_pdf_manifests").upsert({
+                "document_id": document_id,
+                "matter_id": matter_id,
+                "version": manifest.version,
+                "page_count": manifest.page_count,
+                "file_size": manifest.file_size,
+                "manifest": manifest.to_dict(),
+            }, on_conflict="document_id").execute()
+
+            logger.info(
+                "document_pdf_manifest_saved",
+                document_id=document_id,
+                page_count=manifest.page_count,
+            )
+            return True
+
+        except Exception as e:
+            logger.warning(
+                "document_pdf_manifest_save_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+            return False
+
+    def get_pdf_manifest(self, document_id: str) -> PDFManifest | None:
+        """Get the stored PDF manifest for a document.
+
+        Args:
+            document_id: Document UUID.
+
+        Returns:
+            PDFManifest, or None if none is stored or it can't be read.
+        """
+        if self.client is None:
+            return None
+
+        try:
+            result = self.client.table("document_pdf_manifests").select(
+                "manifest"
+            ).eq("document_id", document_id).execute()
+
+            if not result.data:
+                return None
+            return PDFManifest.from_dict(result.data[0].get("manifest"))
+
+        except Exception as e:
+            logger.warning(
+                "document_pdf_manifest_get_failed",
+                document_id=document_id,
+                error=str(e),
+            )
+            return None
+
     def get_pending_documents_for_matter(self, matter_id: str) -> list[dict]:
         """Get pending documents with page counts for ETA calculation.
 
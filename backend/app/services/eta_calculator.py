@@ -76,7 +76,7 @@ class ETACalculator:
 
     Pre-mortem fixes:
     - Weight by page count, not just document count
-    - Query real workers via Celery inspect
+    - Count real workers from the worker heartbeat registry
     - Return confidence ranges (min/max/best)
     """
 
@@ -114,26 +114,21 @@ class ETACalculator:
 
         Story 5.7: Pre-mortem fix - Query real workers, not config value.
 
-        Uses QueueMetricsService if available, otherwise uses Celery inspect.
+        Reads the worker heartbeat registry through QueueMetricsService
+        (cached snapshot), never a Celery inspect() broadcast.
 
         Returns:
             Number of active workers, or fallback value if unable to determine.
         """
-        # Try queue metrics service first
-        if self._queue_metrics_service is not None:
-            try:
-                return await self._queue_metrics_service.get_active_worker_count()
-            except Exception:
-                pass
-
-        # Fallback to Celery inspect
         try:
-            from app.workers.celery import celery_app
-
-            inspector = celery_app.control.inspect()
-            active = inspector.active()
-            if active:
-                return len(active)
+            service = self._queue_metrics_service
+            if service is None:
+                from app.services.queue_metrics_service import (
+                    get_queue_metrics_service,
+                )
+
+                service = get_queue_metrics_service()
+            return await service.get_active_worker_count()
         except Exception as e:
             logger.warning("eta_worker_count_failed", error=str(e))
 
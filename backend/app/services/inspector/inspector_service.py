@@ -6,6 +6,7 @@ Wraps search services to capture detailed timing and scoring information.
 
 from __future__ import annotations
 
+import asyncio
 import time
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
@@ -18,7 +19,10 @@ from app.models.inspector import (
     SearchDebugInfo,
     TimingBreakdown,
 )
-from app.services.rag.embedder import get_embedding_service
+from app.services.rag.embedder import (
+    get_current_embedding_model_version,
+    get_embedding_service,
+)
 from app.services.rag.hybrid_search import (
     HybridSearchService,
     SearchWeights,
@@ -109,6 +113,7 @@ class InspectorService:
             "embedding_ms": None,
             "bm25_search_ms": None,
             "semantic_search_ms": None,
+            "retrieval_ms": None,
             "rrf_fusion_ms": None,
             "rerank_ms": None,
         }
@@ -122,23 +127,35 @@ class InspectorService:
             # For now, pass through
             pass
 
-        # Step 2: Generate embedding (with timing)
-        embedding_start = time.perf_counter()
-        embedder = get_embedding_service()
-        query_embedding = await embedder.embed_text(query)
-        timing["embedding_ms"] = (time.perf_counter() - embedding_start) * 1000
-
-        # Step 3: Execute BM25 search (with timing)
-        bm25_start = time.perf_counter()
-        bm25_results = await self._execute_bm25_search(query, matter_id, limit)
-        timing["bm25_search_ms"] = (time.perf_counter() - bm25_start) * 1000
-
-        # Step 4: Execute semantic search (with timing)
-        semantic_start = time.perf_counter()
-        semantic_results = await self._execute_semantic_search(
-            query_embedding, matter_id, limit
+        # Steps 2-4: BM25 starts immediately and runs concurrently with
+        # embedding; the semantic leg starts as soon as the vector is ready.
+        # Each leg records its own timing.
+        retrieval_start = time.perf_counter()
+
+        async def _timed_bm25() -> list[dict[str, Any]]:
+            bm25_start = time.perf_counter()
+            results = await self._execute_bm25_search(query, matter_id, limit)
+            timing["bm25_search_ms"] = (time.perf_counter() - bm25_start) * 1000
+            return results
+
+        async def _timed_embed_then_semantic() -> list[dict[str, Any]]:
+            embedding_start = time.perf_counter()
+            embedder = get_embedding_service()
+            query_embedding = await embedder.embed_text(query)
+            timing["embedding_ms"] = (time.perf_counter() - embedding_start) * 1000
+
+            semantic_start = time.perf_counter()
+            results = await self._execute_semantic_search(
+                query_embedding, matter_id, limit
+            )
+            timing["semantic_search_ms"] = (time.perf_counter() - semantic_start) * 1000
+            return results
+
+        bm25_results, semantic_results = await asyncio.gather(
+            _timed_bm25(),
+            _timed_embed_then_semantic(),
         )
-        timing["semantic_search_ms"] = (time.perf_counter() - semantic_start) * 1000
+        timing["retrieval_ms"] = (time.perf_counter() - retrieval_start) * 1000
 
         # Step 5: RRF fusion (with timing)
         fusion_start = time.perf_counter()
@@ -219,6 +236,7 @@ class InspectorService:
                 embedding_ms=timing["embedding_ms"],
                 bm25_search_ms=timing["bm25_search_ms"],
                 semantic_search_ms=timing["semantic_search_ms"],
+                retrieval_ms=timing["retrieval_ms"],
                 rrf_fusion_ms=timing["rrf_fusion_ms"],
                 rerank_ms=timing["rerank_ms"],
                 total_ms=total_ms,
@@ -284,14 +302,17 @@ class InspectorService:
             if supabase is None:
                 return []
 
-            response = supabase.rpc(
-                "bm25_search_chunks",
-                {
-                    "query_text": query,
-                    "filter_matter_id": matter_id,
-                    "match_count": limit,
-                }
-            ).execute()
+            def _query():
+                return supabase.rpc(
+                    "bm25_search_chunks",
+                    {
+                        "query_text": query,
+                        "filter_matter_id": matter_id,
+                        "match_count": limit,
+                    }
+                ).execute()
+
+            response = await asyncio.to_thread(_query)
 
             if not response.data:
                 return []
@@ -324,14 +345,18 @@ class InspectorService:
             if supabase is None:
                 return []
 
-            response = supabase.rpc(
-                "semantic_search_chunks",
-                {
-                    "query_embedding": embedding,
-                    "filter_matter_id": matter_id,
-                    "match_count": limit,
-                }
-            ).execute()
+            def _query():
+                return supabase.rpc(
+                    "semantic_leg_search_chunks",
+                    {
+                        "query_embedding": embedding,
+                        "filter_matter_id": matter_id,
+                        "match_count": limit,
+                        "filter_model_version": get_current_embedding_model_version(),
+                    }
+                ).execute()
+
+            response = await asyncio.to_thread(_query)
 
             if not response.data:
                 return []
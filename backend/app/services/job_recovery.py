@@ -403,14 +403,23 @@ class JobRecoveryService:
                     "job_id": job_id,
                 }
 
-            # Get page count from the PDF
+            # Get page count from the stored PDF manifest, parsing the PDF
+            # only when the document has none
+            from app.services.document_service import get_document_service
+            from app.services.pdf_blob_cache import open_storage_pdf
             from app.services.storage_service import get_storage_service
-            storage_service = get_storage_service()
-            pdf_bytes = storage_service.download_file(storage_path)
-            reader = pypdf.PdfReader(BytesIO(pdf_bytes))
-            page_count = len(reader.pages)
-            del reader
-            del pdf_bytes
+
+            manifest = get_document_service().get_pdf_manifest(document_id)
+            if manifest is not None:
+                page_count = manifest.page_count
+            else:
+                storage_service = get_storage_service()
+                with open_storage_pdf(storage_service, storage_path) as pdf_view:
+                    reader = pypdf.PdfReader(
+                        BytesIO(pdf_view) if isinstance(pdf_view, bytes) else pdf_view
+                    )
+                    page_count = len(reader.pages)
+                    del reader
 
             # Create chunk records
             from app.services.pdf_router import CHUNK_SIZE
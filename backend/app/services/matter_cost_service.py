@@ -5,7 +5,7 @@ Story 7.1: Per-Matter Cost Tracking Widget
 Provides cost aggregation and summary functionality for individual matters.
 """
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from functools import lru_cache
 from typing import Any
 
@@ -14,7 +14,9 @@ import structlog
 from app.models.cost import (
     CostByOperation,
     CostByProvider,
+    CostRecord,
     DailyCost,
+    MatterCostRecordsPage,
     MatterCostSummary,
 )
 from app.services.supabase.client import get_service_client
@@ -29,6 +31,9 @@ class MatterCostService:
     - Total LLM cost for this matter
     - Costs broken down by: embedding, analysis, Q&A
     - Daily and weekly rollups available
+
+    Summaries read llm_cost_rollups; raw llm_costs rows are only read for
+    drill-down (get_matter_cost_records).
     """
 
     def __init__(self, supabase_client: Any):
@@ -46,6 +51,11 @@ class MatterCostService:
     ) -> MatterCostSummary:
         """Get cost summary for a specific matter.
 
+        Reads the per-day llm_cost_rollups (maintained by trigger on
+        llm_costs), so latency depends on the period length rather than on
+        how many cost rows the matter has accumulated. The period and weekly
+        totals are bucketed by UTC day.
+
         Note: This method is synchronous because the Supabase client
         uses synchronous HTTP calls. The API endpoint wraps this in
         run_in_executor if needed for async compatibility.
@@ -59,24 +69,26 @@ class MatterCostService:
         """
         logger.info("fetching_matter_costs", matter_id=matter_id, days=days)
 
-        start_date = datetime.now(timezone.utc) - timedelta(days=days)
-        seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+        today = datetime.now(timezone.utc).date()
+        start_date = today - timedelta(days=days)
+        seven_days_ago = (today - timedelta(days=7)).isoformat()
 
-        # Fetch all cost records for this matter in the period
+        # Fetch the daily rollups for this matter in the period
         result = (
-            self.supabase.table("llm_costs")
+            self.supabase.table("llm_cost_rollups")
             .select(
-                "provider, operation, input_tokens, output_tokens, "
-                "total_cost_inr, total_cost_usd, created_at"
+                "cost_date, operation_category, provider, input_tokens, "
+                "output_tokens, total_cost_inr, total_cost_usd, operation_count, "
+                "cost_avoided_inr, cost_avoided_usd"
             )
             .eq("matter_id", matter_id)
-            .gte("created_at", start_date.isoformat())
+            .gte("cost_date", start_date.isoformat())
             .execute()
         )
 
-        records = result.data or []
+        rollups = result.data or []
 
-        if not records:
+        if not rollups:
             logger.debug("no_costs_found", matter_id=matter_id)
             return MatterCostSummary(
                 matter_id=matter_id,
@@ -98,6 +110,9 @@ class MatterCostService:
         total_cost_usd = 0.0
         total_input_tokens = 0
         total_output_tokens = 0
+        total_operations = 0
+        cost_avoided_inr = 0.0
+        cost_avoided_usd = 0.0
 
         # Aggregation dictionaries
         by_operation: dict[str, dict[str, Any]] = {}
@@ -106,67 +121,51 @@ class MatterCostService:
         weekly_cost_inr = 0.0
         weekly_cost_usd = 0.0
 
-        for row in records:
+        for row in rollups:
             cost_inr = float(row.get("total_cost_inr") or 0)
             cost_usd = float(row.get("total_cost_usd") or 0)
-            input_tok = row.get("input_tokens") or 0
-            output_tok = row.get("output_tokens") or 0
-            operation = self._normalize_operation(row.get("operation", "unknown"))
+            input_tok = int(row.get("input_tokens") or 0)
+            output_tok = int(row.get("output_tokens") or 0)
+            count = int(row.get("operation_count") or 0)
+            operation = row.get("operation_category") or "Unknown"
             provider = row.get("provider", "unknown")
-            created_at = row.get("created_at", "")
+            cost_date = str(row.get("cost_date") or "")[:10]  # YYYY-MM-DD
 
             # Totals
             total_cost_inr += cost_inr
             total_cost_usd += cost_usd
             total_input_tokens += input_tok
             total_output_tokens += output_tok
-
-            # By operation
-            if operation not in by_operation:
-                by_operation[operation] = {
-                    "cost_inr": 0.0,
-                    "cost_usd": 0.0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "count": 0,
-                }
-            by_operation[operation]["cost_inr"] += cost_inr
-            by_operation[operation]["cost_usd"] += cost_usd
-            by_operation[operation]["input_tokens"] += input_tok
-            by_operation[operation]["output_tokens"] += output_tok
-            by_operation[operation]["count"] += 1
-
-            # By provider
-            if provider not in by_provider:
-                by_provider[provider] = {
-                    "cost_inr": 0.0,
-                    "cost_usd": 0.0,
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "count": 0,
-                }
-            by_provider[provider]["cost_inr"] += cost_inr
-            by_provider[provider]["cost_usd"] += cost_usd
-            by_provider[provider]["input_tokens"] += input_tok
-            by_provider[provider]["output_tokens"] += output_tok
-            by_provider[provider]["count"] += 1
-
-            # By date (for last 7 days only)
-            if created_at:
-                record_date = created_at[:10]  # YYYY-MM-DD
-                if record_date not in by_date:
-                    by_date[record_date] = {"cost_inr": 0.0, "cost_usd": 0.0}
-                by_date[record_date]["cost_inr"] += cost_inr
-                by_date[record_date]["cost_usd"] += cost_usd
-
-                # Weekly totals
-                try:
-                    record_dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    if record_dt >= seven_days_ago:
-                        weekly_cost_inr += cost_inr
-                        weekly_cost_usd += cost_usd
-                except (ValueError, TypeError):
-                    pass
+            total_operations += count
+            cost_avoided_inr += float(row.get("cost_avoided_inr") or 0)
+            cost_avoided_usd += float(row.get("cost_avoided_usd") or 0)
+
+            for key, buckets in ((operation, by_operation), (provider, by_provider)):
+                if key not in buckets:
+                    buckets[key] = {
+                        "cost_inr": 0.0,
+                        "cost_usd": 0.0,
+                        "input_tokens": 0,
+                        "output_tokens": 0,
+                        "count": 0,
+                    }
+                buckets[key]["cost_inr"] += cost_inr
+                buckets[key]["cost_usd"] += cost_usd
+                buckets[key]["input_tokens"] += input_tok
+                buckets[key]["output_tokens"] += output_tok
+                buckets[key]["count"] += count
+
+            # By date
+            if cost_date:
+                if cost_date not in by_date:
+                    by_date[cost_date] = {"cost_inr": 0.0, "cost_usd": 0.0}
+                by_date[cost_date]["cost_inr"] += cost_inr
+                by_date[cost_date]["cost_usd"] += cost_usd
+
+                # Weekly totals (ISO dates compare lexicographically)
+                if cost_date >= seven_days_ago:
+                    weekly_cost_inr += cost_inr
+                    weekly_cost_usd += cost_usd
 
         # Build response models
         operation_list = [
@@ -201,18 +200,19 @@ class MatterCostService:
         seven_day_dates = sorted(by_date.keys(), reverse=True)[:7]
         daily_list = [
             DailyCost(
-                date=date,
-                cost_inr=round(by_date[date]["cost_inr"], 2),
-                cost_usd=round(by_date[date]["cost_usd"], 6),
+                date=day,
+                cost_inr=round(by_date[day]["cost_inr"], 2),
+                cost_usd=round(by_date[day]["cost_usd"], 6),
             )
-            for date in seven_day_dates
+            for day in seven_day_dates
         ]
 
         logger.info(
             "matter_costs_aggregated",
             matter_id=matter_id,
             total_cost_inr=round(total_cost_inr, 2),
-            operation_count=len(records),
+            operation_count=total_operations,
+            rollup_rows=len(rollups),
             providers=list(by_provider.keys()),
         )
 
@@ -223,18 +223,95 @@ class MatterCostService:
             total_cost_usd=round(total_cost_usd, 6),
             total_input_tokens=total_input_tokens,
             total_output_tokens=total_output_tokens,
-            operation_count=len(records),
+            operation_count=total_operations,
             by_operation=operation_list,
             by_provider=provider_list,
             daily_costs=daily_list,
             weekly_cost_inr=round(weekly_cost_inr, 2),
             weekly_cost_usd=round(weekly_cost_usd, 6),
+            cost_avoided_inr=round(cost_avoided_inr, 2),
+            cost_avoided_usd=round(cost_avoided_usd, 6),
         )
 
+    def get_matter_cost_records(
+        self,
+        matter_id: str,
+        cost_date: str | None = None,
+        provider: str | None = None,
+        days: int = 30,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> MatterCostRecordsPage:
+        """Get raw cost records for drill-down, newest first.
+
+        Only used when a user expands a rollup; the summary never reads raw
+        rows.
+
+        Args:
+            matter_id: Matter UUID to query.
+            cost_date: Optional UTC day (YYYY-MM-DD) to restrict to.
+            provider: Optional provider to restrict to.
+            days: Period when no cost_date is given (default 30).
+            limit: Maximum records to return.
+            offset: Records to skip.
+
+        Returns:
+            MatterCostRecordsPage with the records and whether more exist.
+        """
+        query = (
+            self.supabase.table("llm_costs")
+            .select(
+                "id, document_id, provider, operation, input_tokens, "
+                "output_tokens, total_cost_inr, total_cost_usd, created_at"
+            )
+            .eq("matter_id", matter_id)
+        )
+
+        if cost_date:
+            day = date.fromisoformat(cost_date)
+            query = query.gte("created_at", f"{day.isoformat()}T00:00:00+00:00").lt(
+                "created_at", f"{(day + timedelta(days=1)).isoformat()}T00:00:00+00:00"
+            )
+        else:
+            start = datetime.now(timezone.utc) - timedelta(days=days)
+            query = query.gte("created_at", start.isoformat())
+        if provider:
+            query = query.eq("provider", provider)
+
+        # Fetch one extra row to know whether there is another page
+        result = (
+            query.order("created_at", desc=True)
+            .range(offset, offset + limit)
+            .execute()
+        )
+        rows = result.data or []
+
+        records = [
+            CostRecord(
+                id=row["id"],
+                document_id=row.get("document_id"),
+                provider=row.get("provider", "unknown"),
+                operation=row.get("operation", "unknown"),
+                operation_category=self._normalize_operation(
+                    row.get("operation", "unknown")
+                ),
+                input_tokens=row.get("input_tokens") or 0,
+                output_tokens=row.get("output_tokens") or 0,
+                cost_inr=round(float(row.get("total_cost_inr") or 0), 4),
+                cost_usd=round(float(row.get("total_cost_usd") or 0), 8),
+                created_at=row.get("created_at") or "",
+            )
+            for row in rows[:limit]
+        ]
+
+        return MatterCostRecordsPage(records=records, has_more=len(rows) > limit)
+
     def _normalize_operation(self, operation: str) -> str:
         """Normalize operation names for display.
 
         Groups similar operations into user-friendly categories.
+        Rollups are bucketed by the SQL mirror of this function,
+        normalize_cost_operation; keep the two in sync.
 
         Args:
             operation: Raw operation name from database.
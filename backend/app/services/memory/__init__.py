@@ -62,6 +62,7 @@ from app.services.memory.query_normalizer import (
     reset_query_normalizer,
 )
 from app.services.memory.redis_client import (
+    create_redis_client,
     get_redis_client,
     reset_redis_client,
 )
@@ -107,6 +108,7 @@ __all__ = [
     "matter_pattern",
     "embedding_cache_key",
     # Redis client (Story 7-1)
+    "create_redis_client",
     "get_redis_client",
     "reset_redis_client",
     # Session memory service (Story 7-1, 7-2)
@@ -0,0 +1,170 @@
+"""Per-matter cache generation counters.
+
+Matter caches (query cache, timeline cache) embed a generation number in
+every key. Invalidating all of a matter's entries in a namespace is then a
+single INCR of the counter instead of a SCAN over the whole keyspace; the
+orphaned entries of older generations simply expire by their TTL.
+
+Generations are read on every cache get/set, so each process keeps them in
+a small in-process TTL cache. The process that bumps a generation sees the
+new value immediately; other processes pick it up within
+GENERATION_LOCAL_TTL seconds.
+
+CRITICAL: Counters are scoped by matter_id (Layer 3 isolation).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import structlog
+
+from app.services.memory.redis_keys import (
+    GENERATION_TTL,
+    CacheNamespace,
+    generation_key,
+)
+
+logger = structlog.get_logger(__name__)
+
+# How long a process trusts its copy of a generation number
+GENERATION_LOCAL_TTL = 2.0  # seconds
+
+
+class CacheGenerations:
+    """Reads and bumps per-matter cache generations with local memoization.
+
+    Provides async methods for redis.asyncio clients and *_sync variants for
+    the synchronous redis client.
+
+    Example:
+        >>> generations = CacheGenerations()
+        >>> gen = await generations.current(redis, matter_id, "query")
+        >>> key = cache_key(matter_id, query_hash, generation=gen)
+        >>> await generations.bump(redis, matter_id, "query")  # invalidate
+    """
+
+    def __init__(self, local_ttl: float = GENERATION_LOCAL_TTL) -> None:
+        """Initialize generation tracking.
+
+        Args:
+            local_ttl: Seconds a fetched generation is reused in-process.
+        """
+        self.local_ttl = local_ttl
+        self._local: dict[str, tuple[int, float]] = {}
+
+    # =========================================================================
+    # Async Client
+    # =========================================================================
+
+    async def current(
+        self,
+        redis: Any,
+        matter_id: str,
+        namespace: CacheNamespace,
+    ) -> int:
+        """Get the matter's current generation for a namespace.
+
+        Args:
+            redis: redis.asyncio client.
+            matter_id: Matter UUID.
+            namespace: Cache namespace.
+
+        Returns:
+            Current generation (0 if never bumped).
+        """
+        key = generation_key(matter_id, namespace)
+        cached = self._get_local(key)
+        if cached is not None:
+            return cached
+
+        generation = _parse_generation(await redis.get(key), key)
+        self._set_local(key, generation)
+        return generation
+
+    async def bump(
+        self,
+        redis: Any,
+        matter_id: str,
+        namespace: CacheNamespace,
+    ) -> int:
+        """Invalidate every entry of the namespace for the matter (O(1)).
+
+        Args:
+            redis: redis.asyncio client.
+            matter_id: Matter UUID.
+            namespace: Cache namespace.
+
+        Returns:
+            The new generation.
+        """
+        key = generation_key(matter_id, namespace)
+        generation = int(await redis.incr(key))
+        await redis.expire(key, GENERATION_TTL)
+        self._set_local(key, generation)
+        return generation
+
+    # =========================================================================
+    # Sync Client
+    # =========================================================================
+
+    def current_sync(
+        self,
+        redis: Any,
+        matter_id: str,
+        namespace: CacheNamespace,
+    ) -> int:
+        """Synchronous version of current() for the sync redis client."""
+        key = generation_key(matter_id, namespace)
+        cached = self._get_local(key)
+        if cached is not None:
+            return cached
+
+        generation = _parse_generation(redis.get(key), key)
+        self._set_local(key, generation)
+        return generation
+
+    def bump_sync(
+        self,
+        redis: Any,
+        matter_id: str,
+        namespace: CacheNamespace,
+    ) -> int:
+        """Synchronous version of bump() for the sync redis client."""
+        key = generation_key(matter_id, namespace)
+        generation = int(redis.incr(key))
+        redis.expire(key, GENERATION_TTL)
+        self._set_local(key, generation)
+        return generation
+
+    # =========================================================================
+    # Local Memoization
+    # =========================================================================
+
+    def forget(self, matter_id: str, namespace: CacheNamespace) -> None:
+        """Drop the local copy so the next read goes to Redis."""
+        self._local.pop(generation_key(matter_id, namespace), None)
+
+    def _get_local(self, key: str) -> int | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        generation, expires_at = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return generation
+
+    def _set_local(self, key: str, generation: int) -> None:
+        self._local[key] = (generation, time.monotonic() + self.local_ttl)
+
+
+def _parse_generation(raw: Any, key: str) -> int:
+    """Parse a stored counter; a missing or corrupt value means generation 0."""
+    if raw is None:
+        return 0
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        logger.warning("cache_generation_invalid", key=key)
+        return 0
@@ -4,8 +4,8 @@ Story 7-5: Query Cache Redis Storage
 
 Manages cached query results in Redis with:
 - 1-hour TTL (automatic expiration)
-- Matter-isolated keys (cache:query:{matter_id}:{query_hash})
-- Bulk invalidation on document upload
+- Matter-isolated keys (cache:query:{matter_id}:g{generation}:{query_hash})
+- O(1) bulk invalidation on document upload (generation bump)
 
 CRITICAL: All cache data is scoped by matter_id for Layer 3 isolation.
 """
@@ -18,6 +18,7 @@ from typing import Any
 import structlog
 
 from app.models.memory import CachedQueryResult
+from app.services.memory.cache_generation import CacheGenerations
 from app.services.memory.redis_client import get_redis_client
 from app.services.memory.redis_keys import (
     CACHE_TTL,
@@ -31,6 +32,9 @@ logger = structlog.get_logger(__name__)
 # Log truncation constant for consistent hash display in logs
 LOG_HASH_DISPLAY_LENGTH = 16
 
+# Generation namespace for query cache keys
+QUERY_CACHE_NAMESPACE = "query"
+
 
 class QueryCacheRepository:
     """Repository for query cache Redis operations.
@@ -44,7 +48,7 @@ class QueryCacheRepository:
     - Bulk invalidation for matter (AC #4)
     - Matter isolation via key prefix
 
-    Key format: cache:query:{matter_id}:{query_hash}
+    Key format: cache:query:{matter_id}:g{generation}:{query_hash}
     """
 
     def __init__(self, redis_client: Any = None) -> None:
@@ -54,12 +58,41 @@ class QueryCacheRepository:
             redis_client: Optional Redis client (injected for testing).
         """
         self._redis = redis_client
+        self._generations = CacheGenerations()
 
     async def _ensure_client(self) -> None:
         """Ensure Redis client is initialized."""
         if self._redis is None:
             self._redis = await get_redis_client()
 
+    async def _cache_key(self, matter_id: str, query_hash: str, action: str) -> str:
+        """Build the key for the matter's current cache generation.
+
+        Args:
+            matter_id: Matter UUID.
+            query_hash: SHA256 hash of normalized query.
+            action: Operation description for the RuntimeError message.
+
+        Raises:
+            ValueError: If matter_id or query_hash is invalid.
+            RuntimeError: If the generation cannot be read from Redis.
+        """
+        try:
+            generation = await self._generations.current(
+                self._redis, matter_id, QUERY_CACHE_NAMESPACE
+            )
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                "redis_get_cache_generation_failed",
+                matter_id=matter_id,
+                error=str(e),
+            )
+            raise RuntimeError(f"Failed to {action}: {e}") from e
+
+        return cache_key(matter_id, query_hash, generation=generation)
+
     async def get_cached_result(
         self,
         matter_id: str,
@@ -82,7 +115,9 @@ class QueryCacheRepository:
         """
         await self._ensure_client()
 
-        key = cache_key(matter_id, query_hash)
+        key = await self._cache_key(
+            matter_id, query_hash, "get cached result from Redis"
+        )
 
         # Defense-in-depth: validate key belongs to requested matter
         if not validate_key_access(key, matter_id):
@@ -150,7 +185,9 @@ class QueryCacheRepository:
         """
         await self._ensure_client()
 
-        key = cache_key(result.matter_id, result.query_hash)
+        key = await self._cache_key(
+            result.matter_id, result.query_hash, "store cached result in Redis"
+        )
 
         try:
             await self._redis.setex(
@@ -196,7 +233,9 @@ class QueryCacheRepository:
         """
         await self._ensure_client()
 
-        key = cache_key(matter_id, query_hash)
+        key = await self._cache_key(
+            matter_id, query_hash, "delete cached result from Redis"
+        )
 
         try:
             deleted = await self._redis.delete(key)
@@ -222,43 +261,34 @@ class QueryCacheRepository:
         self,
         matter_id: str,
     ) -> int:
-        """Delete all cache entries for a matter.
+        """Invalidate all cache entries for a matter.
 
         Story 7-5: Task 2.5 - Bulk invalidation.
         AC #4: Invalidate on document upload.
 
-        Uses SCAN to find and delete all matching keys safely
-        (doesn't block like KEYS command).
+        Bumps the matter's query cache generation with a single INCR, so the
+        cost does not depend on how many keys Redis holds. Entries of the old
+        generation are never read again and expire by CACHE_TTL.
 
         Args:
             matter_id: Matter UUID.
 
         Returns:
-            Number of keys deleted.
+            The new cache generation.
 
         Raises:
             RuntimeError: If Redis operation fails.
         """
         await self._ensure_client()
 
-        pattern = cache_pattern(matter_id)  # "cache:query:{matter_id}:*"
-        deleted_count = 0
-
         try:
-            # Use SCAN for safe iteration (non-blocking)
-            cursor = 0
-            while True:
-                cursor, keys = await self._redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await self._redis.delete(*keys)
-                    deleted_count += len(keys)
-                if cursor == 0:
-                    break
+            generation = await self._generations.bump(
+                self._redis, matter_id, QUERY_CACHE_NAMESPACE
+            )
         except Exception as e:
             logger.error(
                 "redis_invalidate_matter_cache_failed",
                 matter_id=matter_id,
-                deleted_before_error=deleted_count,
                 error=str(e),
             )
             raise RuntimeError(f"Failed to invalidate matter cache: {e}") from e
@@ -266,10 +296,10 @@ class QueryCacheRepository:
         logger.info(
             "matter_cache_invalidated",
             matter_id=matter_id,
-            keys_deleted=deleted_count,
+            generation=generation,
         )
 
-        return deleted_count
+        return generation
 
     async def get_cache_stats(
         self,
@@ -277,8 +307,8 @@ class QueryCacheRepository:
     ) -> dict[str, Any]:
         """Get cache statistics for a matter.
 
-        Returns count and estimated size of cached entries.
-        Useful for monitoring and debugging.
+        Returns count of live (current generation) cached entries.
+        Useful for monitoring and debugging - uses SCAN, keep off hot paths.
 
         Args:
             matter_id: Matter UUID.
@@ -288,10 +318,13 @@ class QueryCacheRepository:
         """
         await self._ensure_client()
 
-        pattern = cache_pattern(matter_id)
         keys: list[str] = []
 
         try:
+            generation = await self._generations.current(
+                self._redis, matter_id, QUERY_CACHE_NAMESPACE
+            )
+            pattern = cache_pattern(matter_id, generation=generation)
             cursor = 0
             while True:
                 cursor, batch = await self._redis.scan(cursor, match=pattern, count=100)
@@ -205,19 +205,19 @@ class QueryCacheService:
             matter_id: Matter UUID.
 
         Returns:
-            Number of cache entries deleted.
+            The matter's new query cache generation (always > 0).
         """
         repository = self._ensure_repository()
 
-        deleted_count = await repository.invalidate_matter_cache(matter_id)
+        generation = await repository.invalidate_matter_cache(matter_id)
 
         logger.info(
             "cache_invalidated_on_upload",
             matter_id=matter_id,
-            entries_deleted=deleted_count,
+            generation=generation,
         )
 
-        return deleted_count
+        return generation
 
     async def get_cache_stats(
         self,
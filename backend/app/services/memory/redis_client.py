@@ -37,9 +37,25 @@ async def get_redis_client() -> Any:
     """
     global _redis_client
 
-    if _redis_client is not None:
-        return _redis_client
+    if _redis_client is None:
+        _redis_client = create_redis_client()
+    return _redis_client
 
+
+def create_redis_client() -> Any:
+    """Create a new async Redis client, separate from the shared singleton.
+
+    For callers that run their own event loop (e.g. a Celery task's
+    asyncio.run), since a client's connections belong to the loop that
+    opened them. Use it as an async context manager so it is closed with
+    the loop.
+
+    Returns:
+        Upstash Redis client for production or redis-py for local.
+
+    Raises:
+        RuntimeError: If no Redis client can be initialized.
+    """
     # Check for Upstash environment variables first
     upstash_url = os.getenv("UPSTASH_REDIS_REST_URL")
     upstash_token = os.getenv("UPSTASH_REDIS_REST_TOKEN")
@@ -49,14 +65,14 @@ async def get_redis_client() -> Any:
         try:
             from upstash_redis.asyncio import Redis
 
-            _redis_client = Redis(url=upstash_url, token=upstash_token)
+            client = Redis(url=upstash_url, token=upstash_token)
             logger.info(
                 "redis_client_initialized",
                 type="upstash",
                 url=upstash_url[:30] + "..." if len(upstash_url) > 30 else upstash_url,
             )
-            return _redis_client
-        except ImportError:
+            return client
+        except ImportError as e:
             # CRITICAL: If Upstash is configured but library missing, FAIL FAST
             # Do NOT silently fall back to localhost - this causes production data loss
             logger.error(
@@ -68,7 +84,7 @@ async def get_redis_client() -> Any:
                 "Upstash Redis is configured (UPSTASH_REDIS_REST_URL set) but "
                 "upstash-redis package is not installed. Install it with: "
                 "pip install upstash-redis"
-            )
+            ) from e
 
     # Fallback to standard redis-py for local development
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -76,21 +92,21 @@ async def get_redis_client() -> Any:
     try:
         import redis.asyncio as redis
 
-        _redis_client = redis.from_url(redis_url, decode_responses=True)
+        client = redis.from_url(redis_url, decode_responses=True)
         logger.info(
             "redis_client_initialized",
             type="redis-py",
             url=redis_url[:30] + "..." if len(redis_url) > 30 else redis_url,
         )
-        return _redis_client
-    except ImportError:
+        return client
+    except ImportError as e:
         logger.error(
             "no_redis_client_available",
             message="Install redis or upstash-redis package",
         )
         raise RuntimeError(
             "No Redis client available. Install redis or upstash-redis."
-        )
+        ) from e
 
 
 def reset_redis_client() -> None:
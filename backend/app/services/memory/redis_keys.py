@@ -9,6 +9,7 @@ Key Patterns:
 - Session Memory (7-day TTL): session:{matter_id}:{user_id}:{key_type}
 - Query Cache (1-hour TTL): cache:query:{matter_id}:{query_hash}
 - Matter Memory: matter:{matter_id}:{key_type}
+- Cache Generations: matter:{matter_id}:gen:{namespace}
 
 CRITICAL: All Redis operations MUST use these functions to generate keys.
 Never construct Redis keys manually to prevent isolation bypasses.
@@ -30,6 +31,9 @@ MAX_SESSION_LIFETIME = 30 * 24 * 60 * 60  # 30 days absolute maximum (Story 7-2)
 CACHE_TTL = 60 * 60  # 1 hour in seconds
 MATTER_MEMORY_TTL = None  # No expiration for matter memory
 EMBEDDING_CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
+# Generation counters outlive every entry they version, so an expired counter
+# restarting at 0 can never resurrect a live entry
+GENERATION_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
 
 # =============================================================================
 # Key Type Definitions
@@ -37,6 +41,7 @@ EMBEDDING_CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
 
 SessionKeyType = Literal["messages", "entities", "context", "metadata"]
 MatterKeyType = Literal["timeline", "entity_graph", "findings", "stats"]
+CacheNamespace = Literal["query", "timeline"]
 
 # =============================================================================
 # UUID Validation
@@ -141,7 +146,7 @@ def session_key(
 # Cache Key Functions
 # =============================================================================
 
-def cache_key(matter_id: str, query_hash: str) -> str:
+def cache_key(matter_id: str, query_hash: str, generation: int | None = None) -> str:
     """Generate a query cache Redis key with matter isolation.
 
     Cache keys store LLM query results for fast retrieval.
@@ -150,9 +155,11 @@ def cache_key(matter_id: str, query_hash: str) -> str:
     Args:
         matter_id: The matter UUID.
         query_hash: SHA256 hash of the normalized query.
+        generation: Matter's query cache generation (see generation_key).
 
     Returns:
-        Redis key in format: cache:query:{matter_id}:{query_hash}
+        Redis key in format: cache:query:{matter_id}:{query_hash}, or
+        cache:query:{matter_id}:g{generation}:{query_hash} with a generation.
 
     Raises:
         ValueError: If any parameter is invalid.
@@ -161,6 +168,8 @@ def cache_key(matter_id: str, query_hash: str) -> str:
         >>> key = cache_key("abc-123", "sha256hash...")
         >>> key
         'cache:query:abc-123:sha256hash...'
+        >>> cache_key("abc-123", "sha256hash...", generation=4)
+        'cache:query:abc-123:g4:sha256hash...'
     """
     _validate_uuid(matter_id, "matter_id")
 
@@ -168,9 +177,42 @@ def cache_key(matter_id: str, query_hash: str) -> str:
     if not query_hash or not re.match(r"^[a-f0-9]{32,64}$", query_hash, re.IGNORECASE):
         raise ValueError("query_hash must be a valid hex hash (32-64 characters)")
 
+    if generation is not None:
+        return f"cache:query:{matter_id}:g{int(generation)}:{query_hash}"
     return f"cache:query:{matter_id}:{query_hash}"
 
 
+# =============================================================================
+# Cache Generation Key Functions
+# =============================================================================
+
+def generation_key(matter_id: str, namespace: CacheNamespace) -> str:
+    """Generate the Redis key holding a matter's cache generation counter.
+
+    Cached entries embed the generation in their key. Invalidating a whole
+    namespace for a matter is a single INCR of this counter; entries from
+    older generations are never read again and expire by TTL.
+
+    Args:
+        matter_id: The matter UUID.
+        namespace: Cache namespace (query, timeline).
+
+    Returns:
+        Redis key in format: matter:{matter_id}:gen:{namespace}
+
+    Raises:
+        ValueError: If any parameter is invalid.
+
+    Example:
+        >>> generation_key("abc-123", "timeline")
+        'matter:abc-123:gen:timeline'
+    """
+    _validate_uuid(matter_id, "matter_id")
+    _sanitize_key_component(namespace, "namespace")
+
+    return f"matter:{matter_id}:gen:{namespace}"
+
+
 # =============================================================================
 # Matter Key Functions
 # =============================================================================
@@ -314,14 +356,15 @@ def session_pattern(matter_id: str, user_id: str | None = None) -> str:
     return f"session:{matter_id}:*"
 
 
-def cache_pattern(matter_id: str) -> str:
+def cache_pattern(matter_id: str, generation: int | None = None) -> str:
     """Generate a Redis SCAN pattern for cache keys.
 
-    Use this pattern to invalidate all cache entries for a matter
-    (e.g., when new documents are uploaded).
+    Without a generation the pattern matches every cache entry of the
+    matter; with one, only entries of that generation (for monitoring).
 
     Args:
         matter_id: The matter UUID.
+        generation: Optional query cache generation.
 
     Returns:
         Redis pattern for SCAN command.
@@ -329,8 +372,12 @@ def cache_pattern(matter_id: str) -> str:
     Example:
         >>> cache_pattern("abc-123")
         'cache:query:abc-123:*'
+        >>> cache_pattern("abc-123", generation=4)
+        'cache:query:abc-123:g4:*'
     """
     _validate_uuid(matter_id, "matter_id")
+    if generation is not None:
+        return f"cache:query:{matter_id}:g{int(generation)}:*"
     return f"cache:query:{matter_id}:*"
 
 
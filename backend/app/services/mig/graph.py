@@ -13,6 +13,7 @@ without blocking the event loop.
 
 import asyncio
 import re
+import time
 from datetime import UTC, datetime
 from functools import lru_cache
 
@@ -70,6 +71,21 @@ def _get_broadcast_entity_streaming():
 
 logger = structlog.get_logger(__name__)
 
+# Entities per increment_entity_mention_counts RPC call
+MENTION_COUNT_BATCH_SIZE = 500
+
+# Edges per identity_edges insert statement
+EDGE_INSERT_BATCH_SIZE = 500
+
+# Natural key of identity_edges (UNIQUE constraint)
+EDGE_CONFLICT_COLUMNS = "matter_id,source_node_id,target_node_id,relationship_type"
+
+# How long a process reuses a fetched alias cluster (seconds). Writes made
+# through this service invalidate the matter immediately; alias edges written
+# by other processes (other workers, API replicas) can take up to this long
+# to show up here. Expired entries are pruned on the next cache miss.
+ALIAS_CLUSTER_CACHE_TTL = 60
+
 
 # =============================================================================
 # Exceptions
@@ -127,6 +143,8 @@ class MIGGraphService:
     def __init__(self) -> None:
         """Initialize MIG graph service."""
         self._client = None
+        # matter_id -> {entity_id: (expires_at, cluster nodes)}
+        self._alias_clusters: dict[str, dict[str, tuple[float, list[EntityNode]]]] = {}
 
     @property
     def client(self):
@@ -493,9 +511,10 @@ class MIGGraphService:
     ) -> list[EntityNode]:
         """Batch update mention counts for existing entities.
 
-        Story 6.2: Uses individual updates but in parallel.
-        Note: Supabase doesn't support bulk UPDATE with different values,
-        so we use asyncio.gather for concurrent updates.
+        Applies all increments server-side with the
+        increment_entity_mention_counts RPC: one round trip per
+        MENTION_COUNT_BATCH_SIZE entities, and each delta is added to the
+        current value so concurrent chunks never lose each other's counts.
 
         Args:
             matter_id: Matter UUID.
@@ -507,30 +526,44 @@ class MIGGraphService:
         if not updates:
             return []
 
-        async def _update_one(entity_id: str, additional: int) -> EntityNode | None:
+        updated: list[EntityNode] = []
+
+        for i in range(0, len(updates), MENTION_COUNT_BATCH_SIZE):
+            batch = updates[i:i + MENTION_COUNT_BATCH_SIZE]
             try:
-                updated = await self._update_entity_mention_count(
-                    entity_id=entity_id,
-                    matter_id=matter_id,
-                    additional_mentions=additional,
+                rows = await asyncio.to_thread(
+                    self._increment_mention_counts, matter_id, batch
                 )
-                if updated:
-                    return self._db_row_to_entity_node(updated)
+                updated.extend(self._db_row_to_entity_node(row) for row in rows)
             except Exception as e:
                 logger.warning(
-                    "mig_batch_update_one_failed",
-                    entity_id=entity_id,
+                    "mig_batch_update_mention_counts_failed",
+                    matter_id=matter_id,
+                    batch_size=len(batch),
                     error=str(e),
                 )
-            return None
 
-        # Run updates concurrently
-        results = await asyncio.gather(
-            *[_update_one(eid, add) for eid, add in updates],
-            return_exceptions=True,
-        )
+        return updated
 
-        return [r for r in results if isinstance(r, EntityNode)]
+    def _increment_mention_counts(
+        self,
+        matter_id: str,
+        updates: list[tuple[str, int]],
+    ) -> list[dict]:
+        """Add mention deltas in one statement (increment_entity_mention_counts RPC).
+
+        Returns:
+            Updated identity_nodes rows.
+        """
+        response = self.client.rpc(
+            "increment_entity_mention_counts",
+            {
+                "p_matter_id": matter_id,
+                "p_entity_ids": [entity_id for entity_id, _ in updates],
+                "p_increments": [additional for _, additional in updates],
+            },
+        ).execute()
+        return response.data or []
 
     async def _batch_insert_mentions(
         self,
@@ -629,40 +662,14 @@ class MIGGraphService:
         additional_mentions: int,
     ) -> dict | None:
         """Increment mention count for existing entity."""
-        # First get current count
-        def _get_current():
-            return (
-                self.client.table("identity_nodes")
-                .select("mention_count")
-                .eq("id", entity_id)
-                .eq("matter_id", matter_id)
-                .limit(1)
-                .execute()
-            )
-
-        current = await asyncio.to_thread(_get_current)
-
-        if not current.data:
-            return None
-
-        new_count = (current.data[0].get("mention_count", 0) or 0) + additional_mentions
-
-        def _update():
-            return (
-                self.client.table("identity_nodes")
-                .update({
-                    "mention_count": new_count,
-                    "updated_at": datetime.now(UTC).isoformat(),
-                })
-                .eq("id", entity_id)
-                .eq("matter_id", matter_id)
-                .execute()
-            )
-
-        response = await asyncio.to_thread(_update)
+        rows = await asyncio.to_thread(
+            self._increment_mention_counts,
+            matter_id,
+            [(entity_id, additional_mentions)],
+        )
 
-        if response.data:
-            return response.data[0]
+        if rows:
+            return rows[0]
         return None
 
     async def _save_entity_mentions(
@@ -754,48 +761,34 @@ class MIGGraphService:
     ) -> list[EntityEdge]:
         """Save relationship edges to identity_edges table.
 
+        Inserts in batches of EDGE_INSERT_BATCH_SIZE, ignoring edges that
+        already exist on (matter, source, target, relationship type).
+
         Args:
             matter_id: Matter UUID for isolation.
             edges: List of edges to create.
 
         Returns:
-            List of created EntityEdge objects.
+            List of newly created EntityEdge objects (existing edges are
+            not returned).
         """
         if not edges:
             return []
 
-        saved_edges: list[EntityEdge] = []
-
-        for edge in edges:
-            try:
-                def _insert_edge():
-                    return (
-                        self.client.table("identity_edges")
-                        .insert({
-                            "matter_id": matter_id,
-                            "source_node_id": edge.source_entity_id,
-                            "target_node_id": edge.target_entity_id,
-                            "relationship_type": edge.relationship_type.value,
-                            "confidence": edge.confidence,
-                            "metadata": edge.metadata,
-                        })
-                        .execute()
-                    )
-
-                response = await asyncio.to_thread(_insert_edge)
-
-                if response.data:
-                    saved_edges.append(self._db_row_to_entity_edge(response.data[0]))
+        rows = [
+            {
+                "matter_id": matter_id,
+                "source_node_id": edge.source_entity_id,
+                "target_node_id": edge.target_entity_id,
+                "relationship_type": edge.relationship_type.value,
+                "confidence": edge.confidence,
+                "metadata": edge.metadata,
+            }
+            for edge in edges
+        ]
 
-            except Exception as e:
-                # Likely duplicate edge (unique constraint)
-                logger.debug(
-                    "mig_save_edge_skipped",
-                    source=edge.source_entity_id,
-                    target=edge.target_entity_id,
-                    error=str(e),
-                )
-                continue
+        created = await asyncio.to_thread(self._insert_edges_ignore_duplicates, rows)
+        saved_edges = [self._db_row_to_entity_edge(row) for row in created]
 
         logger.info(
             "mig_edges_saved",
@@ -806,6 +799,74 @@ class MIGGraphService:
 
         return saved_edges
 
+    def _insert_edges_ignore_duplicates(self, rows: list[dict]) -> list[dict]:
+        """Insert edge rows, skipping those that already exist.
+
+        Duplicates within rows are dropped before sending (first one wins).
+        A batch that fails is retried row by row so one bad row only fails
+        itself.
+
+        Args:
+            rows: identity_edges rows.
+
+        Returns:
+            Rows that were actually inserted.
+        """
+        unique_rows: dict[tuple, dict] = {}
+        for row in rows:
+            key = (
+                row["matter_id"],
+                row["source_node_id"],
+                row["target_node_id"],
+                row["relationship_type"],
+            )
+            unique_rows.setdefault(key, row)
+        pending = list(unique_rows.values())
+
+        inserted: list[dict] = []
+        for i in range(0, len(pending), EDGE_INSERT_BATCH_SIZE):
+            batch = pending[i:i + EDGE_INSERT_BATCH_SIZE]
+            try:
+                inserted.extend(self._upsert_edges(batch))
+            except Exception as e:
+                logger.warning(
+                    "mig_save_edges_batch_failed",
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+                inserted.extend(self._insert_edges_row_by_row(batch))
+
+        return inserted
+
+    def _insert_edges_row_by_row(self, rows: list[dict]) -> list[dict]:
+        """Fallback: one upsert per edge, isolating failures."""
+        inserted: list[dict] = []
+        for row in rows:
+            try:
+                inserted.extend(self._upsert_edges([row]))
+            except Exception as e:
+                logger.warning(
+                    "mig_save_edge_failed",
+                    source_node_id=row["source_node_id"],
+                    target_node_id=row["target_node_id"],
+                    relationship_type=row["relationship_type"],
+                    error=str(e),
+                )
+        return inserted
+
+    def _upsert_edges(self, rows: list[dict]) -> list[dict]:
+        """Upsert edge rows, ignoring existing ones; returns inserted rows."""
+        response = (
+            self.client.table("identity_edges")
+            .upsert(
+                rows,
+                on_conflict=EDGE_CONFLICT_COLUMNS,
+                ignore_duplicates=True,
+            )
+            .execute()
+        )
+        return response.data or []
+
     def _db_row_to_entity_edge(self, row: dict) -> EntityEdge:
         """Convert database row to EntityEdge model."""
         from app.models.entity import RelationshipType
@@ -1116,116 +1177,140 @@ class MIGGraphService:
             metadata: Optional metadata about the alias link.
 
         Returns:
-            Created EntityEdge or None if failed.
+            Created EntityEdge or None if it already existed or failed.
+        """
+        created = await self.create_alias_edges(
+            matter_id=matter_id,
+            edges=[(source_id, target_id, confidence, metadata)],
+        )
+        return created[0] if created else None
+
+    async def create_alias_edges(
+        self,
+        matter_id: str,
+        edges: list[tuple[str, str, float, dict | None]],
+    ) -> list[EntityEdge]:
+        """Create ALIAS_OF edges in batches, skipping existing ones.
+
+        Args:
+            matter_id: Matter UUID for isolation.
+            edges: (source_id, target_id, confidence, metadata) tuples.
+
+        Returns:
+            Newly created EntityEdge objects.
         """
         from app.models.entity import RelationshipType
 
-        def _insert():
-            return (
-                self.client.table("identity_edges")
-                .insert({
-                    "matter_id": matter_id,
-                    "source_node_id": source_id,
-                    "target_node_id": target_id,
-                    "relationship_type": RelationshipType.ALIAS_OF.value,
-                    "confidence": confidence,
-                    "metadata": metadata or {},
-                })
-                .execute()
-            )
+        if not edges:
+            return []
 
-        try:
-            response = await asyncio.to_thread(_insert)
+        rows = [
+            {
+                "matter_id": matter_id,
+                "source_node_id": source_id,
+                "target_node_id": target_id,
+                "relationship_type": RelationshipType.ALIAS_OF.value,
+                "confidence": confidence,
+                "metadata": metadata or {},
+            }
+            for source_id, target_id, confidence, metadata in edges
+        ]
 
-            if response.data:
-                logger.info(
-                    "mig_alias_edge_created",
-                    matter_id=matter_id,
-                    source_id=source_id,
-                    target_id=target_id,
-                    confidence=confidence,
-                )
-                return self._db_row_to_entity_edge(response.data[0])
+        created = await asyncio.to_thread(self._insert_edges_ignore_duplicates, rows)
+        if created:
+            self.invalidate_alias_clusters(matter_id)
 
-        except Exception as e:
-            # Likely duplicate (unique constraint)
-            logger.debug(
-                "mig_alias_edge_exists",
-                source_id=source_id,
-                target_id=target_id,
-                error=str(e),
-            )
+        logger.info(
+            "mig_alias_edges_created",
+            matter_id=matter_id,
+            input_count=len(edges),
+            created_count=len(created),
+        )
 
-        return None
+        return [self._db_row_to_entity_edge(row) for row in created]
 
-    async def get_all_aliases(
+    async def get_alias_cluster(
         self,
         entity_id: str,
         matter_id: str,
     ) -> list[EntityNode]:
-        """Get all aliases of an entity (following ALIAS_OF edges).
+        """Get every node in an entity's alias cluster, including the entity.
 
-        Includes both direct aliases (where entity is source/target)
-        and transitive aliases.
+        Clusters are connected components of ALIAS_OF edges, materialized as
+        identity_nodes.alias_cluster_id, so this is one indexed lookup
+        (get_alias_cluster RPC) however long the alias chain. Results are
+        cached per matter for ALIAS_CLUSTER_CACHE_TTL seconds, so alias edges
+        created by another process are visible here within that bound.
 
         Args:
             entity_id: Entity UUID.
             matter_id: Matter UUID for isolation.
 
         Returns:
-            List of EntityNode objects representing all aliases.
+            Cluster nodes, most mentioned first. Empty if the entity is not
+            in the matter.
         """
-        from app.models.entity import RelationshipType
-
-        # Validate entity exists in matter
-        entity = await self.get_entity(entity_id, matter_id)
-        if not entity:
-            return []
+        cached = self._alias_clusters.get(matter_id, {}).get(entity_id)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
 
-        # Get all ALIAS_OF edges involving this entity
-        def _query_aliases():
-            return (
-                self.client.table("identity_edges")
-                .select("source_node_id, target_node_id")
-                .eq("matter_id", matter_id)
-                .eq("relationship_type", RelationshipType.ALIAS_OF.value)
-                .or_(f"source_node_id.eq.{entity_id},target_node_id.eq.{entity_id}")
-                .execute()
-            )
-
-        response = await asyncio.to_thread(_query_aliases)
+        self._prune_alias_clusters()
 
-        if not response.data:
-            return []
-
-        # Collect all related entity IDs
-        related_ids: set[str] = set()
-        for row in response.data:
-            related_ids.add(row["source_node_id"])
-            related_ids.add(row["target_node_id"])
-
-        # Remove the original entity
-        related_ids.discard(entity_id)
+        def _query():
+            return self.client.rpc(
+                "get_alias_cluster",
+                {"p_matter_id": matter_id, "p_entity_id": entity_id},
+            ).execute()
 
-        if not related_ids:
-            return []
+        response = await asyncio.to_thread(_query)
+        nodes = [self._db_row_to_entity_node(row) for row in response.data or []]
+
+        # One lookup fills the cache for every member of the cluster
+        expires_at = time.monotonic() + ALIAS_CLUSTER_CACHE_TTL
+        if nodes:
+            matter_clusters = self._alias_clusters.setdefault(matter_id, {})
+            for node in nodes:
+                matter_clusters[node.id] = (expires_at, nodes)
+
+        return nodes
+
+    def _prune_alias_clusters(self) -> None:
+        """Drop expired cluster entries, and matters left with none."""
+        now = time.monotonic()
+        for matter_id, matter_clusters in list(self._alias_clusters.items()):
+            expired = [
+                entity_id
+                for entity_id, (expires_at, _) in matter_clusters.items()
+                if expires_at <= now
+            ]
+            for entity_id in expired:
+                del matter_clusters[entity_id]
+            if not matter_clusters:
+                del self._alias_clusters[matter_id]
+
+    def invalidate_alias_clusters(self, matter_id: str) -> None:
+        """Drop cached alias clusters for a matter (after alias edge changes)."""
+        self._alias_clusters.pop(matter_id, None)
 
-        # Fetch all alias entities
-        def _fetch_entities():
-            return (
-                self.client.table("identity_nodes")
-                .select("*")
-                .eq("matter_id", matter_id)
-                .in_("id", list(related_ids))
-                .execute()
-            )
+    async def get_all_aliases(
+        self,
+        entity_id: str,
+        matter_id: str,
+    ) -> list[EntityNode]:
+        """Get all aliases of an entity (following ALIAS_OF edges).
 
-        entities_response = await asyncio.to_thread(_fetch_entities)
+        Includes both direct aliases (where entity is source/target)
+        and transitive aliases.
 
-        if not entities_response.data:
-            return []
+        Args:
+            entity_id: Entity UUID.
+            matter_id: Matter UUID for isolation.
 
-        return [self._db_row_to_entity_node(row) for row in entities_response.data]
+        Returns:
+            List of EntityNode objects representing all aliases.
+        """
+        cluster = await self.get_alias_cluster(entity_id, matter_id)
+        return [node for node in cluster if node.id != entity_id]
 
     async def get_canonical_entity(
         self,
@@ -1244,21 +1329,12 @@ class MIGGraphService:
         Returns:
             Canonical EntityNode or the entity itself if no aliases.
         """
-        # Get the entity and all its aliases
-        entity = await self.get_entity(alias_entity_id, matter_id)
-        if not entity:
+        cluster = await self.get_alias_cluster(alias_entity_id, matter_id)
+        if not cluster:
             return None
 
-        aliases = await self.get_all_aliases(alias_entity_id, matter_id)
-
-        if not aliases:
-            return entity
-
-        # Find entity with most mentions (canonical)
-        all_entities = [entity] + aliases
-        canonical = max(all_entities, key=lambda e: e.mention_count)
-
-        return canonical
+        # Find entity with most mentions (canonical); first wins ties
+        return max(cluster, key=lambda e: e.mention_count)
 
     async def update_entity_aliases_array(
         self,
@@ -31,6 +31,7 @@ from app.core.circuit_breaker import (
 from app.core.config import get_settings
 from app.models.ocr import OCRPage, OCRResult
 from app.services.ocr.bbox_extractor import extract_bounding_boxes
+from app.services.pdf_manifest import PDFManifest, open_reader, page_getter
 
 logger = structlog.get_logger(__name__)
 
@@ -174,25 +175,32 @@ class OCRProcessor:
             f"processors/{self.processor_id}"
         )
 
-    def _split_pdf(self, pdf_content: bytes, chunk_size: int = 15) -> list[bytes]:
+    def _split_pdf(
+        self,
+        pdf_content: bytes,
+        chunk_size: int = 15,
+        manifest: PDFManifest | None = None,
+    ) -> list[bytes]:
         """Split a large PDF into smaller chunks.
         
         Args:
             pdf_content: Original PDF bytes.
             chunk_size: Maximum pages per chunk.
+            manifest: Optional matching PDF manifest (pages loaded by reference).
             
         Returns:
             List of PDF bytes for each chunk.
         """
-        reader = pypdf.PdfReader(BytesIO(pdf_content))
-        total_pages = len(reader.pages)
+        reader = open_reader(pdf_content)
+        total_pages = manifest.page_count if manifest is not None else len(reader.pages)
+        get_page = page_getter(reader, manifest)
         chunks = []
         
         for start in range(0, total_pages, chunk_size):
             writer = pypdf.PdfWriter()
             end = min(start + chunk_size, total_pages)
             for i in range(start, end):
-                writer.add_page(reader.pages[i])
+                writer.add_page(get_page(i))
                 
             out_stream = BytesIO()
             writer.write(out_stream)
@@ -263,6 +271,7 @@ class OCRProcessor:
         pdf_content: bytes,
         document_id: str | None = None,
         enable_image_quality_scores: bool = True,
+        manifest: PDFManifest | None = None,
     ) -> OCRResult:
         """Process a PDF document and extract text with bounding boxes.
 
@@ -280,6 +289,9 @@ class OCRProcessor:
             pdf_content: PDF file content as bytes.
             document_id: Optional document ID for logging and result.
             enable_image_quality_scores: Whether to compute image quality scores.
+            manifest: Optional PDF manifest already verified against
+                pdf_content; the page count and split pages come from it
+                instead of a page tree walk.
 
         Returns:
             OCRResult with extracted text, pages, and bounding boxes.
@@ -293,8 +305,10 @@ class OCRProcessor:
         # Story 16.1: Handle large documents by splitting
         # Document AI Online Processing limit is 15 pages
         try:
-            reader = pypdf.PdfReader(BytesIO(pdf_content))
-            page_count = len(reader.pages)
+            if manifest is not None:
+                page_count = manifest.page_count
+            else:
+                page_count = len(open_reader(pdf_content).pages)
             if page_count > 15:
                 logger.info(
                     "splitting_large_document",
@@ -302,7 +316,7 @@ class OCRProcessor:
                     page_count=page_count,
                     chunk_limit=15
                 )
-                chunks = self._split_pdf(pdf_content, 15)
+                chunks = self._split_pdf(pdf_content, 15, manifest)
                 results = []
                 for i, chunk in enumerate(chunks):
                     logger.info(
@@ -5,6 +5,10 @@ Story 17.6: Page Offset Validation
 
 Transforms chunk-relative page numbers to absolute page numbers
 and validates data integrity post-merge.
+
+Chunked OCR writes each chunk's bounding boxes as soon as the chunk
+succeeds, so the worker only needs stitch_results (checksums and text);
+merge_results also carries and transforms the boxes.
 """
 
 import hashlib
@@ -39,6 +43,8 @@ class ChunkOCRResult(BaseModel):
         overall_confidence: OCR confidence score (0.0-1.0).
         page_count: Number of pages in this chunk.
         checksum: Optional SHA256 checksum for validation.
+        bbox_count: Boxes the chunk persisted, when bounding_boxes is not
+            carried (None means len(bounding_boxes)).
     """
 
     chunk_index: int = Field(..., alias="chunkIndex")
@@ -49,9 +55,17 @@ class ChunkOCRResult(BaseModel):
     overall_confidence: float = Field(..., alias="overallConfidence")
     page_count: int = Field(..., alias="pageCount")
     checksum: str | None = None
+    bbox_count: int | None = Field(default=None, alias="bboxCount")
 
     model_config = {"populate_by_name": True}
 
+    @property
+    def total_bboxes(self) -> int:
+        """Number of boxes in this chunk."""
+        if self.bbox_count is not None:
+            return self.bbox_count
+        return len(self.bounding_boxes)
+
 
 class MergedOCRResult(BaseModel):
     """Final merged OCR result with absolute page numbers.
@@ -111,6 +125,91 @@ class OCRResultMerger:
         Returns:
             MergedOCRResult with absolute page numbers.
 
+        Raises:
+            MergeValidationError: If validation fails.
+        """
+        sorted_results = self._validate_chunks(chunk_results)
+
+        # Merge bounding boxes with page offset transformation
+        merged_bboxes = []
+        page_offset = 0
+
+        for chunk in sorted_results:
+            transformed = self._transform_bboxes(chunk.bounding_boxes, page_offset)
+            merged_bboxes.extend(transformed)
+            page_offset += chunk.page_count
+
+        result = self._build_result(
+            sorted_results, document_id, merged_bboxes, len(merged_bboxes)
+        )
+
+        # Post-merge validation
+        self._validate_merged_result(result, sorted_results)
+
+        logger.info(
+            "ocr_results_merged",
+            document_id=document_id,
+            chunk_count=result.chunk_count,
+            total_pages=result.page_count,
+            total_bboxes=result.total_bboxes,
+            confidence=round(result.overall_confidence, 2),
+        )
+
+        return result
+
+    def stitch_results(
+        self,
+        chunk_results: list[ChunkOCRResult],
+        document_id: str,
+    ) -> MergedOCRResult:
+        """Validate chunk results and stitch their text, without bboxes.
+
+        Used when each chunk has already stored its bounding boxes with
+        absolute page numbers, so the cost no longer grows with box count.
+
+        Args:
+            chunk_results: List of chunk OCR results (bbox_count set).
+            document_id: Parent document UUID.
+
+        Returns:
+            MergedOCRResult with empty bounding_boxes and total_bboxes
+            summed from the chunks.
+
+        Raises:
+            MergeValidationError: If validation fails.
+        """
+        sorted_results = self._validate_chunks(chunk_results)
+
+        result = self._build_result(
+            sorted_results,
+            document_id,
+            [],
+            sum(c.total_bboxes for c in sorted_results),
+        )
+
+        logger.info(
+            "ocr_results_stitched",
+            document_id=document_id,
+            chunk_count=result.chunk_count,
+            total_pages=result.page_count,
+            total_bboxes=result.total_bboxes,
+            confidence=round(result.overall_confidence, 2),
+        )
+
+        return result
+
+    def _validate_chunks(
+        self,
+        chunk_results: list[ChunkOCRResult],
+    ) -> list[ChunkOCRResult]:
+        """Sort chunks and validate page ranges and checksums.
+
+        Args:
+            chunk_results: List of chunk OCR results.
+
+        Returns:
+            Chunk results sorted by chunk_index.
+
         Raises:
             MergeValidationError: If validation fails.
         """
@@ -128,18 +227,16 @@ class OCRResultMerger:
             if chunk.checksum:
                 self._validate_checksum(chunk)
 
-        # Merge bounding boxes with page offset transformation
-        merged_bboxes = []
-        page_offset = 0
-
-        for chunk in sorted_results:
-            transformed = self._transform_bboxes(chunk.bounding_boxes, page_offset)
-            merged_bboxes.extend(transformed)
-            page_offset += chunk.page_count
-
-        # Merge full text
-        merged_text = self._merge_text(sorted_results)
+        return sorted_results
 
+    def _build_result(
+        self,
+        sorted_results: list[ChunkOCRResult],
+        document_id: str,
+        bounding_boxes: list[dict],
+        total_bboxes: int,
+    ) -> MergedOCRResult:
+        """Stitch text and confidence of validated chunks into one result."""
         # Calculate weighted average confidence
         total_pages = sum(c.page_count for c in sorted_results)
         weighted_confidence = (
@@ -148,30 +245,16 @@ class OCRResultMerger:
             else 0.0
         )
 
-        result = MergedOCRResult(
+        return MergedOCRResult(
             document_id=document_id,
-            bounding_boxes=merged_bboxes,
-            full_text=merged_text,
+            bounding_boxes=bounding_boxes,
+            full_text=self._merge_text(sorted_results),
             overall_confidence=weighted_confidence,
             page_count=total_pages,
             chunk_count=len(sorted_results),
-            total_bboxes=len(merged_bboxes),
-        )
-
-        # Post-merge validation
-        self._validate_merged_result(result, sorted_results)
-
-        logger.info(
-            "ocr_results_merged",
-            document_id=document_id,
-            chunk_count=len(sorted_results),
-            total_pages=total_pages,
-            total_bboxes=len(merged_bboxes),
-            confidence=round(weighted_confidence, 2),
+            total_bboxes=total_bboxes,
         )
 
-        return result
-
     def _transform_bboxes(
         self,
         bboxes: list[dict],
@@ -330,8 +413,7 @@ class OCRResultMerger:
             return
 
         # Recompute checksum from chunk data
-        data = f"{chunk.chunk_index}:{chunk.page_start}:{chunk.page_end}:{len(chunk.bounding_boxes)}"
-        computed = hashlib.sha256(data.encode()).hexdigest()[:16]
+        computed = self.compute_chunk_checksum(chunk)
 
         if computed != chunk.checksum:
             logger.warning(
@@ -413,7 +495,7 @@ class OCRResultMerger:
         """Compute checksum for a chunk result.
 
         Use this when storing chunk results to enable validation
-        during merge.
+        during merge. Covers the page range, box count and text.
 
         Args:
             chunk: Chunk result to checksum.
@@ -421,7 +503,11 @@ class OCRResultMerger:
         Returns:
             SHA256 checksum (first 16 chars).
         """
-        data = f"{chunk.chunk_index}:{chunk.page_start}:{chunk.page_end}:{len(chunk.bounding_boxes)}"
+        text_digest = hashlib.sha256(chunk.full_text.encode()).hexdigest()
+        data = (
+            f"{chunk.chunk_index}:{chunk.page_start}:{chunk.page_end}:"
+            f"{chunk.total_bboxes}:{text_digest}"
+        )
         return hashlib.sha256(data.encode()).hexdigest()[:16]
 
 
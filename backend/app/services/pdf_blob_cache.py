@@ -0,0 +1,540 @@
+"""Worker-local content-addressed cache for source PDFs.
+
+Every pipeline stage that needs the original PDF (OCR, chunked OCR, table
+extraction, job recovery) used to download it again from Supabase Storage
+and hold the full bytes in memory. This cache keeps one copy per worker host
+on local disk so each document is downloaded once per host.
+
+Layout under the cache root:
+- blobs/{sha[:2]}/{sha}   - PDF bytes, named by sha256 of the content
+- index/{sha(path)}       - storage path -> content sha256 and size
+- locks/{sha(path)}.lock  - per-path download lock (Celery prefork workers),
+                            removed by its holder on release
+
+Writes go to a temp file in the same directory and are published with
+os.replace, so readers never see a partial blob. Blob mtime is bumped on
+every hit and the least recently used blobs are evicted once the cache
+exceeds its byte budget. Readers memory-map blobs instead of copying them;
+evicting a blob that is still mapped is safe on POSIX (the inode lives
+until the mapping is closed).
+
+Index entries are revalidated on lookup: an entry whose blob size no longer
+matches, or that is older than the index TTL, is treated as a miss so a
+storage path that was overwritten is downloaded again.
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import ExitStack, contextmanager, suppress
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import structlog
+
+from app.core.config import get_settings
+
+try:  # POSIX only - cross-process download coalescing
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines
+    fcntl = None
+
+if TYPE_CHECKING:
+    from app.services.storage_service import StorageService
+
+logger = structlog.get_logger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+DEFAULT_CACHE_DIRNAME = "ldip-pdf-cache"
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Cross-process lock polling. Workers run under gevent, so the lock is taken
+# non-blocking and retried with a (monkey-patched, cooperative) sleep rather
+# than blocking the hub in flock().
+FILE_LOCK_POLL_SECONDS = 0.05
+FILE_LOCK_TIMEOUT_SECONDS = 300.0
+
+# Storage paths are rarely rewritten, so index entries are trusted for this
+# long before the PDF is downloaded again.
+DEFAULT_INDEX_TTL_SECONDS = 24 * 3600
+
+
+@dataclass
+class _KeyLock:
+    """In-process lock for one key and the number of threads using it."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    users: int = 0
+
+
+# =============================================================================
+# Cache Implementation
+# =============================================================================
+
+
+class PDFBlobCache:
+    """Bounded on-disk LRU cache of PDFs keyed by storage path and content hash.
+
+    Example:
+        >>> cache = PDFBlobCache("/var/cache/ldip", max_bytes=2 * 1024**3)
+        >>> with cache.open_mmap(storage_path, fetch=download) as pdf:
+        ...     reader = pypdf.PdfReader(pdf)
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_bytes: int,
+        index_ttl_seconds: float = DEFAULT_INDEX_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (created if missing).
+            max_bytes: Total blob size budget before LRU eviction.
+            index_ttl_seconds: Age after which a storage path is downloaded
+                again to pick up rewrites.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.index_ttl_seconds = index_ttl_seconds
+        self._blobs = self.root / "blobs"
+        self._index = self.root / "index"
+        self._locks = self.root / "locks"
+        for directory in (self._blobs, self._index, self._locks):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        # In-process lock per key (dropped once unused); the file lock
+        # covers other processes
+        self._key_locks: dict[str, _KeyLock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    # =========================================================================
+    # Public Methods
+    # =========================================================================
+
+    def get_path(self, storage_path: str, fetch: Callable[[], bytes]) -> Path:
+        """Return a local path for the PDF, downloading it on a miss.
+
+        Concurrent callers for the same storage path on this host wait for a
+        single download instead of fetching in parallel.
+
+        Args:
+            storage_path: Supabase Storage path of the PDF.
+            fetch: Downloads the PDF bytes on a miss.
+
+        Returns:
+            Path of the cached blob. Treat it as read-only.
+        """
+        key = _sha256(storage_path.encode())
+
+        blob = self._lookup(key)
+        if blob is not None:
+            self.hits += 1
+            return blob
+
+        with self._key_lock(key), self._file_lock(key):
+            # Another worker may have filled it while we waited
+            blob = self._lookup(key)
+            if blob is not None:
+                self.hits += 1
+                return blob
+
+            self.misses += 1
+            content = fetch()
+            blob = self._store(key, content)
+            size = len(content)
+            del content
+
+        logger.info(
+            "pdf_blob_cache_miss",
+            storage_path=storage_path,
+            size_bytes=size,
+        )
+        self._evict(keep=blob)
+        return blob
+
+    @contextmanager
+    def open_mmap(
+        self,
+        storage_path: str,
+        fetch: Callable[[], bytes],
+    ) -> Iterator[mmap.mmap | bytes]:
+        """Memory-map the cached PDF for reading (see map_file).
+
+        Args:
+            storage_path: Supabase Storage path of the PDF.
+            fetch: Downloads the PDF bytes on a miss.
+
+        Yields:
+            Read-only mmap of the PDF.
+        """
+        with map_file(self.get_path(storage_path, fetch)) as mapped:
+            yield mapped
+
+    def total_bytes(self) -> int:
+        """Total size of cached blobs."""
+        return sum(size for _, size, _ in self._scan_blobs())
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _lookup(self, key: str) -> Path | None:
+        """Resolve a path key to its blob, bumping it for LRU.
+
+        Returns None (a miss) when the entry is missing, expired, or its blob
+        was evicted or does not have the recorded size; the entry is replaced
+        on the next store.
+        """
+        entry = self._index / key
+        try:
+            stored_at = entry.stat().st_mtime
+            content_hash, size = entry.read_text().split()
+        except (FileNotFoundError, ValueError):
+            return None  # ValueError: entry from before sizes were recorded
+
+        if time.time() - stored_at > self.index_ttl_seconds:
+            logger.debug("pdf_blob_cache_index_expired", key=key)
+            return None
+
+        blob = self._blob_path(content_hash)
+        try:
+            if blob.stat().st_size != int(size):
+                logger.warning("pdf_blob_cache_size_mismatch", key=key, blob=blob.name)
+                return None
+            os.utime(blob)
+        except FileNotFoundError:
+            return None  # Evicted
+        return blob
+
+    def _store(self, key: str, content: bytes) -> Path:
+        """Write blob and index entry atomically."""
+        content_hash = _sha256(content)
+        blob = self._blob_path(content_hash)
+
+        if blob.exists():
+            # Same bytes under another storage path - share the blob
+            os.utime(blob)
+        else:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(blob, content)
+
+        _atomic_write(self._index / key, f"{content_hash} {len(content)}".encode())
+        return blob
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used blobs until under the byte budget."""
+        with self._evict_lock:
+            blobs = self._scan_blobs()
+            total = sum(size for _, size, _ in blobs)
+            if total <= self.max_bytes:
+                return
+
+            evicted = 0
+            for path, size, _ in sorted(blobs, key=lambda item: item[2]):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                with suppress(FileNotFoundError):  # Another process evicted it first
+                    path.unlink()
+                total -= size
+                evicted += 1
+
+            logger.info(
+                "pdf_blob_cache_evicted",
+                evicted=evicted,
+                total_bytes=total,
+                max_bytes=self.max_bytes,
+            )
+
+    def _scan_blobs(self) -> list[tuple[Path, int, float]]:
+        """List (path, size, mtime) for every blob."""
+        blobs = []
+        for path in self._blobs.glob("*/*"):
+            if path.name.startswith("."):
+                continue  # In-flight temp file
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            blobs.append((path, stat.st_size, stat.st_mtime))
+        return blobs
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self._blobs / content_hash[:2] / content_hash
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        """Exclusive lock within this process, removed once no thread uses it."""
+        with self._key_locks_guard:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = _KeyLock()
+            entry.users += 1
+        try:
+            with entry.lock:
+                yield
+        finally:
+            with self._key_locks_guard:
+                entry.users -= 1
+                if entry.users == 0:
+                    del self._key_locks[key]
+
+    @contextmanager
+    def _file_lock(self, key: str) -> Iterator[None]:
+        """Exclusive lock across worker processes on this host.
+
+        Polls with LOCK_NB so a waiting greenlet yields to the gevent hub
+        instead of blocking the whole worker. After FILE_LOCK_TIMEOUT_SECONDS
+        it proceeds unlocked: writes are atomic, so the worst case is a
+        duplicate download.
+
+        The holder deletes the lock file before unlocking. A waiter that then
+        gets the lock on the deleted file opens the path again, so every
+        holder locks the file currently at the path.
+        """
+        if fcntl is None:
+            yield
+            return
+        lock_path = self._locks / f"{key}.lock"
+        deadline = time.monotonic() + FILE_LOCK_TIMEOUT_SECONDS
+        while True:
+            lock_file = open(lock_path, "a")  # noqa: SIM115 - closed below
+            locked = _try_flock(lock_file.fileno())
+            while not locked and time.monotonic() < deadline:
+                time.sleep(FILE_LOCK_POLL_SECONDS)
+                locked = _try_flock(lock_file.fileno())
+            if not locked or _is_same_file(lock_file.fileno(), lock_path):
+                break
+            lock_file.close()  # Locked a file its holder already deleted
+
+        if not locked:
+            logger.warning("pdf_blob_cache_lock_timeout", key=key)
+        try:
+            yield
+        finally:
+            if locked:
+                with suppress(FileNotFoundError):
+                    lock_path.unlink()
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+@contextmanager
+def map_file(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map a file read-only.
+
+    The mapping is file-like (read/seek/tell) and supports slicing, so it can
+    be handed to pypdf or sliced for header checks without holding a full
+    bytes copy. Empty files cannot be mapped and yield b"".
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def _try_flock(fd: int) -> bool:
+    """Take an exclusive flock without blocking; False if another holder has it."""
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return False
+    return True
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    """Whether the open file is still the one at path."""
+    try:
+        at_path = path.stat()
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (at_path.st_dev, at_path.st_ino)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _atomic_write(target: Path, content: bytes) -> None:
+    """Write content to target so readers see either nothing or all of it."""
+    fd, tmp_name = tempfile.mkstemp(prefix=".", dir=target.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            view = memoryview(content)
+            for offset in range(0, len(view), COPY_BUFFER_SIZE):
+                f.write(view[offset:offset + COPY_BUFFER_SIZE])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, target)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+# =============================================================================
+# Factory
+# =============================================================================
+
+
+@lru_cache(maxsize=1)
+def get_pdf_blob_cache() -> PDFBlobCache | None:
+    """Get the worker-local PDF blob cache.
+
+    Returns:
+        PDFBlobCache, or None when disabled or the directory is unusable
+        (callers then download directly).
+    """
+    settings = get_settings()
+    if not settings.pdf_blob_cache_enabled:
+        return None
+
+    root = settings.pdf_blob_cache_dir or os.path.join(
+        tempfile.gettempdir(), DEFAULT_CACHE_DIRNAME
+    )
+    try:
+        cache = PDFBlobCache(
+            root,
+            max_bytes=settings.pdf_blob_cache_max_bytes,
+            index_ttl_seconds=settings.pdf_blob_cache_index_ttl_seconds,
+        )
+    except OSError as e:
+        logger.warning("pdf_blob_cache_unavailable", root=root, error=str(e))
+        return None
+
+    logger.info(
+        "pdf_blob_cache_initialized",
+        root=root,
+        max_bytes=settings.pdf_blob_cache_max_bytes,
+    )
+    return cache
+
+
+# =============================================================================
+# Storage Helpers
+# =============================================================================
+
+
+def get_storage_pdf_path(storage: "StorageService", storage_path: str) -> Path | None:
+    """Get a local read-only path for a stored PDF, downloading once per host.
+
+    Args:
+        storage: Storage service used to download on a miss.
+        storage_path: Supabase Storage path of the PDF.
+
+    Returns:
+        Cached blob path, or None if the cache is unavailable.
+
+    Raises:
+        StorageError: If the download fails.
+    """
+    cache = get_pdf_blob_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get_path(storage_path, fetch=lambda: storage.download_file(storage_path))
+    except OSError as e:
+        logger.warning("pdf_blob_cache_failed", storage_path=storage_path, error=str(e))
+        return None
+
+
+@contextmanager
+def open_storage_pdf_blob(
+    storage: "StorageService",
+    storage_path: str,
+) -> Iterator[tuple[mmap.mmap | bytes, str | None]]:
+    """Open a stored PDF through the blob cache, with its content sha256.
+
+    Blobs are named by the sha256 of their content, so callers verifying a
+    PDF manifest can compare against it instead of hashing the file again.
+
+    Args:
+        storage: Storage service used to download on a miss.
+        storage_path: Supabase Storage path of the PDF.
+
+    Yields:
+        (content, sha256): memory-mapped PDF and its sha256, or downloaded
+        bytes and None when the cache is unavailable.
+
+    Raises:
+        StorageError: If the download fails.
+    """
+    blob = get_storage_pdf_path(storage, storage_path)
+    if blob is None:
+        yield storage.download_file(storage_path), None
+        return
+
+    with ExitStack() as stack:
+        content_sha256: str | None = blob.name  # Blobs are content-addressed
+        try:
+            content = stack.enter_context(map_file(blob))
+        except FileNotFoundError:
+            # Evicted by another worker between lookup and open
+            content = storage.download_file(storage_path)
+            content_sha256 = None
+        yield content, content_sha256
+
+
+@contextmanager
+def open_storage_pdf(
+    storage: "StorageService",
+    storage_path: str,
+) -> Iterator[mmap.mmap | bytes]:
+    """Open a stored PDF through the blob cache as a read-only memory map.
+
+    Falls back to a direct download (bytes) when the cache is unavailable.
+
+    Args:
+        storage: Storage service used to download on a miss.
+        storage_path: Supabase Storage path of the PDF.
+
+    Yields:
+        Memory-mapped PDF content (or bytes on fallback).
+
+    Raises:
+        StorageError: If the download fails.
+    """
+    with open_storage_pdf_blob(storage, storage_path) as (content, _):
+        yield content
+
+
+def read_storage_pdf(storage: "StorageService", storage_path: str) -> bytes:
+    """Read a stored PDF as bytes, downloading only on a cache miss.
+
+    For callers that must pass bytes on (e.g. to Document AI).
+    """
+    blob = get_storage_pdf_path(storage, storage_path)
+    if blob is not None:
+        try:
+            return blob.read_bytes()
+        except FileNotFoundError:
+            pass  # Evicted by another worker between lookup and read
+    return storage.download_file(storage_path)
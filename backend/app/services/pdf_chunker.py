@@ -13,6 +13,10 @@ Memory Safety (Story 17.1):
 - Only current page + output buffer in memory at any time
 - Atomic write pattern (.tmp then rename) prevents corruption
 - Memory profiling warns at 75% of limit
+
+A verified PDF manifest (see pdf_manifest) can be passed to the split
+methods: the page count and pages then come from it instead of a page
+tree walk.
 """
 
 import os
@@ -20,6 +24,7 @@ import shutil
 import tempfile
 import threading
 import tracemalloc
+from collections.abc import Callable
 from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
@@ -27,6 +32,8 @@ from pathlib import Path
 import pypdf
 import structlog
 
+from app.services.pdf_manifest import PDFManifest, page_getter
+
 logger = structlog.get_logger(__name__)
 
 # Configuration
@@ -190,6 +197,7 @@ class PDFChunker:
         self,
         pdf_bytes: bytes,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        manifest: PDFManifest | None = None,
     ) -> list[tuple[bytes, int, int]]:
         """Split PDF into chunks of specified size.
 
@@ -202,6 +210,7 @@ class PDFChunker:
         Args:
             pdf_bytes: Source PDF content.
             chunk_size: Maximum pages per chunk (default 25).
+            manifest: Optional PDF manifest already verified against pdf_bytes.
 
         Returns:
             List of tuples: (chunk_bytes, page_start, page_end)
@@ -222,7 +231,8 @@ class PDFChunker:
 
         try:
             reader = pypdf.PdfReader(BytesIO(pdf_bytes))
-            total_pages = len(reader.pages)
+            total_pages = manifest.page_count if manifest is not None else len(reader.pages)
+            get_page = page_getter(reader, manifest)
 
             if total_pages == 0:
                 raise PDFChunkerError("PDF has no pages", code="EMPTY_PDF")
@@ -241,6 +251,7 @@ class PDFChunker:
                     reader,
                     page_start - 1,  # Convert to 0-based for pypdf
                     page_end - 1,
+                    get_page,
                 )
 
                 chunks.append((chunk_bytes, page_start, page_end))
@@ -279,6 +290,7 @@ class PDFChunker:
         self,
         pdf_bytes: bytes,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        manifest: PDFManifest | None = None,
     ) -> StreamingChunkResult:
         """Split PDF into chunks using streaming with temp files.
 
@@ -294,6 +306,7 @@ class PDFChunker:
         Args:
             pdf_bytes: Source PDF content.
             chunk_size: Maximum pages per chunk (default 25).
+            manifest: Optional PDF manifest already verified against pdf_bytes.
 
         Returns:
             StreamingChunkResult with paths to chunk files.
@@ -317,7 +330,8 @@ class PDFChunker:
 
         try:
             reader = pypdf.PdfReader(BytesIO(pdf_bytes))
-            total_pages = len(reader.pages)
+            total_pages = manifest.page_count if manifest is not None else len(reader.pages)
+            get_page = page_getter(reader, manifest)
 
             if total_pages == 0:
                 raise PDFChunkerError("PDF has no pages", code="EMPTY_PDF")
@@ -339,6 +353,7 @@ class PDFChunker:
                     end_index=page_end - 1,
                     output_dir=temp_dir,
                     chunk_index=chunk_index,
+                    get_page=get_page,
                 )
 
                 chunks.append((chunk_path, page_start, page_end))
@@ -390,6 +405,7 @@ class PDFChunker:
         reader: pypdf.PdfReader,
         start_index: int,
         end_index: int,
+        get_page: Callable[[int], pypdf.PageObject] | None = None,
     ) -> bytes:
         """Extract a range of pages as a new PDF.
 
@@ -400,14 +416,17 @@ class PDFChunker:
             reader: Source PDF reader.
             start_index: Start page index (0-based).
             end_index: End page index (0-based, inclusive).
+            get_page: Optional page accessor (pdf_manifest.page_getter);
+                defaults to reader.pages.
 
         Returns:
             PDF bytes containing only the specified pages.
         """
+        get_page = get_page or page_getter(reader, None)
         writer = pypdf.PdfWriter()
 
         for page_index in range(start_index, end_index + 1):
-            writer.add_page(reader.pages[page_index])
+            writer.add_page(get_page(page_index))
 
         buffer = BytesIO()
         writer.write(buffer)
@@ -420,6 +439,7 @@ class PDFChunker:
         end_index: int,
         output_dir: Path,
         chunk_index: int,
+        get_page: Callable[[int], pypdf.PageObject] | None = None,
     ) -> Path:
         """Extract pages to a file using atomic write pattern.
 
@@ -434,6 +454,8 @@ class PDFChunker:
             end_index: End page index (0-based, inclusive).
             output_dir: Directory to write chunk file.
             chunk_index: Chunk index for filename.
+            get_page: Optional page accessor (pdf_manifest.page_getter);
+                defaults to reader.pages.
 
         Returns:
             Path to the created chunk file.
@@ -441,10 +463,11 @@ class PDFChunker:
         final_path = output_dir / f"chunk_{chunk_index}.pdf"
         tmp_path = output_dir / f"chunk_{chunk_index}.pdf.tmp"
 
+        get_page = get_page or page_getter(reader, None)
         writer = pypdf.PdfWriter()
 
         for page_index in range(start_index, end_index + 1):
-            writer.add_page(reader.pages[page_index])
+            writer.add_page(get_page(page_index))
 
         try:
             # Write to temp file first
@@ -498,6 +521,7 @@ class PDFChunker:
         pdf_bytes: bytes,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         timeout_seconds: int = SPLIT_TIMEOUT_SECONDS,
+        manifest: PDFManifest | None = None,
     ) -> list[tuple[bytes, int, int]]:
         """Split PDF with timeout protection.
 
@@ -508,6 +532,7 @@ class PDFChunker:
             pdf_bytes: Source PDF content.
             chunk_size: Maximum pages per chunk.
             timeout_seconds: Max time allowed for operation.
+            manifest: Optional PDF manifest already verified against pdf_bytes.
 
         Returns:
             List of chunk tuples.
@@ -521,7 +546,7 @@ class PDFChunker:
         def split_worker():
             nonlocal result, error
             try:
-                result = self.split_pdf(pdf_bytes, chunk_size)
+                result = self.split_pdf(pdf_bytes, chunk_size, manifest)
             except Exception as e:
                 error = e
 
@@ -0,0 +1,366 @@
+"""PDF manifest: parse a PDF's page tree once and reuse it everywhere.
+
+Routing (PDFRouter), splitting (PDFChunker, OCRProcessor, chunked OCR tasks)
+and job recovery all need the page count and access to specific pages.
+Building a fresh pypdf reader and calling ``len(reader.pages)`` walks the
+entire page tree every time, which dominates start-up for 1,000-page PDFs.
+
+The manifest is computed once, by the build_document_pdf_manifest task
+queued at upload (off the OCR path), and persisted in document_pdf_manifests.
+It records the file's sha256, the verified page count and, per page, the page
+object reference, the page object's byte range in the file and a hash of its
+raw content streams. Consumers (process_document's page count, PDFRouter,
+PDFChunker, OCRProcessor, chunked OCR tasks, job recovery) then:
+- take the page count straight from the manifest (no parse at all), and
+- load only the page objects they need by reference (no page tree walk),
+  resolving inheritable attributes from the page's /Parent chain.
+
+A manifest is only trusted when the PDF at hand has the recorded size and
+sha256. That check runs once per stage, against the content hash the blob
+cache already keyed the PDF by, and the verified manifest is passed on;
+without a verified manifest callers fall back to a full parse.
+"""
+
+import hashlib
+import mmap
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from io import BytesIO
+from typing import Any
+
+import pypdf
+import structlog
+from pypdf.generic import IndirectObject, NameObject
+
+logger = structlog.get_logger(__name__)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+MANIFEST_VERSION = 2  # 2: adds file_sha256
+MAX_MANIFEST_PAGES = 10000  # Same security limit as PDFRouter.MAX_PAGE_COUNT
+
+# Page attributes a /Page may inherit from its /Pages ancestors (PDF 32000 7.7.3.4)
+INHERITABLE_PAGE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+MAX_PAGE_TREE_DEPTH = 64
+
+
+class PDFManifestError(Exception):
+    """Raised when a manifest cannot be built or does not match its PDF."""
+
+    def __init__(self, message: str, code: str = "PDF_MANIFEST_ERROR"):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+# =============================================================================
+# Manifest Model
+# =============================================================================
+
+
+@dataclass
+class PageManifestEntry:
+    """One page of a PDF manifest (page_number is 1-based)."""
+
+    page_number: int
+    object_number: int
+    generation: int
+    byte_start: int | None  # None when the page dict lives in an object stream
+    byte_end: int | None
+    content_hash: str  # sha256 of the page's raw content stream bytes
+
+
+@dataclass
+class PDFManifest:
+    """Parse-once description of a PDF's pages."""
+
+    page_count: int
+    file_size: int
+    file_sha256: str
+    pages: list[PageManifestEntry] = field(default_factory=list)
+    version: int = MANIFEST_VERSION
+
+    def matches(
+        self,
+        pdf: bytes | mmap.mmap,
+        content_sha256: str | None = None,
+    ) -> bool:
+        """Whether this manifest describes the given PDF bytes.
+
+        Call once per PDF and hand the verified manifest on; consumers
+        (page count, OCR splitting, extract_page_range) trust it as given.
+        The size is compared first so most mismatches skip hashing; a
+        same-size replacement is caught by the content hash.
+
+        Args:
+            pdf: PDF content (bytes or a read-only memory map).
+            content_sha256: sha256 of pdf if the caller already has it
+                (e.g. the blob cache's content address); hashed otherwise.
+        """
+        if len(pdf) != self.file_size or len(self.pages) != self.page_count:
+            return False
+        if content_sha256 is None:
+            content_sha256 = hashlib.sha256(pdf).hexdigest()
+        return content_sha256 == self.file_sha256
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize column-wise to keep the JSONB payload compact."""
+        return {
+            "version": self.version,
+            "page_count": self.page_count,
+            "file_size": self.file_size,
+            "file_sha256": self.file_sha256,
+            "objects": [[p.object_number, p.generation] for p in self.pages],
+            "ranges": [[p.byte_start, p.byte_end] for p in self.pages],
+            "content_hashes": [p.content_hash for p in self.pages],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "PDFManifest | None":
+        """Deserialize a stored manifest.
+
+        Returns:
+            PDFManifest, or None if data is missing, malformed or from an
+            unsupported version (callers then parse the PDF).
+        """
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        try:
+            pages = [
+                PageManifestEntry(
+                    page_number=index + 1,
+                    object_number=int(obj[0]),
+                    generation=int(obj[1]),
+                    byte_start=rng[0],
+                    byte_end=rng[1],
+                    content_hash=str(content_hash),
+                )
+                for index, (obj, rng, content_hash) in enumerate(
+                    zip(
+                        data["objects"],
+                        data["ranges"],
+                        data["content_hashes"],
+                        strict=True,
+                    )
+                )
+            ]
+            return cls(
+                page_count=int(data["page_count"]),
+                file_size=int(data["file_size"]),
+                file_sha256=str(data["file_sha256"]),
+                pages=pages,
+            )
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+
+# =============================================================================
+# Building
+# =============================================================================
+
+
+def open_reader(pdf: bytes | mmap.mmap) -> pypdf.PdfReader:
+    """Create a pypdf reader over bytes or a memory map without copying."""
+    return pypdf.PdfReader(BytesIO(pdf) if isinstance(pdf, bytes) else pdf)
+
+
+def build_pdf_manifest(
+    pdf: bytes | mmap.mmap,
+    content_sha256: str | None = None,
+) -> PDFManifest:
+    """Parse a PDF once and describe its pages.
+
+    Args:
+        pdf: PDF content (bytes or a read-only memory map).
+        content_sha256: sha256 of pdf if already known; hashed otherwise.
+
+    Returns:
+        PDFManifest with verified page count and per-page entries.
+
+    Raises:
+        PDFManifestError: If the PDF cannot be parsed or has too many pages.
+    """
+    try:
+        reader = open_reader(pdf)
+        page_count = len(reader.pages)
+    except pypdf.errors.PdfReadError as e:
+        raise PDFManifestError(f"Failed to parse PDF: {e}", code="PDF_PARSE_ERROR") from e
+
+    if page_count > MAX_MANIFEST_PAGES:
+        raise PDFManifestError(
+            f"PDF has {page_count} pages, exceeds max {MAX_MANIFEST_PAGES}",
+            code="PAGE_LIMIT_EXCEEDED",
+        )
+
+    ranges = _object_byte_ranges(reader, len(pdf))
+    pages: list[PageManifestEntry] = []
+    for index, page in enumerate(reader.pages):
+        ref = page.indirect_reference
+        if ref is None:
+            raise PDFManifestError(
+                f"Page {index + 1} is not an indirect object",
+                code="UNSUPPORTED_PAGE_TREE",
+            )
+        byte_start, byte_end = ranges.get((ref.idnum, ref.generation), (None, None))
+        pages.append(
+            PageManifestEntry(
+                page_number=index + 1,
+                object_number=ref.idnum,
+                generation=ref.generation,
+                byte_start=byte_start,
+                byte_end=byte_end,
+                content_hash=_content_hash(page, pdf, ranges),
+            )
+        )
+
+    logger.info(
+        "pdf_manifest_built",
+        page_count=page_count,
+        file_size=len(pdf),
+    )
+
+    return PDFManifest(
+        page_count=page_count,
+        file_size=len(pdf),
+        file_sha256=content_sha256 or hashlib.sha256(pdf).hexdigest(),
+        pages=pages,
+    )
+
+
+def _object_byte_ranges(
+    reader: pypdf.PdfReader,
+    file_size: int,
+) -> dict[tuple[int, int], tuple[int, int]]:
+    """Map (object number, generation) to [start, end) offsets in the file.
+
+    Objects inside object streams have no range of their own and are omitted.
+    """
+    offsets = sorted(
+        (offset, idnum, generation)
+        for generation, entries in reader.xref.items()
+        for idnum, offset in entries.items()
+        if offset
+    )
+    ranges: dict[tuple[int, int], tuple[int, int]] = {}
+    for position, (offset, idnum, generation) in enumerate(offsets):
+        end = offsets[position + 1][0] if position + 1 < len(offsets) else file_size
+        ranges[(idnum, generation)] = (offset, end)
+    return ranges
+
+
+def _content_hash(
+    page: pypdf.PageObject,
+    pdf: bytes | mmap.mmap,
+    ranges: dict[tuple[int, int], tuple[int, int]],
+) -> str:
+    """Hash the raw bytes of a page's content streams (no decompression)."""
+    digest = hashlib.sha256()
+    contents = page.get("/Contents")
+    refs = contents if isinstance(contents, list) else [contents]
+    for ref in refs:
+        if ref is None:
+            continue
+        if isinstance(ref, IndirectObject) and (ref.idnum, ref.generation) in ranges:
+            start, end = ranges[(ref.idnum, ref.generation)]
+            digest.update(pdf[start:end])
+        else:
+            digest.update(ref.get_object().get_data())
+    return digest.hexdigest()
+
+
+# =============================================================================
+# Using
+# =============================================================================
+
+
+def load_page(
+    reader: pypdf.PdfReader,
+    entry: PageManifestEntry,
+) -> pypdf.PageObject:
+    """Load one page by object reference, without walking the page tree.
+
+    Inheritable attributes missing from the page dict are resolved from its
+    /Parent chain, as pypdf does when flattening.
+
+    Raises:
+        PDFManifestError: If the referenced object is not a page.
+    """
+    ref = IndirectObject(entry.object_number, entry.generation, reader)
+    raw = ref.get_object()
+    if not isinstance(raw, dict) or raw.get("/Type") != "/Page":
+        raise PDFManifestError(
+            f"Object {entry.object_number} is not page {entry.page_number}",
+            code="MANIFEST_MISMATCH",
+        )
+
+    page = pypdf.PageObject(reader, ref)
+    page.update(raw)
+
+    parent = raw.get("/Parent")
+    depth = 0
+    while parent is not None and depth < MAX_PAGE_TREE_DEPTH:
+        missing = [attr for attr in INHERITABLE_PAGE_ATTRIBUTES if attr not in page]
+        if not missing:
+            break
+        node = parent.get_object()
+        for attr in missing:
+            if attr in node:
+                page[NameObject(attr)] = node[attr]
+        parent = node.get("/Parent")
+        depth += 1
+
+    return page
+
+
+def page_getter(
+    reader: pypdf.PdfReader,
+    manifest: PDFManifest | None,
+) -> Callable[[int], pypdf.PageObject]:
+    """Return a 0-based page accessor, served from the manifest when possible.
+
+    Falls back to reader.pages (full page tree walk) without a manifest or if
+    a referenced object turns out not to be the expected page.
+    """
+    if manifest is None:
+        return lambda index: reader.pages[index]
+
+    def _get(index: int) -> pypdf.PageObject:
+        try:
+            return load_page(reader, manifest.pages[index])
+        except PDFManifestError as e:
+            logger.warning("pdf_manifest_page_mismatch", page_index=index, error=e.message)
+            return reader.pages[index]
+
+    return _get
+
+
+def extract_page_range(
+    pdf: bytes | mmap.mmap,
+    page_start: int,
+    page_end: int,
+    manifest: PDFManifest | None = None,
+) -> bytes:
+    """Write pages page_start..page_end (1-based, inclusive) to a new PDF.
+
+    Args:
+        pdf: Source PDF (bytes or memory map).
+        page_start: First page (1-based).
+        page_end: Last page (1-based, inclusive).
+        manifest: Optional manifest already verified against pdf
+            (PDFManifest.matches).
+
+    Returns:
+        PDF bytes containing only the requested pages.
+    """
+    reader = open_reader(pdf)
+    get_page = page_getter(reader, manifest)
+    writer = pypdf.PdfWriter()
+    for page_index in range(page_start - 1, page_end):
+        writer.add_page(get_page(page_index))
+
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
@@ -13,6 +13,7 @@ import pypdf
 import structlog
 
 from app.models.ocr_chunk import ChunkSpec
+from app.services.pdf_manifest import PDFManifest
 
 logger = structlog.get_logger(__name__)
 
@@ -51,7 +52,11 @@ class PDFRouter:
         ...     specs = router.calculate_chunk_specs(count)
     """
 
-    def get_page_count(self, pdf_bytes: bytes) -> int:
+    def get_page_count(
+        self,
+        pdf_bytes: bytes,
+        manifest: PDFManifest | None = None,
+    ) -> int:
         """Get PDF page count without loading full content.
 
         Uses pypdf for lightweight page counting. Validates PDF
@@ -59,6 +64,8 @@ class PDFRouter:
 
         Args:
             pdf_bytes: PDF file content.
+            manifest: Optional PDF manifest already verified against
+                pdf_bytes; its page count is used instead of parsing.
 
         Returns:
             Number of pages in the PDF.
@@ -69,6 +76,19 @@ class PDFRouter:
         """
         self._validate_pdf_magic_bytes(pdf_bytes)
 
+        if manifest is not None:
+            # Built with the same page limit, but never route past it
+            if manifest.page_count > MAX_PAGE_COUNT:
+                raise MaliciousPDFError(
+                    f"PDF claims {manifest.page_count} pages, exceeds max {MAX_PAGE_COUNT}"
+                )
+            logger.debug(
+                "pdf_page_count_detected",
+                page_count=manifest.page_count,
+                source="manifest",
+            )
+            return manifest.page_count
+
         try:
             reader = pypdf.PdfReader(BytesIO(pdf_bytes))
             claimed_count = len(reader.pages)
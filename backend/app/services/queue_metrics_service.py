@@ -3,7 +3,9 @@
 Story 5.6: Queue Depth Visibility Dashboard
 
 Provides metrics for Celery queue depths, active workers, and processing trends.
-Uses direct Redis LLEN queries on Celery queue keys for real-time visibility.
+Queue depths (LLEN on Celery queue keys) and live workers (heartbeat registry,
+see worker_registry) are read in one pipelined round trip and cached for a
+few seconds, so status endpoints never wait on workers.
 
 CRITICAL: Celery stores queues in Redis as lists. The queue names in Redis are:
 - "celery" for the default queue (task_default_queue="default" maps to "celery" key)
@@ -11,13 +13,22 @@ CRITICAL: Celery stores queues in Redis as lists. The queue names in Redis are:
 - "low" for low priority queue
 """
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Literal
 
 import structlog
 
 from app.core.config import get_settings
+from app.services.worker_registry import (
+    WORKER_HEARTBEAT_INFO_KEY,
+    WORKER_HEARTBEATS_KEY,
+    WORKER_STALE_AFTER_SECONDS,
+    WorkerHeartbeat,
+    parse_live_workers,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -32,6 +43,12 @@ QUEUE_REDIS_KEYS = {
 # Default alert threshold (jobs pending before alert triggers)
 DEFAULT_ALERT_THRESHOLD = 100
 
+# How long a queue/worker snapshot is served before Redis is read again
+SNAPSHOT_TTL_SECONDS = 5
+
+# Keep status endpoints fast when Redis is slow or unreachable
+REDIS_SOCKET_TIMEOUT_SECONDS = 2.0
+
 
 @dataclass
 class QueueMetricsData:
@@ -47,13 +64,39 @@ class QueueMetricsData:
     alert_triggered: bool
 
 
+@dataclass
+class QueueSnapshot:
+    """Queue depths and live workers read at one point in time.
+
+    Attributes:
+        pending_by_queue: Pending jobs per logical queue name (None if the
+            queue could not be read).
+        workers: Heartbeats of live workers.
+        taken_at: time.monotonic() when the snapshot was read.
+    """
+
+    pending_by_queue: dict[str, int | None] = field(default_factory=dict)
+    workers: list[WorkerHeartbeat] = field(default_factory=list)
+    taken_at: float = 0.0
+
+    def active_count(self, queue_name: str) -> int:
+        """Tasks executing from a queue across live workers."""
+        return sum(w.active_by_queue.get(queue_name, 0) for w in self.workers)
+
+    @property
+    def total_capacity(self) -> int:
+        """Sum of live workers' pool sizes."""
+        return sum(w.concurrency for w in self.workers)
+
+
 class QueueMetricsService:
     """Service for collecting Celery queue metrics from Redis.
 
     Story 5.6: Queue Depth Visibility Dashboard
 
     This service queries Redis directly to get queue depths and worker status.
-    It uses the same Redis broker that Celery uses for task queuing.
+    It uses the same Redis broker that Celery uses for task queuing, where
+    workers also publish their heartbeats.
 
     Pre-mortem fixes implemented:
     - Include `last_checked_at` timestamp in response
@@ -75,6 +118,8 @@ class QueueMetricsService:
         self._redis = redis_client
         self._alert_threshold = alert_threshold
         self._settings = get_settings()
+        self._snapshot: QueueSnapshot | None = None
+        self._snapshot_lock = asyncio.Lock()
 
     async def _get_redis(self) -> object:
         """Get or create Redis client connected to Celery broker.
@@ -101,34 +146,105 @@ class QueueMetricsService:
                 broker_url,
                 decode_responses=True,
                 ssl=ssl_context,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
             )
         else:
-            self._redis = redis.from_url(broker_url, decode_responses=True)
+            self._redis = redis.from_url(
+                broker_url,
+                decode_responses=True,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            )
 
         return self._redis
 
-    async def get_queue_metrics(self, queue_name: str) -> QueueMetricsData:
-        """Get metrics for a single queue.
+    async def get_snapshot(self) -> QueueSnapshot:
+        """Get queue depths and live workers, cached for SNAPSHOT_TTL_SECONDS.
 
-        Args:
-            queue_name: Logical queue name (default, high, low).
+        Concurrent callers share one refresh. If Redis can't be read, an
+        empty snapshot is cached so the next callers don't wait on it again.
 
         Returns:
-            QueueMetricsData with current metrics.
+            Current QueueSnapshot.
         """
-        redis_key = QUEUE_REDIS_KEYS.get(queue_name, queue_name)
+        snapshot = self._snapshot
+        if snapshot and time.monotonic() - snapshot.taken_at < SNAPSHOT_TTL_SECONDS:
+            return snapshot
+
+        async with self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot and time.monotonic() - snapshot.taken_at < SNAPSHOT_TTL_SECONDS:
+                return snapshot
+
+            self._snapshot = await self._read_snapshot()
+            return self._snapshot
+
+    async def _read_snapshot(self) -> QueueSnapshot:
+        """Read queue depths and worker heartbeats in one round trip."""
+        queue_names = list(QUEUE_REDIS_KEYS.keys())
 
         try:
             redis_client = await self._get_redis()
-            pending_count = await redis_client.llen(redis_key)
+            pipe = redis_client.pipeline(transaction=False)
+            for queue_name in queue_names:
+                pipe.llen(QUEUE_REDIS_KEYS[queue_name])
+            pipe.zrangebyscore(
+                WORKER_HEARTBEATS_KEY,
+                time.time() - WORKER_STALE_AFTER_SECONDS,
+                "+inf",
+            )
+            pipe.hgetall(WORKER_HEARTBEAT_INFO_KEY)
+            results = await pipe.execute(raise_on_error=False)
         except Exception as e:
+            logger.warning("queue_snapshot_redis_error", error=str(e))
+            return QueueSnapshot(
+                pending_by_queue=dict.fromkeys(queue_names),
+                taken_at=time.monotonic(),
+            )
+
+        pending_by_queue: dict[str, int | None] = {}
+        for queue_name, result in zip(queue_names, results, strict=False):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "queue_metrics_redis_error",
+                    queue_name=queue_name,
+                    redis_key=QUEUE_REDIS_KEYS[queue_name],
+                    error=str(result),
+                )
+                pending_by_queue[queue_name] = None
+            else:
+                pending_by_queue[queue_name] = int(result)
+
+        live_hostnames, heartbeat_info = results[len(queue_names):]
+        if isinstance(live_hostnames, Exception) or isinstance(heartbeat_info, Exception):
             logger.warning(
-                "queue_metrics_redis_error",
-                queue_name=queue_name,
-                redis_key=redis_key,
-                error=str(e),
+                "worker_registry_read_failed",
+                error=str(
+                    live_hostnames if isinstance(live_hostnames, Exception) else heartbeat_info
+                ),
             )
-            pending_count = 0
+            workers = []
+        else:
+            workers = parse_live_workers(live_hostnames or [], heartbeat_info or {})
+
+        return QueueSnapshot(
+            pending_by_queue=pending_by_queue,
+            workers=workers,
+            taken_at=time.monotonic(),
+        )
+
+    async def get_queue_metrics(self, queue_name: str) -> QueueMetricsData:
+        """Get metrics for a single queue.
+
+        Args:
+            queue_name: Logical queue name (default, high, low).
+
+        Returns:
+            QueueMetricsData with current metrics.
+        """
+        snapshot = await self.get_snapshot()
+        pending_count = snapshot.pending_by_queue.get(queue_name) or 0
 
         # Determine trend (simplified - always stable for MVP)
         # Future: Compare against historical data stored in separate Redis key
@@ -139,7 +255,7 @@ class QueueMetricsService:
         return QueueMetricsData(
             queue_name=queue_name,
             pending_count=pending_count,
-            active_count=0,  # Would require Celery inspect() - expensive
+            active_count=snapshot.active_count(queue_name),
             failed_count=0,  # Would require result backend query
             completed_24h=0,  # Would require result backend query
             avg_processing_time_ms=0,  # Would require timing data
@@ -181,27 +297,17 @@ class QueueMetricsService:
         return metrics
 
     async def get_active_worker_count(self) -> int:
-        """Get count of active Celery workers.
+        """Get count of live Celery workers.
 
-        Uses Celery inspect() to query workers. This is relatively expensive
-        so should be called sparingly.
+        Read from the heartbeat registry snapshot, so it never waits on
+        workers (busy or unreachable workers simply age out).
 
         Returns:
-            Number of active workers, or 0 if unable to determine.
+            Number of live workers, or 0 if unable to determine.
         """
         try:
-            from app.workers.celery import celery_app
-
-            # inspect().active() returns dict of {worker_name: [tasks]}
-            # This is a synchronous call but fast
-            inspector = celery_app.control.inspect()
-            active = inspector.active()
-
-            if active is None:
-                logger.warning("celery_inspect_returned_none")
-                return 0
-
-            return len(active)
+            snapshot = await self.get_snapshot()
+            return len(snapshot.workers)
         except Exception as e:
             logger.warning(
                 "celery_worker_count_failed",
@@ -209,6 +315,19 @@ class QueueMetricsService:
             )
             return 0
 
+    async def get_worker_capacity(self) -> int:
+        """Get total concurrency (task slots) of live Celery workers.
+
+        Returns:
+            Sum of live workers' pool sizes, or 0 if unable to determine.
+        """
+        try:
+            snapshot = await self.get_snapshot()
+            return snapshot.total_capacity
+        except Exception as e:
+            logger.warning("celery_worker_capacity_failed", error=str(e))
+            return 0
+
     async def check_health(self) -> dict:
         """Check queue system health.
 
@@ -4,14 +4,18 @@ This module implements the hybrid search pattern for the RAG pipeline:
 1. BM25 keyword search via PostgreSQL tsvector
 2. Semantic search via pgvector HNSW index
 3. Reciprocal Rank Fusion (RRF) for result merging
+   (BM25 runs concurrently with query embedding; legs are fused client-side)
 4. Optional Cohere Rerank v3.5 for top-N refinement
 
 CRITICAL: All search operations enforce 4-layer matter isolation.
 The matter_id parameter is MANDATORY for every search query.
 """
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, replace
 from functools import lru_cache
+from typing import Any
 
 import structlog
 
@@ -33,6 +37,14 @@ logger = structlog.get_logger(__name__)
 DEFAULT_HYBRID_LIMIT = 50
 DEFAULT_RERANK_TOP_N = 3
 
+# Per-leg candidate cap, mirroring LEAST(match_count, 30) * 2 in the
+# hybrid_search_chunks RPC so client-side fusion ranks the same candidates
+MAX_LEG_LIMIT = 30
+
+# Minimum cosine similarity for semantic-only search. The fused legs are not
+# thresholded: RRF ranks candidates, so low-similarity chunks only add rank.
+SEMANTIC_SIMILARITY_THRESHOLD = 0.5
+
 
 # =============================================================================
 # Data Classes
@@ -199,6 +211,58 @@ class HybridSearchServiceError(Exception):
         super().__init__(message)
 
 
+# =============================================================================
+# RRF Fusion
+# =============================================================================
+
+def reciprocal_rank_fusion(
+    bm25_results: list[SearchResult],
+    semantic_results: list[SearchResult],
+    weights: SearchWeights,
+    rrf_k: int = 60,
+) -> list[SearchResult]:
+    """Fuse BM25 and semantic legs with weighted Reciprocal Rank Fusion.
+
+    Same formula as the hybrid_search_chunks RPC:
+    score = bm25_weight / (k + bm25_rank) + semantic_weight / (k + semantic_rank),
+    where ranks are 1-indexed positions within each leg.
+
+    Args:
+        bm25_results: BM25 leg, best first.
+        semantic_results: Semantic leg, best first.
+        weights: Weights for each leg.
+        rrf_k: RRF smoothing constant.
+
+    Returns:
+        Fused results sorted by rrf_score descending (ties keep BM25 order).
+    """
+    fused: dict[str, SearchResult] = {}
+
+    for rank, r in enumerate(bm25_results, start=1):
+        fused[r.id] = replace(
+            r,
+            bm25_rank=rank,
+            semantic_rank=None,
+            rrf_score=weights.bm25 / (rrf_k + rank),
+        )
+
+    for rank, r in enumerate(semantic_results, start=1):
+        score = weights.semantic / (rrf_k + rank)
+        existing = fused.get(r.id)
+        if existing is None:
+            fused[r.id] = replace(
+                r,
+                bm25_rank=None,
+                semantic_rank=rank,
+                rrf_score=score,
+            )
+        else:
+            existing.semantic_rank = rank
+            existing.rrf_score += score
+
+    return sorted(fused.values(), key=lambda r: r.rrf_score, reverse=True)
+
+
 # =============================================================================
 # Hybrid Search Service
 # =============================================================================
@@ -378,9 +442,19 @@ class HybridSearchService:
             rrf_k=rrf_k,
         )
 
+        # Start the BM25 leg immediately - it doesn't need the embedding, so
+        # search latency becomes max(embed + semantic, bm25) instead of the sum.
+        leg_limit = min(limit, MAX_LEG_LIMIT) * 2
+        bm25_start = time.perf_counter()
+        bm25_task = asyncio.create_task(
+            self._bm25_search_internal(query, matter_id, limit=leg_limit)
+        )
+
         try:
             # Generate query embedding for semantic search
+            embedding_start = time.perf_counter()
             query_embedding = await self.embedder.embed_text(query)
+            embedding_ms = (time.perf_counter() - embedding_start) * 1000
 
             # Handle embedding service failure (returns None when circuit is open or API fails)
             if query_embedding is None:
@@ -390,7 +464,7 @@ class HybridSearchService:
                     query_len=len(query),
                 )
                 # Fall back to BM25-only search when embeddings unavailable
-                bm25_results = await self._bm25_search_internal(query, matter_id, limit=limit)
+                bm25_results = (await bm25_task)[:limit]
                 return HybridSearchResult(
                     results=bm25_results,
                     query=query,
@@ -402,35 +476,22 @@ class HybridSearchService:
                     fallback_reason="Embedding service unavailable",
                 )
 
-            # Execute hybrid search via RPC
-            supabase = get_supabase_client()
-            if supabase is None:
-                raise HybridSearchServiceError(
-                    message="Database client not configured",
-                    code="DATABASE_NOT_CONFIGURED",
-                    is_retryable=False,
-                )
+            # Semantic leg starts as soon as the vector is ready
+            semantic_start = time.perf_counter()
+            semantic_results = await self._semantic_search_internal(
+                query_embedding, matter_id, limit=leg_limit
+            )
+            semantic_ms = (time.perf_counter() - semantic_start) * 1000
 
-            response = supabase.rpc(
-                "hybrid_search_chunks",
-                {
-                    "query_text": query,
-                    "query_embedding": query_embedding,
-                    "filter_matter_id": matter_id,
-                    "match_count": limit,
-                    "full_text_weight": weights.bm25,
-                    "semantic_weight": weights.semantic,
-                    "rrf_k": rrf_k,
-                    "filter_model_version": get_current_embedding_model_version(),
-                }
-            ).execute()
-
-            if response.data is None or len(response.data) == 0:
+            bm25_results = await bm25_task
+            bm25_ms = (time.perf_counter() - bm25_start) * 1000
+
+            if not semantic_results:
                 # Check if embeddings are incomplete (optimistic RAG)
                 total_chunks, embedded_chunks, completion_pct = await self._check_embedding_status(matter_id)
 
                 if total_chunks > 0 and embedded_chunks < total_chunks:
-                    # Embeddings incomplete - fall back to BM25-only for optimistic search
+                    # Embeddings incomplete - serve the BM25 leg on its own
                     logger.info(
                         "optimistic_bm25_fallback",
                         matter_id=matter_id,
@@ -438,10 +499,11 @@ class HybridSearchService:
                         total_chunks=total_chunks,
                         embedded_chunks=embedded_chunks,
                         completion_pct=round(completion_pct, 1),
+                        bm25_count=len(bm25_results),
                     )
-                    bm25_results = await self._bm25_search_internal(query, matter_id, limit=limit)
+                    results = bm25_results[:limit]
                     return HybridSearchResult(
-                        results=bm25_results,
+                        results=results,
                         query=query,
                         matter_id=matter_id,
                         weights=weights,
@@ -451,6 +513,7 @@ class HybridSearchService:
                         fallback_reason=f"Embeddings {int(completion_pct)}% complete",
                     )
 
+            if not bm25_results and not semantic_results:
                 # No chunks or all embedded but still no results
                 logger.warning(
                     "hybrid_search_no_results",
@@ -465,32 +528,22 @@ class HybridSearchService:
                     total_candidates=0,
                 )
 
-            # Validate results (defense in depth - Layer 2)
-            validated = validate_search_results(response.data, matter_id)
-
-            # Map to typed results
-            results = [
-                SearchResult(
-                    id=str(r["id"]),
-                    matter_id=str(r["matter_id"]),
-                    document_id=str(r["document_id"]),
-                    content=r["content"],
-                    page_number=r.get("page_number"),
-                    bbox_ids=[str(b) for b in r.get("bbox_ids") or []],
-                    chunk_type=r["chunk_type"],
-                    token_count=r.get("token_count") or 0,
-                    bm25_rank=r.get("bm25_rank"),
-                    semantic_rank=r.get("semantic_rank"),
-                    rrf_score=r["rrf_score"],
-                )
-                for r in validated
-            ]
+            fused = reciprocal_rank_fusion(
+                bm25_results,
+                semantic_results,
+                weights=weights,
+                rrf_k=rrf_k,
+            )
+            results = fused[:limit]
 
             logger.info(
                 "hybrid_search_complete",
                 matter_id=matter_id,
                 result_count=len(results),
                 top_score=results[0].rrf_score if results else 0,
+                embedding_ms=round(embedding_ms, 1),
+                bm25_ms=round(bm25_ms, 1),
+                semantic_ms=round(semantic_ms, 1),
             )
 
             return HybridSearchResult(
@@ -498,7 +551,7 @@ class HybridSearchService:
                 query=query,
                 matter_id=matter_id,
                 weights=weights,
-                total_candidates=len(response.data),
+                total_candidates=len(fused),
             )
 
         except HybridSearchServiceError:
@@ -522,6 +575,10 @@ class HybridSearchService:
                 code="SEARCH_FAILED",
                 is_retryable=True,
             ) from e
+        finally:
+            # Never leave the BM25 leg running if the embedding leg failed
+            if not bm25_task.done():
+                bm25_task.cancel()
 
     async def _bm25_search_internal(
         self,
@@ -550,14 +607,18 @@ class HybridSearchService:
                     is_retryable=False,
                 )
 
-            response = supabase.rpc(
-                "bm25_search_chunks",
-                {
-                    "query_text": query,
-                    "filter_matter_id": matter_id,
-                    "match_count": limit,
-                }
-            ).execute()
+            def _query():
+                return supabase.rpc(
+                    "bm25_search_chunks",
+                    {
+                        "query_text": query,
+                        "filter_matter_id": matter_id,
+                        "match_count": limit,
+                    }
+                ).execute()
+
+            # Off the event loop so the leg overlaps with query embedding
+            response = await asyncio.to_thread(_query)
 
             if not response.data:
                 return []
@@ -575,11 +636,11 @@ class HybridSearchService:
                     bbox_ids=[str(b) for b in r.get("bbox_ids") or []],
                     chunk_type=r["chunk_type"],
                     token_count=r.get("token_count") or 0,
-                    bm25_rank=r.get("row_num"),
+                    bm25_rank=r.get("row_num") or idx + 1,
                     semantic_rank=None,
                     rrf_score=r.get("rank") or 0,
                 )
-                for r in validated
+                for idx, r in enumerate(validated)
             ]
 
         except HybridSearchServiceError:
@@ -639,6 +700,93 @@ class HybridSearchService:
             fallback_reason=None,
         )
 
+    async def _semantic_search_internal(
+        self,
+        query_embedding: list[float],
+        matter_id: str,
+        limit: int = 30,
+        similarity_threshold: float | None = None,
+    ) -> list[SearchResult]:
+        """Internal semantic search for an already-embedded query.
+
+        Without a threshold this is the hybrid search leg (fused client-side
+        with the BM25 leg) and calls the internal semantic_leg_search_chunks
+        RPC. The public semantic_search method passes a threshold and calls
+        semantic_search_chunks.
+
+        Args:
+            query_embedding: Query vector from the embedding service.
+            matter_id: matter UUID for isolation.
+            limit: Max results to return.
+            similarity_threshold: Minimum similarity, or None for the
+                unthresholded fusion leg.
+
+        Returns:
+            List of search results ranked by semantic similarity.
+        """
+        try:
+            supabase = get_supabase_client()
+            if supabase is None:
+                raise HybridSearchServiceError(
+                    message="Database client not configured",
+                    code="DATABASE_NOT_CONFIGURED",
+                    is_retryable=False,
+                )
+
+            params: dict[str, Any] = {
+                "query_embedding": query_embedding,
+                "filter_matter_id": matter_id,
+                "match_count": limit,
+                "filter_model_version": get_current_embedding_model_version(),
+            }
+            if similarity_threshold is None:
+                rpc_name = "semantic_leg_search_chunks"
+            else:
+                rpc_name = "semantic_search_chunks"
+                params["similarity_threshold"] = similarity_threshold
+
+            def _query():
+                return supabase.rpc(rpc_name, params).execute()
+
+            response = await asyncio.to_thread(_query)
+
+            if not response.data:
+                return []
+
+            # Validate results
+            validated = validate_search_results(response.data, matter_id)
+
+            return [
+                SearchResult(
+                    id=str(r["id"]),
+                    matter_id=str(r["matter_id"]),
+                    document_id=str(r["document_id"]),
+                    content=r["content"],
+                    page_number=r.get("page_number"),
+                    bbox_ids=[str(b) for b in r.get("bbox_ids") or []],
+                    chunk_type=r["chunk_type"],
+                    token_count=r.get("token_count") or 0,
+                    bm25_rank=None,
+                    semantic_rank=r.get("row_num") or idx + 1,
+                    rrf_score=r.get("similarity") or 0,
+                )
+                for idx, r in enumerate(validated)
+            ]
+
+        except HybridSearchServiceError:
+            raise
+        except Exception as e:
+            logger.error(
+                "semantic_search_internal_failed",
+                matter_id=matter_id,
+                error=str(e),
+            )
+            raise HybridSearchServiceError(
+                message=f"Semantic search failed: {e!s}",
+                code="SEMANTIC_SEARCH_FAILED",
+                is_retryable=True,
+            ) from e
+
     async def semantic_search(
         self,
         query: str,
@@ -686,45 +834,12 @@ class HybridSearchService:
                     is_retryable=True,
                 )
 
-            supabase = get_supabase_client()
-            if supabase is None:
-                raise HybridSearchServiceError(
-                    message="Database client not configured",
-                    code="DATABASE_NOT_CONFIGURED",
-                    is_retryable=False,
-                )
-
-            response = supabase.rpc(
-                "semantic_search_chunks",
-                {
-                    "query_embedding": query_embedding,
-                    "filter_matter_id": matter_id,
-                    "match_count": limit,
-                }
-            ).execute()
-
-            if not response.data:
-                return []
-
-            # Validate results
-            validated = validate_search_results(response.data, matter_id)
-
-            return [
-                SearchResult(
-                    id=str(r["id"]),
-                    matter_id=str(r["matter_id"]),
-                    document_id=str(r["document_id"]),
-                    content=r["content"],
-                    page_number=r.get("page_number"),
-                    bbox_ids=[str(b) for b in r.get("bbox_ids") or []],
-                    chunk_type=r["chunk_type"],
-                    token_count=r.get("token_count") or 0,
-                    bm25_rank=None,
-                    semantic_rank=r.get("row_num"),
-                    rrf_score=r.get("similarity") or 0,
-                )
-                for r in validated
-            ]
+            return await self._semantic_search_internal(
+                query_embedding,
+                matter_id,
+                limit=limit,
+                similarity_threshold=SEMANTIC_SIMILARITY_THRESHOLD,
+            )
 
         except HybridSearchServiceError:
             raise
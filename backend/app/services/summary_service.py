@@ -8,15 +8,24 @@ Generates AI-powered executive summaries for matters by:
 3. Caching results in Redis with 1-hour TTL
 4. Applying language policing to all generated content
 
+Summaries are precomputed by a background job when a matter's processing
+goes quiet (see app.workers.tasks.summary_tasks) and stored, versioned, in
+matter_summaries. The request path only reads the stored summary. A rebuild
+re-runs the LLM only for sections whose inputs changed.
+
 CRITICAL: Uses GPT-4 per LLM routing rules (ADR-002).
 Summary generation = user-facing, accuracy critical.
 """
 
 import asyncio
+import hashlib
 import json
 import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from functools import lru_cache
+from typing import Any
 
 import structlog
 
@@ -49,6 +58,7 @@ from app.models.summary import (
     SubjectMatter,
     SubjectMatterSource,
     SummarySectionTypeEnum,
+    SummaryStatus,
 )
 from app.services.memory.redis_client import get_redis_client
 from app.services.memory.redis_keys import SUMMARY_CACHE_TTL, summary_cache_key
@@ -73,6 +83,18 @@ MAX_KEY_ISSUES = 5
 # Maximum chunks to use for GPT-4 generation context
 MAX_CHUNKS_FOR_SUMMARY = 10
 
+# Chunks sampled across documents for the summary sections
+SUMMARY_TOP_CHUNKS = 15
+
+# Fallback text when subject matter generation fails
+SUBJECT_MATTER_UNAVAILABLE = "Unable to generate summary at this time."
+
+# Placeholder text for LLM sections until the first precompute is stored
+SUMMARY_PENDING = "Summary is being prepared."
+
+# Summary sections produced by the LLM (fingerprinted for selective rebuilds)
+LLM_SECTIONS = ("subject_matter", "key_issues", "current_status")
+
 
 # =============================================================================
 # Story 14.1: Exceptions
@@ -108,6 +130,63 @@ class OpenAIConfigurationError(SummaryServiceError):
         super().__init__(message, code="OPENAI_NOT_CONFIGURED", status_code=503)
 
 
+@dataclass
+class StoredSummary:
+    """Precomputed summary row from matter_summaries."""
+
+    summary: MatterSummary
+    version: int
+    section_fingerprints: dict[str, str] = field(default_factory=dict)
+
+
+def _fingerprint(inputs: Any) -> str:
+    """Stable hash of a section's inputs."""
+    payload = json.dumps(inputs, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _edits_by_section(edits: list) -> dict[tuple[str, str], str]:
+    """Index SummaryEditRecords by (section_type, section_id)."""
+    return {(e.section_type.value, e.section_id): e.edited_content for e in edits}
+
+
+def _apply_review_state(
+    summary: MatterSummary,
+    verifications: dict[tuple[str, str], str],
+    edits: dict[tuple[str, str], str],
+) -> None:
+    """Overlay verification decisions and user edits onto a summary in place.
+
+    Story 14.4: AC #7 - is_verified / verification_status.
+    Story 14.6: AC #7 - edited_content.
+
+    Args:
+        summary: Summary to update.
+        verifications: (section_type, section_id) -> decision.
+        edits: (section_type, section_id) -> edited content.
+    """
+    for section, section_type in (
+        (summary.subject_matter, SummarySectionTypeEnum.SUBJECT_MATTER),
+        (summary.current_status, SummarySectionTypeEnum.CURRENT_STATUS),
+    ):
+        section.is_verified = verifications.get((section_type.value, "main")) == "verified"
+        section.edited_content = edits.get((section_type.value, "main"))
+
+    for party in summary.parties:
+        party.is_verified = verifications.get(
+            (SummarySectionTypeEnum.PARTIES.value, party.entity_id)
+        ) == "verified"
+
+    for issue in summary.key_issues:
+        decision = verifications.get((SummarySectionTypeEnum.KEY_ISSUE.value, issue.id))
+        if decision == "verified":
+            issue.verification_status = KeyIssueVerificationStatus.VERIFIED
+        elif decision == "flagged":
+            issue.verification_status = KeyIssueVerificationStatus.FLAGGED
+        else:
+            issue.verification_status = KeyIssueVerificationStatus.PENDING
+
+
 # =============================================================================
 # Story 14.1: Summary Service (Task 2.1 - 2.9)
 # =============================================================================
@@ -119,14 +198,15 @@ class SummaryService:
     Story 14.1: Implements AC #3-7 for summary generation.
 
     Workflow:
-    1. Check Redis cache for existing summary
-    2. If cache miss, generate new summary:
+    1. Background job (precompute_summary) when processing goes quiet:
        a. Query database for stats, attention items, parties
-       b. Retrieve top chunks via RAG
-       c. Call GPT-4 for subject matter, key issues, current status
+       b. Retrieve top chunks in one set-based query
+       c. Call GPT-4 for subject matter, key issues, current status -
+          only for sections whose input fingerprint changed
        d. Apply language policing to all outputs
-    3. Cache result in Redis with 1-hour TTL
-    4. Return summary
+       e. Store a new version in matter_summaries and Redis
+    2. Request path (get_summary): read Redis, then matter_summaries; a
+       missing or stale summary only queues the background tasks
 
     Example:
         >>> service = SummaryService()
@@ -142,6 +222,7 @@ class SummaryService:
         settings = get_settings()
         self.api_key = settings.openai_api_key
         self.model_name = settings.openai_comparison_model  # GPT-4 for summaries
+        self.live_sections_max_age = settings.summary_live_sections_max_age_seconds
 
     @property
     def openai_client(self):
@@ -204,59 +285,169 @@ class SummaryService:
         matter_id: str,
         force_refresh: bool = False,
     ) -> MatterSummary:
-        """Get or generate matter summary.
+        """Get the precomputed matter summary.
 
         Story 14.1: Main entry point for summary retrieval.
 
+        Read-only: serves Redis, then the stored summary, and never builds.
+        Work is queued for the Celery tasks instead:
+        - no stored summary: an immediate precompute is queued and a partial
+          summary (stats and attention items, status "pending") is returned;
+        - stats/attention items older than summary_live_sections_max_age_seconds:
+          a live-section refresh is queued and the stored summary is served;
+        - force_refresh: a precompute is queued and the stored summary is
+          served with status "refreshing".
+
         Args:
             matter_id: Matter UUID.
-            force_refresh: If True, bypass cache and regenerate.
+            force_refresh: If True, skip Redis and queue a rebuild.
 
         Returns:
-            MatterSummary with all components.
+            MatterSummary with all components (LLM sections are placeholders
+            while pending).
 
         Raises:
-            SummaryServiceError: If generation fails.
+            SummaryServiceError: If the stored summary cannot be read.
         """
-        # Check cache first (unless force_refresh)
+        from app.workers.tasks.summary_tasks import (
+            request_live_sections_refresh,
+            request_summary_precompute,
+        )
+
         if not force_refresh:
             cached = await self._get_cached_summary(matter_id)
             if cached:
+                if self._live_sections_stale(cached):
+                    request_live_sections_refresh(matter_id)
                 logger.info(
                     "summary_cache_hit",
                     matter_id=matter_id,
                 )
                 return cached
 
+        stored = await self._load_stored_summary(matter_id)
+        if stored is None:
+            logger.info("summary_not_precomputed", matter_id=matter_id)
+            request_summary_precompute(matter_id)
+            return await self._pending_summary(matter_id)
+
+        if force_refresh:
+            request_summary_precompute(matter_id)
+            stored.summary.status = SummaryStatus.REFRESHING
+            return stored.summary
+
+        if self._live_sections_stale(stored.summary):
+            request_live_sections_refresh(matter_id)
         logger.info(
-            "summary_generating",
+            "summary_stored_hit",
+            matter_id=matter_id,
+            version=stored.version,
+        )
+        await self._cache_summary(matter_id, stored.summary)
+        return stored.summary
+
+    async def _pending_summary(self, matter_id: str) -> MatterSummary:
+        """Partial summary served until the first precompute is stored.
+
+        Stats and attention items are plain database reads; the LLM sections
+        are placeholders.
+        """
+        stats, attention_items = await asyncio.gather(
+            self.get_stats(matter_id),
+            self.get_attention_items(matter_id),
+        )
+        now = datetime.now(UTC).isoformat()
+        return MatterSummary(
             matter_id=matter_id,
-            force_refresh=force_refresh,
+            attention_items=attention_items,
+            subject_matter=SubjectMatter(description=SUMMARY_PENDING),
+            current_status=CurrentStatus(
+                last_order_date=now,
+                description=SUMMARY_PENDING,
+                source_document="N/A",
+            ),
+            stats=stats,
+            generated_at=now,
+            status=SummaryStatus.PENDING,
         )
 
-        # Generate new summary in parallel
+    async def precompute_summary(
+        self,
+        matter_id: str,
+        redis: Any = None,
+    ) -> MatterSummary:
+        """Build and store the matter summary, reusing unchanged sections.
+
+        Database-backed sections (stats, attention items, parties) are always
+        recomputed. LLM sections are regenerated only when the fingerprint of
+        their inputs differs from the stored version's. Verification status
+        and user edits are re-applied to every section.
+
+        Args:
+            matter_id: Matter UUID.
+            redis: Async Redis client to cache with (defaults to the shared
+                client; Celery tasks pass one bound to their own loop).
+
+        Returns:
+            The stored MatterSummary. If another writer stored a newer
+            version first, that version is returned instead.
+        """
+        stored = await self._load_stored_summary(matter_id)
+
         (
             stats,
             attention_items,
-            parties,
+            verifications,
+            edits,
             top_chunks,
             recent_events,
         ) = await asyncio.gather(
             self.get_stats(matter_id),
             self.get_attention_items(matter_id),
-            self.get_parties(matter_id),
-            self._get_top_chunks(matter_id, limit=15),  # More chunks for comprehensive overview
+            self._get_verification_decisions(matter_id),
+            get_summary_edit_service().get_all_edits(matter_id),
+            self._get_top_chunks(matter_id, limit=SUMMARY_TOP_CHUNKS),
             self._get_recent_events(matter_id),
         )
-
-        # Generate GPT-4 content in parallel
+        parties = await self.get_parties(matter_id, verifications=verifications)
+
+        fingerprints = {
+            "subject_matter": _fingerprint(top_chunks),
+            "key_issues": _fingerprint(top_chunks),
+            "current_status": _fingerprint([top_chunks, recent_events]),
+        }
+        regenerated: list[str] = []
+
+        async def _section(name: str, generate: Callable[[], Awaitable[Any]]) -> Any:
+            if stored and stored.section_fingerprints.get(name) == fingerprints[name]:
+                return getattr(stored.summary, name)
+            regenerated.append(name)
+            return await generate()
+
+        # Generate GPT-4 content in parallel (changed sections only)
         subject_matter, key_issues, current_status = await asyncio.gather(
-            self.generate_subject_matter(matter_id, top_chunks),
-            self.get_key_issues(matter_id, top_chunks),
-            self.get_current_status(matter_id, top_chunks, recent_events),
+            _section(
+                "subject_matter",
+                lambda: self.generate_subject_matter(matter_id, top_chunks),
+            ),
+            _section(
+                "key_issues",
+                lambda: self.get_key_issues(matter_id, top_chunks),
+            ),
+            _section(
+                "current_status",
+                lambda: self.get_current_status(matter_id, top_chunks, recent_events),
+            ),
         )
 
-        # Build summary
+        # Don't pin failed generations - retry them on the next rebuild
+        if subject_matter.description == SUBJECT_MATTER_UNAVAILABLE:
+            fingerprints.pop("subject_matter")
+        if not key_issues and top_chunks:
+            fingerprints.pop("key_issues")
+        if current_status.source_document == "N/A":
+            fingerprints.pop("current_status")
+
         summary = MatterSummary(
             matter_id=matter_id,
             attention_items=attention_items,
@@ -267,13 +458,30 @@ class SummaryService:
             stats=stats,
             generated_at=datetime.now(UTC).isoformat(),
         )
+        _apply_review_state(summary, verifications, _edits_by_section(edits))
 
-        # Cache the summary
-        await self._cache_summary(matter_id, summary)
+        version = await self._save_stored_summary(
+            matter_id,
+            summary,
+            fingerprints,
+            expected_version=stored.version if stored else None,
+        )
+        if version is not None:
+            summary.version = version
+            await self._cache_summary(matter_id, summary, redis=redis)
+        else:
+            # Lost the race (or the write failed) - cache what is stored,
+            # never a summary that isn't
+            winner = await self._load_stored_summary(matter_id)
+            if winner is not None:
+                summary = winner.summary
+                await self._cache_summary(matter_id, summary, redis=redis)
 
         logger.info(
             "summary_generated",
             matter_id=matter_id,
+            version=summary.version,
+            regenerated_sections=regenerated,
             attention_items=len(attention_items),
             parties=len(parties),
             key_issues=len(key_issues),
@@ -281,6 +489,114 @@ class SummaryService:
 
         return summary
 
+    async def refresh_review_state(self, matter_id: str) -> MatterSummary | None:
+        """Re-apply verifications and edits to the stored summary.
+
+        Called after a section is verified or edited so the next read shows
+        the change without regenerating anything.
+
+        Args:
+            matter_id: Matter UUID.
+
+        Returns:
+            Updated summary, or None if there is no stored summary.
+        """
+        stored = await self._load_stored_summary(matter_id)
+        if stored is None:
+            await self.invalidate_cache(matter_id)
+            return None
+
+        verifications, edits = await asyncio.gather(
+            self._get_verification_decisions(matter_id),
+            get_summary_edit_service().get_all_edits(matter_id),
+        )
+        summary = stored.summary
+        _apply_review_state(summary, verifications, _edits_by_section(edits))
+
+        version = await self._save_stored_summary(
+            matter_id,
+            summary,
+            stored.section_fingerprints,
+            expected_version=stored.version,
+        )
+        if version is None:
+            # A rebuild won the race; it applies the same review state
+            await self.invalidate_cache(matter_id)
+            return None
+
+        summary.version = version
+        await self._cache_summary(matter_id, summary)
+        return summary
+
+    def _live_sections_stale(self, summary: MatterSummary) -> bool:
+        """Whether a summary's stats and attention items are past their max age.
+
+        Both are stored with the rest of the summary, so they are as old as
+        its generated_at.
+        """
+        try:
+            generated_at = datetime.fromisoformat(summary.generated_at)
+        except ValueError:
+            return True
+        if generated_at.tzinfo is None:
+            generated_at = generated_at.replace(tzinfo=UTC)
+        age = (datetime.now(UTC) - generated_at).total_seconds()
+        return age > self.live_sections_max_age
+
+    async def refresh_live_sections(
+        self,
+        matter_id: str,
+        redis: Any = None,
+    ) -> MatterSummary | None:
+        """Recompute stats and attention items of the stored summary.
+
+        These are plain database counts, so they are refreshed without a
+        rebuild; the LLM sections are left as stored. Runs in the
+        refresh_summary_live_sections task, never on the request path.
+
+        Args:
+            matter_id: Matter UUID.
+            redis: Async Redis client to cache with (defaults to the shared
+                client; Celery tasks pass one bound to their own loop).
+
+        Returns:
+            Summary with current stats and attention items, or None if the
+            matter has no stored summary.
+        """
+        stored = await self._load_stored_summary(matter_id)
+        if stored is None:
+            return None
+        if not self._live_sections_stale(stored.summary):
+            # Refreshed (or rebuilt) since the read that queued this
+            return stored.summary
+
+        stats, attention_items = await asyncio.gather(
+            self.get_stats(matter_id),
+            self.get_attention_items(matter_id),
+        )
+        summary = stored.summary
+        summary.stats = stats
+        summary.attention_items = attention_items
+        summary.generated_at = datetime.now(UTC).isoformat()
+
+        version = await self._save_stored_summary(
+            matter_id,
+            summary,
+            stored.section_fingerprints,
+            expected_version=stored.version,
+        )
+        if version is not None:
+            summary.version = version
+            await self._cache_summary(matter_id, summary, redis=redis)
+
+        logger.info(
+            "summary_live_sections_refreshed",
+            matter_id=matter_id,
+            version=summary.version,
+            stored=version is not None,
+        )
+        return summary
+
     # =========================================================================
     # Attention Items (Task 2.2) - AC #5
     # =========================================================================
@@ -398,7 +714,11 @@ class SummaryService:
     # Parties (Task 2.3) - AC #6
     # =========================================================================
 
-    async def get_parties(self, matter_id: str) -> list[PartyInfo]:
+    async def get_parties(
+        self,
+        matter_id: str,
+        verifications: dict[tuple[str, str], str] | None = None,
+    ) -> list[PartyInfo]:
         """Get parties from MIG (Matter Identity Graph), excluding soft-deleted docs.
 
         Story 14.1: AC #6 - Parties extracted from entity_mentions.
@@ -411,6 +731,8 @@ class SummaryService:
 
         Args:
             matter_id: Matter UUID.
+            verifications: Decisions from _get_verification_decisions; fetched
+                (one query for all parties) when not provided.
 
         Returns:
             List of PartyInfo objects.
@@ -479,6 +801,9 @@ class SummaryService:
             if not party_entities:
                 return []
 
+            if verifications is None:
+                verifications = await self._get_verification_decisions(matter_id)
+
             # Step 3: Get first mention for each party entity to find source document
             party_entity_ids = [p["entity_id"] for p in party_entities]
             mentions_result = await asyncio.to_thread(
@@ -512,7 +837,9 @@ class SummaryService:
                     source_page = None
 
                 # Check if this party entity has been verified
-                is_verified = await self._check_party_verified(matter_id, entity_id)
+                is_verified = verifications.get(
+                    (SummarySectionTypeEnum.PARTIES.value, entity_id)
+                ) == "verified"
 
                 # Story 14.6: Build citation for party source
                 citation = None
@@ -604,6 +931,37 @@ class SummaryService:
 
         return False
 
+    async def _get_verification_decisions(
+        self,
+        matter_id: str,
+    ) -> dict[tuple[str, str], str]:
+        """Get every summary verification decision for a matter in one query.
+
+        Args:
+            matter_id: Matter UUID.
+
+        Returns:
+            Mapping of (section_type, section_id) to decision.
+        """
+        try:
+            result = await asyncio.to_thread(
+                lambda: self.supabase.table("summary_verifications")
+                .select("section_type, section_id, decision")
+                .eq("matter_id", matter_id)
+                .execute()
+            )
+            return {
+                (row["section_type"], row["section_id"]): row["decision"]
+                for row in result.data or []
+            }
+        except Exception as e:
+            logger.debug(
+                "get_verification_decisions_failed",
+                error=str(e),
+                matter_id=matter_id,
+            )
+            return {}
+
     async def _check_party_verified(self, matter_id: str, entity_id: str) -> bool:
         """Check if a party entity has been verified.
 
@@ -956,7 +1314,7 @@ class SummaryService:
                 matter_id=matter_id,
             )
             return SubjectMatter(
-                description="Unable to generate summary at this time.",
+                description=SUBJECT_MATTER_UNAVAILABLE,
                 sources=[],
                 is_verified=False,
             )
@@ -1178,7 +1536,9 @@ class SummaryService:
 
         Samples chunks across ALL documents to get representative content,
         rather than just taking the most recent chunks (which could all be
-        from one document).
+        from one document). Case documents are preferred over reference
+        material. One get_summary_top_chunks RPC replaces a chunks query per
+        document.
 
         Args:
             matter_id: Matter UUID.
@@ -1188,56 +1548,22 @@ class SummaryService:
             List of chunk dictionaries with content and metadata.
         """
         try:
-            # Get active document IDs (non-deleted, non-reference material)
-            # Reference material like Acts should not dominate the case summary
-            docs_result = await asyncio.to_thread(
-                lambda: self.supabase.table("documents")
-                .select("id, is_reference_material")
-                .eq("matter_id", matter_id)
-                .is_("deleted_at", "null")
-                .execute()
+            result = await asyncio.to_thread(
+                lambda: self.supabase.rpc(
+                    "get_summary_top_chunks",
+                    {"p_matter_id": matter_id, "p_limit": limit},
+                ).execute()
             )
 
-            # Separate case documents from reference material
-            case_doc_ids = []
-            reference_doc_ids = []
-            for d in docs_result.data or []:
-                if d.get("is_reference_material"):
-                    reference_doc_ids.append(d["id"])
-                else:
-                    case_doc_ids.append(d["id"])
-
-            # Prioritize case documents, fall back to reference if no case docs
-            active_doc_ids = case_doc_ids if case_doc_ids else reference_doc_ids
-
-            if not active_doc_ids:
-                return []
-
-            # Get chunks distributed across documents
-            # Take first chunk from each document, then cycle through
-            all_chunks = []
-            chunks_per_doc = max(1, limit // len(active_doc_ids))
-
-            for doc_id in active_doc_ids:
-                result = await asyncio.to_thread(
-                    lambda did=doc_id: self.supabase.table("chunks")
-                    .select("id, content, page_number, document_id, documents(filename)")
-                    .eq("document_id", did)
-                    .order("page_number")
-                    .limit(chunks_per_doc)
-                    .execute()
-                )
-
-                for row in result.data or []:
-                    doc_data = row.get("documents", {}) or {}
-                    all_chunks.append({
-                        "content": row.get("content", ""),
-                        "document_name": doc_data.get("filename", "Unknown"),
-                        "page_number": row.get("page_number"),
-                    })
-
-            # Return up to limit chunks
-            return all_chunks[:limit]
+            return [
+                {
+                    "content": row.get("content", ""),
+                    "document_id": row.get("document_id"),
+                    "document_name": row.get("document_name") or "Unknown",
+                    "page_number": row.get("page_number"),
+                }
+                for row in result.data or []
+            ]
 
         except Exception as e:
             logger.warning("get_top_chunks_failed", error=str(e))
@@ -1324,8 +1650,10 @@ class SummaryService:
             page_number = chunk.get("page_number")
             content = chunk.get("content", "")
 
-            # Look up document ID from documents table
-            document_id = await self._get_document_id_by_name(matter_id, document_name)
+            # Chunks carry their document ID; look it up by name otherwise
+            document_id = chunk.get("document_id") or await self._get_document_id_by_name(
+                matter_id, document_name
+            )
             if document_id:
                 # Truncate excerpt to 200 chars
                 excerpt = content[:200] + "..." if len(content) > 200 else content
@@ -1413,6 +1741,108 @@ class SummaryService:
             )
             return None
 
+    # =========================================================================
+    # Precomputed Summary Storage
+    # =========================================================================
+
+    async def _load_stored_summary(self, matter_id: str) -> StoredSummary | None:
+        """Load the precomputed summary from matter_summaries.
+
+        Args:
+            matter_id: Matter UUID.
+
+        Returns:
+            StoredSummary or None if the matter has none (or it is unreadable).
+        """
+        try:
+            result = await asyncio.to_thread(
+                lambda: self.supabase.table("matter_summaries")
+                .select("summary, version, section_fingerprints")
+                .eq("matter_id", matter_id)
+                .limit(1)
+                .execute()
+            )
+            if not result.data:
+                return None
+
+            row = result.data[0]
+            summary = MatterSummary.model_validate(row["summary"])
+            summary.version = row["version"]
+            return StoredSummary(
+                summary=summary,
+                version=row["version"],
+                section_fingerprints=row.get("section_fingerprints") or {},
+            )
+
+        except Exception as e:
+            logger.warning(
+                "summary_stored_get_failed",
+                error=str(e),
+                matter_id=matter_id,
+            )
+            return None
+
+    async def _save_stored_summary(
+        self,
+        matter_id: str,
+        summary: MatterSummary,
+        section_fingerprints: dict[str, str],
+        expected_version: int | None,
+    ) -> int | None:
+        """Store a summary as the next version (optimistic concurrency).
+
+        Args:
+            matter_id: Matter UUID.
+            summary: Summary to store.
+            section_fingerprints: Input fingerprints of the LLM sections.
+            expected_version: Version the summary was built from, or None if
+                the matter had no stored summary.
+
+        Returns:
+            The new version, or None if another writer stored a newer version
+            first (or the write failed).
+        """
+        row = {
+            "summary": summary.model_dump(mode="json", by_alias=True),
+            "section_fingerprints": section_fingerprints,
+            "generated_at": summary.generated_at,
+            "updated_at": datetime.now(UTC).isoformat(),
+        }
+
+        try:
+            if expected_version is None:
+                await asyncio.to_thread(
+                    lambda: self.supabase.table("matter_summaries")
+                    .insert({"matter_id": matter_id, "version": 1, **row})
+                    .execute()
+                )
+                return 1
+
+            new_version = expected_version + 1
+            result = await asyncio.to_thread(
+                lambda: self.supabase.table("matter_summaries")
+                .update({"version": new_version, **row})
+                .eq("matter_id", matter_id)
+                .eq("version", expected_version)
+                .execute()
+            )
+            if not result.data:
+                logger.info(
+                    "summary_version_conflict",
+                    matter_id=matter_id,
+                    expected_version=expected_version,
+                )
+                return None
+            return new_version
+
+        except Exception as e:
+            logger.warning(
+                "summary_store_failed",
+                error=str(e),
+                matter_id=matter_id,
+            )
+            return None
+
     # =========================================================================
     # Redis Caching (Task 2.8) - AC #4
     # =========================================================================
@@ -1452,6 +1882,7 @@ class SummaryService:
         self,
         matter_id: str,
         summary: MatterSummary,
+        redis: Any = None,
     ) -> None:
         """Cache summary in Redis.
 
@@ -1460,9 +1891,11 @@ class SummaryService:
         Args:
             matter_id: Matter UUID.
             summary: Summary to cache.
+            redis: Async Redis client (defaults to the shared client).
         """
         try:
-            redis = await get_redis_client()
+            if redis is None:
+                redis = await get_redis_client()
             key = summary_cache_key(matter_id)
             # Use by_alias=True to match frontend camelCase
             data = summary.model_dump_json(by_alias=True)
@@ -22,9 +22,25 @@ CONNECTION STABILITY:
 Uses HTTP/1.1 instead of HTTP/2 to avoid connection multiplexing issues
 with Supabase/Cloudflare that cause ConnectionTerminated errors.
 Includes retry transport with exponential backoff for resilience.
+
+CONNECTION POOLING:
+Both clients are process-wide singletons, created lazily on first use, so
+every caller shares one keep-alive pool instead of opening fresh
+connections per call. Pool limits come from the supabase_pool_* settings.
+Idle connections are recycled after supabase_pool_keepalive_expiry, and
+connections the server has closed are discarded before reuse. After a
+fork the child builds its own clients (sockets are never shared across
+processes). Pool wait time and saturation are exposed through
+get_supabase_pool_stats().
 """
 
+import os
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from functools import lru_cache
+from typing import Any
 
 import httpx
 import structlog
@@ -35,31 +51,159 @@ from app.core.config import get_settings
 
 logger = structlog.get_logger(__name__)
 
-# Global client instance (lazy initialized)
-_supabase_client: Client | None = None
+# Process-wide service client (lazy initialized, reset after fork)
+_service_client: Client | None = None
+_service_client_lock = threading.Lock()
+
+# Pooled transports by client name, for metrics
+_pool_transports: dict[str, "PooledTransport"] = {}
 
 # HTTP client configuration for connection stability
 _HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
-_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=5, max_connections=10)
 
 
-def _create_http_client() -> httpx.Client:
+@dataclass
+class PoolStats:
+    """Connection pool usage for one Supabase client."""
+
+    max_connections: int
+    requests: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    waited: int = 0  # Requests that found the pool saturated
+    timeouts: int = 0  # Requests that gave up waiting
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize stats, including derived saturation and average wait."""
+        return {
+            "max_connections": self.max_connections,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "saturation": round(self.in_flight / self.max_connections, 3),
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait_ms / self.waited, 2) if self.waited else 0.0,
+            "max_wait_ms": round(self.max_wait_ms, 2),
+        }
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response stream that frees its pool slot when closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Any):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+class PooledTransport(httpx.HTTPTransport):
+    """HTTP transport that meters pool wait time and saturation.
+
+    Each request holds a slot from acquisition until its response is
+    closed, mirroring the connection it occupies in the underlying pool.
+    Requests beyond max_connections wait up to pool_timeout for a slot and
+    then fail with httpx.PoolTimeout instead of opening more connections.
+    """
+
+    def __init__(self, limits: httpx.Limits, pool_timeout: float, **kwargs: Any):
+        super().__init__(limits=limits, **kwargs)
+        max_connections = limits.max_connections or 100
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._pool_timeout = pool_timeout
+        self._stats_lock = threading.Lock()
+        self.stats = PoolStats(max_connections=max_connections)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self._acquire(request)
+        try:
+            response = super().handle_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        released = False
+
+        def release_once() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                self._release()
+
+        response.stream = _ReleasingStream(response.stream, release_once)
+        return response
+
+    def _acquire(self, request: httpx.Request) -> None:
+        wait_ms = 0.0
+        if not self._slots.acquire(blocking=False):
+            started = time.monotonic()
+            acquired = self._slots.acquire(timeout=self._pool_timeout)
+            wait_ms = (time.monotonic() - started) * 1000
+            with self._stats_lock:
+                self.stats.waited += 1
+                self.stats.total_wait_ms += wait_ms
+                self.stats.max_wait_ms = max(self.stats.max_wait_ms, wait_ms)
+                if not acquired:
+                    self.stats.timeouts += 1
+            if not acquired:
+                logger.warning(
+                    "supabase_pool_timeout",
+                    max_connections=self.stats.max_connections,
+                    wait_ms=round(wait_ms, 2),
+                )
+                raise httpx.PoolTimeout(
+                    "Timed out waiting for a Supabase connection", request=request
+                )
+
+        with self._stats_lock:
+            self.stats.requests += 1
+            self.stats.in_flight += 1
+            self.stats.peak_in_flight = max(self.stats.peak_in_flight, self.stats.in_flight)
+
+    def _release(self) -> None:
+        with self._stats_lock:
+            self.stats.in_flight -= 1
+        self._slots.release()
+
+
+def _create_http_client(name: str) -> httpx.Client:
     """Create configured httpx client with HTTP/1.1 and retry transport.
 
     Uses HTTP/1.1 to avoid connection multiplexing issues with Supabase/Cloudflare
     that cause ConnectionTerminated and RemoteProtocolError exceptions.
 
+    Args:
+        name: Client name the pool metrics are reported under.
+
     Returns:
         Configured httpx.Client with retries and connection pooling.
     """
-    transport = httpx.HTTPTransport(
+    settings = get_settings()
+    limits = httpx.Limits(
+        max_connections=settings.supabase_pool_max_connections,
+        max_keepalive_connections=settings.supabase_pool_max_keepalive,
+        keepalive_expiry=settings.supabase_pool_keepalive_expiry,
+    )
+    transport = PooledTransport(
+        limits=limits,
+        pool_timeout=settings.supabase_pool_timeout,
         retries=3,  # Retry on connection errors
         http2=False,  # Force HTTP/1.1 to avoid multiplexing issues
     )
+    _pool_transports[name] = transport
     return httpx.Client(
         transport=transport,
         timeout=_HTTP_TIMEOUT,
-        limits=_HTTP_LIMITS,
         http2=False,  # Explicit HTTP/1.1
     )
 
@@ -90,7 +234,7 @@ def _create_supabase_client() -> Client | None:
 
     try:
         # Create custom httpx client with HTTP/1.1 for connection stability
-        http_client = _create_http_client()
+        http_client = _create_http_client("default")
         options = SyncClientOptions(httpx_client=http_client)
 
         client = create_client(
@@ -103,6 +247,7 @@ def _create_supabase_client() -> Client | None:
             using_service_key=bool(settings.supabase_service_key),
             http_version="1.1",
             retries=3,
+            max_connections=settings.supabase_pool_max_connections,
         )
         return client
     except Exception as e:
@@ -129,11 +274,19 @@ def get_service_client() -> Client | None:
     This client bypasses RLS and should only be used for administrative
     operations like migrations, background jobs, etc.
 
+    The client is created once per process and shared, so all callers reuse
+    one connection pool.
+
     SECURITY: Never expose this client to user-facing endpoints.
 
     Returns:
         Supabase admin client or None if not configured.
     """
+    global _service_client
+
+    if _service_client is not None:
+        return _service_client
+
     settings = get_settings()
 
     if not settings.supabase_url or not settings.supabase_service_key:
@@ -144,18 +297,55 @@ def get_service_client() -> Client | None:
         )
         return None
 
-    try:
-        # Create custom httpx client with HTTP/1.1 for connection stability
-        http_client = _create_http_client()
-        options = SyncClientOptions(httpx_client=http_client)
+    with _service_client_lock:
+        if _service_client is not None:
+            return _service_client
+
+        try:
+            # Create custom httpx client with HTTP/1.1 for connection stability
+            http_client = _create_http_client("service")
+            options = SyncClientOptions(httpx_client=http_client)
+
+            _service_client = create_client(
+                supabase_url=settings.supabase_url,
+                supabase_key=settings.supabase_service_key,
+                options=options,
+            )
+            logger.info(
+                "supabase_service_client_created",
+                http_version="1.1",
+                retries=3,
+                max_connections=settings.supabase_pool_max_connections,
+                pid=os.getpid(),
+            )
+            return _service_client
+        except Exception as e:
+            logger.error("supabase_service_client_creation_failed", error=str(e))
+            return None
+
+
+def get_supabase_pool_stats() -> dict[str, dict[str, Any]]:
+    """Get connection pool metrics for the Supabase clients in this process.
 
-        client = create_client(
-            supabase_url=settings.supabase_url,
-            supabase_key=settings.supabase_service_key,
-            options=options,
-        )
-        logger.info("supabase_service_client_created", http_version="1.1", retries=3)
-        return client
-    except Exception as e:
-        logger.error("supabase_service_client_creation_failed", error=str(e))
-        return None
+    Returns:
+        Pool stats keyed by client name ("default", "service"). Clients not
+        created yet are omitted.
+    """
+    return {name: transport.stats.to_dict() for name, transport in _pool_transports.items()}
+
+
+def _reset_after_fork() -> None:
+    """Drop clients inherited from the parent process.
+
+    The inherited pools hold the parent's sockets, so they are abandoned
+    rather than closed and the child creates its own clients on first use.
+    """
+    global _service_client, _service_client_lock
+
+    _service_client = None
+    _service_client_lock = threading.Lock()
+    _pool_transports.clear()
+    get_supabase_client.cache_clear()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
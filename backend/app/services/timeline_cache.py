@@ -1,12 +1,15 @@
 """Timeline Cache Service for Matter Memory.
 
 Provides caching for timeline data using Redis to improve performance
-for repeated timeline queries. Uses matter-level keys with timeline prefix.
+for repeated timeline queries. Uses matter-level keys with timeline prefix
+and a per-matter generation number, so invalidation is a single INCR.
 
 Story 4-3: Events Table + MIG Integration
 """
 
+import asyncio
 import json
+import zlib
 from datetime import date, datetime
 from functools import lru_cache
 from typing import Any
@@ -25,6 +28,7 @@ from app.engines.timeline.timeline_builder import (
 from app.models.entity import EntityType
 from app.models.timeline import EventType
 from app.services.memory import matter_key
+from app.services.memory.cache_generation import CacheGenerations
 
 logger = structlog.get_logger(__name__)
 
@@ -41,237 +45,309 @@ CACHE_SUFFIX_TIMELINE = "timeline"
 CACHE_SUFFIX_STATS = "timeline_stats"
 CACHE_SUFFIX_ENTITY_VIEW = "timeline_entity"
 
+# Generation namespace shared by timeline pages, statistics and entity views
+TIMELINE_CACHE_NAMESPACE = "timeline"
+
+# Payloads larger than this are zlib-compressed before they are stored
+COMPRESSION_THRESHOLD = 8 * 1024  # bytes
+COMPRESSION_LEVEL = 1  # Favor speed: cached pages are read far more than written
+
+# First byte of every cached value
+_FORMAT_RAW = 0x01
+_FORMAT_ZLIB = 0x02
+
 
 # =============================================================================
-# JSON Serialization Helpers
+# Compact Encoding
 # =============================================================================
+#
+# Values are a one-byte format header followed by compact JSON in which every
+# record is a positional array instead of a keyed object, optionally
+# zlib-compressed. Dates are ISO strings and enums their values, so decoding
+# needs no object_hook and rebuilds dataclasses positionally.
+#
+# A timeline page is stored as two entries:
+# - {page}:{per_page}         - pagination, statistics and the page's events
+# - {page}:{per_page}:detail  - segments and entity views, whose events are
+#                               indices into the page's events (plus any
+#                               events that are not on the page)
+# Reading a page's events therefore never decodes segments or entity views.
+
+
+class TimelineCacheFormatError(ValueError):
+    """Raised when a cached value is not in the current encoding."""
+
+
+def _encode_payload(data: Any) -> bytes:
+    """Encode rows as compact JSON bytes, compressing large payloads."""
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    if len(raw) > COMPRESSION_THRESHOLD:
+        return bytes((_FORMAT_ZLIB,)) + zlib.compress(raw, COMPRESSION_LEVEL)
+    return bytes((_FORMAT_RAW,)) + raw
+
+
+def _decode_payload(payload: bytes) -> Any:
+    """Decode a value written by _encode_payload.
+
+    Raises:
+        TimelineCacheFormatError: If the value has an unknown header
+            (e.g. an entry written by an older release).
+    """
+    if not payload:
+        raise TimelineCacheFormatError("Empty cache value")
+    header = payload[0]
+    if header == _FORMAT_RAW:
+        return json.loads(payload[1:])
+    if header == _FORMAT_ZLIB:
+        return json.loads(zlib.decompress(payload[1:]))
+    raise TimelineCacheFormatError(f"Unknown cache format header: {header!r}")
 
 
-# Type markers for JSON serialization - use unique prefix to avoid collision
-# with user data (Issue #5 fix)
-_TYPE_MARKER_PREFIX = "__timeline_cache_"
-_DATE_MARKER = f"{_TYPE_MARKER_PREFIX}date__"
-_DATETIME_MARKER = f"{_TYPE_MARKER_PREFIX}datetime__"
-_EVENT_TYPE_MARKER = f"{_TYPE_MARKER_PREFIX}event_type__"
-_ENTITY_TYPE_MARKER = f"{_TYPE_MARKER_PREFIX}entity_type__"
-
-
-class TimelineCacheEncoder(json.JSONEncoder):
-    """JSON encoder for timeline cache data."""
-
-    def default(self, obj: Any) -> Any:
-        # datetime must be checked before date (datetime is a subclass of date)
-        if isinstance(obj, datetime):
-            return {_DATETIME_MARKER: obj.isoformat()}
-        if isinstance(obj, date):
-            return {_DATE_MARKER: obj.isoformat()}
-        if isinstance(obj, EventType):
-            return {_EVENT_TYPE_MARKER: obj.value}
-        if isinstance(obj, EntityType):
-            return {_ENTITY_TYPE_MARKER: obj.value}
-        return super().default(obj)
-
-
-def timeline_decoder(obj: dict) -> Any:
-    """JSON decoder hook for timeline cache data."""
-    # Support both old and new marker formats for backwards compatibility
-    if _DATE_MARKER in obj:
-        return date.fromisoformat(obj[_DATE_MARKER])
-    if "__date__" in obj:  # Legacy format
-        return date.fromisoformat(obj["__date__"])
-    if _DATETIME_MARKER in obj:
-        return datetime.fromisoformat(obj[_DATETIME_MARKER])
-    if "__datetime__" in obj:  # Legacy format
-        return datetime.fromisoformat(obj["__datetime__"])
-    if _EVENT_TYPE_MARKER in obj:
-        try:
-            return EventType(obj[_EVENT_TYPE_MARKER])
-        except ValueError:
-            return EventType.UNCLASSIFIED
-    if "__event_type__" in obj:  # Legacy format
-        try:
-            return EventType(obj["__event_type__"])
-        except ValueError:
-            return EventType.UNCLASSIFIED
-    if _ENTITY_TYPE_MARKER in obj:
-        try:
-            return EntityType(obj[_ENTITY_TYPE_MARKER])
-        except ValueError:
-            return EntityType.PERSON
-    if "__entity_type__" in obj:  # Legacy format
-        try:
-            return EntityType(obj["__entity_type__"])
-        except ValueError:
-            return EntityType.PERSON
-    return obj
-
-
-def _serialize_timeline(timeline: ConstructedTimeline) -> str:
-    """Serialize a ConstructedTimeline to JSON string."""
-    data = {
-        "matter_id": timeline.matter_id,
-        "events": [_event_to_dict(e) for e in timeline.events],
-        "segments": [_segment_to_dict(s) for s in timeline.segments],
-        "entity_views": [_entity_view_to_dict(v) for v in timeline.entity_views],
-        "statistics": _stats_to_dict(timeline.statistics),
-        "generated_at": timeline.generated_at,
-        "page": timeline.page,
-        "per_page": timeline.per_page,
-        "total_events": timeline.total_events,
-        "total_pages": timeline.total_pages,
-    }
-    return json.dumps(data, cls=TimelineCacheEncoder)
-
-
-def _deserialize_timeline(json_str: str) -> ConstructedTimeline:
-    """Deserialize a JSON string to ConstructedTimeline."""
-    data = json.loads(json_str, object_hook=timeline_decoder)
+def _enum_value(value: Any) -> Any:
+    return value.value if hasattr(value, "value") else value
 
-    return ConstructedTimeline(
-        matter_id=data["matter_id"],
-        events=[_dict_to_event(e) for e in data["events"]],
-        segments=[_dict_to_segment(s) for s in data["segments"]],
-        entity_views=[_dict_to_entity_view(v) for v in data["entity_views"]],
-        statistics=_dict_to_stats(data["statistics"]),
-        generated_at=data["generated_at"],
-        page=data["page"],
-        per_page=data["per_page"],
-        total_events=data["total_events"],
-        total_pages=data["total_pages"],
-    )
 
+def _date_to_str(value: date | None) -> str | None:
+    return value.isoformat() if value is not None else None
 
-def _event_to_dict(event: TimelineEvent) -> dict:
-    """Convert TimelineEvent to dict."""
-    return {
-        "event_id": event.event_id,
-        "event_date": event.event_date,
-        "event_date_precision": event.event_date_precision,
-        "event_date_text": event.event_date_text,
-        "event_type": event.event_type,
-        "description": event.description,
-        "document_id": event.document_id,
-        "document_name": event.document_name,
-        "source_page": event.source_page,
-        "confidence": event.confidence,
-        "entities": [_entity_ref_to_dict(e) for e in event.entities],
-        "is_ambiguous": event.is_ambiguous,
-        "is_verified": event.is_verified,
-    }
-
-
-def _dict_to_event(data: dict) -> TimelineEvent:
-    """Convert dict to TimelineEvent."""
-    return TimelineEvent(
-        event_id=data["event_id"],
-        event_date=data["event_date"],
-        event_date_precision=data["event_date_precision"],
-        event_date_text=data.get("event_date_text"),
-        event_type=data["event_type"],
-        description=data["description"],
-        document_id=data.get("document_id"),
-        document_name=data.get("document_name"),
-        source_page=data.get("source_page"),
-        confidence=data.get("confidence", 0.8),
-        entities=[_dict_to_entity_ref(e) for e in data.get("entities", [])],
-        is_ambiguous=data.get("is_ambiguous", False),
-        is_verified=data.get("is_verified", False),
-    )
+
+def _str_to_date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value is not None else None
 
 
-def _entity_ref_to_dict(ref: EntityReference) -> dict:
-    """Convert EntityReference to dict."""
-    return {
-        "entity_id": ref.entity_id,
-        "canonical_name": ref.canonical_name,
-        "entity_type": ref.entity_type,
-        "role": ref.role,
-    }
+def _to_event_type(value: str) -> EventType:
+    try:
+        return EventType(value)
+    except ValueError:
+        return EventType.UNCLASSIFIED
 
 
-def _dict_to_entity_ref(data: dict) -> EntityReference:
-    """Convert dict to EntityReference."""
+def _to_entity_type(value: str) -> EntityType:
+    try:
+        return EntityType(value)
+    except ValueError:
+        return EntityType.PERSON
+
+
+def _entity_ref_to_row(ref: EntityReference) -> list:
+    """Convert EntityReference to a positional row."""
+    return [ref.entity_id, ref.canonical_name, _enum_value(ref.entity_type), ref.role]
+
+
+def _row_to_entity_ref(row: list) -> EntityReference:
+    """Convert a positional row to EntityReference."""
     return EntityReference(
-        entity_id=data["entity_id"],
-        canonical_name=data["canonical_name"],
-        entity_type=data["entity_type"],
-        role=data.get("role"),
+        entity_id=row[0],
+        canonical_name=row[1],
+        entity_type=_to_entity_type(row[2]),
+        role=row[3],
+    )
+
+
+def _event_to_row(event: TimelineEvent) -> list:
+    """Convert TimelineEvent to a positional row."""
+    return [
+        event.event_id,
+        _date_to_str(event.event_date),
+        event.event_date_precision,
+        event.event_date_text,
+        _enum_value(event.event_type),
+        event.description,
+        event.document_id,
+        event.document_name,
+        event.source_page,
+        event.confidence,
+        [_entity_ref_to_row(e) for e in event.entities],
+        event.is_ambiguous,
+        event.is_verified,
+    ]
+
+
+def _row_to_event(row: list) -> TimelineEvent:
+    """Convert a positional row to TimelineEvent."""
+    return TimelineEvent(
+        event_id=row[0],
+        event_date=_str_to_date(row[1]),
+        event_date_precision=row[2],
+        event_date_text=row[3],
+        event_type=_to_event_type(row[4]),
+        description=row[5],
+        document_id=row[6],
+        document_name=row[7],
+        source_page=row[8],
+        confidence=row[9],
+        entities=[_row_to_entity_ref(e) for e in row[10]],
+        is_ambiguous=row[11],
+        is_verified=row[12],
     )
 
 
-def _segment_to_dict(segment: TimelineSegment) -> dict:
-    """Convert TimelineSegment to dict."""
-    return {
-        "period_start": segment.period_start,
-        "period_end": segment.period_end,
-        "period_label": segment.period_label,
-        "events": [_event_to_dict(e) for e in segment.events],
-        "event_count": segment.event_count,
-    }
-
-
-def _dict_to_segment(data: dict) -> TimelineSegment:
-    """Convert dict to TimelineSegment."""
-    return TimelineSegment(
-        period_start=data["period_start"],
-        period_end=data["period_end"],
-        period_label=data["period_label"],
-        events=[_dict_to_event(e) for e in data.get("events", [])],
-        event_count=data["event_count"],
+def _stats_to_row(stats: TimelineStatistics) -> list:
+    """Convert TimelineStatistics to a positional row."""
+    return [
+        stats.total_events,
+        stats.events_by_type,
+        stats.entities_involved,
+        _date_to_str(stats.date_range_start),
+        _date_to_str(stats.date_range_end),
+        stats.events_with_entities,
+        stats.events_without_entities,
+        stats.verified_events,
+    ]
+
+
+def _row_to_stats(row: list) -> TimelineStatistics:
+    """Convert a positional row to TimelineStatistics."""
+    return TimelineStatistics(
+        total_events=row[0],
+        events_by_type=row[1],
+        entities_involved=row[2],
+        date_range_start=_str_to_date(row[3]),
+        date_range_end=_str_to_date(row[4]),
+        events_with_entities=row[5],
+        events_without_entities=row[6],
+        verified_events=row[7],
     )
 
 
-def _entity_view_to_dict(view: EntityTimelineView) -> dict:
-    """Convert EntityTimelineView to dict."""
-    return {
-        "entity_id": view.entity_id,
-        "entity_name": view.entity_name,
-        "entity_type": view.entity_type,
-        "events": [_event_to_dict(e) for e in view.events],
-        "first_appearance": view.first_appearance,
-        "last_appearance": view.last_appearance,
-        "event_count": view.event_count,
-    }
+def _entity_view_to_row(view: EntityTimelineView) -> list:
+    """Convert a standalone EntityTimelineView to a positional row."""
+    return [
+        view.entity_id,
+        view.entity_name,
+        _enum_value(view.entity_type),
+        _date_to_str(view.first_appearance),
+        _date_to_str(view.last_appearance),
+        view.event_count,
+        [_event_to_row(e) for e in view.events],
+    ]
 
 
-def _dict_to_entity_view(data: dict) -> EntityTimelineView:
-    """Convert dict to EntityTimelineView."""
+def _row_to_entity_view(row: list) -> EntityTimelineView:
+    """Convert a positional row to a standalone EntityTimelineView."""
     return EntityTimelineView(
-        entity_id=data["entity_id"],
-        entity_name=data["entity_name"],
-        entity_type=data["entity_type"],
-        events=[_dict_to_event(e) for e in data.get("events", [])],
-        first_appearance=data.get("first_appearance"),
-        last_appearance=data.get("last_appearance"),
-        event_count=data["event_count"],
+        entity_id=row[0],
+        entity_name=row[1],
+        entity_type=_to_entity_type(row[2]),
+        first_appearance=_str_to_date(row[3]),
+        last_appearance=_str_to_date(row[4]),
+        event_count=row[5],
+        events=[_row_to_event(e) for e in row[6]],
     )
 
 
-def _stats_to_dict(stats: TimelineStatistics) -> dict:
-    """Convert TimelineStatistics to dict."""
-    return {
-        "total_events": stats.total_events,
-        "events_by_type": stats.events_by_type,
-        "entities_involved": stats.entities_involved,
-        "date_range_start": stats.date_range_start,
-        "date_range_end": stats.date_range_end,
-        "events_with_entities": stats.events_with_entities,
-        "events_without_entities": stats.events_without_entities,
-        "verified_events": stats.verified_events,
-    }
+def _serialize_timeline(timeline: ConstructedTimeline) -> tuple[bytes, bytes]:
+    """Serialize a ConstructedTimeline page.
 
+    Returns:
+        Tuple of (page entry, detail entry).
+    """
+    index_by_id = {event.event_id: i for i, event in enumerate(timeline.events)}
+    extra_rows: list[list] = []
+
+    def _indices(events: list[TimelineEvent]) -> list[int]:
+        indices = []
+        for event in events:
+            index = index_by_id.get(event.event_id)
+            if index is None:
+                index = len(timeline.events) + len(extra_rows)
+                index_by_id[event.event_id] = index
+                extra_rows.append(_event_to_row(event))
+            indices.append(index)
+        return indices
+
+    page = [
+        timeline.matter_id,
+        timeline.generated_at.isoformat(),
+        timeline.page,
+        timeline.per_page,
+        timeline.total_events,
+        timeline.total_pages,
+        _stats_to_row(timeline.statistics),
+        [_event_to_row(e) for e in timeline.events],
+    ]
+    segments = [
+        [
+            _date_to_str(s.period_start),
+            _date_to_str(s.period_end),
+            s.period_label,
+            s.event_count,
+            _indices(s.events),
+        ]
+        for s in timeline.segments
+    ]
+    views = [
+        [
+            v.entity_id,
+            v.entity_name,
+            _enum_value(v.entity_type),
+            _date_to_str(v.first_appearance),
+            _date_to_str(v.last_appearance),
+            v.event_count,
+            _indices(v.events),
+        ]
+        for v in timeline.entity_views
+    ]
+    return _encode_payload(page), _encode_payload([extra_rows, segments, views])
+
+
+def _deserialize_timeline(
+    page_payload: bytes,
+    detail_payload: bytes | None = None,
+) -> ConstructedTimeline:
+    """Deserialize a ConstructedTimeline page.
+
+    Args:
+        page_payload: Page entry from _serialize_timeline.
+        detail_payload: Detail entry, or None to skip segments and entity
+            views (they are returned empty).
 
-def _dict_to_stats(data: dict) -> TimelineStatistics:
-    """Convert dict to TimelineStatistics."""
-    return TimelineStatistics(
-        total_events=data["total_events"],
-        events_by_type=data["events_by_type"],
-        entities_involved=data["entities_involved"],
-        date_range_start=data.get("date_range_start"),
-        date_range_end=data.get("date_range_end"),
-        events_with_entities=data["events_with_entities"],
-        events_without_entities=data["events_without_entities"],
-        verified_events=data["verified_events"],
+    Returns:
+        ConstructedTimeline. Events shared between the page, segments and
+        entity views are the same objects.
+    """
+    page = _decode_payload(page_payload)
+    events = [_row_to_event(row) for row in page[7]]
+
+    segments: list[TimelineSegment] = []
+    entity_views: list[EntityTimelineView] = []
+    if detail_payload is not None:
+        extra_rows, segment_rows, view_rows = _decode_payload(detail_payload)
+        table = events + [_row_to_event(row) for row in extra_rows]
+        segments = [
+            TimelineSegment(
+                period_start=_str_to_date(row[0]),
+                period_end=_str_to_date(row[1]),
+                period_label=row[2],
+                event_count=row[3],
+                events=[table[i] for i in row[4]],
+            )
+            for row in segment_rows
+        ]
+        entity_views = [
+            EntityTimelineView(
+                entity_id=row[0],
+                entity_name=row[1],
+                entity_type=_to_entity_type(row[2]),
+                first_appearance=_str_to_date(row[3]),
+                last_appearance=_str_to_date(row[4]),
+                event_count=row[5],
+                events=[table[i] for i in row[6]],
+            )
+            for row in view_rows
+        ]
+
+    return ConstructedTimeline(
+        matter_id=page[0],
+        events=events,
+        segments=segments,
+        entity_views=entity_views,
+        statistics=_row_to_stats(page[6]),
+        generated_at=datetime.fromisoformat(page[1]),
+        page=page[2],
+        per_page=page[3],
+        total_events=page[4],
+        total_pages=page[5],
     )
 
 
@@ -284,12 +360,15 @@ class TimelineCacheService:
     """Service for caching timeline data in Redis.
 
     Provides matter-level caching for constructed timelines to improve
-    performance for repeated queries.
+    performance for repeated queries. Uses redis.asyncio, so cache reads and
+    writes never block the event loop.
 
-    Cache keys:
-    - matter:{matter_id}:timeline:{page}:{per_page} - Full timeline pages
-    - matter:{matter_id}:timeline_stats - Timeline statistics
-    - matter:{matter_id}:timeline_entity:{entity_id} - Entity-focused views
+    Cache keys (g{n} is the matter's timeline cache generation):
+    - matter:{matter_id}:timeline:g{n}:{page}:{per_page} - Timeline page events
+    - matter:{matter_id}:timeline:g{n}:{page}:{per_page}:detail - Segments and
+      entity views of the page
+    - matter:{matter_id}:timeline:g{n}:stats - Timeline statistics
+    - matter:{matter_id}:timeline:g{n}:entity:{entity_id} - Entity-focused views
 
     Example:
         >>> cache = TimelineCacheService()
@@ -300,38 +379,60 @@ class TimelineCacheService:
     def __init__(self) -> None:
         """Initialize timeline cache service."""
         self._redis = None
+        # Loop the client was created on (Celery tasks run one loop per task)
+        self._redis_loop: asyncio.AbstractEventLoop | None = None
         self._settings = get_settings()
+        self._generations = CacheGenerations()
 
-    @property
-    def redis(self):
-        """Get Redis client.
+    async def _get_redis(self):
+        """Get the async Redis client for the running event loop.
 
         Returns Redis client if configured, None otherwise.
         Cache operations gracefully degrade to no-op when Redis unavailable.
         """
-        if self._redis is None:
+        loop = asyncio.get_running_loop()
+        if self._redis is not None and self._redis_loop in (None, loop):
+            return self._redis
+
+        if self._redis is not None:
+            # Client of a previous loop (each Celery task runs its own) -
+            # release its pooled connections before replacing it
+            previous, self._redis, self._redis_loop = self._redis, None, None
             try:
-                import redis
-
-                redis_url = self._settings.redis_url
-                if redis_url:
-                    self._redis = redis.from_url(
-                        redis_url, decode_responses=True
-                    )
-                    # Test connection
-                    self._redis.ping()
-                    logger.debug("timeline_cache_redis_connected")
-                else:
-                    logger.debug("timeline_cache_no_redis_url")
-                    return None
+                await previous.aclose()
             except Exception as e:
-                logger.warning(
-                    "timeline_cache_redis_unavailable",
-                    error=str(e),
-                )
+                # Connections bound to a closed loop can't be shut down
+                # cleanly; they are dropped with the client
+                logger.debug("timeline_cache_redis_close_failed", error=str(e))
+
+        try:
+            import redis.asyncio as aioredis
+
+            redis_url = self._settings.redis_url
+            if not redis_url:
+                logger.debug("timeline_cache_no_redis_url")
                 return None
 
-        return self._redis
+            client = aioredis.from_url(redis_url)
+            # Test connection
+            await client.ping()
+            self._redis = client
+            self._redis_loop = loop
+            logger.debug("timeline_cache_redis_connected")
+            return client
+        except Exception as e:
+            logger.warning(
+                "timeline_cache_redis_unavailable",
+                error=str(e),
+            )
+            return None
+
+    async def _key(self, redis: Any, matter_id: str, suffix: str) -> str:
+        """Build a timeline cache key for the matter's current generation."""
+        generation = await self._generations.current(
+            redis, matter_id, TIMELINE_CACHE_NAMESPACE
+        )
+        return f"{matter_key(matter_id, 'timeline')}:g{generation}:{suffix}"
 
     # =========================================================================
     # Timeline Cache Operations
@@ -342,6 +443,7 @@ class TimelineCacheService:
         matter_id: str,
         page: int = 1,
         per_page: int = 50,
+        include_details: bool = True,
     ) -> ConstructedTimeline | None:
         """Get cached timeline for a matter.
 
@@ -349,16 +451,25 @@ class TimelineCacheService:
             matter_id: Matter UUID.
             page: Page number.
             per_page: Items per page.
+            include_details: Also load segments and entity views. When False
+                only the page entry is read and decoded, and the returned
+                timeline has empty segments and entity_views.
 
         Returns:
             ConstructedTimeline if cached, None otherwise.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return None
 
         try:
-            key = f"{matter_key(matter_id, 'timeline')}:{page}:{per_page}"
-            cached = self.redis.get(key)
+            key = await self._key(redis, matter_id, f"{page}:{per_page}")
+            if include_details:
+                cached, detail = await redis.mget(key, f"{key}:detail")
+                if cached and not detail:
+                    cached = None  # Detail entry expired or evicted
+            else:
+                cached, detail = await redis.get(key), None
 
             if cached:
                 logger.debug(
@@ -366,7 +477,7 @@ class TimelineCacheService:
                     matter_id=matter_id,
                     page=page,
                 )
-                return _deserialize_timeline(cached)
+                return _deserialize_timeline(cached, detail)
 
             logger.debug(
                 "timeline_cache_miss",
@@ -399,18 +510,26 @@ class TimelineCacheService:
         Returns:
             True if cached successfully.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return False
 
         try:
-            key = f"{matter_key(matter_id, 'timeline')}:{timeline.page}:{timeline.per_page}"
-            serialized = _serialize_timeline(timeline)
-            self.redis.setex(key, ttl, serialized)
+            key = await self._key(
+                redis, matter_id, f"{timeline.page}:{timeline.per_page}"
+            )
+            page_payload, detail_payload = _serialize_timeline(timeline)
+
+            pipe = redis.pipeline(transaction=False)
+            pipe.setex(key, ttl, page_payload)
+            pipe.setex(f"{key}:detail", ttl, detail_payload)
+            await pipe.execute()
 
             logger.debug(
                 "timeline_cache_set",
                 matter_id=matter_id,
                 page=timeline.page,
+                size_bytes=len(page_payload) + len(detail_payload),
                 ttl=ttl,
             )
             return True
@@ -439,16 +558,16 @@ class TimelineCacheService:
         Returns:
             TimelineStatistics if cached, None otherwise.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return None
 
         try:
-            key = f"{matter_key(matter_id, 'stats')}:timeline"
-            cached = self.redis.get(key)
+            key = await self._key(redis, matter_id, "stats")
+            cached = await redis.get(key)
 
             if cached:
-                data = json.loads(cached, object_hook=timeline_decoder)
-                return _dict_to_stats(data)
+                return _row_to_stats(_decode_payload(cached))
 
             return None
 
@@ -476,13 +595,13 @@ class TimelineCacheService:
         Returns:
             True if cached successfully.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return False
 
         try:
-            key = f"{matter_key(matter_id, 'stats')}:timeline"
-            serialized = json.dumps(_stats_to_dict(stats), cls=TimelineCacheEncoder)
-            self.redis.setex(key, ttl, serialized)
+            key = await self._key(redis, matter_id, "stats")
+            await redis.setex(key, ttl, _encode_payload(_stats_to_row(stats)))
 
             logger.debug(
                 "timeline_stats_cache_set",
@@ -517,16 +636,16 @@ class TimelineCacheService:
         Returns:
             EntityTimelineView if cached, None otherwise.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return None
 
         try:
-            key = f"{matter_key(matter_id, 'timeline')}:entity:{entity_id}"
-            cached = self.redis.get(key)
+            key = await self._key(redis, matter_id, f"entity:{entity_id}")
+            cached = await redis.get(key)
 
             if cached:
-                data = json.loads(cached, object_hook=timeline_decoder)
-                return _dict_to_entity_view(data)
+                return _row_to_entity_view(_decode_payload(cached))
 
             return None
 
@@ -557,13 +676,13 @@ class TimelineCacheService:
         Returns:
             True if cached successfully.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return False
 
         try:
-            key = f"{matter_key(matter_id, 'timeline')}:entity:{entity_id}"
-            serialized = json.dumps(_entity_view_to_dict(view), cls=TimelineCacheEncoder)
-            self.redis.setex(key, ttl, serialized)
+            key = await self._key(redis, matter_id, f"entity:{entity_id}")
+            await redis.setex(key, ttl, _encode_payload(_entity_view_to_row(view)))
 
             logger.debug(
                 "entity_view_cache_set",
@@ -590,43 +709,31 @@ class TimelineCacheService:
         """Invalidate all timeline cache entries for a matter.
 
         Call this when events are added, updated, or entity links change.
+        Bumps the matter's timeline generation with a single INCR; entries of
+        the previous generation are never read again and expire by TTL.
 
         Args:
             matter_id: Matter UUID.
 
         Returns:
-            Number of cache entries deleted.
+            The new timeline cache generation, or 0 if nothing was invalidated.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return 0
 
         try:
-            # Use SCAN to find all timeline-related keys
-            pattern = f"{matter_key(matter_id, 'timeline')}:*"
-            stats_key = f"{matter_key(matter_id, 'stats')}:timeline"
-
-            deleted = 0
-            cursor = 0
-
-            # Delete timeline keys
-            while True:
-                cursor, keys = self.redis.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted += self.redis.delete(*keys)
-                if cursor == 0:
-                    break
-
-            # Delete stats key
-            if self.redis.delete(stats_key):
-                deleted += 1
+            generation = await self._generations.bump(
+                redis, matter_id, TIMELINE_CACHE_NAMESPACE
+            )
 
             logger.info(
                 "timeline_cache_invalidated",
                 matter_id=matter_id,
-                keys_deleted=deleted,
+                generation=generation,
             )
 
-            return deleted
+            return generation
 
         except Exception as e:
             logger.warning(
@@ -650,12 +757,13 @@ class TimelineCacheService:
         Returns:
             True if cache entry was deleted.
         """
-        if not self.redis:
+        redis = await self._get_redis()
+        if not redis:
             return False
 
         try:
-            key = f"{matter_key(matter_id, 'timeline')}:entity:{entity_id}"
-            deleted = self.redis.delete(key)
+            key = await self._key(redis, matter_id, f"entity:{entity_id}")
+            deleted = await redis.delete(key)
 
             if deleted:
                 logger.debug(
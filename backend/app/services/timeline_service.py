@@ -39,6 +39,14 @@ from app.services.supabase.client import get_service_client
 logger = structlog.get_logger(__name__)
 
 
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Rows per set-based bulk update RPC (one UPDATE ... FROM unnest statement)
+BULK_UPDATE_BATCH_SIZE = 500
+
+
 # =============================================================================
 # Exceptions
 # =============================================================================
@@ -921,48 +929,31 @@ class TimelineService:
     ) -> int:
         """Update multiple events with classification results.
 
+        Applies each batch of BULK_UPDATE_BATCH_SIZE events in a single
+        set-based statement (bulk_update_event_classifications RPC).
+
         Args:
             classifications: List of classification results.
             matter_id: Matter UUID for validation.
 
         Returns:
             Number of successfully updated events.
-
-        Raises:
-            TimelineServiceError: If bulk update fails.
         """
         if not classifications:
             return 0
 
-        updated_count = 0
-
-        for result in classifications:
-            try:
-                success = await self.update_event_classification(
-                    event_id=result.event_id,
-                    matter_id=matter_id,
-                    event_type=result.event_type.value,
-                    confidence=result.classification_confidence,
-                )
-                if success:
-                    updated_count += 1
-
-            except Exception as e:
-                logger.warning(
-                    "bulk_classification_item_failed",
-                    event_id=result.event_id,
-                    error=str(e),
-                )
-                continue
+        updated_ids = await asyncio.to_thread(
+            self._bulk_update_classifications, classifications, matter_id
+        )
 
         logger.info(
             "bulk_classifications_updated",
             matter_id=matter_id,
             total=len(classifications),
-            updated=updated_count,
+            updated=len(updated_ids),
         )
 
-        return updated_count
+        return len(updated_ids)
 
     def bulk_update_classifications_sync(
         self,
@@ -981,35 +972,105 @@ class TimelineService:
         if not classifications:
             return 0
 
-        updated_count = 0
+        updated_ids = self._bulk_update_classifications(classifications, matter_id)
+
+        logger.info(
+            "bulk_classifications_updated_sync",
+            matter_id=matter_id,
+            total=len(classifications),
+            updated=len(updated_ids),
+        )
+
+        return len(updated_ids)
+
+    def _bulk_update_classifications(
+        self,
+        classifications: list[EventClassificationResult],
+        matter_id: str,
+    ) -> set[str]:
+        """Apply classification results batch by batch.
+
+        A batch whose RPC fails is retried row by row so one bad row only
+        fails itself.
+
+        Returns:
+            IDs of the events that were updated.
+        """
+        updated_ids: set[str] = set()
+
+        for i in range(0, len(classifications), BULK_UPDATE_BATCH_SIZE):
+            batch = classifications[i:i + BULK_UPDATE_BATCH_SIZE]
+            try:
+                response = self.client.rpc(
+                    "bulk_update_event_classifications",
+                    {
+                        "p_matter_id": matter_id,
+                        "p_event_ids": [r.event_id for r in batch],
+                        "p_event_types": [r.event_type.value for r in batch],
+                        "p_confidences": [r.classification_confidence for r in batch],
+                        "p_is_manual": False,
+                    },
+                ).execute()
+                batch_updated = {str(row["event_id"]) for row in response.data or []}
+            except Exception as e:
+                logger.warning(
+                    "bulk_classification_batch_failed",
+                    matter_id=matter_id,
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+                batch_updated = self._update_classifications_row_by_row(batch, matter_id)
+
+            updated_ids |= batch_updated
+            self._log_not_updated(
+                "bulk_classification_items_not_updated",
+                matter_id,
+                [r.event_id for r in batch],
+                batch_updated,
+            )
+
+        return updated_ids
 
+    def _update_classifications_row_by_row(
+        self,
+        classifications: list[EventClassificationResult],
+        matter_id: str,
+    ) -> set[str]:
+        """Fallback: one update per event, isolating failures."""
+        updated_ids: set[str] = set()
         for result in classifications:
             try:
-                success = self.update_event_classification_sync(
+                if self.update_event_classification_sync(
                     event_id=result.event_id,
                     matter_id=matter_id,
                     event_type=result.event_type.value,
                     confidence=result.classification_confidence,
-                )
-                if success:
-                    updated_count += 1
-
+                ):
+                    updated_ids.add(result.event_id)
             except Exception as e:
                 logger.warning(
-                    "bulk_classification_sync_item_failed",
+                    "bulk_classification_item_failed",
                     event_id=result.event_id,
                     error=str(e),
                 )
-                continue
+        return updated_ids
 
-        logger.info(
-            "bulk_classifications_updated_sync",
-            matter_id=matter_id,
-            total=len(classifications),
-            updated=updated_count,
-        )
-
-        return updated_count
+    def _log_not_updated(
+        self,
+        event: str,
+        matter_id: str,
+        event_ids: list[str],
+        updated_ids: set[str],
+    ) -> None:
+        """Report events of a batch that were not updated (missing or failed)."""
+        not_updated = [event_id for event_id in event_ids if event_id not in updated_ids]
+        if not_updated:
+            logger.warning(
+                event,
+                matter_id=matter_id,
+                count=len(not_updated),
+                event_ids=not_updated[:20],
+            )
 
     async def get_classified_events(
         self,
@@ -1518,6 +1579,9 @@ class TimelineService:
     ) -> int:
         """Bulk update entities for multiple events.
 
+        Applies each batch of BULK_UPDATE_BATCH_SIZE events in a single
+        set-based statement (bulk_update_event_entities RPC).
+
         Args:
             event_entities: Dict mapping event_id to list of entity_ids.
             matter_id: Matter UUID for validation.
@@ -1528,33 +1592,18 @@ class TimelineService:
         if not event_entities:
             return 0
 
-        updated_count = 0
-
-        for event_id, entity_ids in event_entities.items():
-            try:
-                success = await self.update_event_entities(
-                    event_id=event_id,
-                    matter_id=matter_id,
-                    entity_ids=entity_ids,
-                )
-                if success:
-                    updated_count += 1
-            except Exception as e:
-                logger.warning(
-                    "bulk_entity_update_item_failed",
-                    event_id=event_id,
-                    error=str(e),
-                )
-                continue
+        updated_ids = await asyncio.to_thread(
+            self._bulk_update_event_entities, event_entities, matter_id
+        )
 
         logger.info(
             "bulk_entity_update_complete",
             matter_id=matter_id,
             total=len(event_entities),
-            updated=updated_count,
+            updated=len(updated_ids),
         )
 
-        return updated_count
+        return len(updated_ids)
 
     def bulk_update_event_entities_sync(
         self,
@@ -1573,33 +1622,76 @@ class TimelineService:
         if not event_entities:
             return 0
 
-        updated_count = 0
-
-        for event_id, entity_ids in event_entities.items():
-            try:
-                success = self.update_event_entities_sync(
-                    event_id=event_id,
-                    matter_id=matter_id,
-                    entity_ids=entity_ids,
-                )
-                if success:
-                    updated_count += 1
-            except Exception as e:
-                logger.warning(
-                    "bulk_entity_update_sync_item_failed",
-                    event_id=event_id,
-                    error=str(e),
-                )
-                continue
+        updated_ids = self._bulk_update_event_entities(event_entities, matter_id)
 
         logger.info(
             "bulk_entity_update_sync_complete",
             matter_id=matter_id,
             total=len(event_entities),
-            updated=updated_count,
+            updated=len(updated_ids),
         )
 
-        return updated_count
+        return len(updated_ids)
+
+    def _bulk_update_event_entities(
+        self,
+        event_entities: dict[str, list[str]],
+        matter_id: str,
+    ) -> set[str]:
+        """Apply entity links batch by batch, falling back row by row on error.
+
+        Returns:
+            IDs of the events that were updated.
+        """
+        items = list(event_entities.items())
+        updated_ids: set[str] = set()
+
+        for i in range(0, len(items), BULK_UPDATE_BATCH_SIZE):
+            batch = items[i:i + BULK_UPDATE_BATCH_SIZE]
+            try:
+                response = self.client.rpc(
+                    "bulk_update_event_entities",
+                    {
+                        "p_matter_id": matter_id,
+                        "p_updates": [
+                            {"event_id": event_id, "entity_ids": entity_ids}
+                            for event_id, entity_ids in batch
+                        ],
+                    },
+                ).execute()
+                batch_updated = {str(row["event_id"]) for row in response.data or []}
+            except Exception as e:
+                logger.warning(
+                    "bulk_entity_update_batch_failed",
+                    matter_id=matter_id,
+                    batch_size=len(batch),
+                    error=str(e),
+                )
+                batch_updated = set()
+                for event_id, entity_ids in batch:
+                    try:
+                        if self.update_event_entities_sync(
+                            event_id=event_id,
+                            matter_id=matter_id,
+                            entity_ids=entity_ids,
+                        ):
+                            batch_updated.add(event_id)
+                    except Exception as item_error:
+                        logger.warning(
+                            "bulk_entity_update_item_failed",
+                            event_id=event_id,
+                            error=str(item_error),
+                        )
+
+            updated_ids |= batch_updated
+            self._log_not_updated(
+                "bulk_entity_update_items_not_updated",
+                matter_id,
+                [event_id for event_id, _ in batch],
+                batch_updated,
+            )
+
+        return updated_ids
 
     async def get_events_for_entity_linking(
         self,
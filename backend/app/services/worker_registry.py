@@ -0,0 +1,298 @@
+"""Worker registry built from Celery worker heartbeats.
+
+Story 5.6: Queue Depth Visibility Dashboard
+Story 5.7: Processing ETA Display
+
+Each worker publishes a small heartbeat (capacity, active tasks per queue,
+consumed queues) to the broker Redis on Celery's heartbeat signal. Readers
+get every live worker from one sorted set and one hash, instead of
+broadcasting Celery inspect() to all workers and waiting for replies.
+
+Redis layout:
+- workers:heartbeats       sorted set, member=hostname, score=last heartbeat (unix)
+- workers:heartbeat_info   hash, field=hostname, value=heartbeat JSON
+
+A worker is live while its score is newer than WORKER_STALE_AFTER_SECONDS.
+
+Active task counts come from task_prerun/task_postrun in the worker process,
+so they are exact for the gevent/solo/threads pools this service runs with.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Redis keys (broker Redis, shared by all workers and API instances)
+WORKER_HEARTBEATS_KEY = "workers:heartbeats"
+WORKER_HEARTBEAT_INFO_KEY = "workers:heartbeat_info"
+
+# Publish at most this often (Celery fires heartbeat_sent every ~2s)
+HEARTBEAT_INTERVAL_SECONDS = 10
+
+# Workers without a heartbeat for this long are considered gone
+WORKER_STALE_AFTER_SECONDS = 30
+
+# Queue assumed for tasks without delivery info
+DEFAULT_TASK_QUEUE = "default"
+
+
+@dataclass
+class WorkerHeartbeat:
+    """Heartbeat published by one Celery worker.
+
+    Attributes:
+        hostname: Celery worker node name (e.g. celery@host).
+        concurrency: Pool size (max concurrent tasks).
+        active_tasks: Tasks currently executing.
+        active_by_queue: Executing tasks per queue name.
+        queues: Queues the worker consumes from.
+        pid: Worker process id.
+        timestamp: Unix time the heartbeat was built.
+    """
+
+    hostname: str
+    concurrency: int
+    active_tasks: int
+    active_by_queue: dict[str, int] = field(default_factory=dict)
+    queues: list[str] = field(default_factory=list)
+    pid: int = 0
+    timestamp: float = 0.0
+
+    def to_json(self) -> str:
+        """Serialize for the heartbeat info hash."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "WorkerHeartbeat":
+        """Parse a heartbeat stored by WorkerHeartbeatPublisher."""
+        data = json.loads(raw)
+        return cls(
+            hostname=data["hostname"],
+            concurrency=int(data.get("concurrency", 0)),
+            active_tasks=int(data.get("active_tasks", 0)),
+            active_by_queue={
+                k: int(v) for k, v in (data.get("active_by_queue") or {}).items()
+            },
+            queues=list(data.get("queues") or []),
+            pid=int(data.get("pid", 0)),
+            timestamp=float(data.get("timestamp", 0.0)),
+        )
+
+
+def parse_live_workers(
+    live_hostnames: list[str],
+    heartbeat_info: dict[str, str],
+) -> list[WorkerHeartbeat]:
+    """Build heartbeats for live workers from the registry keys.
+
+    Args:
+        live_hostnames: Members of WORKER_HEARTBEATS_KEY with a fresh score.
+        heartbeat_info: Contents of WORKER_HEARTBEAT_INFO_KEY.
+
+    Returns:
+        Heartbeats of live workers, skipping missing or malformed entries.
+    """
+    workers = []
+    for hostname in live_hostnames:
+        raw = heartbeat_info.get(hostname)
+        if not raw:
+            continue
+        try:
+            workers.append(WorkerHeartbeat.from_json(raw))
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "worker_heartbeat_parse_failed",
+                hostname=hostname,
+                error=str(e),
+            )
+    return workers
+
+
+class WorkerHeartbeatPublisher:
+    """Tracks this worker's activity and publishes it to the registry.
+
+    Created once per worker process on worker_ready. Publishing errors
+    are logged and never raised into Celery.
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        concurrency: int,
+        queues: list[str],
+        redis_client: object | None = None,
+        interval_seconds: float = HEARTBEAT_INTERVAL_SECONDS,
+    ):
+        """Initialize publisher.
+
+        Args:
+            hostname: Celery worker node name.
+            concurrency: Pool size.
+            queues: Queues the worker consumes from.
+            redis_client: Optional sync Redis client. Uses the broker client if None.
+            interval_seconds: Minimum seconds between heartbeats.
+        """
+        self.hostname = hostname
+        self.concurrency = concurrency
+        self.queues = sorted(queues)
+        self._redis = redis_client
+        self._interval = interval_seconds
+        self._active_by_queue: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._last_published = 0.0
+
+    def _get_redis(self) -> object:
+        if self._redis is None:
+            from app.services.distributed_lock import get_sync_redis_client
+
+            self._redis = get_sync_redis_client()
+        return self._redis
+
+    def task_started(self, queue: str | None) -> None:
+        """Count a task that started executing."""
+        queue = queue or DEFAULT_TASK_QUEUE
+        with self._lock:
+            self._active_by_queue[queue] = self._active_by_queue.get(queue, 0) + 1
+
+    def task_finished(self, queue: str | None) -> None:
+        """Count a task that finished executing."""
+        queue = queue or DEFAULT_TASK_QUEUE
+        with self._lock:
+            remaining = self._active_by_queue.get(queue, 0) - 1
+            if remaining > 0:
+                self._active_by_queue[queue] = remaining
+            else:
+                self._active_by_queue.pop(queue, None)
+
+    def heartbeat(self) -> WorkerHeartbeat:
+        """Build the current heartbeat."""
+        with self._lock:
+            active_by_queue = dict(self._active_by_queue)
+        return WorkerHeartbeat(
+            hostname=self.hostname,
+            concurrency=self.concurrency,
+            active_tasks=sum(active_by_queue.values()),
+            active_by_queue=active_by_queue,
+            queues=self.queues,
+            pid=os.getpid(),
+            timestamp=time.time(),
+        )
+
+    def maybe_publish(self) -> bool:
+        """Publish if the heartbeat interval has elapsed.
+
+        Returns:
+            True if a heartbeat was published.
+        """
+        if time.monotonic() - self._last_published < self._interval:
+            return False
+        return self.publish()
+
+    def publish(self) -> bool:
+        """Publish the heartbeat and prune workers that stopped reporting.
+
+        Returns:
+            True if the heartbeat was stored.
+        """
+        heartbeat = self.heartbeat()
+        self._last_published = time.monotonic()
+
+        try:
+            redis_client = self._get_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zadd(WORKER_HEARTBEATS_KEY, {self.hostname: heartbeat.timestamp})
+            pipe.hset(WORKER_HEARTBEAT_INFO_KEY, self.hostname, heartbeat.to_json())
+            pipe.zrangebyscore(
+                WORKER_HEARTBEATS_KEY,
+                "-inf",
+                heartbeat.timestamp - WORKER_STALE_AFTER_SECONDS,
+            )
+            _, _, stale = pipe.execute()
+
+            if stale:
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.zrem(WORKER_HEARTBEATS_KEY, *stale)
+                pipe.hdel(WORKER_HEARTBEAT_INFO_KEY, *stale)
+                pipe.execute()
+                logger.info("stale_workers_pruned", hostnames=stale)
+
+            return True
+        except Exception as e:
+            logger.warning(
+                "worker_heartbeat_publish_failed",
+                hostname=self.hostname,
+                error=str(e),
+            )
+            return False
+
+    def unregister(self) -> None:
+        """Remove this worker from the registry (worker shutdown)."""
+        try:
+            redis_client = self._get_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zrem(WORKER_HEARTBEATS_KEY, self.hostname)
+            pipe.hdel(WORKER_HEARTBEAT_INFO_KEY, self.hostname)
+            pipe.execute()
+            logger.info("worker_unregistered", hostname=self.hostname)
+        except Exception as e:
+            logger.warning(
+                "worker_unregister_failed",
+                hostname=self.hostname,
+                error=str(e),
+            )
+
+
+# Publisher of the current worker process (None outside workers)
+_publisher: WorkerHeartbeatPublisher | None = None
+
+
+def start_worker_heartbeats(
+    hostname: str,
+    concurrency: int,
+    queues: list[str],
+) -> WorkerHeartbeatPublisher:
+    """Create this process's publisher and publish the first heartbeat.
+
+    Args:
+        hostname: Celery worker node name.
+        concurrency: Pool size.
+        queues: Queues the worker consumes from.
+
+    Returns:
+        The process-wide publisher.
+    """
+    global _publisher
+
+    _publisher = WorkerHeartbeatPublisher(
+        hostname=hostname,
+        concurrency=concurrency,
+        queues=queues,
+    )
+    _publisher.publish()
+    logger.info(
+        "worker_heartbeats_started",
+        hostname=hostname,
+        concurrency=concurrency,
+        queues=_publisher.queues,
+    )
+    return _publisher
+
+
+def get_worker_heartbeat_publisher() -> WorkerHeartbeatPublisher | None:
+    """Get this process's publisher, if it is a registered worker."""
+    return _publisher
+
+
+def stop_worker_heartbeats() -> None:
+    """Unregister this worker and drop the publisher."""
+    global _publisher
+
+    if _publisher is not None:
+        _publisher.unregister()
+        _publisher = None
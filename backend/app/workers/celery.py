@@ -222,6 +222,7 @@ _TASK_MODULES = [
     "app.workers.tasks.maintenance_tasks",
     "app.workers.tasks.quota_monitoring_tasks",
     "app.workers.tasks.reasoning_archive_tasks",
+    "app.workers.tasks.summary_tasks",
     "app.workers.tasks.verification_tasks",
 ]
 
@@ -280,7 +281,16 @@ if _missing_tasks:
 # Logs permanently failed tasks (after all retries exhausted) for debugging
 # and monitoring. These are tasks that cannot be recovered automatically.
 
-from celery.signals import task_failure, task_retry, worker_ready
+from celery.signals import (
+    heartbeat_sent,
+    task_failure,
+    task_postrun,
+    task_prerun,
+    task_retry,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 
 
 @worker_ready.connect
@@ -305,6 +315,93 @@ def initialize_cost_service(sender=None, **kwargs):
         )
 
 
+# =============================================================================
+# Worker Heartbeat Registry (Story 5.6 / 5.7)
+# =============================================================================
+# Workers publish capacity and active tasks to Redis so queue metrics and ETAs
+# don't need a Celery inspect() broadcast.
+
+
+def _task_queue(task) -> str | None:
+    """Queue a task was delivered from (its routing key)."""
+    request = getattr(task, "request", None)
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    return delivery_info.get("routing_key")
+
+
+@worker_ready.connect
+def register_worker_heartbeat(sender=None, **kwargs):
+    """Register this worker in the heartbeat registry when it starts."""
+    try:
+        from app.services.worker_registry import start_worker_heartbeats
+
+        controller = getattr(sender, "controller", None)
+        concurrency = getattr(controller, "concurrency", None) or celery_app.conf.worker_concurrency
+        queues = list(celery_app.amqp.queues.consume_from or celery_app.amqp.queues)
+
+        start_worker_heartbeats(
+            hostname=getattr(sender, "hostname", None) or "unknown",
+            concurrency=int(concurrency or 0),
+            queues=queues,
+        )
+    except Exception as e:
+        _logger.warning("worker_heartbeat_registration_failed", error=str(e))
+
+
+@heartbeat_sent.connect
+def publish_worker_heartbeat(sender=None, **kwargs):
+    """Publish to the registry on Celery's heartbeat tick (throttled)."""
+    from app.services.worker_registry import get_worker_heartbeat_publisher
+
+    publisher = get_worker_heartbeat_publisher()
+    if publisher is not None:
+        publisher.maybe_publish()
+
+
+@task_prerun.connect
+def count_task_started(sender=None, task=None, **kwargs):
+    """Count an executing task for the worker heartbeat."""
+    from app.services.worker_registry import get_worker_heartbeat_publisher
+
+    publisher = get_worker_heartbeat_publisher()
+    if publisher is not None:
+        publisher.task_started(_task_queue(task or sender))
+
+
+@task_postrun.connect
+def count_task_finished(sender=None, task=None, **kwargs):
+    """Count a finished task for the worker heartbeat."""
+    from app.services.worker_registry import get_worker_heartbeat_publisher
+
+    publisher = get_worker_heartbeat_publisher()
+    if publisher is not None:
+        publisher.task_finished(_task_queue(task or sender))
+
+
+@worker_shutdown.connect
+def unregister_worker_heartbeat(sender=None, **kwargs):
+    """Remove this worker from the heartbeat registry on shutdown."""
+    from app.services.worker_registry import stop_worker_heartbeats
+
+    stop_worker_heartbeats()
+
+
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def flush_cost_records(sender=None, **kwargs):
+    """Insert LLM cost records still buffered by the write-behind recorder.
+
+    worker_process_shutdown covers prefork children, which buffer their own
+    records; gevent/solo workers only get worker_shutdown.
+    """
+    try:
+        from app.core.cost_tracking import close_cost_service
+
+        close_cost_service()
+    except Exception as e:
+        _logger.warning("cost_records_flush_failed_in_worker", error=str(e))
+
+
 @task_failure.connect
 def handle_task_failure(
     sender=None,
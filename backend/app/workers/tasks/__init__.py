@@ -13,4 +13,5 @@ __all__ = [
     "table_extraction_tasks",
     "evaluation_tasks",
     "act_validation_tasks",
+    "summary_tasks",
 ]
@@ -24,6 +24,12 @@ from app.engines.citation.validation import (
     ValidationStatus,
     is_validation_enabled,
 )
+from app.services.act_acquisition_service import (
+    AcquisitionStatus,
+    ActAcquisitionRequest,
+    ActAcquisitionResult,
+    ActAcquisitionService,
+)
 from app.services.act_cache_service import get_act_cache_service
 from app.services.supabase.client import get_service_client
 from app.workers.celery import celery_app
@@ -400,8 +406,9 @@ def fetch_acts_from_india_code(self) -> dict:
 
     This task:
     1. Gets acts that are validated as 'valid' but not yet cached
-    2. Attempts to fetch PDF from India Code (using known mappings first)
-    3. Caches the PDF globally
+    2. Fetches missing PDFs from India Code concurrently via
+       ActAcquisitionService (known mappings first, then search)
+    3. Caches the PDF globally and records it in the act cache manifest
     4. Updates validation cache and act resolutions
 
     Returns:
@@ -438,117 +445,57 @@ def fetch_acts_from_india_code(self) -> dict:
         "errors": 0,
     }
 
-    # Run async fetch
-    async def _fetch_all():
-        async with IndiaCodeClient() as india_code:
-            for act in acts:
-                normalized = act.get("act_name_normalized", "")
-                canonical = act.get("act_name_canonical")
-                year = act.get("act_year")
-                doc_id = act.get("india_code_doc_id")
-
-                try:
-                    # Check if already cached
-                    if cache_service.is_cached(normalized):
-                        storage_path = cache_service._get_storage_path(normalized)
-                        _update_validation_cache(
-                            client,
-                            normalized,
-                            "valid",
-                            cached_storage_path=storage_path,
-                        )
-                        results["fetched"] += 1
-                        continue
+    # Acquire all acts concurrently (cached ones are skipped via the manifest)
+    requests = [
+        ActAcquisitionRequest(
+            normalized_name=act.get("act_name_normalized", ""),
+            canonical_name=act.get("act_name_canonical"),
+            year=act.get("act_year"),
+        )
+        for act in acts
+    ]
 
-                    # Try known mapping first
-                    pdf_url = india_code.get_known_pdf_url(normalized)
-                    if pdf_url:
-                        results["known_mapping"] += 1
-                        known_doc_id = india_code.get_known_doc_id(normalized)
+    async def _fetch_all() -> dict[str, ActAcquisitionResult]:
+        acquisition = ActAcquisitionService(cache_service=cache_service)
+        async with IndiaCodeClient() as india_code:
+            return await acquisition.acquire_many(requests, india_code)
 
-                        download = await india_code.download_pdf(
-                            known_doc_id, pdf_url
-                        )
+    # Run the async function
+    acquired = asyncio.run(_fetch_all())
 
-                        if download.success and download.pdf_bytes:
-                            storage_path = cache_service.cache_act(
-                                normalized, download.pdf_bytes
-                            )
-
-                            _update_validation_cache(
-                                client,
-                                normalized,
-                                "valid",
-                                india_code_url=pdf_url,
-                                india_code_doc_id=known_doc_id,
-                                cached_storage_path=storage_path,
-                            )
-
-                            results["fetched"] += 1
-                            logger.info(
-                                "fetch_act_success_known",
-                                normalized=normalized,
-                                url=pdf_url,
-                            )
-                            continue
-                        else:
-                            logger.warning(
-                                "fetch_act_download_failed_known",
-                                normalized=normalized,
-                                error=download.error_message,
-                            )
-
-                    # Try search if we have canonical name
-                    if canonical:
-                        results["searched"] += 1
-                        search_results = await india_code.search_act(canonical, year)
-
-                        if search_results:
-                            first_result = search_results[0]
-                            download = await india_code.download_pdf(first_result.doc_id)
-
-                            if download.success and download.pdf_bytes:
-                                storage_path = cache_service.cache_act(
-                                    normalized, download.pdf_bytes
-                                )
-
-                                _update_validation_cache(
-                                    client,
-                                    normalized,
-                                    "valid",
-                                    india_code_url=first_result.handle_url,
-                                    india_code_doc_id=first_result.doc_id,
-                                    cached_storage_path=storage_path,
-                                )
-
-                                results["fetched"] += 1
-                                logger.info(
-                                    "fetch_act_success_search",
-                                    normalized=normalized,
-                                    doc_id=first_result.doc_id,
-                                )
-                                continue
-
-                    # Not found - mark as not_on_indiacode
-                    _update_validation_cache(
-                        client,
-                        normalized,
-                        "not_on_indiacode",
-                        ValidationSource.INDIA_CODE.value,
-                    )
-                    results["not_found"] += 1
-                    logger.info("fetch_act_not_found", normalized=normalized)
-
-                except Exception as e:
-                    logger.error(
-                        "fetch_act_error",
-                        normalized=normalized,
-                        error=str(e),
-                    )
-                    results["errors"] += 1
+    for normalized, acquisition in acquired.items():
+        results["known_mapping"] += int(acquisition.used_known_mapping)
+        results["searched"] += int(acquisition.searched)
 
-    # Run the async function
-    asyncio.run(_fetch_all())
+        if acquisition.status == AcquisitionStatus.CACHED:
+            _update_validation_cache(
+                client,
+                normalized,
+                "valid",
+                cached_storage_path=acquisition.storage_path,
+            )
+            results["fetched"] += 1
+        elif acquisition.status == AcquisitionStatus.FETCHED:
+            _update_validation_cache(
+                client,
+                normalized,
+                "valid",
+                india_code_url=acquisition.source_url,
+                india_code_doc_id=acquisition.india_code_doc_id,
+                cached_storage_path=acquisition.storage_path,
+            )
+            results["fetched"] += 1
+        elif acquisition.status == AcquisitionStatus.NOT_FOUND:
+            # Not found - mark as not_on_indiacode
+            _update_validation_cache(
+                client,
+                normalized,
+                "not_on_indiacode",
+                ValidationSource.INDIA_CODE.value,
+            )
+            results["not_found"] += 1
+        else:
+            results["errors"] += 1
 
     # Update act resolutions for fetched acts
     _update_matter_resolutions_from_cache(client)
@@ -564,7 +511,6 @@ def _update_matter_resolutions_from_cache(client: Any) -> dict:
 
     Returns dict with counts of resolutions and documents updated/created.
     """
-    settings = get_settings()
     cache_service = get_act_cache_service()
 
     try:
@@ -598,21 +544,9 @@ def _update_matter_resolutions_from_cache(client: Any) -> dict:
             for resolution in missing_resolutions:
                 matter_id = resolution.get("matter_id")
 
-                # Get file size from storage for document record
-                file_size = 0
-                try:
-                    # Try to get size from storage metadata
-                    prefix = settings.act_cache_storage_prefix
-                    files = client.storage.from_("documents").list(
-                        path=f"{prefix}/",
-                        options={"search": f"{normalized}.pdf"}
-                    )
-                    for f in files or []:
-                        if f.get("name") == f"{normalized}.pdf":
-                            file_size = f.get("metadata", {}).get("size", 0)
-                            break
-                except Exception:
-                    file_size = 0
+                # File size from the act cache manifest
+                entry = cache_service.get_entry(normalized)
+                file_size = entry.file_size if entry else 0
 
                 # Create document record for this matter
                 doc_id = _create_document_for_auto_fetched_act(
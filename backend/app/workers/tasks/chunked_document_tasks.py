@@ -9,13 +9,9 @@ processing each chunk in parallel using Celery group().
 """
 
 import asyncio
-import hashlib
-import json
 import signal
 import time
-from io import BytesIO
 
-import pypdf
 import structlog
 from celery import group
 
@@ -42,10 +38,12 @@ from app.services.ocr_result_merger import (
     MergeValidationError,
     get_ocr_result_merger,
 )
+from app.services.pdf_blob_cache import open_storage_pdf_blob
 from app.services.pdf_chunker import (
     PDFChunker,
     get_pdf_chunker,
 )
+from app.services.pdf_manifest import extract_page_range
 from app.services.pubsub_service import broadcast_document_status
 from app.services.security.injection_detector import (
     scan_document_for_injection,
@@ -627,26 +625,23 @@ def process_single_chunk(
                     code="DOCUMENT_NOT_FOUND",
                 )
 
-            # Download full PDF
-            pdf_bytes = storage.download_file(document.storage_path)
-
-            # Story 19.1: Update heartbeat after download
-            _run_async(chunks_svc.update_heartbeat(chunk_id))
-
-            # Extract just this chunk's pages directly using pypdf (more memory efficient)
-            # The split_pdf method processes ALL pages which exceeds memory limits for large PDFs
-            reader = pypdf.PdfReader(BytesIO(pdf_bytes))
-            writer = pypdf.PdfWriter()
-            for page_idx in range(page_start - 1, page_end):  # Convert to 0-based
-                writer.add_page(reader.pages[page_idx])
-            buffer = BytesIO()
-            writer.write(buffer)
-            chunk_bytes = buffer.getvalue()
-
-            # Clear references to free memory
-            del reader
-            del writer
-            del pdf_bytes
+            # Memory-map the full PDF from the worker-local blob cache: sibling
+            # chunk tasks on this host share one download
+            with open_storage_pdf_blob(storage, document.storage_path) as (
+                pdf_view,
+                pdf_sha256,
+            ):
+                # Story 19.1: Update heartbeat after download
+                _run_async(chunks_svc.update_heartbeat(chunk_id))
+
+                # Extract just this chunk's pages (more memory efficient than
+                # split_pdf, which processes ALL pages). The document's PDF
+                # manifest lets us load these pages without walking the page
+                # tree; it is checked against the blob cache's content hash.
+                manifest = docs_svc.get_pdf_manifest(document_id)
+                if manifest is not None and not manifest.matches(pdf_view, pdf_sha256):
+                    manifest = None
+                chunk_bytes = extract_page_range(pdf_view, page_start, page_end, manifest)
 
             # Story 19.1: Update heartbeat before OCR (long operation)
             _run_async(chunks_svc.update_heartbeat(chunk_id))
@@ -660,29 +655,34 @@ def process_single_chunk(
             # Story 19.1: Update heartbeat after OCR completes
             _run_async(chunks_svc.update_heartbeat(chunk_id))
 
-            # Store bounding boxes in database (same as non-chunked processing)
-            # Adjust page numbers to be relative to the full document, not the chunk
-            # The BoundingBox objects have a 'page' attribute that needs adjustment
+            # Adjust page numbers to be relative to the full document, not the
+            # chunk: chunk's page 1 = document's page_start
             for bbox in ocr_result.bounding_boxes:
-                # Adjust page number: chunk's page 1 = document's page_start
                 bbox.page = bbox.page + page_start - 1
 
-            # Store bounding boxes using the bounding box service
-            # Note: save_bounding_boxes is synchronous, not async
+            # Store this chunk's boxes now, tagged by chunk, so the merge step
+            # never rewrites them. A retry replaces only this chunk's rows.
+            # Note: replace_chunk_bounding_boxes is synchronous, not async
             bbox_svc = get_bounding_box_service()
-            bbox_svc.save_bounding_boxes(
+            bbox_count = bbox_svc.replace_chunk_bounding_boxes(
                 document_id=document_id,
                 matter_id=matter_id,
+                chunk_index=chunk_index,
                 bounding_boxes=ocr_result.bounding_boxes,
             )
 
-            # Calculate checksum of results for idempotency
-            result_json = json.dumps({
-                "full_text": ocr_result.full_text,
-                "overall_confidence": ocr_result.overall_confidence,
-                "page_count": ocr_result.page_count,
-            })
-            result_checksum = hashlib.sha256(result_json.encode()).hexdigest()
+            # Checksum of results, validated at merge and used for idempotency
+            result_checksum = get_ocr_result_merger().compute_chunk_checksum(
+                ChunkOCRResult(
+                    chunk_index=chunk_index,
+                    page_start=page_start,
+                    page_end=page_end,
+                    full_text=ocr_result.full_text,
+                    overall_confidence=ocr_result.overall_confidence,
+                    page_count=ocr_result.page_count,
+                    bbox_count=bbox_count,
+                )
+            )
 
             # Update chunk record with completion info (no storage path needed)
             _run_async(
@@ -709,7 +709,7 @@ def process_single_chunk(
                 "chunk_processed_successfully",
                 document_id=document_id,
                 chunk_index=chunk_index,
-                bbox_count=len(ocr_result.bounding_boxes),
+                bbox_count=bbox_count,
                 confidence=ocr_result.overall_confidence,
                 processing_time_seconds=round(processing_time, 2),
             )
@@ -720,7 +720,7 @@ def process_single_chunk(
                 "page_start": page_start,
                 "page_end": page_end,
                 "checksum": result_checksum,
-                "bbox_count": len(ocr_result.bounding_boxes),
+                "bbox_count": bbox_count,
                 "confidence": ocr_result.overall_confidence,
                 "page_count": ocr_result.page_count,
                 "full_text": ocr_result.full_text,
@@ -786,6 +786,10 @@ def _merge_and_store_results(
 ) -> dict:
     """Merge chunk results and store final document data.
 
+    Bounding boxes are already stored by each chunk, so this validates
+    checksums, stitches text and only removes boxes left from an earlier
+    OCR run of the document.
+
     Args:
         document_id: Document UUID.
         matter_id: Matter UUID.
@@ -826,26 +830,21 @@ def _merge_and_store_results(
                     chunk_index=result["chunk_index"],
                     page_start=result["page_start"],
                     page_end=result["page_end"],
-                    bounding_boxes=result.get("bounding_boxes", []),
                     full_text=result.get("full_text", ""),
                     overall_confidence=result.get("confidence", 0.0),
                     page_count=result.get("page_count", 0),
-                    checksum=result.get("checksum"),
+                    bbox_count=result.get("bbox_count", 0),
+                    # Cached results carry no text to validate against
+                    checksum=None if result.get("from_cache") else result.get("checksum"),
                 )
             )
 
-        # Merge results
-        merged = merger.merge_results(chunk_results, document_id)
-
-        # Delete existing bboxes (in case of reprocessing)
-        bbox_service.delete_bounding_boxes(document_id)
+        # Validate checksums and stitch text (boxes were stored per chunk)
+        merged = merger.stitch_results(chunk_results, document_id)
 
-        # Save merged bounding boxes
-        saved_count = bbox_service.save_bounding_boxes(
-            document_id=document_id,
-            matter_id=matter_id,
-            bounding_boxes=merged.bounding_boxes,
-        )
+        # Remove boxes from a previous OCR run of this document
+        bbox_service.delete_stale_bounding_boxes(document_id, merged.chunk_count)
+        saved_count = merged.total_bboxes
 
         # Update document with OCR results
         doc_service.update_ocr_status(
@@ -1338,9 +1337,11 @@ def finalize_chunked_document(
     for chunk in chunks:
         total_page_count += (chunk.page_end - chunk.page_start + 1)
 
-    # Count bounding boxes from database
+    # Count bounding boxes from database, dropping any left from a previous
+    # OCR run (boxes of this run are tagged with chunk indices < len(chunks))
     from app.services.bounding_box_service import get_bounding_box_service
     bbox_service = get_bounding_box_service()
+    bbox_service.delete_stale_bounding_boxes(document_id, len(chunks))
     bboxes, bbox_count = bbox_service.get_bounding_boxes_for_document(document_id)
 
     # Update document status to OCR_COMPLETE
@@ -13,6 +13,7 @@ Job Tracking Integration (Story 2c-3):
 
 import asyncio
 import contextlib
+import mmap
 
 import structlog
 from celery.exceptions import MaxRetriesExceededError
@@ -86,6 +87,8 @@ from app.services.ocr.validation_extractor import (
     ValidationExtractorError,
     get_validation_extractor,
 )
+from app.services.pdf_blob_cache import open_storage_pdf_blob
+from app.services.pdf_manifest import PDFManifest, PDFManifestError, build_pdf_manifest
 from app.services.pubsub_service import (
     FeatureType,
     broadcast_document_status,
@@ -118,7 +121,6 @@ from app.services.contradiction.comparator import ComparisonServiceError
 from app.models.contradiction import (
     ComparisonResult,
     StatementPairComparison,
-    EntityComparisonsResponse,
 )
 from app.workers.celery import celery_app
 
@@ -132,17 +134,17 @@ RETRY_DELAYS = [30, 60, 120]  # Exponential backoff: 30s, 60s, 120s
 PDF_MAGIC_BYTES = b"%PDF-"
 
 
-def _validate_pdf_content(content: bytes, document_id: str) -> None:
+def _validate_pdf_content(content: bytes | mmap.mmap, document_id: str) -> None:
     """Validate that content appears to be a PDF file.
 
     Args:
-        content: File content bytes.
+        content: File content bytes (or a memory map of the file).
         document_id: Document ID for logging.
 
     Raises:
         OCRServiceError: If content is not a valid PDF.
     """
-    if not content.startswith(PDF_MAGIC_BYTES):
+    if content[:len(PDF_MAGIC_BYTES)] != PDF_MAGIC_BYTES:
         logger.error(
             "document_invalid_pdf",
             document_id=document_id,
@@ -155,14 +157,20 @@ def _validate_pdf_content(content: bytes, document_id: str) -> None:
         )
 
 
-def _get_pdf_page_count(pdf_content: bytes, document_id: str) -> int:
+def _get_pdf_page_count(
+    pdf_content: bytes | mmap.mmap,
+    document_id: str,
+    manifest: PDFManifest | None = None,
+) -> int:
     """Get page count from PDF without loading full content into memory.
 
     Story 16.1: Page count detection for routing large documents.
 
     Args:
-        pdf_content: PDF file bytes.
+        pdf_content: PDF file bytes, or a memory map read in place.
         document_id: Document ID for logging.
+        manifest: Optional PDF manifest already verified against
+            pdf_content (see _resolve_pdf_manifest); skips the parse.
 
     Returns:
         Number of pages in the PDF.
@@ -173,8 +181,19 @@ def _get_pdf_page_count(pdf_content: bytes, document_id: str) -> int:
     from io import BytesIO
     import pypdf
 
+    if manifest is not None:
+        logger.info(
+            "pdf_page_count_detected",
+            document_id=document_id,
+            page_count=manifest.page_count,
+            requires_chunking=manifest.page_count > CHUNK_THRESHOLD,
+            source="manifest",
+        )
+        return manifest.page_count
+
     try:
-        reader = pypdf.PdfReader(BytesIO(pdf_content))
+        stream = BytesIO(pdf_content) if isinstance(pdf_content, bytes) else pdf_content
+        reader = pypdf.PdfReader(stream)
         page_count = len(reader.pages)
 
         logger.info(
@@ -199,6 +218,50 @@ def _get_pdf_page_count(pdf_content: bytes, document_id: str) -> int:
         ) from e
 
 
+def _resolve_pdf_manifest(
+    doc_service: DocumentService,
+    document_id: str,
+    pdf_content: bytes | mmap.mmap,
+    content_sha256: str | None = None,
+) -> PDFManifest | None:
+    """Load the document's PDF manifest and verify it against the PDF.
+
+    This is the one place the manifest is verified; the returned manifest is
+    passed on to page counting and OCR splitting as-is. Manifests are built
+    by build_document_pdf_manifest, queued at upload, so building never sits
+    on the OCR path: a missing or stale manifest queues a rebuild and the
+    caller parses the PDF this time.
+
+    Args:
+        doc_service: Document service for manifest persistence.
+        document_id: Document UUID.
+        pdf_content: PDF file bytes, or a memory map read in place.
+        content_sha256: sha256 of pdf_content from the blob cache, if known.
+
+    Returns:
+        Manifest verified against pdf_content, or None.
+    """
+    manifest = doc_service.get_pdf_manifest(document_id)
+    if manifest is not None and manifest.matches(pdf_content, content_sha256):
+        return manifest
+
+    logger.info(
+        "pdf_manifest_unavailable",
+        document_id=document_id,
+        reason="stale" if manifest is not None else "missing",
+    )
+    try:
+        build_document_pdf_manifest.apply_async(args=[document_id], queue="low")
+    except Exception as e:
+        # Manifest is an optimization - never fail OCR over it
+        logger.warning(
+            "pdf_manifest_enqueue_failed",
+            document_id=document_id,
+            error=str(e),
+        )
+    return None
+
+
 async def _create_chunk_records(
     document_id: str,
     matter_id: str,
@@ -725,6 +788,11 @@ def _mark_job_completed(
                     error=str(cache_err),
                 )
 
+            # Rebuild the stored summary once the matter's pipeline goes quiet
+            from app.workers.tasks.summary_tasks import schedule_summary_precompute
+
+            schedule_summary_precompute(matter_id)
+
             # Story 14.5: AC #6 - Create activity for processing completion
             try:
                 activity_service = get_activity_service()
@@ -1320,13 +1388,21 @@ def process_document(
             document_id=document_id,
             storage_path=storage_path,
         )
-        pdf_content = store_service.download_file(storage_path)
+        # Read through the worker-local blob cache: later stages on this host
+        # (chunked OCR, table extraction) reuse the same download
+        with open_storage_pdf_blob(store_service, storage_path) as (pdf_view, pdf_sha256):
+            # Validate PDF format before sending to OCR
+            _validate_pdf_content(pdf_view, document_id)
 
-        # Validate PDF format before sending to OCR
-        _validate_pdf_content(pdf_content, document_id)
+            # Parse-once manifest shared with OCR splitting and chunked tasks,
+            # verified here against the blob cache's content hash
+            manifest = _resolve_pdf_manifest(doc_service, document_id, pdf_view, pdf_sha256)
 
-        # Story 16.1: Detect page count and route to chunked processing if >30 pages
-        page_count = _get_pdf_page_count(pdf_content, document_id)
+            # Story 16.1: Detect page count and route to chunked processing if >30 pages
+            page_count = _get_pdf_page_count(pdf_view, document_id, manifest)
+
+            # Only small documents are sent whole to Document AI
+            pdf_content = pdf_view[:] if page_count <= CHUNK_THRESHOLD else b""
 
         if page_count > CHUNK_THRESHOLD:
             # Large document - route to chunked parallel processing
@@ -1379,6 +1455,7 @@ def process_document(
         ocr_result = ocr.process_document(
             pdf_content=pdf_content,
             document_id=document_id,
+            manifest=manifest,
         )
 
         # Save bounding boxes
@@ -1625,6 +1702,61 @@ def _handle_max_retries_exceeded(
     }
 
 
+@celery_app.task(
+    name="app.workers.tasks.document_tasks.build_document_pdf_manifest",
+    bind=True,
+    autoretry_for=(StorageError, ConnectionError),
+    retry_backoff=True,
+    retry_backoff_max=60,
+    max_retries=2,
+    retry_jitter=True,
+)  # type: ignore[misc]
+def build_document_pdf_manifest(self, document_id: str) -> dict[str, str | int]:
+    """Build and store the parse-once PDF manifest for a document.
+
+    Queued at upload alongside the processing chain, so the page tree walk
+    happens off the OCR path; process_document, chunked OCR tasks and job
+    recovery pick the manifest up once it is stored. Also queued by
+    process_document for documents with a missing or stale manifest.
+
+    Args:
+        document_id: Document UUID.
+
+    Returns:
+        Task result with status ("built", "current" or "failed").
+    """
+    doc_service = get_document_service()
+    storage_path, matter_id = doc_service.get_document_for_processing(document_id)
+
+    # Same blob cache read as process_document: one download per host
+    with open_storage_pdf_blob(get_storage_service(), storage_path) as (
+        pdf_view,
+        pdf_sha256,
+    ):
+        existing = doc_service.get_pdf_manifest(document_id)
+        if existing is not None and existing.matches(pdf_view, pdf_sha256):
+            return {"status": "current", "document_id": document_id}
+
+        try:
+            manifest = build_pdf_manifest(pdf_view, pdf_sha256)
+        except PDFManifestError as e:
+            # Manifest is an optimization - page count detection reports real errors
+            logger.warning(
+                "pdf_manifest_build_failed",
+                document_id=document_id,
+                error=e.message,
+                code=e.code,
+            )
+            return {"status": "failed", "document_id": document_id, "code": e.code}
+
+    doc_service.save_pdf_manifest(document_id, matter_id, manifest)
+    return {
+        "status": "built",
+        "document_id": document_id,
+        "page_count": manifest.page_count,
+    }
+
+
 @celery_app.task(name="app.workers.tasks.document_tasks.retry_ocr")  # type: ignore[misc]
 def retry_ocr(document_id: str) -> dict[str, str]:
     """Manually retry OCR for a failed document.
@@ -2404,7 +2536,7 @@ def chunk_document(
     try:
         # Get document info including extracted text
         storage_path, matter_id = doc_service.get_document_for_processing(doc_id)
-        doc = doc_service.get_document(doc_id)
+        doc = doc_service.get_document(doc_id, include_text=True)
 
         if not doc.extracted_text:
             logger.warning(
@@ -3593,7 +3725,7 @@ def extract_entities(
             )
 
             # Get document's extracted_text as fallback
-            doc = doc_service.get_document(doc_id)
+            doc = doc_service.get_document(doc_id, include_text=True)
             if doc and doc.extracted_text and len(doc.extracted_text.strip()) > 0:
                 # Split raw text into windows for batch processing
                 raw_text = doc.extracted_text
@@ -4245,42 +4377,42 @@ def resolve_aliases(
                 entity_contexts=entity_contexts,
             )
 
-            # Create alias edges in the database
-            aliases_created = 0
-            for edge in edges_to_create:
-                created_edge = await graph_service.create_alias_edge(
-                    matter_id=matter_id,
-                    source_id=edge.source_entity_id,
-                    target_id=edge.target_entity_id,
-                    confidence=edge.confidence or 0.0,
-                    metadata=edge.metadata,
-                )
-                if created_edge:
-                    aliases_created += 1
-
-                    # Also update the aliases array on the canonical entity
-                    # (entity with higher mention count gets the alias name)
-                    source_entity = next(
-                        (e for e in entities if e.id == edge.source_entity_id), None
-                    )
-                    target_entity = next(
-                        (e for e in entities if e.id == edge.target_entity_id), None
+            # Create alias edges in the database (existing edges are skipped)
+            created_edges = await graph_service.create_alias_edges(
+                matter_id=matter_id,
+                edges=[
+                    (
+                        edge.source_entity_id,
+                        edge.target_entity_id,
+                        edge.confidence or 0.0,
+                        edge.metadata,
                     )
-
-                    if source_entity and target_entity:
-                        # Canonical is the one with more mentions
-                        if source_entity.mention_count >= target_entity.mention_count:
-                            await graph_service.add_alias_to_entity(
-                                entity_id=source_entity.id,
-                                matter_id=matter_id,
-                                alias=target_entity.canonical_name,
-                            )
-                        else:
-                            await graph_service.add_alias_to_entity(
-                                entity_id=target_entity.id,
-                                matter_id=matter_id,
-                                alias=source_entity.canonical_name,
-                            )
+                    for edge in edges_to_create
+                ],
+            )
+            aliases_created = len(created_edges)
+
+            entities_by_id = {e.id: e for e in entities}
+            for created_edge in created_edges:
+                # Also update the aliases array on the canonical entity
+                # (entity with higher mention count gets the alias name)
+                source_entity = entities_by_id.get(created_edge.source_entity_id)
+                target_entity = entities_by_id.get(created_edge.target_entity_id)
+
+                if source_entity and target_entity:
+                    # Canonical is the one with more mentions
+                    if source_entity.mention_count >= target_entity.mention_count:
+                        await graph_service.add_alias_to_entity(
+                            entity_id=source_entity.id,
+                            matter_id=matter_id,
+                            alias=target_entity.canonical_name,
+                        )
+                    else:
+                        await graph_service.add_alias_to_entity(
+                            entity_id=target_entity.id,
+                            matter_id=matter_id,
+                            alias=source_entity.canonical_name,
+                        )
 
             return resolution_result, aliases_created
 
@@ -4430,8 +4562,9 @@ def resolve_aliases(
 # Citation Extraction Task (Story 3-1)
 # =============================================================================
 
-CITATION_EXTRACTION_BATCH_SIZE = 10  # Chunks per Gemini API call
-CITATION_EXTRACTION_RATE_LIMIT_DELAY = 0.5  # Seconds between batches
+# Chunks per extract_from_chunks call; progress is checkpointed after each wave.
+# Packing and concurrency within a wave are handled by CitationExtractor.
+CITATION_EXTRACTION_WAVE_SIZE = 100
 
 
 @celery_app.task(
@@ -4610,7 +4743,7 @@ def extract_citations(
             document_id=doc_id,
             chunk_count=len(chunks),
             already_processed=len(already_processed),
-            batch_size=CITATION_EXTRACTION_BATCH_SIZE,
+            wave_size=CITATION_EXTRACTION_WAVE_SIZE,
         )
 
         # Process chunks and extract citations
@@ -4619,31 +4752,61 @@ def extract_citations(
         failed_chunks = 0
         skipped_chunks = 0
 
-        # Process all batches in a single async context
+        # Process all waves in a single async context
         async def _extract_citations_async():
             nonlocal total_citations, failed_chunks, skipped_chunks
 
-            for i in range(0, len(chunks), CITATION_EXTRACTION_BATCH_SIZE):
-                batch = chunks[i : i + CITATION_EXTRACTION_BATCH_SIZE]
+            # Skip already-processed chunks (partial progress)
+            pending = [c for c in chunks if c["id"] not in already_processed]
+            skipped_chunks = len(chunks) - len(pending)
+            total_waves = (len(pending) + CITATION_EXTRACTION_WAVE_SIZE - 1) // CITATION_EXTRACTION_WAVE_SIZE
 
-                for chunk in batch:
-                    chunk_id = chunk["id"]
+            for i in range(0, len(pending), CITATION_EXTRACTION_WAVE_SIZE):
+                wave = pending[i : i + CITATION_EXTRACTION_WAVE_SIZE]
 
-                    # Skip already-processed chunks (partial progress)
-                    if chunk_id in already_processed:
-                        skipped_chunks += 1
-                        continue
+                try:
+                    # Cue-free chunks are skipped, the rest packed into few prompts
+                    results = await extractor.extract_from_chunks(
+                        wave,
+                        document_id=doc_id,
+                        matter_id=matter_id,
+                    )
+                except CitationExtractorError as e:
+                    if stage_progress:
+                        for chunk in wave:
+                            stage_progress.mark_failed(chunk["id"], str(e))
 
-                    try:
-                        # Extract citations from chunk
-                        extraction_result = extractor.extract_from_text_sync(
-                            text=chunk["content"],
-                            document_id=doc_id,
-                            matter_id=matter_id,
-                            chunk_id=chunk_id,
-                            page_number=chunk.get("page_number"),
-                        )
+                    if e.is_retryable:
+                        # Save progress before retry
+                        if progress_tracker and stage_progress:
+                            progress_tracker.save_progress(stage_progress, force=True)
+                        raise  # Let Celery retry
+                    logger.warning(
+                        "extract_citations_wave_failed",
+                        document_id=doc_id,
+                        chunk_count=len(wave),
+                        error=str(e),
+                    )
+                    failed_chunks += len(wave)
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        "extract_citations_wave_error",
+                        document_id=doc_id,
+                        chunk_count=len(wave),
+                        error=str(e),
+                    )
+                    failed_chunks += len(wave)
+                    if stage_progress:
+                        for chunk in wave:
+                            stage_progress.mark_failed(chunk["id"], str(e))
+                    continue
 
+                for chunk in wave:
+                    chunk_id = chunk["id"]
+                    extraction_result = results[chunk_id]
+
+                    try:
                         if extraction_result.citations:
                             # Save citations to database with source bbox IDs for highlighting
                             # bbox_ids come from the chunk's bbox linking step
@@ -4663,22 +4826,6 @@ def extract_citations(
                         if stage_progress:
                             stage_progress.mark_processed(chunk_id)
 
-                    except CitationExtractorError as e:
-                        if stage_progress:
-                            stage_progress.mark_failed(chunk_id, str(e))
-
-                        if e.is_retryable:
-                            # Save progress before retry
-                            if progress_tracker and stage_progress:
-                                progress_tracker.save_progress(stage_progress, force=True)
-                            raise  # Let Celery retry
-                        logger.warning(
-                            "extract_citations_chunk_failed",
-                            document_id=doc_id,
-                            chunk_id=chunk_id,
-                            error=str(e),
-                        )
-                        failed_chunks += 1
                     except Exception as e:
                         logger.warning(
                             "extract_citations_chunk_error",
@@ -4694,15 +4841,11 @@ def extract_citations(
                 if progress_tracker and stage_progress:
                     progress_tracker.save_progress(stage_progress)
 
-                # Rate limit delay between batches
-                if i + CITATION_EXTRACTION_BATCH_SIZE < len(chunks):
-                    await asyncio.sleep(CITATION_EXTRACTION_RATE_LIMIT_DELAY)
-
                 logger.debug(
-                    "extract_citations_batch_complete",
+                    "extract_citations_wave_complete",
                     document_id=doc_id,
-                    batch_number=i // CITATION_EXTRACTION_BATCH_SIZE + 1,
-                    total_batches=(len(chunks) + CITATION_EXTRACTION_BATCH_SIZE - 1) // CITATION_EXTRACTION_BATCH_SIZE,
+                    wave_number=i // CITATION_EXTRACTION_WAVE_SIZE + 1,
+                    total_waves=total_waves,
                 )
 
         try:
@@ -4903,106 +5046,106 @@ def extract_citations(
 # Configuration
 CONTRADICTION_MAX_ENTITIES_PER_RUN = 50  # Max entities to process per task run
 CONTRADICTION_MAX_PAIRS_PER_ENTITY = 25  # Max pairs per entity (cost control)
+CONTRADICTION_MAX_COST_PER_ENTITY_USD = 1.0  # Stop starting new pairs past this spend
+CONTRADICTION_PERSIST_BATCH_SIZE = 10  # Contradictions buffered per insert
 
 
-def _store_comparison_results(
-    comparison_response: EntityComparisonsResponse,
+def _build_comparison_record(
+    comparison: StatementPairComparison,
     matter_id: str,
     entity_id: str,
-) -> int:
-    """Store comparison results to the statement_comparisons table.
-
-    Follows the same pattern as CitationStorageService - persists detection
-    results to database for UI consumption.
+) -> dict:
+    """Build a statement_comparisons row for a detected contradiction.
 
     Args:
-        comparison_response: The comparison results from the service.
+        comparison: Contradiction comparison result.
         matter_id: Matter UUID for the comparison.
         entity_id: Entity UUID that was compared.
 
     Returns:
-        Number of records stored (only contradictions are stored).
+        Record ready for insert.
     """
-    from app.services.supabase.client import get_service_client
+    # Determine severity based on contradiction type and confidence
+    # HIGH: date/amount mismatch with high confidence
+    # MEDIUM: factual contradiction or moderate confidence
+    # LOW: semantic or low confidence
+    severity = "medium"  # default
+    if comparison.contradiction_type in ("date_mismatch", "amount_mismatch"):
+        severity = "high" if comparison.confidence >= 0.8 else "medium"
+    elif comparison.contradiction_type == "factual_contradiction":
+        severity = "high" if comparison.confidence >= 0.9 else "medium"
+    elif comparison.confidence < 0.7:
+        severity = "low"
+
+    # Build evidence JSON from the model
+    evidence_json = None
+    if comparison.evidence:
+        evidence_json = {
+            "type": comparison.evidence.type.value if comparison.evidence.type else None,
+            "value_a": comparison.evidence.value_a,
+            "value_b": comparison.evidence.value_b,
+            "page_refs": comparison.evidence.page_refs,
+        }
 
-    comparisons = comparison_response.data.comparisons
-    if not comparisons:
-        return 0
+    return {
+        "matter_id": matter_id,
+        "entity_id": entity_id,
+        "statement_a_id": comparison.statement_a_id,
+        "statement_b_id": comparison.statement_b_id,
+        "result": comparison.result.value,  # 'contradiction'
+        "contradiction_type": comparison.contradiction_type or "semantic_contradiction",
+        "severity": severity,
+        "reasoning": comparison.reasoning,  # Chain-of-thought from GPT-4
+        "explanation": comparison.reasoning,  # Attorney-friendly explanation
+        "confidence": comparison.confidence,
+        "evidence": evidence_json,
+    }
 
-    # Only store contradictions (other results are not needed for UI)
-    contradictions = [
-        c for c in comparisons if c.result == ComparisonResult.CONTRADICTION
-    ]
 
-    if not contradictions:
-        return 0
+def _store_comparison_records(
+    records: list[dict],
+    matter_id: str,
+    entity_id: str,
+) -> int:
+    """Insert statement_comparisons rows.
 
-    client = get_service_client()
-    stored = 0
+    Args:
+        records: Rows built with _build_comparison_record.
+        matter_id: Matter UUID for logging.
+        entity_id: Entity UUID for logging.
 
-    # Build records for batch insert
-    records = []
-    for comparison in contradictions:
-        # Determine severity based on contradiction type and confidence
-        # HIGH: date/amount mismatch with high confidence
-        # MEDIUM: factual contradiction or moderate confidence
-        # LOW: semantic or low confidence
-        severity = "medium"  # default
-        if comparison.contradiction_type in ("date_mismatch", "amount_mismatch"):
-            severity = "high" if comparison.confidence >= 0.8 else "medium"
-        elif comparison.contradiction_type == "factual_contradiction":
-            severity = "high" if comparison.confidence >= 0.9 else "medium"
-        elif comparison.confidence < 0.7:
-            severity = "low"
-
-        # Build evidence JSON from the model
-        evidence_json = None
-        if comparison.evidence:
-            evidence_json = {
-                "type": comparison.evidence.type.value if comparison.evidence.type else None,
-                "value_a": comparison.evidence.value_a,
-                "value_b": comparison.evidence.value_b,
-                "page_refs": comparison.evidence.page_refs,
-            }
+    Returns:
+        Number of records stored.
+    """
+    from app.services.supabase.client import get_service_client
 
-        record = {
-            "matter_id": matter_id,
-            "entity_id": entity_id,
-            "statement_a_id": comparison.statement_a_id,
-            "statement_b_id": comparison.statement_b_id,
-            "result": comparison.result.value,  # 'contradiction'
-            "contradiction_type": comparison.contradiction_type or "semantic_contradiction",
-            "severity": severity,
-            "reasoning": comparison.reasoning,  # Chain-of-thought from GPT-4
-            "explanation": comparison.reasoning,  # Attorney-friendly explanation
-            "confidence": comparison.confidence,
-            "evidence": evidence_json,
-        }
-        records.append(record)
+    if not records:
+        return 0
 
-    if records:
-        try:
-            # Use upsert to avoid duplicates (statement_a_id + statement_b_id)
-            # Note: This requires a unique constraint on (statement_a_id, statement_b_id)
-            # If not available, use insert with on_conflict handling
-            result = client.table("statement_comparisons").insert(records).execute()
-            stored = len(result.data) if result.data else 0
+    stored = 0
+    try:
+        client = get_service_client()
+        # Use upsert to avoid duplicates (statement_a_id + statement_b_id)
+        # Note: This requires a unique constraint on (statement_a_id, statement_b_id)
+        # If not available, use insert with on_conflict handling
+        result = client.table("statement_comparisons").insert(records).execute()
+        stored = len(result.data) if result.data else 0
 
-            logger.info(
-                "contradiction_results_stored",
-                matter_id=matter_id,
-                entity_id=entity_id,
-                contradictions_stored=stored,
-            )
-        except Exception as e:
-            # Log but don't fail the task - detection was successful even if storage fails
-            logger.error(
-                "contradiction_storage_failed",
-                matter_id=matter_id,
-                entity_id=entity_id,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
+        logger.info(
+            "contradiction_results_stored",
+            matter_id=matter_id,
+            entity_id=entity_id,
+            contradictions_stored=stored,
+        )
+    except Exception as e:
+        # Log but don't fail the task - detection was successful even if storage fails
+        logger.error(
+            "contradiction_storage_failed",
+            matter_id=matter_id,
+            entity_id=entity_id,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
 
     return stored
 
@@ -5230,10 +5373,46 @@ def detect_contradictions(
         entities_processed = 0
         entities_skipped = 0
         total_cost_usd = 0.0
+        total_cache_hits = 0
+        total_cost_avoided_usd = 0.0
+
+        pending_records: list[dict] = []
+
+        async def _flush_contradictions(entity_id: str) -> None:
+            """Insert buffered contradictions in one batch."""
+            nonlocal total_stored
+            if not pending_records:
+                return
+            records = pending_records.copy()
+            pending_records.clear()
+            total_stored += await asyncio.to_thread(
+                _store_comparison_records,
+                records,
+                matter_id,
+                entity_id,
+            )
+
+        async def _persist_contradiction(
+            entity_id: str,
+            comparison: StatementPairComparison,
+        ) -> None:
+            """Buffer a contradiction as soon as it is found (Epic 5 requirement).
+
+            Rows are inserted every CONTRADICTION_PERSIST_BATCH_SIZE
+            contradictions and after each canonical name, so a task that dies
+            mid-entity loses at most one partial batch. entity_id is the
+            primary entity for merged names.
+            """
+            if comparison.result != ComparisonResult.CONTRADICTION:
+                return
+            pending_records.append(_build_comparison_record(comparison, matter_id, entity_id))
+            if len(pending_records) >= CONTRADICTION_PERSIST_BATCH_SIZE:
+                await _flush_contradictions(entity_id)
 
         async def _detect_contradictions_async():
             nonlocal total_contradictions, total_pairs_compared, entities_processed
-            nonlocal entities_skipped, total_cost_usd, total_stored
+            nonlocal entities_skipped, total_cost_usd
+            nonlocal total_cache_hits, total_cost_avoided_usd
 
             for canonical_name in names_to_process:
                 try:
@@ -5244,32 +5423,25 @@ def detect_contradictions(
                         matter_id=matter_id,
                         max_pairs=CONTRADICTION_MAX_PAIRS_PER_ENTITY,
                         confidence_threshold=0.5,
+                        max_cost_usd=CONTRADICTION_MAX_COST_PER_ENTITY_USD,
+                        on_comparison=_persist_contradiction,
                     )
 
                     # Aggregate results
                     total_contradictions += comparison_result.meta.contradictions_found
                     total_pairs_compared += comparison_result.meta.pairs_compared
                     total_cost_usd += comparison_result.meta.total_cost_usd
+                    total_cache_hits += comparison_result.meta.cache_hits
+                    total_cost_avoided_usd += comparison_result.meta.cost_avoided_usd
                     entities_processed += 1
 
-                    # Store contradictions to database (Epic 5 requirement)
-                    # Uses entity_id from the comparison result (primary entity for merged names)
-                    stored = 0
-                    if comparison_result.meta.contradictions_found > 0:
-                        stored = _store_comparison_results(
-                            comparison_response=comparison_result,
-                            matter_id=matter_id,
-                            entity_id=comparison_result.data.entity_id,
-                        )
-                        total_stored += stored
-
                     logger.debug(
                         "detect_contradictions_name_complete",
                         document_id=doc_id,
                         canonical_name=canonical_name,
                         contradictions=comparison_result.meta.contradictions_found,
                         pairs_compared=comparison_result.meta.pairs_compared,
-                        stored=stored,
+                        stored_total=total_stored,
                     )
 
                 except Exception as e:
@@ -5281,6 +5453,9 @@ def detect_contradictions(
                         error=str(e),
                     )
                     entities_skipped += 1
+                finally:
+                    if pending_records:
+                        await _flush_contradictions(pending_records[-1]["entity_id"])
 
         # Run async comparison
         asyncio.run(_detect_contradictions_async())
@@ -5305,6 +5480,8 @@ def detect_contradictions(
                 "contradictions_stored": total_stored,
                 "pairs_compared": total_pairs_compared,
                 "cost_usd": total_cost_usd,
+                "verdict_cache_hits": total_cache_hits,
+                "cost_avoided_usd": total_cost_avoided_usd,
             },
         )
 
@@ -5328,6 +5505,8 @@ def detect_contradictions(
             contradictions_stored=total_stored,
             pairs_compared=total_pairs_compared,
             cost_usd=total_cost_usd,
+            verdict_cache_hits=total_cache_hits,
+            cost_avoided_usd=total_cost_avoided_usd,
         )
 
         return {
@@ -5339,6 +5518,8 @@ def detect_contradictions(
             "contradictions_stored": total_stored,
             "pairs_compared": total_pairs_compared,
             "cost_usd": total_cost_usd,
+            "verdict_cache_hits": total_cache_hits,
+            "cost_avoided_usd": total_cost_avoided_usd,
             "job_id": job_id,
         }
 
@@ -282,34 +282,28 @@ def extract_dates_from_document(
                 )
             )
 
-        # Extract dates from each chunk individually to preserve page/bbox info
-        from app.models.timeline import ExtractedDate
-        all_dates: list[ExtractedDate] = []
+        # Extract dates per chunk to preserve page/bbox info. Chunks without
+        # date cues are skipped and the rest run concurrently in one loop.
         total_chunks = len(chunks_to_process)
 
-        for idx, chunk in enumerate(chunks_to_process):
-            # Run date extraction via Gemini for this chunk
-            chunk_result = date_extractor.extract_dates_sync(
-                text=chunk.content,
+        async def report_progress(done: int, total: int) -> None:
+            if job_id and total > 1:
+                await job_tracker.update_job_status(
+                    job_id=job_id,
+                    status=JobStatus.PROCESSING,
+                    stage="date_extraction",
+                    progress_pct=30 + int(done / total * 40),  # 30-70%
+                    matter_id=matter_id,
+                )
+
+        all_dates = _run_async(
+            date_extractor.extract_dates_from_document_chunks(
+                chunks=chunks_to_process,
                 document_id=document_id,
                 matter_id=matter_id,
-                page_number=chunk.page_number,  # Pass chunk's page number
-                bbox_ids=chunk.bbox_ids or [],  # Pass chunk's bbox_ids
+                on_progress=report_progress,
             )
-            all_dates.extend(chunk_result.dates)
-
-            # Update progress proportionally
-            if job_id and total_chunks > 1:
-                progress = 30 + int((idx + 1) / total_chunks * 40)  # 30-70%
-                _run_async(
-                    job_tracker.update_job_status(
-                        job_id=job_id,
-                        status=JobStatus.PROCESSING,
-                        stage="date_extraction",
-                        progress_pct=progress,
-                        matter_id=matter_id,
-                    )
-                )
+        )
 
         # Deduplicate dates that appear in multiple chunks (same date + similar context)
         unique_dates = _deduplicate_extracted_dates(all_dates)
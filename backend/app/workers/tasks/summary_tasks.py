@@ -0,0 +1,299 @@
+"""Celery tasks for precomputing matter summaries.
+
+Story 14.1: Summary API Endpoint
+
+Executive summaries are expensive to build (several database queries and
+three GPT-4 calls), so they are built here instead of on the first request
+after ingestion. Every completed processing job calls
+schedule_summary_precompute; the rebuild only runs once the matter's
+pipeline has gone quiet:
+- Each call stores a fresh debounce token in Redis and schedules the task
+  with a delay. A task whose token was replaced by a later call exits.
+- The task also exits while the matter still has QUEUED/PROCESSING jobs
+  (the last job to finish schedules the final rebuild).
+- If another worker is already rebuilding the matter, the task re-enqueues
+  itself so changes made during that rebuild are not lost.
+
+The request path never builds. A read that finds no summary queues an
+immediate rebuild (request_summary_precompute), and a read that finds stale
+stats/attention items queues refresh_summary_live_sections. Both requests
+are throttled per matter so repeated reads queue one task.
+"""
+
+import asyncio
+import uuid
+
+import structlog
+
+from app.core.config import get_settings
+from app.workers.celery import celery_app
+
+logger = structlog.get_logger(__name__)
+
+# Redis keys for debouncing and per-matter exclusivity
+SUMMARY_PRECOMPUTE_TOKEN_KEY = "summary_precompute:token:{matter_id}"
+SUMMARY_PRECOMPUTE_LOCK_KEY = "summary_precompute:lock:{matter_id}"
+SUMMARY_PRECOMPUTE_LOCK_TIMEOUT = 600  # seconds
+
+# Throttles requests queued by summary reads
+SUMMARY_READ_REQUEST_KEY = "summary_precompute:requested:{kind}:{matter_id}"
+SUMMARY_READ_REQUEST_TTL = 120  # seconds
+
+
+def schedule_summary_precompute(matter_id: str, delay: int | None = None) -> bool:
+    """Schedule a debounced summary rebuild for a matter.
+
+    Args:
+        matter_id: Matter UUID.
+        delay: Seconds to wait for the pipeline to go quiet (defaults to
+            settings.summary_precompute_delay_seconds).
+
+    Returns:
+        True if the task was scheduled.
+    """
+    from app.services.distributed_lock import get_sync_redis_client
+
+    if delay is None:
+        delay = get_settings().summary_precompute_delay_seconds
+
+    token = uuid.uuid4().hex
+    try:
+        redis = get_sync_redis_client()
+        redis.set(
+            SUMMARY_PRECOMPUTE_TOKEN_KEY.format(matter_id=matter_id),
+            token,
+            ex=delay + SUMMARY_PRECOMPUTE_LOCK_TIMEOUT,
+        )
+        precompute_matter_summary.apply_async(
+            args=[matter_id, token],
+            countdown=delay,
+            queue="low",
+        )
+        logger.debug(
+            "summary_precompute_scheduled",
+            matter_id=matter_id,
+            delay=delay,
+        )
+        return True
+    except Exception as e:
+        logger.warning(
+            "summary_precompute_schedule_failed",
+            matter_id=matter_id,
+            error=str(e),
+        )
+        return False
+
+
+def _claim_read_request(matter_id: str, kind: str) -> bool:
+    """Whether this read is the first to request `kind` work within the TTL."""
+    from app.services.distributed_lock import get_sync_redis_client
+
+    return bool(
+        get_sync_redis_client().set(
+            SUMMARY_READ_REQUEST_KEY.format(kind=kind, matter_id=matter_id),
+            "1",
+            nx=True,
+            ex=SUMMARY_READ_REQUEST_TTL,
+        )
+    )
+
+
+def request_summary_precompute(matter_id: str) -> bool:
+    """Queue an immediate rebuild for a summary read (throttled per matter).
+
+    Used when a read finds no stored summary or asks for a refresh. Unlike
+    schedule_summary_precompute there is no debounce delay, but the task
+    still waits for the matter's pipeline to go quiet.
+
+    Args:
+        matter_id: Matter UUID.
+
+    Returns:
+        True if a task was queued by this call.
+    """
+    try:
+        if not _claim_read_request(matter_id, "precompute"):
+            return False
+        precompute_matter_summary.apply_async(
+            args=[matter_id, None],
+            countdown=0,
+            queue="low",
+        )
+        logger.debug("summary_precompute_requested", matter_id=matter_id)
+        return True
+    except Exception as e:
+        logger.warning(
+            "summary_precompute_request_failed",
+            matter_id=matter_id,
+            error=str(e),
+        )
+        return False
+
+
+def request_live_sections_refresh(matter_id: str) -> bool:
+    """Queue a refresh of stale stats and attention items (throttled per matter).
+
+    Args:
+        matter_id: Matter UUID.
+
+    Returns:
+        True if a task was queued by this call.
+    """
+    try:
+        if not _claim_read_request(matter_id, "live_sections"):
+            return False
+        refresh_summary_live_sections.apply_async(args=[matter_id], queue="low")
+        logger.debug("summary_live_sections_refresh_requested", matter_id=matter_id)
+        return True
+    except Exception as e:
+        logger.warning(
+            "summary_live_sections_request_failed",
+            matter_id=matter_id,
+            error=str(e),
+        )
+        return False
+
+
+async def _precompute(matter_id: str):
+    """Rebuild the summary with a Redis client bound to this task's loop."""
+    from app.services.memory.redis_client import create_redis_client
+    from app.services.summary_service import get_summary_service
+
+    async with create_redis_client() as redis:
+        return await get_summary_service().precompute_summary(matter_id, redis=redis)
+
+
+async def _refresh_live_sections(matter_id: str):
+    """Refresh live sections with a Redis client bound to this task's loop."""
+    from app.services.memory.redis_client import create_redis_client
+    from app.services.summary_service import get_summary_service
+
+    async with create_redis_client() as redis:
+        return await get_summary_service().refresh_live_sections(matter_id, redis=redis)
+
+
+def _count_active_jobs(matter_id: str) -> int:
+    """Count QUEUED/PROCESSING jobs for the matter."""
+    from app.services.supabase.client import get_service_client
+
+    client = get_service_client()
+    if client is None:
+        return 0
+    result = (
+        client.table("processing_jobs")
+        .select("id", count="exact")
+        .eq("matter_id", matter_id)
+        .in_("status", ["QUEUED", "PROCESSING"])
+        .execute()
+    )
+    return result.count or 0
+
+
+@celery_app.task(
+    name="app.workers.tasks.summary_tasks.precompute_matter_summary",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=120,
+)
+def precompute_matter_summary(
+    self,
+    matter_id: str,
+    token: str | None = None,
+) -> dict[str, str | int]:
+    """Rebuild and store a matter's summary once its pipeline is quiet.
+
+    Args:
+        matter_id: Matter UUID.
+        token: Debounce token from schedule_summary_precompute. None forces
+            a rebuild (e.g. manual trigger).
+
+    Returns:
+        Dict with status and, when rebuilt, the stored summary version.
+    """
+    from app.services.distributed_lock import get_sync_redis_client
+
+    redis = get_sync_redis_client()
+
+    if token is not None:
+        current = redis.get(SUMMARY_PRECOMPUTE_TOKEN_KEY.format(matter_id=matter_id))
+        if current != token:
+            logger.debug("summary_precompute_superseded", matter_id=matter_id)
+            return {"status": "superseded"}
+
+    active_jobs = _count_active_jobs(matter_id)
+    if active_jobs > 0:
+        logger.debug(
+            "summary_precompute_deferred",
+            matter_id=matter_id,
+            active_jobs=active_jobs,
+        )
+        return {"status": "pipeline_active", "active_jobs": active_jobs}
+
+    lock_key = SUMMARY_PRECOMPUTE_LOCK_KEY.format(matter_id=matter_id)
+    if not redis.set(lock_key, token or "manual", nx=True, ex=SUMMARY_PRECOMPUTE_LOCK_TIMEOUT):
+        # The running rebuild may have read the matter before this change
+        countdown = get_settings().summary_precompute_delay_seconds
+        precompute_matter_summary.apply_async(
+            args=[matter_id, token],
+            countdown=countdown,
+            queue="low",
+        )
+        logger.debug(
+            "summary_precompute_requeued",
+            matter_id=matter_id,
+            countdown=countdown,
+        )
+        return {"status": "requeued"}
+
+    try:
+        summary = asyncio.run(_precompute(matter_id))
+        logger.info(
+            "summary_precompute_completed",
+            matter_id=matter_id,
+            version=summary.version,
+        )
+        return {"status": "completed", "version": summary.version}
+
+    except Exception as e:
+        logger.error(
+            "summary_precompute_failed",
+            matter_id=matter_id,
+            error=str(e),
+        )
+        raise self.retry(exc=e) from e
+
+    finally:
+        redis.delete(lock_key)
+
+
+@celery_app.task(
+    name="app.workers.tasks.summary_tasks.refresh_summary_live_sections",
+    bind=True,
+    max_retries=2,
+    default_retry_delay=30,
+)
+def refresh_summary_live_sections(self, matter_id: str) -> dict[str, str | int]:
+    """Recompute stats and attention items of a matter's stored summary.
+
+    Queued by summary reads that find these sections older than
+    summary_live_sections_max_age_seconds; the LLM sections are untouched.
+
+    Args:
+        matter_id: Matter UUID.
+
+    Returns:
+        Dict with status and, when refreshed, the stored summary version.
+    """
+    try:
+        summary = asyncio.run(_refresh_live_sections(matter_id))
+    except Exception as e:
+        logger.error(
+            "summary_live_sections_refresh_failed",
+            matter_id=matter_id,
+            error=str(e),
+        )
+        raise self.retry(exc=e) from e
+
+    if summary is None:
+        return {"status": "not_precomputed"}
+    return {"status": "completed", "version": summary.version}
@@ -26,6 +26,51 @@ if TYPE_CHECKING:
 logger = structlog.get_logger(__name__)
 
 
+def _materialize_pdf(store_service: StorageService, storage_path: str) -> Path:
+    """Place the source PDF at a private temp .pdf path.
+
+    Hard-links the blob from the worker-local PDF cache (no copy, survives
+    eviction) and falls back to a file copy or a direct download.
+
+    Args:
+        store_service: Storage service for downloads.
+        storage_path: Supabase Storage path of the PDF.
+
+    Returns:
+        Temp file path; the caller deletes it.
+    """
+    import os
+    import shutil
+    import tempfile
+    from pathlib import Path
+
+    from app.services.pdf_blob_cache import get_storage_pdf_path
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+
+    blob = get_storage_pdf_path(store_service, storage_path)
+    if blob is not None:
+        try:
+            tmp_path.unlink()
+            os.link(blob, tmp_path)
+            return tmp_path
+        except OSError:
+            try:
+                shutil.copyfile(blob, tmp_path)
+                return tmp_path
+            except OSError:
+                pass  # Evicted meanwhile - download below
+
+    try:
+        tmp_path.write_bytes(store_service.download_file(storage_path))
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
 class TableExtractionTaskError(Exception):
     """Error in table extraction task."""
 
@@ -129,15 +174,9 @@ def extract_tables(
             document_id=doc_id,
             storage_path=storage_path,
         )
-        pdf_content = store_service.download_file(storage_path)
-
-        # Save to temp file for Docling (it requires file path)
-        import tempfile
-        from pathlib import Path
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-            tmp_file.write(pdf_content)
-            tmp_path = Path(tmp_file.name)
+        # Docling requires a .pdf file path - link the worker-local cached copy
+        # when available instead of holding the PDF in memory
+        tmp_path = _materialize_pdf(store_service, storage_path)
 
         try:
             # Import here to avoid loading Docling at startup
@@ -500,6 +500,7 @@ class TestContradictionFiltering:
 
         call_args = mock_list_service.get_all_contradictions.call_args
         assert call_args.kwargs["document_id"] == "doc-1"
+        assert call_args.kwargs["cursor"] is None
 
 
 # =============================================================================
@@ -544,7 +544,7 @@ class TestVerifySummarySection:
         )
 
         mock_summary_service = MagicMock(spec=SummaryService)
-        mock_summary_service.invalidate_cache = AsyncMock(return_value=True)
+        mock_summary_service.refresh_review_state = AsyncMock(return_value=None)
 
         request = SummaryVerificationCreate(
             section_type=SummarySectionTypeEnum.SUBJECT_MATTER,
@@ -562,7 +562,7 @@ class TestVerifySummarySection:
 
         assert response.data.id == "verification-123"
         assert response.data.decision == SummaryVerificationDecisionEnum.VERIFIED
-        mock_summary_service.invalidate_cache.assert_called_once_with("matter-123")
+        mock_summary_service.refresh_review_state.assert_called_once_with("matter-123")
 
     @pytest.mark.asyncio
     async def test_flag_section_success(
@@ -590,7 +590,7 @@ class TestVerifySummarySection:
         )
 
         mock_summary_service = MagicMock(spec=SummaryService)
-        mock_summary_service.invalidate_cache = AsyncMock(return_value=True)
+        mock_summary_service.refresh_review_state = AsyncMock(return_value=None)
 
         request = SummaryVerificationCreate(
             section_type=SummarySectionTypeEnum.CURRENT_STATUS,
@@ -805,7 +805,7 @@ class TestSaveSectionEdit:
         mock_edit_service.save_edit = AsyncMock(return_value=mock_edit_record)
 
         mock_summary_service = MagicMock(spec=SummaryService)
-        mock_summary_service.invalidate_cache = AsyncMock(return_value=True)
+        mock_summary_service.refresh_review_state = AsyncMock(return_value=None)
 
         request = SummaryEditCreate(
             section_id="main",
@@ -824,7 +824,7 @@ class TestSaveSectionEdit:
         assert response.data.edited_content == "User-edited description with corrections."
         assert response.data.section_type.value == "subject_matter"
         mock_edit_service.save_edit.assert_called_once()
-        mock_summary_service.invalidate_cache.assert_called_once_with("matter-123")
+        mock_summary_service.refresh_review_state.assert_called_once_with("matter-123")
 
     @pytest.mark.asyncio
     async def test_save_edit_invalid_section_type(self, mock_editor_access) -> None:
@@ -882,7 +882,7 @@ class TestSaveSectionEdit:
             mock_edit_service.save_edit = AsyncMock(return_value=mock_edit_record_copy)
 
             mock_summary_service = MagicMock(spec=SummaryService)
-            mock_summary_service.invalidate_cache = AsyncMock(return_value=True)
+            mock_summary_service.refresh_review_state = AsyncMock(return_value=None)
 
             request = SummaryEditCreate(
                 section_id="main",
@@ -919,7 +919,7 @@ class TestRegenerateSection:
         mock_edit_service.delete_edit = AsyncMock(return_value=True)
 
         mock_summary_service = MagicMock(spec=SummaryService)
-        mock_summary_service.invalidate_cache = AsyncMock(return_value=True)
+        mock_summary_service.refresh_review_state = AsyncMock(return_value=mock_summary)
         mock_summary_service.get_summary = AsyncMock(return_value=mock_summary)
 
         request = SummaryRegenerateRequest(
@@ -939,7 +939,7 @@ class TestRegenerateSection:
             section_type=SummarySectionTypeEnum.SUBJECT_MATTER,
             section_id="main",
         )
-        mock_summary_service.invalidate_cache.assert_called_once()
+        mock_summary_service.refresh_review_state.assert_awaited_once_with("matter-123")
         mock_summary_service.get_summary.assert_called_once_with(
             matter_id="matter-123",
             force_refresh=True,
@@ -685,6 +685,59 @@ class TestGetDocument:
         assert data["error"]["code"] == "DOCUMENT_NOT_FOUND"
 
 
+class TestGetDocumentText:
+    """Tests for GET /api/documents/{document_id}/text."""
+
+    @pytest.mark.asyncio
+    async def test_returns_page_range_text(
+        self,
+        client: AsyncClient,
+        mock_document_service: MagicMock,
+        valid_token: str,
+        sample_document: Document,
+    ) -> None:
+        """Test that text is loaded for the requested pages only."""
+        mock_document_service.get_document.return_value = sample_document
+        mock_document_service.get_document_text.return_value = "Page two\n\nPage three"
+
+        response = await client.get(
+            "/api/documents/doc-12345/text?pageStart=2&pageEnd=3",
+            headers={"Authorization": f"Bearer {valid_token}"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data == {
+            "documentId": "doc-12345",
+            "pageStart": 2,
+            "pageEnd": 3,
+            "text": "Page two\n\nPage three",
+        }
+        mock_document_service.get_document.assert_called_once_with("doc-12345")
+        mock_document_service.get_document_text.assert_called_once_with(
+            "doc-12345", page_start=2, page_end=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_nonexistent_document_returns_404(
+        self,
+        client: AsyncClient,
+        mock_document_service: MagicMock,
+        valid_token: str,
+    ) -> None:
+        """Test that text for a nonexistent document returns 404."""
+        from app.services.document_service import DocumentNotFoundError
+        mock_document_service.get_document.side_effect = DocumentNotFoundError("doc-999")
+
+        response = await client.get(
+            "/api/documents/doc-999/text",
+            headers={"Authorization": f"Bearer {valid_token}"},
+        )
+
+        assert response.status_code == 404
+        mock_document_service.get_document_text.assert_not_called()
+
+
 class TestUpdateDocument:
     """Tests for PATCH /api/documents/{document_id}."""
 
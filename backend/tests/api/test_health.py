@@ -48,3 +48,13 @@ async def test_root_endpoint(client: AsyncClient) -> None:
     assert "message" in data
     assert "LDIP" in data["message"]
     assert "health" in data
+
+
+@pytest.mark.asyncio
+async def test_supabase_pool_status(client: AsyncClient) -> None:
+    """Test Supabase pool endpoint reports per-client pool stats."""
+    response = await client.get("/api/health/supabase-pool")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data["data"]["pools"], dict)
@@ -0,0 +1,172 @@
+"""Engine Scheduling Performance Tests.
+
+Compares dependency-graph scheduling in EngineExecutor against the previous
+group-barrier schedule for a multi-intent query that touches the citation,
+timeline and contradiction engines, using adapters with simulated latency.
+
+Scenario (contradiction depends on timeline):
+- Citation: slow (0.40s), independent
+- Timeline: fast (0.05s)
+- Contradiction: 0.10s, waits for timeline
+
+Group barriers: max(citation, timeline) + contradiction = 0.50s
+Dependency graph: max(citation, timeline + contradiction) = 0.40s
+
+The contradiction -> timeline edge is hypothetical. Production
+ENGINE_DEPENDENCIES has no edges (every engine reads shared data from the
+database), so both schedules run all engines in a single group and
+production latency is unchanged; the last test pins that down.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.engines.orchestrator.executor import EngineExecutor, get_engine_executor
+from app.engines.orchestrator.planner import ENGINE_DEPENDENCIES
+from app.models.orchestrator import EngineExecutionResult, EngineType
+
+SIMULATED_LATENCY_S = {
+    EngineType.CITATION: 0.40,
+    EngineType.TIMELINE: 0.05,
+    EngineType.CONTRADICTION: 0.10,
+}
+
+DEPENDENCIES = {
+    EngineType.CONTRADICTION: [EngineType.TIMELINE],
+}
+
+ENGINES = [EngineType.CITATION, EngineType.TIMELINE, EngineType.CONTRADICTION]
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def simulated_adapters():
+    """Patch get_cached_adapter with adapters that sleep for their latency."""
+
+    def make_adapter(engine_type):
+        async def execute(matter_id, query, context=None):
+            await asyncio.sleep(SIMULATED_LATENCY_S[engine_type])
+            return EngineExecutionResult(
+                engine=engine_type,
+                success=True,
+                data={},
+                execution_time_ms=int(SIMULATED_LATENCY_S[engine_type] * 1000),
+            )
+
+        adapter = MagicMock()
+        adapter.execute = AsyncMock(side_effect=execute)
+        return adapter
+
+    adapters = {engine: make_adapter(engine) for engine in ENGINES}
+    with patch("app.engines.orchestrator.executor.get_cached_adapter") as mock:
+        mock.side_effect = lambda et: adapters[et]
+        yield adapters
+
+
+@pytest.fixture
+def executor():
+    """EngineExecutor whose planner uses the benchmark dependency graph."""
+    get_engine_executor.cache_clear()
+    executor = EngineExecutor()
+    with patch.object(executor._planner, "_dependencies", DEPENDENCIES):
+        yield executor
+
+
+async def _run_with_group_barriers(executor: EngineExecutor) -> list:
+    """Reference schedule: run plan groups one after another."""
+    plan = executor.get_execution_plan(ENGINES)
+    results = []
+    for group in plan.parallel_groups:
+        results.extend(
+            await asyncio.gather(*[
+                executor._execute_single_engine(
+                    matter_id="matter-bench",
+                    query="Timeline, citations and contradictions?",
+                    engine=engine,
+                )
+                for engine in group
+            ])
+        )
+    return results
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+class TestEngineSchedulingPerformance:
+    """Dependency-graph scheduling vs group barriers (hypothetical edges)."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_graph_beats_group_barriers(
+        self, executor, simulated_adapters
+    ):
+        """Multi-intent query should finish faster without group barriers."""
+        start = time.perf_counter()
+        barrier_results = await _run_with_group_barriers(executor)
+        barrier_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        dag_results = await executor.execute_engines(
+            matter_id="matter-bench",
+            query="Timeline, citations and contradictions?",
+            engines=ENGINES,
+        )
+        dag_s = time.perf_counter() - start
+
+        print(f"\nGroup barriers: {barrier_s:.3f}s, dependency graph: {dag_s:.3f}s")
+
+        assert all(r.success for r in barrier_results)
+        assert all(r.success for r in dag_results)
+        # Barrier schedule pays citation + contradiction; the graph hides
+        # timeline + contradiction behind the slow citation engine
+        assert barrier_s >= 0.48
+        assert dag_s < 0.47
+        assert barrier_s - dag_s >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_wall_clock_tracks_critical_path(self, executor, simulated_adapters):
+        """Wall clock should be close to the longest dependency chain."""
+        critical_path_s = max(
+            SIMULATED_LATENCY_S[EngineType.CITATION],
+            SIMULATED_LATENCY_S[EngineType.TIMELINE]
+            + SIMULATED_LATENCY_S[EngineType.CONTRADICTION],
+        )
+
+        start = time.perf_counter()
+        await executor.execute_engines(
+            matter_id="matter-bench",
+            query="Timeline, citations and contradictions?",
+            engines=ENGINES,
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < critical_path_s + 0.06
+
+    @pytest.mark.asyncio
+    async def test_production_graph_matches_group_barriers(self, simulated_adapters):
+        """With today's edge-free graph both schedules are one parallel group."""
+        get_engine_executor.cache_clear()
+        executor = EngineExecutor()
+        assert all(not deps for deps in ENGINE_DEPENDENCIES.values())
+
+        plan = executor.get_execution_plan(ENGINES)
+        assert len(plan.parallel_groups) == 1
+
+        start = time.perf_counter()
+        await executor.execute_engines(
+            matter_id="matter-bench",
+            query="Timeline, citations and contradictions?",
+            engines=ENGINES,
+        )
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < max(SIMULATED_LATENCY_S.values()) + 0.06
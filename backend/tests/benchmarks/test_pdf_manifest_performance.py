@@ -0,0 +1,150 @@
+"""Performance Benchmarks for the PDF manifest on the OCR path.
+
+Upload-to-OCR-start is the work process_document does on a large PDF before
+its first Document AI request: resolve the manifest, count pages and cut the
+first chunk. The manifest is built at upload by its own task, so this path
+only verifies the stored manifest against the blob cache hash.
+
+Compared here, on a 1,000-page PDF:
+- stored manifest (current path): verify + page count + first chunk
+- inline build (manifest built on the OCR path)
+- no manifest (full page tree walk)
+
+Latency and tracemalloc peak memory are recorded for each.
+"""
+
+import gc
+import hashlib
+import time
+import tracemalloc
+from collections.abc import Callable
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pypdf import PdfWriter
+
+from app.services.pdf_manifest import (
+    PDFManifest,
+    build_pdf_manifest,
+    extract_page_range,
+)
+from app.services.pdf_router import CHUNK_SIZE
+from app.workers.tasks.document_tasks import (
+    _get_pdf_page_count,
+    _resolve_pdf_manifest,
+)
+
+PAGE_COUNT = 1000
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="module")
+def large_pdf() -> bytes:
+    writer = PdfWriter()
+    for _ in range(PAGE_COUNT):
+        writer.add_blank_page(width=612, height=792)
+    buffer = BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _measure(run: Callable[[], None], repeat: int = 3) -> tuple[float, float]:
+    """Best-of-N latency (seconds) and peak traced memory (MB) of run()."""
+    latencies = []
+    peak_mb = 0.0
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_mb = max(peak_mb, peak / (1024 * 1024))
+    return min(latencies), peak_mb
+
+
+def _ocr_start(pdf: bytes, manifest: PDFManifest | None) -> None:
+    """Page count and first chunk, as process_document/chunk tasks do."""
+    page_count = _get_pdf_page_count(pdf, "doc-bench", manifest)
+    assert page_count == PAGE_COUNT
+    extract_page_range(pdf, 1, CHUNK_SIZE, manifest)
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+class TestUploadToOCRStart:
+    """Benchmark the pre-OCR work with and without an upload-time manifest."""
+
+    @pytest.mark.benchmark
+    def test_stored_manifest_beats_inline_build(self, large_pdf):
+        """Verifying a stored manifest is cheaper than building it on the OCR path."""
+        stored = build_pdf_manifest(large_pdf)
+        blob_sha256 = hashlib.sha256(large_pdf).hexdigest()  # Blob cache content address
+        doc_service = MagicMock()
+        doc_service.get_pdf_manifest.return_value = stored
+
+        def stored_path() -> None:
+            manifest = _resolve_pdf_manifest(
+                doc_service, "doc-bench", large_pdf, blob_sha256
+            )
+            assert manifest is stored
+            _ocr_start(large_pdf, manifest)
+
+        def inline_build_path() -> None:
+            _ocr_start(large_pdf, build_pdf_manifest(large_pdf))
+
+        def no_manifest_path() -> None:
+            _ocr_start(large_pdf, None)
+
+        with patch("app.workers.tasks.document_tasks.build_document_pdf_manifest"):
+            stored_s, stored_mb = _measure(stored_path)
+        inline_s, inline_mb = _measure(inline_build_path)
+        parse_s, parse_mb = _measure(no_manifest_path)
+
+        print(
+            f"\nUpload-to-OCR-start ({PAGE_COUNT} pages): "
+            f"stored manifest {stored_s * 1000:.1f}ms / {stored_mb:.1f}MB, "
+            f"inline build {inline_s * 1000:.1f}ms / {inline_mb:.1f}MB, "
+            f"no manifest {parse_s * 1000:.1f}ms / {parse_mb:.1f}MB"
+        )
+
+        assert stored_s < inline_s, (
+            f"Stored manifest {stored_s:.3f}s not faster than inline build {inline_s:.3f}s"
+        )
+        assert stored_mb <= inline_mb, (
+            f"Stored manifest peak {stored_mb:.1f}MB above inline build {inline_mb:.1f}MB"
+        )
+
+    @pytest.mark.benchmark
+    def test_missing_manifest_does_not_build_on_ocr_path(self, large_pdf):
+        """Without a stored manifest the OCR path queues a build and parses once."""
+        doc_service = MagicMock()
+        doc_service.get_pdf_manifest.return_value = None
+
+        with (
+            patch("app.workers.tasks.document_tasks.build_document_pdf_manifest") as task,
+            patch(
+                "app.workers.tasks.document_tasks.build_pdf_manifest",
+                side_effect=AssertionError("manifest built on the OCR path"),
+            ),
+        ):
+            elapsed, peak_mb = _measure(
+                lambda: _ocr_start(
+                    large_pdf,
+                    _resolve_pdf_manifest(doc_service, "doc-bench", large_pdf),
+                ),
+                repeat=1,
+            )
+
+        task.apply_async.assert_called_once_with(args=["doc-bench"], queue="low")
+        assert elapsed < 10.0, f"Upload-to-OCR-start took {elapsed:.2f}s, expected <10s"
+        assert peak_mb < 200, f"Peak memory {peak_mb:.1f}MB exceeds 200MB limit"
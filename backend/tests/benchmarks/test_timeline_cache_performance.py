@@ -0,0 +1,316 @@
+"""Timeline Cache Read Latency Tests.
+
+Measures cached timeline page reads for a 10,000-event matter with
+TimelineCacheService's compact encoding, against the previous format: one
+keyed JSON document per page, with segments and entity views carrying full
+copies of their events, decoded through a per-object hook.
+
+Scenario: 10,000 events, 2 entities per event, 12 entity views per page.
+- per_page=50 reads (the timeline UI default)
+- per_page=1000 reads (largest page the API serves)
+
+Redis is replaced by an in-memory async store so only encode/decode and
+client-side work is measured.
+"""
+
+import json
+import statistics
+import time
+from dataclasses import asdict
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.engines.timeline.timeline_builder import (
+    ConstructedTimeline,
+    EntityReference,
+    EntityTimelineView,
+    TimelineEvent,
+    TimelineSegment,
+    TimelineStatistics,
+)
+from app.models.entity import EntityType
+from app.models.timeline import EventType
+from app.services.timeline_cache import TimelineCacheService
+
+MATTER_ID = "12345678-1234-1234-1234-123456789012"
+TOTAL_EVENTS = 10_000
+ENTITY_COUNT = 12
+READS = 50
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+class InMemoryAsyncRedis:
+    """Minimal async store with the commands TimelineCacheService uses."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def mget(self, *keys):
+        return [self.data.get(k) for k in keys]
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def pipeline(self, transaction=True):
+        store = self
+        pending = []
+
+        class _Pipeline:
+            def setex(self, key, ttl, value):
+                pending.append((key, value))
+
+            async def execute(self):
+                for key, value in pending:
+                    store.data[key] = value
+                return [True] * len(pending)
+
+        return _Pipeline()
+
+
+def _events() -> list[TimelineEvent]:
+    entities = [
+        EntityReference(
+            entity_id=f"entity-{i}",
+            canonical_name=f"Party Number {i}",
+            entity_type=EntityType.PERSON if i % 2 else EntityType.ORG,
+            role="petitioner" if i % 3 == 0 else None,
+        )
+        for i in range(ENTITY_COUNT)
+    ]
+    start = date(2015, 1, 1)
+    return [
+        TimelineEvent(
+            event_id=f"00000000-0000-0000-0000-{i:012d}",
+            event_date=start + timedelta(days=i // 4),
+            event_date_precision="day",
+            event_date_text=(start + timedelta(days=i // 4)).strftime("%d/%m/%Y"),
+            event_type=list(EventType)[i % len(EventType)],
+            description=f"Event {i}: the respondent filed a reply to the petition "
+            f"regarding the disputed property transfer and annexed exhibits.",
+            document_id=f"doc-{i % 40}",
+            document_name=f"Document {i % 40}.pdf",
+            source_page=i % 300 + 1,
+            confidence=0.85,
+            entities=[entities[i % ENTITY_COUNT], entities[(i + 5) % ENTITY_COUNT]],
+            is_ambiguous=False,
+            is_verified=i % 10 == 0,
+        )
+        for i in range(TOTAL_EVENTS)
+    ]
+
+
+def _page(events: list[TimelineEvent], page: int, per_page: int) -> ConstructedTimeline:
+    """Build a page the way TimelineBuilder does (segments + entity views)."""
+    page_events = events[(page - 1) * per_page:page * per_page]
+
+    by_month: dict[tuple[int, int], list[TimelineEvent]] = {}
+    for event in page_events:
+        by_month.setdefault((event.event_date.year, event.event_date.month), []).append(event)
+    segments = [
+        TimelineSegment(
+            period_start=group[0].event_date,
+            period_end=group[-1].event_date,
+            period_label=f"{year}-{month:02d}",
+            events=group,
+            event_count=len(group),
+        )
+        for (year, month), group in by_month.items()
+    ]
+
+    views = []
+    for i in range(ENTITY_COUNT):
+        involved = [
+            e for e in page_events if any(r.entity_id == f"entity-{i}" for r in e.entities)
+        ]
+        views.append(
+            EntityTimelineView(
+                entity_id=f"entity-{i}",
+                entity_name=f"Party Number {i}",
+                entity_type=EntityType.PERSON,
+                events=involved,
+                first_appearance=involved[0].event_date if involved else None,
+                last_appearance=involved[-1].event_date if involved else None,
+                event_count=len(involved),
+            )
+        )
+
+    return ConstructedTimeline(
+        matter_id=MATTER_ID,
+        events=page_events,
+        segments=segments,
+        entity_views=views,
+        statistics=TimelineStatistics(
+            total_events=TOTAL_EVENTS,
+            events_by_type={t.value: TOTAL_EVENTS // len(EventType) for t in EventType},
+            entities_involved=ENTITY_COUNT,
+            date_range_start=events[0].event_date,
+            date_range_end=events[-1].event_date,
+            events_with_entities=TOTAL_EVENTS,
+            events_without_entities=0,
+            verified_events=TOTAL_EVENTS // 10,
+        ),
+        generated_at=datetime(2024, 1, 20, 10, 0, 0),
+        page=page,
+        per_page=per_page,
+        total_events=TOTAL_EVENTS,
+        total_pages=-(-TOTAL_EVENTS // per_page),
+    )
+
+
+def _legacy_encode(timeline: ConstructedTimeline) -> str:
+    """Previous format: keyed JSON with typed markers and copied events."""
+
+    def _default(obj):
+        if isinstance(obj, datetime):
+            return {"__timeline_cache_datetime__": obj.isoformat()}
+        if isinstance(obj, date):
+            return {"__timeline_cache_date__": obj.isoformat()}
+        return str(obj)
+
+    return json.dumps(asdict(timeline), default=_default)
+
+
+def _legacy_decode(payload: str) -> ConstructedTimeline:
+    """Previous read path: object_hook per dict, then dict -> dataclass."""
+
+    def _hook(obj):
+        if "__timeline_cache_date__" in obj:
+            return date.fromisoformat(obj["__timeline_cache_date__"])
+        if "__timeline_cache_datetime__" in obj:
+            return datetime.fromisoformat(obj["__timeline_cache_datetime__"])
+        return obj
+
+    def _event(d):
+        return TimelineEvent(
+            **{
+                **d,
+                "event_type": EventType(d["event_type"]),
+                "entities": [
+                    EntityReference(**{**r, "entity_type": EntityType(r["entity_type"])})
+                    for r in d["entities"]
+                ],
+            }
+        )
+
+    data = json.loads(payload, object_hook=_hook)
+    return ConstructedTimeline(
+        matter_id=data["matter_id"],
+        events=[_event(e) for e in data["events"]],
+        segments=[
+            TimelineSegment(**{**s, "events": [_event(e) for e in s["events"]]})
+            for s in data["segments"]
+        ],
+        entity_views=[
+            EntityTimelineView(**{**v, "events": [_event(e) for e in v["events"]]})
+            for v in data["entity_views"]
+        ],
+        statistics=TimelineStatistics(**data["statistics"]),
+        generated_at=data["generated_at"],
+        page=data["page"],
+        per_page=data["per_page"],
+        total_events=data["total_events"],
+        total_pages=data["total_pages"],
+    )
+
+
+@pytest.fixture(scope="module")
+def matter_events() -> list[TimelineEvent]:
+    return _events()
+
+
+@pytest.fixture
+def cache_service() -> TimelineCacheService:
+    service = TimelineCacheService()
+    service._redis = InMemoryAsyncRedis()
+    service._settings = MagicMock(redis_url="redis://benchmark")
+    return service
+
+
+async def _median_read_ms(service, page: int, per_page: int, include_details: bool) -> float:
+    samples = []
+    for _ in range(READS):
+        start = time.perf_counter()
+        cached = await service.get_timeline(
+            MATTER_ID, page=page, per_page=per_page, include_details=include_details
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+        assert cached is not None
+    return statistics.median(samples)
+
+
+def _median_legacy_read_ms(payload: str) -> float:
+    samples = []
+    for _ in range(READS):
+        start = time.perf_counter()
+        _legacy_decode(payload)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+# =============================================================================
+# Benchmarks
+# =============================================================================
+
+
+class TestTimelineCacheReadLatency:
+    """Cached page latency for a 10k-event matter."""
+
+    @pytest.mark.asyncio
+    async def test_default_page_read_latency(self, cache_service, matter_events):
+        """A 50-event page read from a 10k-event matter stays in low milliseconds."""
+        per_page = 50
+        for page in range(1, TOTAL_EVENTS // per_page + 1):
+            assert await cache_service.set_timeline(
+                MATTER_ID, _page(matter_events, page, per_page)
+            )
+
+        page_ms = await _median_read_ms(cache_service, 100, per_page, include_details=False)
+        full_ms = await _median_read_ms(cache_service, 100, per_page, include_details=True)
+
+        print(f"\nper_page=50: events-only {page_ms:.3f}ms, with details {full_ms:.3f}ms")
+        assert page_ms < 5.0
+        assert full_ms < 10.0
+
+    @pytest.mark.asyncio
+    async def test_large_page_faster_and_smaller_than_legacy(
+        self, cache_service, matter_events
+    ):
+        """A 1000-event page is smaller and decodes faster than the old format."""
+        per_page = 1000
+        timeline = _page(matter_events, 3, per_page)
+        await cache_service.set_timeline(MATTER_ID, timeline)
+
+        stored = sum(len(v) for v in cache_service._redis.data.values())
+        legacy = _legacy_encode(timeline)
+
+        page_ms = await _median_read_ms(cache_service, 3, per_page, include_details=False)
+        full_ms = await _median_read_ms(cache_service, 3, per_page, include_details=True)
+        legacy_ms = _median_legacy_read_ms(legacy)
+
+        print(
+            f"\nper_page=1000: {stored / 1024:.0f}KiB vs legacy "
+            f"{len(legacy.encode()) / 1024:.0f}KiB; events-only {page_ms:.2f}ms, "
+            f"with details {full_ms:.2f}ms, legacy {legacy_ms:.2f}ms"
+        )
+        assert stored * 5 < len(legacy.encode())
+        assert full_ms < legacy_ms
+        assert page_ms * 2 < legacy_ms
+
+    @pytest.mark.asyncio
+    async def test_round_trip_at_scale(self, cache_service, matter_events):
+        """Cached pages decode to the timeline that was stored."""
+        timeline = _page(matter_events, 10, 1000)
+        await cache_service.set_timeline(MATTER_ID, timeline)
+
+        cached = await cache_service.get_timeline(MATTER_ID, page=10, per_page=1000)
+
+        assert cached == timeline
@@ -53,3 +53,17 @@ def mock_matter_id() -> str:
         Mock matter UUID.
     """
     return "test-matter-id-12345"
+
+
+@pytest.fixture(autouse=True)
+def isolated_pdf_blob_cache(tmp_path, monkeypatch):
+    """Give each test its own worker-local PDF blob cache.
+
+    Keeps cached downloads from leaking between tests that reuse the same
+    storage paths.
+    """
+    from app.services import pdf_blob_cache
+
+    cache = pdf_blob_cache.PDFBlobCache(tmp_path / "pdf-blob-cache", max_bytes=1024**3)
+    monkeypatch.setattr(pdf_blob_cache, "get_pdf_blob_cache", lambda: cache)
+    return cache
@@ -0,0 +1,203 @@
+"""Tests for write-behind LLM cost persistence.
+
+Story 7.1: Per-Matter Cost Tracking
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from postgrest.exceptions import APIError
+
+from app.core.cost_tracking import (
+    COST_INSERT_MAX_ATTEMPTS,
+    BatchCostAggregator,
+    CostPersistenceService,
+    CostRecorder,
+    CostTracker,
+    LLMProvider,
+)
+
+
+def _tracker(matter_id: str = "matter-1", input_tokens: int = 1000) -> CostTracker:
+    tracker = CostTracker(
+        provider=LLMProvider.GEMINI_FLASH,
+        operation="date_extraction",
+        matter_id=matter_id,
+    )
+    tracker.add_tokens(input_tokens=input_tokens, output_tokens=100)
+    return tracker
+
+
+@pytest.fixture
+def supabase():
+    """Supabase mock that records inserted batches."""
+    client = MagicMock()
+    client.inserted = []
+
+    def insert(rows):
+        client.inserted.append(rows)
+        query = MagicMock()
+        query.execute.return_value = MagicMock(
+            data=rows if isinstance(rows, list) else [rows]
+        )
+        return query
+
+    client.table.return_value.insert.side_effect = insert
+    return client
+
+
+class TestCostRecorder:
+    """Tests for CostRecorder buffering and flushing."""
+
+    def test_record_only_buffers(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=10, flush_interval=60)
+
+        recorder.record({"total_cost_inr": 1.0})
+
+        assert recorder.pending == 1
+        assert supabase.inserted == []
+        recorder.close()
+
+    def test_flush_inserts_multi_row_batches_in_order(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=3, flush_interval=60)
+        recorder._stopped.set()  # No background thread; flush explicitly
+
+        for i in range(7):
+            recorder.record({"n": i})
+
+        assert recorder.flush() == 7
+        assert [len(batch) for batch in supabase.inserted] == [3, 3, 1]
+        assert [row["n"] for batch in supabase.inserted for row in batch] == list(range(7))
+        supabase.table.assert_called_with("llm_costs")
+
+    def test_size_threshold_triggers_background_flush(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=5, flush_interval=60)
+
+        for i in range(5):
+            recorder.record({"n": i})
+
+        deadline = time.monotonic() + 2
+        while recorder.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert recorder.pending == 0
+        assert len(supabase.inserted[0]) == 5
+        recorder.close()
+
+    def test_failed_flush_keeps_rows_for_retry(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=10, flush_interval=60)
+        recorder._stopped.set()
+        recorder.record({"n": 1})
+        recorder.record({"n": 2})
+
+        supabase.table.return_value.insert.side_effect = Exception("db down")
+        assert recorder.flush() == 0
+        assert recorder.pending == 2
+
+        supabase.table.return_value.insert.side_effect = None
+        assert recorder.flush() == 2
+        assert recorder.pending == 0
+
+    def test_rejected_batch_falls_back_to_rows(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=10, flush_interval=60)
+        recorder._stopped.set()
+        for i in range(3):
+            recorder.record({"n": i})
+
+        insert = supabase.table.return_value.insert.side_effect
+
+        def reject_row_1(rows):
+            if any(row["n"] == 1 for row in rows):
+                raise APIError({"code": "23503", "message": "violates foreign key"})
+            return insert(rows)
+
+        supabase.table.return_value.insert.side_effect = reject_row_1
+
+        assert recorder.flush() == 2
+        assert supabase.inserted == [[{"n": 0}], [{"n": 2}]]
+        assert recorder.pending == 0
+        assert recorder.dropped == 1
+
+    def test_row_dropped_after_max_attempts(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=10, flush_interval=60)
+        recorder._stopped.set()
+        recorder.record({"n": 1})
+
+        supabase.table.return_value.insert.side_effect = APIError(
+            {"code": "57014", "message": "statement timeout"}
+        )
+        for _ in range(COST_INSERT_MAX_ATTEMPTS - 1):
+            recorder.flush()
+            assert recorder.pending == 1
+
+        recorder.flush()
+        assert recorder.pending == 0
+        assert recorder.dropped == 1
+
+    def test_unreachable_database_keeps_rows(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=10, flush_interval=60)
+        recorder._stopped.set()
+        recorder.record({"n": 1})
+        recorder.record({"n": 2})
+
+        supabase.table.return_value.insert.side_effect = httpx.ConnectError("refused")
+        for _ in range(COST_INSERT_MAX_ATTEMPTS + 1):
+            assert recorder.flush() == 0
+
+        assert recorder.pending == 2
+        assert recorder.dropped == 0
+        # One attempt per flush; rows are not retried one by one
+        assert supabase.table.return_value.insert.call_count == COST_INSERT_MAX_ATTEMPTS + 1
+
+    def test_buffer_is_bounded(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=100, flush_interval=60, max_buffered=3)
+        recorder._stopped.set()
+
+        for i in range(5):
+            recorder.record({"n": i})
+
+        assert recorder.pending == 3
+        assert recorder.dropped == 2
+
+    def test_close_flushes_remaining_rows(self, supabase) -> None:
+        recorder = CostRecorder(supabase, max_batch=100, flush_interval=60)
+        recorder.record({"n": 1})
+
+        recorder.close()
+
+        assert recorder.pending == 0
+        assert supabase.inserted == [[{"n": 1}]]
+
+
+class TestCostPersistenceService:
+    """Tests for write-behind and batch saving."""
+
+    def test_recorded_costs_reconcile_with_trackers(self, supabase) -> None:
+        service = CostPersistenceService(supabase)
+        trackers = [_tracker(input_tokens=1000 * (i + 1)) for i in range(4)]
+
+        for tracker in trackers:
+            service.record_cost(tracker)
+        service.recorder.close()
+
+        rows = [row for batch in supabase.inserted for row in batch]
+        assert len(rows) == 4
+        assert sum(r["total_cost_inr"] for r in rows) == pytest.approx(
+            sum(round(t.total_cost_inr, 4) for t in trackers)
+        )
+        assert all(r["created_at"] for r in rows)
+
+    @pytest.mark.asyncio
+    async def test_save_batch_uses_one_insert(self, supabase) -> None:
+        service = CostPersistenceService(supabase)
+        aggregator = BatchCostAggregator(operation="ingestion")
+        for _ in range(3):
+            aggregator.add_tracker(_tracker())
+
+        saved = await service.save_batch(aggregator)
+
+        assert saved == 3
+        assert len(supabase.inserted) == 1
+        assert len(supabase.inserted[0]) == 3
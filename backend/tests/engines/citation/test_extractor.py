@@ -3,16 +3,20 @@
 Story 3-1: Act Citation Extraction (AC: #1, #2)
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.engines.citation.extractor import (
+    BATCH_CONCURRENCY,
     CITATION_PATTERNS,
+    MAX_CHUNKS_PER_BATCH,
     CitationConfigurationError,
     CitationExtractor,
     get_citation_extractor,
+    has_citation_cues,
 )
 from app.models.citation import ExtractedCitation
 
@@ -427,6 +431,227 @@ class TestCitationExtractorSync:
             assert len(result.citations) >= 1
 
 
+class TestCitationCues:
+    """Tests for the cue pre-filter."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Section 138 of the Negotiable Instruments Act, 1881",
+            "The charge u/s 302 was framed.",
+            "Relief under Article 226 was sought.",
+            "Notice was issued under SARFAESI.",
+            "He relied on the provisions of the Cr.P.C.",
+        ],
+    )
+    def test_detects_statutory_cues(self, text: str) -> None:
+        """Should keep chunks that may contain a citation."""
+        assert has_citation_cues(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "The meeting was held on 5 May 2020 at the registered office.",
+            "The contract was signed by both parties and the factors were noted.",
+            "",
+        ],
+    )
+    def test_skips_cue_free_text(self, text: str) -> None:
+        """Should skip chunks without any statutory cue."""
+        assert not has_citation_cues(text)
+
+
+def _chunk(chunk_id: str, content: str, page: int = 1) -> dict:
+    return {"id": chunk_id, "content": content, "page_number": page}
+
+
+def _batch_response(entries: dict[str, list[dict]]) -> str:
+    return json.dumps(
+        {"chunks": [{"chunk_id": cid, "citations": c} for cid, c in entries.items()]}
+    )
+
+
+def _citation(section: str, act_name: str, raw_text: str) -> dict:
+    return {
+        "act_name": act_name,
+        "section": section,
+        "raw_text": raw_text,
+        "confidence": 95,
+    }
+
+
+class TestExtractFromChunks:
+    """Tests for packed multi-chunk extraction."""
+
+    @pytest.mark.asyncio
+    async def test_skips_cue_free_chunks_without_llm_call(self) -> None:
+        """Chunks without cues should get empty results and no prompt."""
+        extractor = CitationExtractor()
+        chunks = [_chunk("a", "The parties met for lunch."), _chunk("b", "   ")]
+
+        with patch.object(
+            CitationExtractor, "_generate_async", new_callable=AsyncMock
+        ) as mock_generate:
+            results = await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        mock_generate.assert_not_called()
+        assert set(results) == {"a", "b"}
+        assert all(not r.citations for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_packs_chunks_and_attributes_results(self) -> None:
+        """One prompt should serve several chunks, with per-chunk attribution."""
+        extractor = CitationExtractor()
+        chunks = [
+            _chunk("a", "The complaint was under Section 138 of the NI Act.", page=2),
+            _chunk("b", "Nothing statutory here."),
+            _chunk("c", "Bail was sought u/s 439 CrPC.", page=7),
+        ]
+        response = _batch_response(
+            {
+                "c0": [_citation("138", "NI Act", "Section 138 of the NI Act")],
+                "c1": [_citation("439", "CrPC", "u/s 439 CrPC")],
+            }
+        )
+
+        with patch.object(
+            CitationExtractor,
+            "_generate_async",
+            new_callable=AsyncMock,
+            return_value=response,
+        ) as mock_generate:
+            results = await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert mock_generate.await_count == 1
+        assert "138" in [c.section for c in results["a"].citations]
+        assert "439" in [c.section for c in results["c"].citations]
+        assert "439" not in [c.section for c in results["a"].citations]
+        assert results["c"].source_chunk_id == "c"
+        assert results["c"].page_number == 7
+        assert results["b"].citations == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_chunk_id_attributed_by_raw_text(self) -> None:
+        """Citations under a wrong chunk id should follow their raw text."""
+        extractor = CitationExtractor()
+        chunks = [
+            _chunk("a", "Section 420 of the IPC was invoked."),
+            _chunk("b", "Section 34 of the IPC applies."),
+        ]
+        response = _batch_response(
+            {"x9": [_citation("34", "IPC", "Section 34 of the IPC")]}
+        )
+
+        with patch.object(
+            CitationExtractor,
+            "_generate_async",
+            new_callable=AsyncMock,
+            return_value=response,
+        ):
+            results = await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert "34" in [c.section for c in results["b"].citations]
+        assert "34" not in [c.section for c in results["a"].citations]
+
+    @pytest.mark.asyncio
+    async def test_respects_chunk_limit_per_prompt(self) -> None:
+        """Packs should never exceed MAX_CHUNKS_PER_BATCH chunks."""
+        extractor = CitationExtractor()
+        chunks = [
+            _chunk(f"id-{i}", f"Section {i} of the Act.")
+            for i in range(MAX_CHUNKS_PER_BATCH * 2 + 1)
+        ]
+
+        with patch.object(
+            CitationExtractor,
+            "_generate_async",
+            new_callable=AsyncMock,
+            return_value=_batch_response({}),
+        ) as mock_generate:
+            await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert mock_generate.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unparseable_pack_falls_back_per_chunk(self) -> None:
+        """A truncated packed response should be retried one chunk per prompt."""
+        extractor = CitationExtractor()
+        chunks = [
+            _chunk("a", "Section 138 of the NI Act."),
+            _chunk("b", "Section 420 of the IPC."),
+        ]
+        fallback = [
+            ExtractedCitation(act_name="IPC", section="420", raw_text="Section 420", confidence=90.0)
+        ]
+
+        with (
+            patch.object(
+                CitationExtractor,
+                "_generate_async",
+                new_callable=AsyncMock,
+                return_value='{"chunks": [{"chunk_id": "c0", "citations": [',
+            ),
+            patch.object(
+                CitationExtractor,
+                "_extract_with_gemini",
+                new_callable=AsyncMock,
+                return_value=fallback,
+            ) as mock_single,
+        ):
+            results = await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert mock_single.await_count == 2
+        assert "420" in [c.section for c in results["b"].citations]
+
+    @pytest.mark.asyncio
+    async def test_fallback_prompts_share_concurrency_limit(self) -> None:
+        """Per-chunk fallback prompts should stay within BATCH_CONCURRENCY."""
+        extractor = CitationExtractor()
+        chunks = [
+            _chunk(f"id-{i}", f"Section {i} of the Act.")
+            for i in range(MAX_CHUNKS_PER_BATCH * 2)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def single(text: str, document_id: str) -> list[ExtractedCitation]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with (
+            patch.object(
+                CitationExtractor,
+                "_generate_async",
+                new_callable=AsyncMock,
+                return_value="not json",
+            ),
+            patch.object(CitationExtractor, "_extract_with_gemini", side_effect=single),
+        ):
+            await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert peak == BATCH_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_regex_results_kept_when_gemini_fails(self) -> None:
+        """Regex citations should survive a failed packed prompt."""
+        extractor = CitationExtractor()
+        chunks = [_chunk("a", "Section 302 of Indian Penal Code was charged.")]
+
+        with patch.object(
+            CitationExtractor,
+            "_generate_async",
+            new_callable=AsyncMock,
+            return_value=None,
+        ):
+            results = await extractor.extract_from_chunks(chunks, "doc-1", "matter-1")
+
+        assert "302" in [c.section for c in results["a"].citations]
+
+
 class TestCitationConfigurationError:
     """Tests for configuration error handling."""
 
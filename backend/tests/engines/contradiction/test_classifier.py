@@ -17,6 +17,7 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import structlog
 
 from app.engines.contradiction.classifier import (
     ClassificationCostTracker,
@@ -664,6 +665,164 @@ class TestBatchClassification:
         results = await classifier.classify_all([])
         assert len(results) == 0
 
+    @staticmethod
+    def _inconclusive(index: int, content_a: str, content_b: str) -> StatementPairComparison:
+        return StatementPairComparison(
+            statement_a_id=f"a{index}",
+            statement_b_id=f"b{index}",
+            statement_a_content=content_a,
+            statement_b_content=content_b,
+            result=ComparisonResult.CONTRADICTION,
+            reasoning="Statements conflict.",
+            confidence=0.8,
+            evidence=ContradictionEvidence(type=EvidenceType.NONE),
+            document_a_id="d1",
+            document_b_id="d2",
+        )
+
+    @staticmethod
+    def _mock_completion(payload: dict) -> MagicMock:
+        completion = MagicMock()
+        completion.choices = [MagicMock()]
+        completion.choices[0].message.content = json.dumps(payload)
+        completion.usage = MagicMock(prompt_tokens=600, completion_tokens=200)
+        return completion
+
+    @pytest.mark.asyncio
+    async def test_classify_all_rule_based_dates_and_amounts_from_statements(
+        self,
+        classifier: ContradictionClassifier,
+    ) -> None:
+        """Should classify NONE evidence from normalized statement values."""
+        mock_client = AsyncMock()
+        classifier._client = mock_client
+        comparisons = [
+            self._inconclusive(1, "The loan was disbursed on 15/01/2024.", "The loan was disbursed on 15 June 2024."),
+            self._inconclusive(2, "He paid Rs. 5 lakhs as advance.", "He paid Rs. 8,00,000 as advance."),
+            # Same date written two ways is not a date mismatch
+            self._inconclusive(3, "Signed on 15/01/2024 by the buyer.", "Signed on 15 January 2024 by the seller."),
+        ]
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=self._mock_completion({
+                "contradiction_type": "factual_contradiction",
+                "explanation": "Different signatories.",
+                "confidence": 0.8,
+            })
+        )
+
+        results = await classifier.classify_all(comparisons)
+
+        classified = [r.classified_contradiction for r in results]
+        assert classified[0].contradiction_type == ContradictionType.DATE_MISMATCH
+        assert classified[0].classification_method == "rule_based"
+        assert classified[0].extracted_values.value_a.normalized == "2024-01-15"
+        assert classified[1].contradiction_type == ContradictionType.AMOUNT_MISMATCH
+        assert classified[1].classification_method == "rule_based"
+        assert classified[2].classification_method == "llm_fallback"
+        assert mock_client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_classify_all_leaves_other_differences_to_llm(
+        self,
+        classifier: ContradictionClassifier,
+    ) -> None:
+        """A differing date should only decide the type if nothing else differs."""
+        mock_client = AsyncMock()
+        classifier._client = mock_client
+        comparisons = [
+            self._inconclusive(1, "The loan was disbursed on 15/01/2024.", "The loan was disbursed on 15 June 2024."),
+            # The parties differ too - the conflict may not be about the date
+            self._inconclusive(2, "Mr. Rao signed the deed on 15/01/2024.", "Mr. Iyer refused to sign the deed on 15 June 2024."),
+        ]
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=self._mock_completion({
+                "contradiction_type": "factual_contradiction",
+                "explanation": "Different signatories.",
+                "confidence": 0.8,
+            })
+        )
+
+        with structlog.testing.capture_logs() as captured:
+            results = await classifier.classify_all(comparisons)
+
+        classified = [r.classified_contradiction for r in results]
+        assert classified[0].classification_method == "rule_based"
+        assert classified[1].classification_method == "llm_fallback"
+        assert classified[1].contradiction_type == ContradictionType.FACTUAL_CONTRADICTION
+        rule_logs = [e for e in captured if e["event"] == "contradiction_classified_rule_based"]
+        assert [e["statement_a_id"] for e in rule_logs] == ["a1"]
+        assert rule_logs[0]["contradiction_type"] == "date_mismatch"
+
+    @pytest.mark.asyncio
+    async def test_classify_all_batches_inconclusive_items(
+        self,
+        classifier: ContradictionClassifier,
+    ) -> None:
+        """Should classify inconclusive items in one multi-item LLM call."""
+        comparisons = [
+            self._inconclusive(i, f"Witness {i} saw the car.", f"Witness {i} did not see the car.")
+            for i in range(1, 4)
+        ]
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=self._mock_completion({
+                "classifications": [
+                    {"item_id": "3", "contradiction_type": "semantic_contradiction", "explanation": "Third.", "confidence": 0.7},
+                    {"item_id": "1", "contradiction_type": "factual_contradiction", "explanation": "First.", "confidence": 0.9},
+                    {"item_id": "2", "contradiction_type": "factual_contradiction", "explanation": "Second.", "confidence": 0.9},
+                ]
+            })
+        )
+        classifier._client = mock_client
+
+        results = await classifier.classify_all(comparisons)
+
+        assert mock_client.chat.completions.create.await_count == 1
+        assert [r.classified_contradiction.statement_a_id for r in results] == ["a1", "a2", "a3"]
+        assert [r.classified_contradiction.explanation for r in results] == ["First.", "Second.", "Third."]
+        assert results[2].classified_contradiction.contradiction_type == ContradictionType.SEMANTIC_CONTRADICTION
+        # Cost of the shared call is split across its items
+        assert sum(r.llm_cost_usd for r in results) == pytest.approx(
+            ClassificationCostTracker(input_tokens=600, output_tokens=200, used_llm=True).cost_usd
+        )
+
+    @pytest.mark.asyncio
+    async def test_classify_all_retries_missing_batch_item_individually(
+        self,
+        classifier: ContradictionClassifier,
+    ) -> None:
+        """Should classify items missing from the batch response on their own."""
+        comparisons = [
+            self._inconclusive(i, f"Witness {i} saw the car.", f"Witness {i} did not see the car.")
+            for i in range(1, 3)
+        ]
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                self._mock_completion({
+                    "classifications": [
+                        {"item_id": "1", "contradiction_type": "factual_contradiction", "explanation": "First.", "confidence": 0.9},
+                        {"item_id": "2", "contradiction_type": "not_a_type", "explanation": "Bad.", "confidence": 0.9},
+                    ]
+                }),
+                self._mock_completion({
+                    "contradiction_type": "semantic_contradiction",
+                    "explanation": "Second, individually.",
+                    "confidence": 0.8,
+                }),
+            ]
+        )
+        classifier._client = mock_client
+
+        results = await classifier.classify_all(comparisons)
+
+        assert mock_client.chat.completions.create.await_count == 2
+        assert [r.classified_contradiction.explanation for r in results] == [
+            "First.",
+            "Second, individually.",
+        ]
+        assert results[1].llm_cost_usd > results[0].llm_cost_usd
+
 
 # =============================================================================
 # Matter Isolation Tests (CRITICAL - Security)
@@ -9,14 +9,18 @@ Tests cover:
 - Chain-of-thought reasoning capture (AC #4)
 - GPT-4 response parsing
 - Cost tracking
+- Sliding-window pair scheduling (timeouts, retries, budgets)
+- Pair verdict cache (hashing, reuse, incremental re-runs)
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.engines.contradiction.comparator import (
+    CachedVerdict,
     ComparatorError,
     ComparisonBatchResult,
     ComparisonParseError,
@@ -24,6 +28,7 @@ from app.engines.contradiction.comparator import (
     OpenAIConfigurationError,
     StatementComparator,
     StatementPair,
+    compute_pair_hash,
     get_statement_comparator,
 )
 from app.engines.contradiction.prompts import format_comparison_prompt
@@ -886,3 +891,375 @@ class TestPrefilteringSuspiciousness:
             score = comparator._calculate_suspiciousness(stmt_a, stmt_b)
 
             assert score == 0.0
+
+
+# =============================================================================
+# Sliding-Window Scheduling Tests
+# =============================================================================
+
+
+def _make_entity_statements(per_doc: int) -> EntityStatements:
+    """Two documents with per_doc statements each (per_doc**2 cross pairs)."""
+    documents = []
+    for doc in ("doc-1", "doc-2"):
+        statements = [
+            Statement(
+                entity_id="entity-123",
+                chunk_id=f"{doc}-chunk-{i}",
+                document_id=doc,
+                content=f"Statement {i} from {doc}",
+                page_number=i + 1,
+            )
+            for i in range(per_doc)
+        ]
+        documents.append(
+            DocumentStatements(
+                document_id=doc,
+                document_name=f"{doc}.pdf",
+                statements=statements,
+                statement_count=per_doc,
+            )
+        )
+    return EntityStatements(
+        entity_id="entity-123",
+        entity_name="Nirav Jobalia",
+        total_statements=per_doc * 2,
+        documents=documents,
+        aliases_included=[],
+    )
+
+
+def _comparison_for(statement_a: Statement, statement_b: Statement):
+    from app.models.contradiction import (
+        ContradictionEvidence,
+        StatementPairComparison,
+    )
+
+    return StatementPairComparison(
+        statement_a_id=statement_a.chunk_id,
+        statement_b_id=statement_b.chunk_id,
+        statement_a_content=statement_a.content,
+        statement_b_content=statement_b.content,
+        result=ComparisonResult.CONSISTENT,
+        reasoning="Test",
+        confidence=0.9,
+        evidence=ContradictionEvidence(type=EvidenceType.NONE),
+        document_a_id=statement_a.document_id,
+        document_b_id=statement_b.document_id,
+    )
+
+
+@pytest.fixture
+def comparator() -> StatementComparator:
+    with patch("app.engines.contradiction.comparator.get_settings") as mock_settings:
+        mock_settings.return_value = MagicMock(openai_api_key="test-key")
+        return StatementComparator()
+
+
+class TestSlidingWindowScheduling:
+    """Tests for the bounded-concurrency comparison queue."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, comparator) -> None:
+        """No more than batch_size comparisons should be in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(4),
+                batch_size=3,
+            )
+
+        assert len(result.comparisons) == 16
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_call_does_not_stall_window(self, comparator) -> None:
+        """Other pairs keep flowing while one call is slow."""
+        started_while_slow: list[str] = []
+        slow_running = False
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            nonlocal slow_running
+            if statement_a.chunk_id == "doc-1-chunk-0" and statement_b.chunk_id == "doc-2-chunk-0":
+                slow_running = True
+                await asyncio.sleep(0.2)
+                slow_running = False
+            else:
+                if slow_running:
+                    started_while_slow.append(statement_b.chunk_id)
+                await asyncio.sleep(0.01)
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(3),
+                batch_size=2,
+            )
+
+        assert len(result.comparisons) == 9
+        # With fixed batches only one other pair could run alongside the slow one
+        assert len(started_while_slow) > 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_retried(self, comparator) -> None:
+        """A timed-out attempt should be retried and then succeed."""
+        attempts = 0
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(1.0)
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        with (
+            patch.object(comparator, "compare_statement_pair", side_effect=fake_compare),
+            patch("app.engines.contradiction.comparator.PAIR_RETRY_BASE_DELAY_SECONDS", 0),
+        ):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(1),
+                pair_timeout_seconds=0.05,
+            )
+
+        assert attempts == 2
+        assert len(result.comparisons) == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted_drops_pair(self, comparator) -> None:
+        """A pair that keeps failing is dropped after max_retries."""
+        mock_compare = AsyncMock(side_effect=ComparatorError("boom"))
+
+        with (
+            patch.object(comparator, "compare_statement_pair", mock_compare),
+            patch("app.engines.contradiction.comparator.PAIR_RETRY_BASE_DELAY_SECONDS", 0),
+        ):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(1),
+                max_retries=2,
+            )
+
+        assert mock_compare.call_count == 3
+        assert result.comparisons == []
+        assert result.stopped_reason is None
+
+    @pytest.mark.asyncio
+    async def test_circuit_open_stops_queue(self, comparator) -> None:
+        """An open circuit should stop scheduling remaining pairs."""
+        mock_compare = AsyncMock(
+            side_effect=ComparatorError("open", code="CIRCUIT_OPEN", is_retryable=True)
+        )
+
+        with patch.object(comparator, "compare_statement_pair", mock_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(3),
+                batch_size=1,
+            )
+
+        assert mock_compare.call_count == 1
+        assert result.stopped_reason == "circuit_open"
+        assert result.pairs_skipped == 8
+
+    @pytest.mark.asyncio
+    async def test_cost_budget_stops_early(self, comparator) -> None:
+        """Spend reaching max_cost_usd should stop new pairs from starting."""
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            # 1000 GPT-4 input tokens = $0.01
+            return _comparison_for(statement_a, statement_b), LLMCostTracker(input_tokens=1000)
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(3),
+                batch_size=1,
+                max_cost_usd=0.025,
+            )
+
+        assert len(result.comparisons) == 3
+        assert result.pairs_skipped == 6
+        assert result.stopped_reason == "cost_budget"
+
+    @pytest.mark.asyncio
+    async def test_results_streamed_to_callback(self, comparator) -> None:
+        """Each comparison should reach on_comparison as it completes."""
+        received = []
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        async def on_comparison(comparison):
+            received.append(comparison)
+            if len(received) == 1:
+                raise RuntimeError("storage down")
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(2),
+                on_comparison=on_comparison,
+            )
+
+        # A failing callback must not abort detection
+        assert len(received) == 4
+        assert len(result.comparisons) == 4
+
+
+class InMemoryVerdictStore:
+    """PairVerdictStore test double that keeps verdicts in a dict."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, CachedVerdict] = {}
+        self.hits: list[str] = []
+
+    async def get_many(self, pair_hashes):
+        return {h: self.entries[h] for h in pair_hashes if h in self.entries}
+
+    async def put(self, pair_hash, verdict):
+        self.entries[pair_hash] = verdict
+
+    async def record_hits(self, pair_hashes):
+        self.hits.extend(pair_hashes)
+
+
+class TestPairVerdictCache:
+    """Tests for reusing verdicts across detection runs."""
+
+    def test_pair_hash_is_order_independent(self) -> None:
+        """Swapping the statements should not change the hash."""
+        assert compute_pair_hash("a", "b", "Entity", "v1") == compute_pair_hash(
+            "b", "a", "Entity", "v1"
+        )
+
+    def test_pair_hash_includes_version_and_entity(self) -> None:
+        """A new prompt/model version or entity must miss the cache."""
+        base = compute_pair_hash("a", "b", "Entity", "v1")
+        assert compute_pair_hash("a", "b", "Entity", "v2") != base
+        assert compute_pair_hash("a", "b", "Other", "v1") != base
+
+    @pytest.mark.asyncio
+    async def test_rerun_skips_llm(self, comparator) -> None:
+        """A second identical run should be served entirely from the cache."""
+        store = InMemoryVerdictStore()
+        calls = 0
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            nonlocal calls
+            calls += 1
+            return _comparison_for(statement_a, statement_b), LLMCostTracker(input_tokens=1000)
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            first = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(2),
+                verdict_cache=store,
+            )
+            second = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(2),
+                verdict_cache=store,
+            )
+
+        assert calls == 4
+        assert first.cache_hits == 0
+        assert first.cache_misses == 4
+        assert second.cache_hits == 4
+        assert second.cache_hit_rate == 1.0
+        assert second.total_cost_usd == 0.0
+        assert second.cost_avoided_usd == pytest.approx(0.04)
+        assert len(store.hits) == 4
+        assert [c.statement_b_id for c in second.comparisons] == [
+            c.statement_b_id for c in first.comparisons
+        ]
+
+    @pytest.mark.asyncio
+    async def test_incremental_run_compares_only_new_pairs(self, comparator) -> None:
+        """After adding a statement, only pairs involving it reach the LLM."""
+        store = InMemoryVerdictStore()
+        compared: list[tuple[str, str]] = []
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            compared.append((statement_a.chunk_id, statement_b.chunk_id))
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(2),
+                verdict_cache=store,
+            )
+            compared.clear()
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(3),
+                verdict_cache=store,
+            )
+
+        # 3x3 pairs, 2x2 already cached
+        assert len(result.comparisons) == 9
+        assert result.cache_hits == 4
+        assert len(compared) == 5
+        assert all("chunk-2" in a or "chunk-2" in b for a, b in compared)
+
+    @pytest.mark.asyncio
+    async def test_cached_evidence_follows_pair_orientation(self, comparator) -> None:
+        """Evidence values are swapped when the pair order is reversed."""
+        from app.models.contradiction import (
+            ContradictionEvidence,
+            StatementPairComparison,
+        )
+
+        entity_statements = _make_entity_statements(1)
+        statement_a = entity_statements.documents[0].statements[0]
+        statement_b = entity_statements.documents[1].statements[0]
+        pair = StatementPair(
+            statement_a=statement_b,
+            statement_b=statement_a,
+            entity_name=entity_statements.entity_name,
+        )
+        original = StatementPairComparison(
+            statement_a_id=statement_a.chunk_id,
+            statement_b_id=statement_b.chunk_id,
+            statement_a_content=statement_a.content,
+            statement_b_content=statement_b.content,
+            result=ComparisonResult.CONTRADICTION,
+            reasoning="Amounts differ",
+            confidence=0.9,
+            evidence=ContradictionEvidence(
+                type=EvidenceType.AMOUNT_MISMATCH,
+                value_a="500000",
+                value_b="800000",
+            ),
+            document_a_id=statement_a.document_id,
+            document_b_id=statement_b.document_id,
+        )
+
+        cached = comparator._verdict_from_comparison(original, LLMCostTracker())
+        reused = comparator._comparison_from_verdict(pair, cached)
+
+        assert reused.statement_a_id == statement_b.chunk_id
+        assert reused.result == ComparisonResult.CONTRADICTION
+        assert reused.evidence.value_a == "800000"
+        assert reused.evidence.value_b == "500000"
+        assert reused.page_a == statement_b.page_number
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_failure_falls_back_to_llm(self, comparator) -> None:
+        """An unavailable cache must not block detection."""
+        store = InMemoryVerdictStore()
+        store.get_many = AsyncMock(side_effect=RuntimeError("db down"))
+
+        async def fake_compare(statement_a, statement_b, **kwargs):
+            return _comparison_for(statement_a, statement_b), LLMCostTracker()
+
+        with patch.object(comparator, "compare_statement_pair", side_effect=fake_compare):
+            result = await comparator.compare_all_entity_statements(
+                entity_statements=_make_entity_statements(2),
+                verdict_cache=store,
+            )
+
+        assert len(result.comparisons) == 4
+        assert result.cache_hits == 0
@@ -10,6 +10,8 @@ Tests cover:
 - Matter isolation propagation
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -17,6 +19,7 @@ import pytest
 from app.core.config import get_settings
 from app.engines.orchestrator.adapters import (
     ADAPTER_REGISTRY,
+    RAG_PREFETCH_TTL_SECONDS,
     CitationEngineAdapter,
     ContradictionEngineAdapter,
     RAGEngineAdapter,
@@ -405,6 +408,54 @@ class TestRAGEngineAdapter:
         assert not result.success
         assert "Search error" in result.error
 
+    @pytest.mark.asyncio
+    async def test_prefetch_retrieval_coalesces_and_discards(self):
+        """Prefetches for the same query share a task; discard cancels it."""
+        adapter = RAGEngineAdapter()
+        started = asyncio.Event()
+
+        async def _slow_search(**kwargs):
+            started.set()
+            await asyncio.sleep(10)
+
+        mock_search = MagicMock()
+        mock_search.search_with_library = AsyncMock(side_effect=_slow_search)
+
+        with patch.object(adapter, "_get_search", return_value=mock_search):
+            first = adapter.prefetch_retrieval("matter-123", "Search query")
+            second = adapter.prefetch_retrieval("matter-123", "Search query")
+            await started.wait()
+            adapter.discard_prefetch("matter-123", "Search query")
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        assert first is second
+        mock_search.search_with_library.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_prefetch_is_evicted(self):
+        """Unconsumed prefetches past the TTL are cancelled on the next prefetch."""
+        adapter = RAGEngineAdapter()
+
+        async def _slow_search(**kwargs):
+            await asyncio.sleep(10)
+
+        mock_search = MagicMock()
+        mock_search.search_with_library = AsyncMock(side_effect=_slow_search)
+
+        with patch.object(adapter, "_get_search", return_value=mock_search):
+            stale = adapter.prefetch_retrieval("matter-123", "Old query")
+            adapter._prefetched[("matter-123", "Old query")] = (
+                stale,
+                time.monotonic() - RAG_PREFETCH_TTL_SECONDS - 1,
+            )
+            adapter.prefetch_retrieval("matter-123", "New query")
+            with pytest.raises(asyncio.CancelledError):
+                await stale
+
+            assert list(adapter._prefetched) == [("matter-123", "New query")]
+            adapter.discard_prefetch("matter-123", "New query")
+
 
 # =============================================================================
 # Unit Tests: Base Adapter Helper Methods
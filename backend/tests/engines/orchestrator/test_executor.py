@@ -15,8 +15,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.engines.orchestrator.aggregator import ResultAggregator
 from app.engines.orchestrator.executor import (
+    CRITICAL_ENGINES,
     ENGINE_TIMEOUT_SECONDS,
+    ENGINE_TIMEOUTS,
     EngineExecutor,
     get_engine_executor,
 )
@@ -275,7 +278,10 @@ class TestTimeoutHandling:
             mock.return_value = mock_slow_adapter
 
             # Use a shorter timeout for test
-            with patch("app.engines.orchestrator.executor.ENGINE_TIMEOUT_SECONDS", 0.1):
+            with patch.dict(
+                "app.engines.orchestrator.executor.ENGINE_TIMEOUTS",
+                {EngineType.RAG: 0.1},
+            ):
                 result = await executor._execute_single_engine(
                     matter_id="matter-123",
                     query="Query",
@@ -283,6 +289,7 @@ class TestTimeoutHandling:
                 )
 
         assert not result.success
+        assert result.timed_out
         assert "timed out" in result.error.lower()
 
     @pytest.mark.asyncio
@@ -329,6 +336,214 @@ class TestTimeoutHandling:
         assert all(r.success for r in results)
 
 
+# =============================================================================
+# Unit Tests: Dependency Graph Scheduling
+# =============================================================================
+
+
+CONTRADICTION_AFTER_TIMELINE = {
+    EngineType.CONTRADICTION: [EngineType.TIMELINE],
+}
+
+
+def _make_timed_adapter(engine_type, delay, events):
+    """Create adapter that sleeps for delay and records start/finish."""
+
+    async def timed_execute(matter_id, query, context=None):
+        events.append(("start", engine_type))
+        await asyncio.sleep(delay)
+        events.append(("finish", engine_type))
+        return EngineExecutionResult(
+            engine=engine_type,
+            success=True,
+            data={},
+            execution_time_ms=int(delay * 1000),
+        )
+
+    adapter = MagicMock()
+    adapter.engine_type = engine_type
+    adapter.execute = AsyncMock(side_effect=timed_execute)
+    return adapter
+
+
+class TestDependencyScheduling:
+    """Tests for dependency-graph scheduling (no group barriers)."""
+
+    @pytest.mark.asyncio
+    async def test_dependent_starts_when_its_dependency_finishes(self, executor):
+        """A dependent should not wait for unrelated slow engines."""
+        events: list = []
+        adapters = {
+            EngineType.CITATION: _make_timed_adapter(EngineType.CITATION, 0.3, events),
+            EngineType.TIMELINE: _make_timed_adapter(EngineType.TIMELINE, 0.05, events),
+            EngineType.CONTRADICTION: _make_timed_adapter(
+                EngineType.CONTRADICTION, 0.05, events
+            ),
+        }
+
+        with (
+            patch("app.engines.orchestrator.executor.get_cached_adapter") as mock,
+            patch.object(executor._planner, "_dependencies", CONTRADICTION_AFTER_TIMELINE),
+        ):
+            mock.side_effect = lambda et: adapters[et]
+
+            results = await executor.execute_engines(
+                matter_id="matter-123",
+                query="Test query",
+                engines=[
+                    EngineType.CITATION,
+                    EngineType.TIMELINE,
+                    EngineType.CONTRADICTION,
+                ],
+            )
+
+        assert all(r.success for r in results)
+        # Contradiction waited for timeline but not for citation
+        assert events.index(("start", EngineType.CONTRADICTION)) > events.index(
+            ("finish", EngineType.TIMELINE)
+        )
+        assert events.index(("finish", EngineType.CONTRADICTION)) < events.index(
+            ("finish", EngineType.CITATION)
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_dependency_does_not_block_dependent(self, executor):
+        """Dependents still run when their dependency fails."""
+        failing = MagicMock()
+        failing.execute = AsyncMock(side_effect=Exception("Timeline down"))
+        events: list = []
+        adapters = {
+            EngineType.TIMELINE: failing,
+            EngineType.CONTRADICTION: _make_timed_adapter(
+                EngineType.CONTRADICTION, 0.01, events
+            ),
+        }
+
+        with (
+            patch("app.engines.orchestrator.executor.get_cached_adapter") as mock,
+            patch.object(executor._planner, "_dependencies", CONTRADICTION_AFTER_TIMELINE),
+        ):
+            mock.side_effect = lambda et: adapters[et]
+
+            results = await executor.execute_engines(
+                matter_id="matter-123",
+                query="Test query",
+                engines=[EngineType.CONTRADICTION, EngineType.TIMELINE],
+            )
+
+        by_engine = {r.engine: r for r in results}
+        assert not by_engine[EngineType.TIMELINE].success
+        assert by_engine[EngineType.CONTRADICTION].success
+        # Results come back in dependency order
+        assert [r.engine for r in results] == [
+            EngineType.TIMELINE,
+            EngineType.CONTRADICTION,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_per_engine_timeout_returns_partial_results(self):
+        """An engine past its own deadline fails; the rest are returned."""
+        get_engine_executor.cache_clear()
+        executor = EngineExecutor(timeouts={EngineType.CITATION: 0.05})
+        events: list = []
+        adapters = {
+            EngineType.CITATION: _make_timed_adapter(EngineType.CITATION, 0.5, events),
+            EngineType.TIMELINE: _make_timed_adapter(EngineType.TIMELINE, 0.1, events),
+        }
+
+        with patch("app.engines.orchestrator.executor.get_cached_adapter") as mock:
+            mock.side_effect = lambda et: adapters[et]
+
+            results = await executor.execute_engines(
+                matter_id="matter-123",
+                query="Test query",
+                engines=[EngineType.CITATION, EngineType.TIMELINE],
+            )
+
+        by_engine = {r.engine: r for r in results}
+        assert "timed out after 0.05" in by_engine[EngineType.CITATION].error
+        assert by_engine[EngineType.TIMELINE].success
+
+
+class TestEngineDeadlines:
+    """Tests for per-engine deadlines and critical engines."""
+
+    def test_every_engine_has_a_deadline(self):
+        """Every engine should have its own deadline within the default."""
+        assert set(ENGINE_TIMEOUTS) == set(EngineType)
+        assert all(0 < t <= ENGINE_TIMEOUT_SECONDS for t in ENGINE_TIMEOUTS.values())
+        assert EngineType.RAG in CRITICAL_ENGINES
+
+    @pytest.mark.asyncio
+    async def test_non_critical_timeout_aggregates_partial_results(self):
+        """A non-critical engine past its deadline drops out of the answer."""
+        executor = EngineExecutor(
+            timeouts={EngineType.CITATION: 0.05},
+            critical_engines=frozenset({EngineType.RAG}),
+        )
+        events: list = []
+        adapters = {
+            EngineType.CITATION: _make_timed_adapter(EngineType.CITATION, 0.5, events),
+            EngineType.RAG: _make_timed_adapter(EngineType.RAG, 0.1, events),
+        }
+
+        with patch("app.engines.orchestrator.executor.get_cached_adapter") as mock:
+            mock.side_effect = lambda et: adapters[et]
+
+            results = await executor.execute_engines(
+                matter_id="matter-123",
+                query="Test query",
+                engines=[EngineType.CITATION, EngineType.RAG],
+            )
+
+        aggregated = ResultAggregator().aggregate_results(
+            matter_id="matter-123",
+            query="Test query",
+            results=results,
+            wall_clock_time_ms=100,
+        )
+        assert aggregated.successful_engines == [EngineType.RAG]
+        assert aggregated.failed_engines == [EngineType.CITATION]
+        assert "citation" in aggregated.unified_response.lower()
+        by_engine = {r.engine: r for r in results}
+        assert by_engine[EngineType.CITATION].timed_out
+        # RAG ran to completion after citation's deadline passed
+        assert ("finish", EngineType.RAG) in events
+
+    @pytest.mark.asyncio
+    async def test_critical_timeout_cancels_running_engines(self):
+        """Engines still running are cancelled once a critical engine misses its deadline."""
+        executor = EngineExecutor(
+            timeouts={EngineType.RAG: 0.05},
+            critical_engines=frozenset({EngineType.RAG}),
+        )
+        events: list = []
+        adapters = {
+            EngineType.RAG: _make_timed_adapter(EngineType.RAG, 0.5, events),
+            EngineType.TIMELINE: _make_timed_adapter(EngineType.TIMELINE, 5.0, events),
+            EngineType.CITATION: _make_timed_adapter(EngineType.CITATION, 0.01, events),
+        }
+
+        with patch("app.engines.orchestrator.executor.get_cached_adapter") as mock:
+            mock.side_effect = lambda et: adapters[et]
+
+            start = asyncio.get_running_loop().time()
+            results = await executor.execute_engines(
+                matter_id="matter-123",
+                query="Test query",
+                engines=[EngineType.RAG, EngineType.TIMELINE, EngineType.CITATION],
+            )
+            elapsed = asyncio.get_running_loop().time() - start
+
+        by_engine = {r.engine: r for r in results}
+        assert elapsed < 1.0
+        assert by_engine[EngineType.RAG].timed_out
+        assert by_engine[EngineType.CITATION].success
+        assert not by_engine[EngineType.TIMELINE].success
+        assert "critical engine rag" in by_engine[EngineType.TIMELINE].error
+        assert ("finish", EngineType.TIMELINE) not in events
+
+
 # =============================================================================
 # Unit Tests: Matter Isolation (CRITICAL)
 # =============================================================================
@@ -0,0 +1,328 @@
+"""Tests for QueryOrchestrator speculative pre-processing.
+
+Safety check, response cache lookup and intent classification are started
+together, with RAG retrieval following a cache miss; these tests inject slow
+stub providers to verify latency tracks the slowest stage rather than the
+sum, and that speculative work is dropped when the safety check blocks the
+query or the cache answers it.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.engines.orchestrator.orchestrator import QueryOrchestrator
+from app.models.orchestrator import (
+    EngineType,
+    IntentAnalysisResult,
+    IntentClassification,
+    QueryIntent,
+)
+from app.models.safety import SafetyCheckResult
+
+STAGE_DELAY_S = 0.2
+
+
+def _safe_result() -> SafetyCheckResult:
+    return SafetyCheckResult(is_safe=True, regex_check_ms=1.0)
+
+
+def _blocked_result() -> SafetyCheckResult:
+    return SafetyCheckResult(
+        is_safe=False,
+        blocked_by="llm",
+        violation_type="legal_advice_request",
+        explanation="This query seeks legal advice...",
+        regex_check_ms=1.0,
+    )
+
+
+def _intent_result(query: str = "What does Section 138 say?") -> IntentAnalysisResult:
+    return IntentAnalysisResult(
+        matter_id="matter-123",
+        query=query,
+        classification=IntentClassification(
+            intent=QueryIntent.RAG_SEARCH,
+            confidence=0.9,
+            required_engines=[EngineType.RAG],
+            reasoning="test",
+        ),
+    )
+
+
+def _slow(result, delay: float = STAGE_DELAY_S, completed: list | None = None):
+    """Build an async stub that sleeps before returning."""
+
+    async def _call(*args, **kwargs):
+        await asyncio.sleep(delay)
+        if completed is not None:
+            completed.append(True)
+        return result
+
+    return AsyncMock(side_effect=_call)
+
+
+@pytest.fixture
+def mock_executor():
+    executor = MagicMock()
+    executor.execute_engines = AsyncMock(return_value=[])
+    return executor
+
+
+@pytest.fixture
+def mock_aggregator():
+    aggregator = MagicMock()
+    result = MagicMock()
+    result.success = False
+    result.successful_engines = []
+    result.failed_engines = []
+    result.confidence = 0.0
+    result.wall_clock_time_ms = 0
+    aggregator.aggregate_results_async = AsyncMock(return_value=result)
+    return aggregator
+
+
+@pytest.fixture
+def mock_cache_service():
+    cache = MagicMock()
+    cache.check_cache = _slow(None)
+    cache.cache_result = AsyncMock()
+    return cache
+
+
+def _build_orchestrator(
+    safety_guard,
+    intent_analyzer,
+    executor,
+    aggregator,
+    cache_service,
+    speculative_rag: bool = False,
+) -> QueryOrchestrator:
+    with patch("app.engines.orchestrator.orchestrator.get_execution_planner"):
+        return QueryOrchestrator(
+            safety_guard=safety_guard,
+            intent_analyzer=intent_analyzer,
+            executor=executor,
+            aggregator=aggregator,
+            audit_logger=MagicMock(),
+            history_store=MagicMock(),
+            cache_service=cache_service,
+            use_multi_intent=False,
+            speculative_rag=speculative_rag,
+        )
+
+
+@pytest.mark.asyncio
+class TestSpeculativePreprocessing:
+    """Pre-processing stages run in parallel rather than in sequence."""
+
+    async def test_latency_tracks_slowest_stage(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """Safety, cache and intent should overlap instead of adding up."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(_safe_result())
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(_intent_result())
+
+        orchestrator = _build_orchestrator(
+            safety_guard, intent_analyzer, mock_executor, mock_aggregator, mock_cache_service
+        )
+
+        start = time.perf_counter()
+        await orchestrator.process_query(
+            matter_id="matter-123",
+            query="What does Section 138 say?",
+            user_id="user-456",
+        )
+        elapsed = time.perf_counter() - start
+
+        # Sequential would be 3 * STAGE_DELAY_S
+        assert elapsed < 2 * STAGE_DELAY_S
+        mock_executor.execute_engines.assert_called_once()
+        assert mock_executor.execute_engines.call_args.kwargs["engines"] == [EngineType.RAG]
+
+    async def test_blocked_query_cancels_speculative_intent(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """A block should cancel in-flight intent work and skip engines."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(_blocked_result(), delay=0.05)
+        intent_completed: list = []
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(
+            _intent_result(), delay=0.5, completed=intent_completed
+        )
+
+        orchestrator = _build_orchestrator(
+            safety_guard, intent_analyzer, mock_executor, mock_aggregator, mock_cache_service
+        )
+
+        start = time.perf_counter()
+        result = await orchestrator.process_query(
+            matter_id="matter-123",
+            query="Should I file an appeal?",
+            user_id="user-456",
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result.blocked is True
+        assert elapsed < 0.5
+        mock_executor.execute_engines.assert_not_called()
+
+        # Give a cancelled stub the chance to (wrongly) finish
+        await asyncio.sleep(0.6)
+        assert intent_completed == []
+
+    async def test_rewritten_query_restarts_speculation(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """Engines should run on the rewritten query, not the original."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(
+            SafetyCheckResult(
+                is_safe=False,
+                blocked_by="regex",
+                violation_type="legal_advice_request",
+                explanation="Rewritten",
+                suggested_rewrite="What does the record say about the appeal?",
+                regex_check_ms=1.0,
+            ),
+            delay=0.05,
+        )
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(_intent_result(), delay=0.05)
+
+        orchestrator = _build_orchestrator(
+            safety_guard, intent_analyzer, mock_executor, mock_aggregator, mock_cache_service
+        )
+
+        await orchestrator.process_query(
+            matter_id="matter-123",
+            query="Should I file an appeal?",
+            user_id="user-456",
+        )
+
+        queries = [c.kwargs["query"] for c in intent_analyzer.analyze_intent.call_args_list]
+        assert queries == [
+            "Should I file an appeal?",
+            "What does the record say about the appeal?",
+        ]
+        assert (
+            mock_executor.execute_engines.call_args.kwargs["query"]
+            == "What does the record say about the appeal?"
+        )
+
+    async def test_blocked_query_skips_rag_prefetch(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """A block before the cache lookup resolves should never start RAG."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(_blocked_result(), delay=0.05)
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(_intent_result())
+        rag_adapter = MagicMock()
+
+        with patch(
+            "app.engines.orchestrator.orchestrator.get_cached_adapter",
+            return_value=rag_adapter,
+        ):
+            orchestrator = _build_orchestrator(
+                safety_guard,
+                intent_analyzer,
+                mock_executor,
+                mock_aggregator,
+                mock_cache_service,
+                speculative_rag=True,
+            )
+            await orchestrator.process_query(
+                matter_id="matter-123",
+                query="Should I file an appeal?",
+                user_id="user-456",
+            )
+            await asyncio.sleep(STAGE_DELAY_S * 1.5)
+
+        rag_adapter.prefetch_retrieval.assert_not_called()
+        rag_adapter.discard_prefetch.assert_called_with(
+            "matter-123", "Should I file an appeal?"
+        )
+
+    async def test_cache_miss_starts_rag_prefetch(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """RAG retrieval should start once the cache misses."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(_safe_result())
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(_intent_result())
+        mock_cache_service.check_cache = _slow(None, delay=0.05)
+        rag_adapter = MagicMock()
+        prefetch_started: list[float] = []
+        rag_adapter.prefetch_retrieval.side_effect = (
+            lambda *args: prefetch_started.append(time.perf_counter())
+        )
+
+        with patch(
+            "app.engines.orchestrator.orchestrator.get_cached_adapter",
+            return_value=rag_adapter,
+        ):
+            orchestrator = _build_orchestrator(
+                safety_guard,
+                intent_analyzer,
+                mock_executor,
+                mock_aggregator,
+                mock_cache_service,
+                speculative_rag=True,
+            )
+            start = time.perf_counter()
+            await orchestrator.process_query(
+                matter_id="matter-123",
+                query="What does Section 138 say?",
+                user_id="user-456",
+            )
+
+        rag_adapter.prefetch_retrieval.assert_called_once_with(
+            "matter-123", "What does Section 138 say?"
+        )
+        # Started alongside the safety check, not after it
+        assert prefetch_started[0] - start < STAGE_DELAY_S
+
+    async def test_cache_hit_skips_rag_prefetch(
+        self, mock_executor, mock_aggregator, mock_cache_service
+    ) -> None:
+        """A cached answer should not spend an embedding and rerank."""
+        safety_guard = MagicMock()
+        safety_guard.check_query = _slow(_safe_result())
+        intent_analyzer = MagicMock()
+        intent_analyzer.analyze_intent = _slow(_intent_result())
+        cached = MagicMock()
+        cached.query_hash = "a" * 64
+        cached.cached_at = "2026-01-01T00:00:00Z"
+        cached.confidence = 0.9
+        cached.response_data = {"success": True, "unified_response": "Cached answer"}
+        mock_cache_service.check_cache = _slow(cached, delay=0.05)
+        rag_adapter = MagicMock()
+
+        with patch(
+            "app.engines.orchestrator.orchestrator.get_cached_adapter",
+            return_value=rag_adapter,
+        ):
+            orchestrator = _build_orchestrator(
+                safety_guard,
+                intent_analyzer,
+                mock_executor,
+                mock_aggregator,
+                mock_cache_service,
+                speculative_rag=True,
+            )
+            result = await orchestrator.process_query(
+                matter_id="matter-123",
+                query="What does Section 138 say?",
+                user_id="user-456",
+            )
+
+        assert result.from_cache is True
+        rag_adapter.prefetch_retrieval.assert_not_called()
+        mock_executor.execute_engines.assert_not_called()
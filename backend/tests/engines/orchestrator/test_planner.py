@@ -121,6 +121,25 @@ class TestDependencyResolution:
         for engine in EngineType:
             assert planner.has_dependencies(engine) is False
 
+    def test_plan_includes_dependency_graph(self, planner):
+        """Plan should carry dependency edges restricted to planned engines."""
+        planner._dependencies = {
+            EngineType.CONTRADICTION: [EngineType.TIMELINE, EngineType.RAG],
+        }
+
+        plan = planner.create_execution_plan([
+            EngineType.CITATION,
+            EngineType.TIMELINE,
+            EngineType.CONTRADICTION,
+        ])
+
+        assert plan.dependencies == {
+            EngineType.CITATION: [],
+            EngineType.TIMELINE: [],
+            EngineType.CONTRADICTION: [EngineType.TIMELINE],
+        }
+        assert plan.parallel_groups[-1] == [EngineType.CONTRADICTION]
+
 
 # =============================================================================
 # Unit Tests: Parallel Detection (Task 3.5)
@@ -3,6 +3,7 @@
 Story 4-1: Date Extraction with Gemini
 """
 
+import asyncio
 import json
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
@@ -13,6 +14,7 @@ from app.engines.timeline.date_extractor import (
     DateConfigurationError,
     DateExtractor,
     get_date_extractor,
+    has_date_cues,
 )
 from app.models.timeline import ExtractedDate
 
@@ -261,6 +263,83 @@ class TestDateExtractorChunking:
         assert "March 2024" in date_texts
 
 
+class TestDateCues:
+    """Tests for the date-cue pre-filter."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Filed on 15/01/2024 before the court.",
+            "Order passed on 3.4.19.",
+            "Hearing in September.",
+            "Adjourned to 5th May.",
+            "Executed on this 5th day of the month.",
+            "Notice issued two days ago, reply within thirty days.",
+            "Agreement dated as above.",
+            "Rent revised w.e.f. the said order.",
+            "Under the Negotiable Instruments Act, 1881.",
+            "Returns for FY 2022-23.",
+        ],
+    )
+    def test_detects_date_cues(self, text: str) -> None:
+        assert has_date_cues(text) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "The petitioner may file a rejoinder.",
+            "Section 138 read with Section 141.",
+            "The respondent denied all allegations.",
+        ],
+    )
+    def test_ignores_text_without_dates(self, text: str) -> None:
+        assert has_date_cues(text) is False
+
+    @pytest.mark.asyncio
+    async def test_chunked_extraction_skips_chunks_without_cues(self) -> None:
+        """Only chunks with date cues reach Gemini; merge keeps chunk order."""
+        extractor = DateExtractor()
+        filler = "The respondent denied all allegations made in the petition. " * 100
+        text = (
+            "Notice was served on 15/01/2024. " * 10
+            + filler * 2
+            + "The reply was filed on 20/02/2024. " * 10
+        )
+        chunks = extractor._split_into_chunks(text)
+        cued = [c for c in chunks if has_date_cues(c)]
+        assert 0 < len(cued) < len(chunks)
+
+        async def mock_generate(prompt: str):
+            # Later chunks finish first, so order must not depend on completion
+            found = []
+            if "15/01/2024" in prompt:
+                found.append(("15/01/2024", "2024-01-15"))
+                await asyncio.sleep(0.02)
+            if "20/02/2024" in prompt:
+                found.append(("20/02/2024", "2024-02-20"))
+            response = MagicMock()
+            response.text = json.dumps({
+                "dates": [
+                    {"date_text": t, "extracted_date": d, "confidence": 0.9}
+                    for t, d in found
+                ]
+            })
+            return response
+
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(side_effect=mock_generate)
+        extractor._model = mock_model
+
+        result = await extractor.extract_dates_from_text(
+            text=text,
+            document_id="doc-123",
+            matter_id="matter-456",
+        )
+
+        assert mock_model.generate_content_async.await_count == len(cued)
+        assert [d.date_text for d in result.dates] == ["15/01/2024", "20/02/2024"]
+
+
 class TestDateExtractorExtraction:
     """Tests for full extraction with mocked Gemini."""
 
@@ -0,0 +1,84 @@
+"""Fixtures for integration tests against a local Supabase stack.
+
+Tests using these fixtures write real rows, so they only run against the
+stack named by LOCAL_SUPABASE_URL / LOCAL_SUPABASE_SERVICE_KEY (the API URL
+and service_role key printed by `supabase start`, with this repo's
+migrations applied). The app's configured Supabase is never used. Without
+them, the tests are skipped.
+"""
+
+import os
+from collections.abc import Callable, Generator
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+LOCAL_SUPABASE_URL = os.getenv("LOCAL_SUPABASE_URL")
+LOCAL_SUPABASE_SERVICE_KEY = os.getenv("LOCAL_SUPABASE_SERVICE_KEY")
+
+
+@pytest.fixture(scope="session")
+def local_supabase_factory() -> Callable[[], Any]:
+    """Create service-role clients for the local stack (one per thread)."""
+    if not (LOCAL_SUPABASE_URL and LOCAL_SUPABASE_SERVICE_KEY):
+        pytest.skip(
+            "Local Supabase not configured. Set LOCAL_SUPABASE_URL and "
+            "LOCAL_SUPABASE_SERVICE_KEY."
+        )
+
+    from supabase import create_client
+
+    def factory() -> Any:
+        return create_client(LOCAL_SUPABASE_URL, LOCAL_SUPABASE_SERVICE_KEY)
+
+    try:
+        factory().table("matters").select("id").limit(1).execute()
+    except Exception as e:
+        pytest.skip(f"Local Supabase unreachable: {e}")
+    return factory
+
+
+@pytest.fixture
+def local_supabase(local_supabase_factory: Callable[[], Any]) -> Any:
+    """Service-role client for the local stack."""
+    return local_supabase_factory()
+
+
+@pytest.fixture
+def local_matter(local_supabase: Any) -> Generator[str, None, None]:
+    """A throwaway matter; its nodes and edges are removed by cascade."""
+    row = (
+        local_supabase.table("matters")
+        .insert({"title": f"integration-{uuid4()}"})
+        .execute()
+        .data[0]
+    )
+    yield row["id"]
+    local_supabase.table("matters").delete().eq("id", row["id"]).execute()
+
+
+@pytest.fixture
+def make_local_nodes(local_supabase: Any, local_matter: str) -> Callable[[list[str]], dict[str, str]]:
+    """Insert PERSON identity_nodes into local_matter; returns {name: id}."""
+
+    def make(names: list[str]) -> dict[str, str]:
+        rows = (
+            local_supabase.table("identity_nodes")
+            .insert(
+                [
+                    {
+                        "matter_id": local_matter,
+                        "canonical_name": name,
+                        "entity_type": "PERSON",
+                        "mention_count": 0,
+                    }
+                    for name in names
+                ]
+            )
+            .execute()
+            .data
+        )
+        return {row["canonical_name"]: row["id"] for row in rows}
+
+    return make
@@ -0,0 +1,201 @@
+"""Consistency tests for materialized alias clusters (local Supabase).
+
+identity_nodes.alias_cluster_id is maintained by trigger as ALIAS_OF edges
+are inserted, deleted and rewritten. After every change it must equal the
+smallest node id of the node's connected component, computed here from
+scratch over identity_edges.
+"""
+
+import asyncio
+import random
+from collections.abc import Callable
+from typing import Any
+
+from app.models.entity import RelationshipType
+from app.services.mig.graph import MIGGraphService
+
+ALIAS_OF = RelationshipType.ALIAS_OF.value
+RELATED_TO = RelationshipType.RELATED_TO.value
+NODE_NAMES = [f"Party {i}" for i in range(10)]
+STEPS = 60
+
+
+def _components(node_ids: list[str], edges: list[dict]) -> dict[str, str]:
+    """Expected cluster id per node: smallest id in its ALIAS_OF component."""
+    parent = {node_id: node_id for node_id in node_ids}
+
+    def find(node_id: str) -> str:
+        while parent[node_id] != node_id:
+            parent[node_id] = parent[parent[node_id]]
+            node_id = parent[node_id]
+        return node_id
+
+    for edge in edges:
+        if edge["relationship_type"] != ALIAS_OF:
+            continue
+        a, b = find(edge["source_node_id"]), find(edge["target_node_id"])
+        if a != b:
+            parent[max(a, b)] = min(a, b)  # uuid order is hex string order
+    return {node_id: find(node_id) for node_id in node_ids}
+
+
+class _AliasGraph:
+    """Reads and mutates one matter's nodes and edges."""
+
+    def __init__(self, client: Any, matter_id: str):
+        self.client = client
+        self.matter_id = matter_id
+
+    def nodes(self) -> dict[str, str]:
+        rows = (
+            self.client.table("identity_nodes")
+            .select("id, alias_cluster_id")
+            .eq("matter_id", self.matter_id)
+            .execute()
+            .data
+        )
+        return {row["id"]: row["alias_cluster_id"] for row in rows}
+
+    def edges(self) -> list[dict]:
+        return (
+            self.client.table("identity_edges")
+            .select("id, source_node_id, target_node_id, relationship_type")
+            .eq("matter_id", self.matter_id)
+            .execute()
+            .data
+        )
+
+    def insert(self, source: str, target: str, relationship_type: str) -> None:
+        self.client.table("identity_edges").insert(
+            {
+                "matter_id": self.matter_id,
+                "source_node_id": source,
+                "target_node_id": target,
+                "relationship_type": relationship_type,
+                "confidence": 0.9,
+            }
+        ).execute()
+
+    def update(self, edge_id: str, changes: dict) -> None:
+        self.client.table("identity_edges").update(changes).eq("id", edge_id).execute()
+
+    def delete_edge(self, edge_id: str) -> None:
+        self.client.table("identity_edges").delete().eq("id", edge_id).execute()
+
+    def delete_node(self, node_id: str) -> None:
+        self.client.table("identity_nodes").delete().eq("id", node_id).execute()
+
+    def assert_consistent(self, step: str) -> None:
+        nodes = self.nodes()
+        expected = _components(list(nodes), self.edges())
+        assert nodes == expected, f"alias_cluster_id out of sync after {step}"
+
+
+def _random_step(graph: _AliasGraph, rng: random.Random) -> str:
+    """Apply one random edge (or node) change; returns its description."""
+    node_ids = sorted(graph.nodes())
+    edges = graph.edges()
+    taken = {
+        (e["source_node_id"], e["target_node_id"], e["relationship_type"]) for e in edges
+    }
+
+    def free_pair(relationship_type: str) -> tuple[str, str] | None:
+        candidates = [
+            (a, b)
+            for a in node_ids
+            for b in node_ids
+            if a != b and (a, b, relationship_type) not in taken
+        ]
+        return rng.choice(candidates) if candidates else None
+
+    roll = rng.random()
+    if roll < 0.45 or not edges:
+        relationship_type = ALIAS_OF if rng.random() < 0.8 else RELATED_TO
+        pair = free_pair(relationship_type)
+        if pair is None:
+            return "no-op"
+        graph.insert(*pair, relationship_type)
+        return f"insert {relationship_type}"
+
+    edge = rng.choice(edges)
+    if roll < 0.7:
+        graph.delete_edge(edge["id"])
+        return f"delete {edge['relationship_type']}"
+    if roll < 0.85:
+        # Retarget: may split the old cluster and merge into another
+        pair = free_pair(edge["relationship_type"])
+        if pair is None:
+            return "no-op"
+        graph.update(edge["id"], {"source_node_id": pair[0], "target_node_id": pair[1]})
+        return f"retarget {edge['relationship_type']}"
+    if roll < 0.97:
+        # Retype: an edge becomes, or stops being, an alias
+        new_type = RELATED_TO if edge["relationship_type"] == ALIAS_OF else ALIAS_OF
+        key = (edge["source_node_id"], edge["target_node_id"], new_type)
+        if key in taken:
+            return "no-op"
+        graph.update(edge["id"], {"relationship_type": new_type})
+        return f"retype to {new_type}"
+    if len(node_ids) > 3:
+        # Cascade-deletes the node's edges
+        graph.delete_node(rng.choice(node_ids))
+        return "delete node"
+    return "no-op"
+
+
+class TestAliasClusterConsistency:
+    """alias_cluster_id against connected components of identity_edges."""
+
+    def test_clusters_match_components_through_edge_changes(
+        self,
+        local_supabase: Any,
+        local_matter: str,
+        make_local_nodes: Callable[[list[str]], dict[str, str]],
+    ) -> None:
+        """Inserts, deletes and rewrites keep every node's cluster exact."""
+        make_local_nodes(NODE_NAMES)
+        graph = _AliasGraph(local_supabase, local_matter)
+        graph.assert_consistent("node insert")
+
+        rng = random.Random(2024)
+        for i in range(STEPS):
+            step = _random_step(graph, rng)
+            graph.assert_consistent(f"step {i}: {step}")
+
+    def test_service_expansion_matches_components(
+        self,
+        local_supabase: Any,
+        local_matter: str,
+        make_local_nodes: Callable[[list[str]], dict[str, str]],
+    ) -> None:
+        """get_alias_cluster returns each node's full transitive component."""
+        ids = make_local_nodes(NODE_NAMES)
+        chain = [ids[name] for name in NODE_NAMES[:4]]
+        service = MIGGraphService()
+        service._client = local_supabase
+
+        asyncio.run(
+            service.create_alias_edges(
+                local_matter,
+                [(a, b, 0.9, None) for a, b in zip(chain, chain[1:], strict=False)],
+            )
+        )
+        graph = _AliasGraph(local_supabase, local_matter)
+        graph.assert_consistent("alias chain insert")
+        expected = _components(list(graph.nodes()), graph.edges())
+
+        for node_id in ids.values():
+            cluster = asyncio.run(service.get_alias_cluster(node_id, local_matter))
+            members = {n.id for n in cluster}
+            assert members == {n for n, c in expected.items() if c == expected[node_id]}
+
+        # Removing the middle link splits the chain in two
+        middle = next(
+            e for e in graph.edges()
+            if {e["source_node_id"], e["target_node_id"]} == {chain[1], chain[2]}
+        )
+        graph.delete_edge(middle["id"])
+        graph.assert_consistent("middle link delete")
+        service.invalidate_alias_clusters(local_matter)
+        cluster = asyncio.run(service.get_alias_cluster(chain[0], local_matter))
+        assert {n.id for n in cluster} == set(chain[:2])
@@ -148,8 +148,12 @@ class TestClassificationPipelineIntegration:
 
         # Step 3: Update classifications in database
         mock_update_response = MagicMock()
-        mock_update_response.data = [{"id": "event-1"}]
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = mock_update_response
+        mock_update_response.data = [
+            {"event_id": "event-1"},
+            {"event_id": "event-2"},
+            {"event_id": "event-3"},
+        ]
+        mock_client.rpc.return_value.execute.return_value = mock_update_response
 
         updated_count = await timeline_service.bulk_update_classifications(
             classifications=classification_results,
@@ -0,0 +1,107 @@
+"""Concurrency test for increment_entity_mention_counts (local Supabase).
+
+Parallel extraction batches add mention deltas to overlapping entities
+through MIGGraphService._batch_update_mention_counts. The final counts must
+equal the sum of every delta: no increment may be lost.
+"""
+
+import asyncio
+import random
+import threading
+from collections import Counter
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.services.mig.graph import MIGGraphService
+
+WORKERS = 8
+ROUNDS = 5
+ENTITIES = ["Alice", "Bob", "Carol"]
+
+
+def _worker_batches(entity_ids: list[str], seed: int) -> list[list[tuple[str, int]]]:
+    """Per-round batches of (entity_id, delta), with repeated ids."""
+    rng = random.Random(seed)
+    return [
+        [(rng.choice(entity_ids), rng.randint(1, 5)) for _ in range(6)]
+        for _ in range(ROUNDS)
+    ]
+
+
+class TestIncrementEntityMentionCounts:
+    """Concurrent increments against a real database."""
+
+    def test_parallel_increments_sum_exactly(
+        self,
+        local_supabase: Any,
+        local_supabase_factory: Callable[[], Any],
+        local_matter: str,
+        make_local_nodes: Callable[[list[str]], dict[str, str]],
+    ) -> None:
+        """Final mention_count equals the sum of all deltas per entity."""
+        ids = list(make_local_nodes(ENTITIES).values())
+        batches = [_worker_batches(ids, seed) for seed in range(WORKERS)]
+        start = threading.Barrier(WORKERS)
+
+        def run(worker_batches: list[list[tuple[str, int]]]) -> None:
+            service = MIGGraphService()
+            service._client = local_supabase_factory()  # Own connection per worker
+            start.wait()
+            for batch in worker_batches:
+                updated = asyncio.run(
+                    service._batch_update_mention_counts(local_matter, batch)
+                )
+                assert {node.id for node in updated} == {eid for eid, _ in batch}
+
+        with ThreadPoolExecutor(max_workers=WORKERS) as pool:
+            list(pool.map(run, batches))
+
+        expected: Counter[str] = Counter()
+        for worker_batches in batches:
+            for batch in worker_batches:
+                for entity_id, delta in batch:
+                    expected[entity_id] += delta
+
+        rows = (
+            local_supabase.table("identity_nodes")
+            .select("id, mention_count")
+            .eq("matter_id", local_matter)
+            .execute()
+            .data
+        )
+        assert {row["id"]: row["mention_count"] for row in rows} == dict(expected)
+
+    def test_ignores_entities_of_other_matters(
+        self,
+        local_supabase: Any,
+        local_matter: str,
+        make_local_nodes: Callable[[list[str]], dict[str, str]],
+    ) -> None:
+        """An entity id from another matter is not incremented."""
+        alice = make_local_nodes(["Alice"])["Alice"]
+        other = (
+            local_supabase.table("matters")
+            .insert({"title": "integration-other"})
+            .execute()
+            .data[0]["id"]
+        )
+        try:
+            service = MIGGraphService()
+            service._client = local_supabase
+            updated = asyncio.run(
+                service._batch_update_mention_counts(other, [(alice, 3)])
+            )
+        finally:
+            local_supabase.table("matters").delete().eq("id", other).execute()
+
+        assert updated == []
+        row = (
+            local_supabase.table("identity_nodes")
+            .select("mention_count")
+            .eq("id", alice)
+            .single()
+            .execute()
+            .data
+        )
+        assert row["mention_count"] == 0
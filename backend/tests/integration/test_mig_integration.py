@@ -427,16 +427,9 @@ class TestMIGMentionTracking:
         matter_id = str(uuid4())
         entity_id = str(uuid4())
 
-        # Mock existing entity with mention_count
-        mock_select_current = MagicMock()
-        mock_select_current.data = [{"mention_count": 5}]
-        mock_client.table.return_value.select.return_value.eq.return_value.eq.return_value.limit.return_value.execute.return_value = (
-            mock_select_current
-        )
-
-        # Mock update
-        mock_update_response = MagicMock()
-        mock_update_response.data = [
+        # Mock increment RPC returning the updated row
+        mock_rpc_response = MagicMock()
+        mock_rpc_response.data = [
             {
                 "id": entity_id,
                 "matter_id": matter_id,
@@ -449,9 +442,7 @@ class TestMIGMentionTracking:
                 "updated_at": "2024-01-15T11:00:00+00:00",
             }
         ]
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = (
-            mock_update_response
-        )
+        mock_client.rpc.return_value.execute.return_value = mock_rpc_response
 
         service = MIGGraphService()
 
@@ -462,5 +453,13 @@ class TestMIGMentionTracking:
             increment=3,
         )
 
-        # Verify update was called with new count
-        mock_client.table.return_value.update.assert_called()
+        # Verify the delta was applied server-side, without a read
+        mock_client.rpc.assert_called_once_with(
+            "increment_entity_mention_counts",
+            {
+                "p_matter_id": matter_id,
+                "p_entity_ids": [entity_id],
+                "p_increments": [3],
+            },
+        )
+        mock_client.table.return_value.select.assert_not_called()
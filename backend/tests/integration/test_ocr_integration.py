@@ -679,7 +679,10 @@ class TestOCRQueueTaskIntegration:
         from app.api.routes.documents import _queue_ocr_task
 
         # Mock the chain function at celery module level (imported inside function)
-        with patch("celery.chain") as mock_chain:
+        with (
+            patch("celery.chain") as mock_chain,
+            patch("app.api.routes.documents.build_document_pdf_manifest") as mock_build,
+        ):
             mock_task_chain = MagicMock()
             mock_chain.return_value = mock_task_chain
 
@@ -689,12 +692,19 @@ class TestOCRQueueTaskIntegration:
             # Verify chain was created and apply_async was called with high queue
             mock_chain.assert_called_once()
             mock_task_chain.apply_async.assert_called_once_with(queue="high")
+            # PDF manifest is built by its own task, off the OCR path
+            mock_build.apply_async.assert_called_once_with(
+                args=["doc-small"], queue="high"
+            )
 
     def test_queue_ocr_task_uses_default_priority_for_large_files(self) -> None:
         """Test that large files (>=10MB) use 'default' priority queue."""
         from app.api.routes.documents import _queue_ocr_task
 
-        with patch("celery.chain") as mock_chain:
+        with (
+            patch("celery.chain") as mock_chain,
+            patch("app.api.routes.documents.build_document_pdf_manifest"),
+        ):
             mock_task_chain = MagicMock()
             mock_chain.return_value = mock_task_chain
 
@@ -708,7 +718,10 @@ class TestOCRQueueTaskIntegration:
         """Test boundary case: exactly 10MB should use default queue."""
         from app.api.routes.documents import _queue_ocr_task
 
-        with patch("celery.chain") as mock_chain:
+        with (
+            patch("celery.chain") as mock_chain,
+            patch("app.api.routes.documents.build_document_pdf_manifest"),
+        ):
             mock_task_chain = MagicMock()
             mock_chain.return_value = mock_task_chain
 
@@ -95,7 +95,8 @@ class TestSearchPipelineIntegration:
 
         # Verify pipeline execution
         mock_embedder.embed_text.assert_called_once_with("contract termination remedies")
-        mock_supabase_client.rpc.assert_called_once()
+        rpc_names = {c[0][0] for c in mock_supabase_client.rpc.call_args_list}
+        assert rpc_names == {"bm25_search_chunks", "semantic_leg_search_chunks"}
 
         # Verify results structure
         assert len(result.results) == 2
@@ -131,11 +132,9 @@ class TestSearchPipelineIntegration:
             weights=weights,
         )
 
-        # Verify weights were passed to RPC
-        # rpc() is called as rpc(func_name, params_dict), so params are in call_args[0][1]
-        rpc_params = mock_supabase_client.rpc.call_args[0][1]
-        assert rpc_params["full_text_weight"] == 1.5
-        assert rpc_params["semantic_weight"] == 0.5
+        # Weights are applied client-side when fusing the two legs:
+        # the top row ranks first in both, so rrf = (1.5 + 0.5) / (60 + 1)
+        assert result.results[0].rrf_score == pytest.approx((1.5 + 0.5) / 61)
 
         # Verify weights in response
         assert result.weights.bm25 == 1.5
@@ -571,8 +570,9 @@ class TestRerankPipelineIntegration:
         assert reranked.page_number == original["page_number"]
         assert reranked.chunk_type == original["chunk_type"]
         assert reranked.token_count == original["token_count"]
-        assert reranked.bm25_rank == original["bm25_rank"]
-        assert reranked.semantic_rank == original["semantic_rank"]
-        assert reranked.rrf_score == original["rrf_score"]
+        # Ranks and score come from client-side RRF over both legs
+        assert reranked.bm25_rank == 1
+        assert reranked.semantic_rank == 1
+        assert reranked.rrf_score == pytest.approx(2 / 61)
         # Plus relevance score from reranker
         assert reranked.relevance_score == 0.9
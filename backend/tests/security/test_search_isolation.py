@@ -97,10 +97,10 @@ class TestSearchMatterIsolationLayer2:
             matter_id=authorized_matter,
         )
 
-        # Verify validate_search_results was called with matter_id
-        mock_validate_results.assert_called_once_with(
-            results_data, authorized_matter
-        )
+        # Verify each leg (BM25 and semantic) was validated with matter_id
+        assert mock_validate_results.call_count == 2
+        for call in mock_validate_results.call_args_list:
+            assert call == ((results_data, authorized_matter),)
 
         # All results should be from the authorized matter
         for r in result.results:
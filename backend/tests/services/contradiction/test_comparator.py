@@ -9,7 +9,7 @@ Tests cover:
 - Cost tracking aggregation
 """
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -26,6 +26,7 @@ from app.models.contradiction import (
     StatementPairComparison,
 )
 from app.services.contradiction.comparator import (
+    VERDICT_CACHE_COST_OPERATION,
     StatementComparisonService,
     TooManyStatementsError,
     get_statement_comparison_service,
@@ -276,6 +277,58 @@ class TestStatementComparisonService:
         # N*(N-1)/2 = 10*9/2 = 45
         assert pairs == 45
 
+    @pytest.mark.asyncio
+    async def test_verdict_cache_savings_recorded_as_zero_cost(
+        self,
+        service: StatementComparisonService,
+        mock_comparator: MagicMock,
+    ) -> None:
+        """Cache hits should be recorded through cost tracking with the avoided cost."""
+        batch_result = mock_comparator.compare_all_entity_statements.return_value
+        batch_result.cache_hits = 3
+        batch_result.cache_misses = 1
+        batch_result.cost_avoided_usd = 0.12
+        cost_service = MagicMock()
+
+        with patch(
+            "app.services.contradiction.comparator.get_cost_service",
+            return_value=cost_service,
+        ):
+            await service.compare_entity_statements(
+                entity_id="entity-123",
+                matter_id="matter-456",
+            )
+
+        cost_service.record_cost.assert_called_once()
+        tracker = cost_service.record_cost.call_args.args[0]
+        metadata = cost_service.record_cost.call_args.kwargs["metadata"]
+        assert tracker.operation == VERDICT_CACHE_COST_OPERATION
+        assert tracker.matter_id == "matter-456"
+        assert tracker.entity_id == "entity-123"
+        assert tracker.total_cost_usd == 0
+        assert metadata["cache_hits"] == 3
+        assert metadata["cost_avoided_usd"] == 0.12
+        assert metadata["cost_avoided_inr"] > 0
+
+    @pytest.mark.asyncio
+    async def test_no_cost_record_without_cache_hits(
+        self,
+        service: StatementComparisonService,
+    ) -> None:
+        """Runs without cache hits should not add savings rows."""
+        cost_service = MagicMock()
+
+        with patch(
+            "app.services.contradiction.comparator.get_cost_service",
+            return_value=cost_service,
+        ):
+            await service.compare_entity_statements(
+                entity_id="entity-123",
+                matter_id="matter-456",
+            )
+
+        cost_service.record_cost.assert_not_called()
+
 
 # =============================================================================
 # Factory Tests
@@ -104,10 +104,12 @@ class TestGetCachedResult:
         """Should use correct Redis key format (AC #1)."""
         await repository.get_cached_result(MATTER_ID, QUERY_HASH)
 
-        mock_redis.get.assert_called_once()
-        call_args = mock_redis.get.call_args
-        key = call_args[0][0]
-        assert key == f"cache:query:{MATTER_ID}:{QUERY_HASH}"
+        # Generation counter first, then the entry of that generation
+        keys = [call.args[0] for call in mock_redis.get.call_args_list]
+        assert keys == [
+            f"matter:{MATTER_ID}:gen:query",
+            f"cache:query:{MATTER_ID}:g0:{QUERY_HASH}",
+        ]
 
     @pytest.mark.asyncio
     async def test_corrupt_cache_entry_deleted(
@@ -153,7 +155,7 @@ class TestSetCachedResult:
 
         call_args = mock_redis.setex.call_args
         key = call_args[0][0]
-        assert key == f"cache:query:{MATTER_ID}:{QUERY_HASH}"
+        assert key == f"cache:query:{MATTER_ID}:g0:{QUERY_HASH}"
 
     @pytest.mark.asyncio
     async def test_stores_serialized_json(
@@ -213,7 +215,7 @@ class TestDeleteCachedResult:
 
         call_args = mock_redis.delete.call_args
         key = call_args[0][0]
-        assert key == f"cache:query:{MATTER_ID}:{QUERY_HASH}"
+        assert key == f"cache:query:{MATTER_ID}:g0:{QUERY_HASH}"
 
 
 class TestMatterIsolation:
@@ -294,70 +296,59 @@ class TestBulkInvalidation:
     """Tests for bulk invalidation (Task 5.8)."""
 
     @pytest.mark.asyncio
-    async def test_invalidate_matter_cache_empty(
+    async def test_invalidate_bumps_generation(
         self,
         repository: QueryCacheRepository,
         mock_redis: AsyncMock,
     ) -> None:
-        """Should return 0 when no keys to delete."""
-        mock_redis.scan.return_value = (0, [])
+        """Should invalidate with one INCR and no keyspace scan (AC #4)."""
+        mock_redis.incr.return_value = 3
 
-        count = await repository.invalidate_matter_cache(MATTER_ID)
+        generation = await repository.invalidate_matter_cache(MATTER_ID)
 
-        assert count == 0
+        assert generation == 3
+        mock_redis.incr.assert_called_once_with(f"matter:{MATTER_ID}:gen:query")
+        mock_redis.expire.assert_called_once()
+        mock_redis.scan.assert_not_called()
+        mock_redis.delete.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_invalidate_matter_cache_deletes_all(
-        self,
-        repository: QueryCacheRepository,
-        mock_redis: AsyncMock,
-    ) -> None:
-        """Should delete all cache entries for matter (AC #4)."""
-        # Mock SCAN returning keys
-        mock_redis.scan.return_value = (0, [
-            f"cache:query:{MATTER_ID}:{QUERY_HASH}",
-            f"cache:query:{MATTER_ID}:{QUERY_HASH_2}",
-        ])
-        mock_redis.delete.return_value = 2
-
-        count = await repository.invalidate_matter_cache(MATTER_ID)
-
-        assert count == 2
-        mock_redis.delete.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_invalidate_uses_correct_pattern(
+    async def test_entries_after_invalidation_use_new_generation(
         self,
         repository: QueryCacheRepository,
         mock_redis: AsyncMock,
+        sample_cached_result: CachedQueryResult,
     ) -> None:
-        """Should use correct SCAN pattern."""
-        mock_redis.scan.return_value = (0, [])
+        """Reads and writes after a bump must not see old-generation keys."""
+        await repository.set_cached_result(sample_cached_result)
+        old_key = mock_redis.setex.call_args[0][0]
 
+        mock_redis.incr.return_value = 1
         await repository.invalidate_matter_cache(MATTER_ID)
+        await repository.get_cached_result(MATTER_ID, QUERY_HASH)
 
-        call_args = mock_redis.scan.call_args
-        assert call_args[1]["match"] == f"cache:query:{MATTER_ID}:*"
+        new_key = mock_redis.get.call_args[0][0]
+        assert old_key == f"cache:query:{MATTER_ID}:g0:{QUERY_HASH}"
+        assert new_key == f"cache:query:{MATTER_ID}:g1:{QUERY_HASH}"
 
     @pytest.mark.asyncio
-    async def test_invalidate_handles_pagination(
+    async def test_generation_memoized_in_process(
         self,
         repository: QueryCacheRepository,
         mock_redis: AsyncMock,
     ) -> None:
-        """Should handle SCAN pagination correctly."""
-        # First batch returns cursor=1, second returns cursor=0 (done)
-        mock_redis.scan.side_effect = [
-            (1, [f"cache:query:{MATTER_ID}:{QUERY_HASH}"]),
-            (0, [f"cache:query:{MATTER_ID}:{QUERY_HASH_2}"]),
-        ]
-        mock_redis.delete.return_value = 1
+        """Generation should be read from Redis once within the local TTL."""
+        mock_redis.get.side_effect = lambda key: "5" if ":gen:" in key else None
 
-        count = await repository.invalidate_matter_cache(MATTER_ID)
+        await repository.get_cached_result(MATTER_ID, QUERY_HASH)
+        await repository.get_cached_result(MATTER_ID, QUERY_HASH_2)
 
-        assert count == 2
-        assert mock_redis.scan.call_count == 2
-        assert mock_redis.delete.call_count == 2
+        keys = [call.args[0] for call in mock_redis.get.call_args_list]
+        assert keys == [
+            f"matter:{MATTER_ID}:gen:query",
+            f"cache:query:{MATTER_ID}:g5:{QUERY_HASH}",
+            f"cache:query:{MATTER_ID}:g5:{QUERY_HASH_2}",
+        ]
 
 
 class TestTTLExpiry:
@@ -499,7 +490,7 @@ class TestErrorHandling:
         mock_redis: AsyncMock,
     ) -> None:
         """Should raise RuntimeError on Redis failure."""
-        mock_redis.scan.side_effect = Exception("Redis connection failed")
+        mock_redis.incr.side_effect = Exception("Redis connection failed")
 
         with pytest.raises(RuntimeError, match="Failed to invalidate matter cache"):
             await repository.invalidate_matter_cache(MATTER_ID)
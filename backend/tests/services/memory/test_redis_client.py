@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from app.services.memory.redis_client import (
+    create_redis_client,
     get_redis_client,
     reset_redis_client,
 )
@@ -100,6 +101,23 @@ class TestRedisClient:
                     "redis://localhost:6379/0", decode_responses=True
                 )
 
+    @pytest.mark.asyncio
+    async def test_create_redis_client_is_separate_from_singleton(self) -> None:
+        """Each call should build a new client without replacing the shared one."""
+        with (
+            patch.dict(os.environ, {"REDIS_URL": "redis://localhost:6379/0"}, clear=True),
+            patch("redis.asyncio.from_url") as mock_from_url,
+        ):
+            mock_from_url.side_effect = lambda *args, **kwargs: MagicMock()
+
+            shared = await get_redis_client()
+            own1 = create_redis_client()
+            own2 = create_redis_client()
+
+            assert own1 is not own2
+            assert shared not in (own1, own2)
+            assert await get_redis_client() is shared
+
     def test_reset_redis_client(self) -> None:
         """Reset should clear the singleton."""
         # This test verifies the reset function exists and runs
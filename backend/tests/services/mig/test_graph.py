@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from app.models.entity import (
+    EntityEdgeCreate,
     EntityExtractionResult,
     EntityType,
     ExtractedEntity,
@@ -12,6 +13,10 @@ from app.models.entity import (
     RelationshipType,
 )
 from app.services.mig.graph import (
+    ALIAS_CLUSTER_CACHE_TTL,
+    EDGE_CONFLICT_COLUMNS,
+    EDGE_INSERT_BATCH_SIZE,
+    MENTION_COUNT_BATCH_SIZE,
     MIGGraphError,
     MIGGraphService,
     MIGNotFoundError,
@@ -280,6 +285,393 @@ class TestMIGGraphServiceSaveEntities:
         # In practice, this would be better tested as an integration test
 
 
+class _FakeMentionCountDB:
+    """Applies increment_entity_mention_counts RPCs to in-memory rows."""
+
+    def __init__(self, counts: dict[str, int]) -> None:
+        self.counts = dict(counts)
+        self.calls = 0
+
+    def rpc(self, name: str, params: dict) -> MagicMock:
+        assert name == "increment_entity_mention_counts"
+        self.calls += 1
+        rows = []
+        for entity_id, increment in zip(
+            params["p_entity_ids"], params["p_increments"], strict=True
+        ):
+            if entity_id not in self.counts:
+                continue
+            self.counts[entity_id] += increment
+            rows.append(
+                {
+                    "id": entity_id,
+                    "matter_id": params["p_matter_id"],
+                    "canonical_name": entity_id,
+                    "entity_type": "PERSON",
+                    "metadata": {},
+                    "mention_count": self.counts[entity_id],
+                    "aliases": [],
+                    "created_at": "2024-01-15T10:30:00+00:00",
+                    "updated_at": "2024-01-15T10:30:00+00:00",
+                }
+            )
+        result = MagicMock()
+        result.execute.return_value = MagicMock(data=rows)
+        return result
+
+
+class TestMIGGraphServiceMentionCounts:
+    """Tests for batched mention-count increments."""
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_batch_uses_one_rpc_and_returns_updated_nodes(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """A batch should be one round trip returning the updated rows."""
+        db = _FakeMentionCountDB({"e1": 5, "e2": 0})
+        mock_get_client.return_value = db
+
+        service = MIGGraphService()
+        nodes = await service._batch_update_mention_counts(
+            matter_id="matter-123",
+            updates=[("e1", 3), ("e2", 1), ("missing", 2)],
+        )
+
+        assert db.calls == 1
+        assert {n.id: n.mention_count for n in nodes} == {"e1": 8, "e2": 1}
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_sends_deltas_without_reading_counts(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """Increments should reach the RPC as deltas, never as read-modify-write."""
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value = MagicMock(data=[])
+        mock_get_client.return_value = mock_client
+
+        service = MIGGraphService()
+        updates = [(f"e{i}", i % 3 + 1) for i in range(MENTION_COUNT_BATCH_SIZE + 2)]
+        await service._batch_update_mention_counts("matter-123", updates)
+        await service.increment_mention_count("e0", "matter-123", increment=4)
+
+        payloads = [c.args for c in mock_client.rpc.call_args_list]
+        assert [name for name, _ in payloads] == ["increment_entity_mention_counts"] * 3
+        assert payloads[0][1] == {
+            "p_matter_id": "matter-123",
+            "p_entity_ids": [e for e, _ in updates[:MENTION_COUNT_BATCH_SIZE]],
+            "p_increments": [n for _, n in updates[:MENTION_COUNT_BATCH_SIZE]],
+        }
+        assert payloads[1][1]["p_entity_ids"] == [
+            e for e, _ in updates[MENTION_COUNT_BATCH_SIZE:]
+        ]
+        assert payloads[1][1]["p_increments"] == [
+            n for _, n in updates[MENTION_COUNT_BATCH_SIZE:]
+        ]
+        assert payloads[2][1] == {
+            "p_matter_id": "matter-123",
+            "p_entity_ids": ["e0"],
+            "p_increments": [4],
+        }
+        mock_client.table.assert_not_called()
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_rpc_failure_returns_no_nodes(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """A failed batch should be logged and skipped, not raised."""
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.side_effect = Exception("timeout")
+        mock_get_client.return_value = mock_client
+
+        service = MIGGraphService()
+        nodes = await service._batch_update_mention_counts(
+            matter_id="matter-123",
+            updates=[("e1", 1)],
+        )
+
+        assert nodes == []
+
+
+def _edge_row(row: dict, edge_id: str = "edge-1") -> dict:
+    return {**row, "id": edge_id, "created_at": "2024-01-15T10:30:00+00:00"}
+
+
+class TestMIGGraphServiceSaveEdges:
+    """Tests for batched, conflict-ignoring edge inserts."""
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_inserts_in_one_statement_ignoring_duplicates(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """Edges should be upserted with DO NOTHING on the natural key."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        upsert = mock_client.table.return_value.upsert
+        # Only the first edge is new; the database skips the existing one
+        upsert.side_effect = lambda rows, **kwargs: MagicMock(
+            execute=MagicMock(return_value=MagicMock(data=[_edge_row(rows[0])]))
+        )
+
+        edges = [
+            EntityEdgeCreate(
+                matter_id="matter-123",
+                source_entity_id="a",
+                target_entity_id=target,
+                relationship_type=RelationshipType.HAS_ROLE,
+            )
+            for target in ("b", "c", "b")
+        ]
+
+        service = MIGGraphService()
+        saved = await service.save_edges(matter_id="matter-123", edges=edges)
+
+        upsert.assert_called_once()
+        rows = upsert.call_args.args[0]
+        assert [r["target_node_id"] for r in rows] == ["b", "c"]
+        assert upsert.call_args.kwargs == {
+            "on_conflict": EDGE_CONFLICT_COLUMNS,
+            "ignore_duplicates": True,
+        }
+        assert [e.target_entity_id for e in saved] == ["b"]
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches_and_retries_failed_chunk_row_by_row(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """A failed chunk is retried per edge so only the bad edge is lost."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+
+        def upsert(rows, **kwargs):
+            query = MagicMock()
+            if any(r["target_node_id"] == "t-bad" for r in rows):
+                query.execute.side_effect = Exception("invalid target")
+            else:
+                query.execute.return_value = MagicMock(data=rows)
+            return query
+
+        mock_client.table.return_value.upsert.side_effect = upsert
+
+        targets = [f"t-{i}" for i in range(EDGE_INSERT_BATCH_SIZE + 1)]
+        targets[3] = "t-bad"
+        edges = [
+            EntityEdgeCreate(
+                matter_id="matter-123",
+                source_entity_id="a",
+                target_entity_id=target,
+                relationship_type=RelationshipType.RELATED_TO,
+            )
+            for target in targets
+        ]
+
+        service = MIGGraphService()
+        with patch.object(service, "_db_row_to_entity_edge", side_effect=lambda r: r):
+            saved = await service.save_edges(matter_id="matter-123", edges=edges)
+
+        calls = mock_client.table.return_value.upsert.call_args_list
+        # Failed chunk, one retry per edge in it, then the second chunk
+        assert [len(c.args[0]) for c in calls] == (
+            [EDGE_INSERT_BATCH_SIZE] + [1] * EDGE_INSERT_BATCH_SIZE + [1]
+        )
+        assert [r["target_node_id"] for r in saved] == [
+            t for t in targets if t != "t-bad"
+        ]
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_create_alias_edge_returns_none_for_existing_edge(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """An alias edge that already exists should return None without raising."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.table.return_value.upsert.return_value.execute.return_value = (
+            MagicMock(data=[])
+        )
+
+        service = MIGGraphService()
+        edge = await service.create_alias_edge(
+            matter_id="matter-123",
+            source_id="a",
+            target_id="b",
+            confidence=0.9,
+        )
+
+        assert edge is None
+        rows = mock_client.table.return_value.upsert.call_args.args[0]
+        assert rows[0]["relationship_type"] == RelationshipType.ALIAS_OF.value
+
+
+def _node_row(node_id: str, mention_count: int = 1, matter_id: str = "matter-123") -> dict:
+    return {
+        "id": node_id,
+        "matter_id": matter_id,
+        "canonical_name": node_id.upper(),
+        "entity_type": "PERSON",
+        "metadata": {},
+        "mention_count": mention_count,
+        "aliases": [],
+        "created_at": "2024-01-15T10:30:00+00:00",
+        "updated_at": "2024-01-15T10:30:00+00:00",
+    }
+
+
+class _FakeAliasGraph:
+    """Serves get_alias_cluster from an ALIAS_OF edge list.
+
+    Stands in for the RPC so the service's caching and ordering can be
+    tested. The trigger-maintained clusters themselves are checked against
+    the edge table in tests/integration/test_alias_cluster_consistency.py.
+    """
+
+    def __init__(self, mention_counts: dict[str, int], edges: list[tuple[str, str]]):
+        self.mention_counts = mention_counts
+        self.edges = list(edges)
+        self.rpc_calls = 0
+
+    def component(self, entity_id: str) -> set[str]:
+        seen, stack = {entity_id}, [entity_id]
+        while stack:
+            node = stack.pop()
+            for a, b in self.edges:
+                for x, y in ((a, b), (b, a)):
+                    if x == node and y not in seen:
+                        seen.add(y)
+                        stack.append(y)
+        return seen
+
+    def rpc(self, name: str, params: dict) -> MagicMock:
+        assert name == "get_alias_cluster"
+        self.rpc_calls += 1
+        entity_id = params["p_entity_id"]
+        rows = []
+        if entity_id in self.mention_counts:
+            rows = sorted(
+                (_node_row(n, self.mention_counts[n]) for n in self.component(entity_id)),
+                key=lambda r: (-r["mention_count"], r["id"]),
+            )
+        result = MagicMock()
+        result.execute.return_value = MagicMock(data=rows)
+        return result
+
+
+class TestMIGGraphServiceAliasClusters:
+    """Tests for alias expansion through materialized clusters."""
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_expands_transitive_aliases_in_one_lookup(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """Aliases of aliases should be included without extra round trips."""
+        graph = _FakeAliasGraph({"a": 1, "b": 3, "c": 2, "d": 1}, [("a", "b"), ("b", "c")])
+        mock_get_client.return_value = graph
+
+        service = MIGGraphService()
+        aliases = await service.get_all_aliases("a", "matter-123")
+
+        assert {n.id for n in aliases} == graph.component("a") - {"a"}
+        assert graph.rpc_calls == 1
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_serves_cluster_members_from_matter_cache(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """Looking up every node should cost one RPC per cluster."""
+        counts = {n: i + 1 for i, n in enumerate("abcdefg")}
+        graph = _FakeAliasGraph(counts, [("a", "b"), ("c", "b"), ("d", "e"), ("f", "f")])
+        mock_get_client.return_value = graph
+
+        service = MIGGraphService()
+        for node in counts:
+            cluster = await service.get_alias_cluster(node, "matter-123")
+            assert {n.id for n in cluster} == graph.component(node)
+
+        # One lookup per cluster; members are served from the matter cache
+        assert graph.rpc_calls == 4
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_canonical_entity_is_most_mentioned_member(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """The canonical node should be the cluster's most mentioned member."""
+        graph = _FakeAliasGraph({"a": 1, "b": 3, "c": 7}, [("a", "b"), ("b", "c")])
+        mock_get_client.return_value = graph
+
+        service = MIGGraphService()
+
+        canonical = await service.get_canonical_entity("a", "matter-123")
+        assert canonical is not None
+        assert canonical.id == "c"
+        assert await service.get_canonical_entity("missing", "matter-123") is None
+
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_new_alias_edge_invalidates_matter_cache(
+        self, mock_get_client: MagicMock
+    ) -> None:
+        """Creating an alias edge should make the next lookup see the new cluster."""
+        graph = _FakeAliasGraph({"a": 1, "b": 1}, [])
+        mock_get_client.return_value = graph
+
+        def _upsert(rows, **kwargs):
+            graph.edges.extend((r["source_node_id"], r["target_node_id"]) for r in rows)
+            return MagicMock(
+                execute=MagicMock(
+                    return_value=MagicMock(
+                        data=[{**rows[0], "id": "edge-1", "created_at": "2024-01-15T10:30:00+00:00"}]
+                    )
+                )
+            )
+
+        graph.table = MagicMock()
+        graph.table.return_value.upsert.side_effect = _upsert
+
+        service = MIGGraphService()
+        assert await service.get_all_aliases("a", "matter-123") == []
+        assert await service.get_all_aliases("a", "matter-123") == []
+        assert graph.rpc_calls == 1
+
+        await service.create_alias_edge("matter-123", "a", "b", confidence=0.9)
+
+        assert [n.id for n in await service.get_all_aliases("a", "matter-123")] == ["b"]
+        assert graph.rpc_calls == 2
+
+    @patch("app.services.mig.graph.time.monotonic")
+    @patch("app.services.mig.graph.get_supabase_client")
+    @pytest.mark.asyncio
+    async def test_expired_clusters_are_refetched_and_pruned(
+        self, mock_get_client: MagicMock, mock_monotonic: MagicMock
+    ) -> None:
+        """Expired entries should be refetched, and pruned across matters."""
+        graph = _FakeAliasGraph({"a": 1, "b": 1, "c": 1}, [("a", "b")])
+        mock_get_client.return_value = graph
+        mock_monotonic.return_value = 1000.0
+
+        service = MIGGraphService()
+        await service.get_alias_cluster("a", "matter-1")
+        await service.get_alias_cluster("c", "matter-2")
+        await service.get_alias_cluster("b", "matter-1")
+        assert graph.rpc_calls == 2
+
+        # An edge written by another process shows up once the TTL passes
+        graph.edges.append(("b", "c"))
+        mock_monotonic.return_value = 1000.0 + ALIAS_CLUSTER_CACHE_TTL
+        cluster = await service.get_alias_cluster("a", "matter-1")
+
+        assert {n.id for n in cluster} == {"a", "b", "c"}
+        assert graph.rpc_calls == 3
+        assert set(service._alias_clusters) == {"matter-1"}
+        assert set(service._alias_clusters["matter-1"]) == {"a", "b", "c"}
+
+
 class TestMIGGraphServiceGetEntity:
     """Tests for MIGGraphService.get_entity method."""
 
@@ -1,10 +1,12 @@
 """Unit tests for the hybrid search service."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.services.rag.hybrid_search import (
+    SEMANTIC_SIMILARITY_THRESHOLD,
     HybridSearchResult,
     HybridSearchService,
     HybridSearchServiceError,
@@ -12,6 +14,7 @@ from app.services.rag.hybrid_search import (
     RerankedSearchResultItem,
     SearchResult,
     SearchWeights,
+    reciprocal_rank_fusion,
 )
 
 
@@ -271,12 +274,179 @@ class TestHybridSearchServiceSearch:
             weights=custom_weights,
         )
 
-        # Check RPC was called with custom weights
+        # Both legs run as separate RPCs and are fused client-side
+        rpc_names = [c[0][0] for c in mock_client.rpc.call_args_list]
+        assert sorted(rpc_names) == ["bm25_search_chunks", "semantic_leg_search_chunks"]
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag.hybrid_search.get_supabase_client")
+    @patch("app.services.rag.hybrid_search.validate_search_results")
+    @patch("app.services.rag.hybrid_search.validate_namespace")
+    async def test_applies_custom_weights_in_fusion(
+        self,
+        mock_validate_ns: MagicMock,
+        mock_validate_results: MagicMock,
+        mock_get_client: MagicMock,
+    ) -> None:
+        """Should weight each leg's RRF contribution."""
+        mock_embedder = MagicMock()
+        mock_embedder.embed_text = AsyncMock(return_value=[0.1] * 1536)
+
+        rows = [
+            {
+                "id": "chunk-1",
+                "matter_id": "matter-1",
+                "document_id": "doc-1",
+                "content": "Test content",
+                "page_number": 1,
+                "chunk_type": "child",
+                "token_count": 100,
+                "row_num": 1,
+            }
+        ]
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value = MagicMock(data=rows)
+        mock_get_client.return_value = mock_client
+        mock_validate_results.return_value = rows
+
+        service = HybridSearchService(embedder=mock_embedder)
+        result = await service.search(
+            query="test",
+            matter_id="550e8400-e29b-41d4-a716-446655440000",
+            weights=SearchWeights(bm25=1.5, semantic=0.5),
+        )
+
+        assert len(result.results) == 1
+        assert result.results[0].bm25_rank == 1
+        assert result.results[0].semantic_rank == 1
+        assert result.results[0].rrf_score == pytest.approx(1.5 / 61 + 0.5 / 61)
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag.hybrid_search.get_supabase_client")
+    @patch("app.services.rag.hybrid_search.validate_search_results")
+    @patch("app.services.rag.hybrid_search.validate_namespace")
+    async def test_bm25_leg_runs_concurrently_with_embedding(
+        self,
+        mock_validate_ns: MagicMock,
+        mock_validate_results: MagicMock,
+        mock_get_client: MagicMock,
+    ) -> None:
+        """BM25 RPC should start before the query embedding completes."""
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value = MagicMock(data=[])
+        mock_get_client.return_value = mock_client
+        mock_validate_results.return_value = []
+
+        bm25_started_during_embedding = False
+
+        async def slow_embed(text: str) -> list[float]:
+            nonlocal bm25_started_during_embedding
+            for _ in range(100):
+                names = [c[0][0] for c in mock_client.rpc.call_args_list]
+                if "bm25_search_chunks" in names:
+                    bm25_started_during_embedding = True
+                    break
+                await asyncio.sleep(0.01)
+            return [0.1] * 1536
+
+        mock_embedder = MagicMock()
+        mock_embedder.embed_text = AsyncMock(side_effect=slow_embed)
+
+        service = HybridSearchService(embedder=mock_embedder)
+        with patch.object(
+            service, "_check_embedding_status", AsyncMock(return_value=(0, 0, 0.0))
+        ):
+            await service.search(
+                query="test",
+                matter_id="550e8400-e29b-41d4-a716-446655440000",
+            )
+
+        assert bm25_started_during_embedding is True
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag.hybrid_search.get_supabase_client")
+    @patch("app.services.rag.hybrid_search.validate_search_results")
+    @patch("app.services.rag.hybrid_search.validate_namespace")
+    async def test_embedding_failure_reuses_bm25_leg(
+        self,
+        mock_validate_ns: MagicMock,
+        mock_validate_results: MagicMock,
+        mock_get_client: MagicMock,
+    ) -> None:
+        """Should return the in-flight BM25 leg without a second BM25 RPC."""
+        rows = [
+            {
+                "id": "chunk-1",
+                "matter_id": "matter-1",
+                "document_id": "doc-1",
+                "content": "BM25 result",
+                "page_number": 1,
+                "chunk_type": "child",
+                "token_count": 100,
+                "row_num": 1,
+                "rank": 0.5,
+            }
+        ]
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value = MagicMock(data=rows)
+        mock_get_client.return_value = mock_client
+        mock_validate_results.return_value = rows
+
+        mock_embedder = MagicMock()
+        mock_embedder.embed_text = AsyncMock(return_value=None)
+
+        service = HybridSearchService(embedder=mock_embedder)
+        result = await service.search(
+            query="test",
+            matter_id="550e8400-e29b-41d4-a716-446655440000",
+        )
+
+        assert result.search_mode == "bm25_fallback"
+        assert [r.id for r in result.results] == ["chunk-1"]
         mock_client.rpc.assert_called_once()
-        # RPC is called as rpc("function_name", {params_dict})
-        rpc_params = mock_client.rpc.call_args[0][1]  # Second positional arg
-        assert rpc_params["full_text_weight"] == 1.5
-        assert rpc_params["semantic_weight"] == 0.5
+        assert mock_client.rpc.call_args[0][0] == "bm25_search_chunks"
+
+
+    @pytest.mark.asyncio
+    @patch("app.services.rag.hybrid_search.validate_namespace")
+    async def test_incomplete_embeddings_serve_bm25_hits(
+        self,
+        mock_validate_ns: MagicMock,
+    ) -> None:
+        """Empty semantic leg with partial embeddings reports the fallback."""
+        bm25_hit = SearchResult(
+            id="chunk-1",
+            matter_id="matter-1",
+            document_id="doc-1",
+            content="BM25 result",
+            page_number=1,
+            bbox_ids=[],
+            chunk_type="child",
+            token_count=100,
+            bm25_rank=1,
+            semantic_rank=None,
+            rrf_score=0.0,
+        )
+        mock_embedder = MagicMock()
+        mock_embedder.embed_text = AsyncMock(return_value=[0.1] * 1536)
+
+        service = HybridSearchService(embedder=mock_embedder)
+        with (
+            patch.object(service, "_bm25_search_internal", AsyncMock(return_value=[bm25_hit])),
+            patch.object(service, "_semantic_search_internal", AsyncMock(return_value=[])),
+            patch.object(
+                service, "_check_embedding_status", AsyncMock(return_value=(10, 4, 40.0))
+            ),
+        ):
+            result = await service.search(
+                query="test",
+                matter_id="550e8400-e29b-41d4-a716-446655440000",
+            )
+
+        assert result.search_mode == "bm25_only"
+        assert [r.id for r in result.results] == ["chunk-1"]
+        assert result.embedding_completion_pct == 40.0
+        assert result.fallback_reason == "Embeddings 40% complete"
 
 
 class TestHybridSearchServiceBM25Search:
@@ -390,6 +560,7 @@ class TestHybridSearchServiceSemanticSearch:
         mock_client.rpc.assert_called_once()
         call_args = mock_client.rpc.call_args[0]
         assert call_args[0] == "semantic_search_chunks"
+        assert call_args[1]["similarity_threshold"] == SEMANTIC_SIMILARITY_THRESHOLD
 
 
 class TestHybridSearchServiceErrorHandling:
@@ -518,6 +689,38 @@ class TestRRFScoreCalculation:
         assert both > semantic_only
         assert both == bm25_only + semantic_only
 
+    def test_reciprocal_rank_fusion_merges_legs(self) -> None:
+        """Client-side fusion should match the RPC formula and dedupe by id."""
+
+        def make(chunk_id: str) -> SearchResult:
+            return SearchResult(
+                id=chunk_id,
+                matter_id="matter-1",
+                document_id="doc-1",
+                content=chunk_id,
+                page_number=1,
+                bbox_ids=None,
+                chunk_type="child",
+                token_count=10,
+                bm25_rank=None,
+                semantic_rank=None,
+                rrf_score=0.0,
+            )
+
+        fused = reciprocal_rank_fusion(
+            [make("a"), make("b")],
+            [make("b"), make("c")],
+            weights=SearchWeights(),
+            rrf_k=60,
+        )
+
+        assert [r.id for r in fused] == ["b", "a", "c"]
+        assert fused[0].bm25_rank == 2
+        assert fused[0].semantic_rank == 1
+        assert fused[0].rrf_score == pytest.approx(1 / 62 + 1 / 61)
+        assert fused[2].bm25_rank is None
+        assert fused[2].semantic_rank == 2
+
 
 class TestRerankedSearchResultItem:
     """Tests for RerankedSearchResultItem dataclass."""
@@ -766,7 +969,7 @@ class TestHybridSearchServiceSearchWithRerank:
         assert len(result.results) == 2
         # Results should be in RRF order (not reranked)
         assert result.results[0].id == "chunk-0"
-        assert result.results[0].rrf_score == 0.033
+        assert result.results[0].rrf_score == pytest.approx(2 / 61)
         # Relevance scores should be None (no reranking)
         assert result.results[0].relevance_score is None
         assert result.results[1].relevance_score is None
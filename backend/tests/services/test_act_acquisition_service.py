@@ -0,0 +1,234 @@
+"""Tests for concurrent, manifest-backed Act acquisition.
+
+Runs IndiaCodeClient against a local HTTP stub of India Code.
+
+Part of Act Validation and Auto-Fetching feature.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.engines.citation.india_code import IndiaCodeClient
+from app.services.act_acquisition_service import (
+    AcquisitionStatus,
+    ActAcquisitionRequest,
+    ActAcquisitionService,
+)
+from app.services.act_cache_service import CachedActEntry
+
+PDF_BYTES = b"%PDF-1.4 stub act"
+
+SEARCH_HTML = """
+<table class="table">
+  <tr><td><a href="/handle/123456789/555">The Stub Act, 1999</a></td></tr>
+</table>
+"""
+
+HANDLE_HTML = """
+<h1>The Stub Act, 1999</h1>
+<a href="/bitstream/123456789/555/1/A1999-55.pdf">View PDF</a>
+"""
+
+
+class _IndiaCodeStub(ThreadingHTTPServer):
+    """Serves search, handle and bitstream pages and records traffic."""
+
+    daemon_threads = True
+
+    def __init__(self, download_delay: float = 0.0):
+        super().__init__(("127.0.0.1", 0), _IndiaCodeStubHandler)
+        self.download_delay = download_delay
+        self.paths: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _IndiaCodeStubHandler(BaseHTTPRequestHandler):
+    server: _IndiaCodeStub
+
+    def log_message(self, *args) -> None:  # Keep test output quiet
+        pass
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        with self.server.lock:
+            self.server.paths.append(path)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            if path.startswith("/bitstream/"):
+                time.sleep(self.server.download_delay)
+                self._respond(200, PDF_BYTES, "application/pdf")
+            elif path.endswith("/simple-search"):
+                self._respond(200, SEARCH_HTML.encode(), "text/html")
+            elif path == "/handle/123456789/555":
+                self._respond(200, HANDLE_HTML.encode(), "text/html")
+            else:
+                self._respond(404, b"not found", "text/plain")
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def _respond(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _FakeActCache:
+    """In-memory stand-in for ActCacheService's manifest API."""
+
+    def __init__(self, cached: tuple[str, ...] = ()):
+        self.entries = {
+            name: CachedActEntry(
+                normalized_name=name,
+                storage_path=f"global/acts/{name}.pdf",
+                content_sha256=None,
+                file_size=10,
+                version=1,
+            )
+            for name in cached
+        }
+        self.cache_calls: list[str] = []
+
+    def get_entry(self, normalized_name: str) -> CachedActEntry | None:
+        return self.entries.get(normalized_name)
+
+    def cache_act(self, normalized_name, pdf_content, source_url=None, india_code_doc_id=None):
+        self.cache_calls.append(normalized_name)
+        path = f"global/acts/{normalized_name}.pdf"
+        self.entries[normalized_name] = CachedActEntry(
+            normalized_name=normalized_name,
+            storage_path=path,
+            content_sha256="hash",
+            file_size=len(pdf_content),
+            version=1,
+            source_url=source_url,
+            india_code_doc_id=india_code_doc_id,
+        )
+        return path
+
+
+@pytest.fixture
+def stub():
+    server = _IndiaCodeStub(download_delay=0.05)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(stub: _IndiaCodeStub, max_concurrent_per_host: int = 2) -> IndiaCodeClient:
+    client = IndiaCodeClient(
+        request_delay=0.0,
+        base_url=stub.base_url,
+        max_concurrent_per_host=max_concurrent_per_host,
+    )
+    client.enabled = True
+    client._known_acts = {
+        f"known_act_{i}": (str(100 + i), f"A{i}.pdf") for i in range(6)
+    }
+    return client
+
+
+class TestActAcquisitionService:
+    """Tests for ActAcquisitionService against the India Code stub."""
+
+    @pytest.mark.asyncio
+    async def test_cached_acts_make_no_requests(self, stub) -> None:
+        cache = _FakeActCache(cached=("known_act_0",))
+        service = ActAcquisitionService(cache_service=cache, concurrency=4)
+
+        async with _client(stub) as india_code:
+            results = await service.acquire_many(
+                [ActAcquisitionRequest("known_act_0")], india_code
+            )
+
+        assert results["known_act_0"].status == AcquisitionStatus.CACHED
+        assert results["known_act_0"].storage_path == "global/acts/known_act_0.pdf"
+        assert stub.paths == []
+
+    @pytest.mark.asyncio
+    async def test_fetches_concurrently_within_host_budget(self, stub) -> None:
+        cache = _FakeActCache()
+        service = ActAcquisitionService(cache_service=cache, concurrency=6)
+        requests = [ActAcquisitionRequest(f"known_act_{i}") for i in range(6)]
+
+        async with _client(stub, max_concurrent_per_host=2) as india_code:
+            results = await service.acquire_many(requests, india_code)
+
+        assert all(r.status == AcquisitionStatus.FETCHED for r in results.values())
+        assert results["known_act_3"].india_code_doc_id == "103"
+        assert results["known_act_3"].file_size == len(PDF_BYTES)
+        assert sorted(cache.cache_calls) == sorted(r.normalized_name for r in requests)
+        # Overlapping downloads, but never more than the per-host budget
+        assert stub.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_duplicate_requests_share_one_fetch(self, stub) -> None:
+        cache = _FakeActCache()
+        service = ActAcquisitionService(cache_service=cache, concurrency=4)
+
+        async with _client(stub) as india_code:
+            results = await service.acquire_many(
+                [ActAcquisitionRequest("known_act_1")] * 3, india_code
+            )
+
+        assert list(results) == ["known_act_1"]
+        assert stub.paths == ["/bitstream/123456789/101/1/A1.pdf"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_acquire_calls_are_coalesced(self, stub) -> None:
+        cache = _FakeActCache()
+        service = ActAcquisitionService(cache_service=cache, concurrency=4)
+
+        async with _client(stub) as india_code:
+            first, second = await asyncio.gather(
+                service.acquire(ActAcquisitionRequest("known_act_2"), india_code),
+                service.acquire(ActAcquisitionRequest("known_act_2"), india_code),
+            )
+
+        assert first.status == second.status == AcquisitionStatus.FETCHED
+        assert cache.cache_calls == ["known_act_2"]
+        assert len(stub.paths) == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_search(self, stub) -> None:
+        cache = _FakeActCache()
+        service = ActAcquisitionService(cache_service=cache, concurrency=4)
+
+        async with _client(stub) as india_code:
+            result = await service.acquire(
+                ActAcquisitionRequest("stub_act_1999", "The Stub Act", 1999),
+                india_code,
+            )
+
+        assert result.status == AcquisitionStatus.FETCHED
+        assert result.searched is True
+        assert result.used_known_mapping is False
+        assert result.india_code_doc_id == "555"
+        assert stub.paths[-1] == "/bitstream/123456789/555/1/A1999-55.pdf"
+
+    @pytest.mark.asyncio
+    async def test_unknown_act_without_name_is_not_found(self, stub) -> None:
+        cache = _FakeActCache()
+        service = ActAcquisitionService(cache_service=cache, concurrency=4)
+
+        async with _client(stub) as india_code:
+            result = await service.acquire(ActAcquisitionRequest("mystery_act"), india_code)
+
+        assert result.status == AcquisitionStatus.NOT_FOUND
+        assert result.is_available is False
+        assert stub.paths == []
@@ -0,0 +1,50 @@
+"""Tests for the global Act cache manifest.
+
+Part of Act Validation and Auto-Fetching feature.
+"""
+
+from unittest.mock import MagicMock
+
+from app.services.act_cache_service import MANIFEST_PAGE_SIZE, ActCacheService
+
+
+def _manifest_row(index: int) -> dict:
+    return {
+        "act_name_normalized": f"act_{index:05d}",
+        "storage_path": f"global/acts/act_{index:05d}.pdf",
+        "content_sha256": None,
+        "file_size": 1024,
+        "version": 1,
+    }
+
+
+def _paged_client(rows: list[dict]) -> MagicMock:
+    """Supabase client whose manifest query honours .range()."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.order.return_value
+
+    def _range(start: int, end: int) -> MagicMock:
+        page = MagicMock()
+        page.execute.return_value = MagicMock(data=rows[start:end + 1])
+        return page
+
+    query.range.side_effect = _range
+    return client
+
+
+class TestManifest:
+    """Tests for loading the manifest."""
+
+    def test_loads_every_page(self) -> None:
+        """Manifests larger than one page should load completely."""
+        client = _paged_client([_manifest_row(i) for i in range(MANIFEST_PAGE_SIZE + 5)])
+        service = ActCacheService(client=client)
+
+        names = service.list_cached_acts()
+
+        assert len(names) == MANIFEST_PAGE_SIZE + 5
+        query = client.table.return_value.select.return_value.order.return_value
+        assert [c.args for c in query.range.call_args_list] == [
+            (0, MANIFEST_PAGE_SIZE - 1),
+            (MANIFEST_PAGE_SIZE, 2 * MANIFEST_PAGE_SIZE - 1),
+        ]
@@ -215,6 +215,77 @@ class TestBoundingBoxService:
 
         assert exc_info.value.code == "DELETE_FAILED"
 
+    def test_replace_chunk_bounding_boxes(
+        self,
+        service: BoundingBoxService,
+        mock_client: MagicMock,
+    ) -> None:
+        """Should delete only the chunk's rows and save new boxes tagged by chunk."""
+        delete_eq = mock_client.table.return_value.delete.return_value.eq
+        delete_eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"id": "old-1"}]
+        )
+        mock_client.table.return_value.insert.return_value.execute.return_value = (
+            MagicMock(data=[{"id": "bbox-1"}])
+        )
+
+        boxes = [
+            OCRBoundingBox(
+                page=30, x=10.0, y=20.0, width=30.0, height=10.0,
+                text="Test", confidence=0.95,
+            ),
+        ]
+
+        result = service.replace_chunk_bounding_boxes(
+            document_id="doc-123",
+            matter_id="matter-456",
+            chunk_index=1,
+            bounding_boxes=boxes,
+        )
+
+        assert result == 1
+        delete_eq.assert_called_once_with("document_id", "doc-123")
+        delete_eq.return_value.eq.assert_called_once_with("ocr_chunk_index", 1)
+        records = mock_client.table.return_value.insert.call_args[0][0]
+        assert records[0]["ocr_chunk_index"] == 1
+        assert records[0]["page_number"] == 30
+
+    def test_replace_chunk_bounding_boxes_raises_on_delete_error(
+        self,
+        service: BoundingBoxService,
+        mock_client: MagicMock,
+    ) -> None:
+        """Should not insert when the chunk's old rows can't be deleted."""
+        delete_eq = mock_client.table.return_value.delete.return_value.eq
+        delete_eq.return_value.eq.return_value.execute.side_effect = Exception(
+            "Delete failed"
+        )
+
+        with pytest.raises(BoundingBoxServiceError) as exc_info:
+            service.replace_chunk_bounding_boxes("doc-123", "matter-456", 0, [])
+
+        assert exc_info.value.code == "DELETE_FAILED"
+        mock_client.table.return_value.insert.assert_not_called()
+
+    def test_delete_stale_bounding_boxes(
+        self,
+        service: BoundingBoxService,
+        mock_client: MagicMock,
+    ) -> None:
+        """Should delete untagged rows and rows from chunks beyond the current run."""
+        delete_eq = mock_client.table.return_value.delete.return_value.eq
+        delete_eq.return_value.or_.return_value.execute.return_value = MagicMock(
+            data=[{"id": "old-1"}, {"id": "old-2"}]
+        )
+
+        result = service.delete_stale_bounding_boxes("doc-123", chunk_count=3)
+
+        assert result == 2
+        delete_eq.assert_called_once_with("document_id", "doc-123")
+        delete_eq.return_value.or_.assert_called_once_with(
+            "ocr_chunk_index.is.null,ocr_chunk_index.gte.3"
+        )
+
 
 class TestBoundingBoxServiceClientNotConfigured:
     """Tests for when client is not configured."""
@@ -7,6 +7,7 @@ Test Categories:
 - Query building
 - Filtering
 - Pagination
+- Document filter (list_document_contradictions RPC, keyset cursors)
 - Sorting
 - Entity grouping
 - Error handling
@@ -20,6 +21,8 @@ from app.models.contradiction import ContradictionType, SeverityLevel
 from app.services.contradiction_list_service import (
     ContradictionListService,
     ContradictionListServiceError,
+    _decode_cursor,
+    _encode_cursor,
     get_contradiction_list_service,
 )
 
@@ -273,6 +276,186 @@ class TestPagination:
         assert response.meta.per_page == 100
 
 
+# =============================================================================
+# Document Filter Tests
+# =============================================================================
+
+
+def _document_rpc_row(index: int, total: int) -> dict:
+    """Row as returned by list_document_contradictions."""
+    return {
+        "id": f"contradiction-{index}",
+        "entity_id": "entity-123",
+        "entity_name": "Nirav Jobalia",
+        "contradiction_type": "amount_mismatch",
+        "severity": "high",
+        "explanation": "Amount conflict detected",
+        "confidence": 0.95,
+        "evidence": {"value_a": "500000", "value_b": "800000"},
+        "created_at": f"2026-01-15T10:{index:02d}:00+00:00",
+        "sort_key": "high",
+        "sort_created_at": f"2026-01-15T10:{index:02d}:00+00:00",
+        "statement_a_id": f"chunk-a{index}",
+        "statement_a_content": "The loan amount was Rs. 5 lakhs.",
+        "statement_a_page": 5,
+        "statement_a_document_id": "doc-1",
+        "statement_a_document_name": "Contract.pdf",
+        "statement_b_id": f"chunk-b{index}",
+        "statement_b_content": "The loan amount was Rs. 8 lakhs.",
+        "statement_b_page": 12,
+        "statement_b_document_id": "doc-2",
+        "statement_b_document_name": "Agreement.pdf",
+        "total_count": total,
+    }
+
+
+class TestDocumentFilter:
+    """Tests for document-filtered listing via list_document_contradictions."""
+
+    @pytest.mark.asyncio
+    async def test_single_rpc_returns_page_and_total(self, service):
+        """Should load rows, statement details and total in one call."""
+        rpc = service._supabase_client.rpc
+        rpc.return_value.execute.return_value = MagicMock(
+            data=[_document_rpc_row(i, total=45) for i in range(3)]
+        )
+
+        response = await service.get_all_contradictions(
+            matter_id="matter-123",
+            document_id="doc-1",
+            severity="HIGH",
+            per_page=2,
+            page=2,
+        )
+
+        rpc.assert_called_once()
+        name, params = rpc.call_args.args
+        assert name == "list_document_contradictions"
+        assert params["p_document_id"] == "doc-1"
+        assert params["p_severity"] == "high"
+        assert params["p_limit"] == 3
+        assert params["p_offset"] == 2
+        assert "p_after_id" not in params
+        service._supabase_client.table.assert_not_called()
+
+        assert response.meta.total == 45
+        assert response.meta.total_pages == 23
+        item = response.data[0].contradictions[0]
+        assert response.data[0].count == 2
+        assert item.statement_a.document_name == "Contract.pdf"
+        assert item.statement_b.page == 12
+        assert item.evidence_links[0].statement_id == "chunk-a0"
+        assert response.meta.next_cursor is not None
+
+    @pytest.mark.asyncio
+    async def test_cursor_continues_after_last_row(self, service):
+        """Should pass the previous page's last row as keyset position."""
+        rpc = service._supabase_client.rpc
+        rpc.return_value.execute.return_value = MagicMock(
+            data=[_document_rpc_row(i, total=3) for i in range(3)]
+        )
+        first = await service.get_all_contradictions(
+            matter_id="matter-123", document_id="doc-1", per_page=2
+        )
+
+        rpc.return_value.execute.return_value = MagicMock(
+            data=[_document_rpc_row(2, total=3)]
+        )
+        second = await service.get_all_contradictions(
+            matter_id="matter-123",
+            document_id="doc-1",
+            per_page=2,
+            cursor=first.meta.next_cursor,
+        )
+
+        params = rpc.call_args.args[1]
+        assert params["p_after_id"] == "contradiction-1"
+        assert params["p_after_sort_key"] == "high"
+        assert params["p_after_created_at"] == "2026-01-15T10:01:00+00:00"
+        assert second.meta.total == 3
+        assert second.meta.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_empty_page_keeps_total(self, service):
+        """Should report the total when the page itself is empty."""
+        service._supabase_client.rpc.return_value.execute.return_value = MagicMock(
+            data=[{"id": None, "total_count": 5}]
+        )
+
+        response = await service.get_all_contradictions(
+            matter_id="matter-123", document_id="doc-1", page=9
+        )
+
+        assert response.data == []
+        assert response.meta.total == 5
+
+    @pytest.mark.asyncio
+    async def test_no_matches_returns_empty(self, service):
+        """Should return an empty response when nothing matches."""
+        service._supabase_client.rpc.return_value.execute.return_value = MagicMock(
+            data=[{"id": None, "total_count": 0}]
+        )
+
+        response = await service.get_all_contradictions(
+            matter_id="matter-123", document_id="doc-1"
+        )
+
+        assert response.data == []
+        assert response.meta.total_pages == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_sort_defaults_to_severity_desc(self, service):
+        """Should normalize unknown sort fields like the unfiltered listing."""
+        rpc = service._supabase_client.rpc
+        rpc.return_value.execute.return_value = MagicMock(data=[])
+
+        await service.get_all_contradictions(
+            matter_id="matter-123",
+            document_id="doc-1",
+            sort_by="bogus",
+            sort_order="asc",
+        )
+
+        params = rpc.call_args.args[1]
+        assert params["p_sort_by"] == "severity"
+        assert params["p_descending"] is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises(self, service):
+        """Should reject malformed cursors with a 400 error."""
+        with pytest.raises(ContradictionListServiceError) as exc_info:
+            await service.get_all_contradictions(
+                matter_id="matter-123", document_id="doc-1", cursor="not-a-cursor"
+            )
+
+        assert exc_info.value.code == "INVALID_CURSOR"
+        assert exc_info.value.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_rpc_error_raises(self, service):
+        """Should wrap RPC failures in ContradictionListServiceError."""
+        service._supabase_client.rpc.return_value.execute.side_effect = Exception(
+            "Database error"
+        )
+
+        with pytest.raises(ContradictionListServiceError) as exc_info:
+            await service.get_all_contradictions(
+                matter_id="matter-123", document_id="doc-1"
+            )
+
+        assert exc_info.value.code == "QUERY_FAILED"
+
+    def test_cursor_round_trip(self):
+        """Cursor encoding should be reversible."""
+        row = _document_rpc_row(7, total=10)
+
+        assert _decode_cursor(_encode_cursor(row)) == (
+            "high",
+            "2026-01-15T10:07:00+00:00",
+            "contradiction-7",
+        )
+
+
 # =============================================================================
 # Entity Grouping Tests
 # =============================================================================
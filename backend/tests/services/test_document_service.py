@@ -17,6 +17,8 @@ from app.models.document import (
     DocumentType,
 )
 from app.services.document_service import (
+    DOCUMENT_SELECT_FIELDS,
+    PAGE_TEXT_BATCH_SIZE,
     DocumentNotFoundError,
     DocumentService,
     DocumentServiceError,
@@ -268,6 +270,107 @@ class TestGetDocument:
         assert exc_info.value.code == "GET_FAILED"
 
 
+class TestDocumentProjection:
+    """Tests for metadata-only reads and lazy text loading."""
+
+    def test_get_document_excludes_extracted_text(
+        self,
+        document_service: DocumentService,
+        mock_supabase_client: MagicMock,
+        sample_document_data: dict,
+    ) -> None:
+        """Default reads select metadata columns only."""
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{**sample_document_data, "extracted_text_length": 5000}]
+        )
+
+        result = document_service.get_document("doc-12345")
+
+        columns = mock_table.select.call_args.args[0]
+        assert columns == DOCUMENT_SELECT_FIELDS
+        assert "extracted_text," not in f"{columns},"
+        assert result.extracted_text is None
+        assert result.extracted_text_length == 5000
+
+    def test_get_document_include_text(
+        self,
+        document_service: DocumentService,
+        mock_supabase_client: MagicMock,
+        sample_document_data: dict,
+    ) -> None:
+        """include_text=True adds the extracted_text column."""
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{**sample_document_data, "extracted_text": "Full text"}]
+        )
+
+        result = document_service.get_document("doc-12345", include_text=True)
+
+        assert mock_table.select.call_args.args[0].endswith(", extracted_text")
+        assert result.extracted_text == "Full text"
+
+    def test_get_document_text_selects_text_only(
+        self,
+        document_service: DocumentService,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """Full text reads transfer only the extracted_text column."""
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"extracted_text": "Full text"}]
+        )
+
+        assert document_service.get_document_text("doc-12345") == "Full text"
+        mock_table.select.assert_called_once_with("extracted_text")
+
+    def test_get_document_text_not_found(
+        self,
+        document_service: DocumentService,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """Missing documents raise DocumentNotFoundError."""
+        mock_table = mock_supabase_client.table.return_value
+        mock_table.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+
+        with pytest.raises(DocumentNotFoundError):
+            document_service.get_document_text("missing")
+
+    def test_page_range_reads_bounding_boxes_in_batches(
+        self,
+        document_service: DocumentService,
+        mock_supabase_client: MagicMock,
+    ) -> None:
+        """Page-range text is assembled per page from paged bbox reads."""
+        first_batch = [{"page_number": 3, "text": "word"}] * PAGE_TEXT_BATCH_SIZE
+        second_batch = [{"page_number": 4, "text": "Last"}, {"page_number": 4, "text": None}]
+
+        query = MagicMock()
+        for method in ("select", "eq", "gte", "lte", "order", "range"):
+            getattr(query, method).return_value = query
+        query.execute.side_effect = [MagicMock(data=first_batch), MagicMock(data=second_batch)]
+        mock_supabase_client.table.return_value = query
+
+        text = document_service.get_document_text("doc-12345", page_start=3, page_end=4)
+
+        mock_supabase_client.table.assert_called_with("bounding_boxes")
+        query.gte.assert_called_with("page_number", 3)
+        query.lte.assert_called_with("page_number", 4)
+        # Total order, so batches neither skip nor repeat rows
+        assert [c.args[0] for c in query.order.call_args_list[:3]] == [
+            "page_number",
+            "reading_order_index",
+            "id",
+        ]
+        assert [c.args for c in query.range.call_args_list] == [
+            (0, PAGE_TEXT_BATCH_SIZE - 1),
+            (PAGE_TEXT_BATCH_SIZE, 2 * PAGE_TEXT_BATCH_SIZE - 1),
+        ]
+        page_3, page_4 = text.split("\n\n")
+        assert page_3 == " ".join(["word"] * PAGE_TEXT_BATCH_SIZE)
+        assert page_4 == "Last"
+
+
 class TestGetDocumentsByMatter:
     """Tests for get_documents_by_matter method."""
 
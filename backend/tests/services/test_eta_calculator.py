@@ -199,7 +199,7 @@ class TestGetActiveWorkerCount:
 
     @pytest.mark.asyncio
     async def test_fallback_on_service_error(self, mock_redis_client) -> None:
-        """Should fall back to Celery inspect on service error."""
+        """Should return the conservative default without inspecting Celery."""
         failing_service = MagicMock()
         failing_service.get_active_worker_count = AsyncMock(side_effect=Exception("Error"))
 
@@ -209,25 +209,25 @@ class TestGetActiveWorkerCount:
         )
 
         with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_inspector = MagicMock()
-            mock_inspector.active.return_value = {"worker1": [], "worker2": []}
-            mock_celery.control.inspect.return_value = mock_inspector
-
             count = await calc.get_active_worker_count()
 
-            assert count == 2
+            assert count == 2  # Conservative fallback
+            mock_celery.control.inspect.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_default_fallback_when_all_fail(self, mock_redis_client) -> None:
-        """Should return 2 as final fallback."""
+    async def test_uses_shared_service_when_not_injected(self, mock_redis_client) -> None:
+        """Should read the worker registry via the queue metrics singleton."""
         calc = ETACalculator(redis_client=mock_redis_client, queue_metrics_service=None)
+        shared_service = MagicMock()
+        shared_service.get_active_worker_count = AsyncMock(return_value=4)
 
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_celery.control.inspect.side_effect = Exception("Celery error")
-
+        with patch(
+            "app.services.queue_metrics_service.get_queue_metrics_service",
+            return_value=shared_service,
+        ):
             count = await calc.get_active_worker_count()
 
-            assert count == 2  # Conservative fallback
+        assert count == 4
 
 
 # =============================================================================
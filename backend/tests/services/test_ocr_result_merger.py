@@ -1045,3 +1045,65 @@ class TestPageNumberFieldAliases:
         # Both fields should be set
         assert result.bounding_boxes[0]["page"] == 10
         assert result.bounding_boxes[0]["page_number"] == 10
+
+
+class TestStitchResults:
+    """Tests for stitch_results (boxes already stored per chunk)."""
+
+    def _chunks(self):
+        merger = OCRResultMerger()
+        chunks = [
+            ChunkOCRResult(
+                chunk_index=0,
+                page_start=1,
+                page_end=25,
+                full_text="Chunk 0 text",
+                overall_confidence=0.9,
+                page_count=25,
+                bbox_count=120,
+            ),
+            ChunkOCRResult(
+                chunk_index=1,
+                page_start=26,
+                page_end=30,
+                full_text="Chunk 1 text",
+                overall_confidence=0.6,
+                page_count=5,
+                bbox_count=30,
+            ),
+        ]
+        for chunk in chunks:
+            chunk.checksum = merger.compute_chunk_checksum(chunk)
+        return chunks
+
+    def test_stitches_text_and_sums_bbox_counts(self):
+        """Text is joined in chunk order and box counts come from the chunks."""
+        chunks = self._chunks()
+
+        result = OCRResultMerger().stitch_results(list(reversed(chunks)), "doc-123")
+
+        assert result.full_text == "Chunk 0 text\n\nChunk 1 text"
+        assert result.bounding_boxes == []
+        assert result.total_bboxes == 150
+        assert result.page_count == 30
+        assert result.chunk_count == 2
+        assert result.overall_confidence == pytest.approx((0.9 * 25 + 0.6 * 5) / 30)
+
+    def test_text_change_fails_checksum(self):
+        """Checksum covers the chunk's text."""
+        chunks = self._chunks()
+        chunks[1].full_text = "Corrupted"
+
+        with pytest.raises(MergeValidationError) as exc:
+            OCRResultMerger().stitch_results(chunks, "doc-123")
+        assert exc.value.code == "CHECKSUM_MISMATCH"
+
+    def test_validates_page_ranges(self):
+        """Non-contiguous chunks are rejected as in merge_results."""
+        chunks = self._chunks()
+        chunks[1].page_start = 27
+        chunks[1].checksum = None
+
+        with pytest.raises(MergeValidationError) as exc:
+            OCRResultMerger().stitch_results(chunks, "doc-123")
+        assert exc.value.code == "PAGE_RANGE_INVALID"
@@ -0,0 +1,256 @@
+"""Unit tests for the worker-local PDF blob cache.
+
+Tests cover:
+- One download per storage path per host (hits, concurrent misses)
+- Content-addressed blob sharing across storage paths
+- LRU eviction under the byte budget
+- Atomic writes (failed downloads leave nothing behind)
+- Non-blocking cross-process file lock, removed once released
+- Index revalidation (TTL and blob size)
+- Memory-mapped reads and direct-download fallback
+"""
+
+import fcntl
+import hashlib
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import pdf_blob_cache
+from app.services.pdf_blob_cache import (
+    PDFBlobCache,
+    open_storage_pdf,
+    open_storage_pdf_blob,
+    read_storage_pdf,
+)
+from app.services.storage_service import StorageError
+
+PDF = b"%PDF-1.4 " + b"x" * 1000
+
+
+@pytest.fixture
+def cache(tmp_path) -> PDFBlobCache:
+    return PDFBlobCache(tmp_path / "cache", max_bytes=10_000)
+
+
+class TestPDFBlobCache:
+    """Tests for PDFBlobCache."""
+
+    def test_second_read_does_not_download(self, cache) -> None:
+        """A hit should be served from disk without calling fetch."""
+        fetch = MagicMock(return_value=PDF)
+
+        first = cache.get_path("matter/uploads/a.pdf", fetch)
+        second = cache.get_path("matter/uploads/a.pdf", fetch)
+
+        assert first == second
+        assert first.read_bytes() == PDF
+        fetch.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_identical_content_shares_blob(self, cache) -> None:
+        """Two storage paths with the same bytes share one blob."""
+        first = cache.get_path("matter/uploads/a.pdf", lambda: PDF)
+        second = cache.get_path("matter/uploads/b.pdf", lambda: PDF)
+
+        assert first == second
+        assert cache.total_bytes() == len(PDF)
+
+    def test_concurrent_misses_download_once(self, cache) -> None:
+        """Parallel readers of the same document wait for one download."""
+        calls = 0
+
+        def slow_fetch() -> bytes:
+            nonlocal calls
+            calls += 1
+            time.sleep(0.05)
+            return PDF
+
+        threads = [
+            threading.Thread(target=cache.get_path, args=("matter/uploads/a.pdf", slow_fetch))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == 1
+
+    def test_file_lock_waits_for_other_process(self, cache) -> None:
+        """A miss should poll the file lock and proceed once it is released."""
+        key = hashlib.sha256(b"matter/uploads/a.pdf").hexdigest()
+        fetch = MagicMock(return_value=PDF)
+        with open(cache.root / "locks" / f"{key}.lock", "a") as holder:
+            # flock is per open file, so this stands in for another worker
+            fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+            reader = threading.Thread(
+                target=cache.get_path, args=("matter/uploads/a.pdf", fetch)
+            )
+            reader.start()
+            time.sleep(0.2)
+            assert reader.is_alive()
+            fetch.assert_not_called()
+            fcntl.flock(holder.fileno(), fcntl.LOCK_UN)
+        reader.join(timeout=5)
+
+        assert not reader.is_alive()
+        fetch.assert_called_once()
+
+    def test_file_lock_timeout_proceeds_unlocked(self, cache, monkeypatch) -> None:
+        """A lock that is never released should not hang the worker."""
+        monkeypatch.setattr(pdf_blob_cache, "FILE_LOCK_TIMEOUT_SECONDS", 0.1)
+        key = hashlib.sha256(b"matter/uploads/a.pdf").hexdigest()
+        with open(cache.root / "locks" / f"{key}.lock", "a") as holder:
+            fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+            blob = cache.get_path("matter/uploads/a.pdf", lambda: PDF)
+
+        assert blob.read_bytes() == PDF
+
+    def test_lru_eviction(self, tmp_path) -> None:
+        """Least recently used blobs are evicted once over budget."""
+        cache = PDFBlobCache(tmp_path / "cache", max_bytes=2500)
+        blob_a = cache.get_path("a.pdf", lambda: b"A" * 1000)
+        blob_b = cache.get_path("b.pdf", lambda: b"B" * 1000)
+        os.utime(blob_a, (1, 1))
+        os.utime(blob_b, (2, 2))
+
+        # Touch A so B becomes least recently used
+        cache.get_path("a.pdf", MagicMock())
+        blob_c = cache.get_path("c.pdf", lambda: b"C" * 1000)
+
+        assert blob_a.exists()
+        assert not blob_b.exists()
+        assert blob_c.exists()
+        assert cache.total_bytes() <= 2500
+
+        # Evicted documents are downloaded again
+        fetch = MagicMock(return_value=b"B" * 1000)
+        cache.get_path("b.pdf", fetch)
+        fetch.assert_called_once()
+
+    def test_failed_download_leaves_no_partial_blob(self, cache) -> None:
+        """A fetch error must not publish anything."""
+
+        def failing_fetch() -> bytes:
+            raise StorageError("boom", code="DOWNLOAD_FAILED")
+
+        with pytest.raises(StorageError):
+            cache.get_path("matter/uploads/a.pdf", failing_fetch)
+
+        assert cache.total_bytes() == 0
+        assert not any(p.is_file() for p in (cache.root / "blobs").rglob("*"))
+
+    def test_expired_index_entry_downloads_again(self, cache) -> None:
+        """A storage path older than the index TTL is fetched again."""
+        cache.get_path("matter/uploads/a.pdf", lambda: PDF)
+        key = hashlib.sha256(b"matter/uploads/a.pdf").hexdigest()
+        expired = time.time() - cache.index_ttl_seconds - 1
+        os.utime(cache.root / "index" / key, (expired, expired))
+
+        rewritten = b"%PDF-1.4 rewritten"
+        blob = cache.get_path("matter/uploads/a.pdf", lambda: rewritten)
+
+        assert blob.read_bytes() == rewritten
+        assert cache.misses == 2
+
+    def test_blob_size_mismatch_downloads_again(self, cache) -> None:
+        """A blob that no longer has the indexed size is not served."""
+        blob = cache.get_path("matter/uploads/a.pdf", lambda: PDF)
+        blob.write_bytes(PDF[:10])
+
+        fetch = MagicMock(return_value=PDF)
+        cache.get_path("matter/uploads/a.pdf", fetch)
+
+        fetch.assert_called_once()
+
+    def test_locks_are_removed_after_use(self, cache) -> None:
+        """Neither lock table entries nor lock files outlive a download."""
+        threads = [
+            threading.Thread(target=cache.get_path, args=(f"{i % 3}.pdf", lambda: PDF))
+            for i in range(9)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache._key_locks == {}
+        assert list((cache.root / "locks").iterdir()) == []
+
+    def test_file_lock_stays_exclusive_when_files_are_removed(self, cache) -> None:
+        """Waiters that locked a deleted lock file lock the current one instead."""
+        inside = 0
+        overlaps = 0
+
+        def hold(worker: PDFBlobCache) -> None:
+            nonlocal inside, overlaps
+            for _ in range(10):
+                with worker._file_lock("key"):
+                    inside += 1
+                    overlaps += inside > 1
+                    time.sleep(0.02)
+                    inside -= 1
+
+        # flock is per open file, so each cache stands in for a worker process
+        threads = [
+            threading.Thread(target=hold, args=(PDFBlobCache(cache.root, max_bytes=10_000),))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert overlaps == 0
+        assert not (cache.root / "locks" / "key.lock").exists()
+
+    def test_open_mmap_reads_content(self, cache) -> None:
+        """The mapping is sliceable and file-like."""
+        with cache.open_mmap("matter/uploads/a.pdf", lambda: PDF) as pdf:
+            assert pdf[:5] == b"%PDF-"
+            pdf.seek(0)
+            assert pdf.read() == PDF
+
+
+class TestStorageHelpers:
+    """Tests for the storage-facing helpers."""
+
+    def test_open_storage_pdf_downloads_once(self, isolated_pdf_blob_cache) -> None:
+        """Stages on the same host share a single Storage download."""
+        storage = MagicMock()
+        storage.download_file.return_value = PDF
+
+        with open_storage_pdf(storage, "matter/uploads/a.pdf") as pdf:
+            assert pdf[:5] == b"%PDF-"
+        assert read_storage_pdf(storage, "matter/uploads/a.pdf") == PDF
+
+        storage.download_file.assert_called_once_with("matter/uploads/a.pdf")
+
+    def test_open_storage_pdf_blob_yields_content_hash(
+        self, isolated_pdf_blob_cache
+    ) -> None:
+        """The blob's content address is handed out so callers skip hashing."""
+        storage = MagicMock()
+        storage.download_file.return_value = PDF
+
+        with open_storage_pdf_blob(storage, "matter/uploads/a.pdf") as (pdf, sha256):
+            assert pdf[:] == PDF
+            assert sha256 == hashlib.sha256(PDF).hexdigest()
+
+    def test_falls_back_to_download_without_cache(self, monkeypatch) -> None:
+        """A disabled cache downloads directly."""
+        from app.services import pdf_blob_cache
+
+        monkeypatch.setattr(pdf_blob_cache, "get_pdf_blob_cache", lambda: None)
+        storage = MagicMock()
+        storage.download_file.return_value = PDF
+
+        with open_storage_pdf(storage, "matter/uploads/a.pdf") as pdf:
+            assert pdf == PDF
+        with open_storage_pdf_blob(storage, "matter/uploads/a.pdf") as (pdf, sha256):
+            assert pdf == PDF
+            assert sha256 is None
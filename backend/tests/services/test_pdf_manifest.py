@@ -0,0 +1,225 @@
+"""Tests for the parse-once PDF manifest.
+
+Covers:
+- Building and JSON round-trip
+- Page loading by reference with inherited attributes
+- Detecting a manifest that does not match its PDF (size or content)
+- Split equivalence with and without a manifest (PDFChunker, extract_page_range)
+- Routing page counts taken from a manifest
+"""
+
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from pypdf import PdfReader, PdfWriter
+
+from app.services.pdf_chunker import PDFChunker
+from app.services.pdf_manifest import (
+    MANIFEST_VERSION,
+    PDFManifest,
+    PDFManifestError,
+    build_pdf_manifest,
+    extract_page_range,
+    load_page,
+    open_reader,
+    page_getter,
+)
+from app.services.pdf_router import PDFRouter
+
+
+def _raw_pdf(page_count: int) -> bytes:
+    """Build a PDF whose pages inherit /MediaBox and /Resources from /Pages.
+
+    Each page has its own content stream drawing "Page N".
+    """
+    objects: list[bytes] = []
+    page_ids = [3 + 2 * i for i in range(page_count)]
+    font_id = 3 + 2 * page_count
+
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+    objects.append(
+        b"<< /Type /Pages /Kids [" + kids + b"] /Count %d"
+        b" /MediaBox [0 0 300 400] /Resources << /Font << /F1 %d 0 R >> >> >>"
+        % (page_count, font_id)
+    )
+    for i, pid in enumerate(page_ids):
+        stream = b"BT /F1 12 Tf 20 300 Td (Page %d) Tj ET" % (i + 1)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % (pid + 1))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref_offset = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objects) + 1, xref_offset)
+    )
+    return out.getvalue()
+
+
+def _page_texts(pdf_bytes: bytes) -> list[str]:
+    return [page.extract_text().strip() for page in PdfReader(BytesIO(pdf_bytes)).pages]
+
+
+@pytest.fixture
+def raw_pdf() -> bytes:
+    return _raw_pdf(40)
+
+
+class TestBuildManifest:
+    """Tests for build_pdf_manifest and serialization."""
+
+    def test_records_pages_and_ranges(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+
+        assert manifest.page_count == 40
+        assert manifest.file_size == len(raw_pdf)
+        assert [p.page_number for p in manifest.pages] == list(range(1, 41))
+        first = manifest.pages[0]
+        assert raw_pdf[first.byte_start:first.byte_end].startswith(
+            b"%d 0 obj" % first.object_number
+        )
+
+    def test_content_hash_differs_per_page(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+
+        assert len({p.content_hash for p in manifest.pages}) == 40
+
+    def test_round_trip(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+
+        restored = PDFManifest.from_dict(manifest.to_dict())
+
+        assert restored == manifest
+
+    def test_from_dict_rejects_invalid(self):
+        assert PDFManifest.from_dict(None) is None
+        assert PDFManifest.from_dict({"version": MANIFEST_VERSION + 1}) is None
+        assert PDFManifest.from_dict({"version": MANIFEST_VERSION, "page_count": 1}) is None
+
+    def test_invalid_pdf_raises(self):
+        with pytest.raises(PDFManifestError):
+            build_pdf_manifest(b"%PDF-1.4\nnot really a pdf")
+
+
+class TestLoadPage:
+    """Tests for loading pages by reference."""
+
+    def test_inherits_mediabox_and_resources(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        reader = open_reader(raw_pdf)
+
+        page = load_page(reader, manifest.pages[4])
+
+        assert [float(v) for v in page.mediabox] == [0, 0, 300, 400]
+        assert "/Font" in page["/Resources"]
+        assert page.extract_text().strip() == "Page 5"
+
+    def test_wrong_object_raises(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        entry = manifest.pages[0]
+        entry.object_number = 1  # Catalog, not a page
+
+        with pytest.raises(PDFManifestError):
+            load_page(open_reader(raw_pdf), entry)
+
+    def test_getter_falls_back_on_wrong_object(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        manifest.pages[2].object_number = 1
+
+        get_page = page_getter(open_reader(raw_pdf), manifest)
+
+        assert get_page(2).extract_text().strip() == "Page 3"
+
+
+class TestManifestConsumers:
+    """Splitting with a manifest must match splitting without one."""
+
+    def test_extract_page_range_matches_full_parse(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+
+        with_manifest = extract_page_range(raw_pdf, 11, 25, manifest)
+        without_manifest = extract_page_range(raw_pdf, 11, 25)
+
+        expected = [f"Page {n}" for n in range(11, 26)]
+        assert _page_texts(with_manifest) == expected
+        assert _page_texts(without_manifest) == expected
+
+    def test_router_takes_page_count_from_manifest(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+
+        with patch("app.services.pdf_router.pypdf.PdfReader") as reader:
+            assert PDFRouter().get_page_count(raw_pdf, manifest) == 40
+        reader.assert_not_called()
+
+    def test_chunker_split_matches_full_parse(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        chunker = PDFChunker(enable_memory_tracking=False)
+
+        with_manifest = chunker.split_pdf(raw_pdf, 15, manifest)
+        without_manifest = chunker.split_pdf(raw_pdf, 15)
+
+        assert [(start, end) for _, start, end in with_manifest] == [
+            (1, 15),
+            (16, 30),
+            (31, 40),
+        ]
+        assert [_page_texts(chunk) for chunk, _, _ in with_manifest] == [
+            _page_texts(chunk) for chunk, _, _ in without_manifest
+        ]
+
+    def test_chunker_streaming_split_uses_manifest(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        chunker = PDFChunker(enable_memory_tracking=False)
+
+        with chunker.split_pdf_streaming(raw_pdf, 15, manifest) as result:
+            texts = [_page_texts(chunk) for chunk, _, _ in result.iter_chunk_bytes()]
+
+        assert texts[1] == [f"Page {n}" for n in range(16, 31)]
+
+    def test_mismatched_manifest_does_not_match(self, raw_pdf):
+        other = _raw_pdf(45)
+        manifest = build_pdf_manifest(other)
+
+        assert not manifest.matches(raw_pdf)
+
+    def test_same_size_different_content_does_not_match(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf)
+        # Same length, different page text
+        altered = raw_pdf.replace(b"(Page 1)", b"(Page X)")
+
+        assert len(altered) == manifest.file_size
+        assert manifest.matches(raw_pdf)
+        assert not manifest.matches(altered)
+
+    def test_known_hash_skips_hashing(self, raw_pdf):
+        manifest = build_pdf_manifest(raw_pdf, content_sha256="a" * 64)
+
+        assert manifest.file_sha256 == "a" * 64
+        with patch("app.services.pdf_manifest.hashlib.sha256") as sha256:
+            assert manifest.matches(raw_pdf, content_sha256="a" * 64)
+            assert not manifest.matches(raw_pdf, content_sha256="b" * 64)
+        sha256.assert_not_called()
+
+    def test_pypdf_writer_output_supported(self):
+        writer = PdfWriter()
+        for _ in range(3):
+            writer.add_blank_page(width=612, height=792)
+        buffer = BytesIO()
+        writer.write(buffer)
+        pdf_bytes = buffer.getvalue()
+
+        manifest = build_pdf_manifest(pdf_bytes)
+
+        assert manifest.page_count == 3
+        assert len(_page_texts(extract_page_range(pdf_bytes, 2, 3, manifest))) == 2
@@ -3,13 +3,16 @@
 Story 5.6: Queue Depth Visibility Dashboard
 
 Test Categories:
-- Queue depth retrieval from Redis
-- Worker count via Celery inspect
+- Queue depth retrieval from Redis (one pipelined snapshot)
+- Worker count and active tasks from the heartbeat registry
+- Snapshot caching
 - Health check endpoint
 - Alert threshold handling
 - Error handling
 """
 
+import json
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -22,14 +25,45 @@ from app.services.queue_metrics_service import (
     get_queue_metrics_service,
     reset_queue_metrics_service,
 )
+from app.services.worker_registry import (
+    WORKER_HEARTBEAT_INFO_KEY,
+    WORKER_HEARTBEATS_KEY,
+)
+
+
+def _heartbeat(hostname: str, concurrency: int = 50, **active_by_queue: int) -> str:
+    return json.dumps({
+        "hostname": hostname,
+        "concurrency": concurrency,
+        "active_tasks": sum(active_by_queue.values()),
+        "active_by_queue": active_by_queue,
+        "queues": ["default", "high", "low"],
+        "pid": 1,
+        "timestamp": time.time(),
+    })
+
+
+def _set_snapshot(redis, pending=(50, 50, 50), workers=None, live=None) -> MagicMock:
+    """Make the client's pipeline return queue depths and worker heartbeats.
+
+    Results follow the pipeline order: LLEN per queue, live hostnames,
+    heartbeat info hash.
+    """
+    workers = workers or {}
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(
+        return_value=[*pending, list(workers) if live is None else live, workers]
+    )
+    redis.pipeline.return_value = pipe
+    return pipe
 
 
 @pytest.fixture
 def mock_redis_client():
-    """Create mock Redis client."""
+    """Create mock Redis client (50 pending per queue, no workers)."""
     redis = MagicMock()
-    redis.llen = AsyncMock(return_value=50)
     redis.ping = AsyncMock(return_value=True)
+    _set_snapshot(redis)
     return redis
 
 
@@ -62,7 +96,7 @@ class TestGetQueueMetrics:
     @pytest.mark.asyncio
     async def test_returns_queue_metrics(self, queue_service, mock_redis_client) -> None:
         """Should return QueueMetricsData for a queue."""
-        mock_redis_client.llen = AsyncMock(return_value=25)
+        _set_snapshot(mock_redis_client, pending=(25, 0, 0))
 
         result = await queue_service.get_queue_metrics("default")
 
@@ -72,23 +106,33 @@ class TestGetQueueMetrics:
         assert result.alert_triggered is False
 
     @pytest.mark.asyncio
-    async def test_uses_correct_redis_key(self, queue_service, mock_redis_client) -> None:
-        """Should use correct Redis key for default queue (celery)."""
-        await queue_service.get_queue_metrics("default")
+    async def test_reads_all_queue_keys_in_one_pipeline(
+        self, queue_service, mock_redis_client
+    ) -> None:
+        """Should LLEN every Celery queue key and read the registry in one round trip."""
+        pipe = _set_snapshot(mock_redis_client)
+
+        await queue_service.get_queue_metrics("high")
 
-        mock_redis_client.llen.assert_called_with("celery")
+        llen_keys = [c.args[0] for c in pipe.llen.call_args_list]
+        assert llen_keys == ["celery", "high", "low"]
+        assert pipe.zrangebyscore.call_args.args[0] == WORKER_HEARTBEATS_KEY
+        pipe.hgetall.assert_called_once_with(WORKER_HEARTBEAT_INFO_KEY)
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_uses_queue_name_for_other_queues(self, queue_service, mock_redis_client) -> None:
-        """Should use queue name as Redis key for other queues."""
-        await queue_service.get_queue_metrics("high")
+        """Should map results back to logical queue names."""
+        _set_snapshot(mock_redis_client, pending=(1, 2, 3))
+
+        result = await queue_service.get_queue_metrics("high")
 
-        mock_redis_client.llen.assert_called_with("high")
+        assert result.pending_count == 2
 
     @pytest.mark.asyncio
     async def test_triggers_alert_above_threshold(self, queue_service, mock_redis_client) -> None:
         """Should trigger alert when pending >= threshold."""
-        mock_redis_client.llen = AsyncMock(return_value=100)
+        _set_snapshot(mock_redis_client, pending=(100, 0, 0))
 
         result = await queue_service.get_queue_metrics("default")
 
@@ -97,7 +141,7 @@ class TestGetQueueMetrics:
     @pytest.mark.asyncio
     async def test_no_alert_below_threshold(self, queue_service, mock_redis_client) -> None:
         """Should not trigger alert when pending < threshold."""
-        mock_redis_client.llen = AsyncMock(return_value=99)
+        _set_snapshot(mock_redis_client, pending=(99, 0, 0))
 
         result = await queue_service.get_queue_metrics("default")
 
@@ -106,13 +150,34 @@ class TestGetQueueMetrics:
     @pytest.mark.asyncio
     async def test_handles_redis_error(self, queue_service, mock_redis_client) -> None:
         """Should return 0 pending on Redis error."""
-        mock_redis_client.llen = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis_client.pipeline.return_value.execute = AsyncMock(
+            side_effect=Exception("Redis error")
+        )
 
         result = await queue_service.get_queue_metrics("default")
 
         assert result.pending_count == 0
         assert result.alert_triggered is False
 
+    @pytest.mark.asyncio
+    async def test_active_count_from_worker_heartbeats(
+        self, queue_service, mock_redis_client
+    ) -> None:
+        """Should sum executing tasks per queue across live workers."""
+        _set_snapshot(
+            mock_redis_client,
+            workers={
+                "w1@host": _heartbeat("w1@host", default=3, low=1),
+                "w2@host": _heartbeat("w2@host", default=2),
+            },
+        )
+
+        default = await queue_service.get_queue_metrics("default")
+        low = await queue_service.get_queue_metrics("low")
+
+        assert default.active_count == 5
+        assert low.active_count == 1
+
     @pytest.mark.asyncio
     async def test_trend_default_stable(self, queue_service) -> None:
         """Should return stable trend (MVP default)."""
@@ -143,21 +208,58 @@ class TestGetAllQueueMetrics:
         self, queue_service, mock_redis_client
     ) -> None:
         """Should continue if one queue fails."""
-        call_count = 0
-
-        async def conditional_error(*args):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise Exception("Redis error")
-            return 25
-
-        mock_redis_client.llen = conditional_error
+        _set_snapshot(mock_redis_client, pending=(Exception("Redis error"), 25, 25))
 
         result = await queue_service.get_all_queue_metrics()
 
         # Should still return all queues, first one with 0
         assert len(result) == len(QUEUE_REDIS_KEYS)
+        assert [m.pending_count for m in result] == [0, 25, 25]
+
+    @pytest.mark.asyncio
+    async def test_one_redis_round_trip_for_all_queues(
+        self, queue_service, mock_redis_client
+    ) -> None:
+        """Should serve all queues and the worker count from one snapshot."""
+        pipe = _set_snapshot(mock_redis_client)
+
+        await queue_service.get_all_queue_metrics()
+        await queue_service.get_active_worker_count()
+
+        pipe.execute.assert_awaited_once()
+
+
+# =============================================================================
+# Snapshot Caching Tests
+# =============================================================================
+
+
+class TestSnapshotCaching:
+    """Test cached snapshot behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_after_ttl(self, queue_service, mock_redis_client) -> None:
+        """Should read Redis again once the snapshot expires."""
+        pipe = _set_snapshot(mock_redis_client)
+
+        await queue_service.get_snapshot()
+        with patch(
+            "app.services.queue_metrics_service.SNAPSHOT_TTL_SECONDS", 0
+        ):
+            await queue_service.get_snapshot()
+
+        assert pipe.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_caches_failed_read(self, queue_service, mock_redis_client) -> None:
+        """Should not retry an unreachable Redis on every call."""
+        pipe = mock_redis_client.pipeline.return_value
+        pipe.execute = AsyncMock(side_effect=TimeoutError("Timeout reading from socket"))
+
+        await queue_service.get_all_queue_metrics()
+        await queue_service.get_active_worker_count()
+
+        pipe.execute.assert_awaited_once()
 
 
 # =============================================================================
@@ -166,45 +268,70 @@ class TestGetAllQueueMetrics:
 
 
 class TestGetActiveWorkerCount:
-    """Test worker count retrieval via Celery inspect."""
+    """Test worker count retrieval from the heartbeat registry."""
 
     @pytest.mark.asyncio
-    async def test_returns_worker_count(self, queue_service) -> None:
-        """Should return count of active workers."""
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_inspector = MagicMock()
-            mock_inspector.active.return_value = {
-                "worker1@host": [],
-                "worker2@host": [],
-                "worker3@host": [],
-            }
-            mock_celery.control.inspect.return_value = mock_inspector
+    async def test_returns_worker_count(self, queue_service, mock_redis_client) -> None:
+        """Should return count of live workers."""
+        _set_snapshot(
+            mock_redis_client,
+            workers={
+                "worker1@host": _heartbeat("worker1@host"),
+                "worker2@host": _heartbeat("worker2@host"),
+                "worker3@host": _heartbeat("worker3@host"),
+            },
+        )
 
-            count = await queue_service.get_active_worker_count()
+        count = await queue_service.get_active_worker_count()
 
-            assert count == 3
+        assert count == 3
 
     @pytest.mark.asyncio
-    async def test_returns_zero_when_none_response(self, queue_service) -> None:
-        """Should return 0 when inspect returns None."""
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_inspector = MagicMock()
-            mock_inspector.active.return_value = None
-            mock_celery.control.inspect.return_value = mock_inspector
+    async def test_ignores_workers_without_fresh_heartbeat(
+        self, queue_service, mock_redis_client
+    ) -> None:
+        """Should count only hostnames with a fresh score in the sorted set."""
+        _set_snapshot(
+            mock_redis_client,
+            workers={
+                "live@host": _heartbeat("live@host"),
+                "gone@host": _heartbeat("gone@host"),
+            },
+            live=["live@host"],
+        )
+
+        assert await queue_service.get_active_worker_count() == 1
 
+    @pytest.mark.asyncio
+    async def test_never_inspects_celery(self, queue_service) -> None:
+        """Should not broadcast to workers."""
+        with patch("app.workers.celery.celery_app") as mock_celery:
             count = await queue_service.get_active_worker_count()
 
             assert count == 0
+            mock_celery.control.inspect.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_returns_zero_on_error(self, queue_service) -> None:
-        """Should return 0 on Celery error."""
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_celery.control.inspect.side_effect = Exception("Celery error")
+    async def test_returns_zero_on_error(self, queue_service, mock_redis_client) -> None:
+        """Should return 0 when Redis can't be read."""
+        mock_redis_client.pipeline.side_effect = Exception("Redis error")
 
-            count = await queue_service.get_active_worker_count()
+        count = await queue_service.get_active_worker_count()
 
-            assert count == 0
+        assert count == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_capacity(self, queue_service, mock_redis_client) -> None:
+        """Should sum live workers' concurrency."""
+        _set_snapshot(
+            mock_redis_client,
+            workers={
+                "w1@host": _heartbeat("w1@host", concurrency=50),
+                "w2@host": _heartbeat("w2@host", concurrency=8),
+            },
+        )
+
+        assert await queue_service.get_worker_capacity() == 58
 
 
 # =============================================================================
@@ -219,34 +346,25 @@ class TestCheckHealth:
     async def test_healthy_when_redis_connected(self, queue_service, mock_redis_client) -> None:
         """Should report healthy when Redis connected and workers exist."""
         mock_redis_client.ping = AsyncMock(return_value=True)
+        _set_snapshot(mock_redis_client, workers={"worker1": _heartbeat("worker1")})
 
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_inspector = MagicMock()
-            mock_inspector.active.return_value = {"worker1": []}
-            mock_celery.control.inspect.return_value = mock_inspector
-
-            result = await queue_service.check_health()
+        result = await queue_service.check_health()
 
-            assert result["status"] == "healthy"
-            assert result["redisConnected"] is True
-            assert result["workerCount"] == 1
-            assert result["error"] is None
+        assert result["status"] == "healthy"
+        assert result["redisConnected"] is True
+        assert result["workerCount"] == 1
+        assert result["error"] is None
 
     @pytest.mark.asyncio
     async def test_degraded_when_no_workers(self, queue_service, mock_redis_client) -> None:
         """Should report degraded when Redis OK but no workers."""
         mock_redis_client.ping = AsyncMock(return_value=True)
 
-        with patch("app.workers.celery.celery_app") as mock_celery:
-            mock_inspector = MagicMock()
-            mock_inspector.active.return_value = {}
-            mock_celery.control.inspect.return_value = mock_inspector
-
-            result = await queue_service.check_health()
+        result = await queue_service.check_health()
 
-            assert result["status"] == "degraded"
-            assert result["redisConnected"] is True
-            assert result["workerCount"] == 0
+        assert result["status"] == "degraded"
+        assert result["redisConnected"] is True
+        assert result["workerCount"] == 0
 
     @pytest.mark.asyncio
     async def test_unhealthy_when_redis_down(self, queue_service, mock_redis_client) -> None:
@@ -278,24 +396,25 @@ class TestRedisConnection:
 
     @pytest.mark.asyncio
     async def test_creates_redis_client_if_none(self) -> None:
-        """Should create Redis client if not provided."""
+        """Should create Redis client with socket timeouts if not provided."""
         service = QueueMetricsService(redis_client=None)
 
         with patch("redis.asyncio.from_url") as mock_from_url:
             mock_client = MagicMock()
-            mock_client.llen = AsyncMock(return_value=10)
+            _set_snapshot(mock_client, pending=(10, 10, 10))
             mock_from_url.return_value = mock_client
 
             await service.get_queue_metrics("default")
 
             mock_from_url.assert_called_once()
+            assert mock_from_url.call_args.kwargs["socket_timeout"] is not None
 
     @pytest.mark.asyncio
     async def test_handles_ssl_for_upstash(self) -> None:
         """Should use SSL for rediss:// URLs."""
         with patch("redis.asyncio.from_url") as mock_from_url:
             mock_client = MagicMock()
-            mock_client.llen = AsyncMock(return_value=10)
+            _set_snapshot(mock_client, pending=(10, 10, 10))
             mock_from_url.return_value = mock_client
 
             # Create service with settings that have rediss URL
@@ -354,7 +473,7 @@ class TestAlertThreshold:
             redis_client=mock_redis_client,
             alert_threshold=50,
         )
-        mock_redis_client.llen = AsyncMock(return_value=50)
+        _set_snapshot(mock_redis_client, pending=(50, 0, 0))
 
         result = await service.get_queue_metrics("default")
 
@@ -367,7 +486,7 @@ class TestAlertThreshold:
             redis_client=mock_redis_client,
             alert_threshold=50,
         )
-        mock_redis_client.llen = AsyncMock(return_value=49)
+        _set_snapshot(mock_redis_client, pending=(49, 0, 0))
 
         result = await service.get_queue_metrics("default")
 
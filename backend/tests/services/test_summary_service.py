@@ -7,10 +7,12 @@ Test Categories:
 - Attention items
 - GPT-4 generation
 - Redis caching
+- Precomputed summaries (stored versions, section reuse)
 - Language policing
 """
 
 import json
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -19,8 +21,16 @@ from app.models.summary import (
     AttentionItemType,
     MatterStats,
     PartyRole,
+    SummaryStatus,
+)
+from app.services.summary_service import (
+    SUBJECT_MATTER_UNAVAILABLE,
+    SUMMARY_PENDING,
+    StoredSummary,
+    SummaryService,
+    _apply_review_state,
+    _fingerprint,
 )
-from app.services.summary_service import SummaryService
 
 
 @pytest.fixture
@@ -370,6 +380,416 @@ class TestSummaryCache:
         assert result is False
 
 
+# =============================================================================
+# Precomputed Summary Tests
+# =============================================================================
+
+
+def _make_summary(matter_id: str = "matter-123"):
+    from app.models.summary import (
+        CurrentStatus,
+        KeyIssue,
+        MatterSummary,
+        PartyInfo,
+        SubjectMatter,
+    )
+
+    return MatterSummary(
+        matter_id=matter_id,
+        attention_items=[],
+        parties=[
+            PartyInfo(
+                entity_id="entity-1",
+                entity_name="John Petitioner",
+                role=PartyRole.PETITIONER,
+                source_document="petition.pdf",
+                source_page=1,
+                is_verified=False,
+            )
+        ],
+        subject_matter=SubjectMatter(
+            description="Stored description",
+            sources=[],
+            is_verified=False,
+        ),
+        current_status=CurrentStatus(
+            last_order_date="2026-01-15T00:00:00Z",
+            description="Stored status",
+            source_document="order.pdf",
+            source_page=3,
+            is_verified=False,
+        ),
+        key_issues=[KeyIssue(id="issue-1", number=1, title="Stored issue")],
+        stats=MatterStats(),
+        generated_at=datetime.now(UTC).isoformat(),
+    )
+
+
+TOP_CHUNKS = [
+    {
+        "content": "Petition text",
+        "document_id": "doc-1",
+        "document_name": "petition.pdf",
+        "page_number": 1,
+    }
+]
+RECENT_EVENTS = [{"event_date": "2026-01-15", "description": "Order passed"}]
+SECTION_FINGERPRINTS = {
+    "subject_matter": _fingerprint(TOP_CHUNKS),
+    "key_issues": _fingerprint(TOP_CHUNKS),
+    "current_status": _fingerprint([TOP_CHUNKS, RECENT_EVENTS]),
+}
+
+
+@pytest.fixture
+def queued():
+    """Celery requests made by get_summary, recorded instead of sent."""
+    with (
+        patch(
+            "app.workers.tasks.summary_tasks.request_summary_precompute"
+        ) as precompute,
+        patch(
+            "app.workers.tasks.summary_tasks.request_live_sections_refresh"
+        ) as live_refresh,
+    ):
+        yield MagicMock(precompute=precompute, live_refresh=live_refresh)
+
+
+@pytest.fixture
+def precompute_service(queued):
+    """SummaryService with database reads, LLM calls and Celery mocked."""
+    service = SummaryService()
+    fresh = _make_summary()
+
+    service.get_stats = AsyncMock(return_value=MatterStats())
+    service.get_attention_items = AsyncMock(return_value=[])
+    service._get_verification_decisions = AsyncMock(return_value={})
+    service._get_top_chunks = AsyncMock(return_value=TOP_CHUNKS)
+    service._get_recent_events = AsyncMock(return_value=RECENT_EVENTS)
+    service.get_parties = AsyncMock(return_value=[])
+    service.generate_subject_matter = AsyncMock(return_value=fresh.subject_matter)
+    service.get_key_issues = AsyncMock(return_value=fresh.key_issues)
+    service.get_current_status = AsyncMock(return_value=fresh.current_status)
+    service._load_stored_summary = AsyncMock(return_value=None)
+    service._save_stored_summary = AsyncMock(return_value=1)
+    service._cache_summary = AsyncMock()
+    service._get_cached_summary = AsyncMock(return_value=None)
+
+    edit_service = MagicMock()
+    edit_service.get_all_edits = AsyncMock(return_value=[])
+    with patch(
+        "app.services.summary_service.get_summary_edit_service",
+        return_value=edit_service,
+    ):
+        yield service
+
+
+class TestPrecomputedSummary:
+    """Test stored summaries and fingerprint-gated regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_get_summary_reads_stored_version(self, precompute_service) -> None:
+        """Should serve the stored summary without generating anything."""
+        service = precompute_service
+        stored = _make_summary()
+        stored.version = 4
+        service._load_stored_summary.return_value = StoredSummary(stored, 4, {})
+
+        result = await service.get_summary("matter-123")
+
+        assert result.version == 4
+        assert result.subject_matter.description == "Stored description"
+        service.generate_subject_matter.assert_not_called()
+        service._cache_summary.assert_awaited_once_with("matter-123", stored)
+
+    @pytest.mark.asyncio
+    async def test_get_summary_queues_build_when_not_precomputed(
+        self, precompute_service, queued
+    ) -> None:
+        """Should queue a precompute and serve a pending partial summary."""
+        service = precompute_service
+        service.get_stats.return_value = MatterStats(total_pages=42)
+
+        result = await service.get_summary("matter-123")
+
+        assert result.status == SummaryStatus.PENDING
+        assert result.stats.total_pages == 42
+        assert result.subject_matter.description == SUMMARY_PENDING
+        queued.precompute.assert_called_once_with("matter-123")
+        service.generate_subject_matter.assert_not_called()
+        service._save_stored_summary.assert_not_called()
+        service._cache_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_force_refresh_queues_rebuild(
+        self, precompute_service, queued
+    ) -> None:
+        """Should queue a rebuild and serve the stored summary as refreshing."""
+        service = precompute_service
+        stored = _make_summary()
+        stored.version = 4
+        service._load_stored_summary.return_value = StoredSummary(stored, 4, {})
+
+        result = await service.get_summary("matter-123", force_refresh=True)
+
+        assert result.version == 4
+        assert result.status == SummaryStatus.REFRESHING
+        queued.precompute.assert_called_once_with("matter-123")
+        service._get_cached_summary.assert_not_called()
+        service.generate_subject_matter.assert_not_called()
+        service._save_stored_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reuses_sections_with_unchanged_inputs(
+        self, precompute_service
+    ) -> None:
+        """Should skip GPT-4 for sections whose fingerprint matches."""
+        service = precompute_service
+        service._load_stored_summary.return_value = StoredSummary(
+            _make_summary(), 2, dict(SECTION_FINGERPRINTS)
+        )
+        service._save_stored_summary.return_value = 3
+
+        result = await service.precompute_summary("matter-123")
+
+        service.generate_subject_matter.assert_not_called()
+        service.get_key_issues.assert_not_called()
+        service.get_current_status.assert_not_called()
+        assert result.version == 3
+        assert result.subject_matter.description == "Stored description"
+        assert service._save_stored_summary.call_args.kwargs["expected_version"] == 2
+
+    @pytest.mark.asyncio
+    async def test_regenerates_only_changed_sections(self, precompute_service) -> None:
+        """Should regenerate current status when only recent events changed."""
+        service = precompute_service
+        fingerprints = dict(SECTION_FINGERPRINTS)
+        fingerprints["current_status"] = "stale"
+        service._load_stored_summary.return_value = StoredSummary(
+            _make_summary(), 2, fingerprints
+        )
+
+        await service.precompute_summary("matter-123")
+
+        service.generate_subject_matter.assert_not_called()
+        service.get_key_issues.assert_not_called()
+        service.get_current_status.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_pinned(self, precompute_service) -> None:
+        """Should drop the fingerprint of a section that failed to generate."""
+        from app.models.summary import SubjectMatter
+
+        service = precompute_service
+        service.generate_subject_matter.return_value = SubjectMatter(
+            description=SUBJECT_MATTER_UNAVAILABLE, sources=[], is_verified=False
+        )
+
+        await service.precompute_summary("matter-123")
+
+        fingerprints = service._save_stored_summary.call_args.args[2]
+        assert "subject_matter" not in fingerprints
+        assert "key_issues" in fingerprints
+
+    @pytest.mark.asyncio
+    async def test_save_conflict_caches_stored_winner(self, precompute_service) -> None:
+        """Should cache the version another writer stored, not the lost build."""
+        service = precompute_service
+        winner = _make_summary()
+        winner.version = 3
+        service._load_stored_summary.side_effect = [
+            StoredSummary(_make_summary(), 1, {}),
+            StoredSummary(winner, 3, {}),
+        ]
+        service._save_stored_summary.return_value = None
+
+        result = await service.precompute_summary("matter-123")
+
+        assert result is winner
+        service._cache_summary.assert_awaited_once_with(
+            "matter-123", winner, redis=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_save_failure_without_stored_row_is_not_cached(
+        self, precompute_service
+    ) -> None:
+        """Should not cache a summary that was never stored."""
+        service = precompute_service
+        service._save_stored_summary.return_value = None
+
+        await service.precompute_summary("matter-123")
+
+        service._cache_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_live_sections_are_queued(
+        self, precompute_service, queued
+    ) -> None:
+        """Should serve an old stored summary and queue its live refresh."""
+        service = precompute_service
+        stored = _make_summary()
+        stored.generated_at = "2026-01-15T00:00:00+00:00"
+        service._load_stored_summary.return_value = StoredSummary(stored, 4, {})
+
+        result = await service.get_summary("matter-123")
+
+        assert result is stored
+        queued.live_refresh.assert_called_once_with("matter-123")
+        service.get_stats.assert_not_called()
+        service._save_stored_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_entry_queues_refresh(
+        self, precompute_service, queued
+    ) -> None:
+        """Should serve an old cached copy and queue its live refresh."""
+        service = precompute_service
+        cached = _make_summary()
+        cached.generated_at = "2026-01-15T00:00:00Z"
+        service._get_cached_summary.return_value = cached
+
+        result = await service.get_summary("matter-123")
+
+        assert result is cached
+        queued.live_refresh.assert_called_once_with("matter-123")
+        service._load_stored_summary.assert_not_called()
+        service.get_stats.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_live_sections_recomputes(self, precompute_service) -> None:
+        """Should refresh stats and attention items of an old stored summary."""
+        service = precompute_service
+        stored = _make_summary()
+        stored.generated_at = "2026-01-15T00:00:00+00:00"
+        service._load_stored_summary.return_value = StoredSummary(
+            stored, 4, {"subject_matter": "abc"}
+        )
+        service.get_stats.return_value = MatterStats(total_pages=250)
+        service._save_stored_summary.return_value = 5
+        redis = MagicMock()
+
+        result = await service.refresh_live_sections("matter-123", redis=redis)
+
+        assert result.stats.total_pages == 250
+        assert result.version == 5
+        assert not service._live_sections_stale(result)
+        service.generate_subject_matter.assert_not_called()
+        args = service._save_stored_summary.call_args
+        assert args.args[2] == {"subject_matter": "abc"}
+        assert args.kwargs["expected_version"] == 4
+        service._cache_summary.assert_awaited_once_with(
+            "matter-123", result, redis=redis
+        )
+
+    @pytest.mark.asyncio
+    async def test_refresh_live_sections_skips_fresh_summary(
+        self, precompute_service
+    ) -> None:
+        """Should leave a summary refreshed since the read that queued it."""
+        service = precompute_service
+        stored = _make_summary()
+        service._load_stored_summary.return_value = StoredSummary(stored, 4, {})
+
+        result = await service.refresh_live_sections("matter-123")
+
+        assert result is stored
+        service.get_stats.assert_not_called()
+        service._save_stored_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_review_state_updates_stored_summary(
+        self, precompute_service
+    ) -> None:
+        """Should re-apply verifications without regenerating."""
+        service = precompute_service
+        service._load_stored_summary.return_value = StoredSummary(
+            _make_summary(), 5, {"subject_matter": "abc"}
+        )
+        service._get_verification_decisions.return_value = {
+            ("subject_matter", "main"): "verified"
+        }
+        service._save_stored_summary.return_value = 6
+
+        result = await service.refresh_review_state("matter-123")
+
+        assert result.version == 6
+        assert result.subject_matter.is_verified is True
+        service.generate_subject_matter.assert_not_called()
+        args = service._save_stored_summary.call_args
+        assert args.args[2] == {"subject_matter": "abc"}
+        assert args.kwargs["expected_version"] == 5
+
+    @pytest.mark.asyncio
+    async def test_refresh_review_state_conflict_invalidates(
+        self, precompute_service
+    ) -> None:
+        """Should drop the cached copy when a rebuild stored a newer version."""
+        service = precompute_service
+        service._load_stored_summary.return_value = StoredSummary(_make_summary(), 5, {})
+        service._save_stored_summary.return_value = None
+        service.invalidate_cache = AsyncMock(return_value=True)
+
+        result = await service.refresh_review_state("matter-123")
+
+        assert result is None
+        service.invalidate_cache.assert_awaited_once_with("matter-123")
+        service._cache_summary.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_save_conflict_returns_none(self, mock_supabase_client) -> None:
+        """Should report a conflict when the expected version was replaced."""
+        service = SummaryService()
+        service._supabase_client = mock_supabase_client
+        update = mock_supabase_client.table.return_value.update
+        update.return_value.eq.return_value.eq.return_value.execute.return_value = (
+            MagicMock(data=[])
+        )
+
+        result = await service._save_stored_summary(
+            "matter-123", _make_summary(), {}, expected_version=3
+        )
+
+        assert result is None
+        assert update.call_args.args[0]["version"] == 4
+        update.return_value.eq.return_value.eq.assert_called_once_with("version", 3)
+
+    @pytest.mark.asyncio
+    async def test_top_chunks_use_single_rpc(self, mock_supabase_client) -> None:
+        """Should fetch top chunks with one RPC call."""
+        service = SummaryService()
+        service._supabase_client = mock_supabase_client
+        mock_supabase_client.rpc.return_value.execute.return_value = MagicMock(
+            data=[TOP_CHUNKS[0]]
+        )
+
+        result = await service._get_top_chunks("matter-123", limit=15)
+
+        mock_supabase_client.rpc.assert_called_once_with(
+            "get_summary_top_chunks", {"p_matter_id": "matter-123", "p_limit": 15}
+        )
+        assert result == TOP_CHUNKS
+
+    def test_apply_review_state(self) -> None:
+        """Should overlay verifications and edits onto every section."""
+        from app.models.summary import KeyIssueVerificationStatus
+
+        summary = _make_summary()
+        _apply_review_state(
+            summary,
+            {
+                ("parties", "entity-1"): "verified",
+                ("key_issue", "issue-1"): "flagged",
+            },
+            {("current_status", "main"): "Edited status"},
+        )
+
+        assert summary.parties[0].is_verified is True
+        assert summary.key_issues[0].verification_status == KeyIssueVerificationStatus.FLAGGED
+        assert summary.current_status.edited_content == "Edited status"
+        assert summary.subject_matter.edited_content is None
+
+
 # =============================================================================
 # GPT-4 Generation Tests
 # =============================================================================
@@ -0,0 +1,140 @@
+"""Tests for the pooled, process-wide Supabase clients.
+
+Runs PooledTransport against a local HTTP server.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from app.services.supabase import client as supabase_client
+from app.services.supabase.client import PooledTransport
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def log_message(self, *args) -> None:  # Keep test output quiet
+        pass
+
+    def do_GET(self) -> None:
+        time.sleep(self.server.delay)
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    httpd.daemon_threads = True
+    httpd.delay = 0.05
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _http_client(max_connections: int, pool_timeout: float = 5.0) -> httpx.Client:
+    transport = PooledTransport(
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        pool_timeout=pool_timeout,
+    )
+    return httpx.Client(transport=transport)
+
+
+class TestPooledTransport:
+    """Tests for pool metering."""
+
+    def test_slots_released_after_each_response(self, server) -> None:
+        url = f"http://127.0.0.1:{server.server_address[1]}/rest/v1/documents"
+
+        with _http_client(max_connections=2) as http:
+            for _ in range(3):
+                assert http.get(url).status_code == 200
+            stats = http._transport.stats.to_dict()
+
+        assert stats["requests"] == 3
+        assert stats["in_flight"] == 0
+        assert stats["saturation"] == 0.0
+        assert stats["waited"] == 0
+
+    def test_saturated_pool_records_wait(self, server) -> None:
+        url = f"http://127.0.0.1:{server.server_address[1]}/rest/v1/documents"
+
+        with _http_client(max_connections=2) as http, ThreadPoolExecutor(6) as pool:
+            statuses = list(pool.map(lambda _: http.get(url).status_code, range(6)))
+            stats = http._transport.stats.to_dict()
+
+        assert statuses == [200] * 6
+        assert stats["peak_in_flight"] == 2
+        assert stats["waited"] >= 1
+        assert stats["max_wait_ms"] > 0
+
+    def test_pool_timeout_raises(self, server) -> None:
+        url = f"http://127.0.0.1:{server.server_address[1]}/rest/v1/documents"
+        server.delay = 0.3
+
+        with _http_client(max_connections=1, pool_timeout=0.05) as http, ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(http.get, url) for _ in range(2)]
+            errors = [f.exception() for f in futures]
+            stats = http._transport.stats
+
+        assert sum(isinstance(e, httpx.PoolTimeout) for e in errors) == 1
+        assert stats.timeouts == 1
+        assert stats.in_flight == 0
+
+
+class TestServiceClientSingleton:
+    """Tests for the process-wide service client."""
+
+    @pytest.fixture(autouse=True)
+    def configured(self, monkeypatch):
+        settings = MagicMock(
+            supabase_url="http://localhost:54321",
+            supabase_service_key="service-key",
+            supabase_pool_max_connections=10,
+            supabase_pool_max_keepalive=5,
+            supabase_pool_keepalive_expiry=30.0,
+            supabase_pool_timeout=10.0,
+        )
+        monkeypatch.setattr(supabase_client, "get_settings", lambda: settings)
+        monkeypatch.setattr(
+            supabase_client, "create_client", lambda **kwargs: MagicMock(options=kwargs["options"])
+        )
+        supabase_client._reset_after_fork()
+        yield
+        supabase_client._reset_after_fork()
+
+    def test_client_is_shared(self) -> None:
+        first = supabase_client.get_service_client()
+
+        assert supabase_client.get_service_client() is first
+        assert list(supabase_client.get_supabase_pool_stats()) == ["service"]
+
+    def test_concurrent_first_calls_create_one_client(self) -> None:
+        with ThreadPoolExecutor(8) as pool:
+            clients = list(pool.map(lambda _: supabase_client.get_service_client(), range(8)))
+
+        assert len({id(c) for c in clients}) == 1
+
+    def test_fork_reset_builds_new_client(self) -> None:
+        parent = supabase_client.get_service_client()
+        parent_http = parent.options.httpx_client
+
+        supabase_client._reset_after_fork()
+        child = supabase_client.get_service_client()
+
+        assert child is not parent
+        assert child.options.httpx_client is not parent_http
+        # Parent's sockets are abandoned, not closed
+        assert not parent_http.is_closed
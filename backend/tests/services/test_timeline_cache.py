@@ -5,9 +5,9 @@ Tests Redis-based caching for timeline data.
 Story 4-3: Events Table + MIG Integration
 """
 
-import json
+import asyncio
 from datetime import date, datetime
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,14 +16,21 @@ from app.engines.timeline.timeline_builder import (
     EntityReference,
     EntityTimelineView,
     TimelineEvent,
+    TimelineSegment,
     TimelineStatistics,
 )
 from app.models.entity import EntityType
 from app.models.timeline import EventType
 from app.services.timeline_cache import (
+    COMPRESSION_THRESHOLD,
+    TimelineCacheFormatError,
     TimelineCacheService,
+    _decode_payload,
     _deserialize_timeline,
+    _encode_payload,
+    _entity_view_to_row,
     _serialize_timeline,
+    _stats_to_row,
     get_timeline_cache_service,
 )
 
@@ -41,12 +48,23 @@ TEST_ENTITY_ID = "abcdef01-1234-1234-1234-123456789012"
 # =============================================================================
 
 
+def _mock_redis() -> MagicMock:
+    """Mock redis.asyncio client (commands are awaitable, pipeline is not)."""
+    redis = MagicMock()
+    for command in ("get", "mget", "setex", "incr", "expire", "delete", "ping"):
+        setattr(redis, command, AsyncMock())
+    redis.get.return_value = None
+    redis.mget.return_value = [None, None]
+    redis.pipeline.return_value.execute = AsyncMock(return_value=[True, True])
+    return redis
+
+
 @pytest.fixture
 def cache_service():
     """Create a TimelineCacheService instance for testing."""
     service = TimelineCacheService()
     # Mock Redis client
-    service._redis = MagicMock()
+    service._redis = _mock_redis()
     return service
 
 
@@ -154,47 +172,86 @@ def sample_entity_view():
 
 
 class TestSerialization:
-    """Tests for timeline serialization/deserialization."""
-
-    def test_serialize_timeline(self, sample_timeline):
-        """Test serializing a timeline to JSON."""
-        serialized = _serialize_timeline(sample_timeline)
-
-        assert isinstance(serialized, str)
-        data = json.loads(serialized)
-        assert data["matter_id"] == TEST_MATTER_ID
-        assert len(data["events"]) == 1
-        assert data["total_events"] == 1
-
-    def test_deserialize_timeline(self, sample_timeline):
-        """Test deserializing a timeline from JSON."""
-        serialized = _serialize_timeline(sample_timeline)
-        deserialized = _deserialize_timeline(serialized)
+    """Tests for the compact timeline encoding."""
+
+    def test_round_trip(self, sample_timeline):
+        """Test a page survives serialize/deserialize unchanged."""
+        page, detail = _serialize_timeline(sample_timeline)
+
+        assert isinstance(page, bytes)
+        assert _deserialize_timeline(page, detail) == sample_timeline
+
+    def test_records_are_positional(self, sample_timeline):
+        """Test events are stored as arrays, with dates and enums as strings."""
+        page, _ = _serialize_timeline(sample_timeline)
+
+        event_row = _decode_payload(page)[7][0]
+        assert event_row[:5] == [
+            "event-1",
+            "2024-01-15",
+            "day",
+            "15/01/2024",
+            "filing",
+        ]
+
+    def test_small_payload_not_compressed(self):
+        """Test small payloads are stored raw behind the header byte."""
+        payload = _encode_payload([1, "a"])
+
+        assert payload == b'\x01[1,"a"]'
+
+    def test_large_payload_compressed(self):
+        """Test payloads above the threshold are compressed."""
+        data = ["x" * 100] * (COMPRESSION_THRESHOLD // 50)
+
+        payload = _encode_payload(data)
+
+        assert payload[0] == 0x02
+        assert len(payload) < COMPRESSION_THRESHOLD
+        assert _decode_payload(payload) == data
+
+    def test_unknown_header_rejected(self):
+        """Test values from the old JSON format are not decoded."""
+        with pytest.raises(TimelineCacheFormatError):
+            _decode_payload(b'{"matter_id": "m"}')
+
+    def test_segments_and_views_share_page_events(
+        self, sample_timeline, sample_entity_view
+    ):
+        """Test detail entries reference page events instead of copying them."""
+        event = sample_timeline.events[0]
+        sample_timeline.segments = [
+            TimelineSegment(
+                period_start=date(2024, 1, 1),
+                period_end=date(2024, 1, 31),
+                period_label="January 2024",
+                events=[event],
+                event_count=1,
+            )
+        ]
+        # Entity view event is not on the page -> stored once as an extra event
+        sample_timeline.entity_views = [sample_entity_view]
+        sample_entity_view.events[0].event_id = "event-2"
 
-        assert isinstance(deserialized, ConstructedTimeline)
-        assert deserialized.matter_id == TEST_MATTER_ID
-        assert len(deserialized.events) == 1
-        assert deserialized.events[0].event_id == "event-1"
+        page, detail = _serialize_timeline(sample_timeline)
+        extra_rows, segment_rows, view_rows = _decode_payload(detail)
+        restored = _deserialize_timeline(page, detail)
 
-    def test_serialize_date_objects(self, sample_timeline):
-        """Test that date objects are properly serialized."""
-        serialized = _serialize_timeline(sample_timeline)
-        data = json.loads(serialized)
+        assert segment_rows[0][4] == [0]
+        assert view_rows[0][6] == [1]
+        assert [row[0] for row in extra_rows] == ["event-2"]
+        assert restored.segments[0].events[0] is restored.events[0]
+        assert restored == sample_timeline
 
-        # Check that dates are serialized as ISO format with marker
-        # Uses __timeline_cache_date__ marker to avoid collision with user data
-        event_data = data["events"][0]
-        assert "__timeline_cache_date__" in str(event_data["event_date"])
+    def test_deserialize_without_detail(self, sample_timeline):
+        """Test the page entry alone yields events without segments/views."""
+        page, _ = _serialize_timeline(sample_timeline)
 
-    def test_serialize_enum_objects(self, sample_timeline):
-        """Test that enum objects are properly serialized."""
-        serialized = _serialize_timeline(sample_timeline)
-        data = json.loads(serialized)
+        restored = _deserialize_timeline(page)
 
-        # EventType is a str enum, so it serializes to its string value directly
-        event_data = data["events"][0]
-        # Verify the event type is serialized (either as marker or string value)
-        assert event_data["event_type"] == "filing" or "__event_type__" in str(event_data["event_type"])
+        assert restored.events == sample_timeline.events
+        assert restored.segments == []
+        assert restored.entity_views == []
 
 
 # =============================================================================
@@ -214,14 +271,21 @@ class TestTimelineCache:
         )
 
         assert result is True
-        cache_service._redis.setex.assert_called_once()
+        pipe = cache_service._redis.pipeline.return_value
+        keys = [c[0][0] for c in pipe.setex.call_args_list]
+        assert keys == [
+            f"matter:{TEST_MATTER_ID}:timeline:g0:1:50",
+            f"matter:{TEST_MATTER_ID}:timeline:g0:1:50:detail",
+        ]
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_get_timeline_hit(self, cache_service, sample_timeline):
         """Test retrieving a cached timeline."""
         # Mock Redis returning cached data
-        serialized = _serialize_timeline(sample_timeline)
-        cache_service._redis.get.return_value = serialized
+        cache_service._redis.mget.return_value = list(
+            _serialize_timeline(sample_timeline)
+        )
 
         result = await cache_service.get_timeline(
             matter_id=TEST_MATTER_ID,
@@ -233,11 +297,48 @@ class TestTimelineCache:
         assert isinstance(result, ConstructedTimeline)
         assert result.matter_id == TEST_MATTER_ID
 
+    @pytest.mark.asyncio
+    async def test_get_timeline_events_only(self, cache_service, sample_timeline):
+        """Test include_details=False reads only the page entry."""
+        page, _ = _serialize_timeline(sample_timeline)
+        cache_service._redis.get.side_effect = lambda key: (
+            page if key.endswith(":1:50") else None
+        )
+
+        result = await cache_service.get_timeline(
+            matter_id=TEST_MATTER_ID,
+            page=1,
+            per_page=50,
+            include_details=False,
+        )
+
+        assert result.events == sample_timeline.events
+        cache_service._redis.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_missing_detail_is_miss(
+        self, cache_service, sample_timeline
+    ):
+        """Test a page whose detail entry is gone is treated as a miss."""
+        page, _ = _serialize_timeline(sample_timeline)
+        cache_service._redis.mget.return_value = [page, None]
+
+        result = await cache_service.get_timeline(TEST_MATTER_ID, page=1, per_page=50)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_legacy_entry_is_miss(self, cache_service):
+        """Test entries in the old JSON format are ignored."""
+        cache_service._redis.mget.return_value = [b'{"matter_id": "m"}', b"{}"]
+
+        result = await cache_service.get_timeline(TEST_MATTER_ID, page=1, per_page=50)
+
+        assert result is None
+
     @pytest.mark.asyncio
     async def test_get_timeline_miss(self, cache_service):
         """Test cache miss returns None."""
-        cache_service._redis.get.return_value = None
-
         result = await cache_service.get_timeline(
             matter_id=TEST_MATTER_ID,
             page=1,
@@ -251,6 +352,7 @@ class TestTimelineCache:
         """Test graceful handling when Redis unavailable."""
         service = TimelineCacheService()
         service._redis = None
+        service._settings = MagicMock(redis_url=None)
 
         result = await service.get_timeline(
             matter_id=TEST_MATTER_ID,
@@ -260,6 +362,24 @@ class TestTimelineCache:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_loop_change_closes_previous_client(self):
+        """Test the client of a previous event loop is closed when replaced."""
+        service = TimelineCacheService()
+        previous = _mock_redis()
+        previous.aclose = AsyncMock()
+        service._redis = previous
+        service._redis_loop = MagicMock()  # Some other (finished) loop
+        service._settings = MagicMock(redis_url="redis://localhost:6379/0")
+        replacement = _mock_redis()
+
+        with patch("redis.asyncio.from_url", return_value=replacement):
+            client = await service._get_redis()
+
+        previous.aclose.assert_awaited_once()
+        assert client is replacement
+        assert service._redis_loop is asyncio.get_running_loop()
+
 
 # =============================================================================
 # Statistics Cache Tests
@@ -283,26 +403,18 @@ class TestStatisticsCache:
     @pytest.mark.asyncio
     async def test_get_statistics_hit(self, cache_service, sample_statistics):
         """Test retrieving cached statistics."""
-        # Create serialized stats manually
-        from app.services.timeline_cache import TimelineCacheEncoder, _stats_to_dict
-
-        serialized = json.dumps(
-            _stats_to_dict(sample_statistics),
-            cls=TimelineCacheEncoder,
+        serialized = _encode_payload(_stats_to_row(sample_statistics))
+        cache_service._redis.get.side_effect = lambda key: (
+            serialized if key.endswith(":stats") else None
         )
-        cache_service._redis.get.return_value = serialized
 
         result = await cache_service.get_statistics(TEST_MATTER_ID)
 
-        assert result is not None
-        assert isinstance(result, TimelineStatistics)
-        assert result.total_events == 10
+        assert result == sample_statistics
 
     @pytest.mark.asyncio
     async def test_get_statistics_miss(self, cache_service):
         """Test statistics cache miss."""
-        cache_service._redis.get.return_value = None
-
         result = await cache_service.get_statistics(TEST_MATTER_ID)
 
         assert result is None
@@ -331,31 +443,21 @@ class TestEntityViewCache:
     @pytest.mark.asyncio
     async def test_get_entity_view_hit(self, cache_service, sample_entity_view):
         """Test retrieving cached entity view."""
-        from app.services.timeline_cache import (
-            TimelineCacheEncoder,
-            _entity_view_to_dict,
+        serialized = _encode_payload(_entity_view_to_row(sample_entity_view))
+        cache_service._redis.get.side_effect = lambda key: (
+            serialized if ":entity:" in key else None
         )
 
-        serialized = json.dumps(
-            _entity_view_to_dict(sample_entity_view),
-            cls=TimelineCacheEncoder,
-        )
-        cache_service._redis.get.return_value = serialized
-
         result = await cache_service.get_entity_view(
             matter_id=TEST_MATTER_ID,
             entity_id="entity-1",
         )
 
-        assert result is not None
-        assert isinstance(result, EntityTimelineView)
-        assert result.entity_id == "entity-1"
+        assert result == sample_entity_view
 
     @pytest.mark.asyncio
     async def test_get_entity_view_miss(self, cache_service):
         """Test entity view cache miss."""
-        cache_service._redis.get.return_value = None
-
         result = await cache_service.get_entity_view(
             matter_id=TEST_MATTER_ID,
             entity_id="entity-1",
@@ -374,15 +476,43 @@ class TestCacheInvalidation:
 
     @pytest.mark.asyncio
     async def test_invalidate_timeline(self, cache_service):
-        """Test invalidating all timeline cache entries."""
-        # Mock SCAN returning keys
-        cache_service._redis.scan.return_value = (0, ["key1", "key2"])
-        cache_service._redis.delete.return_value = 2
+        """Test invalidating all timeline cache entries with one INCR."""
+        cache_service._redis.incr.return_value = 4
+
+        generation = await cache_service.invalidate_timeline(TEST_MATTER_ID)
+
+        assert generation == 4
+        cache_service._redis.incr.assert_called_once_with(
+            f"matter:{TEST_MATTER_ID}:gen:timeline"
+        )
+        cache_service._redis.scan.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_timeline_failure_returns_zero(self, cache_service):
+        """A failed bump reports 0 so callers can tell nothing was cleared."""
+        cache_service._redis.incr.side_effect = ConnectionError("redis down")
 
-        deleted = await cache_service.invalidate_timeline(TEST_MATTER_ID)
+        generation = await cache_service.invalidate_timeline(TEST_MATTER_ID)
 
-        assert deleted >= 0
-        cache_service._redis.scan.assert_called()
+        assert generation == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_timeline_moves_keys_to_new_generation(
+        self, cache_service, sample_timeline
+    ):
+        """Entries written before invalidation must no longer be read."""
+        await cache_service.set_timeline(TEST_MATTER_ID, sample_timeline)
+        pipe = cache_service._redis.pipeline.return_value
+        old_key = pipe.setex.call_args_list[0][0][0]
+
+        cache_service._redis.incr.return_value = 1
+        await cache_service.invalidate_timeline(TEST_MATTER_ID)
+        await cache_service.get_timeline(TEST_MATTER_ID, page=1, per_page=50)
+
+        assert ":timeline:g0:" in old_key
+        assert cache_service._redis.mget.call_args[0][0] == (
+            f"matter:{TEST_MATTER_ID}:timeline:g1:1:50"
+        )
 
     @pytest.mark.asyncio
     async def test_invalidate_entity_view(self, cache_service):
@@ -402,10 +532,11 @@ class TestCacheInvalidation:
         """Test graceful handling of invalidation without Redis."""
         service = TimelineCacheService()
         service._redis = None
+        service._settings = MagicMock(redis_url=None)
 
-        deleted = await service.invalidate_timeline(TEST_MATTER_ID)
+        generation = await service.invalidate_timeline(TEST_MATTER_ID)
 
-        assert deleted == 0
+        assert generation == 0
 
 
 # =============================================================================
@@ -18,11 +18,20 @@ from app.models.timeline import (
     UnclassifiedEventsResponse,
 )
 from app.services.timeline_service import (
+    BULK_UPDATE_BATCH_SIZE,
     TimelineService,
     get_timeline_service,
 )
 
 
+def _classification(event_id: str) -> EventClassificationResult:
+    return EventClassificationResult(
+        event_id=event_id,
+        event_type=EventType.FILING,
+        classification_confidence=0.9,
+    )
+
+
 class TestTimelineServiceInit:
     """Tests for TimelineService initialization."""
 
@@ -817,8 +826,8 @@ class TestBulkUpdateClassifications:
 
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.data = [{"id": "event-1"}]
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = mock_response
+        mock_response.data = [{"event_id": "event-1"}, {"event_id": "event-2"}]
+        mock_client.rpc.return_value.execute.return_value = mock_response
         service._client = mock_client
 
         classifications = [
@@ -846,6 +855,14 @@ class TestBulkUpdateClassifications:
         )
 
         assert count == 2  # Both should update successfully
+        # One set-based statement for the whole batch
+        mock_client.rpc.assert_called_once()
+        name, params = mock_client.rpc.call_args.args
+        assert name == "bulk_update_event_classifications"
+        assert params["p_event_ids"] == ["event-1", "event-2"]
+        assert params["p_event_types"] == ["filing", "hearing"]
+        assert params["p_confidences"] == [0.95, 0.88]
+        mock_client.table.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_bulk_update_empty_list(self) -> None:
@@ -865,8 +882,8 @@ class TestBulkUpdateClassifications:
 
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.data = [{"id": "event-1"}]
-        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = mock_response
+        mock_response.data = [{"event_id": "event-1"}]
+        mock_client.rpc.return_value.execute.return_value = mock_response
         service._client = mock_client
 
         classifications = [
@@ -887,6 +904,127 @@ class TestBulkUpdateClassifications:
 
         assert count == 1
 
+    def test_bulk_update_reports_partial_success(self) -> None:
+        """Events missing from the RPC result are not counted."""
+        service = TimelineService()
+
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value.data = [
+            {"event_id": "event-1"}
+        ]
+        service._client = mock_client
+
+        classifications = [
+            _classification("event-1"),
+            _classification("event-missing"),
+        ]
+
+        count = service.bulk_update_classifications_sync(
+            classifications=classifications,
+            matter_id="matter-123",
+        )
+
+        assert count == 1
+
+    def test_bulk_update_batches_large_inputs(self) -> None:
+        """Should issue one RPC per BULK_UPDATE_BATCH_SIZE events."""
+        service = TimelineService()
+
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.side_effect = lambda: MagicMock(
+            data=[
+                {"event_id": event_id}
+                for event_id in mock_client.rpc.call_args.args[1]["p_event_ids"]
+            ]
+        )
+        service._client = mock_client
+
+        classifications = [
+            _classification(f"event-{i}") for i in range(BULK_UPDATE_BATCH_SIZE + 1)
+        ]
+
+        count = service.bulk_update_classifications_sync(
+            classifications=classifications,
+            matter_id="matter-123",
+        )
+
+        assert count == BULK_UPDATE_BATCH_SIZE + 1
+        assert mock_client.rpc.call_count == 2
+
+    def test_bulk_update_falls_back_row_by_row_on_rpc_error(self) -> None:
+        """A failed batch is retried per event so one bad row only fails itself."""
+        service = TimelineService()
+
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.side_effect = Exception("rpc failed")
+        update_chain = (
+            mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value
+        )
+        update_chain.execute.side_effect = [
+            MagicMock(data=[{"id": "event-1"}]),
+            Exception("bad row"),
+        ]
+        service._client = mock_client
+
+        count = service.bulk_update_classifications_sync(
+            classifications=[_classification("event-1"), _classification("event-2")],
+            matter_id="matter-123",
+        )
+
+        assert count == 1
+        assert update_chain.execute.call_count == 2
+
+
+class TestBulkUpdateEventEntities:
+    """Tests for bulk entity link updates."""
+
+    def test_bulk_update_event_entities_single_rpc(self) -> None:
+        """Should send all events in one set-based RPC."""
+        service = TimelineService()
+
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.return_value.data = [
+            {"event_id": "event-1"},
+            {"event_id": "event-2"},
+        ]
+        service._client = mock_client
+
+        count = service.bulk_update_event_entities_sync(
+            event_entities={"event-1": ["entity-a"], "event-2": []},
+            matter_id="matter-123",
+        )
+
+        assert count == 2
+        mock_client.rpc.assert_called_once_with(
+            "bulk_update_event_entities",
+            {
+                "p_matter_id": "matter-123",
+                "p_updates": [
+                    {"event_id": "event-1", "entity_ids": ["entity-a"]},
+                    {"event_id": "event-2", "entity_ids": []},
+                ],
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_event_entities_async_fallback(self) -> None:
+        """Should fall back to per-event updates when the RPC fails."""
+        service = TimelineService()
+
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.side_effect = Exception("rpc failed")
+        mock_client.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"id": "event-1"}]
+        )
+        service._client = mock_client
+
+        count = await service.bulk_update_event_entities(
+            event_entities={"event-1": ["entity-a"]},
+            matter_id="matter-123",
+        )
+
+        assert count == 1
+
 
 class TestManualClassification:
     """Tests for manual classification updates."""
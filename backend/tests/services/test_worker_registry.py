@@ -0,0 +1,123 @@
+"""Tests for the worker heartbeat registry.
+
+Story 5.6: Queue Depth Visibility Dashboard
+Story 5.7: Processing ETA Display
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.worker_registry import (
+    WORKER_HEARTBEAT_INFO_KEY,
+    WORKER_HEARTBEATS_KEY,
+    WorkerHeartbeat,
+    WorkerHeartbeatPublisher,
+    parse_live_workers,
+)
+
+HOSTNAME = "celery@worker-1"
+
+
+@pytest.fixture
+def mock_redis():
+    """Sync Redis client whose pipeline finds no stale workers."""
+    redis = MagicMock()
+    redis.pipeline.return_value.execute.return_value = [1, 1, []]
+    return redis
+
+
+@pytest.fixture
+def publisher(mock_redis):
+    return WorkerHeartbeatPublisher(
+        hostname=HOSTNAME,
+        concurrency=50,
+        queues=["low", "default", "high"],
+        redis_client=mock_redis,
+    )
+
+
+class TestActiveTaskCounting:
+    """Tests for task_started / task_finished."""
+
+    def test_counts_tasks_per_queue(self, publisher):
+        publisher.task_started("default")
+        publisher.task_started("default")
+        publisher.task_started("low")
+        publisher.task_finished("default")
+
+        heartbeat = publisher.heartbeat()
+
+        assert heartbeat.active_by_queue == {"default": 1, "low": 1}
+        assert heartbeat.active_tasks == 2
+
+    def test_unknown_queue_counts_as_default(self, publisher):
+        publisher.task_started(None)
+
+        assert publisher.heartbeat().active_by_queue == {"default": 1}
+
+    def test_never_goes_negative(self, publisher):
+        publisher.task_finished("high")
+
+        assert publisher.heartbeat().active_tasks == 0
+
+
+class TestPublish:
+    """Tests for publishing heartbeats."""
+
+    def test_publishes_score_and_info(self, publisher, mock_redis):
+        publisher.task_started("default")
+
+        assert publisher.publish() is True
+
+        pipe = mock_redis.pipeline.return_value
+        zadd_key, members = pipe.zadd.call_args.args
+        assert zadd_key == WORKER_HEARTBEATS_KEY
+        assert HOSTNAME in members
+        info_key, hostname, raw = pipe.hset.call_args.args
+        assert (info_key, hostname) == (WORKER_HEARTBEAT_INFO_KEY, HOSTNAME)
+        stored = WorkerHeartbeat.from_json(raw)
+        assert stored.concurrency == 50
+        assert stored.queues == ["default", "high", "low"]
+        assert stored.active_by_queue == {"default": 1}
+
+    def test_prunes_stale_workers(self, publisher, mock_redis):
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.side_effect = [[1, 1, ["celery@gone"]], [1, 1]]
+
+        publisher.publish()
+
+        pipe.zrem.assert_called_once_with(WORKER_HEARTBEATS_KEY, "celery@gone")
+        pipe.hdel.assert_called_once_with(WORKER_HEARTBEAT_INFO_KEY, "celery@gone")
+
+    def test_maybe_publish_throttles(self, publisher, mock_redis):
+        assert publisher.maybe_publish() is True
+        assert publisher.maybe_publish() is False
+
+        assert mock_redis.pipeline.return_value.execute.call_count == 1
+
+    def test_publish_errors_are_swallowed(self, publisher, mock_redis):
+        mock_redis.pipeline.side_effect = ConnectionError("down")
+
+        assert publisher.publish() is False
+
+    def test_unregister_removes_worker(self, publisher, mock_redis):
+        publisher.unregister()
+
+        pipe = mock_redis.pipeline.return_value
+        pipe.zrem.assert_called_once_with(WORKER_HEARTBEATS_KEY, HOSTNAME)
+        pipe.hdel.assert_called_once_with(WORKER_HEARTBEAT_INFO_KEY, HOSTNAME)
+
+
+class TestParseLiveWorkers:
+    """Tests for parse_live_workers."""
+
+    def test_skips_missing_and_malformed_entries(self, publisher):
+        info = {
+            HOSTNAME: publisher.heartbeat().to_json(),
+            "celery@broken": "{not json",
+        }
+
+        workers = parse_live_workers([HOSTNAME, "celery@broken", "celery@no-info"], info)
+
+        assert [w.hostname for w in workers] == [HOSTNAME]
@@ -458,7 +458,7 @@ class TestMergeAndStoreResults:
     """Tests for _merge_and_store_results function."""
 
     def test_merges_results_correctly(self):
-        """Chunk results are merged with correct page offsets."""
+        """Chunk results are stitched without rewriting stored bounding boxes."""
         from app.workers.tasks.chunked_document_tasks import _merge_and_store_results
 
         successful_results = [
@@ -466,19 +466,19 @@ class TestMergeAndStoreResults:
                 "chunk_index": 0,
                 "page_start": 1,
                 "page_end": 25,
-                "bounding_boxes": [{"page": 1, "text": "Chunk 0"}],
+                "bbox_count": 1,
                 "full_text": "Text from chunk 0",
                 "confidence": 0.95,
                 "page_count": 25,
+                "checksum": "abc",
             },
             {
                 "chunk_index": 1,
                 "page_start": 26,
                 "page_end": 50,
-                "bounding_boxes": [{"page": 1, "text": "Chunk 1"}],
-                "full_text": "Text from chunk 1",
-                "confidence": 0.87,
-                "page_count": 25,
+                "result_path": None,
+                "checksum": "def",
+                "from_cache": True,
             },
         ]
 
@@ -486,21 +486,18 @@ class TestMergeAndStoreResults:
             "app.workers.tasks.chunked_document_tasks.get_ocr_result_merger"
         ) as mock_merger:
             mock_merged = MagicMock()
-            mock_merged.bounding_boxes = [
-                {"page": 1},
-                {"page": 26},
-            ]
+            mock_merged.bounding_boxes = []
             mock_merged.full_text = "Combined text"
             mock_merged.overall_confidence = 0.91
             mock_merged.page_count = 50
             mock_merged.chunk_count = 2
-            mock_merger.return_value.merge_results.return_value = mock_merged
+            mock_merged.total_bboxes = 2
+            mock_merger.return_value.stitch_results.return_value = mock_merged
 
             with patch(
                 "app.workers.tasks.chunked_document_tasks.get_bounding_box_service"
             ) as mock_bbox:
-                mock_bbox.return_value.delete_bounding_boxes.return_value = None
-                mock_bbox.return_value.save_bounding_boxes.return_value = 2
+                mock_bbox.return_value.delete_stale_bounding_boxes.return_value = 0
 
                 with patch(
                     "app.workers.tasks.chunked_document_tasks.get_document_service"
@@ -529,3 +526,14 @@ class TestMergeAndStoreResults:
         assert result["status"] == "ocr_complete"
         assert result["chunk_count"] == 2
         assert result["page_count"] == 50
+        assert result["bbox_count"] == 2
+
+        # Boxes were stored per chunk: only stale rows are removed, none rewritten
+        mock_bbox.return_value.delete_stale_bounding_boxes.assert_called_once_with(
+            "doc-456", 2
+        )
+        mock_bbox.return_value.delete_bounding_boxes.assert_not_called()
+        mock_bbox.return_value.save_bounding_boxes.assert_not_called()
+
+        chunk_results = mock_merger.return_value.stitch_results.call_args[0][0]
+        assert [c.checksum for c in chunk_results] == ["abc", None]
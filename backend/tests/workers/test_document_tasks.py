@@ -9,11 +9,14 @@ from app.models.document import DocumentStatus
 from app.models.ocr import OCRBoundingBox, OCRPage, OCRResult
 from app.services.document_service import DocumentServiceError
 from app.services.ocr import OCRServiceError
+from app.services.pdf_manifest import build_pdf_manifest
 from app.services.storage_service import StorageError
 from app.workers.tasks.document_tasks import (
     PDF_MAGIC_BYTES,
     _handle_max_retries_exceeded,
+    _resolve_pdf_manifest,
     _validate_pdf_content,
+    build_document_pdf_manifest,
     process_document,
 )
 
@@ -21,6 +24,14 @@ from app.workers.tasks.document_tasks import (
 class TestProcessDocumentTask:
     """Tests for process_document Celery task."""
 
+    @pytest.fixture(autouse=True)
+    def mock_manifest_task(self):
+        """Keep the background manifest build off the broker."""
+        with patch(
+            "app.workers.tasks.document_tasks.build_document_pdf_manifest"
+        ) as mock_task:
+            yield mock_task
+
     @pytest.fixture
     def mock_services(self) -> dict:
         """Create mock services for testing."""
@@ -29,6 +40,7 @@ class TestProcessDocumentTask:
             "path/to/file.pdf",
             "matter-123",
         )
+        doc_service.get_pdf_manifest.return_value = None  # No stored manifest yet
 
         storage_service = MagicMock()
         # Use valid PDF magic bytes for content validation
@@ -296,6 +308,89 @@ class TestProcessDocumentTask:
         assert result["error_code"] == "NOT_FOUND"
 
 
+class TestPdfManifestResolution:
+    """Tests for verifying stored manifests and building them off the OCR path."""
+
+    @pytest.fixture
+    def raw_pdf(self) -> bytes:
+        from io import BytesIO
+
+        from pypdf import PdfWriter
+
+        writer = PdfWriter()
+        for _ in range(3):
+            writer.add_blank_page(width=612, height=792)
+        buffer = BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
+
+    def test_verified_manifest_is_returned_without_rehashing(self, raw_pdf) -> None:
+        """A stored manifest is checked against the blob cache hash, not re-hashed."""
+        manifest = build_pdf_manifest(raw_pdf)
+        doc_service = MagicMock()
+        doc_service.get_pdf_manifest.return_value = manifest
+
+        with (
+            patch("app.services.pdf_manifest.hashlib.sha256") as sha256,
+            patch(
+                "app.workers.tasks.document_tasks.build_document_pdf_manifest"
+            ) as mock_task,
+        ):
+            resolved = _resolve_pdf_manifest(
+                doc_service, "doc-123", raw_pdf, manifest.file_sha256
+            )
+
+        assert resolved is manifest
+        sha256.assert_not_called()
+        mock_task.apply_async.assert_not_called()
+
+    def test_missing_manifest_queues_build_instead_of_building(self, raw_pdf) -> None:
+        """Building the manifest never happens on the OCR path."""
+        doc_service = MagicMock()
+        doc_service.get_pdf_manifest.return_value = None
+
+        with (
+            patch("app.workers.tasks.document_tasks.build_pdf_manifest") as build,
+            patch(
+                "app.workers.tasks.document_tasks.build_document_pdf_manifest"
+            ) as mock_task,
+        ):
+            resolved = _resolve_pdf_manifest(doc_service, "doc-123", raw_pdf)
+
+        assert resolved is None
+        build.assert_not_called()
+        mock_task.apply_async.assert_called_once_with(args=["doc-123"], queue="low")
+
+    def test_build_task_stores_manifest(self, raw_pdf, isolated_pdf_blob_cache) -> None:
+        """The upload-time task builds from the blob cache and saves the manifest."""
+        doc_service = MagicMock()
+        doc_service.get_document_for_processing.return_value = (
+            "matter-123/uploads/a.pdf",
+            "matter-123",
+        )
+        doc_service.get_pdf_manifest.return_value = None
+        storage_service = MagicMock()
+        storage_service.download_file.return_value = raw_pdf
+
+        with (
+            patch(
+                "app.workers.tasks.document_tasks.get_document_service",
+                return_value=doc_service,
+            ),
+            patch(
+                "app.workers.tasks.document_tasks.get_storage_service",
+                return_value=storage_service,
+            ),
+        ):
+            result = build_document_pdf_manifest("doc-123")
+
+        assert result["status"] == "built"
+        assert result["page_count"] == 3
+        document_id, matter_id, manifest = doc_service.save_pdf_manifest.call_args.args
+        assert (document_id, matter_id) == ("doc-123", "matter-123")
+        assert manifest.matches(raw_pdf)
+
+
 class TestHandleMaxRetriesExceeded:
     """Tests for _handle_max_retries_exceeded helper."""
 
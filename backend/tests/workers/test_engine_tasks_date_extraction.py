@@ -0,0 +1,161 @@
+"""Tests for the extract_dates_from_document Celery task.
+
+Covers cue gating, concurrent per-chunk extraction and chunk-order merging
+of the dates extracted from stored document chunks.
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.engines.timeline.date_extractor import (
+    CHUNK_EXTRACTION_CONCURRENCY,
+    DateExtractor,
+)
+from app.models.chunk import ChunkType, ChunkWithContent
+from app.models.timeline import DateExtractionResult, ExtractedDate
+
+DOCUMENT_ID = "doc-123"
+MATTER_ID = "matter-456"
+
+
+def _chunk(index: int, content: str) -> ChunkWithContent:
+    return ChunkWithContent(
+        id=f"chunk-{index}",
+        document_id=DOCUMENT_ID,
+        chunk_type=ChunkType.PARENT,
+        chunk_index=index,
+        token_count=len(content.split()),
+        page_number=index + 1,
+        bbox_ids=[f"bbox-{index}"],
+        content=content,
+    )
+
+
+def _extracted(day: int, page_number: int | None, bbox_ids: list[str]) -> ExtractedDate:
+    return ExtractedDate(
+        extracted_date=date(2024, 1, day),
+        date_text=f"{day} January 2024",
+        date_precision="day",
+        context_before=f"context {day}",
+        page_number=page_number,
+        bbox_ids=bbox_ids,
+    )
+
+
+@pytest.fixture
+def chunks() -> list[ChunkWithContent]:
+    return [
+        _chunk(0, "The agreement was dated 5 January 2024."),
+        _chunk(1, "The parties were present and nothing else happened."),
+        _chunk(2, "Notice was served on 9 January 2024."),
+        _chunk(3, "The hearing was fixed for 12 January 2024."),
+    ]
+
+
+@pytest.fixture
+def extractor() -> DateExtractor:
+    """DateExtractor whose Gemini call is replaced with a slow fake."""
+    extractor = DateExtractor()
+    in_flight = 0
+    extractor.max_in_flight = 0  # type: ignore[attr-defined]
+
+    async def fake_extract_single(
+        text: str,
+        document_id: str,
+        matter_id: str,
+        page_number: int | None = None,
+        bbox_ids: list[str] | None = None,
+    ) -> DateExtractionResult:
+        nonlocal in_flight
+        in_flight += 1
+        extractor.max_in_flight = max(extractor.max_in_flight, in_flight)  # type: ignore[attr-defined]
+        # Earlier pages finish last, so ordering must come from gather
+        await asyncio.sleep(0.01 * (10 - (page_number or 0)))
+        in_flight -= 1
+        day = int(text.split(" January")[0].rsplit(" ", 1)[-1])
+        return DateExtractionResult(
+            dates=[_extracted(day, page_number, bbox_ids or [])],
+            document_id=document_id,
+            matter_id=matter_id,
+            total_dates_found=1,
+            processing_time_ms=0,
+        )
+
+    extractor._extract_single = AsyncMock(side_effect=fake_extract_single)  # type: ignore[method-assign]
+    return extractor
+
+
+class TestExtractDatesFromDocument:
+    """Tests for extract_dates_from_document."""
+
+    def _run(
+        self, chunks: list[ChunkWithContent], extractor: DateExtractor
+    ) -> tuple[dict, MagicMock]:
+        from app.workers.tasks.engine_tasks import extract_dates_from_document
+
+        job_tracker = MagicMock()
+        job_tracker.update_job_status = AsyncMock()
+        timeline_service = MagicMock()
+        timeline_service.has_dates_for_document_sync.return_value = False
+        timeline_service.save_extracted_dates_sync.side_effect = (
+            lambda matter_id, document_id, dates: [f"event-{i}" for i in range(len(dates))]
+        )
+        chunk_service = MagicMock()
+        chunk_service.get_chunks_for_document.return_value = (chunks, len(chunks), 0)
+
+        with (
+            patch(
+                "app.workers.tasks.engine_tasks.get_job_tracking_service",
+                return_value=job_tracker,
+            ),
+            patch(
+                "app.workers.tasks.engine_tasks.get_timeline_service",
+                return_value=timeline_service,
+            ),
+            patch(
+                "app.workers.tasks.engine_tasks.get_chunk_service",
+                return_value=chunk_service,
+            ),
+            patch(
+                "app.workers.tasks.engine_tasks.get_date_extractor",
+                return_value=extractor,
+            ),
+            patch("app.workers.tasks.engine_tasks.broadcast_timeline_discovery"),
+            patch("app.workers.tasks.engine_tasks.broadcast_feature_ready"),
+        ):
+            result = extract_dates_from_document(
+                document_id=DOCUMENT_ID,
+                matter_id=MATTER_ID,
+                job_id="job-1",
+            )
+        return result, timeline_service
+
+    def test_skips_chunks_without_date_cues(
+        self, chunks: list[ChunkWithContent], extractor: DateExtractor
+    ) -> None:
+        """Chunks with no date cues should never reach the LLM."""
+        result, _ = self._run(chunks, extractor)
+
+        assert result["status"] == "completed"
+        sent = [c.kwargs["text"] for c in extractor._extract_single.await_args_list]  # type: ignore[attr-defined]
+        assert chunks[1].content not in sent
+        assert len(sent) == 3
+
+    def test_extracts_concurrently_and_merges_in_chunk_order(
+        self, chunks: list[ChunkWithContent], extractor: DateExtractor
+    ) -> None:
+        """Chunks run in parallel but saved dates keep chunk order and provenance."""
+        result, timeline_service = self._run(chunks, extractor)
+
+        assert 1 < extractor.max_in_flight <= CHUNK_EXTRACTION_CONCURRENCY  # type: ignore[attr-defined]
+        saved = timeline_service.save_extracted_dates_sync.call_args.kwargs["dates"]
+        assert [d.extracted_date.day for d in saved] == [5, 9, 12]
+        assert [(d.page_number, d.bbox_ids) for d in saved] == [
+            (1, ["bbox-0"]),
+            (3, ["bbox-2"]),
+            (4, ["bbox-3"]),
+        ]
+        assert result["dates_found"] == 3
@@ -0,0 +1,280 @@
+"""Tests for summary precompute Celery tasks.
+
+Story 14.1: Summary API Endpoint
+
+Tests cover:
+- Debounced scheduling
+- Superseded / pipeline-active exits and re-enqueue while another rebuild runs
+- Rebuild and lock release
+- Throttled read requests and the live-section refresh
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.workers.tasks.summary_tasks import (
+    SUMMARY_PRECOMPUTE_LOCK_KEY,
+    SUMMARY_PRECOMPUTE_TOKEN_KEY,
+    SUMMARY_READ_REQUEST_KEY,
+    SUMMARY_READ_REQUEST_TTL,
+    precompute_matter_summary,
+    refresh_summary_live_sections,
+    request_live_sections_refresh,
+    request_summary_precompute,
+    schedule_summary_precompute,
+)
+
+MATTER_ID = "matter-123"
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_redis():
+    """Sync Redis client with a stored debounce token."""
+    redis = MagicMock()
+    redis.get.return_value = "token-1"
+    redis.set.return_value = True
+    return redis
+
+
+@pytest.fixture
+def mock_async_redis():
+    """Async Redis client created for the task's own loop."""
+    return MagicMock()
+
+
+@pytest.fixture
+def mock_summary_service():
+    """Summary service whose rebuild returns version 3."""
+    service = MagicMock()
+    service.precompute_summary = AsyncMock(return_value=MagicMock(version=3))
+    return service
+
+
+def _run(redis, summary_service, active_jobs=0, token="token-1", async_redis=None):
+    with (
+        patch(
+            "app.services.distributed_lock.get_sync_redis_client",
+            return_value=redis,
+        ),
+        patch(
+            "app.workers.tasks.summary_tasks._count_active_jobs",
+            return_value=active_jobs,
+        ),
+        patch(
+            "app.services.memory.redis_client.create_redis_client",
+            return_value=async_redis or MagicMock(),
+        ),
+        patch(
+            "app.services.summary_service.get_summary_service",
+            return_value=summary_service,
+        ),
+    ):
+        return precompute_matter_summary(MATTER_ID, token)
+
+
+# =============================================================================
+# Scheduling Tests
+# =============================================================================
+
+
+class TestScheduleSummaryPrecompute:
+    """Tests for schedule_summary_precompute."""
+
+    def test_stores_token_and_schedules_with_delay(self, mock_redis):
+        """Should replace the debounce token and schedule a delayed task."""
+        with (
+            patch(
+                "app.services.distributed_lock.get_sync_redis_client",
+                return_value=mock_redis,
+            ),
+            patch.object(precompute_matter_summary, "apply_async") as apply_async,
+        ):
+            assert schedule_summary_precompute(MATTER_ID, delay=30) is True
+
+        key, token = mock_redis.set.call_args.args
+        assert key == SUMMARY_PRECOMPUTE_TOKEN_KEY.format(matter_id=MATTER_ID)
+        apply_async.assert_called_once_with(
+            args=[MATTER_ID, token], countdown=30, queue="low"
+        )
+
+    def test_returns_false_when_redis_unavailable(self):
+        """Should not raise when scheduling fails."""
+        with (
+            patch(
+                "app.services.distributed_lock.get_sync_redis_client",
+                side_effect=ConnectionError("down"),
+            ),
+            patch.object(precompute_matter_summary, "apply_async") as apply_async,
+        ):
+            assert schedule_summary_precompute(MATTER_ID, delay=30) is False
+
+        apply_async.assert_not_called()
+
+
+class TestReadRequests:
+    """Tests for the requests summary reads make instead of building."""
+
+    def test_queues_immediate_precompute(self, mock_redis):
+        """Should queue an undebounced rebuild and claim the request key."""
+        with (
+            patch(
+                "app.services.distributed_lock.get_sync_redis_client",
+                return_value=mock_redis,
+            ),
+            patch.object(precompute_matter_summary, "apply_async") as apply_async,
+        ):
+            assert request_summary_precompute(MATTER_ID) is True
+
+        apply_async.assert_called_once_with(
+            args=[MATTER_ID, None], countdown=0, queue="low"
+        )
+        mock_redis.set.assert_called_once_with(
+            SUMMARY_READ_REQUEST_KEY.format(kind="precompute", matter_id=MATTER_ID),
+            "1",
+            nx=True,
+            ex=SUMMARY_READ_REQUEST_TTL,
+        )
+
+    def test_repeat_reads_are_throttled(self, mock_redis):
+        """Should not queue again while an earlier read's request is live."""
+        mock_redis.set.return_value = None
+
+        with (
+            patch(
+                "app.services.distributed_lock.get_sync_redis_client",
+                return_value=mock_redis,
+            ),
+            patch.object(precompute_matter_summary, "apply_async") as precompute,
+            patch.object(refresh_summary_live_sections, "apply_async") as refresh,
+        ):
+            assert request_summary_precompute(MATTER_ID) is False
+            assert request_live_sections_refresh(MATTER_ID) is False
+
+        precompute.assert_not_called()
+        refresh.assert_not_called()
+
+    def test_queues_live_sections_refresh(self, mock_redis):
+        """Should queue the live-section refresh on the low queue."""
+        with (
+            patch(
+                "app.services.distributed_lock.get_sync_redis_client",
+                return_value=mock_redis,
+            ),
+            patch.object(refresh_summary_live_sections, "apply_async") as apply_async,
+        ):
+            assert request_live_sections_refresh(MATTER_ID) is True
+
+        apply_async.assert_called_once_with(args=[MATTER_ID], queue="low")
+
+    def test_request_failure_does_not_raise(self):
+        """Should not fail the read when Redis or the broker is down."""
+        with patch(
+            "app.services.distributed_lock.get_sync_redis_client",
+            side_effect=ConnectionError("down"),
+        ):
+            assert request_summary_precompute(MATTER_ID) is False
+            assert request_live_sections_refresh(MATTER_ID) is False
+
+
+# =============================================================================
+# Task Execution Tests
+# =============================================================================
+
+
+class TestPrecomputeMatterSummary:
+    """Tests for precompute_matter_summary task."""
+
+    def test_superseded_token_exits(self, mock_redis, mock_summary_service):
+        """Should exit when a later call replaced the debounce token."""
+        mock_redis.get.return_value = "token-2"
+
+        result = _run(mock_redis, mock_summary_service)
+
+        assert result == {"status": "superseded"}
+        mock_summary_service.precompute_summary.assert_not_called()
+
+    def test_defers_while_pipeline_active(self, mock_redis, mock_summary_service):
+        """Should exit while the matter still has queued or running jobs."""
+        result = _run(mock_redis, mock_summary_service, active_jobs=2)
+
+        assert result == {"status": "pipeline_active", "active_jobs": 2}
+        mock_summary_service.precompute_summary.assert_not_called()
+
+    def test_requeues_when_already_running(self, mock_redis, mock_summary_service):
+        """Should re-enqueue itself when another worker holds the matter's lock."""
+        mock_redis.set.return_value = None
+
+        with patch.object(precompute_matter_summary, "apply_async") as apply_async:
+            result = _run(mock_redis, mock_summary_service)
+
+        assert result == {"status": "requeued"}
+        mock_summary_service.precompute_summary.assert_not_called()
+        mock_redis.delete.assert_not_called()
+        apply_async.assert_called_once()
+        assert apply_async.call_args.kwargs["args"] == [MATTER_ID, "token-1"]
+        assert apply_async.call_args.kwargs["countdown"] > 0
+
+    def test_rebuilds_and_releases_lock(
+        self, mock_redis, mock_async_redis, mock_summary_service
+    ):
+        """Should rebuild with the task's own Redis client and release the lock."""
+        result = _run(mock_redis, mock_summary_service, async_redis=mock_async_redis)
+
+        assert result == {"status": "completed", "version": 3}
+        mock_summary_service.precompute_summary.assert_awaited_once_with(
+            MATTER_ID, redis=mock_async_redis.__aenter__.return_value
+        )
+        mock_async_redis.__aexit__.assert_awaited_once()
+        mock_redis.delete.assert_called_once_with(
+            SUMMARY_PRECOMPUTE_LOCK_KEY.format(matter_id=MATTER_ID)
+        )
+
+    def test_manual_trigger_ignores_token(self, mock_redis, mock_summary_service):
+        """Should rebuild without a debounce token."""
+        result = _run(mock_redis, mock_summary_service, token=None)
+
+        assert result["status"] == "completed"
+        mock_redis.get.assert_not_called()
+
+
+class TestRefreshSummaryLiveSections:
+    """Tests for refresh_summary_live_sections task."""
+
+    def _run(self, summary_service, async_redis):
+        with (
+            patch(
+                "app.services.memory.redis_client.create_redis_client",
+                return_value=async_redis,
+            ),
+            patch(
+                "app.services.summary_service.get_summary_service",
+                return_value=summary_service,
+            ),
+        ):
+            return refresh_summary_live_sections(MATTER_ID)
+
+    def test_refreshes_with_task_redis(self, mock_async_redis):
+        """Should refresh with the task's own Redis client."""
+        service = MagicMock()
+        service.refresh_live_sections = AsyncMock(return_value=MagicMock(version=5))
+
+        result = self._run(service, mock_async_redis)
+
+        assert result == {"status": "completed", "version": 5}
+        service.refresh_live_sections.assert_awaited_once_with(
+            MATTER_ID, redis=mock_async_redis.__aenter__.return_value
+        )
+        mock_async_redis.__aexit__.assert_awaited_once()
+
+    def test_not_precomputed(self, mock_async_redis):
+        """Should report when the matter has no stored summary yet."""
+        service = MagicMock()
+        service.refresh_live_sections = AsyncMock(return_value=None)
+
+        assert self._run(service, mock_async_redis) == {"status": "not_precomputed"}
@@ -74,6 +74,9 @@ export function InlineDebugInfo({ debugInfo, className }: InlineDebugInfoProps)
               {debugInfo.timing.semanticSearchMs !== null && (
                 <div>Semantic: {debugInfo.timing.semanticSearchMs.toFixed(1)}ms</div>
               )}
+              {debugInfo.timing.retrievalMs !== null && (
+                <div>Retrieval (parallel): {debugInfo.timing.retrievalMs.toFixed(1)}ms</div>
+              )}
               {debugInfo.timing.rrfFusionMs !== null && (
                 <div>RRF Fusion: {debugInfo.timing.rrfFusionMs.toFixed(1)}ms</div>
               )}
@@ -116,6 +116,7 @@ export function useInspector() {
             embeddingMs: result.debug.timing.embedding_ms,
             bm25SearchMs: result.debug.timing.bm25_search_ms,
             semanticSearchMs: result.debug.timing.semantic_search_ms,
+            retrievalMs: result.debug.timing.retrieval_ms ?? null,
             rrfFusionMs: result.debug.timing.rrf_fusion_ms,
             rerankMs: result.debug.timing.rerank_ms,
             totalMs: result.debug.timing.total_ms,
@@ -16,6 +16,8 @@ export interface TimingBreakdown {
   bm25SearchMs: number | null;
   /** Semantic/vector search time */
   semanticSearchMs: number | null;
+  /** Wall time of concurrent retrieval: max(embedding + semantic, bm25) */
+  retrievalMs: number | null;
   /** RRF score fusion time */
   rrfFusionMs: number | null;
   /** Cohere reranking time */
@@ -112,6 +114,7 @@ export interface SearchDebugInfoAPI {
     embedding_ms: number | null;
     bm25_search_ms: number | null;
     semantic_search_ms: number | null;
+    retrieval_ms: number | null;
     rrf_fusion_ms: number | null;
     rerank_ms: number | null;
     total_ms: number;
@@ -161,6 +164,7 @@ export function transformSearchDebugInfo(api: SearchDebugInfoAPI): SearchDebugIn
       embeddingMs: api.timing.embedding_ms,
       bm25SearchMs: api.timing.bm25_search_ms,
       semanticSearchMs: api.timing.semantic_search_ms,
+      retrievalMs: api.timing.retrieval_ms ?? null,
       rrfFusionMs: api.timing.rrf_fusion_ms,
       rerankMs: api.timing.rerank_ms,
       totalMs: api.timing.total_ms,
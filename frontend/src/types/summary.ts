@@ -239,6 +239,8 @@ export interface MatterSummary {
   stats: MatterStats;
   /** When summary was generated (ISO timestamp) */
   generatedAt: string;
+  /** ready, pending (first build queued) or refreshing (rebuild queued) */
+  status?: 'ready' | 'pending' | 'refreshing';
 }
 
 /**
@@ -0,0 +1,87 @@
+-- Parallel Hybrid Retrieval: semantic leg for client-side RRF fusion
+-- The backend now runs BM25 concurrently with query embedding and fuses the
+-- BM25 and semantic legs client-side, so the semantic leg must return the
+-- same shape as bm25_search_chunks (matter_id for isolation checks, row_num
+-- for RRF) and apply the same model version filter as hybrid_search_chunks.
+--
+-- Replaces the Story 1.3 variant, which dropped matter_id/row_num and applied
+-- a 0.5 similarity threshold that the fused RPC never used.
+
+-- =============================================================================
+-- Drop existing semantic search signatures
+-- =============================================================================
+DROP FUNCTION IF EXISTS public.semantic_search_chunks(vector(1536), uuid, float, integer, text);
+DROP FUNCTION IF EXISTS public.semantic_search_chunks(vector(1536), uuid, integer);
+
+-- =============================================================================
+-- Recreate semantic_search_chunks
+-- =============================================================================
+CREATE FUNCTION public.semantic_search_chunks(
+  query_embedding extensions.vector(1536),
+  filter_matter_id uuid,
+  match_count integer DEFAULT 30,
+  filter_model_version TEXT DEFAULT 'text-embedding-3-small'
+)
+RETURNS TABLE (
+  id uuid,
+  matter_id uuid,
+  document_id uuid,
+  content text,
+  page_number integer,
+  chunk_type text,
+  token_count integer,
+  bbox_ids uuid[],
+  similarity float,
+  row_num integer
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+BEGIN
+  -- CRITICAL: matter_id filter is REQUIRED for security
+  IF filter_matter_id IS NULL THEN
+    RAISE EXCEPTION 'filter_matter_id is required - security violation';
+  END IF;
+
+  -- Verify user has access to this matter (defense in depth)
+  -- Skip check if auth.uid() is NULL (service role - backend handles auth)
+  IF auth.uid() IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM public.matter_attorneys ma
+    WHERE ma.matter_id = filter_matter_id
+    AND ma.user_id = auth.uid()
+  ) THEN
+    RAISE EXCEPTION 'Access denied to matter %', filter_matter_id;
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    c.id,
+    c.matter_id,
+    c.document_id,
+    c.content,
+    c.page_number,
+    c.chunk_type,
+    c.token_count,
+    c.bbox_ids,
+    (1 - (c.embedding <=> query_embedding))::float AS similarity,
+    ROW_NUMBER() OVER (
+      ORDER BY c.embedding <=> query_embedding
+    )::integer AS row_num
+  FROM public.chunks c
+  WHERE c.matter_id = filter_matter_id
+    AND c.embedding IS NOT NULL
+    AND c.embedding_model_version = filter_model_version
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
+
+-- =============================================================================
+-- Grant permissions
+-- =============================================================================
+GRANT EXECUTE ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, integer, text) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, integer, text) TO service_role;
+
+COMMENT ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, integer, text) IS
+  'Semantic search leg with matter isolation and model version filtering. Fused client-side with bm25_search_chunks via RRF.';
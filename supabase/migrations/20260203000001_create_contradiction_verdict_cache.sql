@@ -0,0 +1,98 @@
+-- Pair verdict cache for contradiction detection
+-- Epic 5: Consistency & Contradiction Engine (cost optimization)
+-- Stores LLM comparison verdicts keyed by an order-independent hash of both
+-- statement texts plus the prompt/model version, so re-runs after a new upload
+-- only send new or changed statement pairs to the LLM.
+
+-- =============================================================================
+-- TABLE: contradiction_verdict_cache - Per-matter pair verdicts
+-- =============================================================================
+
+CREATE TABLE public.contradiction_verdict_cache (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  matter_id uuid NOT NULL REFERENCES public.matters(id) ON DELETE CASCADE,
+
+  -- sha256 over sorted statement digests + entity name + prompt/model version
+  pair_hash text NOT NULL,
+  -- Digest of the statement that was "A" when the verdict was produced,
+  -- used to orient evidence (value_a/value_b) when the pair is reused
+  first_digest text NOT NULL,
+  verdict_version text NOT NULL,
+
+  -- Verdict payload (result, reasoning, confidence, evidence, contradiction_type)
+  verdict jsonb NOT NULL,
+
+  -- Cost of producing the verdict - reported as dollars avoided on reuse
+  cost_usd numeric(10, 6) NOT NULL DEFAULT 0,
+  hit_count integer NOT NULL DEFAULT 0,
+
+  -- Timestamps
+  created_at timestamptz NOT NULL DEFAULT now(),
+  last_hit_at timestamptz,
+
+  CONSTRAINT contradiction_verdict_cache_pair_unique UNIQUE (matter_id, pair_hash)
+);
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+-- Lookup by (matter_id, pair_hash) is served by the UNIQUE constraint index.
+-- Version index supports purging verdicts from retired prompt/model versions.
+CREATE INDEX idx_contradiction_verdict_cache_version
+  ON public.contradiction_verdict_cache(verdict_version);
+
+-- =============================================================================
+-- RLS POLICIES - Layer 1 of 4-layer matter isolation
+-- =============================================================================
+
+ALTER TABLE public.contradiction_verdict_cache ENABLE ROW LEVEL SECURITY;
+
+-- Users can view cached verdicts from their matters
+CREATE POLICY "Users can view verdict cache from their matters"
+ON public.contradiction_verdict_cache FOR SELECT
+USING (
+  matter_id IN (
+    SELECT ma.matter_id FROM public.matter_attorneys ma
+    WHERE ma.user_id = auth.uid()
+  )
+);
+
+-- Writes happen from workers via service role (bypasses RLS)
+
+-- =============================================================================
+-- RPC: record_verdict_cache_hits - bump hit counters in one statement
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.record_verdict_cache_hits(
+  p_matter_id uuid,
+  p_pair_hashes text[]
+)
+RETURNS integer
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH updated AS (
+    UPDATE public.contradiction_verdict_cache
+    SET hit_count = hit_count + 1,
+        last_hit_at = now()
+    WHERE matter_id = p_matter_id
+      AND pair_hash = ANY(p_pair_hashes)
+    RETURNING 1
+  )
+  SELECT count(*)::integer FROM updated;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.record_verdict_cache_hits(uuid, text[]) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE public.contradiction_verdict_cache IS 'Cached statement-pair comparison verdicts, reused across contradiction detection runs';
+COMMENT ON COLUMN public.contradiction_verdict_cache.matter_id IS 'FK to matters - CRITICAL for 4-layer isolation';
+COMMENT ON COLUMN public.contradiction_verdict_cache.pair_hash IS 'Order-independent hash of both statement texts, entity name and verdict_version';
+COMMENT ON COLUMN public.contradiction_verdict_cache.first_digest IS 'sha256 of statement A content when the verdict was produced';
+COMMENT ON COLUMN public.contradiction_verdict_cache.verdict_version IS 'Prompt/model version the verdict was produced with';
+COMMENT ON COLUMN public.contradiction_verdict_cache.cost_usd IS 'LLM cost of producing the verdict (dollars avoided per reuse)';
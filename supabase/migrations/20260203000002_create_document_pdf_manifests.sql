@@ -0,0 +1,64 @@
+-- Parse-once PDF manifests
+-- Stores the page tree of each document's PDF (verified page count, per-page
+-- object references, byte ranges and content hashes), built by a task queued
+-- at upload, so routing, chunk specs and page-range splitting don't re-parse
+-- the PDF in every pipeline stage.
+-- Kept out of the documents table so SELECT * on documents stays small.
+
+-- =============================================================================
+-- TABLE: document_pdf_manifests - One manifest per document
+-- =============================================================================
+
+CREATE TABLE public.document_pdf_manifests (
+  document_id uuid PRIMARY KEY REFERENCES public.documents(id) ON DELETE CASCADE,
+  matter_id uuid NOT NULL REFERENCES public.matters(id) ON DELETE CASCADE,
+
+  -- Manifest format version (app.services.pdf_manifest.MANIFEST_VERSION)
+  version integer NOT NULL,
+  page_count integer NOT NULL CHECK (page_count >= 0),
+  -- Size of the PDF the manifest describes - manifests are only trusted
+  -- when this and the sha256 in manifest.file_sha256 match the file read
+  file_size bigint NOT NULL CHECK (file_size >= 0),
+
+  -- file_sha256 plus column-wise page data: objects [[num, gen]],
+  -- ranges [[start, end]], content_hashes [sha256]
+  manifest jsonb NOT NULL,
+
+  created_at timestamptz NOT NULL DEFAULT now(),
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- =============================================================================
+-- INDEXES
+-- =============================================================================
+
+CREATE INDEX idx_document_pdf_manifests_matter_id
+  ON public.document_pdf_manifests(matter_id);
+
+-- =============================================================================
+-- RLS POLICIES - Layer 1 of 4-layer matter isolation
+-- =============================================================================
+
+ALTER TABLE public.document_pdf_manifests ENABLE ROW LEVEL SECURITY;
+
+-- Users can view manifests of documents in their matters
+CREATE POLICY "Users can view PDF manifests from their matters"
+ON public.document_pdf_manifests FOR SELECT
+USING (
+  matter_id IN (
+    SELECT ma.matter_id FROM public.matter_attorneys ma
+    WHERE ma.user_id = auth.uid()
+  )
+);
+
+-- Writes happen from workers (build_document_pdf_manifest) via service role (bypasses RLS)
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE public.document_pdf_manifests IS 'Parse-once PDF page manifests reused by routing, chunking and OCR';
+COMMENT ON COLUMN public.document_pdf_manifests.matter_id IS 'FK to matters - CRITICAL for 4-layer isolation';
+COMMENT ON COLUMN public.document_pdf_manifests.page_count IS 'Verified page count (page tree walked once, by the manifest task queued at upload)';
+COMMENT ON COLUMN public.document_pdf_manifests.file_size IS 'Byte size of the described PDF, checked with the content sha256 before the manifest is used';
+COMMENT ON COLUMN public.document_pdf_manifests.manifest IS 'File sha256 and per-page object refs, byte ranges and content hashes';
@@ -0,0 +1,80 @@
+-- Set-based bulk updates for timeline events
+-- Epic 4: Timeline Construction Engine (Stories 4-2, 4-3)
+-- Event classification and entity linking write thousands of rows per matter.
+-- These functions apply a whole batch in one UPDATE ... FROM statement instead
+-- of one HTTP round trip per event, and return the IDs that were updated so
+-- callers can still report per-row failures.
+
+-- =============================================================================
+-- RPC: bulk_update_event_classifications - Classification results in one pass
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.bulk_update_event_classifications(
+  p_matter_id uuid,
+  p_event_ids uuid[],
+  p_event_types text[],
+  p_confidences double precision[],
+  p_is_manual boolean DEFAULT false
+)
+RETURNS TABLE (event_id uuid)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE public.events e
+  SET event_type = u.event_type,
+      confidence = u.confidence,
+      is_manual = p_is_manual,
+      updated_at = now()
+  FROM unnest(p_event_ids, p_event_types, p_confidences)
+    AS u(id, event_type, confidence)
+  WHERE e.id = u.id
+    AND e.matter_id = p_matter_id
+  RETURNING e.id;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.bulk_update_event_classifications(
+  uuid, uuid[], text[], double precision[], boolean
+) TO service_role;
+
+-- =============================================================================
+-- RPC: bulk_update_event_entities - Entity links in one pass
+-- =============================================================================
+
+-- p_updates is a JSON array of {"event_id": uuid, "entity_ids": [uuid, ...]}.
+-- JSON is used because Postgres arrays cannot hold ragged per-event lists.
+CREATE OR REPLACE FUNCTION public.bulk_update_event_entities(
+  p_matter_id uuid,
+  p_updates jsonb
+)
+RETURNS TABLE (event_id uuid)
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  UPDATE public.events e
+  SET entities_involved = u.entity_ids,
+      updated_at = now()
+  FROM (
+    SELECT
+      (item->>'event_id')::uuid AS id,
+      ARRAY(
+        SELECT jsonb_array_elements_text(
+          COALESCE(item->'entity_ids', '[]'::jsonb)
+        )::uuid
+      ) AS entity_ids
+    FROM jsonb_array_elements(p_updates) AS item
+  ) AS u
+  WHERE e.id = u.id
+    AND e.matter_id = p_matter_id
+  RETURNING e.id;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.bulk_update_event_entities(uuid, jsonb) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON FUNCTION public.bulk_update_event_classifications IS 'Set-based update of event_type/confidence for a batch of events in one matter; returns updated event IDs';
+COMMENT ON FUNCTION public.bulk_update_event_entities IS 'Set-based update of entities_involved for a batch of events in one matter; returns updated event IDs';
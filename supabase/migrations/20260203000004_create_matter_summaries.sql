@@ -0,0 +1,112 @@
+-- Precomputed matter summaries
+-- Epic 14: Summary (Story 14.1)
+-- Executive summaries are built by a background job when a matter's
+-- processing pipeline goes quiet, and the summary API only reads the stored
+-- result. Each row keeps a version counter (bumped on every rebuild, used for
+-- optimistic concurrency between workers) and per-section input fingerprints
+-- so a rebuild only re-runs the LLM for sections whose inputs changed.
+
+-- =============================================================================
+-- TABLE: matter_summaries - One precomputed summary per matter
+-- =============================================================================
+
+CREATE TABLE public.matter_summaries (
+  matter_id uuid PRIMARY KEY REFERENCES public.matters(id) ON DELETE CASCADE,
+
+  -- Incremented on every rebuild; writers update WHERE version = expected
+  version integer NOT NULL DEFAULT 1 CHECK (version > 0),
+
+  -- MatterSummary serialized with camelCase aliases (as returned by the API)
+  summary jsonb NOT NULL,
+
+  -- {section: sha256 of the section's LLM inputs}
+  section_fingerprints jsonb NOT NULL DEFAULT '{}'::jsonb,
+
+  generated_at timestamptz NOT NULL DEFAULT now(),
+  created_at timestamptz NOT NULL DEFAULT now(),
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+
+-- =============================================================================
+-- RLS POLICIES - Layer 1 of 4-layer matter isolation
+-- =============================================================================
+
+ALTER TABLE public.matter_summaries ENABLE ROW LEVEL SECURITY;
+
+-- Users can view summaries of their matters
+CREATE POLICY "Users can view summaries from their matters"
+ON public.matter_summaries FOR SELECT
+USING (
+  matter_id IN (
+    SELECT ma.matter_id FROM public.matter_attorneys ma
+    WHERE ma.user_id = auth.uid()
+  )
+);
+
+-- Writes happen from workers and the summary API via service role (bypasses RLS)
+
+-- =============================================================================
+-- RPC: get_summary_top_chunks - Representative chunks in one query
+-- =============================================================================
+
+-- Takes the first chunks (by page) of every active document, spread evenly
+-- across documents. Case documents are preferred; reference material (e.g.
+-- Acts) is only used when a matter has no case documents.
+CREATE OR REPLACE FUNCTION public.get_summary_top_chunks(
+  p_matter_id uuid,
+  p_limit integer DEFAULT 10
+)
+RETURNS TABLE (
+  document_id uuid,
+  document_name text,
+  page_number integer,
+  content text
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH active_docs AS (
+    SELECT d.id, d.filename, d.created_at,
+           COALESCE(d.is_reference_material, false) AS is_reference
+    FROM public.documents d
+    WHERE d.matter_id = p_matter_id
+      AND d.deleted_at IS NULL
+  ),
+  pool AS (
+    SELECT a.*
+    FROM active_docs a
+    WHERE a.is_reference = NOT EXISTS (
+      SELECT 1 FROM active_docs c WHERE NOT c.is_reference
+    )
+  ),
+  per_doc AS (
+    SELECT GREATEST(1, p_limit / GREATEST(COUNT(*), 1))::integer AS n FROM pool
+  )
+  SELECT p.id, p.filename, c.page_number, c.content
+  FROM pool p
+  CROSS JOIN per_doc
+  CROSS JOIN LATERAL (
+    SELECT ch.page_number, ch.content
+    FROM public.chunks ch
+    WHERE ch.document_id = p.id
+      AND ch.matter_id = p_matter_id
+    ORDER BY ch.page_number
+    LIMIT per_doc.n
+  ) c
+  ORDER BY p.created_at, p.id, c.page_number
+  LIMIT p_limit;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.get_summary_top_chunks(uuid, integer) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE public.matter_summaries IS 'Precomputed executive summaries, rebuilt in the background when processing goes quiet';
+COMMENT ON COLUMN public.matter_summaries.matter_id IS 'FK to matters - CRITICAL for 4-layer isolation';
+COMMENT ON COLUMN public.matter_summaries.version IS 'Rebuild counter for optimistic concurrency';
+COMMENT ON COLUMN public.matter_summaries.section_fingerprints IS 'Hash of each LLM section''s inputs; unchanged sections are reused';
+COMMENT ON FUNCTION public.get_summary_top_chunks IS 'First chunks of each active document (case documents preferred) for summary generation';
@@ -0,0 +1,173 @@
+-- Document-filtered contradiction listing in one query
+-- Epic 14: Contradictions Tab (Story 14.2)
+-- The per-document contradictions tab used to download every chunk ID of the
+-- document, run one IN (...) query per statement side and merge the results
+-- client-side before it could paginate. This function joins contradictions to
+-- their statement chunks server-side and returns one page of rows, with
+-- statement and entity details, together with the total match count.
+
+-- =============================================================================
+-- RPC: list_document_contradictions - One page + total for a document
+-- =============================================================================
+
+-- Sorting (matches ContradictionListService):
+--   p_sort_by = 'severity'   -> severity, then created_at DESC
+--   p_sort_by = 'entityName' -> entity canonical name, then created_at DESC
+--   p_sort_by = 'createdAt'  -> created_at in p_descending direction
+-- id breaks ties so the order is total.
+--
+-- Pagination is keyset when p_after_id is given: rows strictly after
+-- (p_after_sort_key, p_after_created_at, p_after_id), taken from the
+-- sort_key / sort_created_at / id of the previous page's last row.
+-- Otherwise p_offset is used (page-number navigation).
+--
+-- total_count is the number of matches ignoring pagination. When the page is
+-- empty a single row with id NULL carries the total.
+CREATE OR REPLACE FUNCTION public.list_document_contradictions(
+  p_matter_id uuid,
+  p_document_id uuid,
+  p_severity text DEFAULT NULL,
+  p_contradiction_type text DEFAULT NULL,
+  p_entity_id uuid DEFAULT NULL,
+  p_sort_by text DEFAULT 'severity',
+  p_descending boolean DEFAULT true,
+  p_limit integer DEFAULT 20,
+  p_offset integer DEFAULT 0,
+  p_after_sort_key text DEFAULT NULL,
+  p_after_created_at timestamptz DEFAULT NULL,
+  p_after_id uuid DEFAULT NULL
+)
+RETURNS TABLE (
+  id uuid,
+  entity_id uuid,
+  entity_name text,
+  contradiction_type text,
+  severity text,
+  explanation text,
+  confidence numeric,
+  evidence jsonb,
+  created_at timestamptz,
+  sort_key text,
+  sort_created_at timestamptz,
+  statement_a_id uuid,
+  statement_a_content text,
+  statement_a_page integer,
+  statement_a_document_id uuid,
+  statement_a_document_name text,
+  statement_b_id uuid,
+  statement_b_content text,
+  statement_b_page integer,
+  statement_b_document_id uuid,
+  statement_b_document_name text,
+  total_count bigint
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH doc_chunks AS (
+    SELECT ch.id
+    FROM public.chunks ch
+    WHERE ch.document_id = p_document_id
+      AND ch.matter_id = p_matter_id
+  ),
+  matches AS (
+    SELECT
+      sc.id,
+      sc.created_at,
+      CASE p_sort_by
+        WHEN 'severity' THEN COALESCE(sc.severity, '')
+        WHEN 'entityName' THEN COALESCE(n.canonical_name, '')
+        ELSE ''
+      END AS sort_key,
+      COALESCE(sc.created_at, '-infinity'::timestamptz) AS sort_created_at
+    FROM public.statement_comparisons sc
+    LEFT JOIN public.identity_nodes n ON n.id = sc.entity_id
+    WHERE sc.matter_id = p_matter_id
+      AND sc.result = 'contradiction'
+      AND (p_severity IS NULL OR sc.severity = p_severity)
+      AND (p_contradiction_type IS NULL OR sc.contradiction_type = p_contradiction_type)
+      AND (p_entity_id IS NULL OR sc.entity_id = p_entity_id)
+      AND (
+        sc.statement_a_id IN (SELECT dc.id FROM doc_chunks dc)
+        OR sc.statement_b_id IN (SELECT dc.id FROM doc_chunks dc)
+      )
+  ),
+  total AS (
+    SELECT COUNT(*) AS total_count FROM matches
+  ),
+  page AS (
+    SELECT m.*
+    FROM matches m
+    WHERE p_after_id IS NULL
+      OR CASE WHEN p_descending
+           THEN m.sort_key < p_after_sort_key
+           ELSE m.sort_key > p_after_sort_key
+         END
+      OR (
+        m.sort_key = p_after_sort_key
+        AND CASE WHEN p_descending OR p_sort_by <> 'createdAt'
+              THEN (m.sort_created_at, m.id) < (p_after_created_at, p_after_id)
+              ELSE (m.sort_created_at, m.id) > (p_after_created_at, p_after_id)
+            END
+      )
+    ORDER BY
+      CASE WHEN p_descending THEN m.sort_key END DESC,
+      CASE WHEN NOT p_descending THEN m.sort_key END ASC,
+      CASE WHEN p_descending OR p_sort_by <> 'createdAt' THEN m.sort_created_at END DESC,
+      CASE WHEN p_descending OR p_sort_by <> 'createdAt' THEN m.id END DESC,
+      CASE WHEN NOT p_descending AND p_sort_by = 'createdAt' THEN m.sort_created_at END ASC,
+      CASE WHEN NOT p_descending AND p_sort_by = 'createdAt' THEN m.id END ASC
+    LIMIT p_limit
+    OFFSET CASE WHEN p_after_id IS NULL THEN p_offset ELSE 0 END
+  )
+  SELECT
+    sc.id,
+    sc.entity_id,
+    n.canonical_name,
+    sc.contradiction_type::text,
+    sc.severity::text,
+    sc.explanation,
+    sc.confidence,
+    sc.evidence,
+    sc.created_at,
+    p.sort_key,
+    p.sort_created_at,
+    sc.statement_a_id,
+    ca.content,
+    ca.page_number,
+    ca.document_id,
+    da.filename,
+    sc.statement_b_id,
+    cb.content,
+    cb.page_number,
+    cb.document_id,
+    db.filename,
+    t.total_count
+  FROM total t
+  LEFT JOIN page p ON true
+  LEFT JOIN public.statement_comparisons sc ON sc.id = p.id
+  LEFT JOIN public.identity_nodes n ON n.id = sc.entity_id
+  LEFT JOIN public.chunks ca ON ca.id = sc.statement_a_id
+  LEFT JOIN public.documents da ON da.id = ca.document_id
+  LEFT JOIN public.chunks cb ON cb.id = sc.statement_b_id
+  LEFT JOIN public.documents db ON db.id = cb.document_id
+  ORDER BY
+    CASE WHEN p_descending THEN p.sort_key END DESC,
+    CASE WHEN NOT p_descending THEN p.sort_key END ASC,
+    CASE WHEN p_descending OR p_sort_by <> 'createdAt' THEN p.sort_created_at END DESC,
+    CASE WHEN p_descending OR p_sort_by <> 'createdAt' THEN p.id END DESC,
+    CASE WHEN NOT p_descending AND p_sort_by = 'createdAt' THEN p.sort_created_at END ASC,
+    CASE WHEN NOT p_descending AND p_sort_by = 'createdAt' THEN p.id END ASC;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.list_document_contradictions(
+  uuid, uuid, text, text, uuid, text, boolean, integer, integer, text, timestamptz, uuid
+) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON FUNCTION public.list_document_contradictions IS 'One page of contradictions with a statement in the given document (keyset or offset pagination), with statement/entity details and the total match count';
@@ -0,0 +1,162 @@
+-- Per-matter daily LLM cost rollups
+-- Story 7.1: Per-Matter Cost Tracking Widget
+-- The matter cost panel used to download every llm_costs row in the period
+-- and aggregate in Python, so it slowed down as a matter aged. Costs are now
+-- rolled up at write time into one row per matter/day/operation/provider,
+-- with operation names normalized once at ingest. Dashboard reads scan at
+-- most days x operations x providers rows; raw rows are only read for
+-- drill-down.
+--
+-- llm_costs is append-only. Updating or deleting cost rows does not adjust
+-- the rollups.
+
+-- =============================================================================
+-- FUNCTION: normalize_cost_operation - Display category for an operation
+-- =============================================================================
+
+-- Keep in sync with MatterCostService._normalize_operation
+CREATE OR REPLACE FUNCTION public.normalize_cost_operation(p_operation text)
+RETURNS text
+LANGUAGE sql
+IMMUTABLE
+SET search_path = public
+AS $$
+  SELECT CASE
+    WHEN lower(p_operation) LIKE '%embed%' THEN 'Embedding'
+    WHEN lower(p_operation) ~ '(qa|chat|rag|query)' THEN 'Q&A'
+    WHEN lower(p_operation) LIKE '%citation%' THEN 'Citations'
+    WHEN lower(p_operation) ~ '(entity|ner)' THEN 'Entities'
+    WHEN lower(p_operation) LIKE '%contradiction%' THEN 'Contradictions'
+    WHEN lower(p_operation) ~ '(timeline|event)' THEN 'Timeline'
+    WHEN lower(p_operation) LIKE '%summar%' THEN 'Summary'
+    WHEN lower(p_operation) ~ '(ocr|document_ai)' THEN 'OCR'
+    ELSE initcap(replace(p_operation, '_', ' '))
+  END;
+$$;
+
+-- =============================================================================
+-- TABLE: llm_cost_rollups - Daily aggregates per matter/operation/provider
+-- =============================================================================
+
+CREATE TABLE public.llm_cost_rollups (
+  matter_id uuid NOT NULL REFERENCES public.matters(id) ON DELETE CASCADE,
+  cost_date date NOT NULL,  -- UTC day of llm_costs.created_at
+  operation_category text NOT NULL,  -- normalize_cost_operation(operation)
+  provider varchar(100) NOT NULL,
+
+  input_tokens bigint NOT NULL DEFAULT 0,
+  output_tokens bigint NOT NULL DEFAULT 0,
+  total_cost_inr numeric(16,4) NOT NULL DEFAULT 0,
+  total_cost_usd numeric(16,8) NOT NULL DEFAULT 0,
+  operation_count bigint NOT NULL DEFAULT 0,
+
+  updated_at timestamptz NOT NULL DEFAULT now(),
+
+  PRIMARY KEY (matter_id, cost_date, operation_category, provider)
+);
+
+-- =============================================================================
+-- RLS POLICIES - Layer 1 of 4-layer matter isolation
+-- =============================================================================
+
+ALTER TABLE public.llm_cost_rollups ENABLE ROW LEVEL SECURITY;
+
+-- Users can view cost rollups of their matters
+CREATE POLICY "Users can view cost rollups from their matters"
+ON public.llm_cost_rollups FOR SELECT
+USING (
+  matter_id IN (
+    SELECT ma.matter_id FROM public.matter_attorneys ma
+    WHERE ma.user_id = auth.uid()
+  )
+);
+
+-- Writes happen only through the rollup trigger (SECURITY DEFINER)
+
+-- =============================================================================
+-- TRIGGER: roll up inserted cost rows
+-- =============================================================================
+
+-- Statement-level so a batched insert becomes one upsert per rollup key.
+-- Keys are upserted in a fixed order to avoid deadlocks between concurrent
+-- batches. System-level costs (matter_id NULL) are not rolled up.
+CREATE OR REPLACE FUNCTION public.rollup_inserted_llm_costs()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.llm_cost_rollups AS r (
+    matter_id, cost_date, operation_category, provider,
+    input_tokens, output_tokens, total_cost_inr, total_cost_usd,
+    operation_count, updated_at
+  )
+  SELECT
+    n.matter_id,
+    (COALESCE(n.created_at, now()) AT TIME ZONE 'UTC')::date,
+    public.normalize_cost_operation(n.operation),
+    n.provider,
+    SUM(n.input_tokens),
+    SUM(n.output_tokens),
+    SUM(n.total_cost_inr),
+    SUM(n.total_cost_usd),
+    COUNT(*),
+    now()
+  FROM new_rows n
+  WHERE n.matter_id IS NOT NULL
+  GROUP BY 1, 2, 3, 4
+  ORDER BY 1, 2, 3, 4
+  ON CONFLICT (matter_id, cost_date, operation_category, provider) DO UPDATE SET
+    input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+    output_tokens = r.output_tokens + EXCLUDED.output_tokens,
+    total_cost_inr = r.total_cost_inr + EXCLUDED.total_cost_inr,
+    total_cost_usd = r.total_cost_usd + EXCLUDED.total_cost_usd,
+    operation_count = r.operation_count + EXCLUDED.operation_count,
+    updated_at = now();
+
+  RETURN NULL;
+END;
+$$;
+
+-- Block concurrent inserts so the backfill and the trigger don't overlap
+LOCK TABLE public.llm_costs IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TRIGGER llm_costs_rollup
+AFTER INSERT ON public.llm_costs
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.rollup_inserted_llm_costs();
+
+-- =============================================================================
+-- BACKFILL: existing cost rows
+-- =============================================================================
+
+INSERT INTO public.llm_cost_rollups (
+  matter_id, cost_date, operation_category, provider,
+  input_tokens, output_tokens, total_cost_inr, total_cost_usd, operation_count
+)
+SELECT
+  c.matter_id,
+  (COALESCE(c.created_at, now()) AT TIME ZONE 'UTC')::date,
+  public.normalize_cost_operation(c.operation),
+  c.provider,
+  SUM(c.input_tokens),
+  SUM(c.output_tokens),
+  SUM(c.total_cost_inr),
+  SUM(c.total_cost_usd),
+  COUNT(*)
+FROM public.llm_costs c
+WHERE c.matter_id IS NOT NULL
+GROUP BY 1, 2, 3, 4;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE public.llm_cost_rollups IS 'Per-matter daily LLM cost aggregates by operation category and provider, maintained by trigger on llm_costs';
+COMMENT ON COLUMN public.llm_cost_rollups.matter_id IS 'FK to matters - CRITICAL for 4-layer isolation';
+COMMENT ON COLUMN public.llm_cost_rollups.cost_date IS 'UTC day of the underlying cost rows';
+COMMENT ON COLUMN public.llm_cost_rollups.operation_category IS 'Normalized operation name (normalize_cost_operation)';
+COMMENT ON FUNCTION public.normalize_cost_operation IS 'Display category for an llm_costs operation name; mirrors MatterCostService._normalize_operation';
+COMMENT ON FUNCTION public.rollup_inserted_llm_costs IS 'Statement-level trigger adding inserted llm_costs rows to llm_cost_rollups';
@@ -0,0 +1,33 @@
+-- Tag bounding boxes with the OCR chunk that produced them
+-- Story 16.3 / 17.5: Chunked OCR merge and batch bounding box inserts
+-- Chunked documents used to write every bounding box again after the last
+-- chunk finished (delete all, re-insert all), so finishing OCR took time
+-- proportional to the document size. Each chunk now stores its boxes with
+-- absolute page numbers as soon as it succeeds, tagged with its chunk index,
+-- and a retried chunk replaces only its own rows.
+
+-- =============================================================================
+-- Add ocr_chunk_index column
+-- =============================================================================
+
+ALTER TABLE public.bounding_boxes
+ADD COLUMN ocr_chunk_index integer;
+
+ALTER TABLE public.bounding_boxes
+ADD CONSTRAINT bboxes_ocr_chunk_index_non_negative
+CHECK (ocr_chunk_index IS NULL OR ocr_chunk_index >= 0);
+
+-- =============================================================================
+-- Index for per-chunk replacement and stale-row cleanup
+-- =============================================================================
+
+CREATE INDEX idx_bboxes_document_chunk ON public.bounding_boxes(
+    document_id, ocr_chunk_index
+);
+
+-- =============================================================================
+-- Column documentation
+-- =============================================================================
+
+COMMENT ON COLUMN public.bounding_boxes.ocr_chunk_index IS
+'0-based OCR chunk that produced the box (chunked documents). NULL for documents OCR''d in one pass.';
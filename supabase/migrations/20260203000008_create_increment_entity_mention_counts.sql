@@ -0,0 +1,56 @@
+-- Atomic batched mention-count increments for MIG entities
+-- Story 6.2: Batch entity persistence
+-- Entity extraction used to read each existing entity's mention_count and
+-- write back count + n in a second request. Two round trips per entity, and
+-- concurrent chunks mentioning the same entity lost each other's updates.
+-- This function applies a whole batch of deltas in one UPDATE, computed
+-- against the row's current value, and returns the updated rows.
+
+-- =============================================================================
+-- RPC: increment_entity_mention_counts - Add deltas to mention_count
+-- =============================================================================
+
+-- Duplicate IDs in one call are summed. Rows are locked in ID order so
+-- concurrent batches touching overlapping entities cannot deadlock.
+CREATE OR REPLACE FUNCTION public.increment_entity_mention_counts(
+  p_matter_id uuid,
+  p_entity_ids uuid[],
+  p_increments integer[]
+)
+RETURNS SETOF public.identity_nodes
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH deltas AS (
+    SELECT u.id, SUM(u.increment)::integer AS increment
+    FROM unnest(p_entity_ids, p_increments) AS u(id, increment)
+    GROUP BY u.id
+  ),
+  locked AS (
+    SELECT n.id
+    FROM public.identity_nodes n
+    JOIN deltas d ON d.id = n.id
+    WHERE n.matter_id = p_matter_id
+    ORDER BY n.id
+    FOR UPDATE OF n
+  )
+  UPDATE public.identity_nodes n
+  SET mention_count = COALESCE(n.mention_count, 0) + d.increment,
+      updated_at = now()
+  FROM deltas d
+  WHERE n.id = d.id
+    AND n.matter_id = p_matter_id
+    AND n.id IN (SELECT id FROM locked)
+  RETURNING n.*;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.increment_entity_mention_counts(
+  uuid, uuid[], integer[]
+) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON FUNCTION public.increment_entity_mention_counts IS 'Atomically adds per-entity deltas to identity_nodes.mention_count for one matter; returns the updated rows';
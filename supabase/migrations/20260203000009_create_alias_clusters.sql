@@ -0,0 +1,223 @@
+-- Materialized alias clusters for MIG entities
+-- Story 2c-2: Alias Resolution
+-- Alias expansion used to query identity_edges for direct ALIAS_OF
+-- neighbours and then fetch those nodes, once per entity, and never
+-- followed transitive aliases. Every node now carries the id of its alias
+-- cluster (the connected component of ALIAS_OF edges), maintained by
+-- trigger as alias edges are added, changed or removed. Expanding an entity
+-- to its full alias set is one indexed lookup.
+--
+-- The cluster id is the smallest node id in the component, so it is
+-- deterministic regardless of the order edges were added in.
+
+-- =============================================================================
+-- Add alias_cluster_id column
+-- =============================================================================
+
+ALTER TABLE public.identity_nodes
+ADD COLUMN alias_cluster_id uuid;
+
+CREATE INDEX idx_identity_nodes_alias_cluster ON public.identity_nodes(
+    matter_id, alias_cluster_id
+);
+
+-- New nodes start as their own cluster
+CREATE OR REPLACE FUNCTION public.set_initial_alias_cluster()
+RETURNS trigger
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+BEGIN
+  NEW.alias_cluster_id := COALESCE(NEW.alias_cluster_id, NEW.id);
+  RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER set_identity_nodes_alias_cluster
+BEFORE INSERT ON public.identity_nodes
+FOR EACH ROW
+EXECUTE FUNCTION public.set_initial_alias_cluster();
+
+-- =============================================================================
+-- FUNCTION: recompute_alias_cluster - Split a cluster after an edge removal
+-- =============================================================================
+
+-- Recomputes connected components among the current members of one cluster
+-- and gives each component its smallest node id. Clusters are small (a
+-- party and its aliases), so walking one is cheap.
+CREATE OR REPLACE FUNCTION public.recompute_alias_cluster(
+  p_matter_id uuid,
+  p_cluster_id uuid
+)
+RETURNS void
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH RECURSIVE members AS (
+    SELECT n.id
+    FROM public.identity_nodes n
+    WHERE n.matter_id = p_matter_id
+      AND n.alias_cluster_id = p_cluster_id
+  ),
+  links AS (
+    SELECT e.source_node_id AS a, e.target_node_id AS b
+    FROM public.identity_edges e
+    WHERE e.matter_id = p_matter_id
+      AND e.relationship_type = 'ALIAS_OF'
+      AND e.source_node_id IN (SELECT id FROM members)
+    UNION
+    SELECT e.target_node_id, e.source_node_id
+    FROM public.identity_edges e
+    WHERE e.matter_id = p_matter_id
+      AND e.relationship_type = 'ALIAS_OF'
+      AND e.target_node_id IN (SELECT id FROM members)
+  ),
+  reach(root, node) AS (
+    SELECT id, id FROM members
+    UNION
+    SELECT r.root, l.b
+    FROM reach r
+    JOIN links l ON l.a = r.node
+  ),
+  components AS (
+    SELECT node, (array_agg(root ORDER BY root))[1] AS cluster_id
+    FROM reach
+    GROUP BY node
+  )
+  UPDATE public.identity_nodes n
+  SET alias_cluster_id = c.cluster_id
+  FROM components c
+  WHERE n.id = c.node
+    AND n.alias_cluster_id IS DISTINCT FROM c.cluster_id;
+$$;
+
+-- =============================================================================
+-- TRIGGER: maintain clusters on ALIAS_OF edge changes
+-- =============================================================================
+
+-- Adding an edge merges two clusters (relabel the larger id to the smaller).
+-- Removing one may split a cluster, so its components are recomputed.
+-- Alias edge changes are serialized per matter so concurrent merges cannot
+-- interleave their read and relabel.
+CREATE OR REPLACE FUNCTION public.maintain_alias_clusters()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_cluster uuid;
+  v_source_cluster uuid;
+  v_target_cluster uuid;
+BEGIN
+  IF TG_OP IN ('DELETE', 'UPDATE') AND OLD.relationship_type = 'ALIAS_OF' THEN
+    PERFORM pg_advisory_xact_lock(hashtext('alias_clusters:' || OLD.matter_id::text));
+
+    -- Endpoint rows may already be gone (cascade from a node delete)
+    FOR v_cluster IN
+      SELECT DISTINCT n.alias_cluster_id
+      FROM public.identity_nodes n
+      WHERE n.id IN (OLD.source_node_id, OLD.target_node_id)
+        AND n.alias_cluster_id IS NOT NULL
+    LOOP
+      PERFORM public.recompute_alias_cluster(OLD.matter_id, v_cluster);
+    END LOOP;
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.relationship_type = 'ALIAS_OF' THEN
+    PERFORM pg_advisory_xact_lock(hashtext('alias_clusters:' || NEW.matter_id::text));
+
+    SELECT alias_cluster_id INTO v_source_cluster
+    FROM public.identity_nodes WHERE id = NEW.source_node_id;
+    SELECT alias_cluster_id INTO v_target_cluster
+    FROM public.identity_nodes WHERE id = NEW.target_node_id;
+
+    IF v_source_cluster IS NOT NULL
+       AND v_target_cluster IS NOT NULL
+       AND v_source_cluster <> v_target_cluster THEN
+      UPDATE public.identity_nodes
+      SET alias_cluster_id = LEAST(v_source_cluster, v_target_cluster)
+      WHERE matter_id = NEW.matter_id
+        AND alias_cluster_id = GREATEST(v_source_cluster, v_target_cluster);
+    END IF;
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER identity_edges_alias_clusters
+AFTER INSERT OR UPDATE OR DELETE ON public.identity_edges
+FOR EACH ROW
+EXECUTE FUNCTION public.maintain_alias_clusters();
+
+-- =============================================================================
+-- BACKFILL: clusters from existing alias edges
+-- =============================================================================
+
+UPDATE public.identity_nodes SET alias_cluster_id = id;
+
+WITH RECURSIVE links AS (
+  SELECT e.source_node_id AS a, e.target_node_id AS b
+  FROM public.identity_edges e
+  WHERE e.relationship_type = 'ALIAS_OF'
+  UNION
+  SELECT e.target_node_id, e.source_node_id
+  FROM public.identity_edges e
+  WHERE e.relationship_type = 'ALIAS_OF'
+),
+reach(root, node) AS (
+  SELECT DISTINCT a, a FROM links
+  UNION
+  SELECT r.root, l.b
+  FROM reach r
+  JOIN links l ON l.a = r.node
+),
+components AS (
+  SELECT node, (array_agg(root ORDER BY root))[1] AS cluster_id
+  FROM reach
+  GROUP BY node
+)
+UPDATE public.identity_nodes n
+SET alias_cluster_id = c.cluster_id
+FROM components c
+WHERE n.id = c.node;
+
+ALTER TABLE public.identity_nodes
+ALTER COLUMN alias_cluster_id SET NOT NULL;
+
+-- =============================================================================
+-- RPC: get_alias_cluster - All nodes in an entity's alias cluster
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_alias_cluster(
+  p_matter_id uuid,
+  p_entity_id uuid
+)
+RETURNS SETOF public.identity_nodes
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+  SELECT n.*
+  FROM public.identity_nodes e
+  JOIN public.identity_nodes n
+    ON n.matter_id = e.matter_id
+   AND n.alias_cluster_id = e.alias_cluster_id
+  WHERE e.id = p_entity_id
+    AND e.matter_id = p_matter_id
+  ORDER BY n.mention_count DESC NULLS LAST, n.id;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.get_alias_cluster(uuid, uuid) TO service_role;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON COLUMN public.identity_nodes.alias_cluster_id IS 'Smallest node id in the entity''s ALIAS_OF connected component; maintained by trigger on identity_edges';
+COMMENT ON FUNCTION public.recompute_alias_cluster IS 'Recomputes ALIAS_OF connected components among the members of one alias cluster';
+COMMENT ON FUNCTION public.maintain_alias_clusters IS 'Row-level trigger keeping identity_nodes.alias_cluster_id in sync with ALIAS_OF edges';
+COMMENT ON FUNCTION public.get_alias_cluster IS 'All nodes in an entity''s alias cluster (including the entity), most mentioned first';
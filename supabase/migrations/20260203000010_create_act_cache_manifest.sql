@@ -0,0 +1,127 @@
+-- Manifest of globally cached Act PDFs
+-- Part of Act Validation and Auto-Fetching feature
+-- Checking whether an Act PDF was already cached used to list the
+-- global/acts/ storage folder with a search filter, once per Act, and the
+-- file size for auto-fetched Act documents needed another listing per
+-- matter. The manifest records every cached Act (name, version, content
+-- hash, storage path, size) so existence checks are a key lookup and the
+-- whole cache can be loaded with one query.
+
+-- =============================================================================
+-- TABLE: act_cache_manifest - One row per cached Act PDF
+-- =============================================================================
+
+CREATE TABLE public.act_cache_manifest (
+  act_name_normalized text PRIMARY KEY,  -- Matches act_validation_cache.act_name_normalized
+
+  storage_path text NOT NULL,            -- documents bucket path (global/acts/{name}.pdf)
+  content_sha256 text,                   -- NULL for PDFs cached before the manifest existed
+  file_size bigint NOT NULL DEFAULT 0,
+  version integer NOT NULL DEFAULT 1,    -- Bumped when the cached content changes
+
+  source_url text,                       -- URL the PDF was downloaded from
+  india_code_doc_id text,                -- DSpace document ID
+
+  fetched_at timestamptz NOT NULL DEFAULT now(),
+  updated_at timestamptz NOT NULL DEFAULT now(),
+
+  CONSTRAINT act_cache_manifest_version_positive CHECK (version >= 1),
+  CONSTRAINT act_cache_manifest_file_size_non_negative CHECK (file_size >= 0)
+);
+
+-- =============================================================================
+-- RLS POLICIES: act_cache_manifest - Read-only for authenticated users
+-- =============================================================================
+
+ALTER TABLE public.act_cache_manifest ENABLE ROW LEVEL SECURITY;
+
+-- Anyone authenticated can read the manifest (the Act cache is global)
+CREATE POLICY "Authenticated users can view act cache manifest"
+ON public.act_cache_manifest FOR SELECT
+TO authenticated
+USING (true);
+
+-- Only service role writes (via record_cached_act / backend workers)
+
+-- =============================================================================
+-- FUNCTION: record_cached_act - Upsert a manifest entry
+-- =============================================================================
+
+-- The version only moves when the content hash changes, so re-caching the
+-- same PDF (e.g. a retried fetch) is idempotent.
+CREATE OR REPLACE FUNCTION public.record_cached_act(
+  p_act_name_normalized text,
+  p_storage_path text,
+  p_content_sha256 text,
+  p_file_size bigint,
+  p_source_url text DEFAULT NULL,
+  p_india_code_doc_id text DEFAULT NULL
+)
+RETURNS SETOF public.act_cache_manifest
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  RETURN QUERY
+  INSERT INTO public.act_cache_manifest AS m (
+    act_name_normalized, storage_path, content_sha256, file_size,
+    source_url, india_code_doc_id
+  )
+  VALUES (
+    p_act_name_normalized, p_storage_path, p_content_sha256, p_file_size,
+    p_source_url, p_india_code_doc_id
+  )
+  ON CONFLICT (act_name_normalized) DO UPDATE SET
+    storage_path = EXCLUDED.storage_path,
+    version = CASE
+      WHEN m.content_sha256 IS DISTINCT FROM EXCLUDED.content_sha256
+      THEN m.version + 1
+      ELSE m.version
+    END,
+    content_sha256 = EXCLUDED.content_sha256,
+    file_size = EXCLUDED.file_size,
+    source_url = COALESCE(EXCLUDED.source_url, m.source_url),
+    india_code_doc_id = COALESCE(EXCLUDED.india_code_doc_id, m.india_code_doc_id),
+    fetched_at = now(),
+    updated_at = now()
+  RETURNING m.*;
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.record_cached_act(text, text, text, bigint, text, text) TO service_role;
+
+-- =============================================================================
+-- BACKFILL: Act PDFs already in storage
+-- =============================================================================
+
+-- Uses the default act_cache_storage_prefix (global/acts). Hashes of
+-- existing PDFs are unknown and stay NULL until the Act is re-cached.
+INSERT INTO public.act_cache_manifest (
+  act_name_normalized, storage_path, file_size, source_url, india_code_doc_id,
+  fetched_at
+)
+SELECT
+  regexp_replace(o.name, '^global/acts/(.*)\.pdf$', '\1'),
+  o.name,
+  COALESCE((o.metadata->>'size')::bigint, 0),
+  avc.india_code_url,
+  avc.india_code_doc_id,
+  COALESCE(o.created_at, now())
+FROM storage.objects o
+LEFT JOIN public.act_validation_cache avc
+  ON avc.cached_storage_path = o.name
+WHERE o.bucket_id = 'documents'
+  AND o.name ~ '^global/acts/[^/]+\.pdf$'
+ON CONFLICT (act_name_normalized) DO NOTHING;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON TABLE public.act_cache_manifest IS 'Manifest of globally cached Act PDFs for key-lookup existence checks';
+COMMENT ON COLUMN public.act_cache_manifest.act_name_normalized IS 'Normalized Act name - matches act_validation_cache';
+COMMENT ON COLUMN public.act_cache_manifest.storage_path IS 'Supabase Storage path of the cached PDF in the documents bucket';
+COMMENT ON COLUMN public.act_cache_manifest.content_sha256 IS 'SHA-256 of the cached PDF (NULL for backfilled entries)';
+COMMENT ON COLUMN public.act_cache_manifest.version IS 'Incremented whenever the cached content changes';
+COMMENT ON FUNCTION public.record_cached_act IS 'Upsert an act_cache_manifest entry, bumping version when the content hash changes';
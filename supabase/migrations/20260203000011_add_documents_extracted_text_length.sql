@@ -0,0 +1,22 @@
+-- Extracted text length on documents
+-- Document metadata reads (status polling, access checks, listings) used
+-- select("*") and transferred extracted_text, which can be megabytes per
+-- document. The backend now selects explicit columns (DOCUMENT_SELECT_FIELDS
+-- in document_service.py) and loads text only on request. Callers that only
+-- need to know whether OCR text exists read extracted_text_length instead.
+
+-- =============================================================================
+-- COLUMN: documents.extracted_text_length - Generated from extracted_text
+-- =============================================================================
+
+-- STORED so reads never touch the (TOASTed) text value.
+-- NOTE: Adding a stored generated column rewrites the documents table.
+ALTER TABLE public.documents
+ADD COLUMN IF NOT EXISTS extracted_text_length integer
+GENERATED ALWAYS AS (char_length(extracted_text)) STORED;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON COLUMN public.documents.extracted_text_length IS 'Character length of extracted_text (NULL until OCR) - lets metadata reads check for text without loading it';
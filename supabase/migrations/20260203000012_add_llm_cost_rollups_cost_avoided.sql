@@ -0,0 +1,68 @@
+-- Roll up LLM cost avoided by caches alongside cost spent
+-- Cache layers (e.g. the contradiction verdict cache) record a zero-cost
+-- llm_costs row whose metadata carries cost_avoided_inr / cost_avoided_usd.
+-- The rollup trigger now totals those values so the matter cost summary can
+-- report savings next to spend without reading raw rows.
+
+-- =============================================================================
+-- COLUMNS
+-- =============================================================================
+
+ALTER TABLE public.llm_cost_rollups
+  ADD COLUMN cost_avoided_inr numeric(16,4) NOT NULL DEFAULT 0,
+  ADD COLUMN cost_avoided_usd numeric(16,8) NOT NULL DEFAULT 0;
+
+-- =============================================================================
+-- TRIGGER FUNCTION: include avoided cost
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.rollup_inserted_llm_costs()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.llm_cost_rollups AS r (
+    matter_id, cost_date, operation_category, provider,
+    input_tokens, output_tokens, total_cost_inr, total_cost_usd,
+    cost_avoided_inr, cost_avoided_usd,
+    operation_count, updated_at
+  )
+  SELECT
+    n.matter_id,
+    (COALESCE(n.created_at, now()) AT TIME ZONE 'UTC')::date,
+    public.normalize_cost_operation(n.operation),
+    n.provider,
+    SUM(n.input_tokens),
+    SUM(n.output_tokens),
+    SUM(n.total_cost_inr),
+    SUM(n.total_cost_usd),
+    SUM(COALESCE((n.metadata->>'cost_avoided_inr')::numeric, 0)),
+    SUM(COALESCE((n.metadata->>'cost_avoided_usd')::numeric, 0)),
+    COUNT(*),
+    now()
+  FROM new_rows n
+  WHERE n.matter_id IS NOT NULL
+  GROUP BY 1, 2, 3, 4
+  ORDER BY 1, 2, 3, 4
+  ON CONFLICT (matter_id, cost_date, operation_category, provider) DO UPDATE SET
+    input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+    output_tokens = r.output_tokens + EXCLUDED.output_tokens,
+    total_cost_inr = r.total_cost_inr + EXCLUDED.total_cost_inr,
+    total_cost_usd = r.total_cost_usd + EXCLUDED.total_cost_usd,
+    cost_avoided_inr = r.cost_avoided_inr + EXCLUDED.cost_avoided_inr,
+    cost_avoided_usd = r.cost_avoided_usd + EXCLUDED.cost_avoided_usd,
+    operation_count = r.operation_count + EXCLUDED.operation_count,
+    updated_at = now();
+
+  RETURN NULL;
+END;
+$$;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON COLUMN public.llm_cost_rollups.cost_avoided_inr IS 'LLM cost avoided by caches (from llm_costs.metadata.cost_avoided_inr)';
+COMMENT ON COLUMN public.llm_cost_rollups.cost_avoided_usd IS 'LLM cost avoided by caches (from llm_costs.metadata.cost_avoided_usd)';
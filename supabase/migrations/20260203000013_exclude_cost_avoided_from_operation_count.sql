@@ -0,0 +1,90 @@
+-- Exclude cache-savings records from LLM operation counts
+-- Cache layers record avoided cost as a zero-cost llm_costs row whose
+-- metadata carries cost_avoided_inr / cost_avoided_usd. Those rows are not
+-- LLM calls, so operation_count in the rollups (and the matter cost panel's
+-- operation totals) now counts only rows without avoided cost. Their tokens
+-- and cost are zero, so the other totals are unaffected.
+
+-- =============================================================================
+-- TRIGGER FUNCTION: count only LLM calls
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.rollup_inserted_llm_costs()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  INSERT INTO public.llm_cost_rollups AS r (
+    matter_id, cost_date, operation_category, provider,
+    input_tokens, output_tokens, total_cost_inr, total_cost_usd,
+    cost_avoided_inr, cost_avoided_usd,
+    operation_count, updated_at
+  )
+  SELECT
+    n.matter_id,
+    (COALESCE(n.created_at, now()) AT TIME ZONE 'UTC')::date,
+    public.normalize_cost_operation(n.operation),
+    n.provider,
+    SUM(n.input_tokens),
+    SUM(n.output_tokens),
+    SUM(n.total_cost_inr),
+    SUM(n.total_cost_usd),
+    SUM(COALESCE((n.metadata->>'cost_avoided_inr')::numeric, 0)),
+    SUM(COALESCE((n.metadata->>'cost_avoided_usd')::numeric, 0)),
+    COUNT(*) FILTER (
+      WHERE NOT COALESCE(n.metadata ?| ARRAY['cost_avoided_inr', 'cost_avoided_usd'], false)
+    ),
+    now()
+  FROM new_rows n
+  WHERE n.matter_id IS NOT NULL
+  GROUP BY 1, 2, 3, 4
+  ORDER BY 1, 2, 3, 4
+  ON CONFLICT (matter_id, cost_date, operation_category, provider) DO UPDATE SET
+    input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+    output_tokens = r.output_tokens + EXCLUDED.output_tokens,
+    total_cost_inr = r.total_cost_inr + EXCLUDED.total_cost_inr,
+    total_cost_usd = r.total_cost_usd + EXCLUDED.total_cost_usd,
+    cost_avoided_inr = r.cost_avoided_inr + EXCLUDED.cost_avoided_inr,
+    cost_avoided_usd = r.cost_avoided_usd + EXCLUDED.cost_avoided_usd,
+    operation_count = r.operation_count + EXCLUDED.operation_count,
+    updated_at = now();
+
+  RETURN NULL;
+END;
+$$;
+
+-- =============================================================================
+-- BACKFILL: remove savings rows already counted
+-- =============================================================================
+
+-- Block concurrent inserts so the correction and the trigger don't overlap
+LOCK TABLE public.llm_costs IN SHARE ROW EXCLUSIVE MODE;
+
+UPDATE public.llm_cost_rollups r
+SET
+  operation_count = GREATEST(r.operation_count - s.savings_rows, 0),
+  updated_at = now()
+FROM (
+  SELECT
+    c.matter_id,
+    (COALESCE(c.created_at, now()) AT TIME ZONE 'UTC')::date AS cost_date,
+    public.normalize_cost_operation(c.operation) AS operation_category,
+    c.provider,
+    COUNT(*) AS savings_rows
+  FROM public.llm_costs c
+  WHERE c.matter_id IS NOT NULL
+    AND c.metadata ?| ARRAY['cost_avoided_inr', 'cost_avoided_usd']
+  GROUP BY 1, 2, 3, 4
+) s
+WHERE r.matter_id = s.matter_id
+  AND r.cost_date = s.cost_date
+  AND r.operation_category = s.operation_category
+  AND r.provider = s.provider;
+
+-- =============================================================================
+-- COMMENTS
+-- =============================================================================
+
+COMMENT ON COLUMN public.llm_cost_rollups.operation_count IS 'LLM calls rolled up (cache-savings rows with cost_avoided metadata are not counted)';
@@ -0,0 +1,153 @@
+-- Restore the similarity threshold on public semantic search
+-- 20260202000001 replaced semantic_search_chunks with an unthresholded leg
+-- for client-side RRF fusion, which also changed what direct callers of the
+-- public RPC get back: every chunk in the matter, however dissimilar.
+--
+-- semantic_search_chunks gets its 0.5 similarity_threshold back (Story 1.3
+-- signature) and keeps the fusion leg's result shape (matter_id for
+-- isolation checks, row_num). The unthresholded leg moves to
+-- semantic_leg_search_chunks, used only by the fused hybrid and inspector
+-- searches and callable only with the service role.
+
+-- =============================================================================
+-- Drop the unthresholded signature
+-- =============================================================================
+DROP FUNCTION IF EXISTS public.semantic_search_chunks(vector(1536), uuid, integer, text);
+
+-- =============================================================================
+-- semantic_search_chunks - public, thresholded
+-- =============================================================================
+CREATE FUNCTION public.semantic_search_chunks(
+  query_embedding extensions.vector(1536),
+  filter_matter_id uuid,
+  similarity_threshold float DEFAULT 0.5,
+  match_count integer DEFAULT 10,
+  filter_model_version TEXT DEFAULT 'text-embedding-3-small'
+)
+RETURNS TABLE (
+  id uuid,
+  matter_id uuid,
+  document_id uuid,
+  content text,
+  page_number integer,
+  chunk_type text,
+  token_count integer,
+  bbox_ids uuid[],
+  similarity float,
+  row_num integer
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+BEGIN
+  -- CRITICAL: matter_id filter is REQUIRED for security
+  IF filter_matter_id IS NULL THEN
+    RAISE EXCEPTION 'filter_matter_id is required - security violation';
+  END IF;
+
+  -- Verify user has access to this matter (defense in depth)
+  -- Skip check if auth.uid() is NULL (service role - backend handles auth)
+  IF auth.uid() IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM public.matter_attorneys ma
+    WHERE ma.matter_id = filter_matter_id
+    AND ma.user_id = auth.uid()
+  ) THEN
+    RAISE EXCEPTION 'Access denied to matter %', filter_matter_id;
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    c.id,
+    c.matter_id,
+    c.document_id,
+    c.content,
+    c.page_number,
+    c.chunk_type,
+    c.token_count,
+    c.bbox_ids,
+    (1 - (c.embedding <=> query_embedding))::float AS similarity,
+    ROW_NUMBER() OVER (
+      ORDER BY c.embedding <=> query_embedding
+    )::integer AS row_num
+  FROM public.chunks c
+  WHERE c.matter_id = filter_matter_id
+    AND c.embedding IS NOT NULL
+    AND c.embedding_model_version = filter_model_version
+    AND 1 - (c.embedding <=> query_embedding) >= similarity_threshold
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
+
+-- =============================================================================
+-- semantic_leg_search_chunks - internal, unthresholded RRF fusion leg
+-- =============================================================================
+
+-- RRF uses ranks, not scores, so the leg returns the top match_count chunks
+-- regardless of similarity, like bm25_search_chunks.
+CREATE FUNCTION public.semantic_leg_search_chunks(
+  query_embedding extensions.vector(1536),
+  filter_matter_id uuid,
+  match_count integer DEFAULT 30,
+  filter_model_version TEXT DEFAULT 'text-embedding-3-small'
+)
+RETURNS TABLE (
+  id uuid,
+  matter_id uuid,
+  document_id uuid,
+  content text,
+  page_number integer,
+  chunk_type text,
+  token_count integer,
+  bbox_ids uuid[],
+  similarity float,
+  row_num integer
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public, extensions
+AS $$
+BEGIN
+  -- CRITICAL: matter_id filter is REQUIRED for security
+  IF filter_matter_id IS NULL THEN
+    RAISE EXCEPTION 'filter_matter_id is required - security violation';
+  END IF;
+
+  RETURN QUERY
+  SELECT
+    c.id,
+    c.matter_id,
+    c.document_id,
+    c.content,
+    c.page_number,
+    c.chunk_type,
+    c.token_count,
+    c.bbox_ids,
+    (1 - (c.embedding <=> query_embedding))::float AS similarity,
+    ROW_NUMBER() OVER (
+      ORDER BY c.embedding <=> query_embedding
+    )::integer AS row_num
+  FROM public.chunks c
+  WHERE c.matter_id = filter_matter_id
+    AND c.embedding IS NOT NULL
+    AND c.embedding_model_version = filter_model_version
+  ORDER BY c.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
+
+-- =============================================================================
+-- Grant permissions
+-- =============================================================================
+GRANT EXECUTE ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, float, integer, text) TO authenticated;
+GRANT EXECUTE ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, float, integer, text) TO service_role;
+
+-- Backend only: access is checked by the service calling it
+REVOKE EXECUTE ON FUNCTION public.semantic_leg_search_chunks(vector(1536), uuid, integer, text) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.semantic_leg_search_chunks(vector(1536), uuid, integer, text) TO service_role;
+
+COMMENT ON FUNCTION public.semantic_search_chunks(vector(1536), uuid, float, integer, text) IS
+  'Semantic search with matter isolation, model version filtering and a similarity threshold (Story 1.3).';
+COMMENT ON FUNCTION public.semantic_leg_search_chunks(vector(1536), uuid, integer, text) IS
+  'Internal unthresholded semantic leg, fused client-side with bm25_search_chunks via RRF. Service role only.';